@@ -1,22 +1,33 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, g, request, jsonify, send_from_directory, stream_with_context
 from flask_cors import CORS
-import pandas as pd
-import numpy as np
 import os
-import random
-import json
 import hashlib
+import hmac
+import logging
+import time
 from chatbot import setup_chatbot_routes
-
-class NumpyEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, np.integer):
-            return int(obj)
-        if isinstance(obj, np.floating):
-            return float(obj)
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        return super(NumpyEncoder, self).default(obj)
+from intents import classify
+from recommender import SCORING_MODES, get_batch_recommendations, get_course_recommendations, scoring_key
+from collaborative import ModelUnavailable
+from planner import DegreePlanner, MAX_CREDIT_HOURS, MAX_HARD_COURSES
+from seats import COMPLETED, NOT_ELIGIBLE, UNKNOWN_COURSE, UNKNOWN_STUDENT, allocate, reserve, reserve_allocation
+from storage import ALREADY_ENROLLED, FULL, RESERVED
+from bulk import TABLES as BULK_TABLES, BulkUpload, BulkValidationError, upload_format
+from prereq_graph import split_codes
+from whatif import WhatIfError, parse_proposal, simulate
+from search import SearchError, SearchQuery
+from data_store import store
+from columnar import memory_report
+from response_cache import ResponseCache
+from listing import ListingError, ListingQuery, STREAM_FORMATS, iter_csv, iter_ndjson, page_positions, page_records, sort_positions
+from serialization import JSONEncoder, JSON_MIMETYPE, dumps, json_response
+from metrics import metrics
+from profiler import SamplingProfiler
+
+# Log level is set with PORTAL_LOG_LEVEL (DEBUG shows the recommender's per-request trace)
+logging.basicConfig(level=os.environ.get('PORTAL_LOG_LEVEL', 'INFO').upper(),
+                    format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+logger = logging.getLogger(__name__)
 
 app = Flask(__name__, static_folder='../frontend/build', static_url_path='/')
 CORS(app, resources={
@@ -26,236 +37,360 @@ CORS(app, resources={
         "allow_headers": ["Content-Type", "Authorization"]
     }
 })
-app.json_encoder = NumpyEncoder
+app.json_encoder = JSONEncoder
 
 # Setup chatbot routes
-setup_chatbot_routes(app)
-
-DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data'))
-
-STUDENT_DATA_FILE = os.path.join(DATA_DIR, 'student_data.csv')
-COURSE_DATA_FILE = os.path.join(DATA_DIR, 'course_data.csv')
-ENROLLMENT_DATA_FILE = os.path.join(DATA_DIR, 'enrollment_data.csv')
+chatbot = setup_chatbot_routes(app)
+
+# Recommendation and portal payloads are cached per data snapshot version
+RESPONSE_CACHE_SIZE = 4096
+RESPONSE_CACHE_TTL = 300.0
+response_cache = ResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL)
+
+# Opt-in profiling of slow requests: set PORTAL_PROFILE_SLOW_MS or use /api/admin/profiler
+profiler = SamplingProfiler()
+if os.environ.get('PORTAL_PROFILE_SLOW_MS'):
+    profiler.enable(float(os.environ['PORTAL_PROFILE_SLOW_MS']) / 1000)
+
+metrics.gauge('portal_cache_entries', 'Entries in the response cache.',
+              lambda: {(): response_cache.stats()['size']})
+metrics.gauge('portal_cache_events', 'Response cache hits, misses, evictions and expirations since startup.',
+              lambda: {(('event', event),): response_cache.stats()[event]
+                       for event in ('hits', 'misses', 'evictions', 'expirations')})
+metrics.gauge('portal_cache_hit_ratio', 'Response cache hits / lookups since startup.',
+              lambda: {(): response_cache.stats()['hit_rate']})
+metrics.gauge('portal_chat_sessions', 'Chatbot conversations currently stored.',
+              lambda: {(('backend', chatbot.sessions.name),): chatbot.sessions.stats()['size']})
+metrics.gauge('portal_snapshot_age_seconds', 'Seconds since the current data snapshot was loaded.',
+              lambda: {(): time.time() - store.get().loaded_at})
+metrics.gauge('portal_snapshot_version', 'Version number of the current data snapshot.',
+              lambda: {(): store.get().version})
+
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+    profiler.begin()
+
+@app.after_request
+def record_request_metrics(response):
+    # Streamed bodies (NDJSON/CSV exports) are produced after this point and not included
+    start = g.pop('request_start', None)
+    if start is not None:
+        duration = time.perf_counter() - start
+        endpoint = request.endpoint or 'unmatched'
+        metrics.observe('portal_request_duration_seconds', duration, endpoint=endpoint, method=request.method)
+        metrics.inc('portal_requests_total', endpoint=endpoint, method=request.method, status=response.status_code)
+        profiler.end(endpoint, duration)
+    return response
 
 # Admin credentials (in a real app, this would be in a secure database)
 ADMIN_CREDENTIALS = {
     'admin': hashlib.sha256('admin123'.encode()).hexdigest()
 }
 
-SAMPLE_DATA = {
-    'student': pd.DataFrame({
-        'Student_ID': [f'FA21-BSCS-{i:04d}' for i in range(1, 11)],
-        'Name': [f'Student {i}' for i in range(1, 11)],
-        'Program': ['BSCS'] * 10,
-        'Department': ['Computer Science'] * 10,
-        'Semester': [random.randint(1, 8) for _ in range(10)],
-        'CGPA': [round(random.uniform(2.0, 4.0), 2) for _ in range(10)],
-        'Completed_Courses': ['CS101,CS102'] * 10
-    }),
-    'course': pd.DataFrame({
-        'Course_Code': [f'CS{i:03d}' for i in range(101, 111)],
-        'Course_Name': [f'Course {i}' for i in range(101, 111)],
-        'Department': ['Computer Science'] * 10,
-        'Prerequisites': ['None'] * 10,
-        'Credit_Hours': [3] * 10,
-        'Difficulty': ['Medium'] * 10
-    }),
-    'enrollment': pd.DataFrame({
-        'Course_Code': [f'CS{i:03d}' for i in range(101, 111)],
-        'Course_Name': [f'Course {i}' for i in range(101, 111)],
-        'Enrollment_Count': np.random.randint(50, 150, 10),
-        'Students_Enrolled': ['FA21-BSCS-0001,FA21-BSCS-0002'] * 10
-    })
-}
-
-def load_data():
-    try:
-        # Read CSV files with proper handling of quotes and commas
-        student_df = pd.read_csv(STUDENT_DATA_FILE, quotechar='"', escapechar='\\')
-        course_df = pd.read_csv(COURSE_DATA_FILE, quotechar='"', escapechar='\\')
-        enrollment_df = pd.read_csv(ENROLLMENT_DATA_FILE, quotechar='"', escapechar='\\')
-
-        # Clean column names by removing quotes
-        student_df.columns = [col.strip('"') for col in student_df.columns]
-        course_df.columns = [col.strip('"') for col in course_df.columns]
-        enrollment_df.columns = [col.strip('"') for col in enrollment_df.columns]
-
-        # Clean string values by removing extra quotes
-        for col in student_df.columns:
-            if student_df[col].dtype == 'object':
-                student_df[col] = student_df[col].apply(lambda x: x.strip('"') if isinstance(x, str) else x)
-                
-        for col in course_df.columns:
-            if course_df[col].dtype == 'object':
-                course_df[col] = course_df[col].apply(lambda x: x.strip('"') if isinstance(x, str) else x)
-                
-        for col in enrollment_df.columns:
-            if enrollment_df[col].dtype == 'object':
-                enrollment_df[col] = enrollment_df[col].apply(lambda x: x.strip('"') if isinstance(x, str) else x)
-
-        print(f"Loaded {len(student_df)} students, {len(course_df)} courses, {len(enrollment_df)} enrollments")
-    except Exception as e:
-        print(f"Error loading data: {str(e)}")
-        student_df = SAMPLE_DATA['student']
-        course_df = SAMPLE_DATA['course']
-        enrollment_df = SAMPLE_DATA['enrollment']
-    return student_df, course_df, enrollment_df
-
-def get_course_recommendations(student_id, student_df, course_df, enrollment_df):
-    student = student_df[student_df['Student_ID'] == student_id]
-    if student.empty:
-        print(f"Student not found for ID: {student_id}")
-        return {"error": "Student not found"}
-
-    completed_courses = student['Completed_Courses'].iloc[0].split(',')
-    department = student['Department'].iloc[0]
-    cgpa = student['CGPA'].iloc[0]
-
-    print(f"Student ID: {student_id}")
-    print(f"Department: {department}")
-    print(f"Completed Courses: {completed_courses}")
-
-    dept_courses = course_df[course_df['Department'] == department]
-    print(f"Found {len(dept_courses)} courses in department {department}")
-    available_courses = dept_courses[~dept_courses['Course_Code'].isin(completed_courses)]
-    print(f"Available courses for recommendation: {len(available_courses)}")
-
-    recommended_courses = []
-    for _, course in available_courses.iterrows():
-        prereqs = course['Prerequisites']
-        if prereqs == 'None':
-            recommended_courses.append({
-                'Course_Code': course['Course_Code'],
-                'Course_Name': course['Course_Name'],
-                'Difficulty': course['Difficulty'],
-                'Credit_Hours': course['Credit_Hours'],
-                'Prerequisites': 'None',
-                'Match_Score': 1.0
-            })
-        else:
-            prereq_list = prereqs.split(',')
-            completed_prereqs = sum(1 for p in prereq_list if p in completed_courses)
-            if completed_prereqs == len(prereq_list):
-                difficulty_score = 1.0 if course['Difficulty'] == 'Easy' else (0.8 if course['Difficulty'] == 'Medium' else 0.6)
-                cgpa_score = min(1.0, cgpa / 4.0)
-                match_score = (difficulty_score + cgpa_score) / 2
-
-                recommended_courses.append({
-                    'Course_Code': course['Course_Code'],
-                    'Course_Name': course['Course_Name'],
-                    'Difficulty': course['Difficulty'],
-                    'Credit_Hours': course['Credit_Hours'],
-                    'Prerequisites': prereqs,
-                    'Match_Score': match_score
-                })
-
-    recommended_courses.sort(key=lambda x: x['Match_Score'], reverse=True)
-
-    for course in recommended_courses:
-        enrollment = enrollment_df[enrollment_df['Course_Code'] == course['Course_Code']]
-        if not enrollment.empty:
-            course['Enrollment_Count'] = enrollment['Enrollment_Count'].iloc[0]
-        else:
-            course['Enrollment_Count'] = 0
-
-    print(f"Returning {len(recommended_courses)} recommended courses.")
-    return recommended_courses
+# Admin endpoints that change data or server state need "Authorization: Bearer <PORTAL_ADMIN_TOKEN>";
+# they are disabled when the variable is not set
+ADMIN_TOKEN = os.environ.get('PORTAL_ADMIN_TOKEN', '')
+
+def admin_token_error():
+    """Error response when the request does not carry the admin token, otherwise None."""
+    if not ADMIN_TOKEN:
+        return jsonify({'success': False, 'message': 'Admin writes are disabled; set PORTAL_ADMIN_TOKEN'}), 403
+    scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+    if scheme.lower() != 'bearer' or not hmac.compare_digest(token.strip().encode(), ADMIN_TOKEN.encode()):
+        return jsonify({'success': False, 'message': 'Admin token required'}), 401
+    return None
+
+def student_id_list(value):
+    """The student_ids of a request body: None or a list of strings (TypeError otherwise, a 400)."""
+    if value is None:
+        return None
+    if not isinstance(value, list) or not all(isinstance(student_id, str) for student_id in value):
+        raise TypeError('student_ids must be a list of student IDs')
+    return value
+
+def int_option(data, name, default):
+    """An integer option of a request body, ``default`` when absent (TypeError for any other type, bool included, a 400)."""
+    value = data.get(name, default)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise TypeError(f'{name} must be an integer')
+    return value
+
+def course_summaries(snapshot, codes):
+    """Code/name pairs for a list of course codes (codes missing from the catalog keep their code as name)."""
+    summaries = []
+    for code in codes:
+        course = snapshot.courses_by_code.get(code)
+        summaries.append({'Course_Code': code, 'Course_Name': course['Course_Name'] if course else code})
+    return summaries
 
 @app.route('/api/analyze', methods=['POST'])
 def analyze_data():
     try:
-        student_df, course_df, enrollment_df = load_data()
-        
-        # Convert numeric values to Python native types for JSON serialization
-        analysis = {
-            'student_stats': {
-                'count': int(len(student_df)),
-                'departments': student_df['Department'].value_counts().to_dict(),
-                'cgpa_stats': {k: float(v) if isinstance(v, (np.float64, np.float32)) else v 
-                              for k, v in student_df['CGPA'].describe().to_dict().items()}
-            },
-            'course_stats': {
-                'count': int(len(course_df)),
-                'departments': course_df['Department'].value_counts().to_dict(),
-                'difficulty': course_df['Difficulty'].value_counts().to_dict()
-            },
-            'enrollment_stats': {
-                'total_enrollments': int(enrollment_df['Enrollment_Count'].sum()),
-                'avg_enrollment': float(enrollment_df['Enrollment_Count'].mean()),
-                'max_enrollment': int(enrollment_df['Enrollment_Count'].max())
-            },
-            'message': 'Analysis completed successfully'
-        }
-        return jsonify(analysis)
+        analysis = dict(store.get().stats.analysis(), message='Analysis completed successfully')
+        return json_response(analysis)
     except Exception as e:
-        print(f"Error in analyze_data: {str(e)}")
+        logger.error("Error in analyze_data: %s", e)
         return jsonify({'error': str(e), 'message': 'Error during analysis'}), 500
 
+def cached_recommendations(student_id, snapshot, scoring='default'):
+    return response_cache.get_or_compute(snapshot.version, ('recommendations', student_id, scoring_key(scoring)),
+                                         lambda: get_course_recommendations(student_id, snapshot, scoring))
+
+def build_recommend_payload(student_id, snapshot, scoring='default'):
+    recommendations = cached_recommendations(student_id, snapshot, scoring)
+    if 'error' in recommendations:
+        return None
+
+    # Records are serialized as they are; the encoder handles NumPy values
+    return {
+        'recommendations': recommendations,
+        'message': f'Found {len(recommendations)} course recommendations'
+    }
+
+def etag_entry(payload):
+    """(serialized body, ETag) for caching, or None when there is no payload."""
+    if payload is None:
+        return None
+    with metrics.timer('portal_serialization_seconds', endpoint=request.endpoint):
+        body = dumps(payload)
+    return body, hashlib.sha1(body).hexdigest()
+
+def conditional_json(body, etag):
+    # POST responses are not handled by Response.make_conditional, so check If-None-Match here
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype=JSON_MIMETYPE)
+    response.set_etag(etag)
+    return response
+
 @app.route('/api/recommend', methods=['POST'])
 def recommend_courses():
     try:
         data = request.json
         student_id = data.get('student_id', '')
+        scoring = data.get('scoring') or 'default'
 
         if not student_id:
             return jsonify({'error': 'Student ID is required', 'message': 'Please provide a student ID'}), 400
+        if scoring not in SCORING_MODES:
+            return jsonify({'error': f'Unknown scoring mode: {scoring}', 'message': f"scoring must be one of {', '.join(SCORING_MODES)}"}), 400
+
+        snapshot = store.get()
+        entry = response_cache.get_or_compute(snapshot.version, ('recommend', student_id, scoring_key(scoring)),
+                                              lambda: etag_entry(build_recommend_payload(student_id, snapshot, scoring)))
+        if entry is None:
+            return jsonify({'error': 'Student not found', 'message': 'Student not found'}), 404
+
+        return conditional_json(*entry)
+    except ModelUnavailable as e:
+        return jsonify({'error': str(e), 'message': 'Collaborative recommendations are not available'}), 503
+    except Exception as e:
+        logger.exception("Unhandled error in %s", request.endpoint)
+        return jsonify({'error': str(e), 'message': 'Error generating recommendations'}), 500
 
-        student_df, course_df, enrollment_df = load_data()
-        recommendations = get_course_recommendations(student_id, student_df, course_df, enrollment_df)
-
-        if 'error' in recommendations:
-            return jsonify({'error': recommendations['error'], 'message': 'Student not found'}), 404
-
-        # Ensure all values are JSON serializable
-        def make_serializable(obj):
-            if isinstance(obj, dict):
-                return {k: make_serializable(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [make_serializable(v) for v in obj]
-            elif hasattr(obj, 'item'):
-                return obj.item()
-            elif obj is None:
-                return ''
-            else:
-                return obj
+@app.route('/api/recommend/batch', methods=['POST'])
+def recommend_courses_batch():
+    try:
+        data = request.json or {}
+        student_ids = student_id_list(data.get('student_ids'))
+        department = data.get('department')
+        top_k = int_option(data, 'top_k', 10)
+
+        if not student_ids and not department:
+            return jsonify({'error': 'Student IDs or department is required', 'message': 'Please provide student_ids or a department'}), 400
+        if top_k <= 0:
+            return jsonify({'error': 'Invalid top_k', 'message': 'top_k must be positive'}), 400
+
+        recommendations = get_batch_recommendations(store.get(), student_ids or None, department or None, top_k)
 
-        serializable_recommendations = make_serializable(recommendations)
+        return json_response({
+            'recommendations': recommendations,
+            'message': f'Generated recommendations for {len(recommendations)} students'
+        })
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e), 'message': 'Invalid batch options'}), 400
+    except Exception as e:
+        logger.exception("Unhandled error in %s", request.endpoint)
+        return jsonify({'error': str(e), 'message': 'Error generating batch recommendations'}), 500
 
+# HTTP status per seat reservation outcome
+RESERVATION_STATUS_CODES = {RESERVED: 200, UNKNOWN_STUDENT: 404, UNKNOWN_COURSE: 404, COMPLETED: 409,
+                            NOT_ELIGIBLE: 409, ALREADY_ENROLLED: 409, FULL: 409}
+
+@app.route('/api/enroll', methods=['POST'])
+def enroll():
+    """Reserve a seat for student_id in course_code; 409 when the course is full or not allowed."""
+    try:
+        data = request.json or {}
+        student_id = (data.get('student_id') or '').strip()
+        course_code = (data.get('course_code') or '').strip().upper()
+        if not student_id or not course_code:
+            return jsonify({'error': 'Student ID and course code are required', 'message': 'Please provide student_id and course_code'}), 400
+
+        result = reserve(store.get(), store, student_id, course_code)
+        status = result['status']
+        metrics.inc('portal_seat_reservations_total', status=status)
         return jsonify({
-            'recommendations': serializable_recommendations,
-            'message': f'Found {len(recommendations)} course recommendations'
+            'success': status == RESERVED,
+            'student_id': student_id,
+            'course_code': course_code,
+            **result,
+            'message': 'Seat reserved' if status == RESERVED else f"Seat not reserved: {status.replace('_', ' ')}"
+        }), RESERVATION_STATUS_CODES[status]
+    except Exception as e:
+        logger.exception("Unhandled error in %s", request.endpoint)
+        return jsonify({'error': str(e), 'message': 'Error reserving seat'}), 500
+
+@app.route('/api/enroll/allocate', methods=['POST'])
+def enroll_allocate():
+    """Allocate seats to a cohort (student_ids and/or department) from their recommendations.
+
+    Optional: max_credits (per student, current enrollments included) and
+    commit (write the allocation; otherwise it is only simulated).
+    """
+    try:
+        data = request.json or {}
+        student_ids = student_id_list(data.get('student_ids'))
+        department = data.get('department')
+        max_credits = int_option(data, 'max_credits', MAX_CREDIT_HOURS)
+        if not student_ids and not department:
+            return jsonify({'error': 'Student IDs or department is required', 'message': 'Please provide student_ids or a department'}), 400
+        if max_credits <= 0:
+            return jsonify({'error': 'Invalid limits', 'message': 'max_credits must be positive'}), 400
+
+        snapshot = store.get()
+        ranked = get_batch_recommendations(snapshot, student_ids or None, department or None, top_k=None)
+        allocation = allocate(snapshot, ranked, max_credits)
+        if data.get('commit'):
+            statuses = reserve_allocation(snapshot, store, allocation)
+            for student_statuses in statuses.values():
+                for status in student_statuses:
+                    metrics.inc('portal_seat_reservations_total', status=status)
+            allocation['reservations'] = statuses
+        return json_response({
+            'allocation': allocation,
+            'committed': bool(data.get('commit')),
+            'message': f"Assigned {allocation['seats_assigned']} seats to {allocation['students_placed']} students"
         })
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e), 'message': 'Invalid allocation options'}), 400
     except Exception as e:
-        import traceback
-        print(traceback.format_exc())
-        return jsonify({'error': str(e), 'message': 'Error generating recommendations'}), 500
+        logger.exception("Unhandled error in %s", request.endpoint)
+        return jsonify({'error': str(e), 'message': 'Error allocating seats'}), 500
+
+def degree_planner(snapshot):
+    return snapshot.derived('degree_planner', lambda: DegreePlanner.from_snapshot(snapshot))
+
+@app.route('/api/plan', methods=['POST'])
+def plan_degree():
+    """Semester-by-semester plan for one student (student_id) or a cohort (student_ids and/or department).
+
+    Optional: max_credits (per semester), max_hard (Hard courses per
+    semester) and include_enrolled (count current enrollments as done).
+    """
+    try:
+        data = request.json or {}
+        student_id = (data.get('student_id') or '').strip()
+        student_ids = student_id_list(data.get('student_ids'))
+        department = data.get('department')
+        options = {
+            'max_credits': int_option(data, 'max_credits', MAX_CREDIT_HOURS),
+            'max_hard': int_option(data, 'max_hard', MAX_HARD_COURSES),
+            'include_enrolled': bool(data.get('include_enrolled', True))
+        }
+        if options['max_credits'] <= 0 or options['max_hard'] < 0:
+            return jsonify({'error': 'Invalid limits', 'message': 'max_credits must be positive and max_hard non-negative'}), 400
+
+        snapshot = store.get()
+        planner = degree_planner(snapshot)
+        if student_id:
+            plan = planner.plan(snapshot, student_id, **options)
+            if plan is None:
+                return jsonify({'error': 'Student not found', 'message': 'Student not found'}), 404
+            return json_response({
+                'plan': plan,
+                'message': f"Planned {plan['semester_count']} semesters"
+            })
+
+        if not student_ids and not department:
+            return jsonify({'error': 'Student ID is required', 'message': 'Please provide student_id, student_ids or a department'}), 400
+        if not student_ids:
+            student_ids = snapshot.students_by_id.ids_in_department(department)
+        plans = {}
+        for sid in student_ids:
+            plan = planner.plan(snapshot, sid, **options)
+            if plan is None:
+                plans[sid] = {'error': 'Student not found'}
+            elif department is None or plan['department'] == department:
+                plans[sid] = plan
+        return json_response({
+            'plans': plans,
+            'message': f'Generated plans for {len(plans)} students'
+        })
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e), 'message': 'Invalid plan options'}), 400
+    except Exception as e:
+        logger.exception("Unhandled error in %s", request.endpoint)
+        return jsonify({'error': str(e), 'message': 'Error generating degree plan'}), 500
 
 @app.route('/api/students', methods=['GET'])
 def get_students():
     try:
-        student_df, _, _ = load_data()
+        student_df, _, _ = store.get().frames()
         # Convert DataFrame to list of dictionaries and handle NaN values
         students = student_df[['Student_ID', 'Name', 'Department', 'CGPA']].fillna('').to_dict('records')
-        return jsonify({
+        return json_response({
             'students': students,
             'message': f'Found {len(students)} students'
         })
     except Exception as e:
-        print(f"Error in get_students: {str(e)}")
+        logger.error("Error in get_students: %s", e)
         return jsonify({'error': str(e), 'message': 'Error retrieving students'}), 500
 
+@app.route('/api/students/<student_id>/enrollments', methods=['GET'])
+def get_student_enrollments(student_id):
+    try:
+        snapshot = store.get()
+        if student_id not in snapshot.students_by_id:
+            return jsonify({'error': 'Student not found', 'message': 'Student not found'}), 404
+        courses = course_summaries(snapshot, snapshot.enrollment_index.schedule(student_id))
+        return json_response({
+            'student_id': student_id,
+            'courses': courses,
+            'message': f'Found {len(courses)} enrolled courses'
+        })
+    except Exception as e:
+        logger.error("Error in get_student_enrollments: %s", e)
+        return jsonify({'error': str(e), 'message': 'Error retrieving enrollments'}), 500
+
 @app.route('/api/chat', methods=['POST'])
 def chat():
     try:
         data = request.json
-        user_message = data.get('message', '').lower()
+        message = data.get('message', '')
+        intent = classify(message)
         student_id = data.get('student_id', '').strip() if data.get('student_id') else ''
+        if not student_id and intent.student_ids:
+            student_id = intent.student_ids[0]
 
-        student_df, course_df, enrollment_df = load_data()
+        snapshot = store.get()
+
+        # Best-scoring intent that can be answered (recommendations and CGPA need a student ID)
+        answerable = [name for name in intent.ranked() if student_id or name not in ('recommend', 'cgpa')]
+        topic = answerable[0] if answerable else 'help'
+
+        # Courses named by code, or else by name (resolved with the search index)
+        course_codes = intent.course_codes
+        if not course_codes and topic in ('course_info', 'prerequisites', 'help'):
+            course_codes = snapshot.search_index.mentioned_courses(message)
+            if course_codes and topic == 'help':
+                topic = 'course_info'
 
         # Respond to course recommendations
-        if 'recommend' in user_message and student_id:
-            recommendations = get_course_recommendations(student_id, student_df, course_df, enrollment_df)
+        if topic == 'recommend':
+            recommendations = cached_recommendations(student_id, snapshot)
             if 'error' in recommendations:
                 response = "Sorry, I couldn't find your student record. Please check your ID."
             elif recommendations:
@@ -263,16 +398,23 @@ def chat():
                 response = f"Here are some recommended courses for you:\n{course_list}"
             else:
                 response = "You have completed all available courses in your department!"
-        # Respond to course info
-        elif 'course' in user_message:
-            courses = course_df[['Course_Code', 'Course_Name', 'Prerequisites']].head(5).to_dict('records')
+        # Respond to prerequisite questions as the chatbot does (what the student still needs included)
+        elif topic == 'prerequisites':
+            response = chatbot.describe_prerequisites(course_codes, student_id or None)
+        # Respond to course info (the courses named in the message, or a few examples)
+        elif topic == 'course_info':
+            courses = [snapshot.courses_by_code[code] for code in course_codes if code in snapshot.courses_by_code]
+            heading = ''
+            if not courses:
+                courses = snapshot.course_df[['Course_Code', 'Course_Name', 'Prerequisites']].head(5).to_dict('records')
+                heading = "Here are some example courses:\n"
             course_list = "\n".join([f"{c['Course_Code']}: {c['Course_Name']} (Prerequisites: {c['Prerequisites']})" for c in courses])
-            response = f"Here are some example courses:\n{course_list}"
+            response = heading + course_list
         # Respond to CGPA
-        elif 'cgpa' in user_message and student_id:
-            student = student_df[student_df['Student_ID'] == student_id]
-            if not student.empty:
-                response = f"Your CGPA is {student.iloc[0]['CGPA']}."
+        elif topic == 'cgpa':
+            student = snapshot.students_by_id.get(student_id)
+            if student is not None:
+                response = f"Your CGPA is {student['CGPA']}."
             else:
                 response = "Sorry, I couldn't find your student record."
         # Default/help
@@ -284,13 +426,40 @@ def chat():
 
         return jsonify({
             'message': response,
-            'confidence': 0.98
+            'intent': intent.name,
+            'confidence': intent.confidence
         })
     except Exception as e:
-        import traceback
-        print(traceback.format_exc())
+        logger.exception("Unhandled error in %s", request.endpoint)
         return jsonify({'error': str(e), 'message': 'Error processing your message'}), 500
 
+@app.route('/api/search', methods=['GET'])
+def search_endpoint():
+    """Courses and students matching q, best first (see search.py); every word may be partly typed.
+
+    Query parameters: q, type=course|student, offset (or cursor) and limit (at most 100).
+    """
+    start = time.perf_counter()
+    try:
+        query = SearchQuery.from_args(request.args)
+        page = store.get().search_index.search(query)
+        next_offset = query.offset + len(page['results'])
+        return json_response({
+            'success': True,
+            'query': query.text,
+            'results': page['results'],
+            'total': page['total'],
+            'offset': query.offset,
+            'limit': query.limit,
+            'next_cursor': str(next_offset) if next_offset < page['total'] else None,
+            'elapsed_ms': round((time.perf_counter() - start) * 1000, 3)
+        })
+    except SearchError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    except Exception as e:
+        logger.exception("Unhandled error in %s", request.endpoint)
+        return jsonify({'success': False, 'message': 'Error searching'}), 500
+
 @app.route('/api/login', methods=['POST'])
 def login():
     try:
@@ -301,79 +470,78 @@ def login():
         if not student_id or not password:
             return jsonify({'success': False, 'message': 'Student ID and password are required'}), 400
             
-        student_df, _, _ = load_data()
+        snapshot = store.get()
         
         # Check if Password column exists
-        if 'Password' not in student_df.columns:
+        if 'Password' not in snapshot.students_by_id.columns:
             return jsonify({'success': False, 'message': 'Password column not found in student data'}), 500
             
-        student = student_df[student_df['Student_ID'] == student_id]
+        student = snapshot.students_by_id.get(student_id)
         
-        if student.empty:
+        if student is None:
             return jsonify({'success': False, 'message': 'Student ID not found'}), 401
             
-        stored_password = str(student['Password'].iloc[0]).strip()
+        stored_password = str(student['Password']).strip()
         if stored_password == password:
             return jsonify({
                 'success': True, 
                 'student_id': student_id, 
-                'name': student['Name'].iloc[0],
-                'department': student['Department'].iloc[0],
-                'cgpa': float(student['CGPA'].iloc[0])
+                'name': student['Name'],
+                'department': student['Department'],
+                'cgpa': float(student['CGPA'])
             })
         else:
             return jsonify({'success': False, 'message': 'Invalid password'}), 401
             
     except Exception as e:
-        print(f"Login error: {str(e)}")
+        logger.error("Login error: %s", e)
         return jsonify({'success': False, 'message': 'An error occurred during login'}), 500
 
+def build_student_portal_payload(student_id, snapshot):
+    student_info = snapshot.students_by_id.get(student_id)
+    if student_info is None:
+        return None
+        
+    # Get completed courses info
+    completed_codes = split_codes(student_info['Completed_Courses'])
+    completed_courses = [
+        {'Course_Code': code, 'Course_Name': snapshot.courses_by_code[code]['Course_Name']}
+        for code in dict.fromkeys(completed_codes) if code in snapshot.courses_by_code
+    ]
+    
+    enrolled_courses = course_summaries(snapshot, snapshot.enrollment_index.schedule(student_id))
+    
+    # Get recommendations
+    recommendations = cached_recommendations(student_id, snapshot)
+    
+    response_data = {
+        'profile': {
+            'Student_ID': str(student_info['Student_ID']),
+            'Name': str(student_info['Name']),
+            'Department': str(student_info['Department']),
+            'CGPA': float(student_info['CGPA']),
+            'Completed_Courses': completed_courses,
+            'Enrolled_Courses': enrolled_courses
+        },
+        'recommendations': recommendations
+    }
+    
+    return response_data
+
 @app.route('/api/student_portal', methods=['POST'])
 def student_portal():
     try:
         data = request.json
         student_id = data.get('student_id', '').strip()
-        student_df, course_df, enrollment_df = load_data()
-        student = student_df[student_df['Student_ID'] == student_id]
-        if student.empty:
+        snapshot = store.get()
+        entry = response_cache.get_or_compute(snapshot.version, ('student_portal', student_id),
+                                              lambda: etag_entry(build_student_portal_payload(student_id, snapshot)))
+        if entry is None:
             return jsonify({'error': 'Student not found'}), 404
-            
-        student_info = student.iloc[0].to_dict()
-        # Get completed courses info
-        completed_codes = student_info['Completed_Courses'].split(',') if student_info['Completed_Courses'] else []
-        completed_courses = course_df[course_df['Course_Code'].isin(completed_codes)][['Course_Code', 'Course_Name']].to_dict('records')
-        
-        # Get recommendations
-        recommendations = get_course_recommendations(student_id, student_df, course_df, enrollment_df)
-        
-        # Convert all numeric values to Python native types
-        def convert_numpy_types(obj):
-            if isinstance(obj, dict):
-                return {k: convert_numpy_types(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_numpy_types(v) for v in obj]
-            elif isinstance(obj, (np.integer, np.floating)):
-                return float(obj)
-            elif isinstance(obj, np.ndarray):
-                return obj.tolist()
-            return obj
-            
-        # Prepare response with converted types
-        response_data = {
-            'profile': {
-                'Student_ID': str(student_info['Student_ID']),
-                'Name': str(student_info['Name']),
-                'Department': str(student_info['Department']),
-                'CGPA': float(student_info['CGPA']),
-                'Completed_Courses': completed_courses
-            },
-            'recommendations': convert_numpy_types(recommendations)
-        }
-        
-        return jsonify(response_data)
+
+        return conditional_json(*entry)
     except Exception as e:
-        import traceback
-        print(traceback.format_exc())
+        logger.exception("Unhandled error in %s", request.endpoint)
         return jsonify({'error': str(e), 'message': 'Error loading student portal'}), 500
 
 @app.route('/api/admin/login', methods=['POST'])
@@ -398,86 +566,222 @@ def admin_login():
             return jsonify({'success': False, 'message': 'Invalid credentials'}), 401
             
     except Exception as e:
-        print(f"Admin login error: {str(e)}")
+        logger.error("Admin login error: %s", e)
         return jsonify({'success': False, 'message': 'An error occurred during login'}), 500
 
 @app.route('/api/admin/dashboard', methods=['GET'])
 def admin_dashboard():
     try:
-        student_df, course_df, enrollment_df = load_data()
-        # Calculate statistics for admin dashboard
-        total_students = int(len(student_df))
-        total_courses = int(len(course_df))
-        total_enrollments = int(enrollment_df['Enrollment_Count'].sum())
-        # Department statistics
-        dept_stats = {str(k): int(v) for k, v in student_df['Department'].value_counts().items()}
-        # Course difficulty distribution
-        difficulty_stats = {str(k): int(v) for k, v in course_df['Difficulty'].value_counts().items()}
-        # Average CGPA by department
-        cgpa_by_dept = {str(k): float(v) for k, v in student_df.groupby('Department')['CGPA'].mean().items()}
-        # Most enrolled courses
-        top_courses = [
-            {
-                'Course_Code': str(row['Course_Code']),
-                'Course_Name': str(row['Course_Name']),
-                'Enrollment_Count': int(row['Enrollment_Count'])
-            }
-            for _, row in enrollment_df.sort_values('Enrollment_Count', ascending=False).head(5).iterrows()
-        ]
-        return jsonify({
+        # Aggregates are materialized once per data snapshot
+        return json_response({
             'success': True,
-            'stats': {
-                'total_students': total_students,
-                'total_courses': total_courses,
-                'total_enrollments': total_enrollments,
-                'department_stats': dept_stats,
-                'difficulty_stats': difficulty_stats,
-                'cgpa_by_department': cgpa_by_dept,
-                'top_courses': top_courses
-            }
+            'stats': store.get().stats.dashboard()
         })
     except Exception as e:
-        print(f"Admin dashboard error: {str(e)}")
+        logger.error("Admin dashboard error: %s", e)
         return jsonify({'success': False, 'message': 'Error loading admin dashboard'}), 500
 
+def admin_listing_response(snapshot, table, key, hidden_columns=()):
+    """Paginated/sorted JSON page, or an NDJSON/CSV stream, of one snapshot table.
+
+    Query parameters: offset (or cursor), limit, columns, sort (prefix '-' or
+    order=desc for descending) and format=json|ndjson|csv.
+    """
+    df = getattr(snapshot, f'{table}_df')
+    query = ListingQuery.from_args(request.args, df, hidden_columns)
+
+    order = None
+    if query.sort:
+        order = snapshot.derived(('sort', table, query.sort, query.ascending),
+                                 lambda: sort_positions(df, query.sort, query.ascending))
+    positions = page_positions(len(df), query, order)
+
+    if query.format in STREAM_FORMATS:
+        generate = iter_ndjson if query.format == 'ndjson' else iter_csv
+        return Response(stream_with_context(generate(df, positions, query.columns)),
+                        mimetype=STREAM_FORMATS[query.format])
+
+    records = page_records(df, positions, query.columns)
+    next_offset = query.offset + len(records)
+    return json_response({
+        'success': True,
+        key: records,
+        'total': int(len(df)),
+        'offset': query.offset,
+        'limit': query.limit,
+        'next_cursor': str(next_offset) if query.limit is not None and next_offset < len(df) else None
+    })
+
 @app.route('/api/admin/students', methods=['GET'])
 def admin_get_students():
     try:
-        student_df, _, _ = load_data()
-        students = student_df.to_dict('records')
-        return jsonify({
-            'success': True,
-            'students': students
-        })
+        # Passwords never leave the server
+        return admin_listing_response(store.get(), 'student', 'students', hidden_columns=('Password',))
+    except ListingError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
     except Exception as e:
-        print(f"Admin get students error: {str(e)}")
+        logger.error("Admin get students error: %s", e)
         return jsonify({'success': False, 'message': 'Error retrieving students'}), 500
 
 @app.route('/api/admin/courses', methods=['GET'])
 def admin_get_courses():
     try:
-        _, course_df, _ = load_data()
-        courses = course_df.to_dict('records')
-        return jsonify({
-            'success': True,
-            'courses': courses
-        })
+        return admin_listing_response(store.get(), 'course', 'courses')
+    except ListingError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
     except Exception as e:
-        print(f"Admin get courses error: {str(e)}")
+        logger.error("Admin get courses error: %s", e)
         return jsonify({'success': False, 'message': 'Error retrieving courses'}), 500
 
 @app.route('/api/admin/enrollments', methods=['GET'])
 def admin_get_enrollments():
     try:
-        _, _, enrollment_df = load_data()
-        enrollments = enrollment_df.to_dict('records')
+        return admin_listing_response(store.get(), 'enrollment', 'enrollments')
+    except ListingError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    except Exception as e:
+        logger.error("Admin get enrollments error: %s", e)
+        return jsonify({'success': False, 'message': 'Error retrieving enrollments'}), 500
+
+@app.route('/api/admin/courses/<course_code>/roster', methods=['GET'])
+def admin_get_course_roster(course_code):
+    try:
+        roster = store.get().enrollment_index.roster(course_code)
+        if roster is None:
+            return jsonify({'success': False, 'message': 'Course not found'}), 404
+        return json_response({
+            'success': True,
+            'course_code': course_code,
+            'count': len(roster),
+            'students': roster
+        })
+    except Exception as e:
+        logger.error("Admin get roster error: %s", e)
+        return jsonify({'success': False, 'message': 'Error retrieving course roster'}), 500
+
+@app.route('/api/admin/<table>/bulk', methods=['POST'])
+def admin_bulk_upsert(table):
+    """Insert or update students, courses or enrollments from a CSV or NDJSON upload (see bulk.py).
+
+    ?format=csv|ndjson overrides the Content-Type; ?dry_run=1 only validates.
+    The upload is applied as one transaction and the in-memory data is
+    updated incrementally, without a reload. Needs the admin token, since
+    uploads can set student passwords.
+    """
+    denied = admin_token_error()
+    if denied is not None:
+        return denied
+    if table not in BULK_TABLES:
+        return jsonify({'success': False, 'message': f'Unknown table: {table}'}), 404
+    start = time.perf_counter()
+    try:
+        upload = BulkUpload(table)
+        upload.read(request.stream, upload_format(request.args.get('format'), request.content_type))
+        if not upload.received:
+            return jsonify({'success': False, 'message': 'The upload has no rows'}), 400
+        dry_run = request.args.get('dry_run', '').lower() in ('1', 'true', 'yes')
+        if dry_run:
+            snapshot = store.get()
+            upload.prepare(snapshot)
+        else:
+            snapshot, _ = store.apply(table, upload.prepare)
+        return json_response({
+            'success': True,
+            'table': table,
+            'dry_run': dry_run,
+            'received': upload.received,
+            'inserted': upload.inserted,
+            'updated': upload.updated,
+            'data': snapshot.info(),
+            'elapsed_ms': round((time.perf_counter() - start) * 1000, 1)
+        })
+    except BulkValidationError as e:
+        return jsonify({'success': False, 'message': f'Upload rejected: {e}', 'errors': e.errors,
+                        'error_count': e.error_count}), 400
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    except Exception as e:
+        logger.exception("Unhandled error in %s", request.endpoint)
+        return jsonify({'success': False, 'message': 'Error applying upload'}), 500
+
+@app.route('/api/admin/whatif', methods=['POST'])
+def admin_whatif():
+    """Eligibility impact of a proposed catalog change; nothing is written.
+
+    Body: {"prerequisites": {"CS201": ["CS101"], ...}, "retire": ["CS150"], "department": optional}
+    """
+    start = time.perf_counter()
+    try:
+        data = request.json or {}
+        changes, retire = parse_proposal(data)
+        impact = simulate(store.get(), changes, retire, data.get('department') or None)
+        return json_response({
+            'success': True,
+            'impact': impact,
+            'elapsed_ms': round((time.perf_counter() - start) * 1000, 1)
+        })
+    except WhatIfError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    except Exception as e:
+        logger.exception("Unhandled error in %s", request.endpoint)
+        return jsonify({'success': False, 'message': 'Error simulating catalog change'}), 500
+
+@app.route('/api/admin/cache', methods=['GET'])
+def admin_cache_stats():
+    return jsonify({
+        'success': True,
+        'cache': response_cache.stats()
+    })
+
+@app.route('/api/admin/memory', methods=['GET'])
+def admin_memory():
+    """Bytes per student held by the current snapshot's columnar student table and enrollment index."""
+    return jsonify({
+        'success': True,
+        'memory': memory_report(store.get())
+    })
+
+@app.route('/api/metrics', methods=['GET'])
+def metrics_endpoint():
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/api/admin/profiler', methods=['GET', 'POST'])
+def admin_profiler():
+    """Profiler state; POST {"enabled": bool, "slow_ms": number} switches it on or off."""
+    if request.method == 'POST':
+        denied = admin_token_error()
+        if denied is not None:
+            return denied
+        data = request.json or {}
+        try:
+            slow_ms = data.get('slow_ms')
+            slow_threshold = float(slow_ms) / 1000 if slow_ms is not None else None
+        except (TypeError, ValueError):
+            return jsonify({'success': False, 'message': 'slow_ms must be a number'}), 400
+        if data.get('enabled', True):
+            profiler.enable(slow_threshold)
+        else:
+            profiler.disable()
+    return jsonify({
+        'success': True,
+        'profiler': profiler.state()
+    })
+
+@app.route('/api/admin/reload', methods=['POST'])
+def admin_reload_data():
+    denied = admin_token_error()
+    if denied is not None:
+        return denied
+    try:
+        snapshot = store.reload(force=True)
         return jsonify({
             'success': True,
-            'enrollments': enrollments
+            'storage': store.backend.name,
+            'data': snapshot.info()
         })
     except Exception as e:
-        print(f"Admin get enrollments error: {str(e)}")
-        return jsonify({'success': False, 'message': 'Error retrieving enrollments'}), 500
+        logger.error("Admin reload error: %s", e)
+        return jsonify({'success': False, 'message': 'Error reloading data'}), 500
 
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
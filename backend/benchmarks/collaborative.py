@@ -0,0 +1,65 @@
+"""Collaborative-filtering benchmark.
+
+Trains the item-item model on a synthetic dataset (benchmarks.dataset),
+reports training time and model file size, then times
+get_course_recommendations for a sample of students with the default and
+the collaborative scoring (the response cache is bypassed).
+
+Run from the backend directory:
+
+    python -m benchmarks.collaborative [--students N] [--courses N] [--sample N]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import collaborative
+from benchmarks.dataset import generate
+from data_store import DataSnapshot
+from recommender import get_course_recommendations
+
+
+def latencies(snapshot, student_ids, scoring):
+    samples = []
+    for student_id in student_ids:
+        start = time.perf_counter()
+        get_course_recommendations(student_id, snapshot, scoring)
+        samples.append(time.perf_counter() - start)
+    return np.array(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time collaborative-filtering training and scoring.')
+    parser.add_argument('--students', type=int, default=10000)
+    parser.add_argument('--courses', type=int, default=1000)
+    parser.add_argument('--neighbors', type=int, default=collaborative.DEFAULT_NEIGHBORS)
+    parser.add_argument('--sample', type=int, default=500, help='students to time recommendations for')
+    args = parser.parse_args()
+
+    student_df, course_df, enrollment_df = generate(args.students, args.courses)
+    snapshot = DataSnapshot(student_df, course_df, enrollment_df, 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cf_model.npz')
+        start = time.perf_counter()
+        model = collaborative.CollaborativeModel.train(student_df, enrollment_df, args.neighbors)
+        elapsed = time.perf_counter() - start
+        model.save(path)
+        print(f"training: {elapsed:.2f}s for {args.students} students, {len(model.codes)} courses, "
+              f"{len(model.data)} similarities, {os.path.getsize(path) / 1024:.0f} KiB on disk")
+
+        collaborative.models = collaborative.ModelCache(path)
+        student_ids = student_df['Student_ID'].sample(min(args.sample, len(student_df)), random_state=0).tolist()
+        print(f"{'scoring':<16}{'p50 ms':>10}{'p95 ms':>10}")
+        for scoring in ('default', 'collaborative'):
+            # One warm-up pass so snapshot-derived indexes and the model load are not timed
+            latencies(snapshot, student_ids[:10], scoring)
+            samples = latencies(snapshot, student_ids, scoring)
+            print(f"{scoring:<16}{np.percentile(samples, 50):>10.2f}{np.percentile(samples, 95):>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""Synthetic portal datasets for benchmarking.
+
+Generates student_data.csv, course_data.csv and enrollment_data.csv in the
+same schema as data/*.csv at a configurable scale. Each department's
+catalog is made of prerequisite chains ``chain_depth`` courses long (every
+course requires the previous one, and some also require a course from
+another chain); students have completed a prefix of some of their
+department's chains and are enrolled in the next course of a few of them.
+The output only depends on the arguments and the seed.
+
+    python -m benchmarks.dataset --out /tmp/portal-100k --students 100000
+"""
+import argparse
+import os
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from storage import COURSE_COLUMNS, ENROLLMENT_COLUMNS, STUDENT_COLUMNS
+
+# (Department, program code, course code prefix); more are numbered as needed
+DEPARTMENTS = [
+    ('Computer Science', 'BSCS', 'CS'),
+    ('Software Engineering', 'BSSE', 'SE'),
+    ('Business Administration', 'BBA', 'BA'),
+    ('Psychology', 'BSPSY', 'PSY'),
+    ('Data Science', 'BSDS', 'DS'),
+    ('Mathematics', 'BSMA', 'MATH'),
+    ('Electrical Engineering', 'BSEE', 'EE'),
+    ('Economics', 'BSECO', 'ECO'),
+]
+
+DIFFICULTIES = np.array(['Easy', 'Medium', 'Hard'])
+CREDIT_HOURS = np.array([1, 2, 3, 3, 3, 4])
+PASSWORD = 'password123'
+
+
+def departments(count: int) -> List[Tuple[str, str, str]]:
+    extra = [(f'Department {i}', f'BSD{i}', f'D{i}X') for i in range(len(DEPARTMENTS) + 1, count + 1)]
+    return (DEPARTMENTS + extra)[:count]
+
+
+def generate(students: int = 10000, courses: int = 1000, department_count: int = 8,
+             chain_depth: int = 12, seed: int = 42) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Build the student, course and enrollment tables."""
+    rng = np.random.RandomState(seed)
+    depts = departments(department_count)
+    per_department = max(1, courses // len(depts))
+    chain_depth = max(1, min(chain_depth, per_department))
+
+    course_rows = []
+    # Department -> list of chains, each a list of course codes in prerequisite order
+    chains: Dict[str, List[List[str]]] = {}
+    for name, _, prefix in depts:
+        codes = [f'{prefix}{100 + i}' for i in range(per_department)]
+        dept_chains = [codes[i:i + chain_depth] for i in range(0, len(codes), chain_depth)]
+        chains[name] = dept_chains
+        for chain_no, chain in enumerate(dept_chains):
+            for level, code in enumerate(chain):
+                prereqs = [chain[level - 1]] if level else []
+                # Cross-chain requirement on an earlier level of another chain
+                if level > 1 and chain_no and rng.rand() < 0.3:
+                    other = dept_chains[rng.randint(chain_no)]
+                    prereqs.append(other[min(level - 2, len(other) - 1)])
+                course_rows.append({
+                    'Course_Code': code,
+                    'Course_Name': f'{name} {level + 1}.{chain_no + 1}',
+                    'Department': name,
+                    'Prerequisites': ','.join(prereqs) if prereqs else 'None',
+                    'Credit_Hours': int(rng.choice(CREDIT_HOURS)),
+                    'Difficulty': DIFFICULTIES[min(2, level * 3 // chain_depth)]
+                })
+    course_df = pd.DataFrame(course_rows, columns=COURSE_COLUMNS)
+
+    dept_of = rng.randint(len(depts), size=students)
+    cgpa = np.round(rng.uniform(2.0, 4.0, size=students), 2)
+    ids, names, dept_names, completed = [], [], [], []
+    rosters: Dict[str, List[str]] = {code: [] for code in course_df['Course_Code']}
+    for i in range(students):
+        name, program, _ = depts[dept_of[i]]
+        student_id = f'FA21-{program}-{i + 1:07d}'
+        dept_chains = chains[name]
+        # Progress along a handful of chains; the next course in each is the current enrollment
+        picked = rng.choice(len(dept_chains), size=min(len(dept_chains), 4), replace=False)
+        progress = rng.randint(0, chain_depth, size=len(picked))
+        # Like data/student_data.csv, every student has completed at least one course
+        progress[0] = max(progress[0], 1)
+        done = []
+        for chain_no, depth in zip(picked, progress):
+            chain = dept_chains[chain_no]
+            done.extend(chain[:depth])
+            if depth < len(chain):
+                rosters[chain[depth]].append(student_id)
+        ids.append(student_id)
+        names.append(f'Student {i + 1}')
+        dept_names.append(name)
+        completed.append(','.join(done))
+    student_df = pd.DataFrame({
+        'Student_ID': ids,
+        'Name': names,
+        'Department': dept_names,
+        'CGPA': cgpa,
+        'Completed_Courses': completed,
+        'Password': PASSWORD
+    }, columns=STUDENT_COLUMNS)
+
+    enrollment_df = pd.DataFrame({
+        'Course_Code': course_df['Course_Code'],
+        'Course_Name': course_df['Course_Name'],
+        'Enrollment_Count': [len(rosters[code]) for code in course_df['Course_Code']],
+        'Students_Enrolled': [','.join(rosters[code]) for code in course_df['Course_Code']]
+    }, columns=ENROLLMENT_COLUMNS)
+    return student_df, course_df, enrollment_df
+
+
+def write(out_dir: str, student_df: pd.DataFrame, course_df: pd.DataFrame,
+          enrollment_df: pd.DataFrame) -> List[str]:
+    """Write the tables as CSV files; returns the student, course and enrollment paths."""
+    os.makedirs(out_dir, exist_ok=True)
+    paths = [os.path.join(out_dir, name) for name in
+             ('student_data.csv', 'course_data.csv', 'enrollment_data.csv')]
+    for df, path in zip((student_df, course_df, enrollment_df), paths):
+        df.to_csv(path, index=False)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic portal dataset.')
+    parser.add_argument('--out', required=True, help='output directory')
+    parser.add_argument('--students', type=int, default=10000)
+    parser.add_argument('--courses', type=int, default=1000)
+    parser.add_argument('--departments', type=int, default=8)
+    parser.add_argument('--chain-depth', type=int, default=12)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    tables = generate(args.students, args.courses, args.departments, args.chain_depth, args.seed)
+    write(args.out, *tables)
+    print(f"Wrote {len(tables[0])} students, {len(tables[1])} courses, {len(tables[2])} enrollments to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
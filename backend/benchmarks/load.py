@@ -0,0 +1,291 @@
+"""Load test for every API endpoint.
+
+Generates (or reuses) a synthetic dataset with benchmarks.dataset, points
+the process-wide data store at it and drives each endpoint through Flask's
+test client, or through a running server with --url. For every endpoint
+it reports p50/p95/p99 latency, throughput and the process's peak RSS after
+the endpoint ran (in-process runs only). Results can be saved as a
+baseline and compared against on a later run; the exit status is 1 when an
+endpoint regressed by more than --threshold. benchmarks/baseline.json holds
+a run at the default scale (10k students, 1000 courses).
+
+Run from the backend directory:
+
+    python -m benchmarks.load --baseline benchmarks/baseline.json
+    python -m benchmarks.load --students 1000000 --courses 5000 --save big.json
+    python -m benchmarks.load --url http://localhost:5000 --data /tmp/portal-100k
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from benchmarks import dataset
+from serialization import encoder_name
+from storage import CsvStorage, read_data_files
+
+# Relative regression (in latency or throughput) reported as a failure
+DEFAULT_THRESHOLD = 0.2
+
+# Metrics compared against a baseline; True when higher is better
+COMPARED_METRICS = {'p50_ms': False, 'p95_ms': False, 'p99_ms': False, 'throughput_rps': True}
+
+
+class Workload:
+    """IDs and codes of the loaded dataset that requests are drawn from."""
+
+    def __init__(self, student_df: pd.DataFrame, course_df: pd.DataFrame, seed: int = 0):
+        self.student_ids = student_df['Student_ID'].tolist()
+        self.passwords = dict(zip(student_df['Student_ID'], student_df['Password'].astype(str)))
+        self.course_codes = course_df['Course_Code'].tolist()
+        self.rng = random.Random(seed)
+
+    def student(self) -> str:
+        return self.rng.choice(self.student_ids)
+
+    def course(self) -> str:
+        return self.rng.choice(self.course_codes)
+
+
+# Request = (method, path, JSON body or None)
+Request = Tuple[str, str, Optional[Dict]]
+
+
+class Endpoint:
+    """A named request generator; ``weight`` scales the number of requests sent."""
+
+    def __init__(self, name: str, make: Callable[[Workload], Request], weight: float = 1.0):
+        self.name = name
+        self.make = make
+        self.weight = weight
+
+
+def _login(w: Workload) -> Request:
+    student_id = w.student()
+    return 'POST', '/api/login', {'student_id': student_id, 'password': w.passwords[student_id]}
+
+
+ENDPOINTS = [
+    Endpoint('recommend', lambda w: ('POST', '/api/recommend', {'student_id': w.student()})),
+    Endpoint('recommend_batch', lambda w: ('POST', '/api/recommend/batch',
+                                           {'student_ids': [w.student() for _ in range(100)], 'top_k': 5}), 0.1),
+    Endpoint('plan', lambda w: ('POST', '/api/plan', {'student_id': w.student()})),
+    Endpoint('plan_batch', lambda w: ('POST', '/api/plan', {'student_ids': [w.student() for _ in range(100)]}), 0.1),
+    Endpoint('student_portal', lambda w: ('POST', '/api/student_portal', {'student_id': w.student()})),
+    Endpoint('login', _login),
+    Endpoint('chat', lambda w: ('POST', '/api/chat',
+                                {'message': 'What courses do you recommend?', 'student_id': w.student()})),
+    Endpoint('chatbot', lambda w: ('POST', '/api/chatbot/response',
+                                   {'message': f'What are the prerequisites for {w.course()}?', 'student_id': w.student()})),
+    Endpoint('admin_login', lambda w: ('POST', '/api/admin/login', {'username': 'admin', 'password': 'admin123'})),
+    Endpoint('admin_dashboard', lambda w: ('GET', '/api/admin/dashboard', None)),
+    Endpoint('admin_students_page', lambda w: ('GET', f'/api/admin/students?limit=100&offset={w.rng.randrange(len(w.student_ids))}&sort=-CGPA', None)),
+    Endpoint('admin_students_ndjson', lambda w: ('GET', '/api/admin/students?format=ndjson', None), 0.02),
+    Endpoint('admin_courses', lambda w: ('GET', '/api/admin/courses?limit=100&sort=Course_Name', None)),
+    Endpoint('admin_enrollments', lambda w: ('GET', '/api/admin/enrollments?limit=100&columns=Course_Code,Enrollment_Count', None)),
+    Endpoint('admin_roster', lambda w: ('GET', f'/api/admin/courses/{w.course()}/roster', None)),
+    Endpoint('admin_cache', lambda w: ('GET', '/api/admin/cache', None)),
+    Endpoint('analyze', lambda w: ('POST', '/api/analyze', {})),
+]
+
+
+class TestClient:
+    """Requests through Flask's test client, in this process."""
+
+    in_process = True
+
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def send(self, method: str, path: str, body: Optional[Dict]) -> Tuple[int, int]:
+        response = self.client.open(path, method=method, json=body)
+        return response.status_code, len(response.get_data())
+
+
+class HttpClient:
+    """Requests to a running server."""
+
+    in_process = False
+
+    def __init__(self, base_url: str, timeout: float = 60.0):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def send(self, method: str, path: str, body: Optional[Dict]) -> Tuple[int, int]:
+        data = json.dumps(body).encode() if body is not None else None
+        req = urllib.request.Request(self.base_url + path, data=data, method=method,
+                                     headers={'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                return response.status, len(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, len(e.read())
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_endpoint(client, endpoint: Endpoint, workload: Workload, requests: int,
+                 concurrency: int, warmup: int) -> Dict:
+    count = max(1, int(requests * endpoint.weight))
+    plan = [endpoint.make(workload) for _ in range(warmup + count)]
+
+    def send(req: Request) -> Tuple[float, int, int]:
+        start = time.perf_counter()
+        status, size = client.send(*req)
+        return time.perf_counter() - start, status, size
+
+    for req in plan[:warmup]:
+        send(req)
+    start = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(concurrency) as pool:
+            results = list(pool.map(send, plan[warmup:]))
+    else:
+        results = [send(req) for req in plan[warmup:]]
+    elapsed = time.perf_counter() - start
+
+    latencies = np.array([r[0] for r in results]) * 1000
+    return {
+        'requests': count,
+        'errors': sum(1 for r in results if r[1] >= 400),
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p95_ms': float(np.percentile(latencies, 95)),
+        'p99_ms': float(np.percentile(latencies, 99)),
+        'throughput_rps': count / elapsed,
+        'mean_bytes': float(np.mean([r[2] for r in results])),
+        'peak_rss_mb': peak_rss_mb() if client.in_process else None
+    }
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Print the change against ``baseline``; returns the regressed 'endpoint.metric' names."""
+    regressions = []
+    print(f"\nchange vs baseline ({baseline['meta'].get('timestamp', 'unknown')}):")
+    print(f"{'endpoint':<24}" + ''.join(f'{m:>16}' for m in COMPARED_METRICS))
+    for name, current in results['endpoints'].items():
+        previous = baseline['endpoints'].get(name)
+        if previous is None:
+            print(f"{name:<24}{'(new)':>16}")
+            continue
+        cells = []
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            change = (current[metric] - previous[metric]) / previous[metric] if previous[metric] else 0.0
+            regressed = -change > threshold if higher_is_better else change > threshold
+            if regressed:
+                regressions.append(f'{name}.{metric}')
+            cells.append(f"{change:>+14.1%}{' !' if regressed else '  '}")
+        print(f'{name:<24}' + ''.join(cells))
+    return regressions
+
+
+def load_dataset(args) -> List[str]:
+    data_dir = args.data or os.path.join(tempfile.gettempdir(), f'portal-bench-{args.students}-{args.courses}-'
+                                                                 f'{args.departments}-{args.chain_depth}-{args.seed}')
+    paths = [os.path.join(data_dir, name) for name in
+             ('student_data.csv', 'course_data.csv', 'enrollment_data.csv')]
+    if not all(os.path.exists(path) for path in paths):
+        start = time.perf_counter()
+        tables = dataset.generate(args.students, args.courses, args.departments, args.chain_depth, args.seed)
+        dataset.write(data_dir, *tables)
+        print(f"generated dataset in {data_dir} ({time.perf_counter() - start:.1f}s)")
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark every API endpoint.')
+    parser.add_argument('--students', type=int, default=10000)
+    parser.add_argument('--courses', type=int, default=1000)
+    parser.add_argument('--departments', type=int, default=8)
+    parser.add_argument('--chain-depth', type=int, default=12)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--data', help='dataset directory (generated there when missing)')
+    parser.add_argument('--url', help='benchmark a running server instead of the in-process test client')
+    parser.add_argument('--requests', type=int, default=500, help='requests per endpoint (before weighting)')
+    parser.add_argument('--concurrency', type=int, default=1)
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument('--endpoints', help='comma-separated subset of endpoint names')
+    parser.add_argument('--save', help='write the results as JSON (e.g. a new baseline)')
+    parser.add_argument('--baseline', help='results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    endpoints = ENDPOINTS
+    if args.endpoints:
+        wanted = set(args.endpoints.split(','))
+        unknown = wanted - {e.name for e in ENDPOINTS}
+        if unknown:
+            parser.error(f"Unknown endpoints: {', '.join(sorted(unknown))}")
+        endpoints = [e for e in ENDPOINTS if e.name in wanted]
+
+    paths = load_dataset(args)
+    if args.url:
+        student_df, course_df, _ = read_data_files(*paths)
+        client = HttpClient(args.url)
+    else:
+        from app import app
+        from data_store import store
+
+        start = time.perf_counter()
+        store.backend = CsvStorage(*paths)
+        snapshot = store.reload(force=True)
+        print(f"loaded snapshot in {time.perf_counter() - start:.1f}s, peak RSS {peak_rss_mb():.0f} MB")
+        student_df, course_df = snapshot.student_df, snapshot.course_df
+        client = TestClient(app)
+    workload = Workload(student_df, course_df, args.seed)
+
+    results = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'students': len(student_df),
+            'courses': len(course_df),
+            'departments': args.departments,
+            'chain_depth': args.chain_depth,
+            'requests': args.requests,
+            'concurrency': args.concurrency,
+            'target': args.url or 'test_client',
+            'encoder': encoder_name(),
+            'python': platform.python_version()
+        },
+        'endpoints': {}
+    }
+
+    print(f"{'endpoint':<24}{'reqs':>6}{'err':>5}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>10}{'RSS MB':>9}")
+    for endpoint in endpoints:
+        stats = run_endpoint(client, endpoint, workload, args.requests, args.concurrency, args.warmup)
+        results['endpoints'][endpoint.name] = stats
+        rss = f"{stats['peak_rss_mb']:>9.0f}" if stats['peak_rss_mb'] is not None else f"{'-':>9}"
+        print(f"{endpoint.name:<24}{stats['requests']:>6}{stats['errors']:>5}{stats['p50_ms']:>10.2f}"
+              f"{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}{stats['throughput_rps']:>10.1f}{rss}")
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"saved results to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"regressions over {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
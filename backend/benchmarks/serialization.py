@@ -0,0 +1,90 @@
+"""Serialization micro-benchmark.
+
+Encodes the student portal, admin dashboard and admin listing payloads of
+the current data snapshot with the previous path (recursive conversion copy
+followed by json.dumps with a NumPy-aware encoder) and with
+serialization.dumps, and reports throughput in bytes/sec.
+
+Run from the backend directory:
+
+    python -m benchmarks.serialization [--repeat N] [--students N]
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from app import build_student_portal_payload
+from data_store import store
+from listing import page_records
+from serialization import dumps, encoder_name
+
+
+class LegacyEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, np.integer):
+            return int(obj)
+        if isinstance(obj, np.floating):
+            return float(obj)
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        return super().default(obj)
+
+
+def legacy_convert(obj):
+    if isinstance(obj, dict):
+        return {k: legacy_convert(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [legacy_convert(v) for v in obj]
+    elif isinstance(obj, (np.integer, np.floating)):
+        return float(obj)
+    elif isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return obj
+
+
+def legacy_dumps(obj) -> bytes:
+    return json.dumps(legacy_convert(obj), sort_keys=True, cls=LegacyEncoder).encode()
+
+
+def measure(encode, payloads, repeat):
+    size = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for payload in payloads:
+            size += len(encode(payload))
+    elapsed = time.perf_counter() - start
+    return size / elapsed, elapsed / (repeat * len(payloads))
+
+
+def build_payloads(snapshot, students):
+    student_ids = list(snapshot.students_by_id)[:students]
+    portal = [p for p in (build_student_portal_payload(sid, snapshot) for sid in student_ids) if p is not None]
+    dashboard = [{'success': True, 'stats': snapshot.stats.dashboard()}]
+    columns = [c for c in snapshot.student_df.columns if c != 'Password']
+    listing = [{
+        'success': True,
+        'students': page_records(snapshot.student_df, np.arange(len(snapshot.student_df)), columns),
+        'total': len(snapshot.student_df)
+    }]
+    return {'portal': portal, 'dashboard': dashboard, 'admin_students': listing}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare JSON serialization paths.')
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--students', type=int, default=200, help='portal payloads to encode')
+    args = parser.parse_args()
+
+    payloads = build_payloads(store.get(), args.students)
+    print(f"encoder: {encoder_name()}")
+    print(f"{'payload':<16}{'path':<8}{'MB/s':>10}{'us/payload':>14}")
+    for name, items in payloads.items():
+        for path, encode in (('legacy', legacy_dumps), ('new', dumps)):
+            rate, per_payload = measure(encode, items, args.repeat)
+            print(f"{name:<16}{path:<8}{rate / 1e6:>10.1f}{per_payload * 1e6:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""Startup time and per-worker memory of a pre-forked server.
+
+Generates (or reuses) a synthetic dataset with benchmarks.dataset, compiles
+it with snapshot_file, then runs each mode in a fresh process that forks
+--workers workers the way gunicorn does:
+
+* per-worker: the master only imports the app; every worker parses the CSV
+  files itself (gunicorn without preload_app)
+* preload: the master parses the CSV files, calls gc.freeze() and forks
+* preload+compiled: the master maps the compiled snapshot, calls
+  gc.freeze() and forks
+
+Each worker serves a mix of requests through Flask's test client. Once
+every worker is done, each one reports its RSS, PSS (shared pages split
+between the processes that map them) and private memory from
+/proc/self/smaps_rollup, so the benchmark needs Linux.
+
+Run from the backend directory:
+
+    python -m benchmarks.startup [--students N] [--workers N] [--requests N]
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from benchmarks.load import load_dataset
+
+MODES = ('per-worker', 'preload', 'preload+compiled')
+
+
+def memory_mb() -> Dict[str, float]:
+    fields = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                fields[parts[0].rstrip(':')] = int(parts[1]) / 1024
+    return {
+        'rss_mb': fields.get('Rss', 0.0),
+        'pss_mb': fields.get('Pss', 0.0),
+        'private_mb': fields.get('Private_Clean', 0.0) + fields.get('Private_Dirty', 0.0)
+    }
+
+
+def serve(client, student_ids: List[str], requests: int, seed: int):
+    rng = random.Random(seed)
+    for i in range(requests):
+        student_id = rng.choice(student_ids)
+        if i % 3 == 0:
+            client.post('/api/student_portal', json={'student_id': student_id})
+        elif i % 3 == 1:
+            client.post('/api/recommend', json={'student_id': student_id})
+        else:
+            client.post('/api/plan', json={'student_id': student_id})
+
+
+def run_mode(mode: str, paths: List[str], snapshot_path: str, workers: int, requests: int) -> Dict:
+    """Runs in its own process: load as ``mode`` says, fork the workers and collect their reports."""
+    start = time.perf_counter()
+    from app import app
+    from data_store import store
+    from storage import CsvStorage
+
+    store.backend = CsvStorage(*paths)
+    store.snapshot_path = snapshot_path if mode == 'preload+compiled' else ''
+    if mode != 'per-worker':
+        store.get()
+        gc.freeze()
+    master_ready = time.perf_counter() - start
+    student_ids = list(store.get().students_by_id)[:10000] if mode != 'per-worker' else None
+
+    children = []
+    for worker in range(workers):
+        report_read, report_write = os.pipe()
+        go_read, go_write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(report_read)
+            os.close(go_write)
+            fork_time = time.perf_counter()
+            snapshot = store.get()
+            ready = time.perf_counter() - fork_time
+            serve(app.test_client(), student_ids or list(snapshot.students_by_id)[:10000], requests, worker)
+            os.write(report_write, b'.')
+            # Measure only once every worker has loaded and served, so PSS splits the shared pages fairly
+            os.read(go_read, 1)
+            report = dict(memory_mb(), ready_s=ready)
+            os.write(report_write, json.dumps(report).encode())
+            os._exit(0)
+        os.close(report_write)
+        os.close(go_read)
+        children.append((pid, report_read, go_write))
+
+    for _, report_read, _ in children:
+        os.read(report_read, 1)
+    for _, _, go_write in children:
+        os.write(go_write, b'.')
+    reports = []
+    for pid, report_read, _ in children:
+        chunks = []
+        while True:
+            chunk = os.read(report_read, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        reports.append(json.loads(b''.join(chunks)))
+        os.waitpid(pid, 0)
+
+    def mean(key):
+        return sum(r[key] for r in reports) / len(reports)
+
+    return {'mode': mode, 'master_ready_s': master_ready, 'worker_ready_s': mean('ready_s'),
+            'rss_mb': mean('rss_mb'), 'pss_mb': mean('pss_mb'), 'private_mb': mean('private_mb')}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure startup time and per-worker memory.')
+    parser.add_argument('--students', type=int, default=100000)
+    parser.add_argument('--courses', type=int, default=1000)
+    parser.add_argument('--departments', type=int, default=8)
+    parser.add_argument('--chain-depth', type=int, default=12)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--data', help='dataset directory (generated there when missing)')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=300, help='requests served by each worker')
+    parser.add_argument('--modes', default=','.join(MODES))
+    parser.add_argument('--run', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--snapshot', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    paths = load_dataset(args)
+    if args.run:
+        print(json.dumps(run_mode(args.run, paths, args.snapshot, args.workers, args.requests)))
+        return
+
+    from data_store import DataSnapshot
+    import snapshot_file
+    from storage import CsvStorage
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot_path = os.path.join(tmp, 'snapshot.bin')
+        backend = CsvStorage(*paths)
+        start = time.perf_counter()
+        size = snapshot_file.write(DataSnapshot(*backend.load(), 1), snapshot_path, backend.signature())
+        print(f"compiled {args.students} students into {size / 1e6:.1f} MB ({time.perf_counter() - start:.1f}s)")
+
+        print(f"{'mode':<18}{'master s':>10}{'worker s':>10}{'RSS MB':>9}{'PSS MB':>9}{'private MB':>12}")
+        for mode in args.modes.split(','):
+            command = [sys.executable, '-m', 'benchmarks.startup', '--run', mode, '--snapshot', snapshot_path,
+                       '--students', str(args.students), '--courses', str(args.courses),
+                       '--departments', str(args.departments), '--chain-depth', str(args.chain_depth),
+                       '--seed', str(args.seed), '--workers', str(args.workers), '--requests', str(args.requests)]
+            if args.data:
+                command += ['--data', args.data]
+            output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{mode:<18}{result['master_ready_s']:>10.2f}{result['worker_ready_s']:>10.2f}{result['rss_mb']:>9.0f}"
+                  f"{result['pss_mb']:>9.0f}{result['private_mb']:>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
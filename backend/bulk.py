@@ -0,0 +1,312 @@
+"""Bulk admin uploads of students, courses and enrollments.
+
+An upload is CSV (header row first) or NDJSON (one JSON object per line)
+and is read from the request stream row by row, so the raw body is never
+held in memory. Rows are upserts keyed by Student_ID or Course_Code. For a
+row that already exists, only the columns it provides change (an empty CSV
+cell leaves a value as it is, except in list columns, where it means an
+empty list). Courses may also set the optional Capacity column (seats.py),
+which is added to a catalog that does not have it yet.
+
+Validation runs in two passes and any error rejects the whole upload:
+
+* while streaming, each row on its own: required fields, types and
+  ranges, and keys repeated within the upload;
+* under the store lock, the upload against the current data: unknown
+  prerequisite codes, prerequisite cycles, enrollments naming unknown
+  courses or students, and required fields missing from new rows.
+
+A valid upload is written with one storage upsert and the in-memory
+snapshot is updated incrementally (DataStore.apply).
+"""
+import csv
+import io
+import json
+from typing import Callable, Dict, IO, List, Optional, Tuple
+
+from prereq_graph import split_codes
+from storage import COURSE_COLUMNS, ENROLLMENT_COLUMNS, OPTIONAL_COURSE_COLUMNS, STUDENT_COLUMNS
+
+BULK_FORMATS = ('csv', 'ndjson')
+
+# Errors reported back before the rest are summarized
+MAX_ERRORS = 100
+
+DIFFICULTIES = ('Easy', 'Medium', 'Hard')
+
+
+class BulkValidationError(ValueError):
+    """Rejected upload (reported to the client as a 400 with the row errors)."""
+
+    def __init__(self, errors: List[Dict], error_count: Optional[int] = None):
+        self.errors = errors
+        self.error_count = error_count if error_count is not None else len(errors)
+        super().__init__(f"{self.error_count} invalid row{'s' if self.error_count != 1 else ''}")
+
+
+def _text(value) -> Optional[str]:
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def _codes(value) -> List[str]:
+    """A course or student list given as a JSON array or a comma-separated string."""
+    if isinstance(value, list):
+        return [str(code).strip() for code in value if str(code).strip()]
+    return [code.strip() for code in split_codes(_text(value)) if code.strip()]
+
+
+def _number(value, name: str, cast: Callable, low: float, high: Optional[float] = None):
+    try:
+        number = cast(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a number")
+    if isinstance(value, float) and cast is int and value != number:
+        raise ValueError(f"{name} must be a whole number")
+    if number < low or (high is not None and number > high):
+        raise ValueError(f"{name} must be between {low} and {high}" if high is not None else f"{name} must be at least {low}")
+    return number
+
+
+def _student_row(row: Dict) -> Dict:
+    record = {}
+    for column in ('Name', 'Department', 'Password'):
+        if _text(row.get(column)) is not None:
+            record[column] = _text(row[column])
+    if _text(row.get('CGPA')) is not None:
+        record['CGPA'] = _number(row['CGPA'], 'CGPA', float, 0.0, 4.0)
+    if 'Completed_Courses' in row:
+        record['Completed_Courses'] = ','.join(code.upper() for code in _codes(row['Completed_Courses']))
+    return record
+
+
+def _course_row(row: Dict) -> Dict:
+    record = {}
+    for column in ('Course_Name', 'Department'):
+        if _text(row.get(column)) is not None:
+            record[column] = _text(row[column])
+    if 'Prerequisites' in row:
+        record['Prerequisites'] = ','.join(code.upper() for code in _codes(row['Prerequisites'])) or 'None'
+    if _text(row.get('Credit_Hours')) is not None:
+        record['Credit_Hours'] = _number(row['Credit_Hours'], 'Credit_Hours', int, 1, 12)
+    if _text(row.get('Difficulty')) is not None:
+        difficulty = _text(row['Difficulty']).capitalize()
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"Difficulty must be one of {', '.join(DIFFICULTIES)}")
+        record['Difficulty'] = difficulty
+    if _text(row.get('Capacity')) is not None:
+        record['Capacity'] = _number(row['Capacity'], 'Capacity', int, 0)
+    return record
+
+
+def _enrollment_row(row: Dict) -> Dict:
+    record = {}
+    if _text(row.get('Course_Name')) is not None:
+        record['Course_Name'] = _text(row['Course_Name'])
+    if 'Students_Enrolled' in row:
+        record['Students_Enrolled'] = ','.join(dict.fromkeys(_codes(row['Students_Enrolled'])))
+    if _text(row.get('Enrollment_Count')) is not None:
+        record['Enrollment_Count'] = _number(row['Enrollment_Count'], 'Enrollment_Count', int, 0)
+    return record
+
+
+# Table -> (key column, columns, optional columns, columns a new row must have, row normalizer)
+TABLES = {
+    'students': ('Student_ID', STUDENT_COLUMNS, [], ('Name', 'Department', 'CGPA', 'Password'), _student_row),
+    'courses': ('Course_Code', COURSE_COLUMNS, OPTIONAL_COURSE_COLUMNS,
+                ('Course_Name', 'Department', 'Credit_Hours', 'Difficulty'), _course_row),
+    'enrollments': ('Course_Code', ENROLLMENT_COLUMNS, [], (), _enrollment_row),
+}
+
+
+class BulkUpload:
+    """One table's upload: rows normalized while streaming, then validated and merged against a snapshot."""
+
+    def __init__(self, table: str):
+        if table not in TABLES:
+            raise ValueError(f"Unknown table: {table}")
+        self.table = table
+        self.key, self.columns, optional, self.required, self._normalize = TABLES[table]
+        # Optional columns are written only when the upload or the existing row has them
+        self.optional = list(optional)
+        # Key -> (row number, provided columns), in upload order
+        self.rows: Dict[str, Tuple[int, Dict]] = {}
+        self.errors: List[Dict] = []
+        self.error_count = 0
+        self.received = 0
+        self.inserted = 0
+        self.updated = 0
+
+    def error(self, row_number: int, message: str, key: Optional[str] = None):
+        self.error_count += 1
+        if len(self.errors) < MAX_ERRORS:
+            entry = {'row': row_number, 'error': message}
+            if key is not None:
+                entry[self.key] = key
+            self.errors.append(entry)
+
+    def read(self, stream: IO[bytes], fmt: str):
+        """Consume an upload body; ``fmt`` is 'csv' or 'ndjson'."""
+        text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+        if fmt == 'csv':
+            reader = csv.DictReader(text)
+            if reader.fieldnames is None or self.key not in reader.fieldnames:
+                raise BulkValidationError([{'row': 0, 'error': f"Header must include {self.key}"}])
+            try:
+                for row_number, row in enumerate(reader, start=1):
+                    self.add(row_number, row)
+            except csv.Error as e:
+                self.error(reader.line_num, f"Invalid CSV: {e}")
+        elif fmt == 'ndjson':
+            row_number = 0
+            for line in text:
+                if not line.strip():
+                    continue
+                row_number += 1
+                try:
+                    row = json.loads(line)
+                except ValueError as e:
+                    self.error(row_number, f"Invalid JSON: {e}")
+                    continue
+                if not isinstance(row, dict):
+                    self.error(row_number, 'Each line must be a JSON object')
+                    continue
+                self.add(row_number, row)
+        else:
+            raise ValueError(f"Unsupported format: {fmt}")
+
+    def add(self, row_number: int, row: Dict):
+        self.received += 1
+        key = _text(row.get(self.key))
+        if key is None:
+            self.error(row_number, f"{self.key} is required")
+            return
+        if self.key == 'Course_Code':
+            key = key.upper()
+        unknown = [column for column in row
+                   if column not in self.columns and column not in self.optional and column is not None]
+        if unknown:
+            self.error(row_number, f"Unknown columns: {', '.join(map(str, unknown))}", key)
+            return
+        if key in self.rows:
+            self.error(row_number, f"Duplicate {self.key} (first seen on row {self.rows[key][0]})", key)
+            return
+        try:
+            self.rows[key] = (row_number, self._normalize(row))
+        except ValueError as e:
+            self.error(row_number, str(e), key)
+
+    def check(self):
+        if self.error_count:
+            raise BulkValidationError(self.errors, self.error_count)
+
+    def prepare(self, snapshot) -> List[Dict]:
+        """Full records to write, merged over ``snapshot``'s rows; raises BulkValidationError."""
+        self.check()
+        existing = {'students': snapshot.students_by_id, 'courses': snapshot.courses_by_code,
+                    'enrollments': snapshot.enrollments_by_code}[self.table]
+        records = []
+        for key, (row_number, provided) in self.rows.items():
+            previous = existing.get(key)
+            if previous is None:
+                missing = [column for column in self.required if column not in provided]
+                if missing:
+                    self.error(row_number, f"New row needs {', '.join(missing)}", key)
+                    continue
+                record = {column: None for column in self.columns}
+                record.update({'Completed_Courses': '', 'Prerequisites': 'None', 'Students_Enrolled': ''})
+            else:
+                record = dict(previous)
+            record.update(provided)
+            record[self.key] = key
+            records.append(record)
+        self.inserted = sum(1 for record in records if record[self.key] not in existing)
+        self.updated = len(records) - self.inserted
+
+        if self.table == 'courses':
+            self._check_prerequisites(snapshot, records)
+        elif self.table == 'enrollments':
+            self._check_enrollments(snapshot, records)
+        self.check()
+        return [{column: record[column] for column in self.columns + self.optional if column in record}
+                for record in records]
+
+    def _check_prerequisites(self, snapshot, records: List[Dict]):
+        prerequisites = {code: split_codes(course['Prerequisites']) for code, course in snapshot.courses_by_code.items()}
+        for record in records:
+            prerequisites[record['Course_Code']] = split_codes(record['Prerequisites'])
+        for record in records:
+            code = record['Course_Code']
+            unknown = [prereq for prereq in prerequisites[code] if prereq not in prerequisites]
+            if unknown:
+                self.error(self.rows[code][0], f"Unknown prerequisite codes: {', '.join(unknown)}", code)
+            if code in prerequisites[code]:
+                self.error(self.rows[code][0], 'Course lists itself as a prerequisite', code)
+        # Any new cycle goes through an uploaded course
+        for cycle in _find_cycles(prerequisites, [record['Course_Code'] for record in records]):
+            if len(cycle) > 1:
+                self.error(self.rows[cycle[0]][0] if cycle[0] in self.rows else 0,
+                           f"Prerequisite cycle: {' -> '.join(cycle + [cycle[0]])}", cycle[0])
+
+    def _check_enrollments(self, snapshot, records: List[Dict]):
+        for record in records:
+            code = record['Course_Code']
+            row_number = self.rows[code][0]
+            course = snapshot.courses_by_code.get(code)
+            if course is None:
+                self.error(row_number, 'Unknown course', code)
+                continue
+            if record.get('Course_Name') is None:
+                record['Course_Name'] = course['Course_Name']
+            roster = split_codes(record['Students_Enrolled'])
+            unknown = [student_id for student_id in roster if student_id not in snapshot.students_by_id]
+            if unknown:
+                shown = ', '.join(unknown[:10]) + (f' and {len(unknown) - 10} more' if len(unknown) > 10 else '')
+                self.error(row_number, f"Unknown students: {shown}", code)
+            if 'Enrollment_Count' not in self.rows[code][1] and 'Students_Enrolled' in self.rows[code][1]:
+                record['Enrollment_Count'] = len(roster)
+
+
+def _find_cycles(prerequisites: Dict[str, List[str]], roots: List[str]) -> List[List[str]]:
+    """Prerequisite cycles reachable from ``roots``, each as its list of codes (iterative DFS)."""
+    state: Dict[str, int] = {}  # 1 on the current path, 2 finished
+    cycles = []
+    for root in roots:
+        if root in state:
+            continue
+        path: List[str] = []
+        stack = [(root, iter(prerequisites.get(root, ())))]
+        state[root] = 1
+        path.append(root)
+        while stack:
+            code, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                path.pop()
+                state[code] = 2
+                continue
+            if child not in prerequisites:
+                continue
+            if state.get(child) == 1:
+                cycles.append(path[path.index(child):])
+            elif child not in state:
+                state[child] = 1
+                path.append(child)
+                stack.append((child, iter(prerequisites[child])))
+    return cycles
+
+
+def upload_format(fmt: Optional[str], content_type: Optional[str]) -> str:
+    """Upload format from the ``format`` parameter, else the Content-Type (CSV by default)."""
+    if fmt:
+        fmt = fmt.lower()
+        if fmt not in BULK_FORMATS:
+            raise ValueError(f"Unsupported format: {fmt}")
+        return fmt
+    content_type = (content_type or '').lower()
+    if 'ndjson' in content_type or 'jsonl' in content_type or 'json' in content_type:
+        return 'ndjson'
+    return 'csv'
@@ -1,92 +1,186 @@
 from flask import jsonify, request
-import json
-import os
-from typing import List, Dict, Any
-import pandas as pd
+from typing import List, Dict, Any, Optional, Tuple
+from data_store import DataSnapshot, store
+from intents import classify
+from recommender import get_course_recommendations
+from response_cache import ResponseCache
+from sessions import HISTORY_LIMIT, SessionStore, create_session_store, new_session_id
+
+def _clean_history(history: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    if not isinstance(history, list):
+        return []
+    return [{'text': str(item.get('text', '')), 'sender': str(item.get('sender', ''))}
+            for item in history[-HISTORY_LIMIT:] if isinstance(item, dict)]
+
+# Recommendations kept per (data snapshot version, student) for follow-up questions
+RECOMMENDATION_CACHE_SIZE = 1024
+RECOMMENDATION_CACHE_TTL = 300.0
 
 class CourseRecommender:
-    def __init__(self):
-        self.courses = self._load_courses()
-        self.prerequisites = self._load_prerequisites()
-        self.student_data = self._load_student_data()
-
-    def _load_courses(self) -> pd.DataFrame:
-        # Load course data from CSV or database
-        # This is a placeholder - you'll need to implement actual data loading
-        return pd.DataFrame({
-            'course_id': ['CS101', 'CS102', 'MATH101'],
-            'course_name': ['Introduction to Programming', 'Data Structures', 'Calculus I'],
-            'prerequisites': ['None', 'CS101', 'None'],
-            'credits': [3, 3, 4],
-            'department': ['CS', 'CS', 'MATH']
-        })
-
-    def _load_prerequisites(self) -> Dict[str, List[str]]:
-        # Load prerequisite relationships
-        return {
-            'CS102': ['CS101'],
-            'CS201': ['CS102'],
-            'MATH201': ['MATH101']
-        }
+    """Chatbot access to the shared data snapshot.
 
-    def _load_student_data(self) -> Dict[str, Any]:
-        # Load student academic records
-        # This is a placeholder - implement actual data loading
-        return {
-            'completed_courses': ['CS101', 'MATH101'],
-            'cgpa': 3.5,
-            'program': 'Computer Science',
-            'current_semester': 2
-        }
+    Holds no data of its own: students, courses and the prerequisite graph
+    come from the process-wide data store, and recommendations from the
+    same get_course_recommendations used by /api/recommend.
+    """
 
-    def get_recommendations(self, student_id: str) -> List[Dict[str, Any]]:
-        student = self.student_data
-        completed = set(student['completed_courses'])
-        
-        recommendations = []
-        for _, course in self.courses.iterrows():
-            prereqs = self.prerequisites.get(course['course_id'], [])
-            if all(prereq in completed for prereq in prereqs):
-                recommendations.append({
-                    'course_id': course['course_id'],
-                    'course_name': course['course_name'],
-                    'credits': course['credits'],
-                    'department': course['department']
-                })
-        
+    def get_recommendations(self, student_id: str, snapshot: Optional[DataSnapshot] = None) -> Optional[List[Dict[str, Any]]]:
+        """Eligible courses for the student, best first, or None for an unknown student."""
+        recommendations = get_course_recommendations(student_id, snapshot or store.get())
+        if 'error' in recommendations:
+            return None
         return recommendations
 
+    def find_courses(self, message: str) -> List[str]:
+        """Codes of the catalog courses named in the message (see SearchIndex.mentioned_courses)."""
+        return store.get().search_index.mentioned_courses(message)
+
+    def get_prerequisites(self, course_code: str) -> Optional[Dict[str, List[str]]]:
+        # Answered from the prerequisite graph compiled with the current data snapshot
+        graph = store.get().prereq_graph
+        direct = graph.direct_prerequisites(course_code)
+        if direct is None:
+            return None
+        return {
+            'direct': direct,
+            'all': graph.all_prerequisites(course_code)
+        }
+
 class Chatbot:
-    def __init__(self):
+    def __init__(self, sessions: Optional[SessionStore] = None):
         self.recommender = CourseRecommender()
-        self.conversation_state = {}
+        # Conversation ID -> student and recent history, bounded and shared by threads
+        self.sessions = sessions if sessions is not None else create_session_store()
+        self.recommendations = ResponseCache(RECOMMENDATION_CACHE_SIZE, RECOMMENDATION_CACHE_TTL)
+
+    def handle(self, message: str, conversation_id: Optional[str] = None, student_id: Optional[str] = None,
+               client_history: Optional[List[Dict[str, str]]] = None) -> Tuple[str, str]:
+        """Answer one message of a conversation; returns (response, conversation ID).
+
+        A new conversation ID is issued when none is given. The history is
+        kept on the server (the last HISTORY_LIMIT messages); history sent by
+        the client only seeds a conversation the server does not know.
+        """
+        conversation_id = conversation_id or new_session_id()
+        stored = self.sessions.get(conversation_id)
+        # Work on a copy: other threads may be reading the stored session
+        session = dict(stored) if stored is not None else {'history': _clean_history(client_history or [])}
+        history = list(session['history'])
+
+        response = self.process_message(message, history, student_id, session)
 
-    def process_message(self, message: str, conversation_history: List[Dict[str, str]]) -> str:
-        # Simple intent detection
-        message = message.lower()
+        history.append({'text': message, 'sender': 'user'})
+        history.append({'text': response, 'sender': 'bot'})
+        session['history'] = history[-HISTORY_LIMIT:]
+        self.sessions.put(conversation_id, session)
+        return response, conversation_id
+
+    def student_recommendations(self, student_id: str) -> Optional[List[Dict[str, Any]]]:
+        """The student's recommendations on the current data snapshot, or None for an unknown student.
+
+        They are cached per snapshot version and student in this process,
+        so follow-up questions do not recompute them. Sessions only keep the
+        student ID.
+        """
+        snapshot = store.get()
+        return self.recommendations.get_or_compute(
+            snapshot.version, student_id, lambda: self.recommender.get_recommendations(student_id, snapshot))
+
+    def process_message(self, message: str, conversation_history: List[Dict[str, str]],
+                        student_id: Optional[str] = None, session: Optional[Dict[str, Any]] = None) -> str:
+        session = session if session is not None else {}
+        intent = classify(message)
+        # The student is taken from the request, the message, or earlier in the conversation
+        if not student_id and intent.student_ids:
+            student_id = intent.student_ids[0]
+        student_id = student_id or session.get('student_id')
+        if student_id:
+            session['student_id'] = student_id
+        # Sessions written by older versions cached the student's data here
+        session.pop('context', None)
         
-        if any(greeting in message for greeting in ['hi', 'hello', 'hey']):
+        if intent.name == 'greeting':
             return "Hello! I'm your academic advisor chatbot. I can help you with course recommendations and academic planning. How can I assist you today?"
+
+        # Courses named by code, or else by name (resolved with the search index)
+        course_codes = intent.course_codes
+        if not course_codes and intent.name in ('prerequisites', 'course_info', 'help', 'unknown'):
+            course_codes = self.recommender.find_courses(message)
+
+        if intent.name == 'prerequisites':
+            return self.describe_prerequisites(course_codes, student_id)
+        
+        elif intent.name == 'cgpa':
+            if not student_id:
+                return "Please tell me your student ID (for example FA21-BSCS-0001) so I can look up your CGPA."
+            student = store.get().students_by_id.get(student_id)
+            if student is None:
+                return f"I couldn't find a student record for {student_id}. Please check your student ID."
+            return f"Your CGPA is {student['CGPA']}."
         
-        elif 'recommend' in message or 'course' in message:
-            recommendations = self.recommender.get_recommendations('student123')
+        elif intent.name in ('course_info', 'help', 'unknown') and course_codes:
+            return self.describe_courses(course_codes)
+        
+        elif intent.name in ('recommend', 'course_info'):
+            recommendations = self.student_recommendations(student_id) if student_id else None
+            if recommendations is None:
+                if student_id:
+                    return f"I couldn't find a student record for {student_id}. Please check your student ID."
+                return "Please tell me your student ID (for example FA21-BSCS-0001) so I can recommend courses for you."
             if recommendations:
                 response = "Based on your academic record, I recommend the following courses:\n"
-                for course in recommendations:
-                    response += f"- {course['course_id']}: {course['course_name']} ({course['credits']} credits)\n"
+                for course in recommendations[:5]:
+                    response += f"- {course['Course_Code']}: {course['Course_Name']} ({course['Credit_Hours']} credits)\n"
                 return response
             else:
                 return "I couldn't find any suitable course recommendations at the moment. Please check your prerequisites or contact your academic advisor."
         
-        elif 'prerequisite' in message:
-            return "I can check prerequisites for any course. Please specify which course you're interested in."
-        
-        elif 'help' in message:
+        elif intent.name == 'help':
             return "I can help you with:\n- Course recommendations\n- Prerequisite checking\n- Academic planning\n- Program requirements\nWhat would you like to know?"
         
         else:
             return "I'm not sure I understand. Could you please rephrase your question? I can help with course recommendations, prerequisites, and academic planning."
 
+    def describe_courses(self, course_codes: List[str]) -> str:
+        catalog = store.get().courses_by_code
+        lines = []
+        for code in course_codes:
+            course = catalog.get(code)
+            if course is None:
+                lines.append(f"I couldn't find {code} in the course catalog.")
+                continue
+            prerequisites = self.recommender.get_prerequisites(code)['direct']
+            lines.append(f"{code}: {course['Course_Name']} ({course['Credit_Hours']} credits, "
+                         f"{course['Department']}). Prerequisites: {', '.join(prerequisites) if prerequisites else 'none'}.")
+        return "\n".join(lines)
+
+    def describe_prerequisites(self, course_codes: List[str], student_id: Optional[str] = None) -> str:
+        if not course_codes:
+            return "I can check prerequisites for any course. Please specify which course you're interested in."
+        
+        snapshot = store.get()
+        # What the student still needs is only added for a known student
+        completed_mask = snapshot.prereq_graph.completed_mask(student_id) \
+            if student_id and student_id in snapshot.students_by_id else None
+        lines = []
+        for code in course_codes:
+            prereqs = self.recommender.get_prerequisites(code)
+            if prereqs is None:
+                lines.append(f"I couldn't find {code} in the course catalog.")
+            elif not prereqs['direct']:
+                lines.append(f"{code} has no prerequisites.")
+            else:
+                line = f"{code} requires {', '.join(prereqs['direct'])}"
+                indirect = [c for c in prereqs['all'] if c not in prereqs['direct']]
+                if indirect:
+                    line += f", which in turn require {', '.join(indirect)}"
+                line += "."
+                if completed_mask is not None:
+                    missing = snapshot.prereq_graph.missing_prerequisites(code, completed_mask)
+                    line += f" You still need {', '.join(missing)}." if missing else " You have completed all of them."
+                lines.append(line)
+        return "\n".join(lines)
+
 def setup_chatbot_routes(app):
     chatbot = Chatbot()
 
@@ -94,7 +188,10 @@ def setup_chatbot_routes(app):
     def get_chatbot_response():
         data = request.get_json()
         message = data.get('message', '')
-        conversation_history = data.get('conversationHistory', [])
+        student_id = (data.get('student_id') or '').strip() or None
         
-        response = chatbot.process_message(message, conversation_history)
-        return jsonify({'response': response}) 
\ No newline at end of file
+        response, conversation_id = chatbot.handle(message, data.get('conversation_id') or None, student_id,
+                                                   data.get('conversationHistory'))
+        return jsonify({'response': response, 'conversation_id': conversation_id})
+
+    return chatbot 
\ No newline at end of file
@@ -0,0 +1,191 @@
+"""Item-item collaborative filtering over enrollment history.
+
+Training builds a sparse binary student x course matrix from
+Completed_Courses and Students_Enrolled, computes the cosine similarity of
+every pair of courses that share a student, and keeps each course's
+``neighbors`` most similar courses. The result is a CSR matrix saved as a
+compressed .npz model file. Scoring a student sums the neighbor rows of the
+courses in their history, so it costs O(history x neighbors) and needs
+NumPy only.
+
+Rebuild the model from the configured storage backend:
+
+    python -m collaborative [--out data/cf_model.npz] [--neighbors 50]
+"""
+import argparse
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from prereq_graph import split_codes
+from storage import DATA_DIR, create_storage
+
+MODEL_FILE = os.path.join(DATA_DIR, 'cf_model.npz')
+
+# Similar courses kept per course
+DEFAULT_NEIGHBORS = 50
+
+
+class ModelUnavailable(RuntimeError):
+    """No collaborative model file has been built (reported to the client as a 503)."""
+
+
+class CollaborativeModel:
+    """Top-k item-item cosine similarities in CSR form.
+
+    Row ``i`` (``indices[indptr[i]:indptr[i + 1]]``, same slice of ``data``)
+    lists the courses most similar to ``codes[i]``. ``popularity`` is each
+    course's share of students, used to break ties.
+    """
+
+    def __init__(self, codes: List[str], indptr: np.ndarray, indices: np.ndarray,
+                 data: np.ndarray, popularity: np.ndarray, built_at: float):
+        self.codes = codes
+        self.index = {code: i for i, code in enumerate(codes)}
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.popularity = popularity
+        self.built_at = built_at
+
+    @classmethod
+    def train(cls, student_df: pd.DataFrame, enrollment_df: pd.DataFrame,
+              neighbors: int = DEFAULT_NEIGHBORS) -> 'CollaborativeModel':
+        from scipy import sparse
+
+        codes: List[str] = []
+        course_index: Dict[str, int] = {}
+        student_index: Dict[str, int] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+
+        def add(student_id: str, course_codes: Iterable[str]):
+            row = student_index.setdefault(student_id, len(student_index))
+            for code in course_codes:
+                col = course_index.get(code)
+                if col is None:
+                    col = course_index[code] = len(codes)
+                    codes.append(code)
+                rows.append(row)
+                cols.append(col)
+
+        for student_id, completed in zip(student_df['Student_ID'], student_df['Completed_Courses']):
+            add(student_id, split_codes(completed))
+        for code, roster in zip(enrollment_df['Course_Code'], enrollment_df['Students_Enrolled']):
+            for student_id in split_codes(roster):
+                add(student_id, [code])
+
+        n_students, n_courses = len(student_index), len(codes)
+        matrix = sparse.csr_matrix((np.ones(len(rows), dtype=np.float32), (rows, cols)),
+                                   shape=(n_students, n_courses))
+        # Duplicate (student, course) pairs are summed by the constructor; make them binary again
+        matrix.data[:] = 1.0
+
+        counts = np.asarray(matrix.sum(axis=0)).ravel()
+        cooccurrence = (matrix.T @ matrix).tocsr()
+        cooccurrence.setdiag(0)
+        cooccurrence.eliminate_zeros()
+        norms = np.sqrt(np.maximum(counts, 1.0))
+        similarity = sparse.diags(1 / norms) @ cooccurrence @ sparse.diags(1 / norms)
+        similarity = similarity.tocsr()
+
+        indptr = np.zeros(n_courses + 1, dtype=np.int64)
+        kept_indices, kept_data = [], []
+        for i in range(n_courses):
+            start, end = similarity.indptr[i], similarity.indptr[i + 1]
+            row_indices, row_data = similarity.indices[start:end], similarity.data[start:end]
+            if len(row_data) > neighbors:
+                top = np.argpartition(-row_data, neighbors)[:neighbors]
+                row_indices, row_data = row_indices[top], row_data[top]
+            kept_indices.append(row_indices)
+            kept_data.append(row_data)
+            indptr[i + 1] = indptr[i] + len(row_data)
+
+        return cls(codes, indptr,
+                   np.concatenate(kept_indices).astype(np.int32) if kept_indices else np.zeros(0, np.int32),
+                   np.concatenate(kept_data).astype(np.float32) if kept_data else np.zeros(0, np.float32),
+                   (counts / max(n_students, 1)).astype(np.float32), time.time())
+
+    def save(self, path: str = MODEL_FILE):
+        # Write a sibling file and rename it, so a ModelCache never loads a partial model
+        temp_file = f'{path}.{os.getpid()}.tmp'
+        try:
+            with open(temp_file, 'wb') as f:
+                np.savez_compressed(f, codes=np.array(self.codes), indptr=self.indptr, indices=self.indices,
+                                    data=self.data, popularity=self.popularity, built_at=np.array(self.built_at))
+            os.replace(temp_file, path)
+        except BaseException:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+
+    @classmethod
+    def load(cls, path: str = MODEL_FILE) -> 'CollaborativeModel':
+        with np.load(path) as f:
+            return cls(f['codes'].tolist(), f['indptr'], f['indices'], f['data'],
+                       f['popularity'], float(f['built_at']))
+
+    def scores(self, history: Iterable[str]) -> np.ndarray:
+        """Similarity of every model course to the courses in ``history`` (one entry per code)."""
+        rows = [self.index[code] for code in history if code in self.index]
+        if not rows:
+            return np.zeros(len(self.codes), dtype=np.float32)
+        indptr = self.indptr
+        picked = np.concatenate([np.arange(indptr[r], indptr[r + 1]) for r in rows])
+        return np.bincount(self.indices[picked], weights=self.data[picked],
+                           minlength=len(self.codes)).astype(np.float32)
+
+    def info(self) -> Dict:
+        return {
+            'courses': len(self.codes),
+            'similarities': int(len(self.data)),
+            'built_at': self.built_at
+        }
+
+
+class ModelCache:
+    """The model file loaded once, and again whenever the file changes."""
+
+    def __init__(self, path: str = MODEL_FILE):
+        self.path = path
+        self._model: Optional[CollaborativeModel] = None
+        self._mtime: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> CollaborativeModel:
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            raise ModelUnavailable(f"Collaborative model not built; run 'python -m collaborative' ({self.path})")
+        if mtime != self._mtime:
+            with self._lock:
+                if mtime != self._mtime:
+                    self._model = CollaborativeModel.load(self.path)
+                    self._mtime = mtime
+        return self._model
+
+
+models = ModelCache(os.environ.get('PORTAL_CF_MODEL') or MODEL_FILE)
+
+
+def rebuild(path: str = MODEL_FILE, neighbors: int = DEFAULT_NEIGHBORS) -> CollaborativeModel:
+    student_df, _, enrollment_df = create_storage().load()
+    start = time.perf_counter()
+    model = CollaborativeModel.train(student_df, enrollment_df, neighbors)
+    elapsed = time.perf_counter() - start
+    model.save(path)
+    print(f"Trained on {len(student_df)} students in {elapsed:.2f}s: {len(model.codes)} courses, "
+          f"{len(model.data)} similarities, {os.path.getsize(path)} bytes written to {path}")
+    return model
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Rebuild the collaborative-filtering model.')
+    parser.add_argument('--out', default=os.environ.get('PORTAL_CF_MODEL') or MODEL_FILE)
+    parser.add_argument('--neighbors', type=int, default=DEFAULT_NEIGHBORS)
+    args = parser.parse_args()
+    rebuild(args.out, args.neighbors)
@@ -0,0 +1,441 @@
+"""Compact columnar storage for the student table.
+
+The student table used to be held three times per worker: a DataFrame of
+Python string objects, a dict record per student and a completed-courses
+bitset per student in the prerequisite graph. StudentTable keeps it once,
+as flat NumPy arrays:
+
+* Student_ID: the IDs in row order; the lookup dict maps them to row numbers
+* Name, Password: UTF-8 bytes in one buffer plus row offsets
+* Department: int16 codes into a sorted category list
+* CGPA: float64, one per row
+* Completed_Courses: course IDs of the prerequisite graph, CSR style
+  (row offsets plus one int32 array)
+
+``students_by_id`` is a StudentTable. It is a read-only Mapping from
+Student_ID to a row view that behaves like the old record dict, so lookups
+need no changes. The DataFrame is rebuilt from the arrays only when a
+student listing asks for it.
+
+Report bytes per student for a data directory:
+
+    python -m columnar [--data DIR]
+"""
+import argparse
+import os
+import sys
+from collections.abc import Mapping
+from itertools import chain
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from prereq_graph import split_codes
+from storage import STUDENT_COLUMNS
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and value != value)
+
+
+class RaggedArray:
+    """Variable-length rows in one flat array: row ``i`` is ``values[offsets[i]:offsets[i + 1]]``."""
+
+    def __init__(self, offsets: np.ndarray, values: np.ndarray):
+        self.offsets = offsets
+        self.values = values
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence], dtype, convert: Optional[Callable] = None) -> 'RaggedArray':
+        """Pack ``rows``, passing each value through ``convert`` if given."""
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, rows), dtype=np.int64, count=len(rows)), out=offsets[1:])
+        values = chain.from_iterable(rows)
+        values = np.fromiter(map(convert, values) if convert else values, dtype=dtype, count=int(offsets[-1]))
+        return cls(offsets, values)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def row(self, i: int) -> np.ndarray:
+        return self.values[self.offsets[i]:self.offsets[i + 1]]
+
+    def updated(self, rows: List[int], replacements: Sequence[Sequence], appended: Sequence[Sequence]) -> 'RaggedArray':
+        """Copy with ``rows`` (ascending) replaced and ``appended`` rows added at the end."""
+        lengths = np.diff(self.offsets)
+        pieces = []
+        start = 0
+        for row, replacement in zip(rows, replacements):
+            pieces.append(self.values[self.offsets[start]:self.offsets[row]])
+            pieces.append(np.asarray(replacement, dtype=self.values.dtype))
+            lengths[row] = len(replacement)
+            start = row + 1
+        pieces.append(self.values[self.offsets[start]:])
+        pieces.extend(np.asarray(row, dtype=self.values.dtype) for row in appended)
+        lengths = np.concatenate([lengths, np.fromiter((len(row) for row in appended), dtype=np.int64, count=len(appended))])
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return RaggedArray(offsets, np.concatenate(pieces) if pieces else self.values[:0])
+
+    @property
+    def nbytes(self) -> int:
+        return self.offsets.nbytes + self.values.nbytes
+
+
+class StringColumn:
+    """Strings as UTF-8 bytes in a RaggedArray; missing values are flagged separately."""
+
+    def __init__(self, data: RaggedArray, missing: np.ndarray):
+        self.data = data
+        self.missing = missing
+
+    @staticmethod
+    def _encode(values: Iterable) -> List[bytes]:
+        return [b'' if _is_missing(value) else str(value).encode('utf-8') for value in values]
+
+    @classmethod
+    def from_values(cls, values: Sequence) -> 'StringColumn':
+        encoded = cls._encode(values)
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+        return cls(RaggedArray(offsets, np.frombuffer(b''.join(encoded), dtype=np.uint8)),
+                   np.fromiter(map(_is_missing, values), dtype=bool, count=len(values)))
+
+    def __len__(self) -> int:
+        return len(self.missing)
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        if self.missing[i]:
+            return None
+        return self.data.row(i).tobytes().decode('utf-8')
+
+    def tolist(self) -> List[Optional[str]]:
+        buffer = self.data.values.tobytes()
+        offsets = self.data.offsets.tolist()
+        return [None if missing else buffer[offsets[i]:offsets[i + 1]].decode('utf-8')
+                for i, missing in enumerate(self.missing.tolist())]
+
+    def updated(self, rows: List[int], replacements: Sequence, appended: Sequence) -> 'StringColumn':
+        missing = np.concatenate([self.missing, np.fromiter((_is_missing(v) for v in appended), dtype=bool, count=len(appended))])
+        missing[rows] = [_is_missing(value) for value in replacements]
+        data = self.data.updated(rows, [np.frombuffer(item, dtype=np.uint8) for item in self._encode(replacements)],
+                                 [np.frombuffer(item, dtype=np.uint8) for item in self._encode(appended)])
+        return StringColumn(data, missing)
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes + self.missing.nbytes
+
+
+class CategoricalColumn:
+    """Low-cardinality strings as int16 codes into a sorted category list (-1 is missing)."""
+
+    def __init__(self, codes: np.ndarray, categories: List[str]):
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def from_values(cls, values: Sequence) -> 'CategoricalColumn':
+        categorical = pd.Categorical([None if _is_missing(value) else str(value) for value in values])
+        # sys.intern so every row view hands out the same string object
+        return cls(categorical.codes.astype(np.int16), [sys.intern(str(c)) for c in categorical.categories])
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        code = self.codes[i]
+        return None if code < 0 else self.categories[code]
+
+    def tolist(self) -> List[Optional[str]]:
+        categories = self.categories
+        return [None if code < 0 else categories[code] for code in self.codes.tolist()]
+
+    def updated(self, rows: List[int], replacements: Sequence, appended: Sequence) -> 'CategoricalColumn':
+        known = {category: code for code, category in enumerate(self.categories)}
+        new_values = [value for value in list(replacements) + list(appended) if not _is_missing(value)]
+        if any(str(value) not in known for value in new_values):
+            # A new category changes the sorted order: recode the whole column
+            values = self.tolist()
+            for row, value in zip(rows, replacements):
+                values[row] = value
+            return CategoricalColumn.from_values(values + list(appended))
+        codes = np.concatenate([self.codes, np.array([-1 if _is_missing(v) else known[str(v)] for v in appended], dtype=np.int16)])
+        codes[rows] = [-1 if _is_missing(value) else known[str(value)] for value in replacements]
+        return CategoricalColumn(codes, self.categories)
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes
+
+
+class StudentRow(Mapping):
+    """Read-only view of one student, with the keys and values of the old record dict."""
+
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table: 'StudentTable', row: int):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, column: str):
+        return self._table.value(self._row, column)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.columns)
+
+    def __len__(self) -> int:
+        return len(self._table.columns)
+
+    def __repr__(self) -> str:
+        return f'StudentRow({dict(self)!r})'
+
+
+class StudentTable(Mapping):
+    """The student table in columns; a Mapping of Student_ID to StudentRow (first row per ID).
+
+    ``codes`` is the prerequisite graph's code list that the
+    Completed_Courses IDs index into; a table is always used with a graph
+    that starts with those codes.
+    """
+
+    def __init__(self, columns: List[str], ids: List[str], name: StringColumn, department: CategoricalColumn,
+                 cgpa: np.ndarray, completed: RaggedArray, password: StringColumn,
+                 extra: Dict[str, list], codes: List[str], index: Optional[Dict[str, int]] = None):
+        self.columns = columns
+        self.ids = ids
+        self.name = name
+        self.department = department
+        self.cgpa = cgpa
+        self.completed = completed
+        self.password = password
+        self.extra = extra
+        self.codes = codes
+        if index is None:
+            index = {}
+            for row, student_id in enumerate(ids):
+                index.setdefault(student_id, row)
+        self.index = index
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, graph) -> 'StudentTable':
+        """Build from a DataFrame in the CSV schema; completed-course codes are interned into ``graph``."""
+        columns = list(df.columns)
+        n = len(df)
+
+        def column(name):
+            return df[name].tolist() if name in df.columns else [None] * n
+
+        completed = [split_codes(value) for value in column('Completed_Courses')]
+        # Intern in first-seen order so IDs do not depend on hash order
+        for code in dict.fromkeys(chain.from_iterable(completed)):
+            graph.intern(code)
+        cgpa = pd.to_numeric(df['CGPA'], errors='coerce').to_numpy(dtype=np.float64) if 'CGPA' in df.columns \
+            else np.full(n, np.nan)
+        extra = {name: df[name].tolist() for name in columns if name not in STUDENT_COLUMNS}
+        return cls(columns, [str(student_id) for student_id in column('Student_ID')],
+                   StringColumn.from_values(column('Name')), CategoricalColumn.from_values(column('Department')),
+                   cgpa, RaggedArray.from_rows(completed, np.int32, graph.code_ids.__getitem__), StringColumn.from_values(column('Password')),
+                   extra, graph.codes)
+
+    # Mapping interface
+
+    def __getitem__(self, student_id: str) -> StudentRow:
+        return StudentRow(self, self.index[student_id])
+
+    def __contains__(self, student_id) -> bool:
+        return student_id in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    # Columns
+
+    def value(self, row: int, column: str):
+        if column == 'Student_ID':
+            return self.ids[row]
+        if column == 'Name':
+            return self.name[row]
+        if column == 'Department':
+            return self.department[row]
+        if column == 'CGPA':
+            return float(self.cgpa[row])
+        if column == 'Completed_Courses':
+            codes = self.codes
+            return ','.join(codes[course_id] for course_id in self.completed.row(row).tolist())
+        if column == 'Password':
+            return self.password[row]
+        if column in self.extra:
+            return self.extra[column][row]
+        raise KeyError(column)
+
+    def rows(self) -> Iterator[StudentRow]:
+        """Every row in table order, duplicate IDs included."""
+        return (StudentRow(self, row) for row in range(len(self.ids)))
+
+    def ids_in_department(self, department: str) -> List[str]:
+        try:
+            code = self.department.categories.index(department)
+        except ValueError:
+            return []
+        rows = np.flatnonzero(self.department.codes == code)
+        # First row per ID, as the Mapping sees them
+        return [self.ids[row] for row in rows.tolist() if self.index[self.ids[row]] == row]
+
+    def completed_mask(self, student_id: str) -> int:
+        row = self.index.get(student_id)
+        if row is None:
+            return 0
+        mask = 0
+        for course_id in self.completed.row(row).tolist():
+            mask |= 1 << course_id
+        return mask
+
+    def completed_matrix(self, student_ids: List[str], n_codes: int) -> np.ndarray:
+        """Boolean (students x course IDs) matrix of completed courses."""
+        matrix = np.zeros((len(student_ids), n_codes), dtype=bool)
+        rows = np.array([self.index.get(student_id, -1) for student_id in student_ids], dtype=np.int64)
+        known = np.flatnonzero(rows >= 0)
+        if len(known):
+            starts = self.completed.offsets[rows[known]]
+            lengths = self.completed.offsets[rows[known] + 1] - starts
+            owners = np.repeat(known, lengths)
+            positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+            matrix[owners, self.completed.values[positions]] = True
+        return matrix
+
+    def first_rows(self) -> np.ndarray:
+        """Row number of every Student_ID, as the Mapping sees them (first row per ID)."""
+        return np.fromiter(self.index.values(), dtype=np.int64, count=len(self.index))
+
+    def completed_columns(self, course_ids: Sequence[int], rows: np.ndarray) -> np.ndarray:
+        """Boolean (rows x course_ids) matrix of whether each row's student completed each course."""
+        values = self.completed.values
+        size = max(int(values.max()) + 1 if len(values) else 0, max(course_ids, default=-1) + 1)
+        lookup = np.full(size, -1, dtype=np.int64)
+        lookup[list(course_ids)] = np.arange(len(course_ids))
+        columns = lookup[values]
+        hit = columns >= 0
+        owners = np.repeat(np.arange(len(self.ids)), np.diff(self.completed.offsets))
+        matrix = np.zeros((len(self.ids), len(course_ids)), dtype=bool)
+        matrix[owners[hit], columns[hit]] = True
+        return matrix[rows]
+
+    def to_frame(self) -> pd.DataFrame:
+        data = {}
+        for column in self.columns:
+            if column == 'Student_ID':
+                data[column] = self.ids
+            elif column == 'Name':
+                data[column] = self.name.tolist()
+            elif column == 'Department':
+                data[column] = self.department.tolist()
+            elif column == 'CGPA':
+                data[column] = self.cgpa
+            elif column == 'Completed_Courses':
+                data[column] = [self.value(row, column) for row in range(len(self.ids))]
+            elif column == 'Password':
+                data[column] = self.password.tolist()
+            else:
+                data[column] = self.extra[column]
+        return pd.DataFrame(data, columns=self.columns)
+
+    def with_records(self, records: List[Dict], graph) -> 'StudentTable':
+        """Copy with ``records`` (full rows) upserted; new completed-course codes are interned into ``graph``."""
+        updates = sorted((self.index[r['Student_ID']], r) for r in records if r['Student_ID'] in self.index)
+        added = [r for r in records if r['Student_ID'] not in self.index]
+        rows = [row for row, _ in updates]
+        replaced = [record for _, record in updates]
+
+        def completed(record):
+            return [graph.intern(code) for code in split_codes(record.get('Completed_Courses'))]
+
+        cgpa = np.concatenate([self.cgpa, np.array([_float(r.get('CGPA')) for r in added], dtype=np.float64)])
+        cgpa[rows] = [_float(r.get('CGPA')) for r in replaced]
+        extra = {}
+        for column, values in self.extra.items():
+            values = list(values)
+            for row, record in updates:
+                values[row] = record.get(column)
+            extra[column] = values + [record.get(column) for record in added]
+        index = dict(self.index)
+        for row, record in enumerate(added, start=len(self.ids)):
+            index.setdefault(record['Student_ID'], row)
+        return StudentTable(
+            self.columns, self.ids + [r['Student_ID'] for r in added],
+            self.name.updated(rows, [r.get('Name') for r in replaced], [r.get('Name') for r in added]),
+            self.department.updated(rows, [r.get('Department') for r in replaced], [r.get('Department') for r in added]),
+            cgpa,
+            self.completed.updated(rows, [completed(r) for r in replaced], [completed(r) for r in added]),
+            self.password.updated(rows, [r.get('Password') for r in replaced], [r.get('Password') for r in added]),
+            extra, graph.codes, index)
+
+    def nbytes(self) -> Dict[str, int]:
+        """Approximate bytes held per column (the ID lookup dict included under Student_ID)."""
+        ids = sys.getsizeof(self.ids) + sys.getsizeof(self.index) + sum(sys.getsizeof(i) for i in self.ids)
+        sizes = {
+            'Student_ID': ids,
+            'Name': self.name.nbytes,
+            'Department': self.department.nbytes,
+            'CGPA': self.cgpa.nbytes,
+            'Completed_Courses': self.completed.nbytes,
+            'Password': self.password.nbytes
+        }
+        for column, values in self.extra.items():
+            sizes[column] = sys.getsizeof(values) + sum(sys.getsizeof(v) for v in values)
+        return sizes
+
+
+def _float(value) -> float:
+    return float('nan') if _is_missing(value) else float(value)
+
+
+def memory_report(snapshot) -> Dict:
+    """Bytes held per student by the snapshot's student-sized structures."""
+    table = snapshot.students_by_id
+    students = max(len(table.ids), 1)
+    columns = table.nbytes()
+    enrollment = snapshot.enrollment_index.nbytes
+    total = sum(columns.values()) + enrollment
+    return {
+        'students': len(table.ids),
+        'bytes': total,
+        'bytes_per_student': total / students,
+        'columns_per_student': {column: size / students for column, size in columns.items()},
+        'enrollment_index_per_student': enrollment / students
+    }
+
+
+def _frame_bytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(deep=True).sum())
+
+
+def _records_bytes(records: List[Dict]) -> int:
+    return sum(sys.getsizeof(r) + sum(sys.getsizeof(v) for v in r.values()) for r in records)
+
+
+if __name__ == '__main__':
+    from data_store import DataSnapshot
+    from storage import read_data_files
+
+    parser = argparse.ArgumentParser(description='Report the memory held per student by a data snapshot.')
+    parser.add_argument('--data', help='directory with student_data.csv, course_data.csv and enrollment_data.csv')
+    args = parser.parse_args()
+    paths = [os.path.join(args.data, name) for name in ('student_data.csv', 'course_data.csv', 'enrollment_data.csv')] \
+        if args.data else []
+
+    student_df, course_df, enrollment_df = read_data_files(*paths)
+    report = memory_report(DataSnapshot(student_df, course_df, enrollment_df, 1))
+    n = max(len(student_df), 1)
+    # What the object representation held: the DataFrame plus one dict record per student
+    legacy = _frame_bytes(student_df) + _records_bytes(student_df.to_dict('records'))
+    print(f"{report['students']} students")
+    for column, size in report['columns_per_student'].items():
+        print(f"  {column:<20}{size:>10.1f} B/student")
+    print(f"  {'enrollment index':<20}{report['enrollment_index_per_student']:>10.1f} B/student")
+    print(f"columnar total        {report['bytes_per_student']:>10.1f} B/student")
+    print(f"DataFrame + records   {legacy / n:>10.1f} B/student (previous representation, excluding bitsets)")
@@ -0,0 +1,505 @@
+import copy
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from columnar import StudentTable
+from enrollment_index import EnrollmentIndex
+from prereq_graph import PrerequisiteGraph, split_codes
+from search import SearchIndex
+from stats import PortalStats
+from snapshot_file import SNAPSHOT_FILE, CompiledSnapshot, read as read_compiled
+from storage import RESERVED, Storage, create_storage, upsert_frame
+
+logger = logging.getLogger(__name__)
+
+# Minimum number of seconds between two data-change checks
+RELOAD_CHECK_INTERVAL = 1.0
+
+def sample_data() -> Dict[str, pd.DataFrame]:
+    """Fallback tables served when the storage backend cannot be read.
+
+    Built on demand rather than at import, and seeded so every worker
+    process serves the same sample.
+    """
+    rng = random.Random(0)
+    return {
+        'student': pd.DataFrame({
+            'Student_ID': [f'FA21-BSCS-{i:04d}' for i in range(1, 11)],
+            'Name': [f'Student {i}' for i in range(1, 11)],
+            'Program': ['BSCS'] * 10,
+            'Department': ['Computer Science'] * 10,
+            'Semester': [rng.randint(1, 8) for _ in range(10)],
+            'CGPA': [round(rng.uniform(2.0, 4.0), 2) for _ in range(10)],
+            'Completed_Courses': ['CS101,CS102'] * 10
+        }),
+        'course': pd.DataFrame({
+            'Course_Code': [f'CS{i:03d}' for i in range(101, 111)],
+            'Course_Name': [f'Course {i}' for i in range(101, 111)],
+            'Department': ['Computer Science'] * 10,
+            'Prerequisites': ['None'] * 10,
+            'Credit_Hours': [3] * 10,
+            'Difficulty': ['Medium'] * 10
+        }),
+        'enrollment': pd.DataFrame({
+            'Course_Code': [f'CS{i:03d}' for i in range(101, 111)],
+            'Course_Name': [f'Course {i}' for i in range(101, 111)],
+            'Enrollment_Count': [rng.randint(50, 149) for _ in range(10)],
+            'Students_Enrolled': ['FA21-BSCS-0001,FA21-BSCS-0002'] * 10
+        })
+    }
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def _index_records(records: List[Dict], key: str) -> Dict[str, Dict]:
+    # First occurrence wins, matching the previous ``df[df[key] == value].iloc[0]`` lookups
+    index = {}
+    for record in records:
+        index.setdefault(record[key], record)
+    return index
+
+
+def _positions(records: List[Dict], key: str) -> Dict[str, int]:
+    # Row of the first record per key, the one _index_records and _upsert_records use
+    positions = {}
+    for position, record in enumerate(records):
+        positions.setdefault(record[key], position)
+    return positions
+
+
+def _upsert_records(records: List[Dict], key: str, changes: List[Dict]) -> List[Dict]:
+    """Copy of ``records`` with rows replaced (first row per key) or appended, as upsert_frame does."""
+    positions = _positions(records, key)
+    records = list(records)
+    for change in changes:
+        position = positions.get(change[key])
+        if position is None:
+            positions[change[key]] = len(records)
+            records.append(change)
+        else:
+            records[position] = change
+    return records
+
+
+def _group_records(records: List[Dict], key: str) -> Dict[str, List[Dict]]:
+    groups = {}
+    for record in records:
+        groups.setdefault(record[key], []).append(record)
+    return groups
+
+
+class DataSnapshot:
+    """An immutable, fully loaded view of the portal data.
+
+    Request handlers must treat the DataFrames, tables and index records as
+    read-only: a snapshot is shared by every request served while it is
+    current.
+
+    A snapshot carries hash indexes for O(1) lookups: ``students_by_id``
+    (Student_ID -> row, a columnar StudentTable), ``courses_by_code``
+    (Course_Code -> record), ``enrollments_by_code`` (Course_Code -> record)
+    and ``courses_by_department`` (Department -> course records in file order),
+    plus the compiled ``prereq_graph`` and the many-to-many ``enrollment_index``.
+    The student and enrollment DataFrames are rebuilt from these on first use,
+    and the ``search_index`` over courses and students when first searched
+    (DataStore builds it as soon as it loads the data).
+    """
+
+    def __init__(self, student_df: pd.DataFrame, course_df: pd.DataFrame,
+                 enrollment_df: pd.DataFrame, version: int, signature: Tuple = ()):
+        course_records = course_df.to_dict('records')
+        graph = PrerequisiteGraph.build(course_records)
+        students = StudentTable.from_frame(student_df, graph)
+        enrollment_records = enrollment_df.to_dict('records')
+        enrollment_index = EnrollmentIndex.build(enrollment_records, students.ids, graph)
+        self._assemble(course_df, course_records, students, graph, list(enrollment_df.columns),
+                       enrollment_records, enrollment_index, version, signature)
+
+    @classmethod
+    def from_compiled(cls, compiled: CompiledSnapshot, version: int, signature: Tuple = ()) -> 'DataSnapshot':
+        """Snapshot over the tables and indexes of a compiled snapshot file (see snapshot_file.py)."""
+        snapshot = cls.__new__(cls)
+        snapshot._assemble(compiled.course_df, compiled.course_df.to_dict('records'), compiled.students,
+                           compiled.graph, compiled.enrollment_columns, compiled.enrollment_records,
+                           compiled.enrollment_index, version, signature)
+        snapshot._derived['search'] = SearchIndex(list(snapshot.courses_by_code.values()), compiled.students,
+                                                  compiled.students.first_rows(), compiled.search_arrays)
+        return snapshot
+
+    def _assemble(self, course_df: pd.DataFrame, course_records: List[Dict], students: StudentTable,
+                  graph: PrerequisiteGraph, enrollment_columns: List[str], enrollment_records: List[Dict],
+                  enrollment_index: EnrollmentIndex, version: int, signature: Tuple):
+        self.course_df = course_df
+        self.version = version
+        self.signature = signature
+        self.loaded_at = time.time()
+        self._derived: Dict[Any, Any] = {}
+        self._derived_lock = threading.Lock()
+
+        self.courses_by_code = _index_records(course_records, 'Course_Code')
+        self.courses_by_department = _group_records(course_records, 'Department')
+        self.prereq_graph = graph
+        self.students_by_id = students
+        graph.students = students
+        self.enrollment_columns = enrollment_columns
+        self.enrollment_records = enrollment_records
+        self.enrollments_by_code = _index_records(enrollment_records, 'Course_Code')
+        self.enrollment_positions = _positions(enrollment_records, 'Course_Code')
+        self.enrollment_index = enrollment_index
+        self._fill_enrollment_counts(enrollment_records)
+
+    def _fill_enrollment_counts(self, enrollment_records: List[Dict]):
+        # Rows without a stored Enrollment_Count get the roster size
+        for record in enrollment_records:
+            if _is_missing(record.get('Enrollment_Count')):
+                record['Enrollment_Count'] = self.enrollment_index.roster_size(record['Course_Code'])
+
+    @property
+    def student_df(self) -> pd.DataFrame:
+        return self.derived('student_df', self.students_by_id.to_frame)
+
+    @property
+    def enrollment_df(self) -> pd.DataFrame:
+        return self.derived('enrollment_df', lambda: pd.DataFrame(self.enrollment_records, columns=self.enrollment_columns))
+
+    def enrollments_with(self, reservations: List[Tuple[str, str]]) -> List[Dict]:
+        """Enrollment records of the courses in ``reservations`` once each (student_id, course_code) is added.
+
+        Matches what Storage.reserve_seats writes for reservations it accepted.
+        """
+        records: Dict[str, Dict] = {}
+        for student_id, course_code in reservations:
+            record = records.get(course_code)
+            if record is None:
+                previous = self.enrollments_by_code.get(course_code)
+                course = self.courses_by_code.get(course_code)
+                record = records[course_code] = dict(previous) if previous is not None else {
+                    'Course_Code': course_code, 'Course_Name': course['Course_Name'] if course else None,
+                    'Enrollment_Count': 0, 'Students_Enrolled': ''}
+            record['Students_Enrolled'] = ','.join(split_codes(record['Students_Enrolled']) + [student_id])
+            record['Enrollment_Count'] = int(record['Enrollment_Count']) + 1
+        return list(records.values())
+
+    def apply(self, table: str, records: List[Dict], version: int, signature: Tuple = ()) -> 'DataSnapshot':
+        """A new snapshot with ``records`` upserted into ``table`` ('students', 'courses' or 'enrollments').
+
+        ``records`` are full rows in the CSV schema, keyed like the storage
+        upserts: an existing key keeps its row position, a new one is
+        appended. Only what the change touches is rebuilt. The other
+        tables, unaffected indexes and the catalog half of the prerequisite
+        graph are shared with this snapshot, and materialized stats are
+        copied and updated row by row. The search index is shared when only
+        enrollments change, and otherwise rebuilt by the next search. This
+        snapshot is left untouched.
+        """
+        snapshot = self._successor(version, signature)
+        stats = self._derived.get('stats')
+        stats = stats.copy() if stats is not None else None
+
+        if table == 'students':
+            snapshot.prereq_graph = self.prereq_graph.copy()
+            snapshot.students_by_id = self.students_by_id.with_records(records, snapshot.prereq_graph)
+            snapshot.prereq_graph.students = snapshot.students_by_id
+            added = False
+            for record in records:
+                # Rows of this snapshot's table, which the new table does not change
+                previous = self.students_by_id.get(record['Student_ID'])
+                added = added or previous is None
+                if stats is None:
+                    continue
+                if previous is not None:
+                    stats.update_student(previous, record)
+                else:
+                    stats.add_student(record)
+            if added:
+                # New students need an ID in the enrollment index
+                snapshot.enrollment_index = EnrollmentIndex.build(
+                    self.enrollment_records, snapshot.students_by_id.ids, snapshot.prereq_graph)
+            else:
+                snapshot.enrollment_index = self.enrollment_index.with_graph(snapshot.prereq_graph)
+        elif table == 'courses':
+            snapshot.course_df = upsert_frame(self.course_df, 'Course_Code', records)
+            course_records = snapshot.course_df.to_dict('records')
+            snapshot.courses_by_code = _index_records(course_records, 'Course_Code')
+            snapshot.courses_by_department = _group_records(course_records, 'Department')
+            snapshot.prereq_graph = self.prereq_graph.with_courses(course_records)
+            snapshot.enrollment_index = self.enrollment_index.with_graph(snapshot.prereq_graph)
+            if stats is not None:
+                for record in records:
+                    previous = self.courses_by_code.get(record['Course_Code'])
+                    if previous is not None:
+                        stats.update_course(previous, record)
+                    else:
+                        stats.add_course(record)
+        elif table == 'enrollments':
+            columns = self.enrollment_columns
+            snapshot.enrollment_records = _upsert_records(
+                self.enrollment_records, 'Course_Code', [{column: r.get(column) for column in columns} for r in records])
+            if any(record['Course_Code'] not in self.prereq_graph.code_ids for record in records):
+                # Codes new to the graph are interned into a copy, not the graph readers share
+                snapshot.prereq_graph = self.prereq_graph.copy()
+            snapshot.enrollment_index = EnrollmentIndex.build(
+                snapshot.enrollment_records, self.students_by_id.ids, snapshot.prereq_graph)
+            snapshot._fill_enrollment_counts(snapshot.enrollment_records)
+            snapshot.enrollments_by_code = _index_records(snapshot.enrollment_records, 'Course_Code')
+            snapshot.enrollment_positions = _positions(snapshot.enrollment_records, 'Course_Code')
+            if stats is not None:
+                for record in records:
+                    stats.update_enrollment(snapshot.enrollments_by_code[record['Course_Code']])
+            # Enrollments are not searched
+            if 'search' in self._derived:
+                snapshot._derived['search'] = self._derived['search']
+        else:
+            raise ValueError(f"Unknown table: {table}")
+
+        if stats is not None:
+            snapshot._derived['stats'] = stats
+        return snapshot
+
+    def with_reservations(self, reservations: List[Tuple[str, str]], version: int, signature: Tuple = ()) -> 'DataSnapshot':
+        """A new snapshot with each accepted (student_id, course_code) reservation enrolled.
+
+        The same data as ``apply('enrollments', self.enrollments_with(reservations), ...)``,
+        without rebuilding every roster: the enrollment index gets the
+        touched rosters and schedules as overrides
+        (EnrollmentIndex.with_enrollments), the touched rows are replaced in
+        shallow copies of the enrollment records and indexes, and the stats,
+        seat map and search index are carried over. Falls back to ``apply``
+        when the index cannot be patched or a course has several enrollment
+        rows.
+        """
+        records = self.enrollments_with(reservations)
+        positions = self.enrollment_positions
+        index = None
+        if len(positions) == len(self.enrollment_records):
+            new_codes = [record['Course_Code'] for record in records if record['Course_Code'] not in positions]
+            if new_codes:
+                positions = dict(positions)
+                for code in new_codes:
+                    positions[code] = len(positions)
+            index = self.enrollment_index.with_enrollments(reservations, positions)
+        if index is None:
+            return self.apply('enrollments', records, version, signature)
+
+        snapshot = self._successor(version, signature)
+        snapshot.enrollment_index = index
+        snapshot.enrollment_positions = positions
+        snapshot.enrollment_records = list(self.enrollment_records)
+        snapshot.enrollments_by_code = dict(self.enrollments_by_code)
+        for record in records:
+            record = {column: record.get(column) for column in self.enrollment_columns}
+            position = positions[record['Course_Code']]
+            if position < len(snapshot.enrollment_records):
+                snapshot.enrollment_records[position] = record
+            else:
+                snapshot.enrollment_records.append(record)
+            snapshot.enrollments_by_code[record['Course_Code']] = record
+
+        stats = self._derived.get('stats')
+        if stats is not None:
+            stats = snapshot._derived['stats'] = stats.copy()
+            for record in records:
+                stats.update_enrollment(snapshot.enrollments_by_code[record['Course_Code']])
+        seats = self._derived.get('seat_map')
+        if seats is not None:
+            snapshot._derived['seat_map'] = seats.with_taken(
+                {record['Course_Code']: int(record['Enrollment_Count']) for record in records})
+        if 'search' in self._derived:
+            snapshot._derived['search'] = self._derived['search']
+        return snapshot
+
+    def _successor(self, version: int, signature: Tuple) -> 'DataSnapshot':
+        # Shallow copy sharing every table and index, with nothing derived yet
+        snapshot = copy.copy(self)
+        snapshot.version = version
+        snapshot.signature = signature
+        snapshot.loaded_at = time.time()
+        snapshot._derived = {}
+        snapshot._derived_lock = threading.Lock()
+        return snapshot
+
+    def frames(self) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        return self.student_df, self.course_df, self.enrollment_df
+
+    def derived(self, key, build: Callable[[], Any]) -> Any:
+        """Compute a value from this snapshot once and memoize it (e.g. sort orders)."""
+        try:
+            return self._derived[key]
+        except KeyError:
+            pass
+        with self._derived_lock:
+            if key not in self._derived:
+                self._derived[key] = build()
+            return self._derived[key]
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """Full-text index over the catalog courses and the students (see search.py)."""
+        return self.derived('search', lambda: SearchIndex.build(list(self.courses_by_code.values()),
+                                                                self.students_by_id))
+
+    @property
+    def stats(self) -> PortalStats:
+        """Dashboard/analysis aggregates, materialized on first use."""
+        return self.derived('stats', lambda: PortalStats.from_snapshot(self))
+
+    def info(self) -> Dict:
+        return {
+            'version': self.version,
+            'loaded_at': self.loaded_at,
+            'students': len(self.students_by_id.ids),
+            'courses': int(len(self.course_df)),
+            'enrollments': len(self.enrollment_records)
+        }
+
+
+class DataStore:
+    """Process-wide cache of the portal data.
+
+    The storage backend (the CSV files by default, see storage.py) is read
+    once and kept in memory. On access the backend's signature (file
+    mtime/size, or the SQLite data version) is checked at most every
+    ``check_interval`` seconds and the data is reloaded only when it changed.
+    A new snapshot is built off to the side and swapped in with a single
+    assignment, so requests holding the previous snapshot are never affected.
+    Writes made through ``apply`` update the snapshot incrementally instead
+    of reloading it.
+
+    When ``snapshot_path`` holds a compiled snapshot of the backend's current
+    data (see snapshot_file.py), it is mapped instead of parsing the backend.
+    """
+
+    def __init__(self, backend: Optional[Storage] = None, check_interval: float = RELOAD_CHECK_INTERVAL,
+                 snapshot_path: Optional[str] = None):
+        self.backend = backend if backend is not None else create_storage()
+        self.check_interval = check_interval
+        self.snapshot_path = snapshot_path if snapshot_path is not None \
+            else os.environ.get('PORTAL_SNAPSHOT') or SNAPSHOT_FILE
+        self._snapshot: Optional[DataSnapshot] = None
+        self._version = 0
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> DataSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.reload()
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return snapshot
+        self._last_check = now
+        if self.backend.signature() != snapshot.signature:
+            return self.reload()
+        return snapshot
+
+    def reload(self, force: bool = False) -> DataSnapshot:
+        with self._lock:
+            signature = self.backend.signature()
+            current = self._snapshot
+            # Another thread may have reloaded while we waited for the lock
+            if current is not None and not force and signature == current.signature:
+                return current
+            return self._load(signature, current)
+
+    def _load(self, signature: Tuple, current: Optional[DataSnapshot]) -> DataSnapshot:
+        # Caller holds self._lock
+        compiled = self._read_compiled(signature)
+        if compiled is not None:
+            self._version += 1
+            snapshot = DataSnapshot.from_compiled(compiled, self._version, signature)
+            logger.info("Mapped compiled snapshot %s: %d students, %d courses, %d enrollments", self.snapshot_path,
+                        len(snapshot.students_by_id.ids), len(snapshot.course_df), len(snapshot.enrollment_records))
+            self._snapshot = snapshot
+            self._last_check = time.monotonic()
+            return snapshot
+        try:
+            student_df, course_df, enrollment_df = self.backend.load()
+            logger.info("Loaded %d students, %d courses, %d enrollments", len(student_df), len(course_df), len(enrollment_df))
+        except Exception as e:
+            logger.error("Error loading data: %s", e)
+            if current is not None:
+                # Keep serving the last good snapshot until the data is fixed
+                return current
+            sample = sample_data()
+            student_df, course_df, enrollment_df = sample['student'], sample['course'], sample['enrollment']
+        self._version += 1
+        snapshot = DataSnapshot(student_df, course_df, enrollment_df, self._version, signature)
+        start = time.perf_counter()
+        index = snapshot.search_index
+        logger.info("Indexed %d documents for search in %.2fs", index.doc_count, time.perf_counter() - start)
+        self._snapshot = snapshot
+        self._last_check = time.monotonic()
+        return snapshot
+
+    def _read_compiled(self, signature: Tuple) -> Optional[CompiledSnapshot]:
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return None
+        try:
+            compiled = read_compiled(self.snapshot_path, signature)
+        except Exception as e:
+            logger.warning("Ignoring compiled snapshot %s: %s", self.snapshot_path, e)
+            return None
+        if compiled is None:
+            logger.info("Compiled snapshot %s is out of date; loading from %s", self.snapshot_path, self.backend.name)
+        return compiled
+
+    def apply(self, table: str, prepare: Callable[[DataSnapshot], List[Dict]]) -> Tuple[DataSnapshot, List[Dict]]:
+        """Upsert rows of ``table`` through the backend and swap in an incrementally updated snapshot.
+
+        ``prepare`` receives the current snapshot and returns the full
+        records to write; it validates them, and raising aborts before
+        anything is written. It runs under the store lock, so concurrent
+        writers validate against each other's changes. Returns the new
+        snapshot and the records written.
+        """
+        with self._lock:
+            current = self._current()
+            records = prepare(current)
+            if not records:
+                return current, records
+            getattr(self.backend, f'upsert_{table}')(records)
+            return self._swap(current.apply(table, records, self._version + 1, self.backend.signature())), records
+
+    def reserve_seats(self, reservations: List[Tuple[str, str]],
+                      capacities: Dict[str, int]) -> Tuple[DataSnapshot, List[str]]:
+        """Reserve seats through the backend (Storage.reserve_seats) and swap in an incrementally updated snapshot.
+
+        Only the rosters of the courses that gained a seat are updated (see
+        DataSnapshot.with_reservations), so a reservation neither reloads
+        the data in this process nor rebuilds the other rosters. Returns the
+        new snapshot and a status per pair.
+        """
+        with self._lock:
+            current = self._current()
+            statuses = self.backend.reserve_seats(reservations, capacities)
+            reserved = [pair for pair, status in zip(reservations, statuses) if status == RESERVED]
+            if not reserved:
+                return current, statuses
+            return self._swap(current.with_reservations(reserved, self._version + 1, self.backend.signature())), statuses
+
+    def _current(self) -> DataSnapshot:
+        # Caller holds self._lock
+        current = self._snapshot
+        signature = self.backend.signature()
+        if current is None or signature != current.signature:
+            # Changed outside this process: write against the stored data
+            current = self._load(signature, current)
+        return current
+
+    def _swap(self, snapshot: DataSnapshot) -> DataSnapshot:
+        # Caller holds self._lock
+        self._version = snapshot.version
+        self._snapshot = snapshot
+        self._last_check = time.monotonic()
+        return snapshot
+
+
+store = DataStore()
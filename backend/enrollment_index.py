@@ -0,0 +1,206 @@
+import bisect
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from prereq_graph import PrerequisiteGraph, split_codes
+
+# Rosters plus schedules an index may override before with_enrollments folds them into new arrays
+MAX_OVERRIDES = 1024
+
+
+class EnrollmentIndex:
+    """Many-to-many enrollment index built once per data snapshot.
+
+    Rosters are stored in both directions as CSR-style integer arrays:
+    ``course_students[course_offsets[c]:course_offsets[c + 1]]`` are the
+    student IDs enrolled in course ID ``c`` and ``student_courses`` /
+    ``student_offsets`` hold each student's courses. Course IDs are the
+    prerequisite graph's interned IDs; student IDs follow the student table
+    (roster entries for unknown students are appended). Both directions
+    answer in O(result).
+
+    Rosters and schedules changed by seat reservations are kept in
+    ``course_overrides`` / ``student_overrides`` (ID -> array) on top of
+    the shared arrays, so a reservation only rebuilds what it touches.
+    """
+
+    def __init__(self, graph: PrerequisiteGraph, student_codes: List[str], student_ids: Dict[str, int],
+                 course_offsets: np.ndarray, course_students: np.ndarray,
+                 student_offsets: np.ndarray, student_courses: np.ndarray,
+                 course_overrides: Optional[Dict[int, np.ndarray]] = None,
+                 student_overrides: Optional[Dict[int, np.ndarray]] = None):
+        self.graph = graph
+        self.student_codes = student_codes
+        self.student_ids = student_ids
+        self.course_offsets = course_offsets
+        self.course_students = course_students
+        self.student_offsets = student_offsets
+        self.student_courses = student_courses
+        self.course_overrides = course_overrides or {}
+        self.student_overrides = student_overrides or {}
+
+    @classmethod
+    def build(cls, enrollment_records: List[Dict], student_order: List[str],
+              graph: PrerequisiteGraph) -> 'EnrollmentIndex':
+        student_codes: List[str] = []
+        student_ids: Dict[str, int] = {}
+
+        def intern_student(student_id: str) -> int:
+            sid = student_ids.get(student_id)
+            if sid is None:
+                sid = len(student_codes)
+                student_codes.append(student_id)
+                student_ids[student_id] = sid
+            return sid
+
+        for student_id in student_order:
+            intern_student(student_id)
+
+        pair_courses: List[int] = []
+        pair_students: List[int] = []
+        for record in enrollment_records:
+            course_id = graph.intern(record['Course_Code'])
+            for student_id in dict.fromkeys(split_codes(record.get('Students_Enrolled'))):
+                pair_courses.append(course_id)
+                pair_students.append(intern_student(student_id))
+
+        courses = np.asarray(pair_courses, dtype=np.int32)
+        students = np.asarray(pair_students, dtype=np.int32)
+        # Pairs are already grouped by course (in roster order); a duplicate
+        # course row is merged by the stable sort
+        by_course = np.argsort(courses, kind='stable')
+        by_student = np.argsort(students, kind='stable')
+        course_offsets = _offsets(courses, len(graph.codes))
+        student_offsets = _offsets(students, len(student_codes))
+        return cls(graph, student_codes, student_ids,
+                   course_offsets, students[by_course], student_offsets, courses[by_student])
+
+    def with_graph(self, graph: PrerequisiteGraph) -> 'EnrollmentIndex':
+        """This index over ``graph``, a catalog change that kept every existing course ID.
+
+        Courses new to ``graph`` get empty rosters; the arrays are shared.
+        """
+        course_offsets = self.course_offsets
+        missing = len(graph.codes) + 1 - len(course_offsets)
+        if missing > 0:
+            course_offsets = np.concatenate([course_offsets, np.full(missing, course_offsets[-1], dtype=np.int64)])
+        return EnrollmentIndex(graph, self.student_codes, self.student_ids, course_offsets, self.course_students,
+                               self.student_offsets, self.student_courses, self.course_overrides, self.student_overrides)
+
+    def with_enrollments(self, pairs: List[Tuple[str, str]], positions: Dict[str, int]) -> Optional['EnrollmentIndex']:
+        """This index with each (student_id, course_code) of ``pairs`` appended to the course's roster.
+
+        Only the touched rosters and schedules are rebuilt, as overrides;
+        the arrays are shared until the overrides pass MAX_OVERRIDES (see
+        ``compacted``). ``positions`` maps course codes to their enrollment
+        row, which orders schedules as ``build`` does. Returns None when a
+        pair names a course or student without an ID here.
+        """
+        rosters: Dict[int, List[int]] = {}
+        schedules: Dict[int, List[int]] = {}
+        for student_id, course_code in pairs:
+            course_id = self.graph.code_ids.get(course_code)
+            sid = self.student_ids.get(student_id)
+            if course_id is None or course_id + 1 >= len(self.course_offsets) or sid is None:
+                return None
+            roster = rosters.get(course_id)
+            if roster is None:
+                roster = rosters[course_id] = self._roster_ids(course_id).tolist()
+            if sid in roster:
+                continue
+            roster.append(sid)
+            schedule = schedules.get(sid)
+            if schedule is None:
+                schedule = schedules[sid] = self._schedule_ids(sid).tolist()
+            ranks = [positions[self.graph.codes[other]] for other in schedule]
+            schedule.insert(bisect.bisect_right(ranks, positions[course_code]), course_id)
+
+        course_overrides = dict(self.course_overrides)
+        course_overrides.update((course_id, np.asarray(roster, dtype=self.course_students.dtype))
+                                for course_id, roster in rosters.items())
+        student_overrides = dict(self.student_overrides)
+        student_overrides.update((sid, np.asarray(schedule, dtype=self.student_courses.dtype))
+                                 for sid, schedule in schedules.items())
+        index = EnrollmentIndex(self.graph, self.student_codes, self.student_ids, self.course_offsets,
+                                self.course_students, self.student_offsets, self.student_courses,
+                                course_overrides, student_overrides)
+        if len(course_overrides) + len(student_overrides) > MAX_OVERRIDES:
+            return index.compacted()
+        return index
+
+    def compacted(self) -> 'EnrollmentIndex':
+        """This index with its overrides folded into new arrays (the form snapshot files store)."""
+        if not self.course_overrides and not self.student_overrides:
+            return self
+        course_offsets, course_students = _fold(self.course_offsets, self.course_students, self.course_overrides)
+        student_offsets, student_courses = _fold(self.student_offsets, self.student_courses, self.student_overrides)
+        return EnrollmentIndex(self.graph, self.student_codes, self.student_ids,
+                               course_offsets, course_students, student_offsets, student_courses)
+
+    def _roster_ids(self, course_id: int) -> np.ndarray:
+        ids = self.course_overrides.get(course_id)
+        if ids is None:
+            ids = self.course_students[self.course_offsets[course_id]:self.course_offsets[course_id + 1]]
+        return ids
+
+    def _schedule_ids(self, sid: int) -> np.ndarray:
+        ids = self.student_overrides.get(sid)
+        if ids is None:
+            ids = self.student_courses[self.student_offsets[sid]:self.student_offsets[sid + 1]]
+        return ids
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [self.course_offsets, self.course_students, self.student_offsets, self.student_courses]
+        arrays += list(self.course_overrides.values()) + list(self.student_overrides.values())
+        return sum(array.nbytes for array in arrays)
+
+    def roster(self, course_code: str) -> Optional[List[str]]:
+        """Student IDs enrolled in ``course_code``, or None for an unknown course."""
+        course_id = self.graph.code_ids.get(course_code)
+        if course_id is None or course_id + 1 >= len(self.course_offsets):
+            return None
+        return [self.student_codes[sid] for sid in self._roster_ids(course_id).tolist()]
+
+    def roster_size(self, course_code: str) -> int:
+        course_id = self.graph.code_ids.get(course_code)
+        if course_id is None or course_id + 1 >= len(self.course_offsets):
+            return 0
+        return len(self._roster_ids(course_id))
+
+    def schedule(self, student_id: str) -> List[str]:
+        """Course codes ``student_id`` is enrolled in."""
+        sid = self.student_ids.get(student_id)
+        if sid is None:
+            return []
+        return [self.graph.codes[course_id] for course_id in self._schedule_ids(sid).tolist()]
+
+    def roster_sizes(self) -> np.ndarray:
+        """Enrolled-student count per course ID."""
+        sizes = np.diff(self.course_offsets)
+        for course_id, ids in self.course_overrides.items():
+            sizes[course_id] = len(ids)
+        return sizes
+
+
+def _offsets(keys: np.ndarray, size: int) -> np.ndarray:
+    offsets = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=size), out=offsets[1:])
+    return offsets
+
+
+def _fold(offsets: np.ndarray, values: np.ndarray, overrides: Dict[int, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    # CSR arrays with the rows in ``overrides`` replaced
+    sizes = np.diff(offsets)
+    pieces = []
+    start = 0
+    for row in sorted(overrides):
+        pieces.append(values[offsets[start]:offsets[row]])
+        pieces.append(overrides[row])
+        sizes[row] = len(overrides[row])
+        start = row + 1
+    pieces.append(values[offsets[start]:offsets[-1]])
+    folded = np.zeros(len(offsets), dtype=np.int64)
+    np.cumsum(sizes, out=folded[1:])
+    return folded, np.concatenate(pieces).astype(values.dtype, copy=False)
@@ -0,0 +1,29 @@
+"""Gunicorn settings for the portal API (read automatically from the backend directory).
+
+    gunicorn app:app
+
+The app is imported and the data snapshot loaded once, in the master
+(preload_app and when_ready), before any worker is forked. The workers
+then share those pages copy-on-write instead of each parsing the data
+again. gc.freeze() moves everything loaded so far out of the garbage
+collector's reach, so collections in the workers do not write to, and
+thereby copy, the shared pages. Compile data/snapshot.bin first
+(python -m snapshot_file) and the master maps it instead of parsing the
+CSV files.
+"""
+import gc
+import os
+
+bind = os.environ.get('PORTAL_BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('PORTAL_WORKERS') or 4)
+preload_app = True
+
+
+def when_ready(server):
+    # Runs in the master after the app is imported and before workers are forked
+    from data_store import store
+
+    snapshot = store.get()
+    server.log.info("Loaded data version %s (%d students) before forking workers",
+                    snapshot.version, len(snapshot.students_by_id))
+    gc.freeze()
@@ -0,0 +1,138 @@
+"""Intent classification shared by /api/chat and /api/chatbot/response.
+
+Messages are split into word tokens with one precompiled regex and each
+token is looked up in a table compiled once at import: single keywords map
+straight to (intent, weight) pairs and multi-word phrases are indexed by
+their first token. Classification therefore costs one dict lookup per token,
+however many intents and keywords there are. Whole tokens are matched, so
+"this" no longer counts as the greeting "hi".
+
+Evaluate against a labeled CSV (columns message,intent):
+
+    python -m intents benchmarks/chat_messages.csv
+"""
+import argparse
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+COURSE_CODE_PATTERN = re.compile(r'\b([a-z]{2,5}\d{3})\b', re.IGNORECASE)
+STUDENT_ID_PATTERN = re.compile(r'\b([a-z]{2}\d{2}-[a-z]+-\d{4,})\b', re.IGNORECASE)
+
+UNKNOWN = 'unknown'
+
+# Intent -> (keywords or phrases, weight). Greetings weigh least, so "hi, what do
+# you recommend?" is a recommendation request.
+INTENT_KEYWORDS = {
+    'prerequisites': (['prerequisite', 'prerequisites', 'prereq', 'prereqs', 'pre requisite',
+                       'requirements for', 'required for', 'before taking'], 3),
+    'recommend': (['recommend', 'recommends', 'recommended', 'recommendation', 'recommendations',
+                   'suggest', 'suggestion', 'suggestions', 'what should i take', 'next semester'], 2),
+    'cgpa': (['cgpa', 'gpa', 'grade point average', 'my grades'], 2),
+    'course_info': (['course', 'courses', 'catalog', 'catalogue', 'offered', 'subjects'], 1),
+    'help': (['help', 'what can you do', 'how does this work'], 1),
+    'greeting': (['hi', 'hello', 'hey', 'greetings', 'good morning', 'good afternoon', 'good evening'], 0.5),
+}
+
+# Extra weight for the prerequisites intent when the message names a course and says "require"
+REQUIRE_WORDS = frozenset(['require', 'requires', 'required', 'requirement', 'requirements', 'need', 'needs'])
+
+# Tie-break order for equal scores
+INTENT_PRIORITY = ['prerequisites', 'recommend', 'cgpa', 'course_info', 'help', 'greeting']
+
+
+class Intent:
+    """Result of classifying one message."""
+
+    def __init__(self, name: str, confidence: float, scores: Dict[str, float],
+                 course_codes: List[str], student_ids: List[str]):
+        self.name = name
+        self.confidence = confidence
+        self.scores = scores
+        self.course_codes = course_codes
+        self.student_ids = student_ids
+
+    def ranked(self) -> List[str]:
+        """Matched intents, best first."""
+        return sorted(self.scores, key=lambda name: (-self.scores[name], INTENT_PRIORITY.index(name)))
+
+class IntentRouter:
+    """Keyword/phrase intent classifier compiled from an intent table."""
+
+    def __init__(self, table: Dict[str, Tuple[List[str], float]] = INTENT_KEYWORDS):
+        self.keywords: Dict[str, List[Tuple[str, float]]] = {}
+        # First token -> [(remaining tokens, intent, weight)]
+        self.phrases: Dict[str, List[Tuple[Tuple[str, ...], str, float]]] = {}
+        for intent, (words, weight) in table.items():
+            for word in words:
+                tokens = TOKEN_PATTERN.findall(word)
+                if len(tokens) == 1:
+                    self.keywords.setdefault(tokens[0], []).append((intent, weight))
+                else:
+                    self.phrases.setdefault(tokens[0], []).append((tuple(tokens[1:]), intent, weight))
+
+    def classify(self, message: str) -> Intent:
+        tokens = TOKEN_PATTERN.findall(message.lower())
+        course_codes = [code.upper() for code in COURSE_CODE_PATTERN.findall(message)]
+        student_ids = [sid.upper() for sid in STUDENT_ID_PATTERN.findall(message)]
+
+        scores: Dict[str, float] = {}
+        mentions_require = False
+        for i, token in enumerate(tokens):
+            for intent, weight in self.keywords.get(token, ()):
+                scores[intent] = scores.get(intent, 0) + weight
+            for rest, intent, weight in self.phrases.get(token, ()):
+                if tuple(tokens[i + 1:i + 1 + len(rest)]) == rest:
+                    scores[intent] = scores.get(intent, 0) + weight
+            mentions_require = mentions_require or token in REQUIRE_WORDS
+        if mentions_require and course_codes:
+            scores['prerequisites'] = scores.get('prerequisites', 0) + 3
+
+        if not scores:
+            return Intent(UNKNOWN, 0.0, scores, course_codes, student_ids)
+        name = min(scores, key=lambda intent: (-scores[intent], INTENT_PRIORITY.index(intent)))
+        return Intent(name, scores[name] / sum(scores.values()), scores, course_codes, student_ids)
+
+
+router = IntentRouter()
+
+
+def classify(message: str) -> Intent:
+    return router.classify(message)
+
+
+def evaluate(path: str, intent_router: Optional[IntentRouter] = None, repeat: int = 1) -> Dict:
+    """Accuracy and throughput of ``intent_router`` on a CSV of labeled messages (columns message,intent)."""
+    intent_router = intent_router or router
+    labeled = pd.read_csv(path)
+    messages = labeled['message'].astype(str).tolist()
+    expected = labeled['intent'].astype(str).tolist()
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        predicted = [intent_router.classify(message).name for message in messages]
+    elapsed = time.perf_counter() - start
+
+    errors = [(m, e, p) for m, e, p in zip(messages, expected, predicted) if e != p]
+    return {
+        'messages': len(messages),
+        'accuracy': 1 - len(errors) / len(messages) if messages else 0.0,
+        'messages_per_sec': len(messages) * repeat / elapsed if elapsed else 0.0,
+        'errors': errors
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Evaluate the chat intent router on labeled messages.')
+    parser.add_argument('path', help='CSV file with message and intent columns')
+    parser.add_argument('--repeat', type=int, default=100, help='passes over the file when timing')
+    args = parser.parse_args()
+
+    result = evaluate(args.path, repeat=args.repeat)
+    for message, expected, predicted in result['errors']:
+        print(f"expected {expected:<14} got {predicted:<14} {message}")
+    print(f"{result['messages']} messages, accuracy {result['accuracy']:.1%}, "
+          f"{result['messages_per_sec']:,.0f} messages/sec")
@@ -0,0 +1,120 @@
+import csv
+import io
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from serialization import dumps
+
+# Rows converted per step when streaming; memory use is bounded by this, not by the table size
+STREAM_CHUNK_ROWS = 1000
+
+STREAM_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+
+class ListingError(ValueError):
+    """Invalid listing query parameters (reported to the client as a 400)."""
+
+
+class ListingQuery:
+    """Pagination, column selection, sort and output format for an admin listing."""
+
+    def __init__(self, columns: List[str], offset: int = 0, limit: Optional[int] = None,
+                 sort: Optional[str] = None, ascending: bool = True, fmt: str = 'json'):
+        self.columns = columns
+        self.offset = offset
+        self.limit = limit
+        self.sort = sort
+        self.ascending = ascending
+        self.format = fmt
+
+    @classmethod
+    def from_args(cls, args, df: pd.DataFrame, hidden_columns=()) -> 'ListingQuery':
+        available = [col for col in df.columns if col not in hidden_columns]
+
+        columns = available
+        if args.get('columns'):
+            columns = [col.strip() for col in args['columns'].split(',') if col.strip()]
+            unknown = [col for col in columns if col not in available]
+            if unknown:
+                raise ListingError(f"Unknown columns: {', '.join(unknown)}")
+
+        # 'cursor' is the opaque form of 'offset' returned as next_cursor by the previous page
+        offset = _parse_int(args.get('cursor', args.get('offset')), 'offset', 0)
+        limit = _parse_int(args.get('limit'), 'limit', None)
+
+        sort = args.get('sort') or None
+        ascending = True
+        if sort and sort.startswith('-'):
+            sort, ascending = sort[1:], False
+        if args.get('order'):
+            ascending = args['order'].lower() != 'desc'
+        if sort and sort not in available:
+            raise ListingError(f"Unknown sort column: {sort}")
+
+        fmt = (args.get('format') or 'json').lower()
+        if fmt != 'json' and fmt not in STREAM_FORMATS:
+            raise ListingError(f"Unsupported format: {fmt}")
+
+        return cls(columns, offset, limit, sort, ascending, fmt)
+
+
+def _parse_int(value, name: str, default):
+    if value in (None, ''):
+        return default
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ListingError(f"{name} must be an integer")
+    if number < 0:
+        raise ListingError(f"{name} must not be negative")
+    return number
+
+
+def sort_positions(df: pd.DataFrame, column: str, ascending: bool) -> np.ndarray:
+    """Row positions of ``df`` ordered by ``column`` (stable, missing values last)."""
+    ordered = df[[column]].reset_index(drop=True).sort_values(
+        column, ascending=ascending, kind='mergesort', na_position='last')
+    return ordered.index.to_numpy()
+
+
+def page_positions(total: int, query: ListingQuery, order: Optional[np.ndarray] = None) -> np.ndarray:
+    end = total if query.limit is None else min(total, query.offset + query.limit)
+    if order is None:
+        return np.arange(min(query.offset, total), end)
+    return order[query.offset:end]
+
+
+def _clean_rows(frame: pd.DataFrame) -> pd.DataFrame:
+    # NaN is not valid JSON; send missing values as null
+    return frame.astype(object).where(frame.notna(), None)
+
+
+def page_records(df: pd.DataFrame, positions: np.ndarray, columns: List[str]) -> List[Dict]:
+    return _clean_rows(df.iloc[positions][columns]).to_dict('records')
+
+
+def iter_ndjson(df: pd.DataFrame, positions: np.ndarray, columns: List[str]) -> Iterator[bytes]:
+    for start in range(0, len(positions), STREAM_CHUNK_ROWS):
+        chunk = _clean_rows(df.iloc[positions[start:start + STREAM_CHUNK_ROWS]][columns])
+        # Keys keep the requested column order
+        yield b''.join(dumps(dict(zip(columns, row)), sort_keys=False) + b'\n'
+                       for row in chunk.itertuples(index=False, name=None))
+
+
+def iter_csv(df: pd.DataFrame, positions: np.ndarray, columns: List[str]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for start in range(0, len(positions), STREAM_CHUNK_ROWS):
+        chunk = _clean_rows(df.iloc[positions[start:start + STREAM_CHUNK_ROWS]][columns])
+        writer.writerows(chunk.itertuples(index=False, name=None))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue()
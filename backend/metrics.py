@@ -0,0 +1,124 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Tuple
+
+# Upper bounds (seconds) of the latency histogram buckets
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _label_key(labels: Dict[str, str]) -> Tuple:
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key: Tuple, extra: Tuple = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+def _format_value(value) -> str:
+    # repr keeps full precision; '%g' would round large counters
+    return repr(float(value)) if isinstance(value, float) else str(int(value))
+
+
+class Metrics:
+    """Thread-safe registry of counters, latency histograms and gauges.
+
+    Counters and histograms are keyed by name and a label set; gauges are
+    callbacks evaluated when the registry is rendered, so values that
+    already live elsewhere (cache counters, snapshot age) are not copied on
+    every request. ``render`` produces the Prometheus text exposition format.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._help: Dict[str, Tuple[str, str]] = {}
+        self._counters: Dict[str, Dict[Tuple, float]] = {}
+        # name -> label key -> [bucket counts..., sum, count]
+        self._histograms: Dict[str, Dict[Tuple, List[float]]] = {}
+        self._gauges: List[Tuple[str, str, Callable[[], Dict[Tuple, float]]]] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str):
+        self._help[name] = ('counter', help_text)
+        self._counters.setdefault(name, {})
+
+    def histogram(self, name: str, help_text: str):
+        self._help[name] = ('histogram', help_text)
+        self._histograms.setdefault(name, {})
+
+    def gauge(self, name: str, help_text: str, read: Callable[[], Dict[Tuple, float]]):
+        """Register a gauge; ``read`` returns {label key: value} (use ``()`` for no labels)."""
+        self._gauges.append((name, help_text, read))
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters[name]
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, seconds: float, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms[name]
+            values = series.get(key)
+            if values is None:
+                values = series[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    values[i] += 1
+                    break
+            values[-2] += seconds
+            values[-1] += 1
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {name: {key: list(values) for key, values in series.items()}
+                          for name, series in self._histograms.items()}
+
+        for name, series in counters.items():
+            lines.append(f'# HELP {name} {self._help[name][1]}')
+            lines.append(f'# TYPE {name} counter')
+            for key, value in series.items():
+                lines.append(f'{name}{_format_labels(key)} {_format_value(value)}')
+
+        for name, series in histograms.items():
+            lines.append(f'# HELP {name} {self._help[name][1]}')
+            lines.append(f'# TYPE {name} histogram')
+            for key, values in series.items():
+                cumulative = 0
+                for bound, count in zip(self.buckets, values):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{_format_labels(key, (("le", f"{bound:g}"),))} {cumulative}')
+                lines.append(f'{name}_bucket{_format_labels(key, (("le", "+Inf"),))} {values[-1]}')
+                lines.append(f'{name}_sum{_format_labels(key)} {values[-2]:.6f}')
+                lines.append(f'{name}_count{_format_labels(key)} {values[-1]}')
+
+        for name, help_text, read in self._gauges:
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} gauge')
+            for key, value in read().items():
+                lines.append(f'{name}{_format_labels(key)} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+metrics = Metrics()
+metrics.counter('portal_requests_total', 'HTTP requests by route, method and status.')
+metrics.histogram('portal_request_duration_seconds', 'Time spent in the route handler.')
+metrics.histogram('portal_recommender_stage_seconds',
+                  'Time spent per stage of get_course_recommendations (load, filter, score).')
+metrics.histogram('portal_serialization_seconds', 'Time spent encoding JSON response bodies.')
+metrics.counter('portal_seat_reservations_total', 'Seat reservation requests by outcome.')
@@ -0,0 +1,201 @@
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from prereq_graph import PrerequisiteGraph
+
+# Default per-semester limits
+MAX_CREDIT_HOURS = 18
+MAX_HARD_COURSES = 2
+
+# Credit hours assumed for catalog rows without a value
+DEFAULT_CREDIT_HOURS = 3
+
+# Memoized plan suffixes kept per snapshot before the memo is reset
+PLAN_MEMO_SIZE = 100000
+
+DIFFICULTY_RANK = {'Easy': 0, 'Medium': 1, 'Hard': 2}
+
+
+def credit_hours(value) -> int:
+    try:
+        hours = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_CREDIT_HOURS
+    return hours if hours > 0 else DEFAULT_CREDIT_HOURS
+
+
+class DegreePlanner:
+    """Semester-by-semester plans to complete a department's catalog.
+
+    Built once per data snapshot on top of its prerequisite graph. A
+    student's goal is every course of their department plus everything
+    those courses transitively require. Semesters are filled by list
+    scheduling: among the courses whose prerequisites are done, the ones
+    heading the longest remaining prerequisite chain go first, subject to
+    the credit-hour cap and the number of Hard courses per semester.
+
+    The schedule from a given set of completed courses only depends on that
+    set and the limits, so plan suffixes are memoized by that state and
+    shared by every student who reaches it.
+    """
+
+    def __init__(self, graph: PrerequisiteGraph, course_records: Dict[str, Dict],
+                 courses_by_department: Dict[str, List[Dict]]):
+        self.graph = graph
+        self.catalog_mask = graph.mask(course_records.keys())
+        self.credits: Dict[int, int] = {}
+        self.hard: Dict[int, bool] = {}
+        for code, course in course_records.items():
+            course_id = graph.code_ids[code]
+            self.credits[course_id] = credit_hours(course['Credit_Hours'])
+            self.hard[course_id] = course['Difficulty'] == 'Hard'
+        self.heights = self._chain_heights()
+        # Longest chain first, then harder, then catalog order
+        self.priority = {course_id: (-self.heights.get(course_id, 1),
+                                     -DIFFICULTY_RANK.get(course_records[graph.codes[course_id]]['Difficulty'], 1),
+                                     course_id)
+                         for course_id in self.credits}
+        # Department -> (courses to plan, every course that can affect the plan)
+        self.department_targets: Dict[str, Tuple[int, int]] = {}
+        for department, courses in courses_by_department.items():
+            scope = 0
+            for course in courses:
+                course_id = graph.code_ids[course['Course_Code']]
+                scope |= (1 << course_id) | graph.closure_mask(course_id)
+            # Prerequisites missing from the catalog can never be scheduled, only completed earlier
+            self.department_targets[department] = (scope & self.catalog_mask, scope)
+        self._memo: Dict[Tuple, Tuple[Tuple[int, ...], ...]] = {}
+        self._memo_lock = threading.Lock()
+
+    @classmethod
+    def from_snapshot(cls, snapshot) -> 'DegreePlanner':
+        return cls(snapshot.prereq_graph, snapshot.courses_by_code, snapshot.courses_by_department)
+
+    def _chain_heights(self) -> Dict[int, int]:
+        """Length of the longest chain of courses that starts at each course (1 for a leaf)."""
+        dependents: Dict[int, List[int]] = {}
+        for course_id, prereqs in self.graph.prereq_masks.items():
+            for prereq_id in self.graph.ids_of(prereqs):
+                dependents.setdefault(prereq_id, []).append(course_id)
+        heights: Dict[int, int] = {}
+        on_stack = set()
+        # Iterative post-order DFS over the dependents; cycles stop at the course on the stack
+        for root in self.graph.prereq_masks:
+            if root in heights:
+                continue
+            stack = [(root, False)]
+            while stack:
+                course_id, expanded = stack.pop()
+                if expanded:
+                    on_stack.discard(course_id)
+                    heights[course_id] = 1 + max((heights.get(d, 0) for d in dependents.get(course_id, ())), default=0)
+                    continue
+                if course_id in heights or course_id in on_stack:
+                    continue
+                on_stack.add(course_id)
+                stack.append((course_id, True))
+                for dependent in dependents.get(course_id, ()):
+                    if dependent not in heights and dependent not in on_stack:
+                        stack.append((dependent, False))
+        return heights
+
+    def _next_semester(self, done: int, remaining: int, max_credits: int, max_hard: int) -> Tuple[int, ...]:
+        prereq_masks = self.graph.prereq_masks
+        available = [course_id for course_id in self.graph.ids_of(remaining)
+                     if prereq_masks.get(course_id, 0) & ~done == 0]
+        available.sort(key=self.priority.__getitem__)
+        semester = []
+        credits = hard = 0
+        for course_id in available:
+            hours = self.credits[course_id]
+            # A course over the cap on its own still gets a semester of its own
+            if semester and credits + hours > max_credits:
+                continue
+            # The Hard limit holds for every course (max_hard=0 leaves Hard courses unscheduled)
+            if self.hard[course_id] and hard >= max_hard:
+                continue
+            semester.append(course_id)
+            credits += hours
+            hard += self.hard[course_id]
+        return tuple(semester)
+
+    def schedule(self, done: int, target: int, scope: int, max_credits: int = MAX_CREDIT_HOURS,
+                 max_hard: int = MAX_HARD_COURSES) -> Tuple[List[Tuple[int, ...]], int]:
+        """Semesters (tuples of course IDs) from ``done`` to ``target``, and the unschedulable rest.
+
+        ``scope`` holds every course whose completion can change the plan
+        (``target`` and all its prerequisites); other bits of ``done`` are
+        ignored, which is what makes the memo key exact.
+        """
+        visited = []
+        semesters: List[Tuple[int, ...]] = []
+        suffix: Tuple[Tuple[int, ...], ...] = ()
+        state = done & scope
+        while True:
+            key = (state, target, max_credits, max_hard)
+            cached = self._memo.get(key)
+            if cached is not None:
+                suffix = cached
+                break
+            semester = self._next_semester(state, target & ~state, max_credits, max_hard)
+            if not semester:
+                break
+            visited.append(key)
+            semesters.append(semester)
+            for course_id in semester:
+                state |= 1 << course_id
+
+        plan = tuple(semesters) + suffix
+        with self._memo_lock:
+            if len(self._memo) + len(visited) > PLAN_MEMO_SIZE:
+                self._memo.clear()
+            for i, key in enumerate(visited):
+                self._memo[key] = plan[i:]
+        scheduled = done
+        for semester in plan:
+            for course_id in semester:
+                scheduled |= 1 << course_id
+        return list(plan), target & ~scheduled
+
+    def plan(self, snapshot, student_id: str, max_credits: int = MAX_CREDIT_HOURS,
+             max_hard: int = MAX_HARD_COURSES, include_enrolled: bool = True) -> Optional[Dict]:
+        """Plan for one student, or None for an unknown student.
+
+        With ``include_enrolled`` the courses the student is enrolled in
+        now count as completed by the first planned semester.
+        """
+        student = snapshot.students_by_id.get(student_id)
+        if student is None:
+            return None
+        graph = self.graph
+        done = graph.completed_mask(student_id)
+        if include_enrolled:
+            done |= graph.mask(snapshot.enrollment_index.schedule(student_id))
+        target, scope = self.department_targets.get(student['Department'], (0, 0))
+        semesters, unschedulable = self.schedule(done, target, scope, max_credits, max_hard)
+
+        planned = []
+        for number, semester in enumerate(semesters, start=1):
+            courses = []
+            for course_id in semester:
+                course = snapshot.courses_by_code[graph.codes[course_id]]
+                courses.append({
+                    'Course_Code': course['Course_Code'],
+                    'Course_Name': course['Course_Name'],
+                    'Credit_Hours': self.credits[course_id],
+                    'Difficulty': course['Difficulty']
+                })
+            planned.append({
+                'semester': number,
+                'courses': courses,
+                'credit_hours': sum(c['Credit_Hours'] for c in courses),
+                'hard_courses': sum(1 for c in courses if c['Difficulty'] == 'Hard')
+            })
+        return {
+            'student_id': student_id,
+            'department': student['Department'],
+            'semesters': planned,
+            'semester_count': len(planned),
+            'total_credit_hours': sum(s['credit_hours'] for s in planned),
+            'unschedulable': graph.codes_of(unschedulable)
+        }
@@ -0,0 +1,217 @@
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+
+def split_codes(value) -> List[str]:
+    """Split a comma-separated course list ('None', '' and NaN mean no courses)."""
+    if not isinstance(value, str) or value in ('', 'None'):
+        return []
+    return [code for code in value.split(',') if code]
+
+
+class PrerequisiteGraph:
+    """Prerequisite graph compiled once per data snapshot.
+
+    Course codes are interned to integer IDs and every set of courses
+    (a course's prerequisites, a student's completed courses, a transitive
+    closure) is handled as a bitset in a Python int, so eligibility checks are
+    a single ``prereqs & ~completed == 0`` test. Completed courses are stored
+    once, as course IDs in the snapshot's columnar StudentTable, and turned
+    into a bitset on demand; codes a student completed that are not in the
+    catalog are interned too.
+    """
+
+    def __init__(self):
+        self.codes: List[str] = []
+        self.code_ids: Dict[str, int] = {}
+        self.prereq_masks: Dict[int, int] = {}
+        self._closure_masks: Dict[int, int] = {}
+        # The snapshot's StudentTable; completed courses are read from it
+        self.students = None
+
+    @classmethod
+    def build(cls, course_records: List[Dict]) -> 'PrerequisiteGraph':
+        graph = cls()
+        for course in course_records:
+            graph.intern(course['Course_Code'])
+        for course in course_records:
+            course_id = graph.code_ids[course['Course_Code']]
+            # First occurrence wins, like the snapshot's courses_by_code index
+            if course_id not in graph.prereq_masks:
+                graph.prereq_masks[course_id] = graph.mask(split_codes(course['Prerequisites']), intern=True)
+        graph._closure_masks = graph._compute_closures()
+        return graph
+
+    def copy(self) -> 'PrerequisiteGraph':
+        """Copy sharing the catalog part, for a student table change that may intern new codes."""
+        graph = PrerequisiteGraph()
+        graph.codes = list(self.codes)
+        graph.code_ids = dict(self.code_ids)
+        graph.prereq_masks = self.prereq_masks
+        graph._closure_masks = self._closure_masks
+        graph.students = self.students
+        return graph
+
+    def with_courses(self, course_records: List[Dict]) -> 'PrerequisiteGraph':
+        """Graph for a changed catalog (``course_records`` is the whole new catalog).
+
+        Existing codes keep their IDs, so the student table's completed-course
+        IDs stay valid and the table is shared.
+        """
+        graph = PrerequisiteGraph()
+        graph.codes = list(self.codes)
+        graph.code_ids = dict(self.code_ids)
+        for course in course_records:
+            graph.intern(course['Course_Code'])
+        for course in course_records:
+            course_id = graph.code_ids[course['Course_Code']]
+            if course_id not in graph.prereq_masks:
+                graph.prereq_masks[course_id] = graph.mask(split_codes(course['Prerequisites']), intern=True)
+        graph.students = self.students
+        graph._closure_masks = graph._compute_closures()
+        return graph
+
+    def with_prerequisites(self, changes: Dict[str, List[str]]) -> 'PrerequisiteGraph':
+        """Read-only copy with the direct prerequisites of catalog courses in ``changes`` replaced.
+
+        Every code must already be interned; codes, IDs and the student
+        table are shared. Only the closures of the changed courses and of
+        the courses that (transitively) require them are recomputed.
+        """
+        graph = PrerequisiteGraph()
+        graph.codes = self.codes
+        graph.code_ids = self.code_ids
+        graph.students = self.students
+        graph.prereq_masks = dict(self.prereq_masks)
+        changed = 0
+        for code, prerequisites in changes.items():
+            course_id = self.code_ids[code]
+            graph.prereq_masks[course_id] = self.mask(prerequisites)
+            changed |= 1 << course_id
+        unaffected = {course_id: closure for course_id, closure in self._closure_masks.items()
+                      if not (closure & changed or (changed >> course_id) & 1)}
+        graph._closure_masks = graph._compute_closures(unaffected)
+        return graph
+
+    def intern(self, code: str) -> int:
+        course_id = self.code_ids.get(code)
+        if course_id is None:
+            course_id = len(self.codes)
+            self.codes.append(code)
+            self.code_ids[code] = course_id
+        return course_id
+
+    def mask(self, codes: Iterable[str], intern: bool = False) -> int:
+        """Bitset for a list of course codes. Unknown codes are ignored unless ``intern``."""
+        bits = 0
+        for code in codes:
+            course_id = self.intern(code) if intern else self.code_ids.get(code)
+            if course_id is not None:
+                bits |= 1 << course_id
+        return bits
+
+    def codes_of(self, mask: int) -> List[str]:
+        return [self.codes[course_id] for course_id in self._bits(mask)]
+
+    def ids_of(self, mask: int) -> List[int]:
+        return self._bits(mask)
+
+    def closure_mask(self, course_id: int) -> int:
+        """Bitset of every course ``course_id`` ultimately requires."""
+        return self._closure_masks.get(course_id, 0)
+
+    def completed_mask(self, student_id: str) -> int:
+        return self.students.completed_mask(student_id) if self.students is not None else 0
+
+    def has_completed(self, completed_mask: int, code: str) -> bool:
+        course_id = self.code_ids.get(code)
+        return course_id is not None and (completed_mask >> course_id) & 1 == 1
+
+    def is_eligible(self, code: str, completed_mask: int) -> bool:
+        """True if every direct prerequisite of ``code`` is in ``completed_mask``."""
+        course_id = self.code_ids.get(code)
+        if course_id is None:
+            return False
+        return self.prereq_masks.get(course_id, 0) & ~completed_mask == 0
+
+    def direct_prerequisites(self, code: str) -> Optional[List[str]]:
+        course_id = self.code_ids.get(code)
+        if course_id is None or course_id not in self.prereq_masks:
+            return None
+        return self.codes_of(self.prereq_masks[course_id])
+
+    def all_prerequisites(self, code: str) -> Optional[List[str]]:
+        """Every course ``code`` ultimately requires, or None for an unknown course."""
+        course_id = self.code_ids.get(code)
+        if course_id is None or course_id not in self.prereq_masks:
+            return None
+        return self.codes_of(self._closure_masks.get(course_id, 0))
+
+    def missing_prerequisites(self, code: str, completed_mask: int) -> List[str]:
+        """Transitive prerequisites of ``code`` not yet in ``completed_mask``."""
+        course_id = self.code_ids.get(code)
+        if course_id is None:
+            return []
+        return self.codes_of(self._closure_masks.get(course_id, 0) & ~completed_mask)
+
+    def completed_matrix(self, student_ids: List[str]) -> np.ndarray:
+        """Boolean (students x course IDs) matrix of completed courses."""
+        if self.students is None:
+            return np.zeros((len(student_ids), len(self.codes)), dtype=bool)
+        return self.students.completed_matrix(student_ids, len(self.codes))
+
+    def prereq_matrix(self, course_codes: List[str]) -> np.ndarray:
+        """Boolean (courses x course IDs) matrix of direct prerequisites."""
+        masks = []
+        for code in course_codes:
+            course_id = self.code_ids.get(code)
+            masks.append(self.prereq_masks.get(course_id, 0) if course_id is not None else 0)
+        return self._masks_to_matrix(masks)
+
+    def _masks_to_matrix(self, masks: List[int]) -> np.ndarray:
+        n_codes = len(self.codes)
+        n_bytes = (n_codes + 7) // 8
+        if not masks or n_bytes == 0:
+            return np.zeros((len(masks), n_codes), dtype=bool)
+        packed = np.frombuffer(b''.join(mask.to_bytes(n_bytes, 'little') for mask in masks), dtype=np.uint8)
+        bits = np.unpackbits(packed.reshape(len(masks), n_bytes), axis=1, bitorder='little')
+        return bits[:, :n_codes].astype(bool)
+
+    def _compute_closures(self, known: Optional[Dict[int, int]] = None) -> Dict[int, int]:
+        # Iterative post-order DFS so deep prerequisite chains cannot hit the
+        # recursion limit; a cycle simply stops at the course already on the stack.
+        # Closures in ``known`` are taken as they are.
+        closures: Dict[int, int] = dict(known) if known else {}
+        on_stack: Set[int] = set()
+        for root in self.prereq_masks:
+            if root in closures:
+                continue
+            stack = [(root, False)]
+            while stack:
+                course_id, expanded = stack.pop()
+                if expanded:
+                    on_stack.discard(course_id)
+                    direct = self.prereq_masks.get(course_id, 0)
+                    closure = direct
+                    for prereq_id in self._bits(direct):
+                        closure |= closures.get(prereq_id, 0)
+                    closures[course_id] = closure
+                    continue
+                if course_id in closures or course_id in on_stack:
+                    continue
+                on_stack.add(course_id)
+                stack.append((course_id, True))
+                for prereq_id in self._bits(self.prereq_masks.get(course_id, 0)):
+                    if prereq_id not in closures and prereq_id not in on_stack:
+                        stack.append((prereq_id, False))
+        return closures
+
+    @staticmethod
+    def _bits(mask: int) -> List[int]:
+        ids = []
+        while mask:
+            low = mask & -mask
+            ids.append(low.bit_length() - 1)
+            mask ^= low
+        return ids
@@ -0,0 +1,136 @@
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'profiles'))
+
+# Seconds between two stack samples of the in-flight requests
+SAMPLE_INTERVAL = 0.005
+
+# Requests taking at least this many seconds get their profile written
+DEFAULT_SLOW_THRESHOLD = 0.5
+
+# Most recent profile files listed by ``state``
+RECENT_PROFILES = 20
+
+
+def _fold(frame) -> str:
+    """One stack as 'outermost;...;innermost' (the folded format used by flamegraph.pl and speedscope)."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f'{os.path.basename(code.co_filename)}:{code.co_name}')
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+class SamplingProfiler:
+    """Opt-in stack sampler for slow requests.
+
+    While enabled, a background thread samples the stacks of every thread
+    that is inside a request (``begin``/``end``) every ``interval`` seconds.
+    When a request ends after ``slow_threshold`` seconds or more, its
+    samples are written to ``out_dir`` as a .folded file that flamegraph.pl
+    or speedscope can render. Disabled, ``begin``/``end`` cost a flag check.
+
+    Threads do not survive fork, so a process forked while the profiler is
+    enabled (a gunicorn worker of a preloaded app) starts its own sampler
+    on its first request.
+    """
+
+    def __init__(self, out_dir: str = PROFILE_DIR, interval: float = SAMPLE_INTERVAL,
+                 slow_threshold: float = DEFAULT_SLOW_THRESHOLD):
+        self.out_dir = out_dir
+        self.interval = interval
+        self.slow_threshold = slow_threshold
+        self.enabled = False
+        self.dumped = 0
+        self._active: Dict[int, Counter] = {}
+        self._recent: List[str] = []
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        os.register_at_fork(after_in_child=self._after_fork)
+
+    def _after_fork(self):
+        # Only the forking thread exists in the child; the lock may have been held by another one
+        self._lock = threading.Lock()
+        self._thread = None
+        self._active = {}
+
+    def _start(self):
+        # Caller holds self._lock. A sampler stopped by disable() may still be finishing its last sleep
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+            self._thread.start()
+
+    def enable(self, slow_threshold: Optional[float] = None):
+        with self._lock:
+            if slow_threshold is not None:
+                self.slow_threshold = slow_threshold
+            self.enabled = True
+            self._start()
+
+    def disable(self):
+        with self._lock:
+            self.enabled = False
+            self._active.clear()
+
+    def begin(self):
+        if self.enabled:
+            with self._lock:
+                if self._thread is None:
+                    self._start()
+                self._active[threading.get_ident()] = Counter()
+
+    def end(self, label: str, duration: float):
+        if not self.enabled:
+            return
+        with self._lock:
+            samples = self._active.pop(threading.get_ident(), None)
+        if samples and duration >= self.slow_threshold:
+            self._dump(label, duration, samples)
+
+    def _run(self):
+        own = threading.get_ident()
+        while self.enabled:
+            frames = sys._current_frames()
+            with self._lock:
+                for ident, samples in self._active.items():
+                    frame = frames.get(ident)
+                    if frame is not None and ident != own:
+                        samples[_fold(frame)] += 1
+            del frames
+            time.sleep(self.interval)
+
+    def _dump(self, label: str, duration: float, samples: Counter):
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{label.replace('/', '_')}-{duration * 1000:.0f}ms.folded"
+        path = os.path.join(self.out_dir, name)
+        try:
+            os.makedirs(self.out_dir, exist_ok=True)
+            with open(path, 'w') as f:
+                for stack, count in samples.most_common():
+                    f.write(f'{stack} {count}\n')
+        except OSError as e:
+            logger.error("Could not write profile %s: %s", path, e)
+            return
+        with self._lock:
+            self.dumped += 1
+            self._recent = (self._recent + [path])[-RECENT_PROFILES:]
+        logger.info("Slow request %s (%.0f ms), profile written to %s", label, duration * 1000, path)
+
+    def state(self) -> Dict:
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'slow_threshold': self.slow_threshold,
+                'interval': self.interval,
+                'out_dir': self.out_dir,
+                'dumped': self.dumped,
+                'recent': list(self._recent)
+            }
@@ -0,0 +1,195 @@
+import logging
+import time
+
+import numpy as np
+
+import collaborative
+from metrics import metrics
+from prereq_graph import split_codes
+from seats import seat_map
+
+logger = logging.getLogger(__name__)
+
+# Number of students scored per NumPy operation in batch recommendations
+BATCH_CHUNK_SIZE = 4096
+
+# Match_Score modes: 'default' (difficulty and CGPA) or 'collaborative' (enrollment history)
+SCORING_MODES = ('default', 'collaborative')
+
+
+def scoring_key(scoring):
+    """Cache key part for a scoring mode; includes the model version for collaborative scoring."""
+    if scoring == 'collaborative':
+        return scoring, collaborative.models.get().built_at
+    return scoring
+
+
+def get_course_recommendations(student_id, snapshot, scoring='default'):
+    stage_start = time.perf_counter()
+    student = snapshot.students_by_id.get(student_id)
+    if student is None:
+        logger.debug("Student not found for ID: %s", student_id)
+        return {"error": "Student not found"}
+
+    department = student['Department']
+    cgpa = student['CGPA']
+
+    graph = snapshot.prereq_graph
+    completed_mask = graph.completed_mask(student_id)
+    dept_courses = snapshot.courses_by_department.get(department, [])
+    stage_start = record_stage('load', stage_start)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Student ID: %s, Department: %s, Completed Courses: %s",
+                     student_id, department, split_codes(student['Completed_Courses']))
+        logger.debug("Found %d courses in department %s", len(dept_courses), department)
+
+    available_courses = [c for c in dept_courses if not graph.has_completed(completed_mask, c['Course_Code'])
+                         and graph.is_eligible(c['Course_Code'], completed_mask)]
+    stage_start = record_stage('filter', stage_start)
+    logger.debug("Eligible courses for recommendation: %d", len(available_courses))
+
+    if scoring == 'collaborative':
+        match_scores = collaborative_scores(student_id, snapshot, available_courses)
+    else:
+        match_scores = []
+        for course in available_courses:
+            if course['Prerequisites'] == 'None':
+                match_scores.append(1.0)
+            else:
+                difficulty_score = 1.0 if course['Difficulty'] == 'Easy' else (0.8 if course['Difficulty'] == 'Medium' else 0.6)
+                cgpa_score = min(1.0, cgpa / 4.0)
+                match_scores.append((difficulty_score + cgpa_score) / 2)
+
+    recommended_courses = []
+    for course, match_score in zip(available_courses, match_scores):
+        prereqs = course['Prerequisites']
+        recommended_courses.append({
+            'Course_Code': course['Course_Code'],
+            'Course_Name': course['Course_Name'],
+            'Difficulty': course['Difficulty'],
+            'Credit_Hours': course['Credit_Hours'],
+            'Prerequisites': prereqs,
+            'Match_Score': match_score
+        })
+
+    recommended_courses.sort(key=lambda x: x['Match_Score'], reverse=True)
+
+    seats = seat_map(snapshot)
+    for course in recommended_courses:
+        enrollment = snapshot.enrollments_by_code.get(course['Course_Code'])
+        course['Enrollment_Count'] = enrollment['Enrollment_Count'] if enrollment is not None else 0
+        course['Seats_Available'] = seats.available(course['Course_Code'])
+    record_stage('score', stage_start)
+
+    logger.debug("Returning %d recommended courses.", len(recommended_courses))
+    return recommended_courses
+
+def collaborative_scores(student_id, snapshot, courses):
+    """Match scores in [0, 1] from the collaborative model's similarity to the student's history.
+
+    The history is the completed and currently enrolled courses. Scores are
+    scaled by the best candidate; course popularity breaks ties (and ranks
+    candidates for students without any known history).
+    """
+    model = collaborative.models.get()
+    graph = snapshot.prereq_graph
+    history = graph.codes_of(graph.completed_mask(student_id)) + snapshot.enrollment_index.schedule(student_id)
+    similarity = model.scores(history)
+    rows = [model.index.get(course['Course_Code']) for course in courses]
+    raw = np.array([similarity[row] if row is not None else 0.0 for row in rows], dtype=np.float64)
+    popularity = np.array([model.popularity[row] if row is not None else 0.0 for row in rows], dtype=np.float64)
+    best = raw.max() if len(raw) else 0.0
+    scaled = raw / best if best > 0 else raw
+    # A little popularity ranks equal similarities (and students without any history)
+    return (scaled * 0.99 + popularity * 0.01).tolist()
+
+def record_stage(stage, start):
+    """Observe the time since ``start`` for one recommender stage; returns the new start time."""
+    now = time.perf_counter()
+    metrics.observe('portal_recommender_stage_seconds', now - start, stage=stage)
+    return now
+
+def get_batch_recommendations(snapshot, student_ids=None, department=None, top_k=10):
+    """Vectorized get_course_recommendations for a whole cohort.
+
+    Students are selected by ID and/or department. Eligibility and Match_Score
+    are computed for all students x department courses as NumPy matrix
+    operations, in chunks of BATCH_CHUNK_SIZE students, and the top_k courses
+    per student are returned in the same order as the single-student path.
+    Unknown IDs map to {"error": "Student not found"}.
+    """
+    results = {}
+    if student_ids is None:
+        student_ids = snapshot.students_by_id.ids_in_department(department) if department is not None \
+            else list(snapshot.students_by_id)
+        students = [snapshot.students_by_id[student_id] for student_id in student_ids]
+    else:
+        students = []
+        for student_id in student_ids:
+            student = snapshot.students_by_id.get(student_id)
+            if student is None:
+                results[student_id] = {"error": "Student not found"}
+            elif department is None or student['Department'] == department:
+                students.append(student)
+
+    by_department = {}
+    for student in students:
+        by_department.setdefault(student['Department'], []).append(student)
+
+    graph = snapshot.prereq_graph
+    seats = seat_map(snapshot)
+    for dept, dept_students in by_department.items():
+        dept_courses = snapshot.courses_by_department.get(dept, [])
+        if not dept_courses:
+            for student in dept_students:
+                results[student['Student_ID']] = []
+            continue
+
+        codes = [c['Course_Code'] for c in dept_courses]
+        course_ids = np.array([graph.code_ids[code] for code in codes])
+        prereqs = graph.prereq_matrix(codes)
+        # Only the course IDs that appear as a prerequisite matter for eligibility
+        relevant = np.flatnonzero(prereqs.any(axis=0))
+        prereqs = prereqs[:, relevant].astype(np.float32)
+        has_prereqs = np.array([c['Prerequisites'] != 'None' for c in dept_courses])
+        difficulty_score = np.array([1.0 if c['Difficulty'] == 'Easy' else (0.8 if c['Difficulty'] == 'Medium' else 0.6)
+                                     for c in dept_courses])
+        course_templates = []
+        for course in dept_courses:
+            enrollment = snapshot.enrollments_by_code.get(course['Course_Code'])
+            course_templates.append({
+                'Course_Code': course['Course_Code'],
+                'Course_Name': course['Course_Name'],
+                'Difficulty': course['Difficulty'],
+                'Credit_Hours': course['Credit_Hours'],
+                'Prerequisites': course['Prerequisites'],
+                'Enrollment_Count': enrollment['Enrollment_Count'] if enrollment is not None else 0,
+                'Seats_Available': seats.available(course['Course_Code'])
+            })
+
+        for start in range(0, len(dept_students), BATCH_CHUNK_SIZE):
+            chunk = dept_students[start:start + BATCH_CHUNK_SIZE]
+            chunk_ids = [s['Student_ID'] for s in chunk]
+            completed = graph.completed_matrix(chunk_ids)
+            missing = (~completed[:, relevant]).astype(np.float32) @ prereqs.T
+            eligible = (missing == 0) & ~completed[:, course_ids]
+
+            cgpa_score = np.minimum(1.0, np.array([s['CGPA'] for s in chunk], dtype=np.float64) / 4.0)
+            scores = np.where(has_prereqs, (difficulty_score + cgpa_score[:, None]) / 2, 1.0)
+            scores = np.where(eligible, scores, -np.inf)
+            # Stable sort keeps catalog order among equal scores, like list.sort in the single path
+            order = np.argsort(-scores, axis=1, kind='stable')
+            if top_k is not None:
+                order = order[:, :top_k]
+
+            # Plain lists are much cheaper to walk than per-element NumPy indexing
+            ranked_eligible = np.take_along_axis(eligible, order, axis=1).tolist()
+            ranked_scores = np.take_along_axis(scores, order, axis=1).tolist()
+            for row, student_id in enumerate(chunk_ids):
+                recommended_courses = []
+                for col, is_eligible, match_score in zip(order[row].tolist(), ranked_eligible[row], ranked_scores[row]):
+                    if not is_eligible:
+                        break
+                    recommended_courses.append(dict(course_templates[col], Match_Score=match_score))
+                results[student_id] = recommended_courses
+    return results
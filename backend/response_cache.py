@@ -0,0 +1,93 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with TTL expiry, scoped to a data snapshot version.
+
+    Entries are stored under ``(version, key)``. As soon as a lookup arrives
+    for a newer snapshot version, every entry of older versions is dropped,
+    so cached payloads never outlive the data they were computed from. At
+    most ``maxsize`` entries are kept; the least recently used is evicted.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _check_version(self, version) -> bool:
+        """Move the cache to ``version``; False if ``version`` is older than the cache."""
+        if self._version is not None and version < self._version:
+            # A request still holding a replaced snapshot: bypass the cache
+            return False
+        if version != self._version:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._version = version
+        return True
+
+    def get(self, version, key: Hashable, default=None):
+        with self._lock:
+            entry = self._entries.get(key) if self._check_version(version) else None
+            if entry is None:
+                self.misses += 1
+                return default
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, version, key: Hashable, value: Any):
+        with self._lock:
+            if not self._check_version(version):
+                return
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, version, key: Hashable, compute: Callable[[], Any]) -> Any:
+        missing = object()
+        value = self.get(version, key, missing)
+        if value is missing:
+            # Computed outside the lock; concurrent misses may compute twice, which is harmless
+            value = compute()
+            self.set(version, key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'version': self._version,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations
+            }
@@ -0,0 +1,461 @@
+"""Full-text search over courses and students, for typeahead and the chat.
+
+A SearchIndex is built once per data snapshot. Every course (Course_Code,
+Course_Name, Department) and every student (Student_ID, Name) is a
+document. Field values are lowercased, stripped of accents and split into
+terms. A hyphenated term such as an ID ("fa21-bscs-0001") is also indexed
+by its parts after the first ("bscs", "0001"), since the first is already
+a prefix of the whole.
+
+The vocabulary is one sorted byte-string array, and the postings (document,
+field) of each term are stored in term order in flat arrays with CSR
+offsets. The terms sharing a prefix are therefore one contiguous range of
+the vocabulary, found with two binary searches, and their postings one
+contiguous slice: a prefix lookup costs the same as an exact one, plus the
+postings it returns. Words of the name fields are also indexed by their
+trigrams, which catches typos and partial words ("scince", "gorithms")
+when a query word is not the prefix of any term.
+
+Ranking: a document is returned when every query word matches it, as a
+prefix of one of its terms (so the last word may still be being typed).
+A word scores its best match in the document, the field weight times 4
+for a whole term, 2 for a prefix and 1 for a trigram match. Documents are
+ordered by the sum over the query words, then courses before students,
+then file order. The rarest query word is looked up first, and the others
+only in the documents it matched.
+
+Time queries against a dataset directory (see benchmarks.dataset):
+
+    python -m search --data DIR "data str" "fa21-bscs-00" "student 4"
+"""
+import argparse
+import os
+import re
+import time
+import unicodedata
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+TOKEN_PATTERN = re.compile(r'[^\W_]+(?:-[^\W_]+)*')
+# The parts of hyphenated words after the first (which is a prefix of the whole word)
+LATER_PART_PATTERN = re.compile(r'(?<=-)[^\W_]+')
+COMBINING_MARKS = re.compile(r'[\u0300-\u036f]')
+
+# Longer terms are truncated (query words too, so they still match)
+MAX_TERM_LENGTH = 32
+
+COURSE_FIELDS = ('Course_Code', 'Course_Name', 'Department')
+STUDENT_FIELDS = ('Student_ID', 'Name')
+FIELDS = COURSE_FIELDS + STUDENT_FIELDS
+FIELD_WEIGHTS = {'Course_Code': 3, 'Course_Name': 2, 'Department': 1, 'Student_ID': 3, 'Name': 2}
+# Fields whose words are indexed by trigram (identifiers are only matched by prefix)
+TRIGRAM_FIELDS = ('Course_Name', 'Department', 'Name')
+
+EXACT, PREFIX, FUZZY = 4, 2, 1
+# Shorter words match by prefix only
+FUZZY_MIN_LENGTH = 4
+# Share of trigrams a word and a term must have in common (Dice coefficient) to match
+FUZZY_THRESHOLD = 0.5
+FUZZY_MAX_TERMS = 50
+
+# Arrays a SearchIndex is made of (stored as they are in compiled snapshots)
+SEARCH_ARRAYS = ('terms', 'offsets', 'docs', 'fields', 'trigram_keys', 'trigram_offsets', 'trigram_terms',
+                 'trigram_counts', 'name_weights')
+
+KINDS = ('course', 'student')
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 100
+
+# Words that do not name a course on their own (ignored when resolving course names in a message)
+STOPWORDS = frozenset(['a', 'an', 'and', 'about', 'are', 'at', 'can', 'do', 'for', 'i', 'in', 'is', 'it', 'me',
+                       'my', 'of', 'on', 'or', 'the', 'to', 'what', 'which', 'with', 'you'])
+# Share of a course name's word weight a message must contain to mention the course
+MENTION_THRESHOLD = 0.5
+# A word found in at most this many course names mentions them on its own
+MENTION_MAX_COURSES = 2
+# Misspelt words of a message must be closer to a course name word than typeahead words
+MENTION_FUZZY_THRESHOLD = 0.7
+
+
+class SearchError(ValueError):
+    """Invalid search parameters (reported to the client as a 400)."""
+
+
+def fold(text: str) -> str:
+    """Lowercase ``text`` and drop accents ("Zoë" -> "zoe")."""
+    return COMBINING_MARKS.sub('', unicodedata.normalize('NFKD', text.lower()))
+
+
+def tokenize(text) -> List[str]:
+    """Folded words of ``text``; hyphenated words are kept whole."""
+    if not isinstance(text, str):
+        return []
+    return TOKEN_PATTERN.findall(fold(text))
+
+
+def index_terms(text) -> List[str]:
+    """Terms ``text`` is indexed under: its words and the later parts of hyphenated words."""
+    if not isinstance(text, str):
+        return []
+    text = fold(text)
+    return list(dict.fromkeys(term[:MAX_TERM_LENGTH]
+                              for term in TOKEN_PATTERN.findall(text) + LATER_PART_PATTERN.findall(text)))
+
+
+def _field_terms(texts: Sequence) -> Tuple[np.ndarray, np.ndarray]:
+    """index_terms of a whole column: (terms, row number of each term), with duplicates.
+
+    The values are joined by newlines and scanned with one findall per
+    pattern; the row of a term is the number of newlines before it.
+    """
+    texts = [text.replace('\n', ' ') if isinstance(text, str) else '' for text in texts]
+    joined = fold('\n'.join(texts))
+    terms, rows = [], []
+    for pattern in (TOKEN_PATTERN, LATER_PART_PATTERN):
+        found = np.array(re.findall(pattern.pattern + '|\n', joined), dtype=object)
+        breaks = found == '\n'
+        terms.append(found[~breaks])
+        rows.append(np.cumsum(breaks)[~breaks])
+    return np.concatenate(terms), np.concatenate(rows)
+
+
+def _bytes_array(values: List[bytes]) -> np.ndarray:
+    return np.array(values, dtype=bytes) if len(values) else np.array([], dtype='S1')
+
+
+def _key(term: str) -> bytes:
+    return term[:MAX_TERM_LENGTH].encode('utf-8')
+
+
+def _idf(documents: int, frequency):
+    """Inverse document frequency of a word found in ``frequency`` of ``documents`` course names."""
+    return np.log1p(documents / np.maximum(frequency, 1))
+
+
+def _trigrams(word: str) -> List[str]:
+    # Padded like PostgreSQL's pg_trgm, so the start and end of a word count more
+    padded = f'  {word} '
+    return list(dict.fromkeys(padded[i:i + 3] for i in range(len(padded) - 2)))
+
+
+class SearchQuery:
+    """Query text, document kind and page of a search request."""
+
+    def __init__(self, text: str, kind: Optional[str] = None, offset: int = 0, limit: int = DEFAULT_LIMIT):
+        self.text = text
+        self.kind = kind
+        self.offset = offset
+        self.limit = limit
+
+    @classmethod
+    def from_args(cls, args) -> 'SearchQuery':
+        text = (args.get('q') or '').strip()
+        if not text:
+            raise SearchError('q is required')
+        kind = args.get('type') or None
+        if kind is not None and kind not in KINDS:
+            raise SearchError(f"type must be one of {', '.join(KINDS)}")
+        # 'cursor' is the opaque form of 'offset' returned as next_cursor by the previous page
+        offset = _parse_int(args.get('cursor', args.get('offset')), 'offset', 0)
+        limit = _parse_int(args.get('limit'), 'limit', DEFAULT_LIMIT)
+        if limit == 0 or limit > MAX_LIMIT:
+            raise SearchError(f"limit must be between 1 and {MAX_LIMIT}")
+        return cls(text, kind, offset, limit)
+
+
+def _parse_int(value, name: str, default: int) -> int:
+    if value in (None, ''):
+        return default
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise SearchError(f"{name} must be an integer")
+    if number < 0:
+        raise SearchError(f"{name} must not be negative")
+    return number
+
+
+class SearchIndex:
+    """Inverted index over the courses and students of one snapshot (see the module docstring).
+
+    Documents 0 .. len(courses) - 1 are the catalog courses in file order,
+    the rest the students in table order (one per Student_ID).
+    """
+
+    def __init__(self, courses: List[Dict], students, student_rows: np.ndarray, arrays: Dict[str, np.ndarray]):
+        self.courses = courses
+        self.students = students
+        self.student_rows = student_rows
+        self.doc_count = len(courses) + len(student_rows)
+        # Vocabulary and postings (CSR by term ID)
+        self.terms = arrays['terms']
+        self.offsets = arrays['offsets']
+        self.docs = arrays['docs']
+        self.fields = arrays['fields']
+        # Field weight of every posting, for a prefix match
+        self.weights = np.array([FIELD_WEIGHTS[field] * PREFIX for field in FIELDS], dtype=np.uint8)[self.fields]
+        # Trigram -> term IDs (CSR by trigram), and the number of trigrams of each term
+        self.trigram_keys = arrays['trigram_keys']
+        self.trigram_offsets = arrays['trigram_offsets']
+        self.trigram_terms = arrays['trigram_terms']
+        self.trigram_counts = arrays['trigram_counts']
+        self._trigram_ids = {gram.decode('utf-8'): i for i, gram in enumerate(self.trigram_keys.tolist())}
+        # Total weight of each course's name words (see mentioned_courses)
+        self.name_weights = arrays['name_weights']
+
+    @classmethod
+    def build(cls, course_records: List[Dict], students) -> 'SearchIndex':
+        student_rows = students.first_rows()
+        names = students.name.tolist()
+        columns = [(field, 0, [course.get(field) for course in course_records]) for field in COURSE_FIELDS]
+        columns.append(('Student_ID', len(course_records), [students.ids[row] for row in student_rows.tolist()]))
+        columns.append(('Name', len(course_records), [names[row] for row in student_rows.tolist()]))
+        doc_count = len(course_records) + len(student_rows)
+
+        found_terms, found_docs, found_fields = [], [], []
+        for field, first_doc, texts in columns:
+            terms, rows = _field_terms(texts)
+            found_terms.append(terms)
+            found_docs.append(rows + first_doc)
+            found_fields.append(np.full(len(terms), FIELDS.index(field), dtype=np.int64))
+        codes, unique_terms = pd.factorize(np.concatenate(found_terms))
+        if len(unique_terms) and max(map(len, unique_terms)) > MAX_TERM_LENGTH:
+            unique_terms = [term[:MAX_TERM_LENGTH] for term in unique_terms]
+        # Vocabulary in byte order (= code point order), so every prefix is a contiguous range of term IDs
+        encoded = _bytes_array('\n'.join(unique_terms).encode('utf-8').split(b'\n') if len(unique_terms) else [])
+        order = np.argsort(encoded, kind='stable')
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = encoded[order[1:]] != encoded[order[:-1]]
+        vocabulary = encoded[order[first]]
+        term_ids = np.empty(len(order), dtype=np.int64)
+        term_ids[order] = np.cumsum(first) - 1
+
+        # One sorted key per distinct (term, field, document): postings in term order
+        doc_count = max(doc_count, 1)
+        keys = (term_ids[codes] * len(FIELDS) + np.concatenate(found_fields)) * doc_count + np.concatenate(found_docs)
+        keys.sort()
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))] if len(keys) else keys
+        # Document numbers as intp, which numpy indexes with directly (no conversion per query)
+        posting_doc = (keys % doc_count).astype(np.intp)
+        keys //= doc_count
+        posting_field = (keys % len(FIELDS)).astype(np.uint8)
+        posting_term = keys // len(FIELDS)
+        offsets = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(posting_term, minlength=len(vocabulary)), out=offsets[1:])
+
+        stopwords = np.isin(vocabulary, [_key(word) for word in STOPWORDS])
+        counted = (posting_field == FIELDS.index('Course_Name')) & ~stopwords[posting_term]
+        name_counts = np.bincount(posting_term[counted], minlength=len(vocabulary))
+        term_weights = _idf(len(course_records), name_counts)
+        name_weights = np.bincount(posting_doc[counted], weights=term_weights[posting_term[counted]],
+                                   minlength=len(course_records))
+
+        # Trigrams of the words that occur in a name field
+        trigram_fields = np.array([field in TRIGRAM_FIELDS for field in FIELDS])
+        trigram_terms: Dict[str, List[int]] = {}
+        trigram_counts = np.zeros(len(vocabulary), dtype=np.int32)
+        for term_id in np.unique(posting_term[trigram_fields[posting_field]]).tolist():
+            term = vocabulary[term_id].decode('utf-8')
+            if term.isdigit():
+                continue
+            grams = _trigrams(term)
+            trigram_counts[term_id] = len(grams)
+            for gram in grams:
+                trigram_terms.setdefault(gram, []).append(term_id)
+        grams = sorted(trigram_terms)
+        trigram_offsets = np.zeros(len(grams) + 1, dtype=np.int64)
+        np.cumsum([len(trigram_terms[gram]) for gram in grams], out=trigram_offsets[1:])
+
+        return cls(course_records, students, student_rows, {
+            'terms': vocabulary,
+            'offsets': offsets,
+            'docs': posting_doc,
+            'fields': posting_field,
+            'trigram_keys': _bytes_array([gram.encode('utf-8') for gram in grams]),
+            'trigram_offsets': trigram_offsets,
+            'trigram_terms': np.array([i for gram in grams for i in trigram_terms[gram]], dtype=np.int32),
+            'trigram_counts': trigram_counts,
+            'name_weights': name_weights
+        })
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """The index as named arrays, from which ``__init__`` rebuilds it (see snapshot_file.py)."""
+        return {name: getattr(self, name) for name in SEARCH_ARRAYS}
+
+    def _term_range(self, key: bytes) -> Tuple[int, int]:
+        """Term IDs of the terms starting with ``key``."""
+        lo = int(np.searchsorted(self.terms, key, 'left'))
+        hi = int(np.searchsorted(self.terms, key + b'\xff', 'left'))
+        return lo, hi
+
+    def _fuzzy_terms(self, word: str, threshold: float = FUZZY_THRESHOLD) -> np.ndarray:
+        """Terms sharing enough trigrams with ``word``, best first."""
+        grams = _trigrams(word)
+        slots = [self._trigram_ids[gram] for gram in grams if gram in self._trigram_ids]
+        postings = [self.trigram_terms[self.trigram_offsets[i]:self.trigram_offsets[i + 1]] for i in slots]
+        if not postings:
+            return np.zeros(0, dtype=np.int32)
+        term_ids, shared = np.unique(np.concatenate(postings), return_counts=True)
+        dice = 2 * shared / (len(grams) + self.trigram_counts[term_ids])
+        keep = dice >= threshold
+        term_ids, dice = term_ids[keep], dice[keep]
+        return term_ids[np.argsort(-dice, kind='stable')[:FUZZY_MAX_TERMS]]
+
+    def _postings(self, word: str) -> int:
+        lo, hi = self._term_range(_key(word))
+        return int(self.offsets[hi] - self.offsets[lo])
+
+    def _word_scores(self, word: str, within: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """Best score of ``word`` in every document, or None when it matches none.
+
+        With ``within``, only documents where it is positive are scored.
+        """
+        key = _key(word)
+        lo, hi = self._term_range(key)
+        if lo < hi:
+            start, end = self.offsets[lo], self.offsets[hi]
+            docs, weights = self.docs[start:end], self.weights[start:end]
+            if self.terms[lo] == key:
+                weights = weights.copy()
+                weights[:self.offsets[lo + 1] - start] *= EXACT // PREFIX
+        elif len(word) >= FUZZY_MIN_LENGTH and len(term_ids := self._fuzzy_terms(word)):
+            positions = np.concatenate([np.arange(self.offsets[t], self.offsets[t + 1]) for t in term_ids.tolist()])
+            docs, weights = self.docs[positions], self.weights[positions] // PREFIX * FUZZY
+        else:
+            return None
+        if within is not None:
+            keep = within[docs] > 0
+            docs, weights = docs[keep], weights[keep]
+        scores = np.zeros(self.doc_count, dtype=np.uint8)
+        np.maximum.at(scores, docs, weights)
+        return scores
+
+    def _doc_range(self, kind: Optional[str]) -> Tuple[int, int]:
+        if kind == 'course':
+            return 0, len(self.courses)
+        if kind == 'student':
+            return len(self.courses), self.doc_count
+        return 0, self.doc_count
+
+    def search(self, query: SearchQuery) -> Dict:
+        """One page of the documents matching every word of the query, best first."""
+        total = None
+        # Rarest word first: the others are only looked up in the documents it matched
+        for word in sorted(dict.fromkeys(tokenize(query.text)), key=self._postings):
+            scores = self._word_scores(word, total)
+            if scores is None:
+                return {'total': 0, 'results': []}
+            if total is None:
+                total = scores.astype(np.uint16)
+            else:
+                total += scores
+                total[scores == 0] = 0
+        if total is None:
+            return {'total': 0, 'results': []}
+
+        lo, hi = self._doc_range(query.kind)
+        window = total[lo:hi]
+        # Walk down the scores present until the page is full
+        page = []
+        skip, needed = query.offset, query.limit
+        score = int(window.max(initial=0))
+        while score and needed:
+            docs = np.flatnonzero(window == score)
+            page.extend(self.result(doc, score) for doc in (docs[skip:skip + needed] + lo).tolist())
+            skip, needed = max(0, skip - len(docs)), query.limit - len(page)
+            score = int(window.max(where=window < score, initial=0))
+        return {'total': int(np.count_nonzero(window)), 'results': page}
+
+    def result(self, doc: int, score: int) -> Dict:
+        if doc < len(self.courses):
+            course = self.courses[doc]
+            return {'type': 'course', 'Course_Code': course['Course_Code'], 'Course_Name': course['Course_Name'],
+                    'Department': course['Department'], 'score': score}
+        row = int(self.student_rows[doc - len(self.courses)])
+        return {'type': 'student', 'Student_ID': self.students.ids[row], 'Name': self.students.name[row],
+                'Department': self.students.department[row], 'score': score}
+
+    def _name_terms(self, word: str) -> List[int]:
+        """Terms a message word stands for: itself, hyphenated words it starts, or its closest spelling."""
+        key = _key(word)
+        lo, hi = self._term_range(key)
+        term_ids = [lo] if lo < hi and self.terms[lo] == key else []
+        term_ids.extend(range(*self._term_range(key + b'-')))
+        if not term_ids and len(word) >= FUZZY_MIN_LENGTH:
+            term_ids = self._fuzzy_terms(word, MENTION_FUZZY_THRESHOLD)[:1].tolist()
+        return term_ids
+
+    def mentioned_courses(self, message: str, limit: int = 5) -> List[str]:
+        """Codes of the courses whose names ``message`` mentions, best match first.
+
+        Words of the message (stopwords aside) match course name words whole
+        or, when misspelt, by trigrams. Each name word weighs its inverse
+        document frequency over the course names, so "structures" says more
+        than "data". A course is mentioned when the message has at least
+        half of its name's weight, or a word that names at most
+        MENTION_MAX_COURSES courses. A course is dropped when a better match
+        contains every word it matched ("data mining" is not also Data
+        Structures).
+        """
+        term_ids = set()
+        for word in index_terms(message):
+            if word not in STOPWORDS:
+                term_ids.update(self._name_terms(word))
+        scores = np.zeros(len(self.courses))
+        matched: Dict[int, set] = {}
+        distinctive = set()
+        name_field = FIELDS.index('Course_Name')
+        for term_id in sorted(term_ids):
+            start, end = self.offsets[term_id], self.offsets[term_id + 1]
+            docs = self.docs[start:end][self.fields[start:end] == name_field]
+            if not len(docs):
+                continue
+            scores[docs] += _idf(len(self.courses), len(docs))
+            for doc in docs.tolist():
+                matched.setdefault(doc, set()).add(term_id)
+            if len(docs) <= MENTION_MAX_COURSES:
+                distinctive.update(docs.tolist())
+
+        coverage = scores / np.maximum(self.name_weights, 1e-9)
+        candidates = sorted((doc for doc in matched if coverage[doc] >= MENTION_THRESHOLD or doc in distinctive),
+                            key=lambda doc: (-scores[doc], -coverage[doc], doc))
+        mentioned = []
+        for doc in candidates:
+            if not any(scores[best] > scores[doc] and matched[doc] <= matched[best] for best in mentioned):
+                mentioned.append(doc)
+        return [self.courses[doc]['Course_Code'] for doc in mentioned[:limit]]
+
+    def nbytes(self) -> int:
+        return int(sum(array.nbytes for array in self.arrays().values()) + self.weights.nbytes)
+
+if __name__ == '__main__':
+    from data_store import DataSnapshot
+    from storage import read_data_files
+
+    parser = argparse.ArgumentParser(description='Build the search index of a dataset and time queries against it.')
+    parser.add_argument('queries', nargs='*', default=['data', 'data str', 'student 4', 'fa21-bscs-00', 'algoritm'])
+    parser.add_argument('--data', help='directory with student_data.csv, course_data.csv and enrollment_data.csv')
+    parser.add_argument('--type', choices=KINDS)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+    paths = [os.path.join(args.data, name) for name in ('student_data.csv', 'course_data.csv', 'enrollment_data.csv')] \
+        if args.data else []
+
+    snapshot = DataSnapshot(*read_data_files(*paths), 1)
+    start = time.perf_counter()
+    index = SearchIndex.build(snapshot.course_df.to_dict('records'), snapshot.students_by_id)
+    print(f"indexed {index.doc_count} documents, {len(index.terms)} terms, {len(index.docs)} postings "
+          f"in {time.perf_counter() - start:.2f}s ({index.nbytes() / 1e6:.1f} MB)")
+    for text in args.queries:
+        query = SearchQuery(text, args.type)
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            page = index.search(query)
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        top = ', '.join(str(r.get('Course_Code') or r.get('Student_ID')) for r in page['results'][:3])
+        print(f"{text!r:<18}{page['total']:>8} matches  median {timings[len(timings) // 2] * 1000:.3f} ms  "
+              f"p99 {timings[int(len(timings) * 0.99)] * 1000:.3f} ms  {top}")
@@ -0,0 +1,184 @@
+"""Course seat capacities, cohort seat allocation and single seat reservations.
+
+A course's capacity is its ``Capacity`` catalog column when the catalog
+has one, otherwise DEFAULT_CAPACITY (env PORTAL_COURSE_CAPACITY). Seats
+taken are the course's Enrollment_Count.
+
+``allocate`` assigns seats to a whole cohort in one pass over the students'
+ranked recommendations, as a draft: a heap ordered by (round, priority)
+pops the highest-priority student of the lowest round, who takes their best
+remaining course with a free seat and goes back in the heap for the next
+round. Everyone gets a first course before anyone gets a second, and
+within a round higher CGPA (then more completed courses) picks first.
+
+``reserve`` enrolls one student through the data store, whose backend's
+reserve_seats is the atomic capacity check; the store then updates its
+snapshot incrementally (DataStore.reserve_seats).
+"""
+import heapq
+import os
+from typing import Dict, List
+
+from planner import MAX_CREDIT_HOURS, credit_hours
+from prereq_graph import split_codes
+from storage import ALREADY_ENROLLED, FULL
+
+DEFAULT_CAPACITY = int(os.environ.get('PORTAL_COURSE_CAPACITY') or 250)
+
+# reserve() outcomes besides the storage ones
+UNKNOWN_STUDENT = 'unknown_student'
+UNKNOWN_COURSE = 'unknown_course'
+COMPLETED = 'completed'
+NOT_ELIGIBLE = 'not_eligible'
+
+
+def course_capacity(course: Dict) -> int:
+    value = course.get('Capacity')
+    try:
+        capacity = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_CAPACITY
+    return capacity if capacity >= 0 else DEFAULT_CAPACITY
+
+
+class SeatMap:
+    """Capacity and seats taken per catalog course of one snapshot."""
+
+    def __init__(self, capacity: Dict[str, int], taken: Dict[str, int]):
+        self.capacity = capacity
+        self.taken = taken
+
+    @classmethod
+    def from_snapshot(cls, snapshot) -> 'SeatMap':
+        capacity, taken = {}, {}
+        for code, course in snapshot.courses_by_code.items():
+            capacity[code] = course_capacity(course)
+            enrollment = snapshot.enrollments_by_code.get(code)
+            taken[code] = int(enrollment['Enrollment_Count']) if enrollment is not None else 0
+        return cls(capacity, taken)
+
+    def with_taken(self, taken: Dict[str, int]) -> 'SeatMap':
+        """Copy with the seats taken of the courses in ``taken`` replaced (capacities are shared)."""
+        updated = dict(self.taken)
+        updated.update((code, count) for code, count in taken.items() if code in self.capacity)
+        return SeatMap(self.capacity, updated)
+
+    def available(self, course_code: str) -> int:
+        return max(0, self.capacity.get(course_code, 0) - self.taken.get(course_code, 0))
+
+
+def seat_map(snapshot) -> SeatMap:
+    return snapshot.derived('seat_map', lambda: SeatMap.from_snapshot(snapshot))
+
+
+def _priority(snapshot, student_id: str):
+    student = snapshot.students_by_id[student_id]
+    return -float(student['CGPA']), -len(split_codes(student['Completed_Courses'])), student_id
+
+
+def allocate(snapshot, ranked: Dict[str, List[Dict]], max_credits: int = MAX_CREDIT_HOURS) -> Dict:
+    """Allocate free seats to the students of ``ranked`` (student ID -> recommendations, best first).
+
+    Courses a student is already enrolled in are skipped and their credit
+    hours count towards ``max_credits``. Returns per-student assignments,
+    per-course seat usage and totals; nothing is written.
+    """
+    seats = seat_map(snapshot)
+    available = {code: seats.available(code) for code in seats.capacity}
+    students: Dict[str, Dict] = {}
+    enrolled: Dict[str, set] = {}
+    position: Dict[str, int] = {}
+    heap = []
+    for student_id, courses in ranked.items():
+        if not isinstance(courses, list):
+            students[student_id] = courses
+            continue
+        schedule = snapshot.enrollment_index.schedule(student_id)
+        enrolled[student_id] = set(schedule)
+        credits = sum(credit_hours(snapshot.courses_by_code[code]['Credit_Hours'])
+                      for code in schedule if code in snapshot.courses_by_code)
+        students[student_id] = {'assigned': [], 'credit_hours': credits, 'full': []}
+        position[student_id] = 0
+        heap.append((0, _priority(snapshot, student_id)))
+    heapq.heapify(heap)
+
+    assigned_count = 0
+    while heap:
+        round_number, priority = heapq.heappop(heap)
+        student_id = priority[-1]
+        result = students[student_id]
+        courses = ranked[student_id]
+        i = position[student_id]
+        picked = None
+        while i < len(courses) and picked is None:
+            code = courses[i]['Course_Code']
+            hours = credit_hours(courses[i]['Credit_Hours'])
+            i += 1
+            if code in enrolled[student_id] or result['credit_hours'] + hours > max_credits:
+                continue
+            if available.get(code, 0) <= 0:
+                result['full'].append(code)
+                continue
+            picked = code
+            available[code] -= 1
+            result['assigned'].append(code)
+            result['credit_hours'] += hours
+            assigned_count += 1
+        position[student_id] = i
+        if picked is not None and i < len(courses) and result['credit_hours'] < max_credits:
+            heapq.heappush(heap, (round_number + 1, priority))
+
+    courses = {}
+    for code, capacity in seats.capacity.items():
+        filled = seats.available(code) - available[code]
+        if filled:
+            courses[code] = {'capacity': capacity, 'taken': seats.taken[code] + filled,
+                             'assigned': filled, 'available': available[code]}
+    return {
+        'students': students,
+        'courses': courses,
+        'seats_assigned': assigned_count,
+        'students_placed': sum(1 for s in students.values() if s.get('assigned'))
+    }
+
+
+def reserve(snapshot, store, student_id: str, course_code: str) -> Dict:
+    """Enroll one student in one course; the result's 'status' is RESERVED or why not.
+
+    Requests the snapshot already rejects (unknown IDs, completed or
+    ineligible courses, current enrollments, full courses) never reach
+    the storage write lock.
+    """
+    student = snapshot.students_by_id.get(student_id)
+    if student is None:
+        return {'status': UNKNOWN_STUDENT}
+    course = snapshot.courses_by_code.get(course_code)
+    if course is None:
+        return {'status': UNKNOWN_COURSE}
+    graph = snapshot.prereq_graph
+    completed_mask = graph.completed_mask(student_id)
+    if graph.has_completed(completed_mask, course_code):
+        return {'status': COMPLETED}
+    if not graph.is_eligible(course_code, completed_mask):
+        missing = [code for code in split_codes(course['Prerequisites']) if not graph.has_completed(completed_mask, code)]
+        return {'status': NOT_ELIGIBLE, 'missing_prerequisites': missing}
+    if course_code in snapshot.enrollment_index.schedule(student_id):
+        return {'status': ALREADY_ENROLLED}
+    seats = seat_map(snapshot)
+    if seats.available(course_code) <= 0:
+        return {'status': FULL, 'capacity': seats.capacity[course_code]}
+
+    _, (status,) = store.reserve_seats([(student_id, course_code)], {course_code: seats.capacity[course_code]})
+    return {'status': status, 'capacity': seats.capacity[course_code]}
+
+
+def reserve_allocation(snapshot, store, allocation: Dict) -> Dict[str, List[str]]:
+    """Write an ``allocate`` result in one storage update (``store`` is the DataStore); returns the statuses per student."""
+    seats = seat_map(snapshot)
+    pairs = [(student_id, code) for student_id, result in allocation['students'].items()
+             for code in result.get('assigned', ())]
+    statuses = store.reserve_seats(pairs, {code: seats.capacity[code] for _, code in pairs})[1] if pairs else []
+    by_student: Dict[str, List[str]] = {}
+    for (student_id, _), status in zip(pairs, statuses):
+        by_student.setdefault(student_id, []).append(status)
+    return by_student
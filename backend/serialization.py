@@ -0,0 +1,97 @@
+"""JSON serialization shared by every API response.
+
+Payloads are built from the in-memory records as is; NumPy scalars and
+arrays are converted by the encoder itself instead of deep-copying dicts
+beforehand. orjson is used when installed (it is optional) and the standard
+library encoder otherwise. Keys are sorted in both cases, as jsonify does,
+so identical payloads always produce identical bytes (and ETags). NaN and
+infinite floats (a missing CGPA) are written as null by both encoders, as
+JSON has no value for them.
+"""
+import json
+import math
+
+import numpy as np
+from flask import Response, has_request_context, request
+
+from metrics import metrics
+
+try:
+    import orjson
+except ImportError:  # optional fast encoder
+    orjson = None
+
+JSON_MIMETYPE = 'application/json'
+
+
+def to_native(obj):
+    """Convert the non-JSON types found in portal data to native Python values."""
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        value = float(obj)
+        return value if math.isfinite(value) else None
+    if isinstance(obj, np.bool_):
+        return bool(obj)
+    if isinstance(obj, np.ndarray):
+        return finite(obj.tolist())
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def finite(obj):
+    """``obj`` with NaN and infinite floats in nested dicts and lists replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [finite(value) for value in obj]
+    if isinstance(obj, np.ndarray):
+        return to_native(obj)
+    return obj
+
+
+class JSONEncoder(json.JSONEncoder):
+    """Standard library encoder with the same conversions (used by jsonify)."""
+
+    def default(self, obj):
+        try:
+            return to_native(obj)
+        except TypeError:
+            return super().default(obj)
+
+    def iterencode(self, o, _one_shot=False):
+        # Floats never reach default(), so NaN is replaced beforehand
+        return super().iterencode(finite(o), _one_shot)
+
+
+def _json_dumps(obj, sort_keys: bool = True) -> bytes:
+    try:
+        text = json.dumps(obj, default=to_native, sort_keys=sort_keys, separators=(',', ':'), allow_nan=False)
+    except ValueError:
+        # Floats never reach default(): copy the payload without NaN only when it has some
+        text = json.dumps(finite(obj), default=to_native, sort_keys=sort_keys, separators=(',', ':'))
+    return text.encode()
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj, sort_keys: bool = True) -> bytes:
+        option = _ORJSON_OPTIONS | orjson.OPT_SORT_KEYS if sort_keys else _ORJSON_OPTIONS
+        return orjson.dumps(obj, default=to_native, option=option)
+else:
+    dumps = _json_dumps
+
+
+def json_response(payload, status: int = 200) -> Response:
+    endpoint = request.endpoint if has_request_context() else None
+    with metrics.timer('portal_serialization_seconds', endpoint=endpoint or 'none'):
+        body = dumps(payload)
+    return Response(body, status=status, mimetype=JSON_MIMETYPE)
+
+
+def encoder_name() -> str:
+    return 'orjson' if orjson is not None else 'json'
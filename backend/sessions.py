@@ -0,0 +1,188 @@
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from serialization import dumps
+from storage import DATA_DIR
+
+SESSION_DB_FILE = os.path.join(DATA_DIR, 'sessions.db')
+
+# Defaults: sessions kept at most, and idle seconds before a session expires
+SESSION_MAX_ENTRIES = 10000
+SESSION_TTL = 1800.0
+
+# Messages of history kept per conversation on the server
+HISTORY_LIMIT = 20
+
+
+def new_session_id() -> str:
+    return secrets.token_urlsafe(16)
+
+
+class SessionStore:
+    """Interface of a chatbot conversation store.
+
+    Sessions are JSON-compatible dicts keyed by session ID. A session
+    expires ``ttl`` seconds after it was last written and at most
+    ``maxsize`` sessions are kept, the least recently used being evicted
+    first. Implementations must be safe to call from several threads.
+    """
+
+    name = 'base'
+
+    def __init__(self, maxsize: int = SESSION_MAX_ENTRIES, ttl: float = SESSION_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def put(self, session_id: str, state: Dict[str, Any]):
+        raise NotImplementedError
+
+    def delete(self, session_id: str):
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+class MemorySessionStore(SessionStore):
+    """Sessions in an LRU dict of this process (the default backend)."""
+
+    name = 'memory'
+
+    def __init__(self, maxsize: int = SESSION_MAX_ENTRIES, ttl: float = SESSION_TTL):
+        super().__init__(maxsize, ttl)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            state, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[session_id]
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(session_id)
+            return state
+
+    def put(self, session_id: str, state: Dict[str, Any]):
+        with self._lock:
+            self._entries[session_id] = (state, time.monotonic() + self.ttl)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, session_id: str):
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'backend': self.name,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
+
+
+SESSION_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions(updated_at);
+'''
+
+
+class SqliteSessionStore(SessionStore):
+    """Sessions in a SQLite database shared by every worker process.
+
+    Expired rows are ignored on read and deleted, together with the least
+    recently written rows above ``maxsize``, every ``prune_every`` writes.
+    Connections are per process and thread, as in storage.SqliteStorage.
+    """
+
+    name = 'sqlite'
+
+    def __init__(self, path: str = SESSION_DB_FILE, maxsize: int = SESSION_MAX_ENTRIES,
+                 ttl: float = SESSION_TTL, prune_every: int = 100, timeout: float = 30.0):
+        super().__init__(maxsize, ttl)
+        self.path = path
+        self.prune_every = prune_every
+        self.timeout = timeout
+        self._local = threading.local()
+        self._writes = 0
+        self._lock = threading.Lock()
+        self.connection().executescript(SESSION_SCHEMA)
+
+    def connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        row = self.connection().execute('SELECT state FROM sessions WHERE session_id = ? AND updated_at >= ?',
+                                        (session_id, time.time() - self.ttl)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, session_id: str, state: Dict[str, Any]):
+        conn = self.connection()
+        conn.execute('INSERT OR REPLACE INTO sessions (session_id, state, updated_at) VALUES (?, ?, ?)',
+                     (session_id, dumps(state, sort_keys=False).decode(), time.time()))
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % self.prune_every == 0
+        if prune:
+            self.prune()
+
+    def prune(self):
+        conn = self.connection()
+        conn.execute('DELETE FROM sessions WHERE updated_at < ?', (time.time() - self.ttl,))
+        conn.execute('DELETE FROM sessions WHERE session_id IN (SELECT session_id FROM sessions '
+                     'ORDER BY updated_at DESC LIMIT -1 OFFSET ?)', (self.maxsize,))
+
+    def delete(self, session_id: str):
+        self.connection().execute('DELETE FROM sessions WHERE session_id = ?', (session_id,))
+
+    def stats(self) -> Dict[str, Any]:
+        (size,) = self.connection().execute('SELECT COUNT(*) FROM sessions WHERE updated_at >= ?',
+                                            (time.time() - self.ttl,)).fetchone()
+        return {
+            'backend': self.name,
+            'size': size,
+            'maxsize': self.maxsize,
+            'ttl': self.ttl,
+            'path': self.path
+        }
+
+
+def create_session_store(kind: Optional[str] = None) -> SessionStore:
+    """Backend selected by PORTAL_SESSIONS ('memory' or 'sqlite'; the database path is PORTAL_SESSION_DB)."""
+    kind = (kind or os.environ.get('PORTAL_SESSIONS') or 'memory').lower()
+    if kind == 'sqlite':
+        return SqliteSessionStore(os.environ.get('PORTAL_SESSION_DB') or SESSION_DB_FILE)
+    if kind == 'memory':
+        return MemorySessionStore()
+    raise ValueError(f"Unknown session backend: {kind}")
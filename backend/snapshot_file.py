@@ -0,0 +1,230 @@
+"""Compiled binary snapshots of the portal data.
+
+Parsing the CSV files and building the indexes takes seconds at 100k
+students, and every worker process used to repeat it. ``write`` compiles a
+loaded DataSnapshot into one file (data/snapshot.bin, env PORTAL_SNAPSHOT)
+and ``read`` maps it back without parsing any CSV:
+
+    preamble  magic, format version, header length
+    header    JSON: source signature, columns, course codes, array table
+    arrays    64-byte aligned: the columnar student table, the enrollment
+              index, the search index and the course and enrollment
+              records (as JSON bytes)
+
+The arrays are views of a read-only mmap of the file, so every process
+reading the same file shares one copy through the page cache. A file
+replaced with os.replace does not disturb processes still mapping the old
+one. The header records the storage backend's signature at compile time.
+DataStore uses the file only while the backend still reports that
+signature, and otherwise loads from the backend as before.
+
+Compile the configured storage backend (the CSV files by default):
+
+    python -m snapshot_file [--out data/snapshot.bin]
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from columnar import CategoricalColumn, RaggedArray, StringColumn, StudentTable
+from enrollment_index import EnrollmentIndex
+from prereq_graph import PrerequisiteGraph
+from search import SEARCH_ARRAYS
+from serialization import to_native
+from storage import DATA_DIR, create_storage
+
+SNAPSHOT_FILE = os.path.join(DATA_DIR, 'snapshot.bin')
+
+MAGIC = b'PORTALSNAP'
+# Bump when the layout changes; files of another format are ignored
+FORMAT_VERSION = 3
+ALIGNMENT = 64
+
+_PREAMBLE = struct.Struct('<10sIQ')
+
+
+class SnapshotFormatError(ValueError):
+    """Not a compiled snapshot, or one written in another format version."""
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _signature(signature: Tuple) -> list:
+    # The header stores it as JSON, which turns tuples into lists
+    return json.loads(json.dumps(signature))
+
+
+def _arrays(snapshot) -> Dict[str, np.ndarray]:
+    table = snapshot.students_by_id
+    index = snapshot.enrollment_index.compacted()
+    ids = StringColumn.from_values(table.ids)
+    tables = json.dumps({'courses': snapshot.course_df.to_dict('records'),
+                         'enrollments': snapshot.enrollment_records}, default=to_native)
+    arrays = {
+        'id_offsets': ids.data.offsets,
+        'id_values': ids.data.values,
+        'name_offsets': table.name.data.offsets,
+        'name_values': table.name.data.values,
+        'name_missing': table.name.missing,
+        'password_offsets': table.password.data.offsets,
+        'password_values': table.password.data.values,
+        'password_missing': table.password.missing,
+        'department_codes': table.department.codes,
+        'cgpa': table.cgpa,
+        'completed_offsets': table.completed.offsets,
+        'completed_values': table.completed.values,
+        'course_offsets': index.course_offsets,
+        'course_students': index.course_students,
+        'student_offsets': index.student_offsets,
+        'student_courses': index.student_courses,
+        'tables': np.frombuffer(tables.encode('utf-8'), dtype=np.uint8)
+    }
+    arrays.update((f'search_{name}', array) for name, array in snapshot.search_index.arrays().items())
+    return arrays
+
+
+def write(snapshot, path: str = SNAPSHOT_FILE, signature: Tuple = ()) -> int:
+    """Compile ``snapshot`` to ``path`` (atomically replaced); returns the file size."""
+    table = snapshot.students_by_id
+    arrays = _arrays(snapshot)
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        offset = _align(offset)
+        layout[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        offset += array.nbytes
+    unique_students = len(table.index)
+    header = json.dumps({
+        'format': FORMAT_VERSION,
+        'built_at': time.time(),
+        'signature': _signature(signature),
+        'student_columns': table.columns,
+        'departments': table.department.categories,
+        'extra_columns': table.extra,
+        'codes': snapshot.prereq_graph.codes,
+        'course_columns': list(snapshot.course_df.columns),
+        'enrollment_columns': snapshot.enrollment_columns,
+        # Roster entries for students missing from the student table
+        'roster_only_students': snapshot.enrollment_index.student_codes[unique_students:],
+        'arrays': layout
+    }, default=to_native).encode('utf-8')
+    data_start = _align(_PREAMBLE.size + len(header))
+
+    temp_file = path + '.tmp'
+    with open(temp_file, 'wb') as f:
+        f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)))
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name]['offset'])
+            f.write(np.ascontiguousarray(array).tobytes())
+        size = f.tell()
+    os.replace(temp_file, path)
+    return size
+
+
+def read_header(f) -> Tuple[Dict, int]:
+    """The header of an open snapshot file and the file offset its arrays start at."""
+    preamble = f.read(_PREAMBLE.size)
+    if len(preamble) < _PREAMBLE.size:
+        raise SnapshotFormatError('file is truncated')
+    magic, version, length = _PREAMBLE.unpack(preamble)
+    if magic != MAGIC:
+        raise SnapshotFormatError('not a compiled snapshot')
+    if version != FORMAT_VERSION:
+        raise SnapshotFormatError(f'format {version}, expected {FORMAT_VERSION}')
+    header = json.loads(f.read(length))
+    return header, _align(_PREAMBLE.size + length)
+
+
+class CompiledSnapshot:
+    """The parts of a DataSnapshot read back from a snapshot file."""
+
+    def __init__(self, header: Dict, course_df: pd.DataFrame, students: StudentTable, graph: PrerequisiteGraph,
+                 enrollment_records: list, enrollment_index: EnrollmentIndex, search_arrays: Dict[str, np.ndarray]):
+        self.header = header
+        self.course_df = course_df
+        self.students = students
+        self.graph = graph
+        self.enrollment_columns = header['enrollment_columns']
+        self.enrollment_records = enrollment_records
+        self.enrollment_index = enrollment_index
+        # Arrays of the SearchIndex (search.py), which needs the snapshot's course records
+        self.search_arrays = search_arrays
+
+
+def read(path: str = SNAPSHOT_FILE, signature: Optional[Tuple] = None) -> Optional[CompiledSnapshot]:
+    """Map a snapshot file; None when ``signature`` is given and the file was compiled from other data.
+
+    Raises OSError or SnapshotFormatError for a missing or unreadable file.
+    """
+    with open(path, 'rb') as f:
+        header, data_start = read_header(f)
+        if signature is not None and header['signature'] != _signature(signature):
+            return None
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    arrays = {}
+    for name, spec in header['arrays'].items():
+        count = int(np.prod(spec['shape']))
+        if count == 0:
+            arrays[name] = np.zeros(spec['shape'], dtype=spec['dtype'])
+        else:
+            arrays[name] = np.frombuffer(buffer, dtype=spec['dtype'], count=count,
+                                         offset=data_start + spec['offset']).reshape(spec['shape'])
+
+    tables = json.loads(arrays['tables'].tobytes())
+    course_df = pd.DataFrame(tables['courses'], columns=header['course_columns'])
+    graph = PrerequisiteGraph.build(course_df.to_dict('records'))
+    for code in header['codes']:
+        graph.intern(code)
+    if graph.codes != header['codes']:
+        raise SnapshotFormatError('course IDs do not match the compiled catalog')
+
+    count = len(arrays['id_offsets']) - 1
+    ids = StringColumn(RaggedArray(arrays['id_offsets'], arrays['id_values']), np.zeros(count, dtype=bool)).tolist()
+    students = StudentTable(
+        header['student_columns'], ids,
+        StringColumn(RaggedArray(arrays['name_offsets'], arrays['name_values']), arrays['name_missing']),
+        CategoricalColumn(arrays['department_codes'], [sys.intern(c) for c in header['departments']]),
+        arrays['cgpa'],
+        RaggedArray(arrays['completed_offsets'], arrays['completed_values']),
+        StringColumn(RaggedArray(arrays['password_offsets'], arrays['password_values']), arrays['password_missing']),
+        header['extra_columns'], graph.codes)
+    graph.students = students
+
+    student_codes = list(students.index) + header['roster_only_students']
+    if len(student_codes) != len(arrays['student_offsets']) - 1:
+        raise SnapshotFormatError('enrollment index does not match the student table')
+    index = EnrollmentIndex(graph, student_codes, {code: sid for sid, code in enumerate(student_codes)},
+                            arrays['course_offsets'], arrays['course_students'],
+                            arrays['student_offsets'], arrays['student_courses'])
+    search_arrays = {name: arrays[f'search_{name}'] for name in SEARCH_ARRAYS}
+    return CompiledSnapshot(header, course_df, students, graph, tables['enrollments'], index, search_arrays)
+
+
+if __name__ == '__main__':
+    from data_store import DataSnapshot
+
+    parser = argparse.ArgumentParser(description='Compile the portal data into a binary snapshot file.')
+    parser.add_argument('--out', default=os.environ.get('PORTAL_SNAPSHOT') or SNAPSHOT_FILE)
+    args = parser.parse_args()
+
+    backend = create_storage()
+    start = time.perf_counter()
+    signature = backend.signature()
+    snapshot = DataSnapshot(*backend.load(), 1, signature)
+    loaded = time.perf_counter() - start
+    size = write(snapshot, args.out, signature)
+    print(f"Compiled {len(snapshot.students_by_id.ids)} students, {len(snapshot.course_df)} courses and "
+          f"{len(snapshot.enrollment_records)} enrollments from {backend.name} ({loaded:.2f}s) "
+          f"into {args.out} ({size} bytes, {time.perf_counter() - start - loaded:.2f}s)")
@@ -0,0 +1,330 @@
+import bisect
+import heapq
+import math
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _quantile(sorted_values: List[float], q: float) -> float:
+    # Linear interpolation, as pandas' describe() does
+    if not sorted_values:
+        return float('nan')
+    position = (len(sorted_values) - 1) * q
+    lower = int(math.floor(position))
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+class PortalStats:
+    """Dashboard and analysis aggregates, materialized once per data snapshot.
+
+    Aggregates are kept as running counts and sums (plus Welford's running
+    mean and squared deviations for the CGPA spread, sorted lists for
+    quartiles and the maximum enrollment, and a heap selection for the top
+    courses) instead of recomputing value_counts/groupby over whole tables.
+    A single student, course or enrollment change costs O(1) for the
+    counts and an O(log n) search plus an O(n) list shift (a memmove) to
+    keep a sorted list in order. The rendered payloads are cached until the
+    next change.
+    """
+
+    TOP_COURSES = 5
+
+    def __init__(self):
+        self._lock = threading.RLock()
+
+        self.student_count = 0
+        self.students_by_department = Counter()
+        self.cgpa_sum_by_department = defaultdict(float)
+        self.cgpa_count_by_department = Counter()
+        self._cgpa_values: List[float] = []
+        # Welford's running mean and sum of squared deviations, over _cgpa_count values
+        self._cgpa_count = 0
+        self._cgpa_mean = 0.0
+        self._cgpa_m2 = 0.0
+
+        self.course_count = 0
+        self.courses_by_department = Counter()
+        self.courses_by_difficulty = Counter()
+
+        self.enrollment_rows = 0
+        self.enrollment_total = 0
+        self._enrollments: Dict[str, Dict] = {}
+        self._enrollment_values: List[int] = []
+        self._next_order = 0
+        self._top_courses: Optional[List[Dict]] = None
+
+        self._dashboard: Optional[Dict] = None
+        self._analysis: Optional[Dict] = None
+
+    @classmethod
+    def from_snapshot(cls, snapshot) -> 'PortalStats':
+        stats = cls()
+        for record in snapshot.students_by_id.rows():
+            stats.add_student(record)
+        for record in snapshot.course_df.to_dict('records'):
+            stats.add_course(record)
+        for record in snapshot.enrollment_records:
+            stats.add_enrollment(record)
+        return stats
+
+    def copy(self) -> 'PortalStats':
+        """Independent copy, to be updated for the next snapshot while this one stays in use."""
+        with self._lock:
+            stats = PortalStats()
+            stats.student_count = self.student_count
+            stats.students_by_department = Counter(self.students_by_department)
+            stats.cgpa_sum_by_department = defaultdict(float, self.cgpa_sum_by_department)
+            stats.cgpa_count_by_department = Counter(self.cgpa_count_by_department)
+            stats._cgpa_values = list(self._cgpa_values)
+            stats._cgpa_count = self._cgpa_count
+            stats._cgpa_mean = self._cgpa_mean
+            stats._cgpa_m2 = self._cgpa_m2
+            stats.course_count = self.course_count
+            stats.courses_by_department = Counter(self.courses_by_department)
+            stats.courses_by_difficulty = Counter(self.courses_by_difficulty)
+            stats.enrollment_rows = self.enrollment_rows
+            stats.enrollment_total = self.enrollment_total
+            stats._enrollments = {code: dict(entry) for code, entry in self._enrollments.items()}
+            stats._enrollment_values = list(self._enrollment_values)
+            stats._next_order = self._next_order
+            # The top list must reference the copied entries
+            stats._top_courses = None
+            return stats
+
+    def _invalidate(self):
+        self._dashboard = None
+        self._analysis = None
+
+    # Students
+
+    def add_student(self, record: Dict):
+        self._change_student(record, 1)
+
+    def remove_student(self, record: Dict):
+        self._change_student(record, -1)
+
+    def update_student(self, old: Dict, new: Dict):
+        with self._lock:
+            self._change_student(old, -1)
+            self._change_student(new, 1)
+
+    def _change_student(self, record: Dict, sign: int):
+        with self._lock:
+            self.student_count += sign
+            department = record.get('Department')
+            cgpa = record.get('CGPA')
+            if not _is_missing(department):
+                self.students_by_department[department] += sign
+                if self.students_by_department[department] <= 0:
+                    del self.students_by_department[department]
+            if not _is_missing(cgpa):
+                cgpa = float(cgpa)
+                if sign > 0:
+                    bisect.insort(self._cgpa_values, cgpa)
+                else:
+                    index = bisect.bisect_left(self._cgpa_values, cgpa)
+                    if index < len(self._cgpa_values) and self._cgpa_values[index] == cgpa:
+                        del self._cgpa_values[index]
+                self._change_cgpa_spread(cgpa, sign)
+                if not _is_missing(department):
+                    self.cgpa_sum_by_department[department] += sign * cgpa
+                    self.cgpa_count_by_department[department] += sign
+                    if self.cgpa_count_by_department[department] <= 0:
+                        del self.cgpa_count_by_department[department]
+                        del self.cgpa_sum_by_department[department]
+            self._invalidate()
+
+    def _change_cgpa_spread(self, cgpa: float, sign: int):
+        # Welford's update (and its inverse for a removal); unlike a running
+        # sum of squares it does not cancel catastrophically
+        if sign > 0:
+            self._cgpa_count += 1
+            delta = cgpa - self._cgpa_mean
+            self._cgpa_mean += delta / self._cgpa_count
+            self._cgpa_m2 += delta * (cgpa - self._cgpa_mean)
+        elif self._cgpa_count <= 1:
+            self._cgpa_count, self._cgpa_mean, self._cgpa_m2 = 0, 0.0, 0.0
+        else:
+            self._cgpa_count -= 1
+            delta = cgpa - self._cgpa_mean
+            self._cgpa_mean -= delta / self._cgpa_count
+            self._cgpa_m2 = max(self._cgpa_m2 - delta * (cgpa - self._cgpa_mean), 0.0)
+
+    # Courses
+
+    def add_course(self, record: Dict):
+        self._change_course(record, 1)
+
+    def remove_course(self, record: Dict):
+        self._change_course(record, -1)
+
+    def update_course(self, old: Dict, new: Dict):
+        with self._lock:
+            self._change_course(old, -1)
+            self._change_course(new, 1)
+
+    def _change_course(self, record: Dict, sign: int):
+        with self._lock:
+            self.course_count += sign
+            for counter, key in ((self.courses_by_department, record.get('Department')),
+                                 (self.courses_by_difficulty, record.get('Difficulty'))):
+                if _is_missing(key):
+                    continue
+                counter[key] += sign
+                if counter[key] <= 0:
+                    del counter[key]
+            self._invalidate()
+
+    # Enrollments (keyed by Course_Code; duplicate rows for a course are merged)
+
+    def add_enrollment(self, record: Dict):
+        with self._lock:
+            code = record['Course_Code']
+            count = int(record['Enrollment_Count'])
+            self.enrollment_rows += 1
+            self.enrollment_total += count
+            existing = self._enrollments.get(code)
+            if existing is not None:
+                self._set_enrollment_count(existing, existing['Enrollment_Count'] + count)
+            else:
+                entry = {
+                    'Course_Code': code,
+                    'Course_Name': record['Course_Name'],
+                    'Enrollment_Count': count,
+                    'order': self._next_order
+                }
+                self._next_order += 1
+                self._enrollments[code] = entry
+                bisect.insort(self._enrollment_values, count)
+                self._touch_top(entry)
+            self._invalidate()
+
+    def remove_enrollment(self, record: Dict):
+        with self._lock:
+            entry = self._enrollments.pop(record['Course_Code'], None)
+            if entry is None:
+                return
+            self.enrollment_rows -= 1
+            self.enrollment_total -= entry['Enrollment_Count']
+            self._remove_value(entry['Enrollment_Count'])
+            if self._top_courses is not None and any(c['Course_Code'] == entry['Course_Code'] for c in self._top_courses):
+                self._top_courses = None
+            self._invalidate()
+
+    def update_enrollment(self, record: Dict):
+        """Set a course's Enrollment_Count (and name) to the values in ``record``."""
+        with self._lock:
+            entry = self._enrollments.get(record['Course_Code'])
+            if entry is None:
+                self.add_enrollment(record)
+                return
+            count = int(record['Enrollment_Count'])
+            self.enrollment_total += count - entry['Enrollment_Count']
+            entry['Course_Name'] = record.get('Course_Name', entry['Course_Name'])
+            self._set_enrollment_count(entry, count)
+            self._invalidate()
+
+    def _set_enrollment_count(self, entry: Dict, count: int):
+        self._remove_value(entry['Enrollment_Count'])
+        bisect.insort(self._enrollment_values, count)
+        was_top = self._top_courses is not None and any(c['Course_Code'] == entry['Course_Code'] for c in self._top_courses)
+        entry['Enrollment_Count'] = count
+        if was_top:
+            self._top_courses = None
+        else:
+            self._touch_top(entry)
+
+    def _remove_value(self, count: int):
+        index = bisect.bisect_left(self._enrollment_values, count)
+        if index < len(self._enrollment_values) and self._enrollment_values[index] == count:
+            del self._enrollment_values[index]
+
+    def _touch_top(self, entry: Dict):
+        # Only rebuild the top list if the changed course could now be in it
+        if self._top_courses is None:
+            return
+        if len(self._top_courses) < self.TOP_COURSES or self._rank(entry) > self._rank(self._top_courses[-1]):
+            self._top_courses = None
+
+    @staticmethod
+    def _rank(entry: Dict):
+        # Highest count first; ties keep file order
+        return entry['Enrollment_Count'], -entry['order']
+
+    def top_courses(self) -> List[Dict]:
+        with self._lock:
+            if self._top_courses is None:
+                self._top_courses = heapq.nlargest(self.TOP_COURSES, self._enrollments.values(), key=self._rank)
+            return [
+                {
+                    'Course_Code': str(c['Course_Code']),
+                    'Course_Name': str(c['Course_Name']),
+                    'Enrollment_Count': int(c['Enrollment_Count'])
+                }
+                for c in self._top_courses
+            ]
+
+    # Payloads
+
+    def cgpa_stats(self) -> Dict[str, float]:
+        values = self._cgpa_values
+        count = len(values)
+        mean = self._cgpa_mean if count else float('nan')
+        std = math.sqrt(self._cgpa_m2 / (count - 1)) if count > 1 else float('nan')
+        return {
+            'count': float(count),
+            'mean': mean,
+            'std': std,
+            'min': values[0] if values else float('nan'),
+            '25%': _quantile(values, 0.25),
+            '50%': _quantile(values, 0.5),
+            '75%': _quantile(values, 0.75),
+            'max': values[-1] if values else float('nan')
+        }
+
+    def dashboard(self) -> Dict:
+        with self._lock:
+            if self._dashboard is None:
+                self._dashboard = {
+                    'total_students': self.student_count,
+                    'total_courses': self.course_count,
+                    'total_enrollments': self.enrollment_total,
+                    'department_stats': {str(k): int(v) for k, v in self.students_by_department.items()},
+                    'difficulty_stats': {str(k): int(v) for k, v in self.courses_by_difficulty.items()},
+                    'cgpa_by_department': {
+                        str(k): self.cgpa_sum_by_department[k] / v
+                        for k, v in self.cgpa_count_by_department.items()
+                    },
+                    'top_courses': self.top_courses()
+                }
+            return self._dashboard
+
+    def analysis(self) -> Dict:
+        with self._lock:
+            if self._analysis is None:
+                values = self._enrollment_values
+                self._analysis = {
+                    'student_stats': {
+                        'count': self.student_count,
+                        'departments': dict(self.students_by_department),
+                        'cgpa_stats': self.cgpa_stats()
+                    },
+                    'course_stats': {
+                        'count': self.course_count,
+                        'departments': dict(self.courses_by_department),
+                        'difficulty': dict(self.courses_by_difficulty)
+                    },
+                    'enrollment_stats': {
+                        'total_enrollments': self.enrollment_total,
+                        'avg_enrollment': self.enrollment_total / self.enrollment_rows if self.enrollment_rows else float('nan'),
+                        'max_enrollment': values[-1] if values else 0
+                    }
+                }
+            return self._analysis
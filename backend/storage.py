@@ -0,0 +1,545 @@
+import argparse
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data'))
+
+STUDENT_DATA_FILE = os.path.join(DATA_DIR, 'student_data.csv')
+COURSE_DATA_FILE = os.path.join(DATA_DIR, 'course_data.csv')
+ENROLLMENT_DATA_FILE = os.path.join(DATA_DIR, 'enrollment_data.csv')
+
+SQLITE_DB_FILE = os.path.join(DATA_DIR, 'portal.db')
+
+STUDENT_COLUMNS = ['Student_ID', 'Name', 'Department', 'CGPA', 'Completed_Courses', 'Password']
+COURSE_COLUMNS = ['Course_Code', 'Course_Name', 'Department', 'Prerequisites', 'Credit_Hours', 'Difficulty']
+ENROLLMENT_COLUMNS = ['Course_Code', 'Course_Name', 'Enrollment_Count', 'Students_Enrolled']
+# Catalog columns a course file may leave out (seat capacity, see seats.py)
+OPTIONAL_COURSE_COLUMNS = ['Capacity']
+
+# Outcomes of Storage.reserve_seats, one per requested (student, course) pair
+RESERVED = 'reserved'
+FULL = 'full'
+ALREADY_ENROLLED = 'already_enrolled'
+
+
+def _read_csv(path: str) -> pd.DataFrame:
+    # Read CSV files with proper handling of quotes and commas
+    df = pd.read_csv(path, quotechar='"', escapechar='\\')
+
+    # Clean column names by removing quotes
+    df.columns = [col.strip('"') for col in df.columns]
+
+    # Clean string values by removing extra quotes (non-string cells are kept as is)
+    for col in df.columns:
+        # pandas >= 3 reads text as the string dtype rather than object
+        if pd.api.types.is_string_dtype(df[col]) or df[col].dtype == object:
+            stripped = df[col].str.strip('"')
+            df[col] = stripped.fillna(df[col])
+    return df
+
+
+def read_data_files(student_file: str = STUDENT_DATA_FILE, course_file: str = COURSE_DATA_FILE,
+                    enrollment_file: str = ENROLLMENT_DATA_FILE) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Parse and clean the three CSV files. Raises on any read error."""
+    student_df = _read_csv(student_file)
+    course_df = _read_csv(course_file)
+    enrollment_df = _read_csv(enrollment_file)
+    # pandas >= 2.0 parses the catalog's literal 'None' as NaN
+    course_df['Prerequisites'] = course_df['Prerequisites'].fillna('None')
+    return student_df, course_df, enrollment_df
+
+
+def _split(value) -> List[str]:
+    if not isinstance(value, str) or value in ('', 'None'):
+        return []
+    return [code for code in value.split(',') if code]
+
+
+class Storage:
+    """Interface of a portal storage backend.
+
+    ``load`` returns the three tables as DataFrames in the CSV schema (multi-
+    valued fields as comma-joined strings) and ``signature`` is a cheap value
+    that changes whenever the stored data does; DataStore polls it to decide
+    when to reload.
+    """
+
+    name = 'base'
+
+    def load(self) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        raise NotImplementedError
+
+    def signature(self) -> Tuple:
+        raise NotImplementedError
+
+    def reserve_seats(self, reservations: Iterable[Tuple[str, str]], capacities: Dict[str, int]) -> List[str]:
+        """Enroll each (student_id, course_code) pair unless the course is at its capacity.
+
+        All pairs are applied as one atomic update, in order, and the
+        returned list holds RESERVED, FULL or ALREADY_ENROLLED per pair.
+        Enrollment_Count is the number of seats taken.
+        """
+        raise NotImplementedError
+
+    def upsert_students(self, records: Iterable[Dict]):
+        """Insert or replace students by Student_ID (full records in the CSV schema), atomically."""
+        raise NotImplementedError
+
+    def upsert_courses(self, records: Iterable[Dict]):
+        raise NotImplementedError
+
+    def upsert_enrollments(self, records: Iterable[Dict]):
+        raise NotImplementedError
+
+
+class CsvStorage(Storage):
+    """The flat files in data/ (the default backend), meant for development.
+
+    A roster is one Students_Enrolled cell, so every write, a seat
+    reservation included, re-reads and rewrites the whole file. Deployments
+    should use SqliteStorage (PORTAL_STORAGE=sqlite), where a reservation
+    inserts one roster row.
+    """
+
+    name = 'csv'
+
+    def __init__(self, student_file: str = STUDENT_DATA_FILE, course_file: str = COURSE_DATA_FILE,
+                 enrollment_file: str = ENROLLMENT_DATA_FILE):
+        self.paths = [student_file, course_file, enrollment_file]
+        self._write_lock = threading.Lock()
+
+    def load(self) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        return read_data_files(*self.paths)
+
+    def signature(self) -> Tuple:
+        signature = []
+        for path in self.paths:
+            try:
+                stat = os.stat(path)
+                signature.append((path, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append((path, None, None))
+        return tuple(signature)
+
+    def reserve_seats(self, reservations: Iterable[Tuple[str, str]], capacities: Dict[str, int]) -> List[str]:
+        # The lock makes this atomic within one process only; run several workers on SQLite
+        with self._write_lock:
+            enrollment_file = self.paths[2]
+            records = _read_csv(enrollment_file).to_dict('records')
+            by_code = {record['Course_Code']: record for record in records}
+            course_names = None
+            statuses = []
+            for student_id, course_code in reservations:
+                record = by_code.get(course_code)
+                if record is None:
+                    if course_names is None:
+                        course_df = _read_csv(self.paths[1])
+                        course_names = dict(zip(course_df['Course_Code'], course_df['Course_Name']))
+                    record = by_code[course_code] = {'Course_Code': course_code, 'Course_Name': course_names.get(course_code),
+                                                     'Enrollment_Count': 0, 'Students_Enrolled': ''}
+                    records.append(record)
+                roster = _split(record.get('Students_Enrolled'))
+                count = len(roster) if _is_missing(record.get('Enrollment_Count')) else int(record['Enrollment_Count'])
+                if student_id in roster:
+                    statuses.append(ALREADY_ENROLLED)
+                elif count >= capacities[course_code]:
+                    statuses.append(FULL)
+                else:
+                    record['Students_Enrolled'] = ','.join(roster + [student_id])
+                    record['Enrollment_Count'] = count + 1
+                    statuses.append(RESERVED)
+
+            if RESERVED in statuses:
+                _write_csv(pd.DataFrame(records, columns=ENROLLMENT_COLUMNS), enrollment_file)
+            return statuses
+
+    # Writes (each call rewrites one file)
+
+    def upsert_students(self, records: Iterable[Dict]):
+        self._upsert_file(self.paths[0], 'Student_ID', records)
+
+    def upsert_courses(self, records: Iterable[Dict]):
+        self._upsert_file(self.paths[1], 'Course_Code', records)
+
+    def upsert_enrollments(self, records: Iterable[Dict]):
+        self._upsert_file(self.paths[2], 'Course_Code', records)
+
+    def _upsert_file(self, path: str, key: str, records: Iterable[Dict]):
+        with self._write_lock:
+            df = _read_csv(path)
+            if 'Prerequisites' in df.columns:
+                # Keep the catalog's literal 'None' (parsed as NaN) in the rewritten file
+                df['Prerequisites'] = df['Prerequisites'].fillna('None')
+            _write_csv(upsert_frame(df, key, list(records)), path)
+
+
+def upsert_frame(df: pd.DataFrame, key: str, records: List[Dict]) -> pd.DataFrame:
+    """Copy of ``df`` with rows replaced (first row per key) or appended from ``records``, as the upserts do.
+
+    A record only writes the columns it has; columns new to ``df`` are
+    added, empty for the other rows.
+    """
+    positions = {}
+    for position, value in enumerate(df[key].tolist()):
+        positions.setdefault(value, position)
+    updates = [(positions[record[key]], record) for record in records if record[key] in positions]
+    added = [record for record in records if record[key] not in positions]
+    df = df.copy()
+    for column in dict.fromkeys(column for record in records for column in record):
+        if column not in df.columns:
+            df[column] = pd.Series([None] * len(df), index=df.index, dtype=object)
+    for column_index, column in enumerate(df.columns):
+        written = [(position, record[column]) for position, record in updates if column in record]
+        if written:
+            df.iloc[[position for position, _ in written], column_index] = [value for _, value in written]
+    if added:
+        df = pd.concat([df, pd.DataFrame(added, columns=df.columns)], ignore_index=True)
+    return df
+
+
+def _write_csv(df: pd.DataFrame, path: str):
+    # Write a sibling file and rename it so readers never see a partial file
+    temp_file = path + '.tmp'
+    df.to_csv(temp_file, index=False)
+    os.replace(temp_file, path)
+
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS students (
+    student_id TEXT PRIMARY KEY,
+    name TEXT,
+    department TEXT,
+    cgpa REAL,
+    password TEXT,
+    position INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_students_department ON students(department);
+CREATE INDEX IF NOT EXISTS idx_students_position ON students(position);
+
+CREATE TABLE IF NOT EXISTS courses (
+    course_code TEXT PRIMARY KEY,
+    course_name TEXT,
+    department TEXT,
+    credit_hours INTEGER,
+    difficulty TEXT,
+    capacity INTEGER,
+    position INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_courses_department ON courses(department);
+CREATE INDEX IF NOT EXISTS idx_courses_position ON courses(position);
+
+CREATE TABLE IF NOT EXISTS completions (
+    student_id TEXT NOT NULL,
+    course_code TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (student_id, course_code)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_completions_course ON completions(course_code);
+
+CREATE TABLE IF NOT EXISTS prerequisites (
+    course_code TEXT NOT NULL,
+    prereq_code TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (course_code, prereq_code)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_prerequisites_prereq ON prerequisites(prereq_code);
+
+CREATE TABLE IF NOT EXISTS enrollments (
+    course_code TEXT PRIMARY KEY,
+    course_name TEXT,
+    enrollment_count INTEGER NOT NULL DEFAULT 0,
+    position INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_enrollments_position ON enrollments(position);
+
+CREATE TABLE IF NOT EXISTS enrollment_students (
+    course_code TEXT NOT NULL,
+    student_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (course_code, student_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_enrollment_students_student ON enrollment_students(student_id);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('data_version', 0);
+'''
+
+DATA_TABLES = ['students', 'courses', 'completions', 'prerequisites', 'enrollments', 'enrollment_students']
+
+
+class SqliteStorage(Storage):
+    """Normalized SQLite backend.
+
+    Multi-valued CSV fields live in their own indexed tables (completions,
+    prerequisites, enrollment_students). The database runs in WAL mode so
+    readers never block the single writer. Connections are pooled per worker
+    process and thread; a forked worker never reuses its parent's connection.
+    """
+
+    name = 'sqlite'
+
+    def __init__(self, path: str = SQLITE_DB_FILE, timeout: float = 30.0):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        conn = self.connection()
+        conn.executescript(SCHEMA)
+        # Databases created before seat capacities have no capacity column
+        if 'capacity' not in [row[1] for row in conn.execute('PRAGMA table_info(courses)')]:
+            conn.execute('ALTER TABLE courses ADD COLUMN capacity INTEGER')
+
+    def connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def transaction(self):
+        return _Transaction(self.connection())
+
+    def signature(self) -> Tuple:
+        row = self.connection().execute("SELECT value FROM meta WHERE key = 'data_version'").fetchone()
+        return (self.path, row[0] if row else None)
+
+    def load(self) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        conn = self.connection()
+        # One read transaction so the three tables come from the same version
+        conn.execute('BEGIN')
+        try:
+            completed = self._grouped(conn, 'SELECT student_id, course_code FROM completions ORDER BY student_id, position')
+            prereqs = self._grouped(conn, 'SELECT course_code, prereq_code FROM prerequisites ORDER BY course_code, position')
+            rosters = self._grouped(conn, 'SELECT course_code, student_id FROM enrollment_students ORDER BY course_code, position')
+
+            students = [
+                (student_id, name, department, cgpa, completed.get(student_id, ''), password)
+                for student_id, name, department, cgpa, password in conn.execute(
+                    'SELECT student_id, name, department, cgpa, password FROM students ORDER BY position')
+            ]
+            courses = [
+                (code, name, department, prereqs.get(code, 'None'), credit_hours, difficulty, capacity)
+                for code, name, department, credit_hours, difficulty, capacity in conn.execute(
+                    'SELECT course_code, course_name, department, credit_hours, difficulty, capacity FROM courses '
+                    'ORDER BY position')
+            ]
+            enrollments = [
+                (code, name, count, rosters.get(code, ''))
+                for code, name, count in conn.execute(
+                    'SELECT course_code, course_name, enrollment_count FROM enrollments ORDER BY position')
+            ]
+        finally:
+            conn.execute('COMMIT')
+        course_df = pd.DataFrame(courses, columns=COURSE_COLUMNS + ['Capacity'])
+        # Like a course file without the column when no capacity is set
+        if course_df['Capacity'].isna().all():
+            course_df = course_df.drop(columns='Capacity')
+        return (pd.DataFrame(students, columns=STUDENT_COLUMNS),
+                course_df,
+                pd.DataFrame(enrollments, columns=ENROLLMENT_COLUMNS))
+
+    @staticmethod
+    def _grouped(conn: sqlite3.Connection, query: str) -> Dict[str, str]:
+        groups: Dict[str, List[str]] = {}
+        for key, value in conn.execute(query):
+            groups.setdefault(key, []).append(value)
+        return {key: ','.join(values) for key, values in groups.items()}
+
+    # Writes (each call is one transaction)
+
+    def upsert_students(self, records: Iterable[Dict]):
+        with self.transaction() as conn:
+            for record in records:
+                position = self._position(conn, 'students', 'student_id', record['Student_ID'])
+                conn.execute('INSERT OR REPLACE INTO students (student_id, name, department, cgpa, password, position) '
+                             'VALUES (?, ?, ?, ?, ?, ?)',
+                             (record['Student_ID'], record.get('Name'), record.get('Department'),
+                              _optional_float(record.get('CGPA')), _optional_str(record.get('Password')), position))
+                self._replace_list(conn, 'completions', 'student_id', 'course_code',
+                                   record['Student_ID'], _split(record.get('Completed_Courses')))
+
+    def upsert_courses(self, records: Iterable[Dict]):
+        with self.transaction() as conn:
+            for record in records:
+                position = self._position(conn, 'courses', 'course_code', record['Course_Code'])
+                conn.execute('INSERT OR REPLACE INTO courses (course_code, course_name, department, credit_hours, '
+                             'difficulty, capacity, position) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                             (record['Course_Code'], record.get('Course_Name'), record.get('Department'),
+                              _optional_int(record.get('Credit_Hours')), record.get('Difficulty'),
+                              _optional_int(record.get('Capacity')), position))
+                self._replace_list(conn, 'prerequisites', 'course_code', 'prereq_code',
+                                   record['Course_Code'], _split(record.get('Prerequisites')))
+
+    def upsert_enrollments(self, records: Iterable[Dict]):
+        with self.transaction() as conn:
+            for record in records:
+                position = self._position(conn, 'enrollments', 'course_code', record['Course_Code'])
+                conn.execute('INSERT OR REPLACE INTO enrollments (course_code, course_name, enrollment_count, position) '
+                             'VALUES (?, ?, ?, ?)',
+                             (record['Course_Code'], record.get('Course_Name'),
+                              _optional_int(record.get('Enrollment_Count')) or 0, position))
+                self._replace_list(conn, 'enrollment_students', 'course_code', 'student_id',
+                                   record['Course_Code'], _split(record.get('Students_Enrolled')))
+
+    def reserve_seats(self, reservations: Iterable[Tuple[str, str]], capacities: Dict[str, int]) -> List[str]:
+        # BEGIN IMMEDIATE takes the write lock up front, so check-then-insert is atomic across workers
+        statuses = []
+        transaction = self.transaction()
+        with transaction as conn:
+            for student_id, course_code in reservations:
+                if conn.execute('SELECT 1 FROM enrollment_students WHERE course_code = ? AND student_id = ?',
+                                (course_code, student_id)).fetchone():
+                    statuses.append(ALREADY_ENROLLED)
+                    continue
+                row = conn.execute('SELECT enrollment_count FROM enrollments WHERE course_code = ?',
+                                   (course_code,)).fetchone()
+                count = row[0] if row else 0
+                if count >= capacities[course_code]:
+                    statuses.append(FULL)
+                    continue
+                if row is None:
+                    name = conn.execute('SELECT course_name FROM courses WHERE course_code = ?', (course_code,)).fetchone()
+                    conn.execute('INSERT INTO enrollments (course_code, course_name, enrollment_count, position) '
+                                 'VALUES (?, ?, 0, ?)',
+                                 (course_code, name[0] if name else None,
+                                  self._position(conn, 'enrollments', 'course_code', course_code)))
+                conn.execute('UPDATE enrollments SET enrollment_count = enrollment_count + 1 WHERE course_code = ?',
+                             (course_code,))
+                conn.execute('INSERT INTO enrollment_students (course_code, student_id, position) '
+                             'SELECT ?, ?, COALESCE(MAX(position), -1) + 1 FROM enrollment_students WHERE course_code = ?',
+                             (course_code, student_id, course_code))
+                statuses.append(RESERVED)
+            # Rejected requests must not bump the data version (and reload every worker)
+            transaction.changed = RESERVED in statuses
+        return statuses
+
+    @staticmethod
+    def _position(conn: sqlite3.Connection, table: str, key_column: str, key: str) -> int:
+        # Existing rows keep their place; new rows are appended
+        row = conn.execute(f'SELECT position FROM {table} WHERE {key_column} = ?', (key,)).fetchone()
+        if row is not None:
+            return row[0]
+        return conn.execute(f'SELECT COALESCE(MAX(position), -1) + 1 FROM {table}').fetchone()[0]
+
+    @staticmethod
+    def _replace_list(conn: sqlite3.Connection, table: str, key_column: str, value_column: str,
+                      key: str, values: List[str]):
+        conn.execute(f'DELETE FROM {table} WHERE {key_column} = ?', (key,))
+        conn.executemany(f'INSERT OR IGNORE INTO {table} ({key_column}, {value_column}, position) VALUES (?, ?, ?)',
+                         [(key, value, position) for position, value in enumerate(values)])
+
+    def import_frames(self, student_df: pd.DataFrame, course_df: pd.DataFrame, enrollment_df: pd.DataFrame):
+        """Replace the whole database contents with the given tables."""
+        with self.transaction() as conn:
+            for table in DATA_TABLES:
+                conn.execute(f'DELETE FROM {table}')
+            conn.executemany(
+                'INSERT OR IGNORE INTO students (student_id, name, department, cgpa, password, position) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                [(r['Student_ID'], r.get('Name'), r.get('Department'), _optional_float(r.get('CGPA')),
+                  _optional_str(r.get('Password')), i)
+                 for i, r in enumerate(student_df.to_dict('records'))])
+            conn.executemany(
+                'INSERT OR IGNORE INTO completions (student_id, course_code, position) VALUES (?, ?, ?)',
+                [(r['Student_ID'], code, j)
+                 for r in student_df.to_dict('records') for j, code in enumerate(_split(r.get('Completed_Courses')))])
+            conn.executemany(
+                'INSERT OR IGNORE INTO courses (course_code, course_name, department, credit_hours, difficulty, '
+                'capacity, position) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                [(r['Course_Code'], r.get('Course_Name'), r.get('Department'), _optional_int(r.get('Credit_Hours')),
+                  r.get('Difficulty'), _optional_int(r.get('Capacity')), i)
+                 for i, r in enumerate(course_df.to_dict('records'))])
+            conn.executemany(
+                'INSERT OR IGNORE INTO prerequisites (course_code, prereq_code, position) VALUES (?, ?, ?)',
+                [(r['Course_Code'], code, j)
+                 for r in course_df.to_dict('records') for j, code in enumerate(_split(r.get('Prerequisites')))])
+            conn.executemany(
+                'INSERT OR IGNORE INTO enrollments (course_code, course_name, enrollment_count, position) '
+                'VALUES (?, ?, ?, ?)',
+                [(r['Course_Code'], r.get('Course_Name'), _optional_int(r.get('Enrollment_Count')) or 0, i)
+                 for i, r in enumerate(enrollment_df.to_dict('records'))])
+            conn.executemany(
+                'INSERT OR IGNORE INTO enrollment_students (course_code, student_id, position) VALUES (?, ?, ?)',
+                [(r['Course_Code'], student_id, j)
+                 for r in enrollment_df.to_dict('records') for j, student_id in enumerate(_split(r.get('Students_Enrolled')))])
+
+
+class _Transaction:
+    """``with`` block running BEGIN IMMEDIATE ... COMMIT/ROLLBACK on a connection.
+
+    A committed write bumps meta.data_version, which is what
+    SqliteStorage.signature() polls, unless the block set ``changed`` to
+    False.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.changed = True
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute('BEGIN IMMEDIATE')
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type:
+            self.conn.execute('ROLLBACK')
+        else:
+            if self.changed:
+                self.conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'data_version'")
+            self.conn.execute('COMMIT')
+        return False
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def _optional_float(value) -> Optional[float]:
+    return None if _is_missing(value) else float(value)
+
+
+def _optional_int(value) -> Optional[int]:
+    return None if _is_missing(value) else int(value)
+
+
+def _optional_str(value) -> Optional[str]:
+    return None if _is_missing(value) else str(value)
+
+
+def create_storage(kind: Optional[str] = None) -> Storage:
+    """Backend selected by PORTAL_STORAGE ('csv' or 'sqlite'; the database path is PORTAL_DB)."""
+    kind = (kind or os.environ.get('PORTAL_STORAGE') or 'csv').lower()
+    if kind == 'sqlite':
+        return SqliteStorage(os.environ.get('PORTAL_DB') or SQLITE_DB_FILE)
+    if kind == 'csv':
+        return CsvStorage()
+    raise ValueError(f"Unknown storage backend: {kind}")
+
+
+def import_csv(db_path: str = SQLITE_DB_FILE, student_file: str = STUDENT_DATA_FILE,
+               course_file: str = COURSE_DATA_FILE, enrollment_file: str = ENROLLMENT_DATA_FILE) -> SqliteStorage:
+    """One-shot import of the CSV files into a SQLite database."""
+    student_df, course_df, enrollment_df = read_data_files(student_file, course_file, enrollment_file)
+    storage = SqliteStorage(db_path)
+    storage.import_frames(student_df, course_df, enrollment_df)
+    print(f"Imported {len(student_df)} students, {len(course_df)} courses, {len(enrollment_df)} enrollments into {db_path}")
+    return storage
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Import the portal CSV files into a SQLite database.')
+    parser.add_argument('--db', default=os.environ.get('PORTAL_DB') or SQLITE_DB_FILE)
+    parser.add_argument('--students', default=STUDENT_DATA_FILE)
+    parser.add_argument('--courses', default=COURSE_DATA_FILE)
+    parser.add_argument('--enrollments', default=ENROLLMENT_DATA_FILE)
+    args = parser.parse_args()
+    import_csv(args.db, args.students, args.courses, args.enrollments)
@@ -0,0 +1,51 @@
+"""Fixtures shared by the backend tests (run from the backend directory: python -m pytest)."""
+import os
+import shutil
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from storage import DATA_DIR, CsvStorage  # noqa: E402
+
+DATA_FILES = ('student_data.csv', 'course_data.csv', 'enrollment_data.csv')
+
+
+@pytest.fixture
+def data_paths(tmp_path):
+    """Copies of the shipped CSV files (student, course, enrollment), safe to write."""
+    paths = []
+    for name in DATA_FILES:
+        shutil.copy(os.path.join(DATA_DIR, name), tmp_path / name)
+        paths.append(str(tmp_path / name))
+    return paths
+
+
+@pytest.fixture
+def portal(data_paths):
+    """The app's data store pointed at ``data_paths`` (restored afterwards)."""
+    from data_store import store
+
+    saved = store.backend, store.snapshot_path
+    store.backend = CsvStorage(*data_paths)
+    store.snapshot_path = ''
+    store.reload(force=True)
+    yield store
+    store.backend, store.snapshot_path = saved
+    store.reload(force=True)
+
+
+ADMIN_TOKEN = 'test-admin-token'
+
+
+@pytest.fixture
+def client(portal, monkeypatch):
+    """Test client that sends the admin token."""
+    import app
+
+    monkeypatch.setattr(app, 'ADMIN_TOKEN', ADMIN_TOKEN)
+    client = app.app.test_client()
+    client.environ_base['HTTP_AUTHORIZATION'] = f'Bearer {ADMIN_TOKEN}'
+    return client
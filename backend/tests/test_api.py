@@ -0,0 +1,51 @@
+import pytest
+
+
+@pytest.mark.parametrize('body', [
+    {'student_ids': ['FA21-BSCS-0001'], 'top_k': 'abc'},
+    {'student_ids': ['FA21-BSCS-0001'], 'top_k': 0},
+    {'student_ids': ['FA21-BSCS-0001'], 'top_k': -3},
+    {'student_ids': ['FA21-BSCS-0001'], 'top_k': 2.7},
+    {'student_ids': ['FA21-BSCS-0001'], 'top_k': True},
+    {'student_ids': ['FA21-BSCS-0001'], 'top_k': '3'},
+    {'student_ids': 'FA21-BSCS-0001'},
+    {'student_ids': [1, 2]},
+])
+def test_batch_recommendations_rejects_bad_options(client, body):
+    response = client.post('/api/recommend/batch', json=body)
+    assert response.status_code == 400
+
+
+def test_batch_recommendations(client):
+    response = client.post('/api/recommend/batch', json={'student_ids': ['FA21-BSCS-0001', 'NOPE'], 'top_k': 2})
+    assert response.status_code == 200
+    recommendations = response.json['recommendations']
+    assert set(recommendations) == {'FA21-BSCS-0001', 'NOPE'}
+    assert len(recommendations['FA21-BSCS-0001']) <= 2
+
+
+@pytest.mark.parametrize('path', ['/api/plan', '/api/enroll/allocate'])
+def test_cohort_endpoints_reject_string_student_ids(client, path):
+    response = client.post(path, json={'student_ids': 'FA21-BSCS-0001'})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize('path, body', [
+    ('/api/enroll/allocate', {'max_credits': 2.7}),
+    ('/api/enroll/allocate', {'max_credits': True}),
+    ('/api/plan', {'max_credits': '18'}),
+    ('/api/plan', {'max_hard': 1.5}),
+    ('/api/plan', {'max_hard': False}),
+])
+def test_cohort_endpoints_reject_non_integer_limits(client, path, body):
+    response = client.post(path, json={'department': 'Computer Science', **body})
+    assert response.status_code == 400
+
+
+def test_chat_endpoints_answer_prerequisites_alike(client):
+    body = {'message': 'What are the prerequisites for CS301?', 'student_id': 'FA21-BSCS-0001'}
+    chat = client.post('/api/chat', json=body)
+    chatbot = client.post('/api/chatbot/response', json=body)
+    assert chat.status_code == chatbot.status_code == 200
+    assert chat.json['message'].startswith('CS301 requires')
+    assert chat.json['message'] == chatbot.json['response']
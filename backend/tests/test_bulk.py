@@ -0,0 +1,103 @@
+import pandas as pd
+
+from storage import CsvStorage, import_csv
+
+HEADER = 'Course_Code,Course_Name,Department,Prerequisites,Credit_Hours,Difficulty'
+
+
+def add_capacity(course_file, capacities):
+    df = pd.read_csv(course_file)
+    df['Capacity'] = [capacities.get(code, 40) for code in df['Course_Code']]
+    df.to_csv(course_file, index=False)
+
+
+def upload(client, table, body):
+    return client.post(f'/api/admin/{table}/bulk', data=body, content_type='text/csv')
+
+
+def test_course_update_keeps_capacity(client, portal, data_paths):
+    add_capacity(data_paths[1], {'CS102': 25})
+    portal.reload(force=True)
+
+    response = upload(client, 'courses', f"{HEADER}\nCS102,Data Structures II,Computer Science,CS101,4,Hard\n")
+    assert response.status_code == 200, response.json
+    assert response.json['updated'] == 1
+
+    course = portal.get().courses_by_code['CS102']
+    assert course['Course_Name'] == 'Data Structures II'
+    assert course['Credit_Hours'] == 4
+    assert course['Capacity'] == 25
+    stored = pd.read_csv(data_paths[1]).set_index('Course_Code')
+    assert stored.loc['CS102', 'Capacity'] == 25
+    assert stored.loc['CS101', 'Capacity'] == 40
+
+
+def test_partial_update_leaves_other_columns(client, portal, data_paths):
+    add_capacity(data_paths[1], {})
+    portal.reload(force=True)
+
+    response = upload(client, 'courses', "Course_Code,Capacity\nCS101,12\n")
+    assert response.status_code == 200, response.json
+    course = portal.get().courses_by_code['CS101']
+    assert course['Capacity'] == 12
+    assert course['Course_Name'] == 'Introduction to Programming'
+    assert int(pd.read_csv(data_paths[1]).set_index('Course_Code').loc['CS101', 'Capacity']) == 12
+
+
+def test_capacity_added_to_catalog_without_it(client, portal, data_paths):
+    response = upload(client, 'courses', "Course_Code,Capacity\nCS101,12\n")
+    assert response.status_code == 200, response.json
+
+    stored = pd.read_csv(data_paths[1]).set_index('Course_Code')
+    assert stored.loc['CS101', 'Capacity'] == 12
+    assert stored['Capacity'].drop('CS101').isna().all()
+    # The incremental snapshot matches a full reload of the rewritten file
+    reloaded = portal.reload(force=True)
+    assert reloaded.courses_by_code['CS101']['Capacity'] == 12
+
+
+def test_invalid_capacity_rejected(client):
+    response = upload(client, 'courses', "Course_Code,Capacity\nCS101,-1\n")
+    assert response.status_code == 400
+    assert response.json['errors'][0]['error'] == 'Capacity must be at least 0'
+
+
+def test_sqlite_capacity(portal, data_paths, tmp_path):
+    from bulk import BulkUpload
+
+    storage = import_csv(str(tmp_path / 'portal.db'), *data_paths)
+    assert 'Capacity' not in storage.load()[1].columns
+
+    portal.backend = storage
+    portal.reload(force=True)
+    bulk = BulkUpload('courses')
+    bulk.add(1, {'Course_Code': 'CS102', 'Capacity': '30'})
+    snapshot, _ = portal.apply('courses', bulk.prepare)
+    assert snapshot.courses_by_code['CS102']['Capacity'] == 30
+
+    course_df = storage.load()[1].set_index('Course_Code')
+    assert course_df.loc['CS102', 'Capacity'] == 30
+    assert course_df.loc['CS102', 'Course_Name'] == 'Data Structures'
+
+
+def test_csv_storage_upsert_writes_only_given_columns(data_paths):
+    storage = CsvStorage(*data_paths)
+    storage.upsert_courses([{'Course_Code': 'CS101', 'Difficulty': 'Hard'}])
+    course = storage.load()[1].set_index('Course_Code').loc['CS101']
+    assert course['Difficulty'] == 'Hard'
+    assert course['Course_Name'] == 'Introduction to Programming'
+
+
+def test_bulk_upload_needs_admin_token(client, portal, monkeypatch):
+    import app
+
+    password = portal.get().students_by_id['FA21-BSCS-0001']['Password']
+    body = "Student_ID,Password\nFA21-BSCS-0001,hijacked\n"
+    for authorization in ('', 'Bearer wrong-token', 'Basic dGVzdA=='):
+        response = client.post('/api/admin/students/bulk', data=body, content_type='text/csv',
+                               headers={'Authorization': authorization})
+        assert response.status_code == 401
+    monkeypatch.setattr(app, 'ADMIN_TOKEN', '')
+    response = client.post('/api/admin/students/bulk', data=body, content_type='text/csv')
+    assert response.status_code == 403
+    assert portal.get().students_by_id['FA21-BSCS-0001']['Password'] == password
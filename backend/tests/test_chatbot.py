@@ -0,0 +1,52 @@
+import json
+
+from chatbot import Chatbot
+from sessions import SqliteSessionStore
+
+STUDENT_ID = 'FA21-BSCS-0001'
+
+
+def test_session_keeps_only_student_and_history(portal, tmp_path):
+    sessions = SqliteSessionStore(str(tmp_path / 'sessions.db'))
+    chatbot = Chatbot(sessions)
+
+    response, conversation_id = chatbot.handle('What courses do you recommend?', student_id=STUDENT_ID)
+    assert 'I recommend' in response
+    response, _ = chatbot.handle('What are the prerequisites for CS301?', conversation_id)
+    assert 'CS301 requires' in response
+    assert 'You still need' in response or 'You have completed all of them' in response
+
+    session = sessions.get(conversation_id)
+    assert set(session) == {'history', 'student_id'}
+    assert session['student_id'] == STUDENT_ID
+    assert len(json.dumps(session)) < 2000
+
+
+def test_recommendations_reused_by_follow_ups(portal):
+    chatbot = Chatbot()
+    _, conversation_id = chatbot.handle('recommend me some courses', student_id=STUDENT_ID)
+    chatbot.handle('any other recommendations?', conversation_id)
+    assert chatbot.recommendations.stats()['hits'] == 1
+
+
+def test_greeting_does_not_compute_recommendations(portal):
+    chatbot = Chatbot()
+    chatbot.handle('hello', student_id=STUDENT_ID)
+    assert chatbot.recommendations.stats()['misses'] == 0
+
+
+def test_cgpa(portal):
+    response, _ = Chatbot().handle('What is my CGPA?', student_id=STUDENT_ID)
+    assert response == f"Your CGPA is {portal.get().students_by_id[STUDENT_ID]['CGPA']}."
+    response, _ = Chatbot().handle('What is my CGPA?')
+    assert 'student ID' in response
+
+
+def test_unknown_student(portal):
+    response, _ = Chatbot().handle('recommend courses for me', student_id='FA21-NOPE-0000')
+    assert "couldn't find a student record" in response
+
+
+def test_course_named_in_message(portal):
+    response, _ = Chatbot().handle('tell me about data structures')
+    assert response.startswith('CS102: Data Structures')
@@ -0,0 +1,26 @@
+import os
+
+import numpy as np
+
+from collaborative import CollaborativeModel, ModelCache
+from storage import CsvStorage
+
+
+def test_save_replaces_model_file(data_paths, tmp_path):
+    student_df, _, enrollment_df = CsvStorage(*data_paths).load()
+    model = CollaborativeModel.train(student_df, enrollment_df, 5)
+    model_dir = tmp_path / 'model'
+    model_dir.mkdir()
+    path = str(model_dir / 'cf_model.npz')
+    model.save(path)
+    cache = ModelCache(path)
+    first = cache.get()
+    assert first.codes == model.codes
+    np.testing.assert_array_equal(first.data, model.data)
+
+    # Saved again over the live file: a new file is renamed into place, no temp file is left behind
+    inode = os.stat(path).st_ino
+    model.save(path)
+    assert os.stat(path).st_ino != inode
+    assert os.listdir(model_dir) == ['cf_model.npz']
+    assert cache.get().codes == model.codes
@@ -0,0 +1,142 @@
+import json
+import os
+import time
+
+import pandas as pd
+import pytest
+
+import snapshot_file
+from bulk import BulkUpload
+from data_store import DataSnapshot, DataStore
+from response_cache import ResponseCache
+from search import SearchQuery
+from storage import CsvStorage, import_csv
+
+NEW_STUDENT = {'Student_ID': 'FA25-BSCS-9001', 'Name': 'New Student', 'Department': 'Computer Science',
+               'CGPA': '3.9', 'Password': 'pw', 'Completed_Courses': 'CS101,CS102'}
+
+
+def assert_same_data(snapshot, reloaded):
+    """Everything the routes read from a snapshot, compared with a snapshot loaded from scratch."""
+    assert list(snapshot.students_by_id) == list(reloaded.students_by_id)
+    for student_id, student in reloaded.students_by_id.items():
+        assert snapshot.students_by_id[student_id]['Completed_Courses'] == student['Completed_Courses']
+        assert float(snapshot.students_by_id[student_id]['CGPA']) == float(student['CGPA'])
+    assert list(snapshot.courses_by_code) == list(reloaded.courses_by_code)
+    assert {department: [course['Course_Code'] for course in courses]
+            for department, courses in snapshot.courses_by_department.items()} == \
+        {department: [course['Course_Code'] for course in courses]
+         for department, courses in reloaded.courses_by_department.items()}
+
+    graph, expected = snapshot.prereq_graph, reloaded.prereq_graph
+    for code in reloaded.courses_by_code:
+        assert sorted(graph.all_prerequisites(code)) == sorted(expected.all_prerequisites(code))
+        assert sorted(snapshot.enrollment_index.roster(code) or []) == sorted(reloaded.enrollment_index.roster(code) or [])
+    for student_id in reloaded.students_by_id:
+        assert graph.codes_of(graph.completed_mask(student_id)) == expected.codes_of(expected.completed_mask(student_id))
+        assert sorted(snapshot.enrollment_index.schedule(student_id)) == sorted(reloaded.enrollment_index.schedule(student_id))
+
+    assert json.dumps(snapshot.stats.dashboard(), sort_keys=True, default=str) == \
+        json.dumps(reloaded.stats.dashboard(), sort_keys=True, default=str)
+    for text in ('data', 'fa21-bscs', 'student 1', 'compilers'):
+        assert snapshot.search_index.search(SearchQuery(text, limit=100)) == \
+            reloaded.search_index.search(SearchQuery(text, limit=100))
+    assert len(snapshot.student_df) == len(reloaded.student_df)
+    assert len(snapshot.enrollment_df) == len(reloaded.enrollment_df)
+
+
+def upload(store, table, rows):
+    bulk = BulkUpload(table)
+    for row_number, row in enumerate(rows, start=1):
+        bulk.add(row_number, row)
+    return store.apply(table, bulk.prepare)[0]
+
+
+@pytest.fixture(params=['csv', 'sqlite'])
+def store(request, data_paths, tmp_path):
+    backend = CsvStorage(*data_paths) if request.param == 'csv' else import_csv(str(tmp_path / 'portal.db'), *data_paths)
+    store = DataStore(backend, check_interval=0, snapshot_path='')
+    store.get().stats  # materialized, so apply updates it row by row
+    return store
+
+
+def test_apply_matches_full_reload(store):
+    upload(store, 'courses', [{'Course_Code': 'CS450', 'Course_Name': 'Compilers', 'Department': 'Computer Science',
+                               'Prerequisites': 'CS202', 'Credit_Hours': '3', 'Difficulty': 'Hard'},
+                              {'Course_Code': 'CS301', 'Prerequisites': 'CS102'}])
+    upload(store, 'students', [NEW_STUDENT, {'Student_ID': 'FA21-BSCS-0001', 'CGPA': '2.5', 'Completed_Courses': 'CS101'}])
+    snapshot = upload(store, 'enrollments', [{'Course_Code': 'CS450', 'Students_Enrolled': 'FA25-BSCS-9001,FA21-BSCS-0001'}])
+
+    assert snapshot.version == 4
+    assert snapshot.signature == store.backend.signature()
+    assert_same_data(snapshot, DataSnapshot(*store.backend.load(), 0))
+    assert snapshot.search_index.mentioned_courses('tell me about compilers') == ['CS450']
+
+
+def test_enrollment_upload_keeps_search_index(store):
+    search_index = store.get().search_index
+    snapshot = upload(store, 'enrollments', [{'Course_Code': 'CS101', 'Students_Enrolled': 'FA21-BSCS-0001'}])
+    assert snapshot.search_index is search_index
+
+
+def test_enrollment_apply_leaves_previous_graph_untouched(data_paths):
+    previous = DataSnapshot(*CsvStorage(*data_paths).load(), 1)
+    codes = list(previous.prereq_graph.codes)
+    snapshot = previous.apply('enrollments', [{'Course_Code': 'XX999', 'Course_Name': 'Unlisted',
+                                               'Enrollment_Count': 1, 'Students_Enrolled': 'FA21-BSCS-0001'}], 2)
+    assert previous.prereq_graph.codes == codes
+    assert 'XX999' not in previous.prereq_graph.code_ids
+    assert snapshot.enrollment_index.roster('XX999') == ['FA21-BSCS-0001']
+
+
+def test_reloads_when_files_change(data_paths):
+    store = DataStore(CsvStorage(*data_paths), check_interval=0, snapshot_path='')
+    first = store.get()
+    assert store.get() is first
+
+    df = pd.read_csv(data_paths[0])
+    df.loc[0, 'Name'] = 'Renamed Student'
+    time.sleep(0.01)
+    df.to_csv(data_paths[0], index=False)
+    second = store.get()
+    assert second is not first
+    assert second.version == first.version + 1
+    assert second.students_by_id[df.loc[0, 'Student_ID']]['Name'] == 'Renamed Student'
+
+
+def test_keeps_last_snapshot_on_bad_files(data_paths):
+    store = DataStore(CsvStorage(*data_paths), check_interval=0, snapshot_path='')
+    first = store.get()
+    os.remove(data_paths[1])
+    assert store.get() is first
+
+
+def test_compiled_snapshot_round_trip(data_paths, tmp_path):
+    backend = CsvStorage(*data_paths)
+    path = str(tmp_path / 'snapshot.bin')
+    snapshot_file.write(DataSnapshot(*backend.load(), 1), path, backend.signature())
+
+    store = DataStore(backend, check_interval=0, snapshot_path=path)
+    mapped = store.get()
+    assert mapped._derived['search'] is not None
+    assert_same_data(mapped, DataSnapshot(*backend.load(), 0))
+
+    # Stale once the data changes: the store falls back to the CSV files
+    snapshot = upload(store, 'students', [NEW_STUDENT])
+    assert 'FA25-BSCS-9001' in snapshot.students_by_id
+    assert snapshot_file.read(path, backend.signature()) is None
+
+
+def test_response_cache_is_scoped_to_version():
+    cache = ResponseCache(maxsize=2, ttl=60)
+    assert cache.get_or_compute(1, 'a', lambda: 'first') == 'first'
+    assert cache.get_or_compute(1, 'a', lambda: 'again') == 'first'
+    # A newer snapshot drops every older entry
+    assert cache.get_or_compute(2, 'a', lambda: 'second') == 'second'
+    # A request still holding the old snapshot bypasses the cache
+    assert cache.get_or_compute(1, 'a', lambda: 'old') == 'old'
+    assert cache.get(2, 'a') == 'second'
+    cache.set(2, 'b', 1)
+    cache.set(2, 'c', 2)
+    assert cache.get(2, 'a') is None
+    assert cache.stats()['evictions'] == 1
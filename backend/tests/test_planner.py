@@ -0,0 +1,17 @@
+from planner import DegreePlanner
+
+STUDENT_ID = 'FA21-BSCS-0001'
+
+
+def test_max_hard_applies_to_every_course(portal):
+    snapshot = portal.get()
+    planner = DegreePlanner.from_snapshot(snapshot)
+
+    plan = planner.plan(snapshot, STUDENT_ID, max_hard=0)
+    assert all(semester['hard_courses'] == 0 for semester in plan['semesters'])
+    hard = [code for code in plan['unschedulable'] if snapshot.courses_by_code[code]['Difficulty'] == 'Hard']
+    assert hard
+
+    plan = planner.plan(snapshot, STUDENT_ID, max_hard=1)
+    assert all(semester['hard_courses'] <= 1 for semester in plan['semesters'])
+    assert not plan['unschedulable']
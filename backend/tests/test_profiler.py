@@ -0,0 +1,38 @@
+import os
+import time
+
+from profiler import SamplingProfiler
+
+
+def slow_request(profiler):
+    profiler.begin()
+    deadline = time.perf_counter() + 0.2
+    while time.perf_counter() < deadline:
+        pass
+    profiler.end('/api/test', 0.2)
+
+
+def test_slow_request_is_dumped(tmp_path):
+    profiler = SamplingProfiler(out_dir=str(tmp_path), slow_threshold=0.1)
+    profiler.enable()
+    slow_request(profiler)
+    profiler.disable()
+    assert profiler.dumped == 1
+    assert os.listdir(tmp_path)
+
+
+def test_sampler_runs_in_forked_child(tmp_path):
+    # Enabled before the fork, as in a preloaded gunicorn master
+    profiler = SamplingProfiler(out_dir=str(tmp_path), slow_threshold=0.1)
+    profiler.enable()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            slow_request(profiler)
+            os._exit(0 if profiler.dumped == 1 else 1)
+        finally:
+            os._exit(2)
+    _, status = os.waitpid(pid, 0)
+    profiler.disable()
+    assert os.WEXITSTATUS(status) == 0
+    assert len(os.listdir(tmp_path)) == 1
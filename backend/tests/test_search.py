@@ -0,0 +1,64 @@
+import pytest
+
+from data_store import DataSnapshot
+from search import SearchError, SearchQuery
+from storage import read_data_files
+
+
+@pytest.fixture(scope='module')
+def index():
+    return DataSnapshot(*read_data_files(), 1).search_index
+
+
+@pytest.mark.parametrize('message, codes', [
+    ('what are the prerequisites of data mining', ['CS311']),
+    ('is operating systems hard', ['CS205']),
+    ('tell me about data structures', ['CS102']),
+    ('data structures and data mining', ['CS102', 'CS311']),
+    ('machine learning and databases', ['CS302', 'CS202']),
+    ('what are the prerequisites for artifical inteligence', ['CS301']),
+    ('show me some courses', []),
+    ('is data hard', []),
+])
+def test_mentioned_courses(index, message, codes):
+    assert index.mentioned_courses(message) == codes
+
+
+def test_distinctive_word_mentions_course(index):
+    # "statistics" is a third of either name, but only two courses have it
+    assert sorted(index.mentioned_courses('what about statistics')) == ['PSY207', 'STAT101']
+
+
+def test_prefix_search(index):
+    page = index.search(SearchQuery('data str'))
+    assert [result['Course_Code'] for result in page['results']] == ['CS102']
+
+
+def test_typo_search(index):
+    page = index.search(SearchQuery('artifical', kind='course'))
+    assert page['results'][0]['Course_Code'] == 'CS301'
+
+
+def test_student_search_pages(index):
+    first = index.search(SearchQuery('fa21', kind='student', limit=2))
+    second = index.search(SearchQuery('fa21', kind='student', offset=2, limit=2))
+    assert first['total'] == second['total'] > 4
+    ids = [result['Student_ID'] for result in first['results'] + second['results']]
+    assert len(set(ids)) == 4
+    assert all(result['type'] == 'student' for result in first['results'])
+
+
+def test_query_validation():
+    with pytest.raises(SearchError):
+        SearchQuery.from_args({})
+    with pytest.raises(SearchError):
+        SearchQuery.from_args({'q': 'data', 'limit': '0'})
+    with pytest.raises(SearchError):
+        SearchQuery.from_args({'q': 'data', 'type': 'teacher'})
+
+
+def test_search_endpoint(client):
+    response = client.get('/api/search?q=data%20str')
+    assert response.status_code == 200
+    assert response.json['results'][0]['Course_Code'] == 'CS102'
+    assert client.get('/api/search').status_code == 400
@@ -0,0 +1,98 @@
+import pandas as pd
+
+from data_store import DataSnapshot
+from storage import import_csv
+
+STUDENT_ID = 'FA21-BSCS-0001'
+
+
+def eligible_course(snapshot, student_id):
+    graph = snapshot.prereq_graph
+    mask = graph.completed_mask(student_id)
+    schedule = snapshot.enrollment_index.schedule(student_id)
+    return next(code for code in snapshot.courses_by_code
+                if not graph.has_completed(mask, code) and graph.is_eligible(code, mask) and code not in schedule)
+
+
+def assert_same_enrollments(snapshot, reloaded):
+    assert snapshot.enrollments_by_code.keys() == reloaded.enrollments_by_code.keys()
+    for code, record in reloaded.enrollments_by_code.items():
+        assert int(snapshot.enrollments_by_code[code]['Enrollment_Count']) == int(record['Enrollment_Count'])
+        assert sorted(snapshot.enrollment_index.roster(code) or []) == sorted(reloaded.enrollment_index.roster(code) or [])
+
+
+def test_reservation_updates_snapshot_without_reload(client, portal):
+    before = portal.get()
+    search_index = before.search_index
+    code = eligible_course(before, STUDENT_ID)
+
+    response = client.post('/api/enroll', json={'student_id': STUDENT_ID, 'course_code': code})
+    assert response.status_code == 200, response.json
+    after = portal.get()
+    assert after.version == before.version + 1
+    # Not reloaded: everything but the enrollments is shared with the previous snapshot
+    assert after.students_by_id is before.students_by_id
+    assert after.search_index is search_index
+    assert STUDENT_ID in after.enrollment_index.roster(code)
+    assert_same_enrollments(after, DataSnapshot(*portal.backend.load(), 0))
+
+    response = client.post('/api/enroll', json={'student_id': STUDENT_ID, 'course_code': code})
+    assert response.status_code == 409
+    assert portal.get().version == after.version
+
+
+def test_reservation_in_new_enrollment_row(portal, data_paths):
+    from seats import reserve
+
+    pd.read_csv(data_paths[2]).iloc[0:0].to_csv(data_paths[2], index=False)
+    snapshot = portal.reload(force=True)
+    code = eligible_course(snapshot, STUDENT_ID)
+
+    assert reserve(snapshot, portal, STUDENT_ID, code)['status'] == 'reserved'
+    assert portal.get().enrollments_by_code[code]['Enrollment_Count'] == 1
+    assert_same_enrollments(portal.get(), DataSnapshot(*portal.backend.load(), 0))
+
+
+def test_allocation_commit_on_sqlite(client, portal, data_paths, tmp_path):
+    portal.backend = import_csv(str(tmp_path / 'portal.db'), *data_paths)
+    portal.reload(force=True)
+
+    response = client.post('/api/enroll/allocate', json={'department': 'Computer Science', 'commit': True})
+    assert response.status_code == 200, response.json
+    assert response.json['allocation']['seats_assigned'] > 0
+    assert_same_enrollments(portal.get(), DataSnapshot(*portal.backend.load(), 0))
+
+
+def test_reservations_patch_only_touched_rosters(portal, monkeypatch):
+    import enrollment_index
+    from seats import SeatMap, seat_map
+
+    snapshot = portal.get()
+    snapshot.stats, seat_map(snapshot)  # materialized, so they are patched rather than rebuilt
+    reservations = []
+    for student_id in list(snapshot.students_by_id)[:40]:
+        schedule = snapshot.enrollment_index.schedule(student_id)
+        reservations += [(student_id, code) for code in list(snapshot.courses_by_code)[:6] if code not in schedule][:2]
+    expected = snapshot.apply('enrollments', snapshot.enrollments_with(reservations), 2)
+
+    for limit in (enrollment_index.MAX_OVERRIDES, 8):
+        monkeypatch.setattr(enrollment_index, 'MAX_OVERRIDES', limit)
+        patched = snapshot
+        for pair in reservations:
+            patched = patched.with_reservations([pair], patched.version + 1)
+        index = patched.enrollment_index
+        if limit == 8:
+            # Folded into new arrays whenever the overrides outgrow the limit
+            assert len(index.course_overrides) + len(index.student_overrides) <= 8
+        else:
+            # The first snapshot's arrays are shared, not rebuilt
+            assert index.course_students is snapshot.enrollment_index.course_students
+        assert 'stats' in patched._derived and 'seat_map' in patched._derived
+        assert patched.enrollment_records == expected.enrollment_records
+        for code in expected.enrollments_by_code:
+            assert patched.enrollment_index.roster(code) == expected.enrollment_index.roster(code)
+        for student_id in snapshot.students_by_id:
+            assert patched.enrollment_index.schedule(student_id) == expected.enrollment_index.schedule(student_id)
+        assert list(patched.enrollment_index.roster_sizes()) == list(expected.enrollment_index.roster_sizes())
+        assert patched.stats.dashboard() == expected.stats.dashboard()
+        assert seat_map(patched).taken == SeatMap.from_snapshot(expected).taken
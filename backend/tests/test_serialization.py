@@ -0,0 +1,31 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import serialization
+
+PAYLOAD = {
+    'cgpa': float('nan'),
+    'numpy': np.float64('nan'),
+    'float32': np.float32('inf'),
+    'array': np.array([1.5, np.nan]),
+    'records': pd.DataFrame({'CGPA': [3.5, None]}).to_dict('records'),
+    'count': np.int64(3)
+}
+EXPECTED = {'array': [1.5, None], 'cgpa': None, 'count': 3, 'float32': None, 'numpy': None,
+            'records': [{'CGPA': 3.5}, {'CGPA': None}]}
+
+
+@pytest.mark.parametrize('dumps', [serialization.dumps, serialization._json_dumps])
+def test_nan_is_null(dumps):
+    assert json.loads(dumps(PAYLOAD)) == EXPECTED
+
+
+def test_encoders_agree():
+    assert serialization.dumps(PAYLOAD) == serialization._json_dumps(PAYLOAD)
+
+
+def test_json_encoder_nan_is_null():
+    assert json.loads(json.dumps(PAYLOAD, cls=serialization.JSONEncoder)) == EXPECTED
@@ -0,0 +1,19 @@
+import random
+import statistics
+
+from stats import PortalStats
+
+
+def test_cgpa_spread_survives_removals_and_large_offsets():
+    rng = random.Random(1)
+    values = [1e6 + rng.random() for _ in range(2000)]
+    stats = PortalStats()
+    for value in values:
+        stats.add_student({'Department': 'Computer Science', 'CGPA': value})
+    for old in values[:700]:
+        stats.update_student({'Department': 'Computer Science', 'CGPA': old}, {'Department': 'Computer Science'})
+
+    cgpa = stats.cgpa_stats()
+    assert cgpa['count'] == 1300
+    assert abs(cgpa['mean'] - statistics.mean(values[700:])) < 1e-6
+    assert abs(cgpa['std'] - statistics.stdev(values[700:])) < 1e-6
@@ -0,0 +1,49 @@
+import pandas as pd
+
+from data_store import DataStore
+from storage import CsvStorage, _read_csv, import_csv
+
+
+def normalized(df):
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
+
+def test_sqlite_import_matches_csv(data_paths, tmp_path):
+    csv_tables = CsvStorage(*data_paths).load()
+    sqlite_tables = import_csv(str(tmp_path / 'portal.db'), *data_paths).load()
+    for csv_df, sqlite_df in zip(csv_tables, sqlite_tables):
+        assert list(sqlite_df.columns) == list(csv_df.columns)
+        assert normalized(sqlite_df) == normalized(csv_df)
+
+
+def test_sqlite_writes_change_signature(data_paths, tmp_path):
+    storage = import_csv(str(tmp_path / 'portal.db'), *data_paths)
+    signature = storage.signature()
+    storage.upsert_students([{'Student_ID': 'FA25-BSCS-9001', 'Name': 'New Student', 'Department': 'Computer Science',
+                              'CGPA': 3.5, 'Completed_Courses': 'CS101', 'Password': 'pw'}])
+    assert storage.signature() != signature
+
+    store = DataStore(storage, check_interval=0, snapshot_path='')
+    student = store.get().students_by_id['FA25-BSCS-9001']
+    assert student['Completed_Courses'] == 'CS101'
+    # Rejected reservations leave the data version alone
+    signature = storage.signature()
+    code = 'CS101'
+    store.reserve_seats([('FA25-BSCS-9001', code)], {code: 0})
+    assert storage.signature() == signature
+
+
+def test_csv_upsert_appends_new_rows(data_paths):
+    storage = CsvStorage(*data_paths)
+    rows = len(pd.read_csv(data_paths[0]))
+    storage.upsert_students([{'Student_ID': 'FA25-BSCS-9001', 'Name': 'New Student', 'Department': 'Computer Science',
+                              'CGPA': 3.5, 'Completed_Courses': '', 'Password': 'pw'}])
+    assert len(pd.read_csv(data_paths[0])) == rows + 1
+
+
+def test_read_csv_strips_quoted_text(tmp_path):
+    path = tmp_path / 'students.csv'
+    path.write_text('Student_ID,Name,CGPA\nA1,"""Alice""",3.5\n')
+    df = _read_csv(str(path))
+    assert df['Name'].tolist() == ['Alice']
+    assert df['CGPA'].tolist() == [3.5]
@@ -0,0 +1,18 @@
+import pandas as pd
+
+from data_store import DataSnapshot
+from storage import CsvStorage
+from whatif import UNKNOWN_DEPARTMENT, simulate
+
+
+def test_students_without_department_are_counted_as_unknown(data_paths):
+    student_df = pd.read_csv(data_paths[0])
+    student_df['Department'] = None
+    student_df.to_csv(data_paths[0], index=False)
+    snapshot = DataSnapshot(*CsvStorage(*data_paths).load(), 1)
+
+    code = next(code for code, course in snapshot.courses_by_code.items() if course['Prerequisites'] != 'None')
+    result = simulate(snapshot, {code: []}, [])
+    assert result['students_affected'] > 0
+    assert list(result['departments']) == [UNKNOWN_DEPARTMENT]
+    assert result['departments'][UNKNOWN_DEPARTMENT]['students_affected'] == result['students_affected']
@@ -0,0 +1,170 @@
+"""What-if analysis of proposed prerequisite changes and course retirements.
+
+A proposal replaces the direct prerequisites of some catalog courses
+and/or retires courses. It is applied to a copy-on-write version of the
+snapshot's prerequisite graph (PrerequisiteGraph.with_prerequisites), and
+the live catalog is never touched.
+
+Eligibility is what the recommender uses: a student is eligible for a
+course they have not completed when they have completed all its direct
+prerequisites, whatever their department (``department`` restricts the
+cohort to one department's students). Only the changed and retired
+courses can gain or lose eligible students, so only those are evaluated,
+for the whole cohort at once as boolean columns over the student table.
+Courses downstream of a change (whose transitive prerequisites change)
+are listed, since the degree planner sees them differently.
+
+A retired course has no eligible students afterwards. Courses that still
+list it as a prerequisite keep requiring it (students who completed it
+still qualify) and are reported under ``dangling_prerequisites``.
+"""
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from prereq_graph import split_codes
+
+
+# Key of students without a department in the per-department counts
+UNKNOWN_DEPARTMENT = 'Unknown'
+
+
+class WhatIfError(ValueError):
+    """Invalid proposal (reported to the client as a 400)."""
+
+
+def _code_list(value, name: str) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        codes = split_codes(value.strip())
+    elif isinstance(value, list):
+        codes = [str(code) for code in value]
+    else:
+        raise WhatIfError(f"{name} must be a list of course codes or a comma-separated string")
+    return list(dict.fromkeys(code.strip().upper() for code in codes if code.strip()))
+
+
+def parse_proposal(data: Dict) -> Tuple[Dict[str, List[str]], List[str]]:
+    """``{"prerequisites": {code: codes}, "retire": codes}`` -> (prerequisite changes, retired codes)."""
+    prerequisites = data.get('prerequisites') or {}
+    if not isinstance(prerequisites, dict):
+        raise WhatIfError('prerequisites must map course codes to their new prerequisites')
+    changes = {str(code).strip().upper(): _code_list(value, f'Prerequisites of {code}')
+               for code, value in prerequisites.items()}
+    retire = _code_list(data.get('retire'), 'retire')
+    if not changes and not retire:
+        raise WhatIfError('Provide prerequisites to change or courses to retire')
+    both = [code for code in retire if code in changes]
+    if both:
+        raise WhatIfError(f"Courses both changed and retired: {', '.join(both)}")
+    return changes, retire
+
+
+def _validate(snapshot, changes: Dict[str, List[str]], retire: List[str]):
+    catalog = snapshot.courses_by_code
+    unknown = [code for code in list(changes) + retire if code not in catalog]
+    if unknown:
+        raise WhatIfError(f"Unknown courses: {', '.join(unknown)}")
+    for code, prerequisites in changes.items():
+        unknown = [prereq for prereq in prerequisites if prereq not in catalog]
+        if unknown:
+            raise WhatIfError(f"Unknown prerequisite codes for {code}: {', '.join(unknown)}")
+        if code in prerequisites:
+            raise WhatIfError(f"{code} lists itself as a prerequisite")
+
+
+def simulate(snapshot, changes: Dict[str, List[str]], retire: List[str], department: Optional[str] = None) -> Dict:
+    """Eligibility impact of a proposal on every student (or one department's students)."""
+    _validate(snapshot, changes, retire)
+    graph = snapshot.prereq_graph
+    proposed = graph.with_prerequisites(changes)
+
+    catalog_ids = [(code, graph.code_ids[code]) for code in snapshot.courses_by_code]
+    # A new cycle shows up as a course that (transitively) requires itself
+    cycles = [code for code, course_id in catalog_ids
+              if (proposed.closure_mask(course_id) >> course_id) & 1 and not (graph.closure_mask(course_id) >> course_id) & 1]
+    if cycles:
+        raise WhatIfError(f"Proposal creates a prerequisite cycle through {', '.join(cycles)}")
+
+    # Courses whose transitive prerequisites change, besides the changed ones
+    downstream = [code for code, course_id in catalog_ids
+                  if code not in changes and proposed.closure_mask(course_id) != graph.closure_mask(course_id)]
+    retired_mask = graph.mask(retire)
+    dangling = {}
+    for code, course in snapshot.courses_by_code.items():
+        if code in retire:
+            continue
+        prerequisites = changes[code] if code in changes else split_codes(course['Prerequisites'])
+        still_required = [prereq for prereq in prerequisites if (retired_mask >> graph.code_ids[prereq]) & 1]
+        if still_required:
+            dangling[code] = still_required
+
+    table = snapshot.students_by_id
+    rows = table.first_rows()
+    if department is not None:
+        try:
+            department_code = table.department.categories.index(department)
+        except ValueError:
+            raise WhatIfError(f"No students in department {department}")
+        rows = rows[table.department.codes[rows] == department_code]
+
+    evaluated = list(changes) + retire
+    before_sets = {code: graph.ids_of(graph.prereq_masks.get(graph.code_ids[code], 0)) for code in evaluated}
+    after_sets = {code: proposed.ids_of(proposed.prereq_masks.get(graph.code_ids[code], 0)) for code in evaluated}
+    needed = list(dict.fromkeys([graph.code_ids[code] for code in evaluated] +
+                                [course_id for ids in before_sets.values() for course_id in ids] +
+                                [course_id for ids in after_sets.values() for course_id in ids]))
+    column = {course_id: i for i, course_id in enumerate(needed)}
+    completed = table.completed_columns(needed, rows)
+
+    gained_any = np.zeros(len(rows), dtype=bool)
+    lost_any = np.zeros(len(rows), dtype=bool)
+    courses = {}
+    for code in evaluated:
+        not_done = ~completed[:, column[graph.code_ids[code]]]
+        before = not_done & completed[:, [column[i] for i in before_sets[code]]].all(axis=1)
+        if code in retire:
+            after = np.zeros(len(rows), dtype=bool)
+        else:
+            after = not_done & completed[:, [column[i] for i in after_sets[code]]].all(axis=1)
+        gained = after & ~before
+        lost = before & ~after
+        gained_any |= gained
+        lost_any |= lost
+        courses[code] = {
+            'department': snapshot.courses_by_code[code]['Department'],
+            'retired': code in retire,
+            'prerequisites_before': graph.codes_of(graph.prereq_masks.get(graph.code_ids[code], 0)),
+            'prerequisites_after': [] if code in retire else proposed.codes_of(proposed.prereq_masks.get(graph.code_ids[code], 0)),
+            'eligible_before': int(before.sum()),
+            'eligible_after': int(after.sum()),
+            'gained': int(gained.sum()),
+            'lost': int(lost.sum())
+        }
+
+    # Students per department (missing departments are code -1, shifted to bin 0)
+    department_codes = table.department.codes[rows].astype(np.int64) + 1
+    bins = len(table.department.categories) + 1
+    gaining = np.bincount(department_codes[gained_any], minlength=bins)
+    losing = np.bincount(department_codes[lost_any], minlength=bins)
+    affected = np.bincount(department_codes[gained_any | lost_any], minlength=bins)
+    names = [UNKNOWN_DEPARTMENT] + table.department.categories
+    departments = {}
+    for i in np.flatnonzero(affected).tolist():
+        # Merged with a department actually named UNKNOWN_DEPARTMENT
+        counts = departments.setdefault(names[i], {'students_gaining': 0, 'students_losing': 0, 'students_affected': 0})
+        counts['students_gaining'] += int(gaining[i])
+        counts['students_losing'] += int(losing[i])
+        counts['students_affected'] += int(affected[i])
+
+    return {
+        'students': len(rows),
+        'students_gaining': int(gained_any.sum()),
+        'students_losing': int(lost_any.sum()),
+        'students_affected': int((gained_any | lost_any).sum()),
+        'courses': courses,
+        'departments': departments,
+        'downstream_courses': downstream,
+        'dangling_prerequisites': dangling
+    }
@@ -99,5 +99,5 @@
       animation: ${0} 1.4s linear infinite;
     `),bl)})),Sl=(0,vt.Ay)("svg",{name:"MuiCircularProgress",slot:"Svg",overridesResolver:(e,t)=>t.svg})({display:"block"}),Al=(0,vt.Ay)("circle",{name:"MuiCircularProgress",slot:"Circle",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.circle,t[`circle${(0,Xt.A)(n.variant)}`],n.disableShrink&&t.circleDisableShrink]}})((e=>{let{ownerState:t,theme:n}=e;return(0,ut.A)({stroke:"currentColor"},"determinate"===t.variant&&{transition:n.transitions.create("stroke-dashoffset")},"indeterminate"===t.variant&&{strokeDasharray:"80px, 200px",strokeDashoffset:0})}),(e=>{let{ownerState:t}=e;return"indeterminate"===t.variant&&!t.disableShrink&&En(yl||(yl=vl`
       animation: ${0} 1.4s ease-in-out infinite;
-    `),xl)})),Ol=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiCircularProgress"}),{className:r,color:o="primary",disableShrink:i=!1,size:a=40,style:l,thickness:s=3.6,value:u=0,variant:c="indeterminate"}=n,d=(0,st.A)(n,fl),f=(0,ut.A)({},n,{color:o,disableShrink:i,size:a,thickness:s,value:u,variant:c}),p=(e=>{const{classes:t,variant:n,color:r,disableShrink:o}=e,i={root:["root",n,`color${(0,Xt.A)(r)}`],svg:["svg"],circle:["circle",`circle${(0,Xt.A)(n)}`,o&&"circleDisableShrink"]};return(0,yt.A)(i,dl,t)})(f),h={},m={},y={};if("determinate"===c){const e=2*Math.PI*((gl-s)/2);h.strokeDasharray=e.toFixed(3),y["aria-valuenow"]=Math.round(u),h.strokeDashoffset=`${((100-u)/100*e).toFixed(3)}px`,m.transform="rotate(-90deg)"}return(0,Pt.jsx)(wl,(0,ut.A)({className:(0,ct.A)(p.root,r),style:(0,ut.A)({width:a,height:a},m,l),ownerState:f,ref:t,role:"progressbar"},y,d,{children:(0,Pt.jsx)(Sl,{className:p.svg,ownerState:f,viewBox:"22 22 44 44",children:(0,Pt.jsx)(Al,{className:p.circle,style:h,ownerState:f,cx:gl,cy:gl,r:(gl-s)/2,fill:"none",strokeWidth:s})})}))})),kl=Ol;function jl(e){return e.substring(2).toLowerCase()}const El=function(e){const{children:n,disableReactTree:r=!1,mouseEvent:o="onClick",onClickAway:i,touchEvent:a="onTouchEnd"}=e,l=t.useRef(!1),s=t.useRef(null),u=t.useRef(!1),c=t.useRef(!1);t.useEffect((()=>(setTimeout((()=>{u.current=!0}),0),()=>{u.current=!1})),[]);const d=(0,br.A)(n.ref,s),f=(0,ki.A)((e=>{const t=c.current;c.current=!1;const n=(0,Oi.A)(s.current);if(!u.current||!s.current||"clientX"in e&&function(e,t){return t.documentElement.clientWidth<e.clientX||t.documentElement.clientHeight<e.clientY}(e,n))return;if(l.current)return void(l.current=!1);let o;o=e.composedPath?e.composedPath().indexOf(s.current)>-1:!n.documentElement.contains(e.target)||s.current.contains(e.target),o||!r&&t||i(e)})),p=e=>t=>{c.current=!0;const r=n.props[e];r&&r(t)},h={ref:d};return!1!==a&&(h[a]=p(a)),t.useEffect((()=>{if(!1!==a){const e=jl(a),t=(0,Oi.A)(s.current),n=()=>{l.current=!0};return t.addEventListener(e,f),t.addEventListener("touchmove",n),()=>{t.removeEventListener(e,f),t.removeEventListener("touchmove",n)}}}),[f,a]),!1!==o&&(h[o]=p(o)),t.useEffect((()=>{if(!1!==o){const e=jl(o),t=(0,Oi.A)(s.current);return t.addEventListener(e,f),()=>{t.removeEventListener(e,f)}}}),[f,o]),(0,Pt.jsx)(t.Fragment,{children:t.cloneElement(n,h)})};function Cl(e){return(0,kt.Ay)("MuiSnackbarContent",e)}(0,Ot.A)("MuiSnackbarContent",["root","message","action"]);const Pl=["action","className","message","role"],Ml=(0,vt.Ay)(sn,{name:"MuiSnackbarContent",slot:"Root",overridesResolver:(e,t)=>t.root})((e=>{let{theme:t}=e;const n="light"===t.palette.mode?.8:.98,r=(0,tn.tL)(t.palette.background.default,n);return(0,ut.A)({},t.typography.body2,{color:t.vars?t.vars.palette.SnackbarContent.color:t.palette.getContrastText(r),backgroundColor:t.vars?t.vars.palette.SnackbarContent.bg:r,display:"flex",alignItems:"center",flexWrap:"wrap",padding:"6px 16px",borderRadius:(t.vars||t).shape.borderRadius,flexGrow:1,[t.breakpoints.up("sm")]:{flexGrow:"initial",minWidth:288}})})),Tl=(0,vt.Ay)("div",{name:"MuiSnackbarContent",slot:"Message",overridesResolver:(e,t)=>t.message})({padding:"8px 0"}),_l=(0,vt.Ay)("div",{name:"MuiSnackbarContent",slot:"Action",overridesResolver:(e,t)=>t.action})({display:"flex",alignItems:"center",marginLeft:"auto",paddingLeft:16,marginRight:-8}),Rl=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiSnackbarContent"}),{action:r,className:o,message:i,role:a="alert"}=n,l=(0,st.A)(n,Pl),s=n,u=(e=>{const{classes:t}=e;return(0,yt.A)({root:["root"],action:["action"],message:["message"]},Cl,t)})(s);return(0,Pt.jsxs)(Ml,(0,ut.A)({role:a,square:!0,elevation:6,className:(0,ct.A)(u.root,o),ownerState:s,ref:t},l,{children:[(0,Pt.jsx)(Tl,{className:u.message,ownerState:s,children:i}),r?(0,Pt.jsx)(_l,{className:u.action,ownerState:s,children:r}):null]}))}));function Nl(e){return(0,kt.Ay)("MuiSnackbar",e)}(0,Ot.A)("MuiSnackbar",["root","anchorOriginTopCenter","anchorOriginBottomCenter","anchorOriginTopRight","anchorOriginBottomRight","anchorOriginTopLeft","anchorOriginBottomLeft"]);const Il=["onEnter","onExited"],Dl=["action","anchorOrigin","autoHideDuration","children","className","ClickAwayListenerProps","ContentProps","disableWindowBlurListener","message","onBlur","onClose","onFocus","onMouseEnter","onMouseLeave","open","resumeHideDuration","TransitionComponent","transitionDuration","TransitionProps"],Ll=(0,vt.Ay)("div",{name:"MuiSnackbar",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[`anchorOrigin${(0,Xt.A)(n.anchorOrigin.vertical)}${(0,Xt.A)(n.anchorOrigin.horizontal)}`]]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({zIndex:(t.vars||t).zIndex.snackbar,position:"fixed",display:"flex",left:8,right:8,justifyContent:"center",alignItems:"center"},"top"===n.anchorOrigin.vertical?{top:8}:{bottom:8},"left"===n.anchorOrigin.horizontal&&{justifyContent:"flex-start"},"right"===n.anchorOrigin.horizontal&&{justifyContent:"flex-end"},{[t.breakpoints.up("sm")]:(0,ut.A)({},"top"===n.anchorOrigin.vertical?{top:24}:{bottom:24},"center"===n.anchorOrigin.horizontal&&{left:"50%",right:"auto",transform:"translateX(-50%)"},"left"===n.anchorOrigin.horizontal&&{left:24,right:"auto"},"right"===n.anchorOrigin.horizontal&&{right:24,left:"auto"})})})),zl=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiSnackbar"}),o=St(),i={enter:o.transitions.duration.enteringScreen,exit:o.transitions.duration.leavingScreen},{action:a,anchorOrigin:{vertical:l,horizontal:s}={vertical:"bottom",horizontal:"left"},autoHideDuration:u=null,children:c,className:d,ClickAwayListenerProps:f,ContentProps:p,disableWindowBlurListener:h=!1,message:m,open:y,TransitionComponent:v=Ai,transitionDuration:g=i,TransitionProps:{onEnter:b,onExited:x}={}}=r,w=(0,st.A)(r.TransitionProps,Il),S=(0,st.A)(r,Dl),A=(0,ut.A)({},r,{anchorOrigin:{vertical:l,horizontal:s},autoHideDuration:u,disableWindowBlurListener:h,TransitionComponent:v,transitionDuration:g}),O=(e=>{const{classes:t,anchorOrigin:n}=e,r={root:["root",`anchorOrigin${(0,Xt.A)(n.vertical)}${(0,Xt.A)(n.horizontal)}`]};return(0,yt.A)(r,Nl,t)})(A),{getRootProps:k,onClickAway:j}=function(e){const{autoHideDuration:n=null,disableWindowBlurListener:r=!1,onClose:o,open:i,resumeHideDuration:a}=e,l=t.useRef();t.useEffect((()=>{if(i)return document.addEventListener("keydown",e),()=>{document.removeEventListener("keydown",e)};function e(e){e.defaultPrevented||"Escape"!==e.key&&"Esc"!==e.key||null==o||o(e,"escapeKeyDown")}}),[i,o]);const s=(0,ki.A)(((e,t)=>{null==o||o(e,t)})),u=(0,ki.A)((e=>{o&&null!=e&&(clearTimeout(l.current),l.current=setTimeout((()=>{s(null,"timeout")}),e))}));t.useEffect((()=>(i&&u(n),()=>{clearTimeout(l.current)})),[i,n,u]);const c=()=>{clearTimeout(l.current)},d=t.useCallback((()=>{null!=n&&u(null!=a?a:.5*n)}),[n,a,u]),f=e=>t=>{const n=e.onBlur;null==n||n(t),d()},p=e=>t=>{const n=e.onFocus;null==n||n(t),c()},h=e=>t=>{const n=e.onMouseEnter;null==n||n(t),c()},m=e=>t=>{const n=e.onMouseLeave;null==n||n(t),d()};return t.useEffect((()=>{if(!r&&i)return window.addEventListener("focus",d),window.addEventListener("blur",c),()=>{window.removeEventListener("focus",d),window.removeEventListener("blur",c)}}),[r,d,i]),{getRootProps:function(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const n=Wi(e),r=(0,ut.A)({},n,t);return(0,ut.A)({role:"presentation"},r,{onBlur:f(r),onFocus:p(r),onMouseEnter:h(r),onMouseLeave:m(r)})},onClickAway:e=>{null==o||o(e,"clickaway")}}}((0,ut.A)({},A)),[E,C]=t.useState(!0),P=qi({elementType:Ll,getSlotProps:k,externalForwardedProps:S,ownerState:A,additionalProps:{ref:n},className:[O.root,d]});return!y&&E?null:(0,Pt.jsx)(El,(0,ut.A)({onClickAway:j},f,{children:(0,Pt.jsx)(Ll,(0,ut.A)({},P,{children:(0,Pt.jsx)(v,(0,ut.A)({appear:!0,in:y,timeout:g,direction:"top"===l?"down":"up",onEnter:(e,t)=>{C(!1),b&&b(e,t)},onExited:e=>{C(!0),x&&x(e)}},w,{children:c||(0,Pt.jsx)(Rl,(0,ut.A)({message:m,action:a},p))}))}))}))}));function $l(e){return(0,kt.Ay)("MuiAlert",e)}const Bl=(0,Ot.A)("MuiAlert",["root","action","icon","message","filled","filledSuccess","filledInfo","filledWarning","filledError","outlined","outlinedSuccess","outlinedInfo","outlinedWarning","outlinedError","standard","standardSuccess","standardInfo","standardWarning","standardError"]);function Fl(e){return(0,kt.Ay)("MuiIconButton",e)}const Wl=(0,Ot.A)("MuiIconButton",["root","disabled","colorInherit","colorPrimary","colorSecondary","colorError","colorInfo","colorSuccess","colorWarning","edgeStart","edgeEnd","sizeSmall","sizeMedium","sizeLarge"]),Ul=["edge","children","className","color","disabled","disableFocusRipple","size"],Hl=(0,vt.Ay)(Kn,{name:"MuiIconButton",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,"default"!==n.color&&t[`color${(0,Xt.A)(n.color)}`],n.edge&&t[`edge${(0,Xt.A)(n.edge)}`],t[`size${(0,Xt.A)(n.size)}`]]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({textAlign:"center",flex:"0 0 auto",fontSize:t.typography.pxToRem(24),padding:8,borderRadius:"50%",overflow:"visible",color:(t.vars||t).palette.action.active,transition:t.transitions.create("background-color",{duration:t.transitions.duration.shortest})},!n.disableRipple&&{"&:hover":{backgroundColor:t.vars?`rgba(${t.vars.palette.action.activeChannel} / ${t.vars.palette.action.hoverOpacity})`:(0,tn.X4)(t.palette.action.active,t.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}}},"start"===n.edge&&{marginLeft:"small"===n.size?-3:-12},"end"===n.edge&&{marginRight:"small"===n.size?-3:-12})}),(e=>{let{theme:t,ownerState:n}=e;var r;const o=null==(r=(t.vars||t).palette)?void 0:r[n.color];return(0,ut.A)({},"inherit"===n.color&&{color:"inherit"},"inherit"!==n.color&&"default"!==n.color&&(0,ut.A)({color:null==o?void 0:o.main},!n.disableRipple&&{"&:hover":(0,ut.A)({},o&&{backgroundColor:t.vars?`rgba(${o.mainChannel} / ${t.vars.palette.action.hoverOpacity})`:(0,tn.X4)(o.main,t.palette.action.hoverOpacity)},{"@media (hover: none)":{backgroundColor:"transparent"}})}),"small"===n.size&&{padding:5,fontSize:t.typography.pxToRem(18)},"large"===n.size&&{padding:12,fontSize:t.typography.pxToRem(28)},{[`&.${Wl.disabled}`]:{backgroundColor:"transparent",color:(t.vars||t).palette.action.disabled}})})),Vl=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiIconButton"}),{edge:r=!1,children:o,className:i,color:a="default",disabled:l=!1,disableFocusRipple:s=!1,size:u="medium"}=n,c=(0,st.A)(n,Ul),d=(0,ut.A)({},n,{edge:r,color:a,disabled:l,disableFocusRipple:s,size:u}),f=(e=>{const{classes:t,disabled:n,color:r,edge:o,size:i}=e,a={root:["root",n&&"disabled","default"!==r&&`color${(0,Xt.A)(r)}`,o&&`edge${(0,Xt.A)(o)}`,`size${(0,Xt.A)(i)}`]};return(0,yt.A)(a,Fl,t)})(d);return(0,Pt.jsx)(Hl,(0,ut.A)({className:(0,ct.A)(f.root,i),centerRipple:!0,focusRipple:!s,disabled:l,ref:t,ownerState:d},c,{children:o}))})),ql=Vl,Xl=(0,Ya.A)((0,Pt.jsx)("path",{d:"M20,12A8,8 0 0,1 12,20A8,8 0 0,1 4,12A8,8 0 0,1 12,4C12.76,4 13.5,4.11 14.2, 4.31L15.77,2.74C14.61,2.26 13.34,2 12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0, 0 22,12M7.91,10.08L6.5,11.5L11,16L21,6L19.59,4.58L11,13.17L7.91,10.08Z"}),"SuccessOutlined"),Kl=(0,Ya.A)((0,Pt.jsx)("path",{d:"M12 5.99L19.53 19H4.47L12 5.99M12 2L1 21h22L12 2zm1 14h-2v2h2v-2zm0-6h-2v4h2v-4z"}),"ReportProblemOutlined"),Gl=(0,Ya.A)((0,Pt.jsx)("path",{d:"M11 15h2v2h-2zm0-8h2v6h-2zm.99-5C6.47 2 2 6.48 2 12s4.47 10 9.99 10C17.52 22 22 17.52 22 12S17.52 2 11.99 2zM12 20c-4.42 0-8-3.58-8-8s3.58-8 8-8 8 3.58 8 8-3.58 8-8 8z"}),"ErrorOutline"),Yl=(0,Ya.A)((0,Pt.jsx)("path",{d:"M11,9H13V7H11M12,20C7.59,20 4,16.41 4,12C4,7.59 7.59,4 12,4C16.41,4 20,7.59 20, 12C20,16.41 16.41,20 12,20M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10, 10 0 0,0 12,2M11,17H13V11H11V17Z"}),"InfoOutlined"),Ql=(0,Ya.A)((0,Pt.jsx)("path",{d:"M19 6.41L17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"}),"Close"),Jl=["action","children","className","closeText","color","components","componentsProps","icon","iconMapping","onClose","role","severity","slotProps","slots","variant"],Zl=(0,vt.Ay)(sn,{name:"MuiAlert",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[n.variant],t[`${n.variant}${(0,Xt.A)(n.color||n.severity)}`]]}})((e=>{let{theme:t,ownerState:n}=e;const r="light"===t.palette.mode?tn.e$:tn.a,o="light"===t.palette.mode?tn.a:tn.e$,i=n.color||n.severity;return(0,ut.A)({},t.typography.body2,{backgroundColor:"transparent",display:"flex",padding:"6px 16px"},i&&"standard"===n.variant&&{color:t.vars?t.vars.palette.Alert[`${i}Color`]:r(t.palette[i].light,.6),backgroundColor:t.vars?t.vars.palette.Alert[`${i}StandardBg`]:o(t.palette[i].light,.9),[`& .${Bl.icon}`]:t.vars?{color:t.vars.palette.Alert[`${i}IconColor`]}:{color:t.palette[i].main}},i&&"outlined"===n.variant&&{color:t.vars?t.vars.palette.Alert[`${i}Color`]:r(t.palette[i].light,.6),border:`1px solid ${(t.vars||t).palette[i].light}`,[`& .${Bl.icon}`]:t.vars?{color:t.vars.palette.Alert[`${i}IconColor`]}:{color:t.palette[i].main}},i&&"filled"===n.variant&&(0,ut.A)({fontWeight:t.typography.fontWeightMedium},t.vars?{color:t.vars.palette.Alert[`${i}FilledColor`],backgroundColor:t.vars.palette.Alert[`${i}FilledBg`]}:{backgroundColor:"dark"===t.palette.mode?t.palette[i].dark:t.palette[i].main,color:t.palette.getContrastText(t.palette[i].main)}))})),es=(0,vt.Ay)("div",{name:"MuiAlert",slot:"Icon",overridesResolver:(e,t)=>t.icon})({marginRight:12,padding:"7px 0",display:"flex",fontSize:22,opacity:.9}),ts=(0,vt.Ay)("div",{name:"MuiAlert",slot:"Message",overridesResolver:(e,t)=>t.message})({padding:"8px 0",minWidth:0,overflow:"auto"}),ns=(0,vt.Ay)("div",{name:"MuiAlert",slot:"Action",overridesResolver:(e,t)=>t.action})({display:"flex",alignItems:"flex-start",padding:"4px 0 0 16px",marginLeft:"auto",marginRight:-8}),rs={success:(0,Pt.jsx)(Xl,{fontSize:"inherit"}),warning:(0,Pt.jsx)(Kl,{fontSize:"inherit"}),error:(0,Pt.jsx)(Gl,{fontSize:"inherit"}),info:(0,Pt.jsx)(Yl,{fontSize:"inherit"})},os=t.forwardRef((function(e,t){var n,r,o,i,a,l;const s=(0,gt.A)({props:e,name:"MuiAlert"}),{action:u,children:c,className:d,closeText:f="Close",color:p,components:h={},componentsProps:m={},icon:y,iconMapping:v=rs,onClose:g,role:b="alert",severity:x="success",slotProps:w={},slots:S={},variant:A="standard"}=s,O=(0,st.A)(s,Jl),k=(0,ut.A)({},s,{color:p,severity:x,variant:A}),j=(e=>{const{variant:t,color:n,severity:r,classes:o}=e,i={root:["root",`${t}${(0,Xt.A)(n||r)}`,`${t}`],icon:["icon"],message:["message"],action:["action"]};return(0,yt.A)(i,$l,o)})(k),E=null!=(n=null!=(r=S.closeButton)?r:h.CloseButton)?n:ql,C=null!=(o=null!=(i=S.closeIcon)?i:h.CloseIcon)?o:Ql,P=null!=(a=w.closeButton)?a:m.closeButton,M=null!=(l=w.closeIcon)?l:m.closeIcon;return(0,Pt.jsxs)(Zl,(0,ut.A)({role:b,elevation:0,ownerState:k,className:(0,ct.A)(j.root,d),ref:t},O,{children:[!1!==y?(0,Pt.jsx)(es,{ownerState:k,className:j.icon,children:y||v[x]||rs[x]}):null,(0,Pt.jsx)(ts,{ownerState:k,className:j.message,children:c}),null!=u?(0,Pt.jsx)(ns,{ownerState:k,className:j.action,children:u}):null,null==u&&g?(0,Pt.jsx)(ns,{ownerState:k,className:j.action,children:(0,Pt.jsx)(E,(0,ut.A)({size:"small","aria-label":f,title:f,color:"inherit",onClick:g},P,{children:(0,Pt.jsx)(C,(0,ut.A)({fontSize:"small"},M))}))}):null]}))})),is=os;function as(e){if(null==e)return window;if("[object Window]"!==e.toString()){var t=e.ownerDocument;return t&&t.defaultView||window}return e}function ls(e){return e instanceof as(e).Element||e instanceof Element}function ss(e){return e instanceof as(e).HTMLElement||e instanceof HTMLElement}function us(e){return"undefined"!==typeof ShadowRoot&&(e instanceof as(e).ShadowRoot||e instanceof ShadowRoot)}var cs=Math.max,ds=Math.min,fs=Math.round;function ps(){var e=navigator.userAgentData;return null!=e&&e.brands&&Array.isArray(e.brands)?e.brands.map((function(e){return e.brand+"/"+e.version})).join(" "):navigator.userAgent}function hs(){return!/^((?!chrome|android).)*safari/i.test(ps())}function ms(e,t,n){void 0===t&&(t=!1),void 0===n&&(n=!1);var r=e.getBoundingClientRect(),o=1,i=1;t&&ss(e)&&(o=e.offsetWidth>0&&fs(r.width)/e.offsetWidth||1,i=e.offsetHeight>0&&fs(r.height)/e.offsetHeight||1);var a=(ls(e)?as(e):window).visualViewport,l=!hs()&&n,s=(r.left+(l&&a?a.offsetLeft:0))/o,u=(r.top+(l&&a?a.offsetTop:0))/i,c=r.width/o,d=r.height/i;return{width:c,height:d,top:u,right:s+c,bottom:u+d,left:s,x:s,y:u}}function ys(e){var t=as(e);return{scrollLeft:t.pageXOffset,scrollTop:t.pageYOffset}}function vs(e){return e?(e.nodeName||"").toLowerCase():null}function gs(e){return((ls(e)?e.ownerDocument:e.document)||window.document).documentElement}function bs(e){return ms(gs(e)).left+ys(e).scrollLeft}function xs(e){return as(e).getComputedStyle(e)}function ws(e){var t=xs(e),n=t.overflow,r=t.overflowX,o=t.overflowY;return/auto|scroll|overlay|hidden/.test(n+o+r)}function Ss(e,t,n){void 0===n&&(n=!1);var r=ss(t),o=ss(t)&&function(e){var t=e.getBoundingClientRect(),n=fs(t.width)/e.offsetWidth||1,r=fs(t.height)/e.offsetHeight||1;return 1!==n||1!==r}(t),i=gs(t),a=ms(e,o,n),l={scrollLeft:0,scrollTop:0},s={x:0,y:0};return(r||!r&&!n)&&(("body"!==vs(t)||ws(i))&&(l=function(e){return e!==as(e)&&ss(e)?{scrollLeft:(t=e).scrollLeft,scrollTop:t.scrollTop}:ys(e);var t}(t)),ss(t)?((s=ms(t,!0)).x+=t.clientLeft,s.y+=t.clientTop):i&&(s.x=bs(i))),{x:a.left+l.scrollLeft-s.x,y:a.top+l.scrollTop-s.y,width:a.width,height:a.height}}function As(e){var t=ms(e),n=e.offsetWidth,r=e.offsetHeight;return Math.abs(t.width-n)<=1&&(n=t.width),Math.abs(t.height-r)<=1&&(r=t.height),{x:e.offsetLeft,y:e.offsetTop,width:n,height:r}}function Os(e){return"html"===vs(e)?e:e.assignedSlot||e.parentNode||(us(e)?e.host:null)||gs(e)}function ks(e){return["html","body","#document"].indexOf(vs(e))>=0?e.ownerDocument.body:ss(e)&&ws(e)?e:ks(Os(e))}function js(e,t){var n;void 0===t&&(t=[]);var r=ks(e),o=r===(null==(n=e.ownerDocument)?void 0:n.body),i=as(r),a=o?[i].concat(i.visualViewport||[],ws(r)?r:[]):r,l=t.concat(a);return o?l:l.concat(js(Os(a)))}function Es(e){return["table","td","th"].indexOf(vs(e))>=0}function Cs(e){return ss(e)&&"fixed"!==xs(e).position?e.offsetParent:null}function Ps(e){for(var t=as(e),n=Cs(e);n&&Es(n)&&"static"===xs(n).position;)n=Cs(n);return n&&("html"===vs(n)||"body"===vs(n)&&"static"===xs(n).position)?t:n||function(e){var t=/firefox/i.test(ps());if(/Trident/i.test(ps())&&ss(e)&&"fixed"===xs(e).position)return null;var n=Os(e);for(us(n)&&(n=n.host);ss(n)&&["html","body"].indexOf(vs(n))<0;){var r=xs(n);if("none"!==r.transform||"none"!==r.perspective||"paint"===r.contain||-1!==["transform","perspective"].indexOf(r.willChange)||t&&"filter"===r.willChange||t&&r.filter&&"none"!==r.filter)return n;n=n.parentNode}return null}(e)||t}var Ms="top",Ts="bottom",_s="right",Rs="left",Ns="auto",Is=[Ms,Ts,_s,Rs],Ds="start",Ls="end",zs="viewport",$s="popper",Bs=Is.reduce((function(e,t){return e.concat([t+"-"+Ds,t+"-"+Ls])}),[]),Fs=[].concat(Is,[Ns]).reduce((function(e,t){return e.concat([t,t+"-"+Ds,t+"-"+Ls])}),[]),Ws=["beforeRead","read","afterRead","beforeMain","main","afterMain","beforeWrite","write","afterWrite"];function Us(e){var t=new Map,n=new Set,r=[];function o(e){n.add(e.name),[].concat(e.requires||[],e.requiresIfExists||[]).forEach((function(e){if(!n.has(e)){var r=t.get(e);r&&o(r)}})),r.push(e)}return e.forEach((function(e){t.set(e.name,e)})),e.forEach((function(e){n.has(e.name)||o(e)})),r}function Hs(e){var t;return function(){return t||(t=new Promise((function(n){Promise.resolve().then((function(){t=void 0,n(e())}))}))),t}}var Vs={placement:"bottom",modifiers:[],strategy:"absolute"};function qs(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return!t.some((function(e){return!(e&&"function"===typeof e.getBoundingClientRect)}))}function Xs(e){void 0===e&&(e={});var t=e,n=t.defaultModifiers,r=void 0===n?[]:n,o=t.defaultOptions,i=void 0===o?Vs:o;return function(e,t,n){void 0===n&&(n=i);var o={placement:"bottom",orderedModifiers:[],options:Object.assign({},Vs,i),modifiersData:{},elements:{reference:e,popper:t},attributes:{},styles:{}},a=[],l=!1,s={state:o,setOptions:function(n){var l="function"===typeof n?n(o.options):n;u(),o.options=Object.assign({},i,o.options,l),o.scrollParents={reference:ls(e)?js(e):e.contextElement?js(e.contextElement):[],popper:js(t)};var c=function(e){var t=Us(e);return Ws.reduce((function(e,n){return e.concat(t.filter((function(e){return e.phase===n})))}),[])}(function(e){var t=e.reduce((function(e,t){var n=e[t.name];return e[t.name]=n?Object.assign({},n,t,{options:Object.assign({},n.options,t.options),data:Object.assign({},n.data,t.data)}):t,e}),{});return Object.keys(t).map((function(e){return t[e]}))}([].concat(r,o.options.modifiers)));return o.orderedModifiers=c.filter((function(e){return e.enabled})),o.orderedModifiers.forEach((function(e){var t=e.name,n=e.options,r=void 0===n?{}:n,i=e.effect;if("function"===typeof i){var l=i({state:o,name:t,instance:s,options:r}),u=function(){};a.push(l||u)}})),s.update()},forceUpdate:function(){if(!l){var e=o.elements,t=e.reference,n=e.popper;if(qs(t,n)){o.rects={reference:Ss(t,Ps(n),"fixed"===o.options.strategy),popper:As(n)},o.reset=!1,o.placement=o.options.placement,o.orderedModifiers.forEach((function(e){return o.modifiersData[e.name]=Object.assign({},e.data)}));for(var r=0;r<o.orderedModifiers.length;r++)if(!0!==o.reset){var i=o.orderedModifiers[r],a=i.fn,u=i.options,c=void 0===u?{}:u,d=i.name;"function"===typeof a&&(o=a({state:o,options:c,name:d,instance:s})||o)}else o.reset=!1,r=-1}}},update:Hs((function(){return new Promise((function(e){s.forceUpdate(),e(o)}))})),destroy:function(){u(),l=!0}};if(!qs(e,t))return s;function u(){a.forEach((function(e){return e()})),a=[]}return s.setOptions(n).then((function(e){!l&&n.onFirstUpdate&&n.onFirstUpdate(e)})),s}}var Ks={passive:!0};function Gs(e){return e.split("-")[0]}function Ys(e){return e.split("-")[1]}function Qs(e){return["top","bottom"].indexOf(e)>=0?"x":"y"}function Js(e){var t,n=e.reference,r=e.element,o=e.placement,i=o?Gs(o):null,a=o?Ys(o):null,l=n.x+n.width/2-r.width/2,s=n.y+n.height/2-r.height/2;switch(i){case Ms:t={x:l,y:n.y-r.height};break;case Ts:t={x:l,y:n.y+n.height};break;case _s:t={x:n.x+n.width,y:s};break;case Rs:t={x:n.x-r.width,y:s};break;default:t={x:n.x,y:n.y}}var u=i?Qs(i):null;if(null!=u){var c="y"===u?"height":"width";switch(a){case Ds:t[u]=t[u]-(n[c]/2-r[c]/2);break;case Ls:t[u]=t[u]+(n[c]/2-r[c]/2)}}return t}var Zs={top:"auto",right:"auto",bottom:"auto",left:"auto"};function eu(e){var t,n=e.popper,r=e.popperRect,o=e.placement,i=e.variation,a=e.offsets,l=e.position,s=e.gpuAcceleration,u=e.adaptive,c=e.roundOffsets,d=e.isFixed,f=a.x,p=void 0===f?0:f,h=a.y,m=void 0===h?0:h,y="function"===typeof c?c({x:p,y:m}):{x:p,y:m};p=y.x,m=y.y;var v=a.hasOwnProperty("x"),g=a.hasOwnProperty("y"),b=Rs,x=Ms,w=window;if(u){var S=Ps(n),A="clientHeight",O="clientWidth";if(S===as(n)&&"static"!==xs(S=gs(n)).position&&"absolute"===l&&(A="scrollHeight",O="scrollWidth"),o===Ms||(o===Rs||o===_s)&&i===Ls)x=Ts,m-=(d&&S===w&&w.visualViewport?w.visualViewport.height:S[A])-r.height,m*=s?1:-1;if(o===Rs||(o===Ms||o===Ts)&&i===Ls)b=_s,p-=(d&&S===w&&w.visualViewport?w.visualViewport.width:S[O])-r.width,p*=s?1:-1}var k,j=Object.assign({position:l},u&&Zs),E=!0===c?function(e,t){var n=e.x,r=e.y,o=t.devicePixelRatio||1;return{x:fs(n*o)/o||0,y:fs(r*o)/o||0}}({x:p,y:m},as(n)):{x:p,y:m};return p=E.x,m=E.y,s?Object.assign({},j,((k={})[x]=g?"0":"",k[b]=v?"0":"",k.transform=(w.devicePixelRatio||1)<=1?"translate("+p+"px, "+m+"px)":"translate3d("+p+"px, "+m+"px, 0)",k)):Object.assign({},j,((t={})[x]=g?m+"px":"",t[b]=v?p+"px":"",t.transform="",t))}const tu={name:"applyStyles",enabled:!0,phase:"write",fn:function(e){var t=e.state;Object.keys(t.elements).forEach((function(e){var n=t.styles[e]||{},r=t.attributes[e]||{},o=t.elements[e];ss(o)&&vs(o)&&(Object.assign(o.style,n),Object.keys(r).forEach((function(e){var t=r[e];!1===t?o.removeAttribute(e):o.setAttribute(e,!0===t?"":t)})))}))},effect:function(e){var t=e.state,n={popper:{position:t.options.strategy,left:"0",top:"0",margin:"0"},arrow:{position:"absolute"},reference:{}};return Object.assign(t.elements.popper.style,n.popper),t.styles=n,t.elements.arrow&&Object.assign(t.elements.arrow.style,n.arrow),function(){Object.keys(t.elements).forEach((function(e){var r=t.elements[e],o=t.attributes[e]||{},i=Object.keys(t.styles.hasOwnProperty(e)?t.styles[e]:n[e]).reduce((function(e,t){return e[t]="",e}),{});ss(r)&&vs(r)&&(Object.assign(r.style,i),Object.keys(o).forEach((function(e){r.removeAttribute(e)})))}))}},requires:["computeStyles"]};const nu={name:"offset",enabled:!0,phase:"main",requires:["popperOffsets"],fn:function(e){var t=e.state,n=e.options,r=e.name,o=n.offset,i=void 0===o?[0,0]:o,a=Fs.reduce((function(e,n){return e[n]=function(e,t,n){var r=Gs(e),o=[Rs,Ms].indexOf(r)>=0?-1:1,i="function"===typeof n?n(Object.assign({},t,{placement:e})):n,a=i[0],l=i[1];return a=a||0,l=(l||0)*o,[Rs,_s].indexOf(r)>=0?{x:l,y:a}:{x:a,y:l}}(n,t.rects,i),e}),{}),l=a[t.placement],s=l.x,u=l.y;null!=t.modifiersData.popperOffsets&&(t.modifiersData.popperOffsets.x+=s,t.modifiersData.popperOffsets.y+=u),t.modifiersData[r]=a}};var ru={left:"right",right:"left",bottom:"top",top:"bottom"};function ou(e){return e.replace(/left|right|bottom|top/g,(function(e){return ru[e]}))}var iu={start:"end",end:"start"};function au(e){return e.replace(/start|end/g,(function(e){return iu[e]}))}function lu(e,t){var n=t.getRootNode&&t.getRootNode();if(e.contains(t))return!0;if(n&&us(n)){var r=t;do{if(r&&e.isSameNode(r))return!0;r=r.parentNode||r.host}while(r)}return!1}function su(e){return Object.assign({},e,{left:e.x,top:e.y,right:e.x+e.width,bottom:e.y+e.height})}function uu(e,t,n){return t===zs?su(function(e,t){var n=as(e),r=gs(e),o=n.visualViewport,i=r.clientWidth,a=r.clientHeight,l=0,s=0;if(o){i=o.width,a=o.height;var u=hs();(u||!u&&"fixed"===t)&&(l=o.offsetLeft,s=o.offsetTop)}return{width:i,height:a,x:l+bs(e),y:s}}(e,n)):ls(t)?function(e,t){var n=ms(e,!1,"fixed"===t);return n.top=n.top+e.clientTop,n.left=n.left+e.clientLeft,n.bottom=n.top+e.clientHeight,n.right=n.left+e.clientWidth,n.width=e.clientWidth,n.height=e.clientHeight,n.x=n.left,n.y=n.top,n}(t,n):su(function(e){var t,n=gs(e),r=ys(e),o=null==(t=e.ownerDocument)?void 0:t.body,i=cs(n.scrollWidth,n.clientWidth,o?o.scrollWidth:0,o?o.clientWidth:0),a=cs(n.scrollHeight,n.clientHeight,o?o.scrollHeight:0,o?o.clientHeight:0),l=-r.scrollLeft+bs(e),s=-r.scrollTop;return"rtl"===xs(o||n).direction&&(l+=cs(n.clientWidth,o?o.clientWidth:0)-i),{width:i,height:a,x:l,y:s}}(gs(e)))}function cu(e,t,n,r){var o="clippingParents"===t?function(e){var t=js(Os(e)),n=["absolute","fixed"].indexOf(xs(e).position)>=0&&ss(e)?Ps(e):e;return ls(n)?t.filter((function(e){return ls(e)&&lu(e,n)&&"body"!==vs(e)})):[]}(e):[].concat(t),i=[].concat(o,[n]),a=i[0],l=i.reduce((function(t,n){var o=uu(e,n,r);return t.top=cs(o.top,t.top),t.right=ds(o.right,t.right),t.bottom=ds(o.bottom,t.bottom),t.left=cs(o.left,t.left),t}),uu(e,a,r));return l.width=l.right-l.left,l.height=l.bottom-l.top,l.x=l.left,l.y=l.top,l}function du(e){return Object.assign({},{top:0,right:0,bottom:0,left:0},e)}function fu(e,t){return t.reduce((function(t,n){return t[n]=e,t}),{})}function pu(e,t){void 0===t&&(t={});var n=t,r=n.placement,o=void 0===r?e.placement:r,i=n.strategy,a=void 0===i?e.strategy:i,l=n.boundary,s=void 0===l?"clippingParents":l,u=n.rootBoundary,c=void 0===u?zs:u,d=n.elementContext,f=void 0===d?$s:d,p=n.altBoundary,h=void 0!==p&&p,m=n.padding,y=void 0===m?0:m,v=du("number"!==typeof y?y:fu(y,Is)),g=f===$s?"reference":$s,b=e.rects.popper,x=e.elements[h?g:f],w=cu(ls(x)?x:x.contextElement||gs(e.elements.popper),s,c,a),S=ms(e.elements.reference),A=Js({reference:S,element:b,strategy:"absolute",placement:o}),O=su(Object.assign({},b,A)),k=f===$s?O:S,j={top:w.top-k.top+v.top,bottom:k.bottom-w.bottom+v.bottom,left:w.left-k.left+v.left,right:k.right-w.right+v.right},E=e.modifiersData.offset;if(f===$s&&E){var C=E[o];Object.keys(j).forEach((function(e){var t=[_s,Ts].indexOf(e)>=0?1:-1,n=[Ms,Ts].indexOf(e)>=0?"y":"x";j[e]+=C[n]*t}))}return j}const hu={name:"flip",enabled:!0,phase:"main",fn:function(e){var t=e.state,n=e.options,r=e.name;if(!t.modifiersData[r]._skip){for(var o=n.mainAxis,i=void 0===o||o,a=n.altAxis,l=void 0===a||a,s=n.fallbackPlacements,u=n.padding,c=n.boundary,d=n.rootBoundary,f=n.altBoundary,p=n.flipVariations,h=void 0===p||p,m=n.allowedAutoPlacements,y=t.options.placement,v=Gs(y),g=s||(v===y||!h?[ou(y)]:function(e){if(Gs(e)===Ns)return[];var t=ou(e);return[au(e),t,au(t)]}(y)),b=[y].concat(g).reduce((function(e,n){return e.concat(Gs(n)===Ns?function(e,t){void 0===t&&(t={});var n=t,r=n.placement,o=n.boundary,i=n.rootBoundary,a=n.padding,l=n.flipVariations,s=n.allowedAutoPlacements,u=void 0===s?Fs:s,c=Ys(r),d=c?l?Bs:Bs.filter((function(e){return Ys(e)===c})):Is,f=d.filter((function(e){return u.indexOf(e)>=0}));0===f.length&&(f=d);var p=f.reduce((function(t,n){return t[n]=pu(e,{placement:n,boundary:o,rootBoundary:i,padding:a})[Gs(n)],t}),{});return Object.keys(p).sort((function(e,t){return p[e]-p[t]}))}(t,{placement:n,boundary:c,rootBoundary:d,padding:u,flipVariations:h,allowedAutoPlacements:m}):n)}),[]),x=t.rects.reference,w=t.rects.popper,S=new Map,A=!0,O=b[0],k=0;k<b.length;k++){var j=b[k],E=Gs(j),C=Ys(j)===Ds,P=[Ms,Ts].indexOf(E)>=0,M=P?"width":"height",T=pu(t,{placement:j,boundary:c,rootBoundary:d,altBoundary:f,padding:u}),_=P?C?_s:Rs:C?Ts:Ms;x[M]>w[M]&&(_=ou(_));var R=ou(_),N=[];if(i&&N.push(T[E]<=0),l&&N.push(T[_]<=0,T[R]<=0),N.every((function(e){return e}))){O=j,A=!1;break}S.set(j,N)}if(A)for(var I=function(e){var t=b.find((function(t){var n=S.get(t);if(n)return n.slice(0,e).every((function(e){return e}))}));if(t)return O=t,"break"},D=h?3:1;D>0;D--){if("break"===I(D))break}t.placement!==O&&(t.modifiersData[r]._skip=!0,t.placement=O,t.reset=!0)}},requiresIfExists:["offset"],data:{_skip:!1}};function mu(e,t,n){return cs(e,ds(t,n))}const yu={name:"preventOverflow",enabled:!0,phase:"main",fn:function(e){var t=e.state,n=e.options,r=e.name,o=n.mainAxis,i=void 0===o||o,a=n.altAxis,l=void 0!==a&&a,s=n.boundary,u=n.rootBoundary,c=n.altBoundary,d=n.padding,f=n.tether,p=void 0===f||f,h=n.tetherOffset,m=void 0===h?0:h,y=pu(t,{boundary:s,rootBoundary:u,padding:d,altBoundary:c}),v=Gs(t.placement),g=Ys(t.placement),b=!g,x=Qs(v),w="x"===x?"y":"x",S=t.modifiersData.popperOffsets,A=t.rects.reference,O=t.rects.popper,k="function"===typeof m?m(Object.assign({},t.rects,{placement:t.placement})):m,j="number"===typeof k?{mainAxis:k,altAxis:k}:Object.assign({mainAxis:0,altAxis:0},k),E=t.modifiersData.offset?t.modifiersData.offset[t.placement]:null,C={x:0,y:0};if(S){if(i){var P,M="y"===x?Ms:Rs,T="y"===x?Ts:_s,_="y"===x?"height":"width",R=S[x],N=R+y[M],I=R-y[T],D=p?-O[_]/2:0,L=g===Ds?A[_]:O[_],z=g===Ds?-O[_]:-A[_],$=t.elements.arrow,B=p&&$?As($):{width:0,height:0},F=t.modifiersData["arrow#persistent"]?t.modifiersData["arrow#persistent"].padding:{top:0,right:0,bottom:0,left:0},W=F[M],U=F[T],H=mu(0,A[_],B[_]),V=b?A[_]/2-D-H-W-j.mainAxis:L-H-W-j.mainAxis,q=b?-A[_]/2+D+H+U+j.mainAxis:z+H+U+j.mainAxis,X=t.elements.arrow&&Ps(t.elements.arrow),K=X?"y"===x?X.clientTop||0:X.clientLeft||0:0,G=null!=(P=null==E?void 0:E[x])?P:0,Y=R+q-G,Q=mu(p?ds(N,R+V-G-K):N,R,p?cs(I,Y):I);S[x]=Q,C[x]=Q-R}if(l){var J,Z="x"===x?Ms:Rs,ee="x"===x?Ts:_s,te=S[w],ne="y"===w?"height":"width",re=te+y[Z],oe=te-y[ee],ie=-1!==[Ms,Rs].indexOf(v),ae=null!=(J=null==E?void 0:E[w])?J:0,le=ie?re:te-A[ne]-O[ne]-ae+j.altAxis,se=ie?te+A[ne]+O[ne]-ae-j.altAxis:oe,ue=p&&ie?function(e,t,n){var r=mu(e,t,n);return r>n?n:r}(le,te,se):mu(p?le:re,te,p?se:oe);S[w]=ue,C[w]=ue-te}t.modifiersData[r]=C}},requiresIfExists:["offset"]};const vu={name:"arrow",enabled:!0,phase:"main",fn:function(e){var t,n=e.state,r=e.name,o=e.options,i=n.elements.arrow,a=n.modifiersData.popperOffsets,l=Gs(n.placement),s=Qs(l),u=[Rs,_s].indexOf(l)>=0?"height":"width";if(i&&a){var c=function(e,t){return du("number"!==typeof(e="function"===typeof e?e(Object.assign({},t.rects,{placement:t.placement})):e)?e:fu(e,Is))}(o.padding,n),d=As(i),f="y"===s?Ms:Rs,p="y"===s?Ts:_s,h=n.rects.reference[u]+n.rects.reference[s]-a[s]-n.rects.popper[u],m=a[s]-n.rects.reference[s],y=Ps(i),v=y?"y"===s?y.clientHeight||0:y.clientWidth||0:0,g=h/2-m/2,b=c[f],x=v-d[u]-c[p],w=v/2-d[u]/2+g,S=mu(b,w,x),A=s;n.modifiersData[r]=((t={})[A]=S,t.centerOffset=S-w,t)}},effect:function(e){var t=e.state,n=e.options.element,r=void 0===n?"[data-popper-arrow]":n;null!=r&&("string"!==typeof r||(r=t.elements.popper.querySelector(r)))&&lu(t.elements.popper,r)&&(t.elements.arrow=r)},requires:["popperOffsets"],requiresIfExists:["preventOverflow"]};function gu(e,t,n){return void 0===n&&(n={x:0,y:0}),{top:e.top-t.height-n.y,right:e.right-t.width+n.x,bottom:e.bottom-t.height+n.y,left:e.left-t.width-n.x}}function bu(e){return[Ms,_s,Ts,Rs].some((function(t){return e[t]>=0}))}var xu=Xs({defaultModifiers:[{name:"eventListeners",enabled:!0,phase:"write",fn:function(){},effect:function(e){var t=e.state,n=e.instance,r=e.options,o=r.scroll,i=void 0===o||o,a=r.resize,l=void 0===a||a,s=as(t.elements.popper),u=[].concat(t.scrollParents.reference,t.scrollParents.popper);return i&&u.forEach((function(e){e.addEventListener("scroll",n.update,Ks)})),l&&s.addEventListener("resize",n.update,Ks),function(){i&&u.forEach((function(e){e.removeEventListener("scroll",n.update,Ks)})),l&&s.removeEventListener("resize",n.update,Ks)}},data:{}},{name:"popperOffsets",enabled:!0,phase:"read",fn:function(e){var t=e.state,n=e.name;t.modifiersData[n]=Js({reference:t.rects.reference,element:t.rects.popper,strategy:"absolute",placement:t.placement})},data:{}},{name:"computeStyles",enabled:!0,phase:"beforeWrite",fn:function(e){var t=e.state,n=e.options,r=n.gpuAcceleration,o=void 0===r||r,i=n.adaptive,a=void 0===i||i,l=n.roundOffsets,s=void 0===l||l,u={placement:Gs(t.placement),variation:Ys(t.placement),popper:t.elements.popper,popperRect:t.rects.popper,gpuAcceleration:o,isFixed:"fixed"===t.options.strategy};null!=t.modifiersData.popperOffsets&&(t.styles.popper=Object.assign({},t.styles.popper,eu(Object.assign({},u,{offsets:t.modifiersData.popperOffsets,position:t.options.strategy,adaptive:a,roundOffsets:s})))),null!=t.modifiersData.arrow&&(t.styles.arrow=Object.assign({},t.styles.arrow,eu(Object.assign({},u,{offsets:t.modifiersData.arrow,position:"absolute",adaptive:!1,roundOffsets:s})))),t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-placement":t.placement})},data:{}},tu,nu,hu,yu,vu,{name:"hide",enabled:!0,phase:"main",requiresIfExists:["preventOverflow"],fn:function(e){var t=e.state,n=e.name,r=t.rects.reference,o=t.rects.popper,i=t.modifiersData.preventOverflow,a=pu(t,{elementContext:"reference"}),l=pu(t,{altBoundary:!0}),s=gu(a,r),u=gu(l,o,i),c=bu(s),d=bu(u);t.modifiersData[n]={referenceClippingOffsets:s,popperEscapeOffsets:u,isReferenceHidden:c,hasPopperEscaped:d},t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-reference-hidden":c,"data-popper-escaped":d})}}]});function wu(e){return(0,kt.Ay)("MuiPopper",e)}(0,Ot.A)("MuiPopper",["root"]);const Su=["anchorEl","children","direction","disablePortal","modifiers","open","placement","popperOptions","popperRef","slotProps","slots","TransitionProps","ownerState"],Au=["anchorEl","children","container","direction","disablePortal","keepMounted","modifiers","open","placement","popperOptions","popperRef","style","transition","slotProps","slots"];function Ou(e){return"function"===typeof e?e():e}function ku(e){return void 0!==e.nodeType}const ju={},Eu=t.forwardRef((function(e,n){var r;const{anchorEl:o,children:i,direction:a,disablePortal:l,modifiers:s,open:u,placement:c,popperOptions:d,popperRef:f,slotProps:p={},slots:h={},TransitionProps:m}=e,y=(0,st.A)(e,Su),v=t.useRef(null),g=(0,br.A)(v,n),b=t.useRef(null),x=(0,br.A)(b,f),w=t.useRef(x);(0,Sr.A)((()=>{w.current=x}),[x]),t.useImperativeHandle(f,(()=>b.current),[]);const S=function(e,t){if("ltr"===t)return e;switch(e){case"bottom-end":return"bottom-start";case"bottom-start":return"bottom-end";case"top-end":return"top-start";case"top-start":return"top-end";default:return e}}(c,a),[A,O]=t.useState(S),[k,j]=t.useState(Ou(o));t.useEffect((()=>{b.current&&b.current.forceUpdate()})),t.useEffect((()=>{o&&j(Ou(o))}),[o]),(0,Sr.A)((()=>{if(!k||!u)return;let e=[{name:"preventOverflow",options:{altBoundary:l}},{name:"flip",options:{altBoundary:l}},{name:"onUpdate",enabled:!0,phase:"afterWrite",fn:e=>{let{state:t}=e;(e=>{O(e.placement)})(t)}}];null!=s&&(e=e.concat(s)),d&&null!=d.modifiers&&(e=e.concat(d.modifiers));const t=xu(k,v.current,(0,ut.A)({placement:S},d,{modifiers:e}));return w.current(t),()=>{t.destroy(),w.current(null)}}),[k,l,s,u,d,S]);const E={placement:A};null!==m&&(E.TransitionProps=m);const C=(0,yt.A)({root:["root"]},Gi(wu)),P=null!=(r=h.root)?r:"div",M=qi({elementType:P,externalSlotProps:p.root,externalForwardedProps:y,additionalProps:{role:"tooltip",ref:g},ownerState:e,className:C.root});return(0,Pt.jsx)(P,(0,ut.A)({},M,{children:"function"===typeof i?i(E):i}))})),Cu=t.forwardRef((function(e,n){const{anchorEl:r,children:o,container:i,direction:a="ltr",disablePortal:l=!1,keepMounted:s=!1,modifiers:u,open:c,placement:d="bottom",popperOptions:f=ju,popperRef:p,style:h,transition:m=!1,slotProps:y={},slots:v={}}=e,g=(0,st.A)(e,Au),[b,x]=t.useState(!0);if(!s&&!c&&(!m||b))return null;let w;if(i)w=i;else if(r){const e=Ou(r);w=e&&ku(e)?(0,Oi.A)(e).body:(0,Oi.A)(null).body}const S=c||!s||m&&!b?void 0:"none",A=m?{in:c,onEnter:()=>{x(!1)},onExited:()=>{x(!0)}}:void 0;return(0,Pt.jsx)(Ci,{disablePortal:l,container:w,children:(0,Pt.jsx)(Eu,(0,ut.A)({anchorEl:r,direction:a,disablePortal:l,modifiers:u,ref:n,open:m?!b:c,placement:d,popperOptions:f,popperRef:p,slotProps:y,slots:v},g,{style:(0,ut.A)({position:"fixed",top:0,left:0,display:S},h),TransitionProps:A,children:o}))})}));var Pu=n(7082);const Mu=["anchorEl","component","components","componentsProps","container","disablePortal","keepMounted","modifiers","open","placement","popperOptions","popperRef","transition","slots","slotProps"],Tu=(0,vt.Ay)(Cu,{name:"MuiPopper",slot:"Root",overridesResolver:(e,t)=>t.root})({}),_u=t.forwardRef((function(e,t){var n;const r=(0,Pu.A)(),o=(0,gt.A)({props:e,name:"MuiPopper"}),{anchorEl:i,component:a,components:l,componentsProps:s,container:u,disablePortal:c,keepMounted:d,modifiers:f,open:p,placement:h,popperOptions:m,popperRef:y,transition:v,slots:g,slotProps:b}=o,x=(0,st.A)(o,Mu),w=null!=(n=null==g?void 0:g.root)?n:null==l?void 0:l.Root,S=(0,ut.A)({anchorEl:i,container:u,disablePortal:c,keepMounted:d,modifiers:f,open:p,placement:h,popperOptions:m,popperRef:y,transition:v},x);return(0,Pt.jsx)(Tu,(0,ut.A)({as:a,direction:null==r?void 0:r.direction,slots:{root:w},slotProps:null!=b?b:s},S,{ref:t}))}));var Ru=n(5879);function Nu(e){return(0,kt.Ay)("MuiTooltip",e)}const Iu=(0,Ot.A)("MuiTooltip",["popper","popperInteractive","popperArrow","popperClose","tooltip","tooltipArrow","touch","tooltipPlacementLeft","tooltipPlacementRight","tooltipPlacementTop","tooltipPlacementBottom","arrow"]),Du=["arrow","children","classes","components","componentsProps","describeChild","disableFocusListener","disableHoverListener","disableInteractive","disableTouchListener","enterDelay","enterNextDelay","enterTouchDelay","followCursor","id","leaveDelay","leaveTouchDelay","onClose","onOpen","open","placement","PopperComponent","PopperProps","slotProps","slots","title","TransitionComponent","TransitionProps"];function Lu(e){return Math.round(1e5*e)/1e5}const zu=(0,vt.Ay)(_u,{name:"MuiTooltip",slot:"Popper",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.popper,!n.disableInteractive&&t.popperInteractive,n.arrow&&t.popperArrow,!n.open&&t.popperClose]}})((e=>{let{theme:t,ownerState:n,open:r}=e;return(0,ut.A)({zIndex:(t.vars||t).zIndex.tooltip,pointerEvents:"none"},!n.disableInteractive&&{pointerEvents:"auto"},!r&&{pointerEvents:"none"},n.arrow&&{[`&[data-popper-placement*="bottom"] .${Iu.arrow}`]:{top:0,marginTop:"-0.71em","&::before":{transformOrigin:"0 100%"}},[`&[data-popper-placement*="top"] .${Iu.arrow}`]:{bottom:0,marginBottom:"-0.71em","&::before":{transformOrigin:"100% 0"}},[`&[data-popper-placement*="right"] .${Iu.arrow}`]:(0,ut.A)({},n.isRtl?{right:0,marginRight:"-0.71em"}:{left:0,marginLeft:"-0.71em"},{height:"1em",width:"0.71em","&::before":{transformOrigin:"100% 100%"}}),[`&[data-popper-placement*="left"] .${Iu.arrow}`]:(0,ut.A)({},n.isRtl?{left:0,marginLeft:"-0.71em"}:{right:0,marginRight:"-0.71em"},{height:"1em",width:"0.71em","&::before":{transformOrigin:"0 0"}})})})),$u=(0,vt.Ay)("div",{name:"MuiTooltip",slot:"Tooltip",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.tooltip,n.touch&&t.touch,n.arrow&&t.tooltipArrow,t[`tooltipPlacement${(0,Xt.A)(n.placement.split("-")[0])}`]]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({backgroundColor:t.vars?t.vars.palette.Tooltip.bg:(0,tn.X4)(t.palette.grey[700],.92),borderRadius:(t.vars||t).shape.borderRadius,color:(t.vars||t).palette.common.white,fontFamily:t.typography.fontFamily,padding:"4px 8px",fontSize:t.typography.pxToRem(11),maxWidth:300,margin:2,wordWrap:"break-word",fontWeight:t.typography.fontWeightMedium},n.arrow&&{position:"relative",margin:0},n.touch&&{padding:"8px 16px",fontSize:t.typography.pxToRem(14),lineHeight:`${Lu(16/14)}em`,fontWeight:t.typography.fontWeightRegular},{[`.${Iu.popper}[data-popper-placement*="left"] &`]:(0,ut.A)({transformOrigin:"right center"},n.isRtl?(0,ut.A)({marginLeft:"14px"},n.touch&&{marginLeft:"24px"}):(0,ut.A)({marginRight:"14px"},n.touch&&{marginRight:"24px"})),[`.${Iu.popper}[data-popper-placement*="right"] &`]:(0,ut.A)({transformOrigin:"left center"},n.isRtl?(0,ut.A)({marginRight:"14px"},n.touch&&{marginRight:"24px"}):(0,ut.A)({marginLeft:"14px"},n.touch&&{marginLeft:"24px"})),[`.${Iu.popper}[data-popper-placement*="top"] &`]:(0,ut.A)({transformOrigin:"center bottom",marginBottom:"14px"},n.touch&&{marginBottom:"24px"}),[`.${Iu.popper}[data-popper-placement*="bottom"] &`]:(0,ut.A)({transformOrigin:"center top",marginTop:"14px"},n.touch&&{marginTop:"24px"})})})),Bu=(0,vt.Ay)("span",{name:"MuiTooltip",slot:"Arrow",overridesResolver:(e,t)=>t.arrow})((e=>{let{theme:t}=e;return{overflow:"hidden",position:"absolute",width:"1em",height:"0.71em",boxSizing:"border-box",color:t.vars?t.vars.palette.Tooltip.bg:(0,tn.X4)(t.palette.grey[700],.9),"&::before":{content:'""',margin:"auto",display:"block",width:"100%",height:"100%",backgroundColor:"currentColor",transform:"rotate(45deg)"}}}));let Fu=!1,Wu=null,Uu={x:0,y:0};function Hu(e,t){return n=>{t&&t(n),e(n)}}const Vu=t.forwardRef((function(e,n){var r,o,i,a,l,s,u,c,d,f,p,h,m,y,v,g,b,x,w;const S=(0,gt.A)({props:e,name:"MuiTooltip"}),{arrow:A=!1,children:O,components:k={},componentsProps:j={},describeChild:E=!1,disableFocusListener:C=!1,disableHoverListener:P=!1,disableInteractive:M=!1,disableTouchListener:T=!1,enterDelay:_=100,enterNextDelay:R=0,enterTouchDelay:N=700,followCursor:I=!1,id:D,leaveDelay:L=0,leaveTouchDelay:z=1500,onClose:$,onOpen:B,open:F,placement:W="bottom",PopperComponent:U,PopperProps:H={},slotProps:V={},slots:q={},title:X,TransitionComponent:K=Ai,TransitionProps:G}=S,Y=(0,st.A)(S,Du),Q=St(),J="rtl"===Q.direction,[Z,ee]=t.useState(),[te,ne]=t.useState(null),re=t.useRef(!1),oe=M||I,ie=t.useRef(),ae=t.useRef(),le=t.useRef(),se=t.useRef(),[ue,ce]=(0,za.A)({controlled:F,default:!1,name:"Tooltip",state:"open"});let de=ue;const fe=(0,Ru.A)(D),pe=t.useRef(),he=t.useCallback((()=>{void 0!==pe.current&&(document.body.style.WebkitUserSelect=pe.current,pe.current=void 0),clearTimeout(se.current)}),[]);t.useEffect((()=>()=>{clearTimeout(ie.current),clearTimeout(ae.current),clearTimeout(le.current),he()}),[he]);const me=e=>{clearTimeout(Wu),Fu=!0,ce(!0),B&&!de&&B(e)},ye=(0,dn.A)((e=>{clearTimeout(Wu),Wu=setTimeout((()=>{Fu=!1}),800+L),ce(!1),$&&de&&$(e),clearTimeout(ie.current),ie.current=setTimeout((()=>{re.current=!1}),Q.transitions.duration.shortest)})),ve=e=>{re.current&&"touchstart"!==e.type||(Z&&Z.removeAttribute("title"),clearTimeout(ae.current),clearTimeout(le.current),_||Fu&&R?ae.current=setTimeout((()=>{me(e)}),Fu?R:_):me(e))},ge=e=>{clearTimeout(ae.current),clearTimeout(le.current),le.current=setTimeout((()=>{ye(e)}),L)},{isFocusVisibleRef:be,onBlur:xe,onFocus:we,ref:Se}=(0,fn.A)(),[,Ae]=t.useState(!1),Oe=e=>{xe(e),!1===be.current&&(Ae(!1),ge(e))},ke=e=>{Z||ee(e.currentTarget),we(e),!0===be.current&&(Ae(!0),ve(e))},je=e=>{re.current=!0;const t=O.props;t.onTouchStart&&t.onTouchStart(e)},Ee=ve,Ce=ge,Pe=e=>{je(e),clearTimeout(le.current),clearTimeout(ie.current),he(),pe.current=document.body.style.WebkitUserSelect,document.body.style.WebkitUserSelect="none",se.current=setTimeout((()=>{document.body.style.WebkitUserSelect=pe.current,ve(e)}),N)},Me=e=>{O.props.onTouchEnd&&O.props.onTouchEnd(e),he(),clearTimeout(le.current),le.current=setTimeout((()=>{ye(e)}),z)};t.useEffect((()=>{if(de)return document.addEventListener("keydown",e),()=>{document.removeEventListener("keydown",e)};function e(e){"Escape"!==e.key&&"Esc"!==e.key||ye(e)}}),[ye,de]);const Te=(0,cn.A)(O.ref,Se,ee,n);X||0===X||(de=!1);const _e=t.useRef(),Re={},Ne="string"===typeof X;E?(Re.title=de||!Ne||P?null:X,Re["aria-describedby"]=de?fe:null):(Re["aria-label"]=Ne?X:null,Re["aria-labelledby"]=de&&!Ne?fe:null);const Ie=(0,ut.A)({},Re,Y,O.props,{className:(0,ct.A)(Y.className,O.props.className),onTouchStart:je,ref:Te},I?{onMouseMove:e=>{const t=O.props;t.onMouseMove&&t.onMouseMove(e),Uu={x:e.clientX,y:e.clientY},_e.current&&_e.current.update()}}:{});const De={};T||(Ie.onTouchStart=Pe,Ie.onTouchEnd=Me),P||(Ie.onMouseOver=Hu(Ee,Ie.onMouseOver),Ie.onMouseLeave=Hu(Ce,Ie.onMouseLeave),oe||(De.onMouseOver=Ee,De.onMouseLeave=Ce)),C||(Ie.onFocus=Hu(ke,Ie.onFocus),Ie.onBlur=Hu(Oe,Ie.onBlur),oe||(De.onFocus=ke,De.onBlur=Oe));const Le=t.useMemo((()=>{var e;let t=[{name:"arrow",enabled:Boolean(te),options:{element:te,padding:4}}];return null!=(e=H.popperOptions)&&e.modifiers&&(t=t.concat(H.popperOptions.modifiers)),(0,ut.A)({},H.popperOptions,{modifiers:t})}),[te,H]),ze=(0,ut.A)({},S,{isRtl:J,arrow:A,disableInteractive:oe,placement:W,PopperComponentProp:U,touch:re.current}),$e=(e=>{const{classes:t,disableInteractive:n,arrow:r,touch:o,placement:i}=e,a={popper:["popper",!n&&"popperInteractive",r&&"popperArrow"],tooltip:["tooltip",r&&"tooltipArrow",o&&"touch",`tooltipPlacement${(0,Xt.A)(i.split("-")[0])}`],arrow:["arrow"]};return(0,yt.A)(a,Nu,t)})(ze),Be=null!=(r=null!=(o=q.popper)?o:k.Popper)?r:zu,Fe=null!=(i=null!=(a=null!=(l=q.transition)?l:k.Transition)?a:K)?i:Ai,We=null!=(s=null!=(u=q.tooltip)?u:k.Tooltip)?s:$u,Ue=null!=(c=null!=(d=q.arrow)?d:k.Arrow)?c:Bu,He=$i(Be,(0,ut.A)({},H,null!=(f=V.popper)?f:j.popper,{className:(0,ct.A)($e.popper,null==H?void 0:H.className,null==(p=null!=(h=V.popper)?h:j.popper)?void 0:p.className)}),ze),Ve=$i(Fe,(0,ut.A)({},G,null!=(m=V.transition)?m:j.transition),ze),qe=$i(We,(0,ut.A)({},null!=(y=V.tooltip)?y:j.tooltip,{className:(0,ct.A)($e.tooltip,null==(v=null!=(g=V.tooltip)?g:j.tooltip)?void 0:v.className)}),ze),Xe=$i(Ue,(0,ut.A)({},null!=(b=V.arrow)?b:j.arrow,{className:(0,ct.A)($e.arrow,null==(x=null!=(w=V.arrow)?w:j.arrow)?void 0:x.className)}),ze);return(0,Pt.jsxs)(t.Fragment,{children:[t.cloneElement(O,Ie),(0,Pt.jsx)(Be,(0,ut.A)({as:null!=U?U:_u,placement:W,anchorEl:I?{getBoundingClientRect:()=>({top:Uu.y,left:Uu.x,right:Uu.x,bottom:Uu.y,width:0,height:0})}:Z,popperRef:_e,open:!!Z&&de,id:fe,transition:!0},De,He,{popperOptions:Le,children:e=>{let{TransitionProps:t}=e;return(0,Pt.jsx)(Fe,(0,ut.A)({timeout:Q.transitions.duration.shorter},t,Ve,{children:(0,Pt.jsxs)(We,(0,ut.A)({},qe,{children:[X,A?(0,Pt.jsx)(Ue,(0,ut.A)({},Xe,{ref:ne})):null]}))}))}}))]})})),qu=Vu;let Xu;function Ku(){if(Xu)return Xu;const e=document.createElement("div"),t=document.createElement("div");return t.style.width="10px",t.style.height="1px",e.appendChild(t),e.dir="rtl",e.style.fontSize="14px",e.style.width="4px",e.style.height="1px",e.style.position="absolute",e.style.top="-1000px",e.style.overflow="scroll",document.body.appendChild(e),Xu="reverse",e.scrollLeft>0?Xu="default":(e.scrollLeft=1,0===e.scrollLeft&&(Xu="negative")),document.body.removeChild(e),Xu}function Gu(e,t){const n=e.scrollLeft;if("rtl"!==t)return n;switch(Ku()){case"negative":return e.scrollWidth-e.clientWidth+n;case"reverse":return e.scrollWidth-e.clientWidth-n;default:return n}}function Yu(e){return(1+Math.sin(Math.PI*e-Math.PI/2))/2}const Qu=["onChange"],Ju={width:99,height:99,position:"absolute",top:-9999,overflow:"scroll"};const Zu=(0,Ya.A)((0,Pt.jsx)("path",{d:"M15.41 16.09l-4.58-4.59 4.58-4.59L14 5.5l-6 6 6 6z"}),"KeyboardArrowLeft"),ec=(0,Ya.A)((0,Pt.jsx)("path",{d:"M8.59 16.34l4.58-4.59-4.58-4.59L10 5.75l6 6-6 6z"}),"KeyboardArrowRight");function tc(e){return(0,kt.Ay)("MuiTabScrollButton",e)}const nc=(0,Ot.A)("MuiTabScrollButton",["root","vertical","horizontal","disabled"]),rc=["className","slots","slotProps","direction","orientation","disabled"],oc=(0,vt.Ay)(Kn,{name:"MuiTabScrollButton",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.orientation&&t[n.orientation]]}})((e=>{let{ownerState:t}=e;return(0,ut.A)({width:40,flexShrink:0,opacity:.8,[`&.${nc.disabled}`]:{opacity:0}},"vertical"===t.orientation&&{width:"100%",height:40,"& svg":{transform:`rotate(${t.isRtl?-90:90}deg)`}})})),ic=t.forwardRef((function(e,t){var n,r;const o=(0,gt.A)({props:e,name:"MuiTabScrollButton"}),{className:i,slots:a={},slotProps:l={},direction:s}=o,u=(0,st.A)(o,rc),c="rtl"===St().direction,d=(0,ut.A)({isRtl:c},o),f=(e=>{const{classes:t,orientation:n,disabled:r}=e,o={root:["root",n,r&&"disabled"]};return(0,yt.A)(o,tc,t)})(d),p=null!=(n=a.StartScrollButtonIcon)?n:Zu,h=null!=(r=a.EndScrollButtonIcon)?r:ec,m=qi({elementType:p,externalSlotProps:l.startScrollButtonIcon,additionalProps:{fontSize:"small"},ownerState:d}),y=qi({elementType:h,externalSlotProps:l.endScrollButtonIcon,additionalProps:{fontSize:"small"},ownerState:d});return(0,Pt.jsx)(oc,(0,ut.A)({component:"div",className:(0,ct.A)(f.root,i),ref:t,role:null,ownerState:d,tabIndex:null},u,{children:"left"===s?(0,Pt.jsx)(p,(0,ut.A)({},m)):(0,Pt.jsx)(h,(0,ut.A)({},y))}))}));function ac(e){return(0,kt.Ay)("MuiTabs",e)}const lc=(0,Ot.A)("MuiTabs",["root","vertical","flexContainer","flexContainerVertical","centered","scroller","fixed","scrollableX","scrollableY","hideScrollbar","scrollButtons","scrollButtonsHideMobile","indicator"]),sc=["aria-label","aria-labelledby","action","centered","children","className","component","allowScrollButtonsMobile","indicatorColor","onChange","orientation","ScrollButtonComponent","scrollButtons","selectionFollowsFocus","slots","slotProps","TabIndicatorProps","TabScrollButtonProps","textColor","value","variant","visibleScrollbar"],uc=(e,t)=>e===t?e.firstChild:t&&t.nextElementSibling?t.nextElementSibling:e.firstChild,cc=(e,t)=>e===t?e.lastChild:t&&t.previousElementSibling?t.previousElementSibling:e.lastChild,dc=(e,t,n)=>{let r=!1,o=n(e,t);for(;o;){if(o===e.firstChild){if(r)return;r=!0}const t=o.disabled||"true"===o.getAttribute("aria-disabled");if(o.hasAttribute("tabindex")&&!t)return void o.focus();o=n(e,o)}},fc=(0,vt.Ay)("div",{name:"MuiTabs",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[{[`& .${lc.scrollButtons}`]:t.scrollButtons},{[`& .${lc.scrollButtons}`]:n.scrollButtonsHideMobile&&t.scrollButtonsHideMobile},t.root,n.vertical&&t.vertical]}})((e=>{let{ownerState:t,theme:n}=e;return(0,ut.A)({overflow:"hidden",minHeight:48,WebkitOverflowScrolling:"touch",display:"flex"},t.vertical&&{flexDirection:"column"},t.scrollButtonsHideMobile&&{[`& .${lc.scrollButtons}`]:{[n.breakpoints.down("sm")]:{display:"none"}}})})),pc=(0,vt.Ay)("div",{name:"MuiTabs",slot:"Scroller",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.scroller,n.fixed&&t.fixed,n.hideScrollbar&&t.hideScrollbar,n.scrollableX&&t.scrollableX,n.scrollableY&&t.scrollableY]}})((e=>{let{ownerState:t}=e;return(0,ut.A)({position:"relative",display:"inline-block",flex:"1 1 auto",whiteSpace:"nowrap"},t.fixed&&{overflowX:"hidden",width:"100%"},t.hideScrollbar&&{scrollbarWidth:"none","&::-webkit-scrollbar":{display:"none"}},t.scrollableX&&{overflowX:"auto",overflowY:"hidden"},t.scrollableY&&{overflowY:"auto",overflowX:"hidden"})})),hc=(0,vt.Ay)("div",{name:"MuiTabs",slot:"FlexContainer",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.flexContainer,n.vertical&&t.flexContainerVertical,n.centered&&t.centered]}})((e=>{let{ownerState:t}=e;return(0,ut.A)({display:"flex"},t.vertical&&{flexDirection:"column"},t.centered&&{justifyContent:"center"})})),mc=(0,vt.Ay)("span",{name:"MuiTabs",slot:"Indicator",overridesResolver:(e,t)=>t.indicator})((e=>{let{ownerState:t,theme:n}=e;return(0,ut.A)({position:"absolute",height:2,bottom:0,width:"100%",transition:n.transitions.create()},"primary"===t.indicatorColor&&{backgroundColor:(n.vars||n).palette.primary.main},"secondary"===t.indicatorColor&&{backgroundColor:(n.vars||n).palette.secondary.main},t.vertical&&{height:"100%",width:2,right:0})})),yc=(0,vt.Ay)((function(e){const{onChange:n}=e,r=(0,st.A)(e,Qu),o=t.useRef(),i=t.useRef(null),a=()=>{o.current=i.current.offsetHeight-i.current.clientHeight};return(0,Rr.A)((()=>{const e=(0,ii.A)((()=>{const e=o.current;a(),e!==o.current&&n(o.current)})),t=(0,ai.A)(i.current);return t.addEventListener("resize",e),()=>{e.clear(),t.removeEventListener("resize",e)}}),[n]),t.useEffect((()=>{a(),n(o.current)}),[n]),(0,Pt.jsx)("div",(0,ut.A)({style:Ju,ref:i},r))}),{name:"MuiTabs",slot:"ScrollbarSize"})({overflowX:"auto",overflowY:"hidden",scrollbarWidth:"none","&::-webkit-scrollbar":{display:"none"}}),vc={};const gc=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiTabs"}),o=St(),i="rtl"===o.direction,{"aria-label":a,"aria-labelledby":l,action:s,centered:u=!1,children:c,className:d,component:f="div",allowScrollButtonsMobile:p=!1,indicatorColor:h="primary",onChange:m,orientation:y="horizontal",ScrollButtonComponent:v=ic,scrollButtons:g="auto",selectionFollowsFocus:b,slots:x={},slotProps:w={},TabIndicatorProps:S={},TabScrollButtonProps:A={},textColor:O="primary",value:k,variant:j="standard",visibleScrollbar:E=!1}=r,C=(0,st.A)(r,sc),P="scrollable"===j,M="vertical"===y,T=M?"scrollTop":"scrollLeft",_=M?"top":"left",R=M?"bottom":"right",N=M?"clientHeight":"clientWidth",I=M?"height":"width",D=(0,ut.A)({},r,{component:f,allowScrollButtonsMobile:p,indicatorColor:h,orientation:y,vertical:M,scrollButtons:g,textColor:O,variant:j,visibleScrollbar:E,fixed:!P,hideScrollbar:P&&!E,scrollableX:P&&!M,scrollableY:P&&M,centered:u&&!P,scrollButtonsHideMobile:!p}),L=(e=>{const{vertical:t,fixed:n,hideScrollbar:r,scrollableX:o,scrollableY:i,centered:a,scrollButtonsHideMobile:l,classes:s}=e,u={root:["root",t&&"vertical"],scroller:["scroller",n&&"fixed",r&&"hideScrollbar",o&&"scrollableX",i&&"scrollableY"],flexContainer:["flexContainer",t&&"flexContainerVertical",a&&"centered"],indicator:["indicator"],scrollButtons:["scrollButtons",l&&"scrollButtonsHideMobile"],scrollableX:[o&&"scrollableX"],hideScrollbar:[r&&"hideScrollbar"]};return(0,yt.A)(u,ac,s)})(D),z=qi({elementType:x.StartScrollButtonIcon,externalSlotProps:w.startScrollButtonIcon,ownerState:D}),$=qi({elementType:x.EndScrollButtonIcon,externalSlotProps:w.endScrollButtonIcon,ownerState:D});const[B,F]=t.useState(!1),[W,U]=t.useState(vc),[H,V]=t.useState({start:!1,end:!1}),[q,X]=t.useState({overflow:"hidden",scrollbarWidth:0}),K=new Map,G=t.useRef(null),Y=t.useRef(null),Q=()=>{const e=G.current;let t,n;if(e){const n=e.getBoundingClientRect();t={clientWidth:e.clientWidth,scrollLeft:e.scrollLeft,scrollTop:e.scrollTop,scrollLeftNormalized:Gu(e,o.direction),scrollWidth:e.scrollWidth,top:n.top,bottom:n.bottom,left:n.left,right:n.right}}if(e&&!1!==k){const e=Y.current.children;if(e.length>0){const t=e[K.get(k)];0,n=t?t.getBoundingClientRect():null}}return{tabsMeta:t,tabMeta:n}},J=(0,dn.A)((()=>{const{tabsMeta:e,tabMeta:t}=Q();let n,r=0;if(M)n="top",t&&e&&(r=t.top-e.top+e.scrollTop);else if(n=i?"right":"left",t&&e){const o=i?e.scrollLeftNormalized+e.clientWidth-e.scrollWidth:e.scrollLeft;r=(i?-1:1)*(t[n]-e[n]+o)}const o={[n]:r,[I]:t?t[I]:0};if(isNaN(W[n])||isNaN(W[I]))U(o);else{const e=Math.abs(W[n]-o[n]),t=Math.abs(W[I]-o[I]);(e>=1||t>=1)&&U(o)}})),Z=function(e){let{animation:t=!0}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};t?function(e,t,n){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{},o=arguments.length>4&&void 0!==arguments[4]?arguments[4]:()=>{};const{ease:i=Yu,duration:a=300}=r;let l=null;const s=t[e];let u=!1;const c=()=>{u=!0},d=r=>{if(u)return void o(new Error("Animation cancelled"));null===l&&(l=r);const c=Math.min(1,(r-l)/a);t[e]=i(c)*(n-s)+s,c>=1?requestAnimationFrame((()=>{o(null)})):requestAnimationFrame(d)};s===n?o(new Error("Element already at target position")):requestAnimationFrame(d)}(T,G.current,e,{duration:o.transitions.duration.standard}):G.current[T]=e},ee=e=>{let t=G.current[T];M?t+=e:(t+=e*(i?-1:1),t*=i&&"reverse"===Ku()?-1:1),Z(t)},te=()=>{const e=G.current[N];let t=0;const n=Array.from(Y.current.children);for(let r=0;r<n.length;r+=1){const o=n[r];if(t+o[N]>e){0===r&&(t=e);break}t+=o[N]}return t},ne=()=>{ee(-1*te())},re=()=>{ee(te())},oe=t.useCallback((e=>{X({overflow:null,scrollbarWidth:e})}),[]),ie=(0,dn.A)((e=>{const{tabsMeta:t,tabMeta:n}=Q();if(n&&t)if(n[_]<t[_]){const r=t[T]+(n[_]-t[_]);Z(r,{animation:e})}else if(n[R]>t[R]){const r=t[T]+(n[R]-t[R]);Z(r,{animation:e})}})),ae=(0,dn.A)((()=>{if(P&&!1!==g){const{scrollTop:e,scrollHeight:t,clientHeight:n,scrollWidth:r,clientWidth:a}=G.current;let l,s;if(M)l=e>1,s=e<t-n-1;else{const e=Gu(G.current,o.direction);l=i?e<r-a-1:e>1,s=i?e>1:e<r-a-1}l===H.start&&s===H.end||V({start:l,end:s})}}));t.useEffect((()=>{const e=(0,ii.A)((()=>{G.current&&(J(),ae())})),t=(0,ai.A)(G.current);let n;return t.addEventListener("resize",e),"undefined"!==typeof ResizeObserver&&(n=new ResizeObserver(e),Array.from(Y.current.children).forEach((e=>{n.observe(e)}))),()=>{e.clear(),t.removeEventListener("resize",e),n&&n.disconnect()}}),[J,ae]);const le=t.useMemo((()=>(0,ii.A)((()=>{ae()}))),[ae]);t.useEffect((()=>()=>{le.clear()}),[le]),t.useEffect((()=>{F(!0)}),[]),t.useEffect((()=>{J(),ae()})),t.useEffect((()=>{ie(vc!==W)}),[ie,W]),t.useImperativeHandle(s,(()=>({updateIndicator:J,updateScrollButtons:ae})),[J,ae]);const se=(0,Pt.jsx)(mc,(0,ut.A)({},S,{className:(0,ct.A)(L.indicator,S.className),ownerState:D,style:(0,ut.A)({},W,S.style)}));let ue=0;const ce=t.Children.map(c,(e=>{if(!t.isValidElement(e))return null;const n=void 0===e.props.value?ue:e.props.value;K.set(n,ue);const r=n===k;return ue+=1,t.cloneElement(e,(0,ut.A)({fullWidth:"fullWidth"===j,indicator:r&&!B&&se,selected:r,selectionFollowsFocus:b,onChange:m,textColor:O,value:n},1!==ue||!1!==k||e.props.tabIndex?{}:{tabIndex:0}))})),de=(()=>{const e={};e.scrollbarSizeListener=P?(0,Pt.jsx)(yc,{onChange:oe,className:(0,ct.A)(L.scrollableX,L.hideScrollbar)}):null;const t=H.start||H.end,n=P&&("auto"===g&&t||!0===g);return e.scrollButtonStart=n?(0,Pt.jsx)(v,(0,ut.A)({slots:{StartScrollButtonIcon:x.StartScrollButtonIcon},slotProps:{startScrollButtonIcon:z},orientation:y,direction:i?"right":"left",onClick:ne,disabled:!H.start},A,{className:(0,ct.A)(L.scrollButtons,A.className)})):null,e.scrollButtonEnd=n?(0,Pt.jsx)(v,(0,ut.A)({slots:{EndScrollButtonIcon:x.EndScrollButtonIcon},slotProps:{endScrollButtonIcon:$},orientation:y,direction:i?"left":"right",onClick:re,disabled:!H.end},A,{className:(0,ct.A)(L.scrollButtons,A.className)})):null,e})();return(0,Pt.jsxs)(fc,(0,ut.A)({className:(0,ct.A)(L.root,d),ownerState:D,ref:n,as:f},C,{children:[de.scrollButtonStart,de.scrollbarSizeListener,(0,Pt.jsxs)(pc,{className:L.scroller,ownerState:D,style:{overflow:q.overflow,[M?"margin"+(i?"Left":"Right"):"marginBottom"]:E?void 0:-q.scrollbarWidth},ref:G,onScroll:le,children:[(0,Pt.jsx)(hc,{"aria-label":a,"aria-labelledby":l,"aria-orientation":"vertical"===y?"vertical":null,className:L.flexContainer,ownerState:D,onKeyDown:e=>{const t=Y.current,n=(0,Vo.A)(t).activeElement;if("tab"!==n.getAttribute("role"))return;let r="horizontal"===y?"ArrowLeft":"ArrowUp",o="horizontal"===y?"ArrowRight":"ArrowDown";switch("horizontal"===y&&i&&(r="ArrowRight",o="ArrowLeft"),e.key){case r:e.preventDefault(),dc(t,n,cc);break;case o:e.preventDefault(),dc(t,n,uc);break;case"Home":e.preventDefault(),dc(t,null,uc);break;case"End":e.preventDefault(),dc(t,null,cc)}},ref:Y,role:"tablist",children:ce}),B&&se]}),de.scrollButtonEnd]}))})),bc=gc;function xc(e){return(0,kt.Ay)("MuiTab",e)}const wc=(0,Ot.A)("MuiTab",["root","labelIcon","textColorInherit","textColorPrimary","textColorSecondary","selected","disabled","fullWidth","wrapped","iconWrapper"]),Sc=["className","disabled","disableFocusRipple","fullWidth","icon","iconPosition","indicator","label","onChange","onClick","onFocus","selected","selectionFollowsFocus","textColor","value","wrapped"],Ac=(0,vt.Ay)(Kn,{name:"MuiTab",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.label&&n.icon&&t.labelIcon,t[`textColor${(0,Xt.A)(n.textColor)}`],n.fullWidth&&t.fullWidth,n.wrapped&&t.wrapped]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({},t.typography.button,{maxWidth:360,minWidth:90,position:"relative",minHeight:48,flexShrink:0,padding:"12px 16px",overflow:"hidden",whiteSpace:"normal",textAlign:"center"},n.label&&{flexDirection:"top"===n.iconPosition||"bottom"===n.iconPosition?"column":"row"},{lineHeight:1.25},n.icon&&n.label&&{minHeight:72,paddingTop:9,paddingBottom:9,[`& > .${wc.iconWrapper}`]:(0,ut.A)({},"top"===n.iconPosition&&{marginBottom:6},"bottom"===n.iconPosition&&{marginTop:6},"start"===n.iconPosition&&{marginRight:t.spacing(1)},"end"===n.iconPosition&&{marginLeft:t.spacing(1)})},"inherit"===n.textColor&&{color:"inherit",opacity:.6,[`&.${wc.selected}`]:{opacity:1},[`&.${wc.disabled}`]:{opacity:(t.vars||t).palette.action.disabledOpacity}},"primary"===n.textColor&&{color:(t.vars||t).palette.text.secondary,[`&.${wc.selected}`]:{color:(t.vars||t).palette.primary.main},[`&.${wc.disabled}`]:{color:(t.vars||t).palette.text.disabled}},"secondary"===n.textColor&&{color:(t.vars||t).palette.text.secondary,[`&.${wc.selected}`]:{color:(t.vars||t).palette.secondary.main},[`&.${wc.disabled}`]:{color:(t.vars||t).palette.text.disabled}},n.fullWidth&&{flexShrink:1,flexGrow:1,flexBasis:0,maxWidth:"none"},n.wrapped&&{fontSize:t.typography.pxToRem(12)})})),Oc=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiTab"}),{className:o,disabled:i=!1,disableFocusRipple:a=!1,fullWidth:l,icon:s,iconPosition:u="top",indicator:c,label:d,onChange:f,onClick:p,onFocus:h,selected:m,selectionFollowsFocus:y,textColor:v="inherit",value:g,wrapped:b=!1}=r,x=(0,st.A)(r,Sc),w=(0,ut.A)({},r,{disabled:i,disableFocusRipple:a,selected:m,icon:!!s,iconPosition:u,label:!!d,fullWidth:l,textColor:v,wrapped:b}),S=(e=>{const{classes:t,textColor:n,fullWidth:r,wrapped:o,icon:i,label:a,selected:l,disabled:s}=e,u={root:["root",i&&a&&"labelIcon",`textColor${(0,Xt.A)(n)}`,r&&"fullWidth",o&&"wrapped",l&&"selected",s&&"disabled"],iconWrapper:["iconWrapper"]};return(0,yt.A)(u,xc,t)})(w),A=s&&d&&t.isValidElement(s)?t.cloneElement(s,{className:(0,ct.A)(S.iconWrapper,s.props.className)}):s;return(0,Pt.jsxs)(Ac,(0,ut.A)({focusRipple:!a,className:(0,ct.A)(S.root,o),ref:n,role:"tab","aria-selected":m,disabled:i,onClick:e=>{!m&&f&&f(e,g),p&&p(e)},onFocus:e=>{y&&!m&&f&&f(e,g),h&&h(e)},ownerState:w,tabIndex:m?0:-1},x,{children:["top"===u||"start"===u?(0,Pt.jsxs)(t.Fragment,{children:[A,d]}):(0,Pt.jsxs)(t.Fragment,{children:[d,A]}),c]}))})),kc=Oc;function jc(e){return(0,kt.Ay)("MuiCard",e)}(0,Ot.A)("MuiCard",["root"]);const Ec=["className","raised"],Cc=(0,vt.Ay)(sn,{name:"MuiCard",slot:"Root",overridesResolver:(e,t)=>t.root})((()=>({overflow:"hidden"}))),Pc=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiCard"}),{className:r,raised:o=!1}=n,i=(0,st.A)(n,Ec),a=(0,ut.A)({},n,{raised:o}),l=(e=>{const{classes:t}=e;return(0,yt.A)({root:["root"]},jc,t)})(a);return(0,Pt.jsx)(Cc,(0,ut.A)({className:(0,ct.A)(l.root,r),elevation:o?8:void 0,ref:t,ownerState:a},i))}));function Mc(e){return(0,kt.Ay)("MuiCardContent",e)}(0,Ot.A)("MuiCardContent",["root"]);const Tc=["className","component"],_c=(0,vt.Ay)("div",{name:"MuiCardContent",slot:"Root",overridesResolver:(e,t)=>t.root})((()=>({padding:16,"&:last-child":{paddingBottom:24}}))),Rc=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiCardContent"}),{className:r,component:o="div"}=n,i=(0,st.A)(n,Tc),a=(0,ut.A)({},n,{component:o}),l=(e=>{const{classes:t}=e;return(0,yt.A)({root:["root"]},Mc,t)})(a);return(0,Pt.jsx)(_c,(0,ut.A)({as:o,className:(0,ct.A)(l.root,r),ownerState:a,ref:t},i))}));function Nc(e){return(0,kt.Ay)("MuiTableContainer",e)}(0,Ot.A)("MuiTableContainer",["root"]);const Ic=["className","component"],Dc=(0,vt.Ay)("div",{name:"MuiTableContainer",slot:"Root",overridesResolver:(e,t)=>t.root})({width:"100%",overflowX:"auto"}),Lc=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiTableContainer"}),{className:r,component:o="div"}=n,i=(0,st.A)(n,Ic),a=(0,ut.A)({},n,{component:o}),l=(e=>{const{classes:t}=e;return(0,yt.A)({root:["root"]},Nc,t)})(a);return(0,Pt.jsx)(Dc,(0,ut.A)({ref:t,as:o,className:(0,ct.A)(l.root,r),ownerState:a},i))}));const zc=t.createContext();function $c(e){return(0,kt.Ay)("MuiTable",e)}(0,Ot.A)("MuiTable",["root","stickyHeader"]);const Bc=["className","component","padding","size","stickyHeader"],Fc=(0,vt.Ay)("table",{name:"MuiTable",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.stickyHeader&&t.stickyHeader]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({display:"table",width:"100%",borderCollapse:"collapse",borderSpacing:0,"& caption":(0,ut.A)({},t.typography.body2,{padding:t.spacing(2),color:(t.vars||t).palette.text.secondary,textAlign:"left",captionSide:"bottom"})},n.stickyHeader&&{borderCollapse:"separate"})})),Wc="table",Uc=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiTable"}),{className:o,component:i=Wc,padding:a="normal",size:l="medium",stickyHeader:s=!1}=r,u=(0,st.A)(r,Bc),c=(0,ut.A)({},r,{component:i,padding:a,size:l,stickyHeader:s}),d=(e=>{const{classes:t,stickyHeader:n}=e,r={root:["root",n&&"stickyHeader"]};return(0,yt.A)(r,$c,t)})(c),f=t.useMemo((()=>({padding:a,size:l,stickyHeader:s})),[a,l,s]);return(0,Pt.jsx)(zc.Provider,{value:f,children:(0,Pt.jsx)(Fc,(0,ut.A)({as:i,role:i===Wc?null:"table",ref:n,className:(0,ct.A)(d.root,o),ownerState:c},u))})}));const Hc=t.createContext();function Vc(e){return(0,kt.Ay)("MuiTableHead",e)}(0,Ot.A)("MuiTableHead",["root"]);const qc=["className","component"],Xc=(0,vt.Ay)("thead",{name:"MuiTableHead",slot:"Root",overridesResolver:(e,t)=>t.root})({display:"table-header-group"}),Kc={variant:"head"},Gc="thead",Yc=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiTableHead"}),{className:r,component:o=Gc}=n,i=(0,st.A)(n,qc),a=(0,ut.A)({},n,{component:o}),l=(e=>{const{classes:t}=e;return(0,yt.A)({root:["root"]},Vc,t)})(a);return(0,Pt.jsx)(Hc.Provider,{value:Kc,children:(0,Pt.jsx)(Xc,(0,ut.A)({as:o,className:(0,ct.A)(l.root,r),ref:t,role:o===Gc?null:"rowgroup",ownerState:a},i))})}));function Qc(e){return(0,kt.Ay)("MuiTableRow",e)}const Jc=(0,Ot.A)("MuiTableRow",["root","selected","hover","head","footer"]),Zc=["className","component","hover","selected"],ed=(0,vt.Ay)("tr",{name:"MuiTableRow",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.head&&t.head,n.footer&&t.footer]}})((e=>{let{theme:t}=e;return{color:"inherit",display:"table-row",verticalAlign:"middle",outline:0,[`&.${Jc.hover}:hover`]:{backgroundColor:(t.vars||t).palette.action.hover},[`&.${Jc.selected}`]:{backgroundColor:t.vars?`rgba(${t.vars.palette.primary.mainChannel} / ${t.vars.palette.action.selectedOpacity})`:(0,tn.X4)(t.palette.primary.main,t.palette.action.selectedOpacity),"&:hover":{backgroundColor:t.vars?`rgba(${t.vars.palette.primary.mainChannel} / calc(${t.vars.palette.action.selectedOpacity} + ${t.vars.palette.action.hoverOpacity}))`:(0,tn.X4)(t.palette.primary.main,t.palette.action.selectedOpacity+t.palette.action.hoverOpacity)}}}})),td="tr",nd=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiTableRow"}),{className:o,component:i=td,hover:a=!1,selected:l=!1}=r,s=(0,st.A)(r,Zc),u=t.useContext(Hc),c=(0,ut.A)({},r,{component:i,hover:a,selected:l,head:u&&"head"===u.variant,footer:u&&"footer"===u.variant}),d=(e=>{const{classes:t,selected:n,hover:r,head:o,footer:i}=e,a={root:["root",n&&"selected",r&&"hover",o&&"head",i&&"footer"]};return(0,yt.A)(a,Qc,t)})(c);return(0,Pt.jsx)(ed,(0,ut.A)({as:i,ref:n,className:(0,ct.A)(d.root,o),role:i===td?null:"row",ownerState:c},s))})),rd=nd;function od(e){return(0,kt.Ay)("MuiTableCell",e)}const id=(0,Ot.A)("MuiTableCell",["root","head","body","footer","sizeSmall","sizeMedium","paddingCheckbox","paddingNone","alignLeft","alignCenter","alignRight","alignJustify","stickyHeader"]),ad=["align","className","component","padding","scope","size","sortDirection","variant"],ld=(0,vt.Ay)("td",{name:"MuiTableCell",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[n.variant],t[`size${(0,Xt.A)(n.size)}`],"normal"!==n.padding&&t[`padding${(0,Xt.A)(n.padding)}`],"inherit"!==n.align&&t[`align${(0,Xt.A)(n.align)}`],n.stickyHeader&&t.stickyHeader]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({},t.typography.body2,{display:"table-cell",verticalAlign:"inherit",borderBottom:t.vars?`1px solid ${t.vars.palette.TableCell.border}`:`1px solid\n    ${"light"===t.palette.mode?(0,tn.a)((0,tn.X4)(t.palette.divider,1),.88):(0,tn.e$)((0,tn.X4)(t.palette.divider,1),.68)}`,textAlign:"left",padding:16},"head"===n.variant&&{color:(t.vars||t).palette.text.primary,lineHeight:t.typography.pxToRem(24),fontWeight:t.typography.fontWeightMedium},"body"===n.variant&&{color:(t.vars||t).palette.text.primary},"footer"===n.variant&&{color:(t.vars||t).palette.text.secondary,lineHeight:t.typography.pxToRem(21),fontSize:t.typography.pxToRem(12)},"small"===n.size&&{padding:"6px 16px",[`&.${id.paddingCheckbox}`]:{width:24,padding:"0 12px 0 16px","& > *":{padding:0}}},"checkbox"===n.padding&&{width:48,padding:"0 0 0 4px"},"none"===n.padding&&{padding:0},"left"===n.align&&{textAlign:"left"},"center"===n.align&&{textAlign:"center"},"right"===n.align&&{textAlign:"right",flexDirection:"row-reverse"},"justify"===n.align&&{textAlign:"justify"},n.stickyHeader&&{position:"sticky",top:0,zIndex:2,backgroundColor:(t.vars||t).palette.background.default})})),sd=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiTableCell"}),{align:o="inherit",className:i,component:a,padding:l,scope:s,size:u,sortDirection:c,variant:d}=r,f=(0,st.A)(r,ad),p=t.useContext(zc),h=t.useContext(Hc),m=h&&"head"===h.variant;let y;y=a||(m?"th":"td");let v=s;"td"===y?v=void 0:!v&&m&&(v="col");const g=d||h&&h.variant,b=(0,ut.A)({},r,{align:o,component:y,padding:l||(p&&p.padding?p.padding:"normal"),size:u||(p&&p.size?p.size:"medium"),sortDirection:c,stickyHeader:"head"===g&&p&&p.stickyHeader,variant:g}),x=(e=>{const{classes:t,variant:n,align:r,padding:o,size:i,stickyHeader:a}=e,l={root:["root",n,a&&"stickyHeader","inherit"!==r&&`align${(0,Xt.A)(r)}`,"normal"!==o&&`padding${(0,Xt.A)(o)}`,`size${(0,Xt.A)(i)}`]};return(0,yt.A)(l,od,t)})(b);let w=null;return c&&(w="asc"===c?"ascending":"descending"),(0,Pt.jsx)(ld,(0,ut.A)({as:y,ref:n,className:(0,ct.A)(x.root,i),"aria-sort":w,scope:v,ownerState:b},f))})),ud=sd;function cd(e){return(0,kt.Ay)("MuiTableBody",e)}(0,Ot.A)("MuiTableBody",["root"]);const dd=["className","component"],fd=(0,vt.Ay)("tbody",{name:"MuiTableBody",slot:"Root",overridesResolver:(e,t)=>t.root})({display:"table-row-group"}),pd={variant:"body"},hd="tbody",md=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiTableBody"}),{className:r,component:o=hd}=n,i=(0,st.A)(n,dd),a=(0,ut.A)({},n,{component:o}),l=(e=>{const{classes:t}=e;return(0,yt.A)({root:["root"]},cd,t)})(a);return(0,Pt.jsx)(Hc.Provider,{value:pd,children:(0,Pt.jsx)(fd,(0,ut.A)({className:(0,ct.A)(l.root,r),as:o,ref:t,role:o===hd?null:"rowgroup",ownerState:a},i))})})),yd=(0,Ya.A)((0,Pt.jsx)("path",{d:"M12 2C6.47 2 2 6.47 2 12s4.47 10 10 10 10-4.47 10-10S17.53 2 12 2zm5 13.59L15.59 17 12 13.41 8.41 17 7 15.59 10.59 12 7 8.41 8.41 7 12 10.59 15.59 7 17 8.41 13.41 12 17 15.59z"}),"Cancel");function vd(e){return(0,kt.Ay)("MuiChip",e)}const gd=(0,Ot.A)("MuiChip",["root","sizeSmall","sizeMedium","colorError","colorInfo","colorPrimary","colorSecondary","colorSuccess","colorWarning","disabled","clickable","clickableColorPrimary","clickableColorSecondary","deletable","deletableColorPrimary","deletableColorSecondary","outlined","filled","outlinedPrimary","outlinedSecondary","filledPrimary","filledSecondary","avatar","avatarSmall","avatarMedium","avatarColorPrimary","avatarColorSecondary","icon","iconSmall","iconMedium","iconColorPrimary","iconColorSecondary","label","labelSmall","labelMedium","deleteIcon","deleteIconSmall","deleteIconMedium","deleteIconColorPrimary","deleteIconColorSecondary","deleteIconOutlinedColorPrimary","deleteIconOutlinedColorSecondary","deleteIconFilledColorPrimary","deleteIconFilledColorSecondary","focusVisible"]),bd=["avatar","className","clickable","color","component","deleteIcon","disabled","icon","label","onClick","onDelete","onKeyDown","onKeyUp","size","variant","tabIndex","skipFocusWhenDisabled"],xd=(0,vt.Ay)("div",{name:"MuiChip",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e,{color:r,iconColor:o,clickable:i,onDelete:a,size:l,variant:s}=n;return[{[`& .${gd.avatar}`]:t.avatar},{[`& .${gd.avatar}`]:t[`avatar${(0,Xt.A)(l)}`]},{[`& .${gd.avatar}`]:t[`avatarColor${(0,Xt.A)(r)}`]},{[`& .${gd.icon}`]:t.icon},{[`& .${gd.icon}`]:t[`icon${(0,Xt.A)(l)}`]},{[`& .${gd.icon}`]:t[`iconColor${(0,Xt.A)(o)}`]},{[`& .${gd.deleteIcon}`]:t.deleteIcon},{[`& .${gd.deleteIcon}`]:t[`deleteIcon${(0,Xt.A)(l)}`]},{[`& .${gd.deleteIcon}`]:t[`deleteIconColor${(0,Xt.A)(r)}`]},{[`& .${gd.deleteIcon}`]:t[`deleteIcon${(0,Xt.A)(s)}Color${(0,Xt.A)(r)}`]},t.root,t[`size${(0,Xt.A)(l)}`],t[`color${(0,Xt.A)(r)}`],i&&t.clickable,i&&"default"!==r&&t[`clickableColor${(0,Xt.A)(r)})`],a&&t.deletable,a&&"default"!==r&&t[`deletableColor${(0,Xt.A)(r)}`],t[s],t[`${s}${(0,Xt.A)(r)}`]]}})((e=>{let{theme:t,ownerState:n}=e;const r="light"===t.palette.mode?t.palette.grey[700]:t.palette.grey[300];return(0,ut.A)({maxWidth:"100%",fontFamily:t.typography.fontFamily,fontSize:t.typography.pxToRem(13),display:"inline-flex",alignItems:"center",justifyContent:"center",height:32,color:(t.vars||t).palette.text.primary,backgroundColor:(t.vars||t).palette.action.selected,borderRadius:16,whiteSpace:"nowrap",transition:t.transitions.create(["background-color","box-shadow"]),cursor:"default",outline:0,textDecoration:"none",border:0,padding:0,verticalAlign:"middle",boxSizing:"border-box",[`&.${gd.disabled}`]:{opacity:(t.vars||t).palette.action.disabledOpacity,pointerEvents:"none"},[`& .${gd.avatar}`]:{marginLeft:5,marginRight:-6,width:24,height:24,color:t.vars?t.vars.palette.Chip.defaultAvatarColor:r,fontSize:t.typography.pxToRem(12)},[`& .${gd.avatarColorPrimary}`]:{color:(t.vars||t).palette.primary.contrastText,backgroundColor:(t.vars||t).palette.primary.dark},[`& .${gd.avatarColorSecondary}`]:{color:(t.vars||t).palette.secondary.contrastText,backgroundColor:(t.vars||t).palette.secondary.dark},[`& .${gd.avatarSmall}`]:{marginLeft:4,marginRight:-4,width:18,height:18,fontSize:t.typography.pxToRem(10)},[`& .${gd.icon}`]:(0,ut.A)({marginLeft:5,marginRight:-6},"small"===n.size&&{fontSize:18,marginLeft:4,marginRight:-4},n.iconColor===n.color&&(0,ut.A)({color:t.vars?t.vars.palette.Chip.defaultIconColor:r},"default"!==n.color&&{color:"inherit"})),[`& .${gd.deleteIcon}`]:(0,ut.A)({WebkitTapHighlightColor:"transparent",color:t.vars?`rgba(${t.vars.palette.text.primaryChannel} / 0.26)`:(0,tn.X4)(t.palette.text.primary,.26),fontSize:22,cursor:"pointer",margin:"0 5px 0 -6px","&:hover":{color:t.vars?`rgba(${t.vars.palette.text.primaryChannel} / 0.4)`:(0,tn.X4)(t.palette.text.primary,.4)}},"small"===n.size&&{fontSize:16,marginRight:4,marginLeft:-4},"default"!==n.color&&{color:t.vars?`rgba(${t.vars.palette[n.color].contrastTextChannel} / 0.7)`:(0,tn.X4)(t.palette[n.color].contrastText,.7),"&:hover, &:active":{color:(t.vars||t).palette[n.color].contrastText}})},"small"===n.size&&{height:24},"default"!==n.color&&{backgroundColor:(t.vars||t).palette[n.color].main,color:(t.vars||t).palette[n.color].contrastText},n.onDelete&&{[`&.${gd.focusVisible}`]:{backgroundColor:t.vars?`rgba(${t.vars.palette.action.selectedChannel} / calc(${t.vars.palette.action.selectedOpacity} + ${t.vars.palette.action.focusOpacity}))`:(0,tn.X4)(t.palette.action.selected,t.palette.action.selectedOpacity+t.palette.action.focusOpacity)}},n.onDelete&&"default"!==n.color&&{[`&.${gd.focusVisible}`]:{backgroundColor:(t.vars||t).palette[n.color].dark}})}),(e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({},n.clickable&&{userSelect:"none",WebkitTapHighlightColor:"transparent",cursor:"pointer","&:hover":{backgroundColor:t.vars?`rgba(${t.vars.palette.action.selectedChannel} / calc(${t.vars.palette.action.selectedOpacity} + ${t.vars.palette.action.hoverOpacity}))`:(0,tn.X4)(t.palette.action.selected,t.palette.action.selectedOpacity+t.palette.action.hoverOpacity)},[`&.${gd.focusVisible}`]:{backgroundColor:t.vars?`rgba(${t.vars.palette.action.selectedChannel} / calc(${t.vars.palette.action.selectedOpacity} + ${t.vars.palette.action.focusOpacity}))`:(0,tn.X4)(t.palette.action.selected,t.palette.action.selectedOpacity+t.palette.action.focusOpacity)},"&:active":{boxShadow:(t.vars||t).shadows[1]}},n.clickable&&"default"!==n.color&&{[`&:hover, &.${gd.focusVisible}`]:{backgroundColor:(t.vars||t).palette[n.color].dark}})}),(e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({},"outlined"===n.variant&&{backgroundColor:"transparent",border:t.vars?`1px solid ${t.vars.palette.Chip.defaultBorder}`:`1px solid ${"light"===t.palette.mode?t.palette.grey[400]:t.palette.grey[700]}`,[`&.${gd.clickable}:hover`]:{backgroundColor:(t.vars||t).palette.action.hover},[`&.${gd.focusVisible}`]:{backgroundColor:(t.vars||t).palette.action.focus},[`& .${gd.avatar}`]:{marginLeft:4},[`& .${gd.avatarSmall}`]:{marginLeft:2},[`& .${gd.icon}`]:{marginLeft:4},[`& .${gd.iconSmall}`]:{marginLeft:2},[`& .${gd.deleteIcon}`]:{marginRight:5},[`& .${gd.deleteIconSmall}`]:{marginRight:3}},"outlined"===n.variant&&"default"!==n.color&&{color:(t.vars||t).palette[n.color].main,border:`1px solid ${t.vars?`rgba(${t.vars.palette[n.color].mainChannel} / 0.7)`:(0,tn.X4)(t.palette[n.color].main,.7)}`,[`&.${gd.clickable}:hover`]:{backgroundColor:t.vars?`rgba(${t.vars.palette[n.color].mainChannel} / ${t.vars.palette.action.hoverOpacity})`:(0,tn.X4)(t.palette[n.color].main,t.palette.action.hoverOpacity)},[`&.${gd.focusVisible}`]:{backgroundColor:t.vars?`rgba(${t.vars.palette[n.color].mainChannel} / ${t.vars.palette.action.focusOpacity})`:(0,tn.X4)(t.palette[n.color].main,t.palette.action.focusOpacity)},[`& .${gd.deleteIcon}`]:{color:t.vars?`rgba(${t.vars.palette[n.color].mainChannel} / 0.7)`:(0,tn.X4)(t.palette[n.color].main,.7),"&:hover, &:active":{color:(t.vars||t).palette[n.color].main}}})})),wd=(0,vt.Ay)("span",{name:"MuiChip",slot:"Label",overridesResolver:(e,t)=>{const{ownerState:n}=e,{size:r}=n;return[t.label,t[`label${(0,Xt.A)(r)}`]]}})((e=>{let{ownerState:t}=e;return(0,ut.A)({overflow:"hidden",textOverflow:"ellipsis",paddingLeft:12,paddingRight:12,whiteSpace:"nowrap"},"small"===t.size&&{paddingLeft:8,paddingRight:8})}));function Sd(e){return"Backspace"===e.key||"Delete"===e.key}const Ad=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiChip"}),{avatar:o,className:i,clickable:a,color:l="default",component:s,deleteIcon:u,disabled:c=!1,icon:d,label:f,onClick:p,onDelete:h,onKeyDown:m,onKeyUp:y,size:v="medium",variant:g="filled",tabIndex:b,skipFocusWhenDisabled:x=!1}=r,w=(0,st.A)(r,bd),S=t.useRef(null),A=(0,cn.A)(S,n),O=e=>{e.stopPropagation(),h&&h(e)},k=!(!1===a||!p)||a,j=k||h?Kn:s||"div",E=(0,ut.A)({},r,{component:j,disabled:c,size:v,color:l,iconColor:t.isValidElement(d)&&d.props.color||l,onDelete:!!h,clickable:k,variant:g}),C=(e=>{const{classes:t,disabled:n,size:r,color:o,iconColor:i,onDelete:a,clickable:l,variant:s}=e,u={root:["root",s,n&&"disabled",`size${(0,Xt.A)(r)}`,`color${(0,Xt.A)(o)}`,l&&"clickable",l&&`clickableColor${(0,Xt.A)(o)}`,a&&"deletable",a&&`deletableColor${(0,Xt.A)(o)}`,`${s}${(0,Xt.A)(o)}`],label:["label",`label${(0,Xt.A)(r)}`],avatar:["avatar",`avatar${(0,Xt.A)(r)}`,`avatarColor${(0,Xt.A)(o)}`],icon:["icon",`icon${(0,Xt.A)(r)}`,`iconColor${(0,Xt.A)(i)}`],deleteIcon:["deleteIcon",`deleteIcon${(0,Xt.A)(r)}`,`deleteIconColor${(0,Xt.A)(o)}`,`deleteIcon${(0,Xt.A)(s)}Color${(0,Xt.A)(o)}`]};return(0,yt.A)(u,vd,t)})(E),P=j===Kn?(0,ut.A)({component:s||"div",focusVisibleClassName:C.focusVisible},h&&{disableRipple:!0}):{};let M=null;h&&(M=u&&t.isValidElement(u)?t.cloneElement(u,{className:(0,ct.A)(u.props.className,C.deleteIcon),onClick:O}):(0,Pt.jsx)(yd,{className:(0,ct.A)(C.deleteIcon),onClick:O}));let T=null;o&&t.isValidElement(o)&&(T=t.cloneElement(o,{className:(0,ct.A)(C.avatar,o.props.className)}));let _=null;return d&&t.isValidElement(d)&&(_=t.cloneElement(d,{className:(0,ct.A)(C.icon,d.props.className)})),(0,Pt.jsxs)(xd,(0,ut.A)({as:j,className:(0,ct.A)(C.root,i),disabled:!(!k||!c)||void 0,onClick:p,onKeyDown:e=>{e.currentTarget===e.target&&Sd(e)&&e.preventDefault(),m&&m(e)},onKeyUp:e=>{e.currentTarget===e.target&&(h&&Sd(e)?h(e):"Escape"===e.key&&S.current&&S.current.blur()),y&&y(e)},ref:A,tabIndex:x&&c?-1:b,ownerState:E},P,w,{children:[T||_,(0,Pt.jsx)(wd,{className:(0,ct.A)(C.label),ownerState:E,children:f}),M]}))})),Od=Ad;function kd(e){return(0,kt.Ay)("MuiDialog",e)}const jd=(0,Ot.A)("MuiDialog",["root","scrollPaper","scrollBody","container","paper","paperScrollPaper","paperScrollBody","paperWidthFalse","paperWidthXs","paperWidthSm","paperWidthMd","paperWidthLg","paperWidthXl","paperFullWidth","paperFullScreen"]);const Ed=t.createContext({}),Cd=["aria-describedby","aria-labelledby","BackdropComponent","BackdropProps","children","className","disableEscapeKeyDown","fullScreen","fullWidth","maxWidth","onBackdropClick","onClose","open","PaperComponent","PaperProps","scroll","TransitionComponent","transitionDuration","TransitionProps"],Pd=(0,vt.Ay)(ia,{name:"MuiDialog",slot:"Backdrop",overrides:(e,t)=>t.backdrop})({zIndex:-1}),Md=(0,vt.Ay)(ua,{name:"MuiDialog",slot:"Root",overridesResolver:(e,t)=>t.root})({"@media print":{position:"absolute !important"}}),Td=(0,vt.Ay)("div",{name:"MuiDialog",slot:"Container",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.container,t[`scroll${(0,Xt.A)(n.scroll)}`]]}})((e=>{let{ownerState:t}=e;return(0,ut.A)({height:"100%","@media print":{height:"auto"},outline:0},"paper"===t.scroll&&{display:"flex",justifyContent:"center",alignItems:"center"},"body"===t.scroll&&{overflowY:"auto",overflowX:"hidden",textAlign:"center","&:after":{content:'""',display:"inline-block",verticalAlign:"middle",height:"100%",width:"0"}})})),_d=(0,vt.Ay)(sn,{name:"MuiDialog",slot:"Paper",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.paper,t[`scrollPaper${(0,Xt.A)(n.scroll)}`],t[`paperWidth${(0,Xt.A)(String(n.maxWidth))}`],n.fullWidth&&t.paperFullWidth,n.fullScreen&&t.paperFullScreen]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({margin:32,position:"relative",overflowY:"auto","@media print":{overflowY:"visible",boxShadow:"none"}},"paper"===n.scroll&&{display:"flex",flexDirection:"column",maxHeight:"calc(100% - 64px)"},"body"===n.scroll&&{display:"inline-block",verticalAlign:"middle",textAlign:"left"},!n.maxWidth&&{maxWidth:"calc(100% - 64px)"},"xs"===n.maxWidth&&{maxWidth:"px"===t.breakpoints.unit?Math.max(t.breakpoints.values.xs,444):`${t.breakpoints.values.xs}${t.breakpoints.unit}`,[`&.${jd.paperScrollBody}`]:{[t.breakpoints.down(Math.max(t.breakpoints.values.xs,444)+64)]:{maxWidth:"calc(100% - 64px)"}}},n.maxWidth&&"xs"!==n.maxWidth&&{maxWidth:`${t.breakpoints.values[n.maxWidth]}${t.breakpoints.unit}`,[`&.${jd.paperScrollBody}`]:{[t.breakpoints.down(t.breakpoints.values[n.maxWidth]+64)]:{maxWidth:"calc(100% - 64px)"}}},n.fullWidth&&{width:"calc(100% - 64px)"},n.fullScreen&&{margin:0,width:"100%",maxWidth:"100%",height:"100%",maxHeight:"none",borderRadius:0,[`&.${jd.paperScrollBody}`]:{margin:0,maxWidth:"100%"}})})),Rd=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiDialog"}),o=St(),i={enter:o.transitions.duration.enteringScreen,exit:o.transitions.duration.leavingScreen},{"aria-describedby":a,"aria-labelledby":l,BackdropComponent:s,BackdropProps:u,children:c,className:d,disableEscapeKeyDown:f=!1,fullScreen:p=!1,fullWidth:h=!1,maxWidth:m="sm",onBackdropClick:y,onClose:v,open:g,PaperComponent:b=sn,PaperProps:x={},scroll:w="paper",TransitionComponent:S=ta,transitionDuration:A=i,TransitionProps:O}=r,k=(0,st.A)(r,Cd),j=(0,ut.A)({},r,{disableEscapeKeyDown:f,fullScreen:p,fullWidth:h,maxWidth:m,scroll:w}),E=(e=>{const{classes:t,scroll:n,maxWidth:r,fullWidth:o,fullScreen:i}=e,a={root:["root"],container:["container",`scroll${(0,Xt.A)(n)}`],paper:["paper",`paperScroll${(0,Xt.A)(n)}`,`paperWidth${(0,Xt.A)(String(r))}`,o&&"paperFullWidth",i&&"paperFullScreen"]};return(0,yt.A)(a,kd,t)})(j),C=t.useRef(),P=(0,yr.A)(l),M=t.useMemo((()=>({titleId:P})),[P]);return(0,Pt.jsx)(Md,(0,ut.A)({className:(0,ct.A)(E.root,d),closeAfterTransition:!0,components:{Backdrop:Pd},componentsProps:{backdrop:(0,ut.A)({transitionDuration:A,as:s},u)},disableEscapeKeyDown:f,onClose:v,open:g,ref:n,onClick:e=>{C.current&&(C.current=null,y&&y(e),v&&v(e,"backdropClick"))},ownerState:j},k,{children:(0,Pt.jsx)(S,(0,ut.A)({appear:!0,in:g,timeout:A,role:"presentation"},O,{children:(0,Pt.jsx)(Td,{className:(0,ct.A)(E.container),onMouseDown:e=>{C.current=e.target===e.currentTarget},ownerState:j,children:(0,Pt.jsx)(_d,(0,ut.A)({as:b,elevation:24,role:"dialog","aria-describedby":a,"aria-labelledby":P},x,{className:(0,ct.A)(E.paper,x.className),ownerState:j,children:(0,Pt.jsx)(Ed.Provider,{value:M,children:c})}))})}))}))}));function Nd(e){return(0,kt.Ay)("MuiDialogTitle",e)}const Id=(0,Ot.A)("MuiDialogTitle",["root"]),Dd=["className","id"],Ld=(0,vt.Ay)(en,{name:"MuiDialogTitle",slot:"Root",overridesResolver:(e,t)=>t.root})({padding:"16px 24px",flex:"0 0 auto"}),zd=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiDialogTitle"}),{className:o,id:i}=r,a=(0,st.A)(r,Dd),l=r,s=(e=>{const{classes:t}=e;return(0,yt.A)({root:["root"]},Nd,t)})(l),{titleId:u=i}=t.useContext(Ed);return(0,Pt.jsx)(Ld,(0,ut.A)({component:"h2",className:(0,ct.A)(s.root,o),ownerState:l,ref:n,variant:"h6",id:null!=i?i:u},a))}));function $d(e){return(0,kt.Ay)("MuiDialogContent",e)}(0,Ot.A)("MuiDialogContent",["root","dividers"]);const Bd=["className","dividers"],Fd=(0,vt.Ay)("div",{name:"MuiDialogContent",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.dividers&&t.dividers]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({flex:"1 1 auto",WebkitOverflowScrolling:"touch",overflowY:"auto",padding:"20px 24px"},n.dividers?{padding:"16px 24px",borderTop:`1px solid ${(t.vars||t).palette.divider}`,borderBottom:`1px solid ${(t.vars||t).palette.divider}`}:{[`.${Id.root} + &`]:{paddingTop:0}})})),Wd=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiDialogContent"}),{className:r,dividers:o=!1}=n,i=(0,st.A)(n,Bd),a=(0,ut.A)({},n,{dividers:o}),l=(e=>{const{classes:t,dividers:n}=e,r={root:["root",n&&"dividers"]};return(0,yt.A)(r,$d,t)})(a);return(0,Pt.jsx)(Fd,(0,ut.A)({className:(0,ct.A)(l.root,r),ownerState:a,ref:t},i))}));function Ud(e){return(0,kt.Ay)("MuiDialogActions",e)}(0,Ot.A)("MuiDialogActions",["root","spacing"]);const Hd=["className","disableSpacing"],Vd=(0,vt.Ay)("div",{name:"MuiDialogActions",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,!n.disableSpacing&&t.spacing]}})((e=>{let{ownerState:t}=e;return(0,ut.A)({display:"flex",alignItems:"center",padding:8,justifyContent:"flex-end",flex:"0 0 auto"},!t.disableSpacing&&{"& > :not(:first-of-type)":{marginLeft:8}})})),qd=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiDialogActions"}),{className:r,disableSpacing:o=!1}=n,i=(0,st.A)(n,Hd),a=(0,ut.A)({},n,{disableSpacing:o}),l=(e=>{const{classes:t,disableSpacing:n}=e,r={root:["root",!n&&"spacing"]};return(0,yt.A)(r,Ud,t)})(a);return(0,Pt.jsx)(Vd,(0,ut.A)({className:(0,ct.A)(l.root,r),ownerState:a,ref:t},i))})),Xd=(0,Ya.A)((0,Pt.jsx)("path",{d:"M17.65 6.35C16.2 4.9 14.21 4 12 4c-4.42 0-7.99 3.58-7.99 8s3.57 8 7.99 8c3.73 0 6.84-2.55 7.73-6h-2.08c-.82 2.33-3.04 4-5.65 4-3.31 0-6-2.69-6-6s2.69-6 6-6c1.66 0 3.14.69 4.22 1.78L13 11h7V4l-2.35 2.35z"}),"Refresh"),Kd=(0,Ya.A)((0,Pt.jsx)("path",{d:"m17 7-1.41 1.41L18.17 11H8v2h10.17l-2.58 2.58L17 17l5-5zM4 5h8V3H4c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h8v-2H4V5z"}),"Logout"),Gd=(0,Ya.A)((0,Pt.jsx)("path",{d:"M12 12c2.21 0 4-1.79 4-4s-1.79-4-4-4-4 1.79-4 4 1.79 4 4 4zm0 2c-2.67 0-8 1.34-8 4v2h16v-2c0-2.66-5.33-4-8-4z"}),"Person"),Yd=(0,Ya.A)((0,Pt.jsx)("path",{d:"m16 6 2.29 2.29-4.88 4.88-4-4L2 16.59 3.41 18l6-6 4 4 6.3-6.29L22 12V6z"}),"TrendingUp"),Qd=(0,Ya.A)((0,Pt.jsx)("path",{d:"M20 2H4c-1.1 0-1.99.9-1.99 2L2 22l4-4h14c1.1 0 2-.9 2-2V4c0-1.1-.9-2-2-2zM6 9h12v2H6V9zm8 5H6v-2h8v2zm4-6H6V6h12v2z"}),"Chat"),Jd=(0,Ya.A)((0,Pt.jsx)("path",{d:"M12 4.5C7 4.5 2.73 7.61 1 12c1.73 4.39 6 7.5 11 7.5s9.27-3.11 11-7.5c-1.73-4.39-6-7.5-11-7.5zM12 17c-2.76 0-5-2.24-5-5s2.24-5 5-5 5 2.24 5 5-2.24 5-5 5zm0-8c-1.66 0-3 1.34-3 3s1.34 3 3 3 3-1.34 3-3-1.34-3-3-3z"}),"Visibility");const Zd=function(){const e=ee(),[n,r]=(0,t.useState)(""),[o,i]=(0,t.useState)(""),[a,l]=(0,t.useState)(""),[s,u]=(0,t.useState)(!1),[c,d]=(0,t.useState)(null),[f,p]=(0,t.useState)(!1),[h,m]=(0,t.useState)(0),[y,v]=(0,t.useState)(""),[g,b]=(0,t.useState)([]),[x,w]=(0,t.useState)(null),[S,A]=(0,t.useState)(!1),[O,k]=(0,t.useState)([]);t.useEffect((()=>{const t=sessionStorage.getItem("student_id");t?(r(t),E(t)):e("/student/login")}),[]);const j=async e=>{e.preventDefault(),p(!0),l("");try{const e=await fetch("/api/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({student_id:n,password:o})}),t=await e.json();t.success?(u(!0),E()):l(t.message||"Login failed")}catch(t){l("An error occurred during login")}finally{p(!1)}},E=async e=>{try{const t=await fetch("/api/student_portal",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({student_id:e})}),n=await t.json();n.profile&&(d(n.profile),k(n.recommendations||[]))}catch(t){console.error("Error fetching student data:",t),l("Failed to fetch student data")}},C=async()=>{if(!y.trim())return;const e={sender:"student",text:y,timestamp:(new Date).toISOString()};b([...g,e]),v("");try{const e=await fetch("/api/chat",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({message:y,student_id:n})}),t={sender:"bot",text:(await e.json()).message,timestamp:(new Date).toISOString()};b((e=>[...e,t]))}catch(t){console.error("Error sending message:",t),l("Failed to send message")}},P=()=>{w(null),A(!1)},M=e=>{switch(e.toLowerCase()){case"easy":return"#4caf50";case"medium":return"#ff9800";case"hard":return"#f44336";default:return"#757575"}};return s?(0,Pt.jsx)(mr,{maxWidth:"lg",children:(0,Pt.jsxs)(qt,{sx:{mt:4},children:[(0,Pt.jsxs)(qt,{sx:{display:"flex",justifyContent:"space-between",alignItems:"center",mb:3},children:[(0,Pt.jsx)(en,{variant:"h4",component:"h1",children:"Student Portal"}),(0,Pt.jsxs)(qt,{children:[(0,Pt.jsx)(qu,{title:"Refresh Data",children:(0,Pt.jsx)(ql,{onClick:E,sx:{mr:1},children:(0,Pt.jsx)(Xd,{})})}),(0,Pt.jsx)(qu,{title:"Logout",children:(0,Pt.jsx)(ql,{onClick:()=>{sessionStorage.removeItem("student_id"),u(!1),r(""),d(null),k([]),b([]),m(0),e("/student/login")},children:(0,Pt.jsx)(Kd,{})})})]})]}),(0,Pt.jsxs)(bc,{value:h,onChange:(e,t)=>{m(t)},sx:{mb:3},children:[(0,Pt.jsx)(kc,{icon:(0,Pt.jsx)(Gd,{}),label:"Profile"}),(0,Pt.jsx)(kc,{icon:(0,Pt.jsx)(Yd,{}),label:"Recommendations"}),(0,Pt.jsx)(kc,{icon:(0,Pt.jsx)(Qd,{}),label:"Chat"})]}),0===h&&c&&(0,Pt.jsxs)(Dt,{container:!0,spacing:3,children:[(0,Pt.jsx)(Dt,{item:!0,xs:12,md:6,children:(0,Pt.jsx)(Pc,{children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{variant:"h6",gutterBottom:!0,children:"Personal Information"}),(0,Pt.jsxs)(en,{variant:"body1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Student ID:"})," ",c.Student_ID]}),(0,Pt.jsxs)(en,{variant:"body1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Name:"})," ",c.Name]}),(0,Pt.jsxs)(en,{variant:"body1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Department:"})," ",c.Department]}),(0,Pt.jsxs)(en,{variant:"body1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"CGPA:"})," ",c.CGPA]})]})})}),(0,Pt.jsx)(Dt,{item:!0,xs:12,md:6,children:(0,Pt.jsx)(Pc,{children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{variant:"h6",gutterBottom:!0,children:"Completed Courses"}),(0,Pt.jsx)(Lc,{children:(0,Pt.jsxs)(Uc,{size:"small",children:[(0,Pt.jsx)(Yc,{children:(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:"Course Code"}),(0,Pt.jsx)(ud,{children:"Course Name"})]})}),(0,Pt.jsx)(md,{children:c.Completed_Courses.map(((e,t)=>(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:e.Course_Code}),(0,Pt.jsx)(ud,{children:e.Course_Name})]},t)))})]})})]})})})]}),1===h&&(0,Pt.jsx)(Lc,{component:sn,children:(0,Pt.jsxs)(Uc,{children:[(0,Pt.jsx)(Yc,{children:(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:"Course Code"}),(0,Pt.jsx)(ud,{children:"Course Name"}),(0,Pt.jsx)(ud,{children:"Department"}),(0,Pt.jsx)(ud,{children:"Difficulty"}),(0,Pt.jsx)(ud,{children:"Match Score"}),(0,Pt.jsx)(ud,{children:"Actions"})]})}),(0,Pt.jsx)(md,{children:O.map((e=>{return(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:e.Course_Code}),(0,Pt.jsx)(ud,{children:e.Course_Name}),(0,Pt.jsx)(ud,{children:e.Department}),(0,Pt.jsx)(ud,{children:(0,Pt.jsx)(Od,{label:e.Difficulty,size:"small",sx:{backgroundColor:M(e.Difficulty),color:"white"}})}),(0,Pt.jsx)(ud,{children:(0,Pt.jsx)(Od,{label:`${(100*e.Match_Score).toFixed(0)}%`,size:"small",sx:{backgroundColor:(t=e.Match_Score,t>=.8?"#4caf50":t>=.6?"#ff9800":"#f44336"),color:"white"}})}),(0,Pt.jsx)(ud,{children:(0,Pt.jsx)(qu,{title:"View Details",children:(0,Pt.jsx)(ql,{size:"small",onClick:()=>(e=>{w(e),A(!0)})(e),children:(0,Pt.jsx)(Jd,{})})})})]},e.Course_Code);var t}))})]})}),2===h&&(0,Pt.jsxs)(Dt,{container:!0,spacing:3,children:[(0,Pt.jsx)(Dt,{item:!0,xs:12,children:(0,Pt.jsx)(sn,{sx:{p:2,height:"400px",overflow:"auto"},children:g.map(((e,t)=>(0,Pt.jsx)(qt,{sx:{display:"flex",justifyContent:"student"===e.sender?"flex-end":"flex-start",mb:2},children:(0,Pt.jsx)(sn,{sx:{p:2,maxWidth:"70%",backgroundColor:"student"===e.sender?"primary.main":"grey.100",color:"student"===e.sender?"white":"text.primary"},children:(0,Pt.jsx)(en,{variant:"body1",children:e.text})})},t)))})}),(0,Pt.jsx)(Dt,{item:!0,xs:12,children:(0,Pt.jsxs)(qt,{sx:{display:"flex",gap:1},children:[(0,Pt.jsx)(cl,{fullWidth:!0,value:y,onChange:e=>v(e.target.value),placeholder:"Type your message...",onKeyPress:e=>{"Enter"===e.key&&C()}}),(0,Pt.jsx)(or,{variant:"contained",onClick:C,disabled:!y.trim(),children:"Send"})]})})]}),(0,Pt.jsx)(Rd,{open:S,onClose:P,maxWidth:"md",fullWidth:!0,children:x&&(0,Pt.jsxs)(Pt.Fragment,{children:[(0,Pt.jsx)(zd,{children:"Course Details"}),(0,Pt.jsx)(Wd,{children:(0,Pt.jsxs)(Dt,{container:!0,spacing:2,sx:{mt:1},children:[(0,Pt.jsxs)(Dt,{item:!0,xs:12,sm:6,children:[(0,Pt.jsxs)(en,{variant:"subtitle1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Course Code:"})," ",x.Course_Code]}),(0,Pt.jsxs)(en,{variant:"subtitle1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Course Name:"})," ",x.Course_Name]}),(0,Pt.jsxs)(en,{variant:"subtitle1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Department:"})," ",x.Department]})]}),(0,Pt.jsxs)(Dt,{item:!0,xs:12,sm:6,children:[(0,Pt.jsxs)(en,{variant:"subtitle1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Credit Hours:"})," ",x.Credit_Hours]}),(0,Pt.jsxs)(en,{variant:"subtitle1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Difficulty:"})," ",x.Difficulty]}),(0,Pt.jsxs)(en,{variant:"subtitle1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Prerequisites:"})," ",x.Prerequisites]}),(0,Pt.jsxs)(en,{variant:"subtitle1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Match Score:"})," ",(100*x.Match_Score).toFixed(0),"%"]})]})]})}),(0,Pt.jsx)(qd,{children:(0,Pt.jsx)(or,{onClick:P,children:"Close"})})]})}),(0,Pt.jsx)(zl,{open:!!a,autoHideDuration:6e3,onClose:()=>l(""),children:(0,Pt.jsx)(is,{severity:"error",onClose:()=>l(""),children:a})})]})}):(0,Pt.jsxs)(mr,{maxWidth:"sm",children:[(0,Pt.jsx)(qt,{sx:{mt:8,display:"flex",flexDirection:"column",alignItems:"center"},children:(0,Pt.jsxs)(sn,{elevation:3,sx:{p:4,width:"100%"},children:[(0,Pt.jsx)(en,{component:"h1",variant:"h5",align:"center",gutterBottom:!0,children:"Student Login"}),(0,Pt.jsxs)("form",{onSubmit:j,children:[(0,Pt.jsx)(cl,{margin:"normal",required:!0,fullWidth:!0,label:"Student ID",value:n,onChange:e=>r(e.target.value)}),(0,Pt.jsx)(cl,{margin:"normal",required:!0,fullWidth:!0,label:"Password",type:"password",value:o,onChange:e=>i(e.target.value)}),(0,Pt.jsx)(or,{type:"submit",fullWidth:!0,variant:"contained",sx:{mt:3,mb:2},disabled:f,children:f?(0,Pt.jsx)(kl,{size:24}):"Login"})]})]})}),(0,Pt.jsx)(zl,{open:!!a,autoHideDuration:6e3,onClose:()=>l(""),children:(0,Pt.jsx)(is,{severity:"error",onClose:()=>l(""),children:a})})]})};var ef=n(8094),tf=n(6300),nf=n(7991),rf=n(7912),of=n(1702),af=n(8625),lf=n(9889),sf=n.n(lf),uf=n(620),cf=n.n(uf),df=n(5268),ff=n.n(df),pf=n(3097),hf=n.n(pf),mf=n(9160),yf=n.n(mf),vf=function(e){return 0===e?0:e>0?1:-1},gf=function(e){return cf()(e)&&e.indexOf("%")===e.length-1},bf=function(e){return yf()(e)&&!ff()(e)},xf=function(e){return bf(e)||cf()(e)},wf=0,Sf=function(e){var t=++wf;return"".concat(e||"").concat(t)},Af=function(e,t){var n,r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,o=arguments.length>3&&void 0!==arguments[3]&&arguments[3];if(!bf(e)&&!cf()(e))return r;if(gf(e)){var i=e.indexOf("%");n=t*parseFloat(e.slice(0,i))/100}else n=+e;return ff()(n)&&(n=r),o&&n>t&&(n=t),n},Of=function(e){if(!e)return null;var t=Object.keys(e);return t&&t.length?e[t[0]]:null},kf=function(e,t){return bf(e)&&bf(t)?function(n){return e+n*(t-e)}:function(){return t}};function jf(e,t,n){return e&&e.length?e.find((function(e){return e&&("function"===typeof t?t(e):hf()(e,t))===n})):null}var Ef=function(e,t){return bf(e)&&bf(t)?e-t:cf()(e)&&cf()(t)?e.localeCompare(t):e instanceof Date&&t instanceof Date?e.getTime()-t.getTime():String(e).localeCompare(String(t))},Cf=function(e,t){for(var n=arguments.length,r=new Array(n>2?n-2:0),o=2;o<n;o++)r[o-2]=arguments[o]},Pf=n(9686),Mf=n.n(Pf),Tf=n(1629),_f=n.n(Tf),Rf=n(6686),Nf=n.n(Rf),If=n(9062);function Df(e,t){for(var n in e)if({}.hasOwnProperty.call(e,n)&&(!{}.hasOwnProperty.call(t,n)||e[n]!==t[n]))return!1;for(var r in t)if({}.hasOwnProperty.call(t,r)&&!{}.hasOwnProperty.call(e,r))return!1;return!0}function Lf(e){return Lf="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Lf(e)}var zf=["aria-activedescendant","aria-atomic","aria-autocomplete","aria-busy","aria-checked","aria-colcount","aria-colindex","aria-colspan","aria-controls","aria-current","aria-describedby","aria-details","aria-disabled","aria-errormessage","aria-expanded","aria-flowto","aria-haspopup","aria-hidden","aria-invalid","aria-keyshortcuts","aria-label","aria-labelledby","aria-level","aria-live","aria-modal","aria-multiline","aria-multiselectable","aria-orientation","aria-owns","aria-placeholder","aria-posinset","aria-pressed","aria-readonly","aria-relevant","aria-required","aria-roledescription","aria-rowcount","aria-rowindex","aria-rowspan","aria-selected","aria-setsize","aria-sort","aria-valuemax","aria-valuemin","aria-valuenow","aria-valuetext","className","color","height","id","lang","max","media","method","min","name","style","target","width","role","tabIndex","accentHeight","accumulate","additive","alignmentBaseline","allowReorder","alphabetic","amplitude","arabicForm","ascent","attributeName","attributeType","autoReverse","azimuth","baseFrequency","baselineShift","baseProfile","bbox","begin","bias","by","calcMode","capHeight","clip","clipPath","clipPathUnits","clipRule","colorInterpolation","colorInterpolationFilters","colorProfile","colorRendering","contentScriptType","contentStyleType","cursor","cx","cy","d","decelerate","descent","diffuseConstant","direction","display","divisor","dominantBaseline","dur","dx","dy","edgeMode","elevation","enableBackground","end","exponent","externalResourcesRequired","fill","fillOpacity","fillRule","filter","filterRes","filterUnits","floodColor","floodOpacity","focusable","fontFamily","fontSize","fontSizeAdjust","fontStretch","fontStyle","fontVariant","fontWeight","format","from","fx","fy","g1","g2","glyphName","glyphOrientationHorizontal","glyphOrientationVertical","glyphRef","gradientTransform","gradientUnits","hanging","horizAdvX","horizOriginX","href","ideographic","imageRendering","in2","in","intercept","k1","k2","k3","k4","k","kernelMatrix","kernelUnitLength","kerning","keyPoints","keySplines","keyTimes","lengthAdjust","letterSpacing","lightingColor","limitingConeAngle","local","markerEnd","markerHeight","markerMid","markerStart","markerUnits","markerWidth","mask","maskContentUnits","maskUnits","mathematical","mode","numOctaves","offset","opacity","operator","order","orient","orientation","origin","overflow","overlinePosition","overlineThickness","paintOrder","panose1","pathLength","patternContentUnits","patternTransform","patternUnits","pointerEvents","pointsAtX","pointsAtY","pointsAtZ","preserveAlpha","preserveAspectRatio","primitiveUnits","r","radius","refX","refY","renderingIntent","repeatCount","repeatDur","requiredExtensions","requiredFeatures","restart","result","rotate","rx","ry","seed","shapeRendering","slope","spacing","specularConstant","specularExponent","speed","spreadMethod","startOffset","stdDeviation","stemh","stemv","stitchTiles","stopColor","stopOpacity","strikethroughPosition","strikethroughThickness","string","stroke","strokeDasharray","strokeDashoffset","strokeLinecap","strokeLinejoin","strokeMiterlimit","strokeOpacity","strokeWidth","surfaceScale","systemLanguage","tableValues","targetX","targetY","textAnchor","textDecoration","textLength","textRendering","to","transform","u1","u2","underlinePosition","underlineThickness","unicode","unicodeBidi","unicodeRange","unitsPerEm","vAlphabetic","values","vectorEffect","version","vertAdvY","vertOriginX","vertOriginY","vHanging","vIdeographic","viewTarget","visibility","vMathematical","widths","wordSpacing","writingMode","x1","x2","x","xChannelSelector","xHeight","xlinkActuate","xlinkArcrole","xlinkHref","xlinkRole","xlinkShow","xlinkTitle","xlinkType","xmlBase","xmlLang","xmlns","xmlnsXlink","xmlSpace","y1","y2","y","yChannelSelector","z","zoomAndPan","ref","key","angle"],$f=["points","pathLength"],Bf={svg:["viewBox","children"],polygon:$f,polyline:$f},Ff=["dangerouslySetInnerHTML","onCopy","onCopyCapture","onCut","onCutCapture","onPaste","onPasteCapture","onCompositionEnd","onCompositionEndCapture","onCompositionStart","onCompositionStartCapture","onCompositionUpdate","onCompositionUpdateCapture","onFocus","onFocusCapture","onBlur","onBlurCapture","onChange","onChangeCapture","onBeforeInput","onBeforeInputCapture","onInput","onInputCapture","onReset","onResetCapture","onSubmit","onSubmitCapture","onInvalid","onInvalidCapture","onLoad","onLoadCapture","onError","onErrorCapture","onKeyDown","onKeyDownCapture","onKeyPress","onKeyPressCapture","onKeyUp","onKeyUpCapture","onAbort","onAbortCapture","onCanPlay","onCanPlayCapture","onCanPlayThrough","onCanPlayThroughCapture","onDurationChange","onDurationChangeCapture","onEmptied","onEmptiedCapture","onEncrypted","onEncryptedCapture","onEnded","onEndedCapture","onLoadedData","onLoadedDataCapture","onLoadedMetadata","onLoadedMetadataCapture","onLoadStart","onLoadStartCapture","onPause","onPauseCapture","onPlay","onPlayCapture","onPlaying","onPlayingCapture","onProgress","onProgressCapture","onRateChange","onRateChangeCapture","onSeeked","onSeekedCapture","onSeeking","onSeekingCapture","onStalled","onStalledCapture","onSuspend","onSuspendCapture","onTimeUpdate","onTimeUpdateCapture","onVolumeChange","onVolumeChangeCapture","onWaiting","onWaitingCapture","onAuxClick","onAuxClickCapture","onClick","onClickCapture","onContextMenu","onContextMenuCapture","onDoubleClick","onDoubleClickCapture","onDrag","onDragCapture","onDragEnd","onDragEndCapture","onDragEnter","onDragEnterCapture","onDragExit","onDragExitCapture","onDragLeave","onDragLeaveCapture","onDragOver","onDragOverCapture","onDragStart","onDragStartCapture","onDrop","onDropCapture","onMouseDown","onMouseDownCapture","onMouseEnter","onMouseLeave","onMouseMove","onMouseMoveCapture","onMouseOut","onMouseOutCapture","onMouseOver","onMouseOverCapture","onMouseUp","onMouseUpCapture","onSelect","onSelectCapture","onTouchCancel","onTouchCancelCapture","onTouchEnd","onTouchEndCapture","onTouchMove","onTouchMoveCapture","onTouchStart","onTouchStartCapture","onPointerDown","onPointerDownCapture","onPointerMove","onPointerMoveCapture","onPointerUp","onPointerUpCapture","onPointerCancel","onPointerCancelCapture","onPointerEnter","onPointerEnterCapture","onPointerLeave","onPointerLeaveCapture","onPointerOver","onPointerOverCapture","onPointerOut","onPointerOutCapture","onGotPointerCapture","onGotPointerCaptureCapture","onLostPointerCapture","onLostPointerCaptureCapture","onScroll","onScrollCapture","onWheel","onWheelCapture","onAnimationStart","onAnimationStartCapture","onAnimationEnd","onAnimationEndCapture","onAnimationIteration","onAnimationIterationCapture","onTransitionEnd","onTransitionEndCapture"],Wf=function(e,n){if(!e||"function"===typeof e||"boolean"===typeof e)return null;var r=e;if((0,t.isValidElement)(e)&&(r=e.props),!Nf()(r))return null;var o={};return Object.keys(r).forEach((function(e){Ff.includes(e)&&(o[e]=n||function(t){return r[e](r,t)})})),o},Uf=function(e,t,n){if(!Nf()(e)||"object"!==Lf(e))return null;var r=null;return Object.keys(e).forEach((function(o){var i=e[o];Ff.includes(o)&&"function"===typeof i&&(r||(r={}),r[o]=function(e,t,n){return function(r){return e(t,n,r),null}}(i,t,n))})),r},Hf=["children"],Vf=["children"];function qf(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var Xf={click:"onClick",mousedown:"onMouseDown",mouseup:"onMouseUp",mouseover:"onMouseOver",mousemove:"onMouseMove",mouseout:"onMouseOut",mouseenter:"onMouseEnter",mouseleave:"onMouseLeave",touchcancel:"onTouchCancel",touchend:"onTouchEnd",touchmove:"onTouchMove",touchstart:"onTouchStart",contextmenu:"onContextMenu",dblclick:"onDoubleClick"},Kf=function(e){return"string"===typeof e?e:e?e.displayName||e.name||"Component":""},Gf=null,Yf=null,Qf=function e(n){if(n===Gf&&Array.isArray(Yf))return Yf;var r=[];return t.Children.forEach(n,(function(t){Mf()(t)||((0,If.isFragment)(t)?r=r.concat(e(t.props.children)):r.push(t))})),Yf=r,Gf=n,r};function Jf(e,t){var n=[],r=[];return r=Array.isArray(t)?t.map((function(e){return Kf(e)})):[Kf(t)],Qf(e).forEach((function(e){var t=hf()(e,"type.displayName")||hf()(e,"type.name");-1!==r.indexOf(t)&&n.push(e)})),n}function Zf(e,t){var n=Jf(e,t);return n&&n[0]}var ep=function(e){if(!e||!e.props)return!1;var t=e.props,n=t.width,r=t.height;return!(!bf(n)||n<=0||!bf(r)||r<=0)},tp=["a","altGlyph","altGlyphDef","altGlyphItem","animate","animateColor","animateMotion","animateTransform","circle","clipPath","color-profile","cursor","defs","desc","ellipse","feBlend","feColormatrix","feComponentTransfer","feComposite","feConvolveMatrix","feDiffuseLighting","feDisplacementMap","feDistantLight","feFlood","feFuncA","feFuncB","feFuncG","feFuncR","feGaussianBlur","feImage","feMerge","feMergeNode","feMorphology","feOffset","fePointLight","feSpecularLighting","feSpotLight","feTile","feTurbulence","filter","font","font-face","font-face-format","font-face-name","font-face-url","foreignObject","g","glyph","glyphRef","hkern","image","line","lineGradient","marker","mask","metadata","missing-glyph","mpath","path","pattern","polygon","polyline","radialGradient","rect","script","set","stop","style","svg","switch","symbol","text","textPath","title","tref","tspan","use","view","vkern"],np=function(e){return e&&e.type&&cf()(e.type)&&tp.indexOf(e.type)>=0},rp=function(e,n,r){if(!e||"function"===typeof e||"boolean"===typeof e)return null;var o=e;if((0,t.isValidElement)(e)&&(o=e.props),!Nf()(o))return null;var i={};return Object.keys(o).forEach((function(e){var t;(function(e,t,n,r){var o,i=null!==(o=null===Bf||void 0===Bf?void 0:Bf[r])&&void 0!==o?o:[];return t.startsWith("data-")||!_f()(e)&&(r&&i.includes(t)||zf.includes(t))||n&&Ff.includes(t)})(null===(t=o)||void 0===t?void 0:t[e],e,n,r)&&(i[e]=o[e])})),i},op=function e(n,r){if(n===r)return!0;var o=t.Children.count(n);if(o!==t.Children.count(r))return!1;if(0===o)return!0;if(1===o)return ip(Array.isArray(n)?n[0]:n,Array.isArray(r)?r[0]:r);for(var i=0;i<o;i++){var a=n[i],l=r[i];if(Array.isArray(a)||Array.isArray(l)){if(!e(a,l))return!1}else if(!ip(a,l))return!1}return!0},ip=function(e,t){if(Mf()(e)&&Mf()(t))return!0;if(!Mf()(e)&&!Mf()(t)){var n=e.props||{},r=n.children,o=qf(n,Hf),i=t.props||{},a=i.children,l=qf(i,Vf);return r&&a?Df(o,l)&&op(r,a):!r&&!a&&Df(o,l)}return!1},ap=function(e,t){var n=[],r={};return Qf(e).forEach((function(e,o){if(np(e))n.push(e);else if(e){var i=Kf(e.type),a=t[i]||{},l=a.handler,s=a.once;if(l&&(!s||!r[i])){var u=l(e,i,o);n.push(u),r[i]=!0}}})),n};function lp(e){return lp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},lp(e)}function sp(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function up(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?sp(Object(n),!0).forEach((function(t){cp(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):sp(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function cp(e,t,n){return t=function(e){var t=function(e,t){if("object"!=lp(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=lp(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==lp(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function dp(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return fp(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return fp(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function fp(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var pp=(0,t.forwardRef)((function(e,n){var r=e.aspect,o=e.initialDimension,i=void 0===o?{width:-1,height:-1}:o,a=e.width,l=void 0===a?"100%":a,s=e.height,u=void 0===s?"100%":s,c=e.minWidth,d=void 0===c?0:c,f=e.minHeight,p=e.maxHeight,h=e.children,m=e.debounce,y=void 0===m?0:m,v=e.id,g=e.className,b=e.onResize,x=e.style,w=void 0===x?{}:x,S=(0,t.useRef)(null),A=(0,t.useRef)();A.current=b,(0,t.useImperativeHandle)(n,(function(){return Object.defineProperty(S.current,"current",{get:function(){return console.warn("The usage of ref.current.current is deprecated and will no longer be supported."),S.current},configurable:!0})}));var O=dp((0,t.useState)({containerWidth:i.width,containerHeight:i.height}),2),k=O[0],j=O[1],E=(0,t.useCallback)((function(e,t){j((function(n){var r=Math.round(e),o=Math.round(t);return n.containerWidth===r&&n.containerHeight===o?n:{containerWidth:r,containerHeight:o}}))}),[]);(0,t.useEffect)((function(){var e=function(e){var t,n=e[0].contentRect,r=n.width,o=n.height;E(r,o),null===(t=A.current)||void 0===t||t.call(A,r,o)};y>0&&(e=sf()(e,y,{trailing:!0,leading:!1}));var t=new ResizeObserver(e),n=S.current.getBoundingClientRect(),r=n.width,o=n.height;return E(r,o),t.observe(S.current),function(){t.disconnect()}}),[E,y]);var C=(0,t.useMemo)((function(){var e=k.containerWidth,n=k.containerHeight;if(e<0||n<0)return null;Cf(gf(l)||gf(u),"The width(%s) and height(%s) are both fixed numbers,\n       maybe you don't need to use a ResponsiveContainer.",l,u),Cf(!r||r>0,"The aspect(%s) must be greater than zero.",r);var o=gf(l)?e:l,i=gf(u)?n:u;r&&r>0&&(o?i=o/r:i&&(o=i*r),p&&i>p&&(i=p)),Cf(o>0||i>0,"The width(%s) and height(%s) of chart should be greater than 0,\n       please check the style of container, or the props width(%s) and height(%s),\n       or add a minWidth(%s) or minHeight(%s) or use aspect(%s) to control the\n       height and width.",o,i,l,u,d,f,r);var a=!Array.isArray(h)&&Kf(h.type).endsWith("Chart");return t.Children.map(h,(function(e){return t.isValidElement(e)?(0,t.cloneElement)(e,up({width:o,height:i},a?{style:up({height:"100%",width:"100%",maxHeight:i,maxWidth:o},e.props.style)}:{})):e}))}),[r,h,u,p,f,d,k,l]);return t.createElement("div",{id:v?"".concat(v):void 0,className:zt("recharts-responsive-container",g),style:up(up({},w),{},{width:l,height:u,minWidth:d,minHeight:f,maxHeight:p}),ref:S},C)})),hp=n(6604),mp=n.n(hp),yp=n(7424),vp=n.n(yp),gp="Invariant failed";function bp(e,t){if(!e)throw new Error(gp)}var xp=["children","width","height","viewBox","className","style","title","desc"];function wp(){return wp=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},wp.apply(this,arguments)}function Sp(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Ap(e){var n=e.children,r=e.width,o=e.height,i=e.viewBox,a=e.className,l=e.style,s=e.title,u=e.desc,c=Sp(e,xp),d=i||{width:r,height:o,x:0,y:0},f=zt("recharts-surface",a);return t.createElement("svg",wp({},rp(c,!0,"svg"),{className:f,width:r,height:o,style:l,viewBox:"".concat(d.x," ").concat(d.y," ").concat(d.width," ").concat(d.height)}),t.createElement("title",null,s),t.createElement("desc",null,u),n)}var Op=["children","className"];function kp(){return kp=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},kp.apply(this,arguments)}function jp(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var Ep=t.forwardRef((function(e,n){var r=e.children,o=e.className,i=jp(e,Op),a=zt("recharts-layer",o);return t.createElement("g",kp({className:a},rp(i,!0),{ref:n}),r)}));function Cp(e){return Cp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Cp(e)}function Pp(){return Pp=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Pp.apply(this,arguments)}function Mp(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return Tp(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Tp(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Tp(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function _p(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Rp(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?_p(Object(n),!0).forEach((function(t){Np(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):_p(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function Np(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Cp(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Cp(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Cp(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Ip(e){return Array.isArray(e)&&xf(e[0])&&xf(e[1])?e.join(" ~ "):e}var Dp=function(e){var n=e.separator,r=void 0===n?" : ":n,o=e.contentStyle,i=void 0===o?{}:o,a=e.itemStyle,l=void 0===a?{}:a,s=e.labelStyle,u=void 0===s?{}:s,c=e.payload,d=e.formatter,f=e.itemSorter,p=e.wrapperClassName,h=e.labelClassName,m=e.label,y=e.labelFormatter,v=e.accessibilityLayer,g=void 0!==v&&v,b=Rp({margin:0,padding:10,backgroundColor:"#fff",border:"1px solid #ccc",whiteSpace:"nowrap"},i),x=Rp({margin:0},u),w=!Mf()(m),S=w?m:"",A=zt("recharts-default-tooltip",p),O=zt("recharts-tooltip-label",h);w&&y&&void 0!==c&&null!==c&&(S=y(m,c));var k=g?{role:"status","aria-live":"assertive"}:{};return t.createElement("div",Pp({className:A,style:b},k),t.createElement("p",{className:O,style:x},t.isValidElement(S)?S:"".concat(S)),function(){if(c&&c.length){var e=(f?vp()(c,f):c).map((function(e,n){if("none"===e.type)return null;var o=Rp({display:"block",paddingTop:4,paddingBottom:4,color:e.color||"#000"},l),i=e.formatter||d||Ip,a=e.value,s=e.name,u=a,f=s;if(i&&null!=u&&null!=f){var p=i(a,s,e,n,c);if(Array.isArray(p)){var h=Mp(p,2);u=h[0],f=h[1]}else u=p}return t.createElement("li",{className:"recharts-tooltip-item",key:"tooltip-item-".concat(n),style:o},xf(f)?t.createElement("span",{className:"recharts-tooltip-item-name"},f):null,xf(f)?t.createElement("span",{className:"recharts-tooltip-item-separator"},r):null,t.createElement("span",{className:"recharts-tooltip-item-value"},u),t.createElement("span",{className:"recharts-tooltip-item-unit"},e.unit||""))}));return t.createElement("ul",{className:"recharts-tooltip-item-list",style:{padding:0,margin:0}},e)}return null}())};function Lp(e){return Lp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Lp(e)}function zp(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Lp(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Lp(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Lp(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var $p="recharts-tooltip-wrapper",Bp={visibility:"hidden"};function Fp(e){var t=e.coordinate,n=e.translateX,r=e.translateY;return zt($p,zp(zp(zp(zp({},"".concat($p,"-right"),bf(n)&&t&&bf(t.x)&&n>=t.x),"".concat($p,"-left"),bf(n)&&t&&bf(t.x)&&n<t.x),"".concat($p,"-bottom"),bf(r)&&t&&bf(t.y)&&r>=t.y),"".concat($p,"-top"),bf(r)&&t&&bf(t.y)&&r<t.y))}function Wp(e){var t=e.allowEscapeViewBox,n=e.coordinate,r=e.key,o=e.offsetTopLeft,i=e.position,a=e.reverseDirection,l=e.tooltipDimension,s=e.viewBox,u=e.viewBoxDimension;if(i&&bf(i[r]))return i[r];var c=n[r]-l-o,d=n[r]+o;return t[r]?a[r]?c:d:a[r]?c<s[r]?Math.max(d,s[r]):Math.max(c,s[r]):d+l>s[r]+u?Math.max(c,s[r]):Math.max(d,s[r])}function Up(e){return Up="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Up(e)}function Hp(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Vp(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Hp(Object(n),!0).forEach((function(t){Qp(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Hp(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function qp(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Jp(r.key),r)}}function Xp(e,t,n){return t=Gp(t),function(e,t){if(t&&("object"===Up(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,Kp()?Reflect.construct(t,n||[],Gp(e).constructor):t.apply(e,n))}function Kp(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(Kp=function(){return!!e})()}function Gp(e){return Gp=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},Gp(e)}function Yp(e,t){return Yp=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},Yp(e,t)}function Qp(e,t,n){return(t=Jp(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Jp(e){var t=function(e,t){if("object"!=Up(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Up(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Up(t)?t:t+""}var Zp=function(e){function n(){var e;!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n);for(var t=arguments.length,r=new Array(t),o=0;o<t;o++)r[o]=arguments[o];return Qp(e=Xp(this,n,[].concat(r)),"state",{dismissed:!1,dismissedAtCoordinate:{x:0,y:0},lastBoundingBox:{width:-1,height:-1}}),Qp(e,"handleKeyDown",(function(t){var n,r,o,i;"Escape"===t.key&&e.setState({dismissed:!0,dismissedAtCoordinate:{x:null!==(n=null===(r=e.props.coordinate)||void 0===r?void 0:r.x)&&void 0!==n?n:0,y:null!==(o=null===(i=e.props.coordinate)||void 0===i?void 0:i.y)&&void 0!==o?o:0}})})),e}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&Yp(e,t)}(n,e),r=n,o=[{key:"updateBBox",value:function(){if(this.wrapperNode&&this.wrapperNode.getBoundingClientRect){var e=this.wrapperNode.getBoundingClientRect();(Math.abs(e.width-this.state.lastBoundingBox.width)>1||Math.abs(e.height-this.state.lastBoundingBox.height)>1)&&this.setState({lastBoundingBox:{width:e.width,height:e.height}})}else-1===this.state.lastBoundingBox.width&&-1===this.state.lastBoundingBox.height||this.setState({lastBoundingBox:{width:-1,height:-1}})}},{key:"componentDidMount",value:function(){document.addEventListener("keydown",this.handleKeyDown),this.updateBBox()}},{key:"componentWillUnmount",value:function(){document.removeEventListener("keydown",this.handleKeyDown)}},{key:"componentDidUpdate",value:function(){var e,t;this.props.active&&this.updateBBox(),this.state.dismissed&&((null===(e=this.props.coordinate)||void 0===e?void 0:e.x)===this.state.dismissedAtCoordinate.x&&(null===(t=this.props.coordinate)||void 0===t?void 0:t.y)===this.state.dismissedAtCoordinate.y||(this.state.dismissed=!1))}},{key:"render",value:function(){var e=this,n=this.props,r=n.active,o=n.allowEscapeViewBox,i=n.animationDuration,a=n.animationEasing,l=n.children,s=n.coordinate,u=n.hasPayload,c=n.isAnimationActive,d=n.offset,f=n.position,p=n.reverseDirection,h=n.useTranslate3d,m=n.viewBox,y=n.wrapperStyle,v=function(e){var t,n,r=e.allowEscapeViewBox,o=e.coordinate,i=e.offsetTopLeft,a=e.position,l=e.reverseDirection,s=e.tooltipBox,u=e.useTranslate3d,c=e.viewBox;return{cssProperties:s.height>0&&s.width>0&&o?function(e){var t=e.translateX,n=e.translateY;return{transform:e.useTranslate3d?"translate3d(".concat(t,"px, ").concat(n,"px, 0)"):"translate(".concat(t,"px, ").concat(n,"px)")}}({translateX:t=Wp({allowEscapeViewBox:r,coordinate:o,key:"x",offsetTopLeft:i,position:a,reverseDirection:l,tooltipDimension:s.width,viewBox:c,viewBoxDimension:c.width}),translateY:n=Wp({allowEscapeViewBox:r,coordinate:o,key:"y",offsetTopLeft:i,position:a,reverseDirection:l,tooltipDimension:s.height,viewBox:c,viewBoxDimension:c.height}),useTranslate3d:u}):Bp,cssClasses:Fp({translateX:t,translateY:n,coordinate:o})}}({allowEscapeViewBox:o,coordinate:s,offsetTopLeft:d,position:f,reverseDirection:p,tooltipBox:this.state.lastBoundingBox,useTranslate3d:h,viewBox:m}),g=v.cssClasses,b=v.cssProperties,x=Vp(Vp({transition:c&&r?"transform ".concat(i,"ms ").concat(a):void 0},b),{},{pointerEvents:"none",visibility:!this.state.dismissed&&r&&u?"visible":"hidden",position:"absolute",top:0,left:0},y);return t.createElement("div",{tabIndex:-1,className:g,style:x,ref:function(t){e.wrapperNode=t}},l)}}],o&&qp(r.prototype,o),i&&qp(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent),eh={isSsr:!("undefined"!==typeof window&&window.document&&window.document.createElement&&window.setTimeout),get:function(e){return eh[e]},set:function(e,t){if("string"===typeof e)eh[e]=t;else{var n=Object.keys(e);n&&n.length&&n.forEach((function(t){eh[t]=e[t]}))}}},th=n(977),nh=n.n(th);function rh(e,t,n){return!0===t?nh()(e,n):_f()(t)?nh()(e,t):e}function oh(e){return oh="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},oh(e)}function ih(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function ah(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?ih(Object(n),!0).forEach((function(t){fh(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ih(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function lh(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,ph(r.key),r)}}function sh(e,t,n){return t=ch(t),function(e,t){if(t&&("object"===oh(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,uh()?Reflect.construct(t,n||[],ch(e).constructor):t.apply(e,n))}function uh(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(uh=function(){return!!e})()}function ch(e){return ch=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},ch(e)}function dh(e,t){return dh=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},dh(e,t)}function fh(e,t,n){return(t=ph(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ph(e){var t=function(e,t){if("object"!=oh(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=oh(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==oh(t)?t:t+""}function hh(e){return e.dataKey}var mh=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),sh(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&dh(e,t)}(n,e),r=n,o=[{key:"render",value:function(){var e=this,n=this.props,r=n.active,o=n.allowEscapeViewBox,i=n.animationDuration,a=n.animationEasing,l=n.content,s=n.coordinate,u=n.filterNull,c=n.isAnimationActive,d=n.offset,f=n.payload,p=n.payloadUniqBy,h=n.position,m=n.reverseDirection,y=n.useTranslate3d,v=n.viewBox,g=n.wrapperStyle,b=null!==f&&void 0!==f?f:[];u&&b.length&&(b=rh(f.filter((function(t){return null!=t.value&&(!0!==t.hide||e.props.includeHidden)})),p,hh));var x=b.length>0;return t.createElement(Zp,{allowEscapeViewBox:o,animationDuration:i,animationEasing:a,isAnimationActive:c,active:r,coordinate:s,hasPayload:x,offset:d,position:h,reverseDirection:m,useTranslate3d:y,viewBox:v,wrapperStyle:g},function(e,n){return t.isValidElement(e)?t.cloneElement(e,n):"function"===typeof e?t.createElement(e,n):t.createElement(Dp,n)}(l,ah(ah({},this.props),{},{payload:b})))}}],o&&lh(r.prototype,o),i&&lh(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);fh(mh,"displayName","Tooltip"),fh(mh,"defaultProps",{accessibilityLayer:!1,allowEscapeViewBox:{x:!1,y:!1},animationDuration:400,animationEasing:"ease",contentStyle:{},coordinate:{x:0,y:0},cursor:!0,cursorStyle:{},filterNull:!0,isAnimationActive:!eh.isSsr,itemStyle:{},labelStyle:{},offset:10,reverseDirection:{x:!1,y:!1},separator:" : ",trigger:"hover",useTranslate3d:!1,viewBox:{x:0,y:0,height:0,width:0},wrapperStyle:{}});var yh=n(643),vh=n.n(yh);Math.abs,Math.atan2;const gh=Math.cos,bh=(Math.max,Math.min,Math.sin),xh=Math.sqrt,wh=Math.PI,Sh=2*wh;const Ah={draw(e,t){const n=xh(t/wh);e.moveTo(n,0),e.arc(0,0,n,0,Sh)}},Oh={draw(e,t){const n=xh(t/5)/2;e.moveTo(-3*n,-n),e.lineTo(-n,-n),e.lineTo(-n,-3*n),e.lineTo(n,-3*n),e.lineTo(n,-n),e.lineTo(3*n,-n),e.lineTo(3*n,n),e.lineTo(n,n),e.lineTo(n,3*n),e.lineTo(-n,3*n),e.lineTo(-n,n),e.lineTo(-3*n,n),e.closePath()}},kh=xh(1/3),jh=2*kh,Eh={draw(e,t){const n=xh(t/jh),r=n*kh;e.moveTo(0,-n),e.lineTo(r,0),e.lineTo(0,n),e.lineTo(-r,0),e.closePath()}},Ch={draw(e,t){const n=xh(t),r=-n/2;e.rect(r,r,n,n)}},Ph=bh(wh/10)/bh(7*wh/10),Mh=bh(Sh/10)*Ph,Th=-gh(Sh/10)*Ph,_h={draw(e,t){const n=xh(.8908130915292852*t),r=Mh*n,o=Th*n;e.moveTo(0,-n),e.lineTo(r,o);for(let i=1;i<5;++i){const t=Sh*i/5,a=gh(t),l=bh(t);e.lineTo(l*n,-a*n),e.lineTo(a*r-l*o,l*r+a*o)}e.closePath()}},Rh=xh(3),Nh={draw(e,t){const n=-xh(t/(3*Rh));e.moveTo(0,2*n),e.lineTo(-Rh*n,-n),e.lineTo(Rh*n,-n),e.closePath()}},Ih=-.5,Dh=xh(3)/2,Lh=1/xh(12),zh=3*(Lh/2+1),$h={draw(e,t){const n=xh(t/zh),r=n/2,o=n*Lh,i=r,a=n*Lh+n,l=-i,s=a;e.moveTo(r,o),e.lineTo(i,a),e.lineTo(l,s),e.lineTo(Ih*r-Dh*o,Dh*r+Ih*o),e.lineTo(Ih*i-Dh*a,Dh*i+Ih*a),e.lineTo(Ih*l-Dh*s,Dh*l+Ih*s),e.lineTo(Ih*r+Dh*o,Ih*o-Dh*r),e.lineTo(Ih*i+Dh*a,Ih*a-Dh*i),e.lineTo(Ih*l+Dh*s,Ih*s-Dh*l),e.closePath()}};function Bh(e){return function(){return e}}const Fh=Math.PI,Wh=2*Fh,Uh=1e-6,Hh=Wh-Uh;function Vh(e){this._+=e[0];for(let t=1,n=e.length;t<n;++t)this._+=arguments[t]+e[t]}class qh{constructor(e){this._x0=this._y0=this._x1=this._y1=null,this._="",this._append=null==e?Vh:function(e){let t=Math.floor(e);if(!(t>=0))throw new Error(`invalid digits: ${e}`);if(t>15)return Vh;const n=10**t;return function(e){this._+=e[0];for(let t=1,r=e.length;t<r;++t)this._+=Math.round(arguments[t]*n)/n+e[t]}}(e)}moveTo(e,t){this._append`M${this._x0=this._x1=+e},${this._y0=this._y1=+t}`}closePath(){null!==this._x1&&(this._x1=this._x0,this._y1=this._y0,this._append`Z`)}lineTo(e,t){this._append`L${this._x1=+e},${this._y1=+t}`}quadraticCurveTo(e,t,n,r){this._append`Q${+e},${+t},${this._x1=+n},${this._y1=+r}`}bezierCurveTo(e,t,n,r,o,i){this._append`C${+e},${+t},${+n},${+r},${this._x1=+o},${this._y1=+i}`}arcTo(e,t,n,r,o){if(e=+e,t=+t,n=+n,r=+r,(o=+o)<0)throw new Error(`negative radius: ${o}`);let i=this._x1,a=this._y1,l=n-e,s=r-t,u=i-e,c=a-t,d=u*u+c*c;if(null===this._x1)this._append`M${this._x1=e},${this._y1=t}`;else if(d>Uh)if(Math.abs(c*l-s*u)>Uh&&o){let f=n-i,p=r-a,h=l*l+s*s,m=f*f+p*p,y=Math.sqrt(h),v=Math.sqrt(d),g=o*Math.tan((Fh-Math.acos((h+d-m)/(2*y*v)))/2),b=g/v,x=g/y;Math.abs(b-1)>Uh&&this._append`L${e+b*u},${t+b*c}`,this._append`A${o},${o},0,0,${+(c*f>u*p)},${this._x1=e+x*l},${this._y1=t+x*s}`}else this._append`L${this._x1=e},${this._y1=t}`;else;}arc(e,t,n,r,o,i){if(e=+e,t=+t,i=!!i,(n=+n)<0)throw new Error(`negative radius: ${n}`);let a=n*Math.cos(r),l=n*Math.sin(r),s=e+a,u=t+l,c=1^i,d=i?r-o:o-r;null===this._x1?this._append`M${s},${u}`:(Math.abs(this._x1-s)>Uh||Math.abs(this._y1-u)>Uh)&&this._append`L${s},${u}`,n&&(d<0&&(d=d%Wh+Wh),d>Hh?this._append`A${n},${n},0,1,${c},${e-a},${t-l}A${n},${n},0,1,${c},${this._x1=s},${this._y1=u}`:d>Uh&&this._append`A${n},${n},0,${+(d>=Fh)},${c},${this._x1=e+n*Math.cos(o)},${this._y1=t+n*Math.sin(o)}`)}rect(e,t,n,r){this._append`M${this._x0=this._x1=+e},${this._y0=this._y1=+t}h${n=+n}v${+r}h${-n}Z`}toString(){return this._}}function Xh(e){let t=3;return e.digits=function(n){if(!arguments.length)return t;if(null==n)t=null;else{const e=Math.floor(n);if(!(e>=0))throw new RangeError(`invalid digits: ${n}`);t=e}return e},()=>new qh(t)}xh(3),xh(3);function Kh(e){return Kh="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Kh(e)}var Gh=["type","size","sizeType"];function Yh(){return Yh=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Yh.apply(this,arguments)}function Qh(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Jh(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Qh(Object(n),!0).forEach((function(t){Zh(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Qh(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function Zh(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Kh(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Kh(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Kh(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function em(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var tm={symbolCircle:Ah,symbolCross:Oh,symbolDiamond:Eh,symbolSquare:Ch,symbolStar:_h,symbolTriangle:Nh,symbolWye:$h},nm=Math.PI/180,rm=function(e){var n=e.type,r=void 0===n?"circle":n,o=e.size,i=void 0===o?64:o,a=e.sizeType,l=void 0===a?"area":a,s=Jh(Jh({},em(e,Gh)),{},{type:r,size:i,sizeType:l}),u=s.className,c=s.cx,d=s.cy,f=rp(s,!0);return c===+c&&d===+d&&i===+i?t.createElement("path",Yh({},f,{className:zt("recharts-symbols",u),transform:"translate(".concat(c,", ").concat(d,")"),d:function(){var e=function(e){var t="symbol".concat(vh()(e));return tm[t]||Ah}(r),t=function(e,t){let n=null,r=Xh(o);function o(){let o;if(n||(n=o=r()),e.apply(this,arguments).draw(n,+t.apply(this,arguments)),o)return n=null,o+""||null}return e="function"===typeof e?e:Bh(e||Ah),t="function"===typeof t?t:Bh(void 0===t?64:+t),o.type=function(t){return arguments.length?(e="function"===typeof t?t:Bh(t),o):e},o.size=function(e){return arguments.length?(t="function"===typeof e?e:Bh(+e),o):t},o.context=function(e){return arguments.length?(n=null==e?null:e,o):n},o}().type(e).size(function(e,t,n){if("area"===t)return e;switch(n){case"cross":return 5*e*e/9;case"diamond":return.5*e*e/Math.sqrt(3);case"square":return e*e;case"star":var r=18*nm;return 1.25*e*e*(Math.tan(r)-Math.tan(2*r)*Math.pow(Math.tan(r),2));case"triangle":return Math.sqrt(3)*e*e/4;case"wye":return(21-10*Math.sqrt(3))*e*e/8;default:return Math.PI*e*e/4}}(i,l,r));return t()}()})):null};function om(e){return om="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},om(e)}function im(){return im=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},im.apply(this,arguments)}function am(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function lm(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,pm(r.key),r)}}function sm(e,t,n){return t=cm(t),function(e,t){if(t&&("object"===om(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,um()?Reflect.construct(t,n||[],cm(e).constructor):t.apply(e,n))}function um(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(um=function(){return!!e})()}function cm(e){return cm=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},cm(e)}function dm(e,t){return dm=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},dm(e,t)}function fm(e,t,n){return(t=pm(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function pm(e){var t=function(e,t){if("object"!=om(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=om(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==om(t)?t:t+""}rm.registerSymbol=function(e,t){tm["symbol".concat(vh()(e))]=t};var hm=32,mm=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),sm(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&dm(e,t)}(n,e),r=n,o=[{key:"renderIcon",value:function(e){var n=this.props.inactiveColor,r=16,o=5.333333333333333,i=10.666666666666666,a=e.inactive?n:e.color;if("plainline"===e.type)return t.createElement("line",{strokeWidth:4,fill:"none",stroke:a,strokeDasharray:e.payload.strokeDasharray,x1:0,y1:r,x2:hm,y2:r,className:"recharts-legend-icon"});if("line"===e.type)return t.createElement("path",{strokeWidth:4,fill:"none",stroke:a,d:"M0,".concat(r,"h").concat(i,"\n            A").concat(o,",").concat(o,",0,1,1,").concat(2*i,",").concat(r,"\n            H").concat(hm,"M").concat(2*i,",").concat(r,"\n            A").concat(o,",").concat(o,",0,1,1,").concat(i,",").concat(r),className:"recharts-legend-icon"});if("rect"===e.type)return t.createElement("path",{stroke:"none",fill:a,d:"M0,".concat(4,"h").concat(hm,"v").concat(24,"h").concat(-32,"z"),className:"recharts-legend-icon"});if(t.isValidElement(e.legendIcon)){var l=function(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?am(Object(n),!0).forEach((function(t){fm(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):am(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}({},e);return delete l.legendIcon,t.cloneElement(e.legendIcon,l)}return t.createElement(rm,{fill:a,cx:r,cy:r,size:hm,sizeType:"diameter",type:e.type})}},{key:"renderItems",value:function(){var e=this,n=this.props,r=n.payload,o=n.iconSize,i=n.layout,a=n.formatter,l=n.inactiveColor,s={x:0,y:0,width:hm,height:hm},u={display:"horizontal"===i?"inline-block":"block",marginRight:10},c={display:"inline-block",verticalAlign:"middle",marginRight:4};return r.map((function(n,r){var i=n.formatter||a,d=zt(fm(fm({"recharts-legend-item":!0},"legend-item-".concat(r),!0),"inactive",n.inactive));if("none"===n.type)return null;var f=_f()(n.value)?null:n.value;Cf(!_f()(n.value),'The name property is also required when using a function for the dataKey of a chart\'s cartesian components. Ex: <Bar name="Name of my Data"/>');var p=n.inactive?l:n.color;return t.createElement("li",im({className:d,style:u,key:"legend-item-".concat(r)},Uf(e.props,n,r)),t.createElement(Ap,{width:o,height:o,viewBox:s,style:c},e.renderIcon(n)),t.createElement("span",{className:"recharts-legend-item-text",style:{color:p}},i?i(f,n,r):f))}))}},{key:"render",value:function(){var e=this.props,n=e.payload,r=e.layout,o=e.align;if(!n||!n.length)return null;var i={padding:0,margin:0,textAlign:"horizontal"===r?o:"left"};return t.createElement("ul",{className:"recharts-default-legend",style:i},this.renderItems())}}],o&&lm(r.prototype,o),i&&lm(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);function ym(e){return ym="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},ym(e)}fm(mm,"displayName","Legend"),fm(mm,"defaultProps",{iconSize:14,layout:"horizontal",align:"center",verticalAlign:"middle",inactiveColor:"#ccc"});var vm=["ref"];function gm(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function bm(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?gm(Object(n),!0).forEach((function(t){km(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):gm(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function xm(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,jm(r.key),r)}}function wm(e,t,n){return t=Am(t),function(e,t){if(t&&("object"===ym(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,Sm()?Reflect.construct(t,n||[],Am(e).constructor):t.apply(e,n))}function Sm(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(Sm=function(){return!!e})()}function Am(e){return Am=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},Am(e)}function Om(e,t){return Om=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},Om(e,t)}function km(e,t,n){return(t=jm(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function jm(e){var t=function(e,t){if("object"!=ym(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=ym(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==ym(t)?t:t+""}function Em(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Cm(e){return e.value}var Pm=function(e){function n(){var e;!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n);for(var t=arguments.length,r=new Array(t),o=0;o<t;o++)r[o]=arguments[o];return km(e=wm(this,n,[].concat(r)),"lastBoundingBox",{width:-1,height:-1}),e}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&Om(e,t)}(n,e),r=n,i=[{key:"getWithHeight",value:function(e,t){var n=bm(bm({},this.defaultProps),e.props).layout;return"vertical"===n&&bf(e.props.height)?{height:e.props.height}:"horizontal"===n?{width:e.props.width||t}:null}}],(o=[{key:"componentDidMount",value:function(){this.updateBBox()}},{key:"componentDidUpdate",value:function(){this.updateBBox()}},{key:"getBBox",value:function(){if(this.wrapperNode&&this.wrapperNode.getBoundingClientRect){var e=this.wrapperNode.getBoundingClientRect();return e.height=this.wrapperNode.offsetHeight,e.width=this.wrapperNode.offsetWidth,e}return null}},{key:"updateBBox",value:function(){var e=this.props.onBBoxUpdate,t=this.getBBox();t?(Math.abs(t.width-this.lastBoundingBox.width)>1||Math.abs(t.height-this.lastBoundingBox.height)>1)&&(this.lastBoundingBox.width=t.width,this.lastBoundingBox.height=t.height,e&&e(t)):-1===this.lastBoundingBox.width&&-1===this.lastBoundingBox.height||(this.lastBoundingBox.width=-1,this.lastBoundingBox.height=-1,e&&e(null))}},{key:"getBBoxSnapshot",value:function(){return this.lastBoundingBox.width>=0&&this.lastBoundingBox.height>=0?bm({},this.lastBoundingBox):{width:0,height:0}}},{key:"getDefaultPosition",value:function(e){var t,n,r=this.props,o=r.layout,i=r.align,a=r.verticalAlign,l=r.margin,s=r.chartWidth,u=r.chartHeight;return e&&(void 0!==e.left&&null!==e.left||void 0!==e.right&&null!==e.right)||(t="center"===i&&"vertical"===o?{left:((s||0)-this.getBBoxSnapshot().width)/2}:"right"===i?{right:l&&l.right||0}:{left:l&&l.left||0}),e&&(void 0!==e.top&&null!==e.top||void 0!==e.bottom&&null!==e.bottom)||(n="middle"===a?{top:((u||0)-this.getBBoxSnapshot().height)/2}:"bottom"===a?{bottom:l&&l.bottom||0}:{top:l&&l.top||0}),bm(bm({},t),n)}},{key:"render",value:function(){var e=this,n=this.props,r=n.content,o=n.width,i=n.height,a=n.wrapperStyle,l=n.payloadUniqBy,s=n.payload,u=bm(bm({position:"absolute",width:o||"auto",height:i||"auto"},this.getDefaultPosition(a)),a);return t.createElement("div",{className:"recharts-legend-wrapper",style:u,ref:function(t){e.wrapperNode=t}},function(e,n){if(t.isValidElement(e))return t.cloneElement(e,n);if("function"===typeof e)return t.createElement(e,n);n.ref;var r=Em(n,vm);return t.createElement(mm,r)}(r,bm(bm({},this.props),{},{payload:rh(s,l,Cm)})))}}])&&xm(r.prototype,o),i&&xm(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);function Mm(){return Mm=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Mm.apply(this,arguments)}km(Pm,"displayName","Legend"),km(Pm,"defaultProps",{iconSize:14,layout:"horizontal",align:"center",verticalAlign:"bottom"});var Tm=function(e){var n=e.cx,r=e.cy,o=e.r,i=e.className,a=zt("recharts-dot",i);return n===+n&&r===+r&&o===+o?t.createElement("circle",Mm({},rp(e,!1),Wf(e),{className:a,cx:n,cy:r,r:o})):null},_m=n(5173),Rm=n.n(_m),Nm=Object.getOwnPropertyNames,Im=Object.getOwnPropertySymbols,Dm=Object.prototype.hasOwnProperty;function Lm(e,t){return function(n,r,o){return e(n,r,o)&&t(n,r,o)}}function zm(e){return function(t,n,r){if(!t||!n||"object"!==typeof t||"object"!==typeof n)return e(t,n,r);var o=r.cache,i=o.get(t),a=o.get(n);if(i&&a)return i===n&&a===t;o.set(t,n),o.set(n,t);var l=e(t,n,r);return o.delete(t),o.delete(n),l}}function $m(e){return Nm(e).concat(Im(e))}var Bm=Object.hasOwn||function(e,t){return Dm.call(e,t)};function Fm(e,t){return e===t||!e&&!t&&e!==e&&t!==t}var Wm=Object.getOwnPropertyDescriptor,Um=Object.keys;function Hm(e,t,n){var r=e.length;if(t.length!==r)return!1;for(;r-- >0;)if(!n.equals(e[r],t[r],r,r,e,t,n))return!1;return!0}function Vm(e,t){return Fm(e.getTime(),t.getTime())}function qm(e,t){return e.name===t.name&&e.message===t.message&&e.cause===t.cause&&e.stack===t.stack}function Xm(e,t){return e===t}function Km(e,t,n){var r=e.size;if(r!==t.size)return!1;if(!r)return!0;for(var o,i,a=new Array(r),l=e.entries(),s=0;(o=l.next())&&!o.done;){for(var u=t.entries(),c=!1,d=0;(i=u.next())&&!i.done;)if(a[d])d++;else{var f=o.value,p=i.value;if(n.equals(f[0],p[0],s,d,e,t,n)&&n.equals(f[1],p[1],f[0],p[0],e,t,n)){c=a[d]=!0;break}d++}if(!c)return!1;s++}return!0}var Gm=Fm;function Ym(e,t,n){var r=Um(e),o=r.length;if(Um(t).length!==o)return!1;for(;o-- >0;)if(!ry(e,t,n,r[o]))return!1;return!0}function Qm(e,t,n){var r,o,i,a=$m(e),l=a.length;if($m(t).length!==l)return!1;for(;l-- >0;){if(!ry(e,t,n,r=a[l]))return!1;if(o=Wm(e,r),i=Wm(t,r),(o||i)&&(!o||!i||o.configurable!==i.configurable||o.enumerable!==i.enumerable||o.writable!==i.writable))return!1}return!0}function Jm(e,t){return Fm(e.valueOf(),t.valueOf())}function Zm(e,t){return e.source===t.source&&e.flags===t.flags}function ey(e,t,n){var r=e.size;if(r!==t.size)return!1;if(!r)return!0;for(var o,i,a=new Array(r),l=e.values();(o=l.next())&&!o.done;){for(var s=t.values(),u=!1,c=0;(i=s.next())&&!i.done;){if(!a[c]&&n.equals(o.value,i.value,o.value,i.value,e,t,n)){u=a[c]=!0;break}c++}if(!u)return!1}return!0}function ty(e,t){var n=e.length;if(t.length!==n)return!1;for(;n-- >0;)if(e[n]!==t[n])return!1;return!0}function ny(e,t){return e.hostname===t.hostname&&e.pathname===t.pathname&&e.protocol===t.protocol&&e.port===t.port&&e.hash===t.hash&&e.username===t.username&&e.password===t.password}function ry(e,t,n,r){return!("_owner"!==r&&"__o"!==r&&"__v"!==r||!e.$$typeof&&!t.$$typeof)||Bm(t,r)&&n.equals(e[r],t[r],r,r,e,t,n)}var oy=Array.isArray,iy="function"===typeof ArrayBuffer&&ArrayBuffer.isView?ArrayBuffer.isView:null,ay=Object.assign,ly=Object.prototype.toString.call.bind(Object.prototype.toString);var sy=uy();uy({strict:!0}),uy({circular:!0}),uy({circular:!0,strict:!0}),uy({createInternalComparator:function(){return Fm}}),uy({strict:!0,createInternalComparator:function(){return Fm}}),uy({circular:!0,createInternalComparator:function(){return Fm}}),uy({circular:!0,createInternalComparator:function(){return Fm},strict:!0});function uy(e){void 0===e&&(e={});var t,n=e.circular,r=void 0!==n&&n,o=e.createInternalComparator,i=e.createState,a=e.strict,l=void 0!==a&&a,s=function(e){var t=e.circular,n=e.createCustomConfig,r=e.strict,o={areArraysEqual:r?Qm:Hm,areDatesEqual:Vm,areErrorsEqual:qm,areFunctionsEqual:Xm,areMapsEqual:r?Lm(Km,Qm):Km,areNumbersEqual:Gm,areObjectsEqual:r?Qm:Ym,arePrimitiveWrappersEqual:Jm,areRegExpsEqual:Zm,areSetsEqual:r?Lm(ey,Qm):ey,areTypedArraysEqual:r?Qm:ty,areUrlsEqual:ny};if(n&&(o=ay({},o,n(o))),t){var i=zm(o.areArraysEqual),a=zm(o.areMapsEqual),l=zm(o.areObjectsEqual),s=zm(o.areSetsEqual);o=ay({},o,{areArraysEqual:i,areMapsEqual:a,areObjectsEqual:l,areSetsEqual:s})}return o}(e),u=function(e){var t=e.areArraysEqual,n=e.areDatesEqual,r=e.areErrorsEqual,o=e.areFunctionsEqual,i=e.areMapsEqual,a=e.areNumbersEqual,l=e.areObjectsEqual,s=e.arePrimitiveWrappersEqual,u=e.areRegExpsEqual,c=e.areSetsEqual,d=e.areTypedArraysEqual,f=e.areUrlsEqual;return function(e,p,h){if(e===p)return!0;if(null==e||null==p)return!1;var m=typeof e;if(m!==typeof p)return!1;if("object"!==m)return"number"===m?a(e,p,h):"function"===m&&o(e,p,h);var y=e.constructor;if(y!==p.constructor)return!1;if(y===Object)return l(e,p,h);if(oy(e))return t(e,p,h);if(null!=iy&&iy(e))return d(e,p,h);if(y===Date)return n(e,p,h);if(y===RegExp)return u(e,p,h);if(y===Map)return i(e,p,h);if(y===Set)return c(e,p,h);var v=ly(e);return"[object Date]"===v?n(e,p,h):"[object RegExp]"===v?u(e,p,h):"[object Map]"===v?i(e,p,h):"[object Set]"===v?c(e,p,h):"[object Object]"===v?"function"!==typeof e.then&&"function"!==typeof p.then&&l(e,p,h):"[object URL]"===v?f(e,p,h):"[object Error]"===v?r(e,p,h):"[object Arguments]"===v?l(e,p,h):("[object Boolean]"===v||"[object Number]"===v||"[object String]"===v)&&s(e,p,h)}}(s),c=o?o(u):(t=u,function(e,n,r,o,i,a,l){return t(e,n,l)});return function(e){var t=e.circular,n=e.comparator,r=e.createState,o=e.equals,i=e.strict;if(r)return function(e,a){var l=r(),s=l.cache,u=void 0===s?t?new WeakMap:void 0:s,c=l.meta;return n(e,a,{cache:u,equals:o,meta:c,strict:i})};if(t)return function(e,t){return n(e,t,{cache:new WeakMap,equals:o,meta:void 0,strict:i})};var a={cache:void 0,equals:o,meta:void 0,strict:i};return function(e,t){return n(e,t,a)}}({circular:r,comparator:u,createState:i,equals:c,strict:l})}function cy(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0,n=-1;requestAnimationFrame((function r(o){n<0&&(n=o),o-n>t?(e(o),n=-1):function(e){"undefined"!==typeof requestAnimationFrame&&requestAnimationFrame(e)}(r)}))}function dy(e){return dy="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},dy(e)}function fy(e){return function(e){if(Array.isArray(e))return e}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return py(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return py(e,t)}(e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function py(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function hy(){var e=function(){return null},t=!1,n=function n(r){if(!t){if(Array.isArray(r)){if(!r.length)return;var o=fy(r),i=o[0],a=o.slice(1);return"number"===typeof i?void cy(n.bind(null,a),i):(n(i),void cy(n.bind(null,a)))}"object"===dy(r)&&e(r),"function"===typeof r&&r()}};return{stop:function(){t=!0},start:function(e){t=!1,n(e)},subscribe:function(t){return e=t,function(){e=function(){return null}}}}}function my(e){return my="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},my(e)}function yy(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function vy(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?yy(Object(n),!0).forEach((function(t){gy(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):yy(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function gy(e,t,n){return(t=function(e){var t=function(e,t){if("object"!==my(e)||null===e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!==my(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"===my(t)?t:String(t)}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var by=function(e){return e},xy=function(e,t){return Object.keys(t).reduce((function(n,r){return vy(vy({},n),{},gy({},r,e(r,t[r])))}),{})},wy=function(e,t,n){return e.map((function(e){return"".concat((r=e,r.replace(/([A-Z])/g,(function(e){return"-".concat(e.toLowerCase())})))," ").concat(t,"ms ").concat(n);var r})).join(",")};function Sy(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||Oy(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ay(e){return function(e){if(Array.isArray(e))return ky(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||Oy(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Oy(e,t){if(e){if("string"===typeof e)return ky(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?ky(e,t):void 0}}function ky(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var jy=1e-4,Ey=function(e,t){return[0,3*e,3*t-6*e,3*e-3*t+1]},Cy=function(e,t){return e.map((function(e,n){return e*Math.pow(t,n)})).reduce((function(e,t){return e+t}))},Py=function(e,t){return function(n){var r=Ey(e,t);return Cy(r,n)}},My=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];var r=t[0],o=t[1],i=t[2],a=t[3];if(1===t.length)switch(t[0]){case"linear":r=0,o=0,i=1,a=1;break;case"ease":r=.25,o=.1,i=.25,a=1;break;case"ease-in":r=.42,o=0,i=1,a=1;break;case"ease-out":r=.42,o=0,i=.58,a=1;break;case"ease-in-out":r=0,o=0,i=.58,a=1;break;default:var l=t[0].split("(");if("cubic-bezier"===l[0]&&4===l[1].split(")")[0].split(",").length){var s=Sy(l[1].split(")")[0].split(",").map((function(e){return parseFloat(e)})),4);r=s[0],o=s[1],i=s[2],a=s[3]}}[r,i,o,a].every((function(e){return"number"===typeof e&&e>=0&&e<=1}));var u,c,d=Py(r,i),f=Py(o,a),p=(u=r,c=i,function(e){var t=Ey(u,c),n=[].concat(Ay(t.map((function(e,t){return e*t})).slice(1)),[0]);return Cy(n,e)}),h=function(e){return e>1?1:e<0?0:e},m=function(e){for(var t=e>1?1:e,n=t,r=0;r<8;++r){var o=d(n)-t,i=p(n);if(Math.abs(o-t)<jy||i<jy)return f(n);n=h(n-o/i)}return f(n)};return m.isStepper=!1,m},Ty=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];var r=t[0];if("string"===typeof r)switch(r){case"ease":case"ease-in-out":case"ease-out":case"ease-in":case"linear":return My(r);case"spring":return function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=e.stiff,n=void 0===t?100:t,r=e.damping,o=void 0===r?8:r,i=e.dt,a=void 0===i?17:i,l=function(e,t,r){var i=r+(-(e-t)*n-r*o)*a/1e3,l=r*a/1e3+e;return Math.abs(l-t)<jy&&Math.abs(i)<jy?[t,0]:[l,i]};return l.isStepper=!0,l.dt=a,l}();default:if("cubic-bezier"===r.split("(")[0])return My(r)}return"function"===typeof r?r:null};function _y(e){return _y="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},_y(e)}function Ry(e){return function(e){if(Array.isArray(e))return $y(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||zy(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ny(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Iy(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Ny(Object(n),!0).forEach((function(t){Dy(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Ny(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function Dy(e,t,n){return(t=function(e){var t=function(e,t){if("object"!==_y(e)||null===e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!==_y(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"===_y(t)?t:String(t)}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Ly(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||zy(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function zy(e,t){if(e){if("string"===typeof e)return $y(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?$y(e,t):void 0}}function $y(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var By=function(e,t,n){return e+(t-e)*n},Fy=function(e){return e.from!==e.to},Wy=function e(t,n,r){var o=xy((function(e,n){if(Fy(n)){var r=Ly(t(n.from,n.to,n.velocity),2),o=r[0],i=r[1];return Iy(Iy({},n),{},{from:o,velocity:i})}return n}),n);return r<1?xy((function(e,t){return Fy(t)?Iy(Iy({},t),{},{velocity:By(t.velocity,o[e].velocity,r),from:By(t.from,o[e].from,r)}):t}),n):e(t,o,r-1)};const Uy=function(e,t,n,r,o){var i,a,l,s,u=(i=e,a=t,[Object.keys(i),Object.keys(a)].reduce((function(e,t){return e.filter((function(e){return t.includes(e)}))}))),c=u.reduce((function(n,r){return Iy(Iy({},n),{},Dy({},r,[e[r],t[r]]))}),{}),d=u.reduce((function(n,r){return Iy(Iy({},n),{},Dy({},r,{from:e[r],velocity:0,to:t[r]}))}),{}),f=-1,p=function(){return null};return p=n.isStepper?function(r){l||(l=r);var i=(r-l)/n.dt;d=Wy(n,d,i),o(Iy(Iy(Iy({},e),t),xy((function(e,t){return t.from}),d))),l=r,Object.values(d).filter(Fy).length&&(f=requestAnimationFrame(p))}:function(i){s||(s=i);var a=(i-s)/r,l=xy((function(e,t){return By.apply(void 0,Ry(t).concat([n(a)]))}),c);if(o(Iy(Iy(Iy({},e),t),l)),a<1)f=requestAnimationFrame(p);else{var u=xy((function(e,t){return By.apply(void 0,Ry(t).concat([n(1)]))}),c);o(Iy(Iy(Iy({},e),t),u))}},function(){return requestAnimationFrame(p),function(){cancelAnimationFrame(f)}}};function Hy(e){return Hy="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Hy(e)}var Vy=["children","begin","duration","attributeName","easing","isActive","steps","from","to","canBegin","onAnimationEnd","shouldReAnimate","onAnimationReStart"];function qy(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Xy(e){return function(e){if(Array.isArray(e))return Ky(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return Ky(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Ky(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ky(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function Gy(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Yy(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Gy(Object(n),!0).forEach((function(t){Qy(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Gy(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function Qy(e,t,n){return(t=Zy(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Jy(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Zy(r.key),r)}}function Zy(e){var t=function(e,t){if("object"!==Hy(e)||null===e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!==Hy(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"===Hy(t)?t:String(t)}function ev(e,t){return ev=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},ev(e,t)}function tv(e){var t=function(){if("undefined"===typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"===typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(SR){return!1}}();return function(){var n,r=ov(e);if(t){var o=ov(this).constructor;n=Reflect.construct(r,arguments,o)}else n=r.apply(this,arguments);return nv(this,n)}}function nv(e,t){if(t&&("object"===Hy(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return rv(e)}function rv(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function ov(e){return ov=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},ov(e)}var iv=function(e){!function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&ev(e,t)}(a,e);var n,r,o,i=tv(a);function a(e,t){var n;!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,a);var r=(n=i.call(this,e,t)).props,o=r.isActive,l=r.attributeName,s=r.from,u=r.to,c=r.steps,d=r.children,f=r.duration;if(n.handleStyleChange=n.handleStyleChange.bind(rv(n)),n.changeStyle=n.changeStyle.bind(rv(n)),!o||f<=0)return n.state={style:{}},"function"===typeof d&&(n.state={style:u}),nv(n);if(c&&c.length)n.state={style:c[0].style};else if(s){if("function"===typeof d)return n.state={style:s},nv(n);n.state={style:l?Qy({},l,s):s}}else n.state={style:{}};return n}return n=a,r=[{key:"componentDidMount",value:function(){var e=this.props,t=e.isActive,n=e.canBegin;this.mounted=!0,t&&n&&this.runAnimation(this.props)}},{key:"componentDidUpdate",value:function(e){var t=this.props,n=t.isActive,r=t.canBegin,o=t.attributeName,i=t.shouldReAnimate,a=t.to,l=t.from,s=this.state.style;if(r)if(n){if(!(sy(e.to,a)&&e.canBegin&&e.isActive)){var u=!e.canBegin||!e.isActive;this.manager&&this.manager.stop(),this.stopJSAnimation&&this.stopJSAnimation();var c=u||i?l:e.to;if(this.state&&s){var d={style:o?Qy({},o,c):c};(o&&s[o]!==c||!o&&s!==c)&&this.setState(d)}this.runAnimation(Yy(Yy({},this.props),{},{from:c,begin:0}))}}else{var f={style:o?Qy({},o,a):a};this.state&&s&&(o&&s[o]!==a||!o&&s!==a)&&this.setState(f)}}},{key:"componentWillUnmount",value:function(){this.mounted=!1;var e=this.props.onAnimationEnd;this.unSubscribe&&this.unSubscribe(),this.manager&&(this.manager.stop(),this.manager=null),this.stopJSAnimation&&this.stopJSAnimation(),e&&e()}},{key:"handleStyleChange",value:function(e){this.changeStyle(e)}},{key:"changeStyle",value:function(e){this.mounted&&this.setState({style:e})}},{key:"runJSAnimation",value:function(e){var t=this,n=e.from,r=e.to,o=e.duration,i=e.easing,a=e.begin,l=e.onAnimationEnd,s=e.onAnimationStart,u=Uy(n,r,Ty(i),o,this.changeStyle);this.manager.start([s,a,function(){t.stopJSAnimation=u()},o,l])}},{key:"runStepAnimation",value:function(e){var t=this,n=e.steps,r=e.begin,o=e.onAnimationStart,i=n[0],a=i.style,l=i.duration,s=void 0===l?0:l;return this.manager.start([o].concat(Xy(n.reduce((function(e,r,o){if(0===o)return e;var i=r.duration,a=r.easing,l=void 0===a?"ease":a,s=r.style,u=r.properties,c=r.onAnimationEnd,d=o>0?n[o-1]:r,f=u||Object.keys(s);if("function"===typeof l||"spring"===l)return[].concat(Xy(e),[t.runJSAnimation.bind(t,{from:d.style,to:s,duration:i,easing:l}),i]);var p=wy(f,i,l),h=Yy(Yy(Yy({},d.style),s),{},{transition:p});return[].concat(Xy(e),[h,i,c]).filter(by)}),[a,Math.max(s,r)])),[e.onAnimationEnd]))}},{key:"runAnimation",value:function(e){this.manager||(this.manager=hy());var t=e.begin,n=e.duration,r=e.attributeName,o=e.to,i=e.easing,a=e.onAnimationStart,l=e.onAnimationEnd,s=e.steps,u=e.children,c=this.manager;if(this.unSubscribe=c.subscribe(this.handleStyleChange),"function"!==typeof i&&"function"!==typeof u&&"spring"!==i)if(s.length>1)this.runStepAnimation(e);else{var d=r?Qy({},r,o):o,f=wy(Object.keys(d),n,i);c.start([a,t,Yy(Yy({},d),{},{transition:f}),n,l])}else this.runJSAnimation(e)}},{key:"render",value:function(){var e=this.props,n=e.children,r=(e.begin,e.duration),o=(e.attributeName,e.easing,e.isActive),i=(e.steps,e.from,e.to,e.canBegin,e.onAnimationEnd,e.shouldReAnimate,e.onAnimationReStart,qy(e,Vy)),a=t.Children.count(n),l=this.state.style;if("function"===typeof n)return n(l);if(!o||0===a||r<=0)return n;var s=function(e){var n=e.props,r=n.style,o=void 0===r?{}:r,a=n.className;return(0,t.cloneElement)(e,Yy(Yy({},i),{},{style:Yy(Yy({},o),l),className:a}))};return 1===a?s(t.Children.only(n)):t.createElement("div",null,t.Children.map(n,(function(e){return s(e)})))}}],r&&Jy(n.prototype,r),o&&Jy(n,o),Object.defineProperty(n,"prototype",{writable:!1}),a}(t.PureComponent);iv.displayName="Animate",iv.defaultProps={begin:0,duration:1e3,from:"",to:"",attributeName:"",easing:"ease",isActive:!0,canBegin:!0,steps:[],onAnimationEnd:function(){},onAnimationStart:function(){}},iv.propTypes={from:Rm().oneOfType([Rm().object,Rm().string]),to:Rm().oneOfType([Rm().object,Rm().string]),attributeName:Rm().string,duration:Rm().number,begin:Rm().number,easing:Rm().oneOfType([Rm().string,Rm().func]),steps:Rm().arrayOf(Rm().shape({duration:Rm().number.isRequired,style:Rm().object.isRequired,easing:Rm().oneOfType([Rm().oneOf(["ease","ease-in","ease-out","ease-in-out","linear"]),Rm().func]),properties:Rm().arrayOf("string"),onAnimationEnd:Rm().func})),children:Rm().oneOfType([Rm().node,Rm().func]),isActive:Rm().bool,canBegin:Rm().bool,onAnimationEnd:Rm().func,shouldReAnimate:Rm().bool,onAnimationStart:Rm().func,onAnimationReStart:Rm().func};const av=iv;function lv(e){return lv="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},lv(e)}function sv(){return sv=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},sv.apply(this,arguments)}function uv(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return cv(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return cv(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function cv(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function dv(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function fv(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?dv(Object(n),!0).forEach((function(t){pv(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):dv(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function pv(e,t,n){return t=function(e){var t=function(e,t){if("object"!=lv(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=lv(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==lv(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var hv=function(e,t,n,r,o){var i,a=Math.min(Math.abs(n)/2,Math.abs(r)/2),l=r>=0?1:-1,s=n>=0?1:-1,u=r>=0&&n>=0||r<0&&n<0?1:0;if(a>0&&o instanceof Array){for(var c=[0,0,0,0],d=0;d<4;d++)c[d]=o[d]>a?a:o[d];i="M".concat(e,",").concat(t+l*c[0]),c[0]>0&&(i+="A ".concat(c[0],",").concat(c[0],",0,0,").concat(u,",").concat(e+s*c[0],",").concat(t)),i+="L ".concat(e+n-s*c[1],",").concat(t),c[1]>0&&(i+="A ".concat(c[1],",").concat(c[1],",0,0,").concat(u,",\n        ").concat(e+n,",").concat(t+l*c[1])),i+="L ".concat(e+n,",").concat(t+r-l*c[2]),c[2]>0&&(i+="A ".concat(c[2],",").concat(c[2],",0,0,").concat(u,",\n        ").concat(e+n-s*c[2],",").concat(t+r)),i+="L ".concat(e+s*c[3],",").concat(t+r),c[3]>0&&(i+="A ".concat(c[3],",").concat(c[3],",0,0,").concat(u,",\n        ").concat(e,",").concat(t+r-l*c[3])),i+="Z"}else if(a>0&&o===+o&&o>0){var f=Math.min(a,o);i="M ".concat(e,",").concat(t+l*f,"\n            A ").concat(f,",").concat(f,",0,0,").concat(u,",").concat(e+s*f,",").concat(t,"\n            L ").concat(e+n-s*f,",").concat(t,"\n            A ").concat(f,",").concat(f,",0,0,").concat(u,",").concat(e+n,",").concat(t+l*f,"\n            L ").concat(e+n,",").concat(t+r-l*f,"\n            A ").concat(f,",").concat(f,",0,0,").concat(u,",").concat(e+n-s*f,",").concat(t+r,"\n            L ").concat(e+s*f,",").concat(t+r,"\n            A ").concat(f,",").concat(f,",0,0,").concat(u,",").concat(e,",").concat(t+r-l*f," Z")}else i="M ".concat(e,",").concat(t," h ").concat(n," v ").concat(r," h ").concat(-n," Z");return i},mv=function(e,t){if(!e||!t)return!1;var n=e.x,r=e.y,o=t.x,i=t.y,a=t.width,l=t.height;if(Math.abs(a)>0&&Math.abs(l)>0){var s=Math.min(o,o+a),u=Math.max(o,o+a),c=Math.min(i,i+l),d=Math.max(i,i+l);return n>=s&&n<=u&&r>=c&&r<=d}return!1},yv={x:0,y:0,width:0,height:0,radius:0,isAnimationActive:!1,isUpdateAnimationActive:!1,animationBegin:0,animationDuration:1500,animationEasing:"ease"},vv=function(e){var n=fv(fv({},yv),e),r=(0,t.useRef)(),o=uv((0,t.useState)(-1),2),i=o[0],a=o[1];(0,t.useEffect)((function(){if(r.current&&r.current.getTotalLength)try{var e=r.current.getTotalLength();e&&a(e)}catch(t){}}),[]);var l=n.x,s=n.y,u=n.width,c=n.height,d=n.radius,f=n.className,p=n.animationEasing,h=n.animationDuration,m=n.animationBegin,y=n.isAnimationActive,v=n.isUpdateAnimationActive;if(l!==+l||s!==+s||u!==+u||c!==+c||0===u||0===c)return null;var g=zt("recharts-rectangle",f);return v?t.createElement(av,{canBegin:i>0,from:{width:u,height:c,x:l,y:s},to:{width:u,height:c,x:l,y:s},duration:h,animationEasing:p,isActive:v},(function(e){var o=e.width,a=e.height,l=e.x,s=e.y;return t.createElement(av,{canBegin:i>0,from:"0px ".concat(-1===i?1:i,"px"),to:"".concat(i,"px 0px"),attributeName:"strokeDasharray",begin:m,duration:h,isActive:y,easing:p},t.createElement("path",sv({},rp(n,!0),{className:g,d:hv(l,s,o,a,d),ref:r})))})):t.createElement("path",sv({},rp(n,!0),{className:g,d:hv(l,s,u,c,d)}))};function gv(e,t){switch(arguments.length){case 0:break;case 1:this.range(e);break;default:this.range(t).domain(e)}return this}function bv(e,t){switch(arguments.length){case 0:break;case 1:"function"===typeof e?this.interpolator(e):this.range(e);break;default:this.domain(e),"function"===typeof t?this.interpolator(t):this.range(t)}return this}class xv extends Map{constructor(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Ov;if(super(),Object.defineProperties(this,{_intern:{value:new Map},_key:{value:t}}),null!=e)for(const[n,r]of e)this.set(n,r)}get(e){return super.get(wv(this,e))}has(e){return super.has(wv(this,e))}set(e,t){return super.set(Sv(this,e),t)}delete(e){return super.delete(Av(this,e))}}Set;function wv(e,t){let{_intern:n,_key:r}=e;const o=r(t);return n.has(o)?n.get(o):t}function Sv(e,t){let{_intern:n,_key:r}=e;const o=r(t);return n.has(o)?n.get(o):(n.set(o,t),t)}function Av(e,t){let{_intern:n,_key:r}=e;const o=r(t);return n.has(o)&&(t=n.get(o),n.delete(o)),t}function Ov(e){return null!==e&&"object"===typeof e?e.valueOf():e}const kv=Symbol("implicit");function jv(){var e=new xv,t=[],n=[],r=kv;function o(o){let i=e.get(o);if(void 0===i){if(r!==kv)return r;e.set(o,i=t.push(o)-1)}return n[i%n.length]}return o.domain=function(n){if(!arguments.length)return t.slice();t=[],e=new xv;for(const r of n)e.has(r)||e.set(r,t.push(r)-1);return o},o.range=function(e){return arguments.length?(n=Array.from(e),o):n.slice()},o.unknown=function(e){return arguments.length?(r=e,o):r},o.copy=function(){return jv(t,n).unknown(r)},gv.apply(o,arguments),o}function Ev(){var e,t,n=jv().unknown(void 0),r=n.domain,o=n.range,i=0,a=1,l=!1,s=0,u=0,c=.5;function d(){var n=r().length,d=a<i,f=d?a:i,p=d?i:a;e=(p-f)/Math.max(1,n-s+2*u),l&&(e=Math.floor(e)),f+=(p-f-e*(n-s))*c,t=e*(1-s),l&&(f=Math.round(f),t=Math.round(t));var h=function(e,t,n){e=+e,t=+t,n=(o=arguments.length)<2?(t=e,e=0,1):o<3?1:+n;for(var r=-1,o=0|Math.max(0,Math.ceil((t-e)/n)),i=new Array(o);++r<o;)i[r]=e+r*n;return i}(n).map((function(t){return f+e*t}));return o(d?h.reverse():h)}return delete n.unknown,n.domain=function(e){return arguments.length?(r(e),d()):r()},n.range=function(e){return arguments.length?([i,a]=e,i=+i,a=+a,d()):[i,a]},n.rangeRound=function(e){return[i,a]=e,i=+i,a=+a,l=!0,d()},n.bandwidth=function(){return t},n.step=function(){return e},n.round=function(e){return arguments.length?(l=!!e,d()):l},n.padding=function(e){return arguments.length?(s=Math.min(1,u=+e),d()):s},n.paddingInner=function(e){return arguments.length?(s=Math.min(1,e),d()):s},n.paddingOuter=function(e){return arguments.length?(u=+e,d()):u},n.align=function(e){return arguments.length?(c=Math.max(0,Math.min(1,e)),d()):c},n.copy=function(){return Ev(r(),[i,a]).round(l).paddingInner(s).paddingOuter(u).align(c)},gv.apply(d(),arguments)}function Cv(e){var t=e.copy;return e.padding=e.paddingOuter,delete e.paddingInner,delete e.paddingOuter,e.copy=function(){return Cv(t())},e}function Pv(){return Cv(Ev.apply(null,arguments).paddingInner(1))}function Mv(e){return Mv="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Mv(e)}function Tv(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function _v(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Tv(Object(n),!0).forEach((function(t){Rv(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Tv(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function Rv(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Mv(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Mv(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Mv(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var Nv={widthCache:{},cacheCount:0},Iv={position:"absolute",top:"-20000px",left:0,padding:0,margin:0,border:"none",whiteSpace:"pre"},Dv="recharts_measurement_span";var Lv=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if(void 0===e||null===e||eh.isSsr)return{width:0,height:0};var n=function(e){var t=_v({},e);return Object.keys(t).forEach((function(e){t[e]||delete t[e]})),t}(t),r=JSON.stringify({text:e,copyStyle:n});if(Nv.widthCache[r])return Nv.widthCache[r];try{var o=document.getElementById(Dv);o||((o=document.createElement("span")).setAttribute("id",Dv),o.setAttribute("aria-hidden","true"),document.body.appendChild(o));var i=_v(_v({},Iv),n);Object.assign(o.style,i),o.textContent="".concat(e);var a=o.getBoundingClientRect(),l={width:a.width,height:a.height};return Nv.widthCache[r]=l,++Nv.cacheCount>2e3&&(Nv.cacheCount=0,Nv.widthCache={}),l}catch(SR){return{width:0,height:0}}};function zv(e){return zv="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},zv(e)}function $v(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return Bv(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Bv(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Bv(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function Fv(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Wv(r.key),r)}}function Wv(e){var t=function(e,t){if("object"!=zv(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=zv(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==zv(t)?t:t+""}var Uv=/(-?\d+(?:\.\d+)?[a-zA-Z%]*)([*/])(-?\d+(?:\.\d+)?[a-zA-Z%]*)/,Hv=/(-?\d+(?:\.\d+)?[a-zA-Z%]*)([+-])(-?\d+(?:\.\d+)?[a-zA-Z%]*)/,Vv=/^px|cm|vh|vw|em|rem|%|mm|in|pt|pc|ex|ch|vmin|vmax|Q$/,qv=/(-?\d+(?:\.\d+)?)([a-zA-Z%]+)?/,Xv={cm:96/2.54,mm:96/25.4,pt:96/72,pc:16,in:96,Q:96/101.6,px:1},Kv=Object.keys(Xv),Gv="NaN";var Yv=function(){function e(t,n){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.num=t,this.unit=n,this.num=t,this.unit=n,Number.isNaN(t)&&(this.unit=""),""===n||Vv.test(n)||(this.num=NaN,this.unit=""),Kv.includes(n)&&(this.num=function(e,t){return e*Xv[t]}(t,n),this.unit="px")}return t=e,r=[{key:"parse",value:function(t){var n,r=$v(null!==(n=qv.exec(t))&&void 0!==n?n:[],3),o=r[1],i=r[2];return new e(parseFloat(o),null!==i&&void 0!==i?i:"")}}],(n=[{key:"add",value:function(t){return this.unit!==t.unit?new e(NaN,""):new e(this.num+t.num,this.unit)}},{key:"subtract",value:function(t){return this.unit!==t.unit?new e(NaN,""):new e(this.num-t.num,this.unit)}},{key:"multiply",value:function(t){return""!==this.unit&&""!==t.unit&&this.unit!==t.unit?new e(NaN,""):new e(this.num*t.num,this.unit||t.unit)}},{key:"divide",value:function(t){return""!==this.unit&&""!==t.unit&&this.unit!==t.unit?new e(NaN,""):new e(this.num/t.num,this.unit||t.unit)}},{key:"toString",value:function(){return"".concat(this.num).concat(this.unit)}},{key:"isNaN",value:function(){return Number.isNaN(this.num)}}])&&Fv(t.prototype,n),r&&Fv(t,r),Object.defineProperty(t,"prototype",{writable:!1}),t;var t,n,r}();function Qv(e){if(e.includes(Gv))return Gv;for(var t=e;t.includes("*")||t.includes("/");){var n,r=$v(null!==(n=Uv.exec(t))&&void 0!==n?n:[],4),o=r[1],i=r[2],a=r[3],l=Yv.parse(null!==o&&void 0!==o?o:""),s=Yv.parse(null!==a&&void 0!==a?a:""),u="*"===i?l.multiply(s):l.divide(s);if(u.isNaN())return Gv;t=t.replace(Uv,u.toString())}for(;t.includes("+")||/.-\d+(?:\.\d+)?/.test(t);){var c,d=$v(null!==(c=Hv.exec(t))&&void 0!==c?c:[],4),f=d[1],p=d[2],h=d[3],m=Yv.parse(null!==f&&void 0!==f?f:""),y=Yv.parse(null!==h&&void 0!==h?h:""),v="+"===p?m.add(y):m.subtract(y);if(v.isNaN())return Gv;t=t.replace(Hv,v.toString())}return t}var Jv=/\(([^()]*)\)/;function Zv(e){var t=e.replace(/\s+/g,"");return t=function(e){for(var t=e;t.includes("(");){var n=$v(Jv.exec(t),2)[1];t=t.replace(Jv,Qv(n))}return t}(t),t=Qv(t)}function eg(e){var t=function(e){try{return Zv(e)}catch(SR){return Gv}}(e.slice(5,-1));return t===Gv?"":t}var tg=["x","y","lineHeight","capHeight","scaleToFit","textAnchor","verticalAnchor","fill"],ng=["dx","dy","angle","className","breakAll"];function rg(){return rg=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},rg.apply(this,arguments)}function og(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function ig(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return ag(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return ag(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function ag(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var lg=/[ \f\n\r\t\v\u2028\u2029]+/,sg=function(e){var t=e.children,n=e.breakAll,r=e.style;try{var o=[];return Mf()(t)||(o=n?t.toString().split(""):t.toString().split(lg)),{wordsWithComputedWidth:o.map((function(e){return{word:e,width:Lv(e,r).width}})),spaceWidth:n?0:Lv("\xa0",r).width}}catch(SR){return null}},ug=function(e){return[{words:Mf()(e)?[]:e.toString().split(lg)}]},cg=function(e){var t=e.width,n=e.scaleToFit,r=e.children,o=e.style,i=e.breakAll,a=e.maxLines;if((t||n)&&!eh.isSsr){var l=sg({breakAll:i,children:r,style:o});return l?function(e,t,n,r,o){var i=e.maxLines,a=e.children,l=e.style,s=e.breakAll,u=bf(i),c=a,d=function(){return(arguments.length>0&&void 0!==arguments[0]?arguments[0]:[]).reduce((function(e,t){var i=t.word,a=t.width,l=e[e.length-1];if(l&&(null==r||o||l.width+a+n<Number(r)))l.words.push(i),l.width+=a+n;else{var s={words:[i],width:a};e.push(s)}return e}),[])},f=d(t);if(!u)return f;for(var p,h=function(e){var t=c.slice(0,e),n=sg({breakAll:s,style:l,children:t+"\u2026"}).wordsWithComputedWidth,o=d(n),a=o.length>i||function(e){return e.reduce((function(e,t){return e.width>t.width?e:t}))}(o).width>Number(r);return[a,o]},m=0,y=c.length-1,v=0;m<=y&&v<=c.length-1;){var g=Math.floor((m+y)/2),b=ig(h(g-1),2),x=b[0],w=b[1],S=ig(h(g),1)[0];if(x||S||(m=g+1),x&&S&&(y=g-1),!x&&S){p=w;break}v++}return p||f}({breakAll:i,children:r,maxLines:a,style:o},l.wordsWithComputedWidth,l.spaceWidth,t,n):ug(r)}return ug(r)},dg="#808080",fg=function(e){var n=e.x,r=void 0===n?0:n,o=e.y,i=void 0===o?0:o,a=e.lineHeight,l=void 0===a?"1em":a,s=e.capHeight,u=void 0===s?"0.71em":s,c=e.scaleToFit,d=void 0!==c&&c,f=e.textAnchor,p=void 0===f?"start":f,h=e.verticalAnchor,m=void 0===h?"end":h,y=e.fill,v=void 0===y?dg:y,g=og(e,tg),b=(0,t.useMemo)((function(){return cg({breakAll:g.breakAll,children:g.children,maxLines:g.maxLines,scaleToFit:d,style:g.style,width:g.width})}),[g.breakAll,g.children,g.maxLines,d,g.style,g.width]),x=g.dx,w=g.dy,S=g.angle,A=g.className,O=g.breakAll,k=og(g,ng);if(!xf(r)||!xf(i))return null;var j,E=r+(bf(x)?x:0),C=i+(bf(w)?w:0);switch(m){case"start":j=eg("calc(".concat(u,")"));break;case"middle":j=eg("calc(".concat((b.length-1)/2," * -").concat(l," + (").concat(u," / 2))"));break;default:j=eg("calc(".concat(b.length-1," * -").concat(l,")"))}var P=[];if(d){var M=b[0].width,T=g.width;P.push("scale(".concat((bf(T)?T/M:1)/M,")"))}return S&&P.push("rotate(".concat(S,", ").concat(E,", ").concat(C,")")),P.length&&(k.transform=P.join(" ")),t.createElement("text",rg({},rp(k,!0),{x:E,y:C,className:zt("recharts-text",A),textAnchor:p,fill:v.includes("url")?dg:v}),b.map((function(e,n){var r=e.words.join(O?"":" ");return t.createElement("tspan",{x:E,dy:0===n?j:l,key:"".concat(r,"-").concat(n)},r)})))};const pg=Math.sqrt(50),hg=Math.sqrt(10),mg=Math.sqrt(2);function yg(e,t,n){const r=(t-e)/Math.max(0,n),o=Math.floor(Math.log10(r)),i=r/Math.pow(10,o),a=i>=pg?10:i>=hg?5:i>=mg?2:1;let l,s,u;return o<0?(u=Math.pow(10,-o)/a,l=Math.round(e*u),s=Math.round(t*u),l/u<e&&++l,s/u>t&&--s,u=-u):(u=Math.pow(10,o)*a,l=Math.round(e/u),s=Math.round(t/u),l*u<e&&++l,s*u>t&&--s),s<l&&.5<=n&&n<2?yg(e,t,2*n):[l,s,u]}function vg(e,t,n){if(!((n=+n)>0))return[];if((e=+e)===(t=+t))return[e];const r=t<e,[o,i,a]=r?yg(t,e,n):yg(e,t,n);if(!(i>=o))return[];const l=i-o+1,s=new Array(l);if(r)if(a<0)for(let u=0;u<l;++u)s[u]=(i-u)/-a;else for(let u=0;u<l;++u)s[u]=(i-u)*a;else if(a<0)for(let u=0;u<l;++u)s[u]=(o+u)/-a;else for(let u=0;u<l;++u)s[u]=(o+u)*a;return s}function gg(e,t,n){return yg(e=+e,t=+t,n=+n)[2]}function bg(e,t,n){n=+n;const r=(t=+t)<(e=+e),o=r?gg(t,e,n):gg(e,t,n);return(r?-1:1)*(o<0?1/-o:o)}function xg(e,t){return null==e||null==t?NaN:e<t?-1:e>t?1:e>=t?0:NaN}function wg(e,t){return null==e||null==t?NaN:t<e?-1:t>e?1:t>=e?0:NaN}function Sg(e){let t,n,r;function o(e,r){let o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,i=arguments.length>3&&void 0!==arguments[3]?arguments[3]:e.length;if(o<i){if(0!==t(r,r))return i;do{const t=o+i>>>1;n(e[t],r)<0?o=t+1:i=t}while(o<i)}return o}return 2!==e.length?(t=xg,n=(t,n)=>xg(e(t),n),r=(t,n)=>e(t)-n):(t=e===xg||e===wg?e:Ag,n=e,r=e),{left:o,center:function(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0;const i=o(e,t,n,(arguments.length>3&&void 0!==arguments[3]?arguments[3]:e.length)-1);return i>n&&r(e[i-1],t)>-r(e[i],t)?i-1:i},right:function(e,r){let o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,i=arguments.length>3&&void 0!==arguments[3]?arguments[3]:e.length;if(o<i){if(0!==t(r,r))return i;do{const t=o+i>>>1;n(e[t],r)<=0?o=t+1:i=t}while(o<i)}return o}}}function Ag(){return 0}function Og(e){return null===e?NaN:+e}const kg=Sg(xg),jg=kg.right,Eg=(kg.left,Sg(Og).center,jg);function Cg(e,t,n){e.prototype=t.prototype=n,n.constructor=e}function Pg(e,t){var n=Object.create(e.prototype);for(var r in t)n[r]=t[r];return n}function Mg(){}var Tg=.7,_g=1/Tg,Rg="\\s*([+-]?\\d+)\\s*",Ng="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",Ig="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",Dg=/^#([0-9a-f]{3,8})$/,Lg=new RegExp(`^rgb\\(${Rg},${Rg},${Rg}\\)$`),zg=new RegExp(`^rgb\\(${Ig},${Ig},${Ig}\\)$`),$g=new RegExp(`^rgba\\(${Rg},${Rg},${Rg},${Ng}\\)$`),Bg=new RegExp(`^rgba\\(${Ig},${Ig},${Ig},${Ng}\\)$`),Fg=new RegExp(`^hsl\\(${Ng},${Ig},${Ig}\\)$`),Wg=new RegExp(`^hsla\\(${Ng},${Ig},${Ig},${Ng}\\)$`),Ug={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};function Hg(){return this.rgb().formatHex()}function Vg(){return this.rgb().formatRgb()}function qg(e){var t,n;return e=(e+"").trim().toLowerCase(),(t=Dg.exec(e))?(n=t[1].length,t=parseInt(t[1],16),6===n?Xg(t):3===n?new Yg(t>>8&15|t>>4&240,t>>4&15|240&t,(15&t)<<4|15&t,1):8===n?Kg(t>>24&255,t>>16&255,t>>8&255,(255&t)/255):4===n?Kg(t>>12&15|t>>8&240,t>>8&15|t>>4&240,t>>4&15|240&t,((15&t)<<4|15&t)/255):null):(t=Lg.exec(e))?new Yg(t[1],t[2],t[3],1):(t=zg.exec(e))?new Yg(255*t[1]/100,255*t[2]/100,255*t[3]/100,1):(t=$g.exec(e))?Kg(t[1],t[2],t[3],t[4]):(t=Bg.exec(e))?Kg(255*t[1]/100,255*t[2]/100,255*t[3]/100,t[4]):(t=Fg.exec(e))?nb(t[1],t[2]/100,t[3]/100,1):(t=Wg.exec(e))?nb(t[1],t[2]/100,t[3]/100,t[4]):Ug.hasOwnProperty(e)?Xg(Ug[e]):"transparent"===e?new Yg(NaN,NaN,NaN,0):null}function Xg(e){return new Yg(e>>16&255,e>>8&255,255&e,1)}function Kg(e,t,n,r){return r<=0&&(e=t=n=NaN),new Yg(e,t,n,r)}function Gg(e,t,n,r){return 1===arguments.length?((o=e)instanceof Mg||(o=qg(o)),o?new Yg((o=o.rgb()).r,o.g,o.b,o.opacity):new Yg):new Yg(e,t,n,null==r?1:r);var o}function Yg(e,t,n,r){this.r=+e,this.g=+t,this.b=+n,this.opacity=+r}function Qg(){return`#${tb(this.r)}${tb(this.g)}${tb(this.b)}`}function Jg(){const e=Zg(this.opacity);return`${1===e?"rgb(":"rgba("}${eb(this.r)}, ${eb(this.g)}, ${eb(this.b)}${1===e?")":`, ${e})`}`}function Zg(e){return isNaN(e)?1:Math.max(0,Math.min(1,e))}function eb(e){return Math.max(0,Math.min(255,Math.round(e)||0))}function tb(e){return((e=eb(e))<16?"0":"")+e.toString(16)}function nb(e,t,n,r){return r<=0?e=t=n=NaN:n<=0||n>=1?e=t=NaN:t<=0&&(e=NaN),new ob(e,t,n,r)}function rb(e){if(e instanceof ob)return new ob(e.h,e.s,e.l,e.opacity);if(e instanceof Mg||(e=qg(e)),!e)return new ob;if(e instanceof ob)return e;var t=(e=e.rgb()).r/255,n=e.g/255,r=e.b/255,o=Math.min(t,n,r),i=Math.max(t,n,r),a=NaN,l=i-o,s=(i+o)/2;return l?(a=t===i?(n-r)/l+6*(n<r):n===i?(r-t)/l+2:(t-n)/l+4,l/=s<.5?i+o:2-i-o,a*=60):l=s>0&&s<1?0:a,new ob(a,l,s,e.opacity)}function ob(e,t,n,r){this.h=+e,this.s=+t,this.l=+n,this.opacity=+r}function ib(e){return(e=(e||0)%360)<0?e+360:e}function ab(e){return Math.max(0,Math.min(1,e||0))}function lb(e,t,n){return 255*(e<60?t+(n-t)*e/60:e<180?n:e<240?t+(n-t)*(240-e)/60:t)}function sb(e,t,n,r,o){var i=e*e,a=i*e;return((1-3*e+3*i-a)*t+(4-6*i+3*a)*n+(1+3*e+3*i-3*a)*r+a*o)/6}Cg(Mg,qg,{copy(e){return Object.assign(new this.constructor,this,e)},displayable(){return this.rgb().displayable()},hex:Hg,formatHex:Hg,formatHex8:function(){return this.rgb().formatHex8()},formatHsl:function(){return rb(this).formatHsl()},formatRgb:Vg,toString:Vg}),Cg(Yg,Gg,Pg(Mg,{brighter(e){return e=null==e?_g:Math.pow(_g,e),new Yg(this.r*e,this.g*e,this.b*e,this.opacity)},darker(e){return e=null==e?Tg:Math.pow(Tg,e),new Yg(this.r*e,this.g*e,this.b*e,this.opacity)},rgb(){return this},clamp(){return new Yg(eb(this.r),eb(this.g),eb(this.b),Zg(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:Qg,formatHex:Qg,formatHex8:function(){return`#${tb(this.r)}${tb(this.g)}${tb(this.b)}${tb(255*(isNaN(this.opacity)?1:this.opacity))}`},formatRgb:Jg,toString:Jg})),Cg(ob,(function(e,t,n,r){return 1===arguments.length?rb(e):new ob(e,t,n,null==r?1:r)}),Pg(Mg,{brighter(e){return e=null==e?_g:Math.pow(_g,e),new ob(this.h,this.s,this.l*e,this.opacity)},darker(e){return e=null==e?Tg:Math.pow(Tg,e),new ob(this.h,this.s,this.l*e,this.opacity)},rgb(){var e=this.h%360+360*(this.h<0),t=isNaN(e)||isNaN(this.s)?0:this.s,n=this.l,r=n+(n<.5?n:1-n)*t,o=2*n-r;return new Yg(lb(e>=240?e-240:e+120,o,r),lb(e,o,r),lb(e<120?e+240:e-120,o,r),this.opacity)},clamp(){return new ob(ib(this.h),ab(this.s),ab(this.l),Zg(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){const e=Zg(this.opacity);return`${1===e?"hsl(":"hsla("}${ib(this.h)}, ${100*ab(this.s)}%, ${100*ab(this.l)}%${1===e?")":`, ${e})`}`}}));const ub=e=>()=>e;function cb(e,t){return function(n){return e+n*t}}function db(e){return 1===(e=+e)?fb:function(t,n){return n-t?function(e,t,n){return e=Math.pow(e,n),t=Math.pow(t,n)-e,n=1/n,function(r){return Math.pow(e+r*t,n)}}(t,n,e):ub(isNaN(t)?n:t)}}function fb(e,t){var n=t-e;return n?cb(e,n):ub(isNaN(e)?t:e)}const pb=function e(t){var n=db(t);function r(e,t){var r=n((e=Gg(e)).r,(t=Gg(t)).r),o=n(e.g,t.g),i=n(e.b,t.b),a=fb(e.opacity,t.opacity);return function(t){return e.r=r(t),e.g=o(t),e.b=i(t),e.opacity=a(t),e+""}}return r.gamma=e,r}(1);function hb(e){return function(t){var n,r,o=t.length,i=new Array(o),a=new Array(o),l=new Array(o);for(n=0;n<o;++n)r=Gg(t[n]),i[n]=r.r||0,a[n]=r.g||0,l[n]=r.b||0;return i=e(i),a=e(a),l=e(l),r.opacity=1,function(e){return r.r=i(e),r.g=a(e),r.b=l(e),r+""}}}hb((function(e){var t=e.length-1;return function(n){var r=n<=0?n=0:n>=1?(n=1,t-1):Math.floor(n*t),o=e[r],i=e[r+1],a=r>0?e[r-1]:2*o-i,l=r<t-1?e[r+2]:2*i-o;return sb((n-r/t)*t,a,o,i,l)}})),hb((function(e){var t=e.length;return function(n){var r=Math.floor(((n%=1)<0?++n:n)*t),o=e[(r+t-1)%t],i=e[r%t],a=e[(r+1)%t],l=e[(r+2)%t];return sb((n-r/t)*t,o,i,a,l)}}));function mb(e,t){var n,r=t?t.length:0,o=e?Math.min(r,e.length):0,i=new Array(o),a=new Array(r);for(n=0;n<o;++n)i[n]=Ab(e[n],t[n]);for(;n<r;++n)a[n]=t[n];return function(e){for(n=0;n<o;++n)a[n]=i[n](e);return a}}function yb(e,t){var n=new Date;return e=+e,t=+t,function(r){return n.setTime(e*(1-r)+t*r),n}}function vb(e,t){return e=+e,t=+t,function(n){return e*(1-n)+t*n}}function gb(e,t){var n,r={},o={};for(n in null!==e&&"object"===typeof e||(e={}),null!==t&&"object"===typeof t||(t={}),t)n in e?r[n]=Ab(e[n],t[n]):o[n]=t[n];return function(e){for(n in r)o[n]=r[n](e);return o}}var bb=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,xb=new RegExp(bb.source,"g");function wb(e,t){var n,r,o,i=bb.lastIndex=xb.lastIndex=0,a=-1,l=[],s=[];for(e+="",t+="";(n=bb.exec(e))&&(r=xb.exec(t));)(o=r.index)>i&&(o=t.slice(i,o),l[a]?l[a]+=o:l[++a]=o),(n=n[0])===(r=r[0])?l[a]?l[a]+=r:l[++a]=r:(l[++a]=null,s.push({i:a,x:vb(n,r)})),i=xb.lastIndex;return i<t.length&&(o=t.slice(i),l[a]?l[a]+=o:l[++a]=o),l.length<2?s[0]?function(e){return function(t){return e(t)+""}}(s[0].x):function(e){return function(){return e}}(t):(t=s.length,function(e){for(var n,r=0;r<t;++r)l[(n=s[r]).i]=n.x(e);return l.join("")})}function Sb(e,t){t||(t=[]);var n,r=e?Math.min(t.length,e.length):0,o=t.slice();return function(i){for(n=0;n<r;++n)o[n]=e[n]*(1-i)+t[n]*i;return o}}function Ab(e,t){var n,r,o=typeof t;return null==t||"boolean"===o?ub(t):("number"===o?vb:"string"===o?(n=qg(t))?(t=n,pb):wb:t instanceof qg?pb:t instanceof Date?yb:(r=t,!ArrayBuffer.isView(r)||r instanceof DataView?Array.isArray(t)?mb:"function"!==typeof t.valueOf&&"function"!==typeof t.toString||isNaN(t)?gb:vb:Sb))(e,t)}function Ob(e,t){return e=+e,t=+t,function(n){return Math.round(e*(1-n)+t*n)}}function kb(e){return+e}var jb=[0,1];function Eb(e){return e}function Cb(e,t){return(t-=e=+e)?function(n){return(n-e)/t}:(n=isNaN(t)?NaN:.5,function(){return n});var n}function Pb(e,t,n){var r=e[0],o=e[1],i=t[0],a=t[1];return o<r?(r=Cb(o,r),i=n(a,i)):(r=Cb(r,o),i=n(i,a)),function(e){return i(r(e))}}function Mb(e,t,n){var r=Math.min(e.length,t.length)-1,o=new Array(r),i=new Array(r),a=-1;for(e[r]<e[0]&&(e=e.slice().reverse(),t=t.slice().reverse());++a<r;)o[a]=Cb(e[a],e[a+1]),i[a]=n(t[a],t[a+1]);return function(t){var n=Eg(e,t,1,r)-1;return i[n](o[n](t))}}function Tb(e,t){return t.domain(e.domain()).range(e.range()).interpolate(e.interpolate()).clamp(e.clamp()).unknown(e.unknown())}function _b(){var e,t,n,r,o,i,a=jb,l=jb,s=Ab,u=Eb;function c(){var e=Math.min(a.length,l.length);return u!==Eb&&(u=function(e,t){var n;return e>t&&(n=e,e=t,t=n),function(n){return Math.max(e,Math.min(t,n))}}(a[0],a[e-1])),r=e>2?Mb:Pb,o=i=null,d}function d(t){return null==t||isNaN(t=+t)?n:(o||(o=r(a.map(e),l,s)))(e(u(t)))}return d.invert=function(n){return u(t((i||(i=r(l,a.map(e),vb)))(n)))},d.domain=function(e){return arguments.length?(a=Array.from(e,kb),c()):a.slice()},d.range=function(e){return arguments.length?(l=Array.from(e),c()):l.slice()},d.rangeRound=function(e){return l=Array.from(e),s=Ob,c()},d.clamp=function(e){return arguments.length?(u=!!e||Eb,c()):u!==Eb},d.interpolate=function(e){return arguments.length?(s=e,c()):s},d.unknown=function(e){return arguments.length?(n=e,d):n},function(n,r){return e=n,t=r,c()}}function Rb(){return _b()(Eb,Eb)}var Nb,Ib=/^(?:(.)?([<>=^]))?([+\-( ])?([$#])?(0)?(\d+)?(,)?(\.\d+)?(~)?([a-z%])?$/i;function Db(e){if(!(t=Ib.exec(e)))throw new Error("invalid format: "+e);var t;return new Lb({fill:t[1],align:t[2],sign:t[3],symbol:t[4],zero:t[5],width:t[6],comma:t[7],precision:t[8]&&t[8].slice(1),trim:t[9],type:t[10]})}function Lb(e){this.fill=void 0===e.fill?" ":e.fill+"",this.align=void 0===e.align?">":e.align+"",this.sign=void 0===e.sign?"-":e.sign+"",this.symbol=void 0===e.symbol?"":e.symbol+"",this.zero=!!e.zero,this.width=void 0===e.width?void 0:+e.width,this.comma=!!e.comma,this.precision=void 0===e.precision?void 0:+e.precision,this.trim=!!e.trim,this.type=void 0===e.type?"":e.type+""}function zb(e,t){if((n=(e=t?e.toExponential(t-1):e.toExponential()).indexOf("e"))<0)return null;var n,r=e.slice(0,n);return[r.length>1?r[0]+r.slice(2):r,+e.slice(n+1)]}function $b(e){return(e=zb(Math.abs(e)))?e[1]:NaN}function Bb(e,t){var n=zb(e,t);if(!n)return e+"";var r=n[0],o=n[1];return o<0?"0."+new Array(-o).join("0")+r:r.length>o+1?r.slice(0,o+1)+"."+r.slice(o+1):r+new Array(o-r.length+2).join("0")}Db.prototype=Lb.prototype,Lb.prototype.toString=function(){return this.fill+this.align+this.sign+this.symbol+(this.zero?"0":"")+(void 0===this.width?"":Math.max(1,0|this.width))+(this.comma?",":"")+(void 0===this.precision?"":"."+Math.max(0,0|this.precision))+(this.trim?"~":"")+this.type};const Fb={"%":(e,t)=>(100*e).toFixed(t),b:e=>Math.round(e).toString(2),c:e=>e+"",d:function(e){return Math.abs(e=Math.round(e))>=1e21?e.toLocaleString("en").replace(/,/g,""):e.toString(10)},e:(e,t)=>e.toExponential(t),f:(e,t)=>e.toFixed(t),g:(e,t)=>e.toPrecision(t),o:e=>Math.round(e).toString(8),p:(e,t)=>Bb(100*e,t),r:Bb,s:function(e,t){var n=zb(e,t);if(!n)return e+"";var r=n[0],o=n[1],i=o-(Nb=3*Math.max(-8,Math.min(8,Math.floor(o/3))))+1,a=r.length;return i===a?r:i>a?r+new Array(i-a+1).join("0"):i>0?r.slice(0,i)+"."+r.slice(i):"0."+new Array(1-i).join("0")+zb(e,Math.max(0,t+i-1))[0]},X:e=>Math.round(e).toString(16).toUpperCase(),x:e=>Math.round(e).toString(16)};function Wb(e){return e}var Ub,Hb,Vb,qb=Array.prototype.map,Xb=["y","z","a","f","p","n","\xb5","m","","k","M","G","T","P","E","Z","Y"];function Kb(e){var t,n,r=void 0===e.grouping||void 0===e.thousands?Wb:(t=qb.call(e.grouping,Number),n=e.thousands+"",function(e,r){for(var o=e.length,i=[],a=0,l=t[0],s=0;o>0&&l>0&&(s+l+1>r&&(l=Math.max(1,r-s)),i.push(e.substring(o-=l,o+l)),!((s+=l+1)>r));)l=t[a=(a+1)%t.length];return i.reverse().join(n)}),o=void 0===e.currency?"":e.currency[0]+"",i=void 0===e.currency?"":e.currency[1]+"",a=void 0===e.decimal?".":e.decimal+"",l=void 0===e.numerals?Wb:function(e){return function(t){return t.replace(/[0-9]/g,(function(t){return e[+t]}))}}(qb.call(e.numerals,String)),s=void 0===e.percent?"%":e.percent+"",u=void 0===e.minus?"\u2212":e.minus+"",c=void 0===e.nan?"NaN":e.nan+"";function d(e){var t=(e=Db(e)).fill,n=e.align,d=e.sign,f=e.symbol,p=e.zero,h=e.width,m=e.comma,y=e.precision,v=e.trim,g=e.type;"n"===g?(m=!0,g="g"):Fb[g]||(void 0===y&&(y=12),v=!0,g="g"),(p||"0"===t&&"="===n)&&(p=!0,t="0",n="=");var b="$"===f?o:"#"===f&&/[boxX]/.test(g)?"0"+g.toLowerCase():"",x="$"===f?i:/[%p]/.test(g)?s:"",w=Fb[g],S=/[defgprs%]/.test(g);function A(e){var o,i,s,f=b,A=x;if("c"===g)A=w(e)+A,e="";else{var O=(e=+e)<0||1/e<0;if(e=isNaN(e)?c:w(Math.abs(e),y),v&&(e=function(e){e:for(var t,n=e.length,r=1,o=-1;r<n;++r)switch(e[r]){case".":o=t=r;break;case"0":0===o&&(o=r),t=r;break;default:if(!+e[r])break e;o>0&&(o=0)}return o>0?e.slice(0,o)+e.slice(t+1):e}(e)),O&&0===+e&&"+"!==d&&(O=!1),f=(O?"("===d?d:u:"-"===d||"("===d?"":d)+f,A=("s"===g?Xb[8+Nb/3]:"")+A+(O&&"("===d?")":""),S)for(o=-1,i=e.length;++o<i;)if(48>(s=e.charCodeAt(o))||s>57){A=(46===s?a+e.slice(o+1):e.slice(o))+A,e=e.slice(0,o);break}}m&&!p&&(e=r(e,1/0));var k=f.length+e.length+A.length,j=k<h?new Array(h-k+1).join(t):"";switch(m&&p&&(e=r(j+e,j.length?h-A.length:1/0),j=""),n){case"<":e=f+e+A+j;break;case"=":e=f+j+e+A;break;case"^":e=j.slice(0,k=j.length>>1)+f+e+A+j.slice(k);break;default:e=j+f+e+A}return l(e)}return y=void 0===y?6:/[gprs]/.test(g)?Math.max(1,Math.min(21,y)):Math.max(0,Math.min(20,y)),A.toString=function(){return e+""},A}return{format:d,formatPrefix:function(e,t){var n=d(((e=Db(e)).type="f",e)),r=3*Math.max(-8,Math.min(8,Math.floor($b(t)/3))),o=Math.pow(10,-r),i=Xb[8+r/3];return function(e){return n(o*e)+i}}}}function Gb(e,t,n,r){var o,i=bg(e,t,n);switch((r=Db(null==r?",f":r)).type){case"s":var a=Math.max(Math.abs(e),Math.abs(t));return null!=r.precision||isNaN(o=function(e,t){return Math.max(0,3*Math.max(-8,Math.min(8,Math.floor($b(t)/3)))-$b(Math.abs(e)))}(i,a))||(r.precision=o),Vb(r,a);case"":case"e":case"g":case"p":case"r":null!=r.precision||isNaN(o=function(e,t){return e=Math.abs(e),t=Math.abs(t)-e,Math.max(0,$b(t)-$b(e))+1}(i,Math.max(Math.abs(e),Math.abs(t))))||(r.precision=o-("e"===r.type));break;case"f":case"%":null!=r.precision||isNaN(o=function(e){return Math.max(0,-$b(Math.abs(e)))}(i))||(r.precision=o-2*("%"===r.type))}return Hb(r)}function Yb(e){var t=e.domain;return e.ticks=function(e){var n=t();return vg(n[0],n[n.length-1],null==e?10:e)},e.tickFormat=function(e,n){var r=t();return Gb(r[0],r[r.length-1],null==e?10:e,n)},e.nice=function(n){null==n&&(n=10);var r,o,i=t(),a=0,l=i.length-1,s=i[a],u=i[l],c=10;for(u<s&&(o=s,s=u,u=o,o=a,a=l,l=o);c-- >0;){if((o=gg(s,u,n))===r)return i[a]=s,i[l]=u,t(i);if(o>0)s=Math.floor(s/o)*o,u=Math.ceil(u/o)*o;else{if(!(o<0))break;s=Math.ceil(s*o)/o,u=Math.floor(u*o)/o}r=o}return e},e}function Qb(){var e=Rb();return e.copy=function(){return Tb(e,Qb())},gv.apply(e,arguments),Yb(e)}function Jb(e){var t;function n(e){return null==e||isNaN(e=+e)?t:e}return n.invert=n,n.domain=n.range=function(t){return arguments.length?(e=Array.from(t,kb),n):e.slice()},n.unknown=function(e){return arguments.length?(t=e,n):t},n.copy=function(){return Jb(e).unknown(t)},e=arguments.length?Array.from(e,kb):[0,1],Yb(n)}function Zb(e,t){var n,r=0,o=(e=e.slice()).length-1,i=e[r],a=e[o];return a<i&&(n=r,r=o,o=n,n=i,i=a,a=n),e[r]=t.floor(i),e[o]=t.ceil(a),e}function ex(e){return Math.log(e)}function tx(e){return Math.exp(e)}function nx(e){return-Math.log(-e)}function rx(e){return-Math.exp(-e)}function ox(e){return isFinite(e)?+("1e"+e):e<0?0:e}function ix(e){return(t,n)=>-e(-t,n)}function ax(e){const t=e(ex,tx),n=t.domain;let r,o,i=10;function a(){return r=function(e){return e===Math.E?Math.log:10===e&&Math.log10||2===e&&Math.log2||(e=Math.log(e),t=>Math.log(t)/e)}(i),o=function(e){return 10===e?ox:e===Math.E?Math.exp:t=>Math.pow(e,t)}(i),n()[0]<0?(r=ix(r),o=ix(o),e(nx,rx)):e(ex,tx),t}return t.base=function(e){return arguments.length?(i=+e,a()):i},t.domain=function(e){return arguments.length?(n(e),a()):n()},t.ticks=e=>{const t=n();let a=t[0],l=t[t.length-1];const s=l<a;s&&([a,l]=[l,a]);let u,c,d=r(a),f=r(l);const p=null==e?10:+e;let h=[];if(!(i%1)&&f-d<p){if(d=Math.floor(d),f=Math.ceil(f),a>0){for(;d<=f;++d)for(u=1;u<i;++u)if(c=d<0?u/o(-d):u*o(d),!(c<a)){if(c>l)break;h.push(c)}}else for(;d<=f;++d)for(u=i-1;u>=1;--u)if(c=d>0?u/o(-d):u*o(d),!(c<a)){if(c>l)break;h.push(c)}2*h.length<p&&(h=vg(a,l,p))}else h=vg(d,f,Math.min(f-d,p)).map(o);return s?h.reverse():h},t.tickFormat=(e,n)=>{if(null==e&&(e=10),null==n&&(n=10===i?"s":","),"function"!==typeof n&&(i%1||null!=(n=Db(n)).precision||(n.trim=!0),n=Hb(n)),e===1/0)return n;const a=Math.max(1,i*e/t.ticks().length);return e=>{let t=e/o(Math.round(r(e)));return t*i<i-.5&&(t*=i),t<=a?n(e):""}},t.nice=()=>n(Zb(n(),{floor:e=>o(Math.floor(r(e))),ceil:e=>o(Math.ceil(r(e)))})),t}function lx(){const e=ax(_b()).domain([1,10]);return e.copy=()=>Tb(e,lx()).base(e.base()),gv.apply(e,arguments),e}function sx(e){return function(t){return Math.sign(t)*Math.log1p(Math.abs(t/e))}}function ux(e){return function(t){return Math.sign(t)*Math.expm1(Math.abs(t))*e}}function cx(e){var t=1,n=e(sx(t),ux(t));return n.constant=function(n){return arguments.length?e(sx(t=+n),ux(t)):t},Yb(n)}function dx(){var e=cx(_b());return e.copy=function(){return Tb(e,dx()).constant(e.constant())},gv.apply(e,arguments)}function fx(e){return function(t){return t<0?-Math.pow(-t,e):Math.pow(t,e)}}function px(e){return e<0?-Math.sqrt(-e):Math.sqrt(e)}function hx(e){return e<0?-e*e:e*e}function mx(e){var t=e(Eb,Eb),n=1;return t.exponent=function(t){return arguments.length?1===(n=+t)?e(Eb,Eb):.5===n?e(px,hx):e(fx(n),fx(1/n)):n},Yb(t)}function yx(){var e=mx(_b());return e.copy=function(){return Tb(e,yx()).exponent(e.exponent())},gv.apply(e,arguments),e}function vx(){return yx.apply(null,arguments).exponent(.5)}function gx(e){return Math.sign(e)*e*e}function bx(){var e,t=Rb(),n=[0,1],r=!1;function o(n){var o=function(e){return Math.sign(e)*Math.sqrt(Math.abs(e))}(t(n));return isNaN(o)?e:r?Math.round(o):o}return o.invert=function(e){return t.invert(gx(e))},o.domain=function(e){return arguments.length?(t.domain(e),o):t.domain()},o.range=function(e){return arguments.length?(t.range((n=Array.from(e,kb)).map(gx)),o):n.slice()},o.rangeRound=function(e){return o.range(e).round(!0)},o.round=function(e){return arguments.length?(r=!!e,o):r},o.clamp=function(e){return arguments.length?(t.clamp(e),o):t.clamp()},o.unknown=function(t){return arguments.length?(e=t,o):e},o.copy=function(){return bx(t.domain(),n).round(r).clamp(t.clamp()).unknown(e)},gv.apply(o,arguments),Yb(o)}function xx(e,t){let n;if(void 0===t)for(const r of e)null!=r&&(n<r||void 0===n&&r>=r)&&(n=r);else{let r=-1;for(let o of e)null!=(o=t(o,++r,e))&&(n<o||void 0===n&&o>=o)&&(n=o)}return n}function wx(e,t){let n;if(void 0===t)for(const r of e)null!=r&&(n>r||void 0===n&&r>=r)&&(n=r);else{let r=-1;for(let o of e)null!=(o=t(o,++r,e))&&(n>o||void 0===n&&o>=o)&&(n=o)}return n}function Sx(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:xg;if(e===xg)return Ax;if("function"!==typeof e)throw new TypeError("compare is not a function");return(t,n)=>{const r=e(t,n);return r||0===r?r:(0===e(n,n))-(0===e(t,t))}}function Ax(e,t){return(null==e||!(e>=e))-(null==t||!(t>=t))||(e<t?-1:e>t?1:0)}function Ox(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:1/0,o=arguments.length>4?arguments[4]:void 0;if(t=Math.floor(t),n=Math.floor(Math.max(0,n)),r=Math.floor(Math.min(e.length-1,r)),!(n<=t&&t<=r))return e;for(o=void 0===o?Ax:Sx(o);r>n;){if(r-n>600){const i=r-n+1,a=t-n+1,l=Math.log(i),s=.5*Math.exp(2*l/3),u=.5*Math.sqrt(l*s*(i-s)/i)*(a-i/2<0?-1:1);Ox(e,t,Math.max(n,Math.floor(t-a*s/i+u)),Math.min(r,Math.floor(t+(i-a)*s/i+u)),o)}const i=e[t];let a=n,l=r;for(kx(e,n,t),o(e[r],i)>0&&kx(e,n,r);a<l;){for(kx(e,a,l),++a,--l;o(e[a],i)<0;)++a;for(;o(e[l],i)>0;)--l}0===o(e[n],i)?kx(e,n,l):(++l,kx(e,l,r)),l<=t&&(n=l+1),t<=l&&(r=l-1)}return e}function kx(e,t,n){const r=e[t];e[t]=e[n],e[n]=r}function jx(e,t,n){if(e=Float64Array.from(function*(e,t){if(void 0===t)for(let n of e)null!=n&&(n=+n)>=n&&(yield n);else{let n=-1;for(let r of e)null!=(r=t(r,++n,e))&&(r=+r)>=r&&(yield r)}}(e,n)),(r=e.length)&&!isNaN(t=+t)){if(t<=0||r<2)return wx(e);if(t>=1)return xx(e);var r,o=(r-1)*t,i=Math.floor(o),a=xx(Ox(e,i).subarray(0,i+1));return a+(wx(e.subarray(i+1))-a)*(o-i)}}function Ex(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:Og;if((r=e.length)&&!isNaN(t=+t)){if(t<=0||r<2)return+n(e[0],0,e);if(t>=1)return+n(e[r-1],r-1,e);var r,o=(r-1)*t,i=Math.floor(o),a=+n(e[i],i,e);return a+(+n(e[i+1],i+1,e)-a)*(o-i)}}function Cx(){var e,t=[],n=[],r=[];function o(){var e=0,o=Math.max(1,n.length);for(r=new Array(o-1);++e<o;)r[e-1]=Ex(t,e/o);return i}function i(t){return null==t||isNaN(t=+t)?e:n[Eg(r,t)]}return i.invertExtent=function(e){var o=n.indexOf(e);return o<0?[NaN,NaN]:[o>0?r[o-1]:t[0],o<r.length?r[o]:t[t.length-1]]},i.domain=function(e){if(!arguments.length)return t.slice();t=[];for(let n of e)null==n||isNaN(n=+n)||t.push(n);return t.sort(xg),o()},i.range=function(e){return arguments.length?(n=Array.from(e),o()):n.slice()},i.unknown=function(t){return arguments.length?(e=t,i):e},i.quantiles=function(){return r.slice()},i.copy=function(){return Cx().domain(t).range(n).unknown(e)},gv.apply(i,arguments)}function Px(){var e,t=0,n=1,r=1,o=[.5],i=[0,1];function a(t){return null!=t&&t<=t?i[Eg(o,t,0,r)]:e}function l(){var e=-1;for(o=new Array(r);++e<r;)o[e]=((e+1)*n-(e-r)*t)/(r+1);return a}return a.domain=function(e){return arguments.length?([t,n]=e,t=+t,n=+n,l()):[t,n]},a.range=function(e){return arguments.length?(r=(i=Array.from(e)).length-1,l()):i.slice()},a.invertExtent=function(e){var a=i.indexOf(e);return a<0?[NaN,NaN]:a<1?[t,o[0]]:a>=r?[o[r-1],n]:[o[a-1],o[a]]},a.unknown=function(t){return arguments.length?(e=t,a):a},a.thresholds=function(){return o.slice()},a.copy=function(){return Px().domain([t,n]).range(i).unknown(e)},gv.apply(Yb(a),arguments)}function Mx(){var e,t=[.5],n=[0,1],r=1;function o(o){return null!=o&&o<=o?n[Eg(t,o,0,r)]:e}return o.domain=function(e){return arguments.length?(t=Array.from(e),r=Math.min(t.length,n.length-1),o):t.slice()},o.range=function(e){return arguments.length?(n=Array.from(e),r=Math.min(t.length,n.length-1),o):n.slice()},o.invertExtent=function(e){var r=n.indexOf(e);return[t[r-1],t[r]]},o.unknown=function(t){return arguments.length?(e=t,o):e},o.copy=function(){return Mx().domain(t).range(n).unknown(e)},gv.apply(o,arguments)}Ub=Kb({thousands:",",grouping:[3],currency:["$",""]}),Hb=Ub.format,Vb=Ub.formatPrefix;const Tx=1e3,_x=6e4,Rx=36e5,Nx=864e5,Ix=6048e5,Dx=2592e6,Lx=31536e6,zx=new Date,$x=new Date;function Bx(e,t,n,r){function o(t){return e(t=0===arguments.length?new Date:new Date(+t)),t}return o.floor=t=>(e(t=new Date(+t)),t),o.ceil=n=>(e(n=new Date(n-1)),t(n,1),e(n),n),o.round=e=>{const t=o(e),n=o.ceil(e);return e-t<n-e?t:n},o.offset=(e,n)=>(t(e=new Date(+e),null==n?1:Math.floor(n)),e),o.range=(n,r,i)=>{const a=[];if(n=o.ceil(n),i=null==i?1:Math.floor(i),!(n<r)||!(i>0))return a;let l;do{a.push(l=new Date(+n)),t(n,i),e(n)}while(l<n&&n<r);return a},o.filter=n=>Bx((t=>{if(t>=t)for(;e(t),!n(t);)t.setTime(t-1)}),((e,r)=>{if(e>=e)if(r<0)for(;++r<=0;)for(;t(e,-1),!n(e););else for(;--r>=0;)for(;t(e,1),!n(e););})),n&&(o.count=(t,r)=>(zx.setTime(+t),$x.setTime(+r),e(zx),e($x),Math.floor(n(zx,$x))),o.every=e=>(e=Math.floor(e),isFinite(e)&&e>0?e>1?o.filter(r?t=>r(t)%e===0:t=>o.count(0,t)%e===0):o:null)),o}const Fx=Bx((()=>{}),((e,t)=>{e.setTime(+e+t)}),((e,t)=>t-e));Fx.every=e=>(e=Math.floor(e),isFinite(e)&&e>0?e>1?Bx((t=>{t.setTime(Math.floor(t/e)*e)}),((t,n)=>{t.setTime(+t+n*e)}),((t,n)=>(n-t)/e)):Fx:null);Fx.range;const Wx=Bx((e=>{e.setTime(e-e.getMilliseconds())}),((e,t)=>{e.setTime(+e+t*Tx)}),((e,t)=>(t-e)/Tx),(e=>e.getUTCSeconds())),Ux=(Wx.range,Bx((e=>{e.setTime(e-e.getMilliseconds()-e.getSeconds()*Tx)}),((e,t)=>{e.setTime(+e+t*_x)}),((e,t)=>(t-e)/_x),(e=>e.getMinutes()))),Hx=(Ux.range,Bx((e=>{e.setUTCSeconds(0,0)}),((e,t)=>{e.setTime(+e+t*_x)}),((e,t)=>(t-e)/_x),(e=>e.getUTCMinutes()))),Vx=(Hx.range,Bx((e=>{e.setTime(e-e.getMilliseconds()-e.getSeconds()*Tx-e.getMinutes()*_x)}),((e,t)=>{e.setTime(+e+t*Rx)}),((e,t)=>(t-e)/Rx),(e=>e.getHours()))),qx=(Vx.range,Bx((e=>{e.setUTCMinutes(0,0,0)}),((e,t)=>{e.setTime(+e+t*Rx)}),((e,t)=>(t-e)/Rx),(e=>e.getUTCHours()))),Xx=(qx.range,Bx((e=>e.setHours(0,0,0,0)),((e,t)=>e.setDate(e.getDate()+t)),((e,t)=>(t-e-(t.getTimezoneOffset()-e.getTimezoneOffset())*_x)/Nx),(e=>e.getDate()-1))),Kx=(Xx.range,Bx((e=>{e.setUTCHours(0,0,0,0)}),((e,t)=>{e.setUTCDate(e.getUTCDate()+t)}),((e,t)=>(t-e)/Nx),(e=>e.getUTCDate()-1))),Gx=(Kx.range,Bx((e=>{e.setUTCHours(0,0,0,0)}),((e,t)=>{e.setUTCDate(e.getUTCDate()+t)}),((e,t)=>(t-e)/Nx),(e=>Math.floor(e/Nx))));Gx.range;function Yx(e){return Bx((t=>{t.setDate(t.getDate()-(t.getDay()+7-e)%7),t.setHours(0,0,0,0)}),((e,t)=>{e.setDate(e.getDate()+7*t)}),((e,t)=>(t-e-(t.getTimezoneOffset()-e.getTimezoneOffset())*_x)/Ix))}const Qx=Yx(0),Jx=Yx(1),Zx=Yx(2),ew=Yx(3),tw=Yx(4),nw=Yx(5),rw=Yx(6);Qx.range,Jx.range,Zx.range,ew.range,tw.range,nw.range,rw.range;function ow(e){return Bx((t=>{t.setUTCDate(t.getUTCDate()-(t.getUTCDay()+7-e)%7),t.setUTCHours(0,0,0,0)}),((e,t)=>{e.setUTCDate(e.getUTCDate()+7*t)}),((e,t)=>(t-e)/Ix))}const iw=ow(0),aw=ow(1),lw=ow(2),sw=ow(3),uw=ow(4),cw=ow(5),dw=ow(6),fw=(iw.range,aw.range,lw.range,sw.range,uw.range,cw.range,dw.range,Bx((e=>{e.setDate(1),e.setHours(0,0,0,0)}),((e,t)=>{e.setMonth(e.getMonth()+t)}),((e,t)=>t.getMonth()-e.getMonth()+12*(t.getFullYear()-e.getFullYear())),(e=>e.getMonth()))),pw=(fw.range,Bx((e=>{e.setUTCDate(1),e.setUTCHours(0,0,0,0)}),((e,t)=>{e.setUTCMonth(e.getUTCMonth()+t)}),((e,t)=>t.getUTCMonth()-e.getUTCMonth()+12*(t.getUTCFullYear()-e.getUTCFullYear())),(e=>e.getUTCMonth()))),hw=(pw.range,Bx((e=>{e.setMonth(0,1),e.setHours(0,0,0,0)}),((e,t)=>{e.setFullYear(e.getFullYear()+t)}),((e,t)=>t.getFullYear()-e.getFullYear()),(e=>e.getFullYear())));hw.every=e=>isFinite(e=Math.floor(e))&&e>0?Bx((t=>{t.setFullYear(Math.floor(t.getFullYear()/e)*e),t.setMonth(0,1),t.setHours(0,0,0,0)}),((t,n)=>{t.setFullYear(t.getFullYear()+n*e)})):null;hw.range;const mw=Bx((e=>{e.setUTCMonth(0,1),e.setUTCHours(0,0,0,0)}),((e,t)=>{e.setUTCFullYear(e.getUTCFullYear()+t)}),((e,t)=>t.getUTCFullYear()-e.getUTCFullYear()),(e=>e.getUTCFullYear()));mw.every=e=>isFinite(e=Math.floor(e))&&e>0?Bx((t=>{t.setUTCFullYear(Math.floor(t.getUTCFullYear()/e)*e),t.setUTCMonth(0,1),t.setUTCHours(0,0,0,0)}),((t,n)=>{t.setUTCFullYear(t.getUTCFullYear()+n*e)})):null;mw.range;function yw(e,t,n,r,o,i){const a=[[Wx,1,Tx],[Wx,5,5e3],[Wx,15,15e3],[Wx,30,3e4],[i,1,_x],[i,5,3e5],[i,15,9e5],[i,30,18e5],[o,1,Rx],[o,3,108e5],[o,6,216e5],[o,12,432e5],[r,1,Nx],[r,2,1728e5],[n,1,Ix],[t,1,Dx],[t,3,7776e6],[e,1,Lx]];function l(t,n,r){const o=Math.abs(n-t)/r,i=Sg((e=>{let[,,t]=e;return t})).right(a,o);if(i===a.length)return e.every(bg(t/Lx,n/Lx,r));if(0===i)return Fx.every(Math.max(bg(t,n,r),1));const[l,s]=a[o/a[i-1][2]<a[i][2]/o?i-1:i];return l.every(s)}return[function(e,t,n){const r=t<e;r&&([e,t]=[t,e]);const o=n&&"function"===typeof n.range?n:l(e,t,n),i=o?o.range(e,+t+1):[];return r?i.reverse():i},l]}const[vw,gw]=yw(mw,pw,iw,Gx,qx,Hx),[bw,xw]=yw(hw,fw,Qx,Xx,Vx,Ux);function ww(e){if(0<=e.y&&e.y<100){var t=new Date(-1,e.m,e.d,e.H,e.M,e.S,e.L);return t.setFullYear(e.y),t}return new Date(e.y,e.m,e.d,e.H,e.M,e.S,e.L)}function Sw(e){if(0<=e.y&&e.y<100){var t=new Date(Date.UTC(-1,e.m,e.d,e.H,e.M,e.S,e.L));return t.setUTCFullYear(e.y),t}return new Date(Date.UTC(e.y,e.m,e.d,e.H,e.M,e.S,e.L))}function Aw(e,t,n){return{y:e,m:t,d:n,H:0,M:0,S:0,L:0}}var Ow,kw,jw,Ew={"-":"",_:" ",0:"0"},Cw=/^\s*\d+/,Pw=/^%/,Mw=/[\\^$*+?|[\]().{}]/g;function Tw(e,t,n){var r=e<0?"-":"",o=(r?-e:e)+"",i=o.length;return r+(i<n?new Array(n-i+1).join(t)+o:o)}function _w(e){return e.replace(Mw,"\\$&")}function Rw(e){return new RegExp("^(?:"+e.map(_w).join("|")+")","i")}function Nw(e){return new Map(e.map(((e,t)=>[e.toLowerCase(),t])))}function Iw(e,t,n){var r=Cw.exec(t.slice(n,n+1));return r?(e.w=+r[0],n+r[0].length):-1}function Dw(e,t,n){var r=Cw.exec(t.slice(n,n+1));return r?(e.u=+r[0],n+r[0].length):-1}function Lw(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.U=+r[0],n+r[0].length):-1}function zw(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.V=+r[0],n+r[0].length):-1}function $w(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.W=+r[0],n+r[0].length):-1}function Bw(e,t,n){var r=Cw.exec(t.slice(n,n+4));return r?(e.y=+r[0],n+r[0].length):-1}function Fw(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.y=+r[0]+(+r[0]>68?1900:2e3),n+r[0].length):-1}function Ww(e,t,n){var r=/^(Z)|([+-]\d\d)(?::?(\d\d))?/.exec(t.slice(n,n+6));return r?(e.Z=r[1]?0:-(r[2]+(r[3]||"00")),n+r[0].length):-1}function Uw(e,t,n){var r=Cw.exec(t.slice(n,n+1));return r?(e.q=3*r[0]-3,n+r[0].length):-1}function Hw(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.m=r[0]-1,n+r[0].length):-1}function Vw(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.d=+r[0],n+r[0].length):-1}function qw(e,t,n){var r=Cw.exec(t.slice(n,n+3));return r?(e.m=0,e.d=+r[0],n+r[0].length):-1}function Xw(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.H=+r[0],n+r[0].length):-1}function Kw(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.M=+r[0],n+r[0].length):-1}function Gw(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.S=+r[0],n+r[0].length):-1}function Yw(e,t,n){var r=Cw.exec(t.slice(n,n+3));return r?(e.L=+r[0],n+r[0].length):-1}function Qw(e,t,n){var r=Cw.exec(t.slice(n,n+6));return r?(e.L=Math.floor(r[0]/1e3),n+r[0].length):-1}function Jw(e,t,n){var r=Pw.exec(t.slice(n,n+1));return r?n+r[0].length:-1}function Zw(e,t,n){var r=Cw.exec(t.slice(n));return r?(e.Q=+r[0],n+r[0].length):-1}function eS(e,t,n){var r=Cw.exec(t.slice(n));return r?(e.s=+r[0],n+r[0].length):-1}function tS(e,t){return Tw(e.getDate(),t,2)}function nS(e,t){return Tw(e.getHours(),t,2)}function rS(e,t){return Tw(e.getHours()%12||12,t,2)}function oS(e,t){return Tw(1+Xx.count(hw(e),e),t,3)}function iS(e,t){return Tw(e.getMilliseconds(),t,3)}function aS(e,t){return iS(e,t)+"000"}function lS(e,t){return Tw(e.getMonth()+1,t,2)}function sS(e,t){return Tw(e.getMinutes(),t,2)}function uS(e,t){return Tw(e.getSeconds(),t,2)}function cS(e){var t=e.getDay();return 0===t?7:t}function dS(e,t){return Tw(Qx.count(hw(e)-1,e),t,2)}function fS(e){var t=e.getDay();return t>=4||0===t?tw(e):tw.ceil(e)}function pS(e,t){return e=fS(e),Tw(tw.count(hw(e),e)+(4===hw(e).getDay()),t,2)}function hS(e){return e.getDay()}function mS(e,t){return Tw(Jx.count(hw(e)-1,e),t,2)}function yS(e,t){return Tw(e.getFullYear()%100,t,2)}function vS(e,t){return Tw((e=fS(e)).getFullYear()%100,t,2)}function gS(e,t){return Tw(e.getFullYear()%1e4,t,4)}function bS(e,t){var n=e.getDay();return Tw((e=n>=4||0===n?tw(e):tw.ceil(e)).getFullYear()%1e4,t,4)}function xS(e){var t=e.getTimezoneOffset();return(t>0?"-":(t*=-1,"+"))+Tw(t/60|0,"0",2)+Tw(t%60,"0",2)}function wS(e,t){return Tw(e.getUTCDate(),t,2)}function SS(e,t){return Tw(e.getUTCHours(),t,2)}function AS(e,t){return Tw(e.getUTCHours()%12||12,t,2)}function OS(e,t){return Tw(1+Kx.count(mw(e),e),t,3)}function kS(e,t){return Tw(e.getUTCMilliseconds(),t,3)}function jS(e,t){return kS(e,t)+"000"}function ES(e,t){return Tw(e.getUTCMonth()+1,t,2)}function CS(e,t){return Tw(e.getUTCMinutes(),t,2)}function PS(e,t){return Tw(e.getUTCSeconds(),t,2)}function MS(e){var t=e.getUTCDay();return 0===t?7:t}function TS(e,t){return Tw(iw.count(mw(e)-1,e),t,2)}function _S(e){var t=e.getUTCDay();return t>=4||0===t?uw(e):uw.ceil(e)}function RS(e,t){return e=_S(e),Tw(uw.count(mw(e),e)+(4===mw(e).getUTCDay()),t,2)}function NS(e){return e.getUTCDay()}function IS(e,t){return Tw(aw.count(mw(e)-1,e),t,2)}function DS(e,t){return Tw(e.getUTCFullYear()%100,t,2)}function LS(e,t){return Tw((e=_S(e)).getUTCFullYear()%100,t,2)}function zS(e,t){return Tw(e.getUTCFullYear()%1e4,t,4)}function $S(e,t){var n=e.getUTCDay();return Tw((e=n>=4||0===n?uw(e):uw.ceil(e)).getUTCFullYear()%1e4,t,4)}function BS(){return"+0000"}function FS(){return"%"}function WS(e){return+e}function US(e){return Math.floor(+e/1e3)}function HS(e){return new Date(e)}function VS(e){return e instanceof Date?+e:+new Date(+e)}function qS(e,t,n,r,o,i,a,l,s,u){var c=Rb(),d=c.invert,f=c.domain,p=u(".%L"),h=u(":%S"),m=u("%I:%M"),y=u("%I %p"),v=u("%a %d"),g=u("%b %d"),b=u("%B"),x=u("%Y");function w(e){return(s(e)<e?p:l(e)<e?h:a(e)<e?m:i(e)<e?y:r(e)<e?o(e)<e?v:g:n(e)<e?b:x)(e)}return c.invert=function(e){return new Date(d(e))},c.domain=function(e){return arguments.length?f(Array.from(e,VS)):f().map(HS)},c.ticks=function(t){var n=f();return e(n[0],n[n.length-1],null==t?10:t)},c.tickFormat=function(e,t){return null==t?w:u(t)},c.nice=function(e){var n=f();return e&&"function"===typeof e.range||(e=t(n[0],n[n.length-1],null==e?10:e)),e?f(Zb(n,e)):c},c.copy=function(){return Tb(c,qS(e,t,n,r,o,i,a,l,s,u))},c}function XS(){return gv.apply(qS(bw,xw,hw,fw,Qx,Xx,Vx,Ux,Wx,kw).domain([new Date(2e3,0,1),new Date(2e3,0,2)]),arguments)}function KS(){return gv.apply(qS(vw,gw,mw,pw,iw,Kx,qx,Hx,Wx,jw).domain([Date.UTC(2e3,0,1),Date.UTC(2e3,0,2)]),arguments)}function GS(){var e,t,n,r,o,i=0,a=1,l=Eb,s=!1;function u(t){return null==t||isNaN(t=+t)?o:l(0===n?.5:(t=(r(t)-e)*n,s?Math.max(0,Math.min(1,t)):t))}function c(e){return function(t){var n,r;return arguments.length?([n,r]=t,l=e(n,r),u):[l(0),l(1)]}}return u.domain=function(o){return arguments.length?([i,a]=o,e=r(i=+i),t=r(a=+a),n=e===t?0:1/(t-e),u):[i,a]},u.clamp=function(e){return arguments.length?(s=!!e,u):s},u.interpolator=function(e){return arguments.length?(l=e,u):l},u.range=c(Ab),u.rangeRound=c(Ob),u.unknown=function(e){return arguments.length?(o=e,u):o},function(o){return r=o,e=o(i),t=o(a),n=e===t?0:1/(t-e),u}}function YS(e,t){return t.domain(e.domain()).interpolator(e.interpolator()).clamp(e.clamp()).unknown(e.unknown())}function QS(){var e=Yb(GS()(Eb));return e.copy=function(){return YS(e,QS())},bv.apply(e,arguments)}function JS(){var e=ax(GS()).domain([1,10]);return e.copy=function(){return YS(e,JS()).base(e.base())},bv.apply(e,arguments)}function ZS(){var e=cx(GS());return e.copy=function(){return YS(e,ZS()).constant(e.constant())},bv.apply(e,arguments)}function eA(){var e=mx(GS());return e.copy=function(){return YS(e,eA()).exponent(e.exponent())},bv.apply(e,arguments)}function tA(){return eA.apply(null,arguments).exponent(.5)}function nA(){var e=[],t=Eb;function n(n){if(null!=n&&!isNaN(n=+n))return t((Eg(e,n,1)-1)/(e.length-1))}return n.domain=function(t){if(!arguments.length)return e.slice();e=[];for(let n of t)null==n||isNaN(n=+n)||e.push(n);return e.sort(xg),n},n.interpolator=function(e){return arguments.length?(t=e,n):t},n.range=function(){return e.map(((n,r)=>t(r/(e.length-1))))},n.quantiles=function(t){return Array.from({length:t+1},((n,r)=>jx(e,r/t)))},n.copy=function(){return nA(t).domain(e)},bv.apply(n,arguments)}function rA(){var e,t,n,r,o,i,a,l=0,s=.5,u=1,c=1,d=Eb,f=!1;function p(e){return isNaN(e=+e)?a:(e=.5+((e=+i(e))-t)*(c*e<c*t?r:o),d(f?Math.max(0,Math.min(1,e)):e))}function h(e){return function(t){var n,r,o;return arguments.length?([n,r,o]=t,d=function(e,t){void 0===t&&(t=e,e=Ab);for(var n=0,r=t.length-1,o=t[0],i=new Array(r<0?0:r);n<r;)i[n]=e(o,o=t[++n]);return function(e){var t=Math.max(0,Math.min(r-1,Math.floor(e*=r)));return i[t](e-t)}}(e,[n,r,o]),p):[d(0),d(.5),d(1)]}}return p.domain=function(a){return arguments.length?([l,s,u]=a,e=i(l=+l),t=i(s=+s),n=i(u=+u),r=e===t?0:.5/(t-e),o=t===n?0:.5/(n-t),c=t<e?-1:1,p):[l,s,u]},p.clamp=function(e){return arguments.length?(f=!!e,p):f},p.interpolator=function(e){return arguments.length?(d=e,p):d},p.range=h(Ab),p.rangeRound=h(Ob),p.unknown=function(e){return arguments.length?(a=e,p):a},function(a){return i=a,e=a(l),t=a(s),n=a(u),r=e===t?0:.5/(t-e),o=t===n?0:.5/(n-t),c=t<e?-1:1,p}}function oA(){var e=Yb(rA()(Eb));return e.copy=function(){return YS(e,oA())},bv.apply(e,arguments)}function iA(){var e=ax(rA()).domain([.1,1,10]);return e.copy=function(){return YS(e,iA()).base(e.base())},bv.apply(e,arguments)}function aA(){var e=cx(rA());return e.copy=function(){return YS(e,aA()).constant(e.constant())},bv.apply(e,arguments)}function lA(){var e=mx(rA());return e.copy=function(){return YS(e,lA()).exponent(e.exponent())},bv.apply(e,arguments)}function sA(){return lA.apply(null,arguments).exponent(.5)}function uA(e,t){if((o=e.length)>1)for(var n,r,o,i=1,a=e[t[0]],l=a.length;i<o;++i)for(r=a,a=e[t[i]],n=0;n<l;++n)a[n][1]+=a[n][0]=isNaN(r[n][1])?r[n][0]:r[n][1]}!function(e){Ow=function(e){var t=e.dateTime,n=e.date,r=e.time,o=e.periods,i=e.days,a=e.shortDays,l=e.months,s=e.shortMonths,u=Rw(o),c=Nw(o),d=Rw(i),f=Nw(i),p=Rw(a),h=Nw(a),m=Rw(l),y=Nw(l),v=Rw(s),g=Nw(s),b={a:function(e){return a[e.getDay()]},A:function(e){return i[e.getDay()]},b:function(e){return s[e.getMonth()]},B:function(e){return l[e.getMonth()]},c:null,d:tS,e:tS,f:aS,g:vS,G:bS,H:nS,I:rS,j:oS,L:iS,m:lS,M:sS,p:function(e){return o[+(e.getHours()>=12)]},q:function(e){return 1+~~(e.getMonth()/3)},Q:WS,s:US,S:uS,u:cS,U:dS,V:pS,w:hS,W:mS,x:null,X:null,y:yS,Y:gS,Z:xS,"%":FS},x={a:function(e){return a[e.getUTCDay()]},A:function(e){return i[e.getUTCDay()]},b:function(e){return s[e.getUTCMonth()]},B:function(e){return l[e.getUTCMonth()]},c:null,d:wS,e:wS,f:jS,g:LS,G:$S,H:SS,I:AS,j:OS,L:kS,m:ES,M:CS,p:function(e){return o[+(e.getUTCHours()>=12)]},q:function(e){return 1+~~(e.getUTCMonth()/3)},Q:WS,s:US,S:PS,u:MS,U:TS,V:RS,w:NS,W:IS,x:null,X:null,y:DS,Y:zS,Z:BS,"%":FS},w={a:function(e,t,n){var r=p.exec(t.slice(n));return r?(e.w=h.get(r[0].toLowerCase()),n+r[0].length):-1},A:function(e,t,n){var r=d.exec(t.slice(n));return r?(e.w=f.get(r[0].toLowerCase()),n+r[0].length):-1},b:function(e,t,n){var r=v.exec(t.slice(n));return r?(e.m=g.get(r[0].toLowerCase()),n+r[0].length):-1},B:function(e,t,n){var r=m.exec(t.slice(n));return r?(e.m=y.get(r[0].toLowerCase()),n+r[0].length):-1},c:function(e,n,r){return O(e,t,n,r)},d:Vw,e:Vw,f:Qw,g:Fw,G:Bw,H:Xw,I:Xw,j:qw,L:Yw,m:Hw,M:Kw,p:function(e,t,n){var r=u.exec(t.slice(n));return r?(e.p=c.get(r[0].toLowerCase()),n+r[0].length):-1},q:Uw,Q:Zw,s:eS,S:Gw,u:Dw,U:Lw,V:zw,w:Iw,W:$w,x:function(e,t,r){return O(e,n,t,r)},X:function(e,t,n){return O(e,r,t,n)},y:Fw,Y:Bw,Z:Ww,"%":Jw};function S(e,t){return function(n){var r,o,i,a=[],l=-1,s=0,u=e.length;for(n instanceof Date||(n=new Date(+n));++l<u;)37===e.charCodeAt(l)&&(a.push(e.slice(s,l)),null!=(o=Ew[r=e.charAt(++l)])?r=e.charAt(++l):o="e"===r?" ":"0",(i=t[r])&&(r=i(n,o)),a.push(r),s=l+1);return a.push(e.slice(s,l)),a.join("")}}function A(e,t){return function(n){var r,o,i=Aw(1900,void 0,1);if(O(i,e,n+="",0)!=n.length)return null;if("Q"in i)return new Date(i.Q);if("s"in i)return new Date(1e3*i.s+("L"in i?i.L:0));if(t&&!("Z"in i)&&(i.Z=0),"p"in i&&(i.H=i.H%12+12*i.p),void 0===i.m&&(i.m="q"in i?i.q:0),"V"in i){if(i.V<1||i.V>53)return null;"w"in i||(i.w=1),"Z"in i?(o=(r=Sw(Aw(i.y,0,1))).getUTCDay(),r=o>4||0===o?aw.ceil(r):aw(r),r=Kx.offset(r,7*(i.V-1)),i.y=r.getUTCFullYear(),i.m=r.getUTCMonth(),i.d=r.getUTCDate()+(i.w+6)%7):(o=(r=ww(Aw(i.y,0,1))).getDay(),r=o>4||0===o?Jx.ceil(r):Jx(r),r=Xx.offset(r,7*(i.V-1)),i.y=r.getFullYear(),i.m=r.getMonth(),i.d=r.getDate()+(i.w+6)%7)}else("W"in i||"U"in i)&&("w"in i||(i.w="u"in i?i.u%7:"W"in i?1:0),o="Z"in i?Sw(Aw(i.y,0,1)).getUTCDay():ww(Aw(i.y,0,1)).getDay(),i.m=0,i.d="W"in i?(i.w+6)%7+7*i.W-(o+5)%7:i.w+7*i.U-(o+6)%7);return"Z"in i?(i.H+=i.Z/100|0,i.M+=i.Z%100,Sw(i)):ww(i)}}function O(e,t,n,r){for(var o,i,a=0,l=t.length,s=n.length;a<l;){if(r>=s)return-1;if(37===(o=t.charCodeAt(a++))){if(o=t.charAt(a++),!(i=w[o in Ew?t.charAt(a++):o])||(r=i(e,n,r))<0)return-1}else if(o!=n.charCodeAt(r++))return-1}return r}return b.x=S(n,b),b.X=S(r,b),b.c=S(t,b),x.x=S(n,x),x.X=S(r,x),x.c=S(t,x),{format:function(e){var t=S(e+="",b);return t.toString=function(){return e},t},parse:function(e){var t=A(e+="",!1);return t.toString=function(){return e},t},utcFormat:function(e){var t=S(e+="",x);return t.toString=function(){return e},t},utcParse:function(e){var t=A(e+="",!0);return t.toString=function(){return e},t}}}(e),kw=Ow.format,Ow.parse,jw=Ow.utcFormat,Ow.utcParse}({dateTime:"%x, %X",date:"%-m/%-d/%Y",time:"%-I:%M:%S %p",periods:["AM","PM"],days:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],shortDays:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],months:["January","February","March","April","May","June","July","August","September","October","November","December"],shortMonths:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]});Array.prototype.slice;function cA(e){return"object"===typeof e&&"length"in e?e:Array.from(e)}function dA(e){for(var t=e.length,n=new Array(t);--t>=0;)n[t]=t;return n}function fA(e,t){return e[t]}function pA(e){const t=[];return t.key=e,t}var hA=n(539),mA=n.n(hA),yA=n(6745),vA=n.n(yA),gA=n(3538),bA=n.n(gA),xA=n(9853),wA=n.n(xA),SA=n(8210),AA=n.n(SA);function OA(e){return function(e){if(Array.isArray(e))return kA(e)}(e)||function(e){if("undefined"!==typeof Symbol&&Symbol.iterator in Object(e))return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return kA(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return kA(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function kA(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var jA=function(e){return e},EA={"@@functional/placeholder":!0},CA=function(e){return e===EA},PA=function(e){return function t(){return 0===arguments.length||1===arguments.length&&CA(arguments.length<=0?void 0:arguments[0])?t:e.apply(void 0,arguments)}},MA=function e(t,n){return 1===t?n:PA((function(){for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];var a=o.filter((function(e){return e!==EA})).length;return a>=t?n.apply(void 0,o):e(t-a,PA((function(){for(var e=arguments.length,t=new Array(e),r=0;r<e;r++)t[r]=arguments[r];var i=o.map((function(e){return CA(e)?t.shift():e}));return n.apply(void 0,OA(i).concat(t))})))}))},TA=function(e){return MA(e.length,e)},_A=function(e,t){for(var n=[],r=e;r<t;++r)n[r-e]=r;return n},RA=TA((function(e,t){return Array.isArray(t)?t.map(e):Object.keys(t).map((function(e){return t[e]})).map(e)})),NA=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];if(!t.length)return jA;var r=t.reverse(),o=r[0],i=r.slice(1);return function(){return i.reduce((function(e,t){return t(e)}),o.apply(void 0,arguments))}},IA=function(e){return Array.isArray(e)?e.reverse():e.split("").reverse.join("")},DA=function(e){var t=null,n=null;return function(){for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return t&&o.every((function(e,n){return e===t[n]}))?n:(t=o,n=e.apply(void 0,o))}};var LA=TA((function(e,t,n){var r=+e;return r+n*(+t-r)})),zA=TA((function(e,t,n){var r=t-+e;return(n-e)/(r=r||1/0)})),$A=TA((function(e,t,n){var r=t-+e;return r=r||1/0,Math.max(0,Math.min(1,(n-e)/r))}));const BA={rangeStep:function(e,t,n){for(var r=new(AA())(e),o=0,i=[];r.lt(t)&&o<1e5;)i.push(r.toNumber()),r=r.add(n),o++;return i},getDigitCount:function(e){return 0===e?1:Math.floor(new(AA())(e).abs().log(10).toNumber())+1},interpolateNumber:LA,uninterpolateNumber:zA,uninterpolateTruncation:$A};function FA(e){return function(e){if(Array.isArray(e))return HA(e)}(e)||function(e){if("undefined"!==typeof Symbol&&Symbol.iterator in Object(e))return Array.from(e)}(e)||UA(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function WA(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if("undefined"===typeof Symbol||!(Symbol.iterator in Object(e)))return;var n=[],r=!0,o=!1,i=void 0;try{for(var a,l=e[Symbol.iterator]();!(r=(a=l.next()).done)&&(n.push(a.value),!t||n.length!==t);r=!0);}catch(s){o=!0,i=s}finally{try{r||null==l.return||l.return()}finally{if(o)throw i}}return n}(e,t)||UA(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function UA(e,t){if(e){if("string"===typeof e)return HA(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?HA(e,t):void 0}}function HA(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function VA(e){var t=WA(e,2),n=t[0],r=t[1],o=n,i=r;return n>r&&(o=r,i=n),[o,i]}function qA(e,t,n){if(e.lte(0))return new(AA())(0);var r=BA.getDigitCount(e.toNumber()),o=new(AA())(10).pow(r),i=e.div(o),a=1!==r?.05:.1,l=new(AA())(Math.ceil(i.div(a).toNumber())).add(n).mul(a).mul(o);return t?l:new(AA())(Math.ceil(l))}function XA(e,t,n){var r=1,o=new(AA())(e);if(!o.isint()&&n){var i=Math.abs(e);i<1?(r=new(AA())(10).pow(BA.getDigitCount(e)-1),o=new(AA())(Math.floor(o.div(r).toNumber())).mul(r)):i>1&&(o=new(AA())(Math.floor(e)))}else 0===e?o=new(AA())(Math.floor((t-1)/2)):n||(o=new(AA())(Math.floor(e)));var a=Math.floor((t-1)/2);return NA(RA((function(e){return o.add(new(AA())(e-a).mul(r)).toNumber()})),_A)(0,t)}function KA(e,t,n,r){var o=arguments.length>4&&void 0!==arguments[4]?arguments[4]:0;if(!Number.isFinite((t-e)/(n-1)))return{step:new(AA())(0),tickMin:new(AA())(0),tickMax:new(AA())(0)};var i,a=qA(new(AA())(t).sub(e).div(n-1),r,o);i=e<=0&&t>=0?new(AA())(0):(i=new(AA())(e).add(t).div(2)).sub(new(AA())(i).mod(a));var l=Math.ceil(i.sub(e).div(a).toNumber()),s=Math.ceil(new(AA())(t).sub(i).div(a).toNumber()),u=l+s+1;return u>n?KA(e,t,n,r,o+1):(u<n&&(s=t>0?s+(n-u):s,l=t>0?l:l+(n-u)),{step:a,tickMin:i.sub(new(AA())(l).mul(a)),tickMax:i.add(new(AA())(s).mul(a))})}var GA=DA((function(e){var t=WA(e,2),n=t[0],r=t[1],o=arguments.length>1&&void 0!==arguments[1]?arguments[1]:6,i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],a=Math.max(o,2),l=WA(VA([n,r]),2),s=l[0],u=l[1];if(s===-1/0||u===1/0){var c=u===1/0?[s].concat(FA(_A(0,o-1).map((function(){return 1/0})))):[].concat(FA(_A(0,o-1).map((function(){return-1/0}))),[u]);return n>r?IA(c):c}if(s===u)return XA(s,o,i);var d=KA(s,u,a,i),f=d.step,p=d.tickMin,h=d.tickMax,m=BA.rangeStep(p,h.add(new(AA())(.1).mul(f)),f);return n>r?IA(m):m})),YA=(DA((function(e){var t=WA(e,2),n=t[0],r=t[1],o=arguments.length>1&&void 0!==arguments[1]?arguments[1]:6,i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],a=Math.max(o,2),l=WA(VA([n,r]),2),s=l[0],u=l[1];if(s===-1/0||u===1/0)return[n,r];if(s===u)return XA(s,o,i);var c=qA(new(AA())(u).sub(s).div(a-1),i,0),d=NA(RA((function(e){return new(AA())(s).add(new(AA())(e).mul(c)).toNumber()})),_A)(0,a).filter((function(e){return e>=s&&e<=u}));return n>r?IA(d):d})),DA((function(e,t){var n=WA(e,2),r=n[0],o=n[1],i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],a=WA(VA([r,o]),2),l=a[0],s=a[1];if(l===-1/0||s===1/0)return[r,o];if(l===s)return[l];var u=Math.max(t,2),c=qA(new(AA())(s).sub(l).div(u-1),i,0),d=[].concat(FA(BA.rangeStep(new(AA())(l),new(AA())(s).sub(new(AA())(.99).mul(c)),c)),[s]);return r>o?IA(d):d}))),QA=["offset","layout","width","dataKey","data","dataPointFormatter","xAxis","yAxis"];function JA(e){return JA="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},JA(e)}function ZA(){return ZA=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},ZA.apply(this,arguments)}function eO(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return tO(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return tO(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function tO(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function nO(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function rO(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,uO(r.key),r)}}function oO(e,t,n){return t=aO(t),function(e,t){if(t&&("object"===JA(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,iO()?Reflect.construct(t,n||[],aO(e).constructor):t.apply(e,n))}function iO(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(iO=function(){return!!e})()}function aO(e){return aO=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},aO(e)}function lO(e,t){return lO=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},lO(e,t)}function sO(e,t,n){return(t=uO(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function uO(e){var t=function(e,t){if("object"!=JA(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=JA(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==JA(t)?t:t+""}var cO=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),oO(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&lO(e,t)}(n,e),r=n,o=[{key:"render",value:function(){var e=this.props,n=e.offset,r=e.layout,o=e.width,i=e.dataKey,a=e.data,l=e.dataPointFormatter,s=e.xAxis,u=e.yAxis,c=nO(e,QA),d=rp(c,!1);"x"===this.props.direction&&"number"!==s.type&&bp(!1);var f=a.map((function(e){var a=l(e,i),c=a.x,f=a.y,p=a.value,h=a.errorVal;if(!h)return null;var m,y,v=[];if(Array.isArray(h)){var g=eO(h,2);m=g[0],y=g[1]}else m=y=h;if("vertical"===r){var b=s.scale,x=f+n,w=x+o,S=x-o,A=b(p-m),O=b(p+y);v.push({x1:O,y1:w,x2:O,y2:S}),v.push({x1:A,y1:x,x2:O,y2:x}),v.push({x1:A,y1:w,x2:A,y2:S})}else if("horizontal"===r){var k=u.scale,j=c+n,E=j-o,C=j+o,P=k(p-m),M=k(p+y);v.push({x1:E,y1:M,x2:C,y2:M}),v.push({x1:j,y1:P,x2:j,y2:M}),v.push({x1:E,y1:P,x2:C,y2:P})}return t.createElement(Ep,ZA({className:"recharts-errorBar",key:"bar-".concat(v.map((function(e){return"".concat(e.x1,"-").concat(e.x2,"-").concat(e.y1,"-").concat(e.y2)})))},d),v.map((function(e){return t.createElement("line",ZA({},e,{key:"line-".concat(e.x1,"-").concat(e.x2,"-").concat(e.y1,"-").concat(e.y2)}))})))}));return t.createElement(Ep,{className:"recharts-errorBars"},f)}}],o&&rO(r.prototype,o),i&&rO(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);function dO(e){return dO="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},dO(e)}function fO(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function pO(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?fO(Object(n),!0).forEach((function(t){hO(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):fO(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function hO(e,t,n){return t=function(e){var t=function(e,t){if("object"!=dO(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=dO(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==dO(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}sO(cO,"defaultProps",{stroke:"black",strokeWidth:1.5,width:5,offset:0,layout:"horizontal"}),sO(cO,"displayName","ErrorBar");var mO=function(e){var t=e.children,n=e.formattedGraphicalItems,r=e.legendWidth,o=e.legendContent,i=Zf(t,Pm);if(!i)return null;var a,l=Pm.defaultProps,s=void 0!==l?pO(pO({},l),i.props):{};return a=i.props&&i.props.payload?i.props&&i.props.payload:"children"===o?(n||[]).reduce((function(e,t){var n=t.item,r=t.props,o=r.sectors||r.data||[];return e.concat(o.map((function(e){return{type:i.props.iconType||n.props.legendType,value:e.name,color:e.fill,payload:e}})))}),[]):(n||[]).map((function(e){var t=e.item,n=t.type.defaultProps,r=void 0!==n?pO(pO({},n),t.props):{},o=r.dataKey,i=r.name,a=r.legendType;return{inactive:r.hide,dataKey:o,type:s.iconType||a||"square",color:OO(t),value:i||o,payload:r}})),pO(pO(pO({},s),Pm.getWithHeight(i,r)),{},{payload:a,item:i})};function yO(e){return yO="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},yO(e)}function vO(e){return function(e){if(Array.isArray(e))return gO(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return gO(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return gO(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function gO(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function bO(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function xO(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?bO(Object(n),!0).forEach((function(t){wO(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):bO(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function wO(e,t,n){return t=function(e){var t=function(e,t){if("object"!=yO(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=yO(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==yO(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function SO(e,t,n){return Mf()(e)||Mf()(t)?n:xf(t)?hf()(e,t,n):_f()(t)?t(e):n}function AO(e,t,n,r){var o=bA()(e,(function(e){return SO(e,t)}));if("number"===n){var i=o.filter((function(e){return bf(e)||parseFloat(e)}));return i.length?[vA()(i),mA()(i)]:[1/0,-1/0]}return(r?o.filter((function(e){return!Mf()(e)})):o).map((function(e){return xf(e)||e instanceof Date?e:""}))}var OO=function(e){var t,n,r=e.type.displayName,o=null!==(t=e.type)&&void 0!==t&&t.defaultProps?xO(xO({},e.type.defaultProps),e.props):e.props,i=o.stroke,a=o.fill;switch(r){case"Line":n=i;break;case"Area":case"Radar":n=i&&"none"!==i?i:a;break;default:n=a}return n},kO=function(e,t,n,r,o){var i=Jf(t.props.children,cO).filter((function(e){return function(e,t,n){return!!Mf()(t)||("horizontal"===e?"yAxis"===t:"vertical"===e||"x"===n?"xAxis"===t:"y"!==n||"yAxis"===t)}(r,o,e.props.direction)}));if(i&&i.length){var a=i.map((function(e){return e.props.dataKey}));return e.reduce((function(e,t){var r=SO(t,n);if(Mf()(r))return e;var o=Array.isArray(r)?[vA()(r),mA()(r)]:[r,r],i=a.reduce((function(e,n){var r=SO(t,n,0),i=o[0]-Math.abs(Array.isArray(r)?r[0]:r),a=o[1]+Math.abs(Array.isArray(r)?r[1]:r);return[Math.min(i,e[0]),Math.max(a,e[1])]}),[1/0,-1/0]);return[Math.min(i[0],e[0]),Math.max(i[1],e[1])]}),[1/0,-1/0])}return null},jO=function(e,t,n,r,o){var i=t.map((function(t){var i=t.props.dataKey;return"number"===n&&i&&kO(e,t,i,r)||AO(e,i,n,o)}));if("number"===n)return i.reduce((function(e,t){return[Math.min(e[0],t[0]),Math.max(e[1],t[1])]}),[1/0,-1/0]);var a={};return i.reduce((function(e,t){for(var n=0,r=t.length;n<r;n++)a[t[n]]||(a[t[n]]=!0,e.push(t[n]));return e}),[])},EO=function(e,t){return"horizontal"===e&&"xAxis"===t||"vertical"===e&&"yAxis"===t||"centric"===e&&"angleAxis"===t||"radial"===e&&"radiusAxis"===t},CO=function(e,t,n,r){if(r)return e.map((function(e){return e.coordinate}));var o,i,a=e.map((function(e){return e.coordinate===t&&(o=!0),e.coordinate===n&&(i=!0),e.coordinate}));return o||a.push(t),i||a.push(n),a},PO=function(e,t,n){if(!e)return null;var r=e.scale,o=e.duplicateDomain,i=e.type,a=e.range,l="scaleBand"===e.realScaleType?r.bandwidth()/2:2,s=(t||n)&&"category"===i&&r.bandwidth?r.bandwidth()/l:0;return s="angleAxis"===e.axisType&&(null===a||void 0===a?void 0:a.length)>=2?2*vf(a[0]-a[1])*s:s,t&&(e.ticks||e.niceTicks)?(e.ticks||e.niceTicks).map((function(e){var t=o?o.indexOf(e):e;return{coordinate:r(t)+s,value:e,offset:s}})).filter((function(e){return!ff()(e.coordinate)})):e.isCategorical&&e.categoricalDomain?e.categoricalDomain.map((function(e,t){return{coordinate:r(e)+s,value:e,index:t,offset:s}})):r.ticks&&!n?r.ticks(e.tickCount).map((function(e){return{coordinate:r(e)+s,value:e,offset:s}})):r.domain().map((function(e,t){return{coordinate:r(e)+s,value:o?o[e]:e,index:t,offset:s}}))},MO=new WeakMap,TO=function(e,t){if("function"!==typeof t)return e;MO.has(e)||MO.set(e,new WeakMap);var n=MO.get(e);if(n.has(t))return n.get(t);var r=function(){e.apply(void 0,arguments),t.apply(void 0,arguments)};return n.set(t,r),r},_O=function(t,n,r){var o=t.scale,i=t.type,a=t.layout,l=t.axisType;if("auto"===o)return"radial"===a&&"radiusAxis"===l?{scale:Ev(),realScaleType:"band"}:"radial"===a&&"angleAxis"===l?{scale:Qb(),realScaleType:"linear"}:"category"===i&&n&&(n.indexOf("LineChart")>=0||n.indexOf("AreaChart")>=0||n.indexOf("ComposedChart")>=0&&!r)?{scale:Pv(),realScaleType:"point"}:"category"===i?{scale:Ev(),realScaleType:"band"}:{scale:Qb(),realScaleType:"linear"};if(cf()(o)){var s="scale".concat(vh()(o));return{scale:(e[s]||Pv)(),realScaleType:e[s]?s:"point"}}return _f()(o)?{scale:o}:{scale:Pv(),realScaleType:"point"}},RO=1e-4,NO=function(e){var t=e.domain();if(t&&!(t.length<=2)){var n=t.length,r=e.range(),o=Math.min(r[0],r[1])-RO,i=Math.max(r[0],r[1])+RO,a=e(t[0]),l=e(t[n-1]);(a<o||a>i||l<o||l>i)&&e.domain([t[0],t[n-1]])}},IO={sign:function(e){var t=e.length;if(!(t<=0))for(var n=0,r=e[0].length;n<r;++n)for(var o=0,i=0,a=0;a<t;++a){var l=ff()(e[a][n][1])?e[a][n][0]:e[a][n][1];l>=0?(e[a][n][0]=o,e[a][n][1]=o+l,o=e[a][n][1]):(e[a][n][0]=i,e[a][n][1]=i+l,i=e[a][n][1])}},expand:function(e,t){if((r=e.length)>0){for(var n,r,o,i=0,a=e[0].length;i<a;++i){for(o=n=0;n<r;++n)o+=e[n][i][1]||0;if(o)for(n=0;n<r;++n)e[n][i][1]/=o}uA(e,t)}},none:uA,silhouette:function(e,t){if((n=e.length)>0){for(var n,r=0,o=e[t[0]],i=o.length;r<i;++r){for(var a=0,l=0;a<n;++a)l+=e[a][r][1]||0;o[r][1]+=o[r][0]=-l/2}uA(e,t)}},wiggle:function(e,t){if((o=e.length)>0&&(r=(n=e[t[0]]).length)>0){for(var n,r,o,i=0,a=1;a<r;++a){for(var l=0,s=0,u=0;l<o;++l){for(var c=e[t[l]],d=c[a][1]||0,f=(d-(c[a-1][1]||0))/2,p=0;p<l;++p){var h=e[t[p]];f+=(h[a][1]||0)-(h[a-1][1]||0)}s+=d,u+=f*d}n[a-1][1]+=n[a-1][0]=i,s&&(i-=u/s)}n[a-1][1]+=n[a-1][0]=i,uA(e,t)}},positive:function(e){var t=e.length;if(!(t<=0))for(var n=0,r=e[0].length;n<r;++n)for(var o=0,i=0;i<t;++i){var a=ff()(e[i][n][1])?e[i][n][0]:e[i][n][1];a>=0?(e[i][n][0]=o,e[i][n][1]=o+a,o=e[i][n][1]):(e[i][n][0]=0,e[i][n][1]=0)}}},DO=function(e,t,n){var r=t.map((function(e){return e.props.dataKey})),o=IO[n],i=function(){var e=Bh([]),t=dA,n=uA,r=fA;function o(o){var i,a,l=Array.from(e.apply(this,arguments),pA),s=l.length,u=-1;for(const e of o)for(i=0,++u;i<s;++i)(l[i][u]=[0,+r(e,l[i].key,u,o)]).data=e;for(i=0,a=cA(t(l));i<s;++i)l[a[i]].index=i;return n(l,a),l}return o.keys=function(t){return arguments.length?(e="function"===typeof t?t:Bh(Array.from(t)),o):e},o.value=function(e){return arguments.length?(r="function"===typeof e?e:Bh(+e),o):r},o.order=function(e){return arguments.length?(t=null==e?dA:"function"===typeof e?e:Bh(Array.from(e)),o):t},o.offset=function(e){return arguments.length?(n=null==e?uA:e,o):n},o}().keys(r).value((function(e,t){return+SO(e,t,0)})).order(dA).offset(o);return i(e)},LO=function(e,t){var n=t.realScaleType,r=t.type,o=t.tickCount,i=t.originalDomain,a=t.allowDecimals,l=n||t.scale;if("auto"!==l&&"linear"!==l)return null;if(o&&"number"===r&&i&&("auto"===i[0]||"auto"===i[1])){var s=e.domain();if(!s.length)return null;var u=GA(s,o,a);return e.domain([vA()(u),mA()(u)]),{niceTicks:u}}if(o&&"number"===r){var c=e.domain();return{niceTicks:YA(c,o,a)}}return null};var zO=function(e){var t=e.axis,n=e.ticks,r=e.offset,o=e.bandSize,i=e.entry,a=e.index;if("category"===t.type)return n[a]?n[a].coordinate+r:null;var l=SO(i,t.dataKey,t.domain[a]);return Mf()(l)?null:t.scale(l)-o/2+r},$O=function(e,t,n){return Object.keys(e).reduce((function(r,o){var i=e[o].stackedData.reduce((function(e,r){var o=function(e){return e.reduce((function(e,t){return[vA()(t.concat([e[0]]).filter(bf)),mA()(t.concat([e[1]]).filter(bf))]}),[1/0,-1/0])}(r.slice(t,n+1));return[Math.min(e[0],o[0]),Math.max(e[1],o[1])]}),[1/0,-1/0]);return[Math.min(i[0],r[0]),Math.max(i[1],r[1])]}),[1/0,-1/0]).map((function(e){return e===1/0||e===-1/0?0:e}))},BO=/^dataMin[\s]*-[\s]*([0-9]+([.]{1}[0-9]+){0,1})$/,FO=/^dataMax[\s]*\+[\s]*([0-9]+([.]{1}[0-9]+){0,1})$/,WO=function(e,t,n){if(_f()(e))return e(t,n);if(!Array.isArray(e))return t;var r=[];if(bf(e[0]))r[0]=n?e[0]:Math.min(e[0],t[0]);else if(BO.test(e[0])){var o=+BO.exec(e[0])[1];r[0]=t[0]-o}else _f()(e[0])?r[0]=e[0](t[0]):r[0]=t[0];if(bf(e[1]))r[1]=n?e[1]:Math.max(e[1],t[1]);else if(FO.test(e[1])){var i=+FO.exec(e[1])[1];r[1]=t[1]+i}else _f()(e[1])?r[1]=e[1](t[1]):r[1]=t[1];return r},UO=function(e,t,n){if(e&&e.scale&&e.scale.bandwidth){var r=e.scale.bandwidth();if(!n||r>0)return r}if(e&&t&&t.length>=2){for(var o=vp()(t,(function(e){return e.coordinate})),i=1/0,a=1,l=o.length;a<l;a++){var s=o[a],u=o[a-1];i=Math.min((s.coordinate||0)-(u.coordinate||0),i)}return i===1/0?0:i}return n?void 0:0},HO=function(e,t,n){return e&&e.length?wA()(e,hf()(n,"type.defaultProps.domain"))?t:e:t},VO=function(e,t){var n=e.type.defaultProps?xO(xO({},e.type.defaultProps),e.props):e.props,r=n.dataKey,o=n.name,i=n.unit,a=n.formatter,l=n.tooltipType,s=n.chartType,u=n.hide;return xO(xO({},rp(e,!1)),{},{dataKey:r,unit:i,formatter:a,name:o||r,color:OO(e),value:SO(t,r),type:l,payload:t,chartType:s,hide:u})};function qO(e){return qO="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},qO(e)}function XO(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function KO(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?XO(Object(n),!0).forEach((function(t){GO(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):XO(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function GO(e,t,n){return t=function(e){var t=function(e,t){if("object"!=qO(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=qO(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==qO(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var YO=["Webkit","Moz","O","ms"];function QO(e){return QO="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},QO(e)}function JO(){return JO=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},JO.apply(this,arguments)}function ZO(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function ek(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?ZO(Object(n),!0).forEach((function(t){ak(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ZO(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function tk(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,lk(r.key),r)}}function nk(e,t,n){return t=ok(t),function(e,t){if(t&&("object"===QO(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,rk()?Reflect.construct(t,n||[],ok(e).constructor):t.apply(e,n))}function rk(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(rk=function(){return!!e})()}function ok(e){return ok=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},ok(e)}function ik(e,t){return ik=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},ik(e,t)}function ak(e,t,n){return(t=lk(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function lk(e){var t=function(e,t){if("object"!=QO(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=QO(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==QO(t)?t:t+""}var sk=function(e){return e.changedTouches&&!!e.changedTouches.length},uk=function(e){function n(e){var t;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),ak(t=nk(this,n,[e]),"handleDrag",(function(e){t.leaveTimer&&(clearTimeout(t.leaveTimer),t.leaveTimer=null),t.state.isTravellerMoving?t.handleTravellerMove(e):t.state.isSlideMoving&&t.handleSlideDrag(e)})),ak(t,"handleTouchMove",(function(e){null!=e.changedTouches&&e.changedTouches.length>0&&t.handleDrag(e.changedTouches[0])})),ak(t,"handleDragEnd",(function(){t.setState({isTravellerMoving:!1,isSlideMoving:!1},(function(){var e=t.props,n=e.endIndex,r=e.onDragEnd,o=e.startIndex;null===r||void 0===r||r({endIndex:n,startIndex:o})})),t.detachDragEndListener()})),ak(t,"handleLeaveWrapper",(function(){(t.state.isTravellerMoving||t.state.isSlideMoving)&&(t.leaveTimer=window.setTimeout(t.handleDragEnd,t.props.leaveTimeOut))})),ak(t,"handleEnterSlideOrTraveller",(function(){t.setState({isTextActive:!0})})),ak(t,"handleLeaveSlideOrTraveller",(function(){t.setState({isTextActive:!1})})),ak(t,"handleSlideDragStart",(function(e){var n=sk(e)?e.changedTouches[0]:e;t.setState({isTravellerMoving:!1,isSlideMoving:!0,slideMoveStartX:n.pageX}),t.attachDragEndListener()})),t.travellerDragStartHandlers={startX:t.handleTravellerDragStart.bind(t,"startX"),endX:t.handleTravellerDragStart.bind(t,"endX")},t.state={},t}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&ik(e,t)}(n,e),r=n,o=[{key:"componentWillUnmount",value:function(){this.leaveTimer&&(clearTimeout(this.leaveTimer),this.leaveTimer=null),this.detachDragEndListener()}},{key:"getIndex",value:function(e){var t=e.startX,r=e.endX,o=this.state.scaleValues,i=this.props,a=i.gap,l=i.data.length-1,s=Math.min(t,r),u=Math.max(t,r),c=n.getIndexInRange(o,s),d=n.getIndexInRange(o,u);return{startIndex:c-c%a,endIndex:d===l?l:d-d%a}}},{key:"getTextOfTick",value:function(e){var t=this.props,n=t.data,r=t.tickFormatter,o=t.dataKey,i=SO(n[e],o,e);return _f()(r)?r(i,e):i}},{key:"attachDragEndListener",value:function(){window.addEventListener("mouseup",this.handleDragEnd,!0),window.addEventListener("touchend",this.handleDragEnd,!0),window.addEventListener("mousemove",this.handleDrag,!0)}},{key:"detachDragEndListener",value:function(){window.removeEventListener("mouseup",this.handleDragEnd,!0),window.removeEventListener("touchend",this.handleDragEnd,!0),window.removeEventListener("mousemove",this.handleDrag,!0)}},{key:"handleSlideDrag",value:function(e){var t=this.state,n=t.slideMoveStartX,r=t.startX,o=t.endX,i=this.props,a=i.x,l=i.width,s=i.travellerWidth,u=i.startIndex,c=i.endIndex,d=i.onChange,f=e.pageX-n;f>0?f=Math.min(f,a+l-s-o,a+l-s-r):f<0&&(f=Math.max(f,a-r,a-o));var p=this.getIndex({startX:r+f,endX:o+f});p.startIndex===u&&p.endIndex===c||!d||d(p),this.setState({startX:r+f,endX:o+f,slideMoveStartX:e.pageX})}},{key:"handleTravellerDragStart",value:function(e,t){var n=sk(t)?t.changedTouches[0]:t;this.setState({isSlideMoving:!1,isTravellerMoving:!0,movingTravellerId:e,brushMoveStartX:n.pageX}),this.attachDragEndListener()}},{key:"handleTravellerMove",value:function(e){var t=this.state,n=t.brushMoveStartX,r=t.movingTravellerId,o=t.endX,i=t.startX,a=this.state[r],l=this.props,s=l.x,u=l.width,c=l.travellerWidth,d=l.onChange,f=l.gap,p=l.data,h={startX:this.state.startX,endX:this.state.endX},m=e.pageX-n;m>0?m=Math.min(m,s+u-c-a):m<0&&(m=Math.max(m,s-a)),h[r]=a+m;var y=this.getIndex(h),v=y.startIndex,g=y.endIndex;this.setState(ak(ak({},r,a+m),"brushMoveStartX",e.pageX),(function(){d&&function(){var e=p.length-1;return"startX"===r&&(o>i?v%f===0:g%f===0)||o<i&&g===e||"endX"===r&&(o>i?g%f===0:v%f===0)||o>i&&g===e}()&&d(y)}))}},{key:"handleTravellerMoveKeyboard",value:function(e,t){var n=this,r=this.state,o=r.scaleValues,i=r.startX,a=r.endX,l=this.state[t],s=o.indexOf(l);if(-1!==s){var u=s+e;if(!(-1===u||u>=o.length)){var c=o[u];"startX"===t&&c>=a||"endX"===t&&c<=i||this.setState(ak({},t,c),(function(){n.props.onChange(n.getIndex({startX:n.state.startX,endX:n.state.endX}))}))}}}},{key:"renderBackground",value:function(){var e=this.props,n=e.x,r=e.y,o=e.width,i=e.height,a=e.fill,l=e.stroke;return t.createElement("rect",{stroke:l,fill:a,x:n,y:r,width:o,height:i})}},{key:"renderPanorama",value:function(){var e=this.props,n=e.x,r=e.y,o=e.width,i=e.height,a=e.data,l=e.children,s=e.padding,u=t.Children.only(l);return u?t.cloneElement(u,{x:n,y:r,width:o,height:i,margin:s,compact:!0,data:a}):null}},{key:"renderTravellerLayer",value:function(e,r){var o,i,a=this,l=this.props,s=l.y,u=l.travellerWidth,c=l.height,d=l.traveller,f=l.ariaLabel,p=l.data,h=l.startIndex,m=l.endIndex,y=Math.max(e,this.props.x),v=ek(ek({},rp(this.props,!1)),{},{x:y,y:s,width:u,height:c}),g=f||"Min value: ".concat(null===(o=p[h])||void 0===o?void 0:o.name,", Max value: ").concat(null===(i=p[m])||void 0===i?void 0:i.name);return t.createElement(Ep,{tabIndex:0,role:"slider","aria-label":g,"aria-valuenow":e,className:"recharts-brush-traveller",onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.travellerDragStartHandlers[r],onTouchStart:this.travellerDragStartHandlers[r],onKeyDown:function(e){["ArrowLeft","ArrowRight"].includes(e.key)&&(e.preventDefault(),e.stopPropagation(),a.handleTravellerMoveKeyboard("ArrowRight"===e.key?1:-1,r))},onFocus:function(){a.setState({isTravellerFocused:!0})},onBlur:function(){a.setState({isTravellerFocused:!1})},style:{cursor:"col-resize"}},n.renderTraveller(d,v))}},{key:"renderSlide",value:function(e,n){var r=this.props,o=r.y,i=r.height,a=r.stroke,l=r.travellerWidth,s=Math.min(e,n)+l,u=Math.max(Math.abs(n-e)-l,0);return t.createElement("rect",{className:"recharts-brush-slide",onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.handleSlideDragStart,onTouchStart:this.handleSlideDragStart,style:{cursor:"move"},stroke:"none",fill:a,fillOpacity:.2,x:s,y:o,width:u,height:i})}},{key:"renderText",value:function(){var e=this.props,n=e.startIndex,r=e.endIndex,o=e.y,i=e.height,a=e.travellerWidth,l=e.stroke,s=this.state,u=s.startX,c=s.endX,d={pointerEvents:"none",fill:l};return t.createElement(Ep,{className:"recharts-brush-texts"},t.createElement(fg,JO({textAnchor:"end",verticalAnchor:"middle",x:Math.min(u,c)-5,y:o+i/2},d),this.getTextOfTick(n)),t.createElement(fg,JO({textAnchor:"start",verticalAnchor:"middle",x:Math.max(u,c)+a+5,y:o+i/2},d),this.getTextOfTick(r)))}},{key:"render",value:function(){var e=this.props,n=e.data,r=e.className,o=e.children,i=e.x,a=e.y,l=e.width,s=e.height,u=e.alwaysShowText,c=this.state,d=c.startX,f=c.endX,p=c.isTextActive,h=c.isSlideMoving,m=c.isTravellerMoving,y=c.isTravellerFocused;if(!n||!n.length||!bf(i)||!bf(a)||!bf(l)||!bf(s)||l<=0||s<=0)return null;var v=zt("recharts-brush",r),g=1===t.Children.count(o),b=function(e,t){if(!e)return null;var n=e.replace(/(\w)/,(function(e){return e.toUpperCase()})),r=YO.reduce((function(e,r){return KO(KO({},e),{},GO({},r+n,t))}),{});return r[e]=t,r}("userSelect","none");return t.createElement(Ep,{className:v,onMouseLeave:this.handleLeaveWrapper,onTouchMove:this.handleTouchMove,style:b},this.renderBackground(),g&&this.renderPanorama(),this.renderSlide(d,f),this.renderTravellerLayer(d,"startX"),this.renderTravellerLayer(f,"endX"),(p||h||m||y||u)&&this.renderText())}}],i=[{key:"renderDefaultTraveller",value:function(e){var n=e.x,r=e.y,o=e.width,i=e.height,a=e.stroke,l=Math.floor(r+i/2)-1;return t.createElement(t.Fragment,null,t.createElement("rect",{x:n,y:r,width:o,height:i,fill:a,stroke:"none"}),t.createElement("line",{x1:n+1,y1:l,x2:n+o-1,y2:l,fill:"none",stroke:"#fff"}),t.createElement("line",{x1:n+1,y1:l+2,x2:n+o-1,y2:l+2,fill:"none",stroke:"#fff"}))}},{key:"renderTraveller",value:function(e,r){return t.isValidElement(e)?t.cloneElement(e,r):_f()(e)?e(r):n.renderDefaultTraveller(r)}},{key:"getDerivedStateFromProps",value:function(e,t){var n=e.data,r=e.width,o=e.x,i=e.travellerWidth,a=e.updateId,l=e.startIndex,s=e.endIndex;if(n!==t.prevData||a!==t.prevUpdateId)return ek({prevData:n,prevTravellerWidth:i,prevUpdateId:a,prevX:o,prevWidth:r},n&&n.length?function(e){var t=e.data,n=e.startIndex,r=e.endIndex,o=e.x,i=e.width,a=e.travellerWidth;if(!t||!t.length)return{};var l=t.length,s=Pv().domain(mp()(0,l)).range([o,o+i-a]),u=s.domain().map((function(e){return s(e)}));return{isTextActive:!1,isSlideMoving:!1,isTravellerMoving:!1,isTravellerFocused:!1,startX:s(n),endX:s(r),scale:s,scaleValues:u}}({data:n,width:r,x:o,travellerWidth:i,startIndex:l,endIndex:s}):{scale:null,scaleValues:null});if(t.scale&&(r!==t.prevWidth||o!==t.prevX||i!==t.prevTravellerWidth)){t.scale.range([o,o+r-i]);var u=t.scale.domain().map((function(e){return t.scale(e)}));return{prevData:n,prevTravellerWidth:i,prevUpdateId:a,prevX:o,prevWidth:r,startX:t.scale(e.startIndex),endX:t.scale(e.endIndex),scaleValues:u}}return null}},{key:"getIndexInRange",value:function(e,t){for(var n=0,r=e.length-1;r-n>1;){var o=Math.floor((n+r)/2);e[o]>t?r=o:n=o}return t>=e[r]?r:n}}],o&&tk(r.prototype,o),i&&tk(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);function ck(e){return ck="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},ck(e)}function dk(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function fk(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?dk(Object(n),!0).forEach((function(t){pk(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):dk(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function pk(e,t,n){return t=function(e){var t=function(e,t){if("object"!=ck(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=ck(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==ck(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function hk(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return mk(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return mk(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function mk(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}ak(uk,"displayName","Brush"),ak(uk,"defaultProps",{height:40,travellerWidth:5,gap:1,fill:"#fff",stroke:"#666",padding:{top:1,right:1,bottom:1,left:1},leaveTimeOut:1e3,alwaysShowText:!1});var yk=Math.PI/180,vk=function(e){return 180*e/Math.PI},gk=function(e,t,n,r){return{x:e+Math.cos(-yk*r)*n,y:t+Math.sin(-yk*r)*n}},bk=function(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{top:0,right:0,bottom:0,left:0};return Math.min(Math.abs(e-(n.left||0)-(n.right||0)),Math.abs(t-(n.top||0)-(n.bottom||0)))/2},xk=function(e,t){var n=e.x,r=e.y,o=t.cx,i=t.cy,a=function(e,t){var n=e.x,r=e.y,o=t.x,i=t.y;return Math.sqrt(Math.pow(n-o,2)+Math.pow(r-i,2))}({x:n,y:r},{x:o,y:i});if(a<=0)return{radius:a};var l=(n-o)/a,s=Math.acos(l);return r>i&&(s=2*Math.PI-s),{radius:a,angle:vk(s),angleInRadian:s}},wk=function(e,t){var n=t.startAngle,r=t.endAngle,o=Math.floor(n/360),i=Math.floor(r/360);return e+360*Math.min(o,i)},Sk=function(e,t){var n=e.x,r=e.y,o=xk({x:n,y:r},t),i=o.radius,a=o.angle,l=t.innerRadius,s=t.outerRadius;if(i<l||i>s)return!1;if(0===i)return!0;var u,c=function(e){var t=e.startAngle,n=e.endAngle,r=Math.floor(t/360),o=Math.floor(n/360),i=Math.min(r,o);return{startAngle:t-360*i,endAngle:n-360*i}}(t),d=c.startAngle,f=c.endAngle,p=a;if(d<=f){for(;p>f;)p-=360;for(;p<d;)p+=360;u=p>=d&&p<=f}else{for(;p>d;)p-=360;for(;p<f;)p+=360;u=p>=f&&p<=d}return u?fk(fk({},t),{},{radius:i,angle:wk(p,t)}):null},Ak=function(e){return(0,t.isValidElement)(e)||_f()(e)||"boolean"===typeof e?"":e.className};function Ok(e){return Ok="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Ok(e)}var kk=["offset"];function jk(e){return function(e){if(Array.isArray(e))return Ek(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return Ek(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Ek(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ek(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function Ck(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Pk(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Mk(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Pk(Object(n),!0).forEach((function(t){Tk(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Pk(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function Tk(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Ok(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Ok(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Ok(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function _k(){return _k=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},_k.apply(this,arguments)}var Rk=function(e,n,r){var o,i,a=e.position,l=e.viewBox,s=e.offset,u=e.className,c=l,d=c.cx,f=c.cy,p=c.innerRadius,h=c.outerRadius,m=c.startAngle,y=c.endAngle,v=c.clockWise,g=(p+h)/2,b=function(e,t){return vf(t-e)*Math.min(Math.abs(t-e),360)}(m,y),x=b>=0?1:-1;"insideStart"===a?(o=m+x*s,i=v):"insideEnd"===a?(o=y-x*s,i=!v):"end"===a&&(o=y+x*s,i=v),i=b<=0?i:!i;var w=gk(d,f,g,o),S=gk(d,f,g,o+359*(i?1:-1)),A="M".concat(w.x,",").concat(w.y,"\n    A").concat(g,",").concat(g,",0,1,").concat(i?0:1,",\n    ").concat(S.x,",").concat(S.y),O=Mf()(e.id)?Sf("recharts-radial-line-"):e.id;return t.createElement("text",_k({},r,{dominantBaseline:"central",className:zt("recharts-radial-bar-label",u)}),t.createElement("defs",null,t.createElement("path",{id:O,d:A})),t.createElement("textPath",{xlinkHref:"#".concat(O)},n))};function Nk(e){var n,r=e.offset,o=Mk({offset:void 0===r?5:r},Ck(e,kk)),i=o.viewBox,a=o.position,l=o.value,s=o.children,u=o.content,c=o.className,d=void 0===c?"":c,f=o.textBreakAll;if(!i||Mf()(l)&&Mf()(s)&&!(0,t.isValidElement)(u)&&!_f()(u))return null;if((0,t.isValidElement)(u))return(0,t.cloneElement)(u,o);if(_f()(u)){if(n=(0,t.createElement)(u,o),(0,t.isValidElement)(n))return n}else n=function(e){var t=e.value,n=e.formatter,r=Mf()(e.children)?t:e.children;return _f()(n)?n(r):r}(o);var p=function(e){return"cx"in e&&bf(e.cx)}(i),h=rp(o,!0);if(p&&("insideStart"===a||"insideEnd"===a||"end"===a))return Rk(o,n,h);var m=p?function(e){var t=e.viewBox,n=e.offset,r=e.position,o=t,i=o.cx,a=o.cy,l=o.innerRadius,s=o.outerRadius,u=(o.startAngle+o.endAngle)/2;if("outside"===r){var c=gk(i,a,s+n,u),d=c.x;return{x:d,y:c.y,textAnchor:d>=i?"start":"end",verticalAnchor:"middle"}}if("center"===r)return{x:i,y:a,textAnchor:"middle",verticalAnchor:"middle"};if("centerTop"===r)return{x:i,y:a,textAnchor:"middle",verticalAnchor:"start"};if("centerBottom"===r)return{x:i,y:a,textAnchor:"middle",verticalAnchor:"end"};var f=gk(i,a,(l+s)/2,u);return{x:f.x,y:f.y,textAnchor:"middle",verticalAnchor:"middle"}}(o):function(e){var t=e.viewBox,n=e.parentViewBox,r=e.offset,o=e.position,i=t,a=i.x,l=i.y,s=i.width,u=i.height,c=u>=0?1:-1,d=c*r,f=c>0?"end":"start",p=c>0?"start":"end",h=s>=0?1:-1,m=h*r,y=h>0?"end":"start",v=h>0?"start":"end";if("top"===o)return Mk(Mk({},{x:a+s/2,y:l-c*r,textAnchor:"middle",verticalAnchor:f}),n?{height:Math.max(l-n.y,0),width:s}:{});if("bottom"===o)return Mk(Mk({},{x:a+s/2,y:l+u+d,textAnchor:"middle",verticalAnchor:p}),n?{height:Math.max(n.y+n.height-(l+u),0),width:s}:{});if("left"===o){var g={x:a-m,y:l+u/2,textAnchor:y,verticalAnchor:"middle"};return Mk(Mk({},g),n?{width:Math.max(g.x-n.x,0),height:u}:{})}if("right"===o){var b={x:a+s+m,y:l+u/2,textAnchor:v,verticalAnchor:"middle"};return Mk(Mk({},b),n?{width:Math.max(n.x+n.width-b.x,0),height:u}:{})}var x=n?{width:s,height:u}:{};return"insideLeft"===o?Mk({x:a+m,y:l+u/2,textAnchor:v,verticalAnchor:"middle"},x):"insideRight"===o?Mk({x:a+s-m,y:l+u/2,textAnchor:y,verticalAnchor:"middle"},x):"insideTop"===o?Mk({x:a+s/2,y:l+d,textAnchor:"middle",verticalAnchor:p},x):"insideBottom"===o?Mk({x:a+s/2,y:l+u-d,textAnchor:"middle",verticalAnchor:f},x):"insideTopLeft"===o?Mk({x:a+m,y:l+d,textAnchor:v,verticalAnchor:p},x):"insideTopRight"===o?Mk({x:a+s-m,y:l+d,textAnchor:y,verticalAnchor:p},x):"insideBottomLeft"===o?Mk({x:a+m,y:l+u-d,textAnchor:v,verticalAnchor:f},x):"insideBottomRight"===o?Mk({x:a+s-m,y:l+u-d,textAnchor:y,verticalAnchor:f},x):Nf()(o)&&(bf(o.x)||gf(o.x))&&(bf(o.y)||gf(o.y))?Mk({x:a+Af(o.x,s),y:l+Af(o.y,u),textAnchor:"end",verticalAnchor:"end"},x):Mk({x:a+s/2,y:l+u/2,textAnchor:"middle",verticalAnchor:"middle"},x)}(o);return t.createElement(fg,_k({className:zt("recharts-label",d)},h,m,{breakAll:f}),n)}Nk.displayName="Label";var Ik=function(e){var t=e.cx,n=e.cy,r=e.angle,o=e.startAngle,i=e.endAngle,a=e.r,l=e.radius,s=e.innerRadius,u=e.outerRadius,c=e.x,d=e.y,f=e.top,p=e.left,h=e.width,m=e.height,y=e.clockWise,v=e.labelViewBox;if(v)return v;if(bf(h)&&bf(m)){if(bf(c)&&bf(d))return{x:c,y:d,width:h,height:m};if(bf(f)&&bf(p))return{x:f,y:p,width:h,height:m}}return bf(c)&&bf(d)?{x:c,y:d,width:0,height:0}:bf(t)&&bf(n)?{cx:t,cy:n,startAngle:o||r||0,endAngle:i||r||0,innerRadius:s||0,outerRadius:u||l||a||0,clockWise:y}:e.viewBox?e.viewBox:{}};Nk.parseViewBox=Ik,Nk.renderCallByParent=function(e,n){var r=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if(!e||!e.children&&r&&!e.label)return null;var o=e.children,i=Ik(e),a=Jf(o,Nk).map((function(e,r){return(0,t.cloneElement)(e,{viewBox:n||i,key:"label-".concat(r)})}));if(!r)return a;var l=function(e,n){return e?!0===e?t.createElement(Nk,{key:"label-implicit",viewBox:n}):xf(e)?t.createElement(Nk,{key:"label-implicit",viewBox:n,value:e}):(0,t.isValidElement)(e)?e.type===Nk?(0,t.cloneElement)(e,{key:"label-implicit",viewBox:n}):t.createElement(Nk,{key:"label-implicit",content:e,viewBox:n}):_f()(e)?t.createElement(Nk,{key:"label-implicit",content:e,viewBox:n}):Nf()(e)?t.createElement(Nk,_k({viewBox:n},e,{key:"label-implicit"})):null:null}(e.label,n||i);return[l].concat(jk(a))};var Dk=function(e,t){var n=e.alwaysShow,r=e.ifOverflow;return n&&(r="extendDomain"),r===t},Lk=n(1733),zk=n.n(Lk),$k=n(7002),Bk=n.n($k),Fk=function(e){return null};Fk.displayName="Cell";var Wk=n(4065),Uk=n.n(Wk);function Hk(e){return Hk="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Hk(e)}var Vk=["valueAccessor"],qk=["data","dataKey","clockWise","id","textBreakAll"];function Xk(e){return function(e){if(Array.isArray(e))return Kk(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return Kk(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Kk(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Kk(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function Gk(){return Gk=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Gk.apply(this,arguments)}function Yk(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Qk(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Yk(Object(n),!0).forEach((function(t){Jk(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Yk(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function Jk(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Hk(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Hk(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Hk(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Zk(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var ej=function(e){return Array.isArray(e.value)?Uk()(e.value):e.value};function tj(e){var n=e.valueAccessor,r=void 0===n?ej:n,o=Zk(e,Vk),i=o.data,a=o.dataKey,l=o.clockWise,s=o.id,u=o.textBreakAll,c=Zk(o,qk);return i&&i.length?t.createElement(Ep,{className:"recharts-label-list"},i.map((function(e,n){var o=Mf()(a)?r(e,n):SO(e&&e.payload,a),i=Mf()(s)?{}:{id:"".concat(s,"-").concat(n)};return t.createElement(Nk,Gk({},rp(e,!0),c,i,{parentViewBox:e.parentViewBox,value:o,textBreakAll:u,viewBox:Nk.parseViewBox(Mf()(l)?e:Qk(Qk({},e),{},{clockWise:l})),key:"label-".concat(n),index:n}))}))):null}tj.displayName="LabelList",tj.renderCallByParent=function(e,n){var r=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if(!e||!e.children&&r&&!e.label)return null;var o=Jf(e.children,tj).map((function(e,r){return(0,t.cloneElement)(e,{data:n,key:"labelList-".concat(r)})}));if(!r)return o;var i=function(e,n){return e?!0===e?t.createElement(tj,{key:"labelList-implicit",data:n}):t.isValidElement(e)||_f()(e)?t.createElement(tj,{key:"labelList-implicit",data:n,content:e}):Nf()(e)?t.createElement(tj,Gk({data:n},e,{key:"labelList-implicit"})):null:null}(e.label,n);return[i].concat(Xk(o))};var nj=n(2322),rj=n.n(nj),oj=n(6361),ij=n.n(oj);function aj(e){return aj="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},aj(e)}function lj(){return lj=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},lj.apply(this,arguments)}function sj(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return uj(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return uj(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function uj(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function cj(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function dj(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?cj(Object(n),!0).forEach((function(t){fj(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):cj(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function fj(e,t,n){return t=function(e){var t=function(e,t){if("object"!=aj(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=aj(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==aj(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var pj=function(e,t,n,r,o){var i,a=n-r;return i="M ".concat(e,",").concat(t),i+="L ".concat(e+n,",").concat(t),i+="L ".concat(e+n-a/2,",").concat(t+o),i+="L ".concat(e+n-a/2-r,",").concat(t+o),i+="L ".concat(e,",").concat(t," Z")},hj={x:0,y:0,upperWidth:0,lowerWidth:0,height:0,isUpdateAnimationActive:!1,animationBegin:0,animationDuration:1500,animationEasing:"ease"},mj=function(e){var n=dj(dj({},hj),e),r=(0,t.useRef)(),o=sj((0,t.useState)(-1),2),i=o[0],a=o[1];(0,t.useEffect)((function(){if(r.current&&r.current.getTotalLength)try{var e=r.current.getTotalLength();e&&a(e)}catch(t){}}),[]);var l=n.x,s=n.y,u=n.upperWidth,c=n.lowerWidth,d=n.height,f=n.className,p=n.animationEasing,h=n.animationDuration,m=n.animationBegin,y=n.isUpdateAnimationActive;if(l!==+l||s!==+s||u!==+u||c!==+c||d!==+d||0===u&&0===c||0===d)return null;var v=zt("recharts-trapezoid",f);return y?t.createElement(av,{canBegin:i>0,from:{upperWidth:0,lowerWidth:0,height:d,x:l,y:s},to:{upperWidth:u,lowerWidth:c,height:d,x:l,y:s},duration:h,animationEasing:p,isActive:y},(function(e){var o=e.upperWidth,a=e.lowerWidth,l=e.height,s=e.x,u=e.y;return t.createElement(av,{canBegin:i>0,from:"0px ".concat(-1===i?1:i,"px"),to:"".concat(i,"px 0px"),attributeName:"strokeDasharray",begin:m,duration:h,easing:p},t.createElement("path",lj({},rp(n,!0),{className:v,d:pj(s,u,o,a,l),ref:r})))})):t.createElement("g",null,t.createElement("path",lj({},rp(n,!0),{className:v,d:pj(l,s,u,c,d)})))};function yj(e){return yj="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},yj(e)}function vj(){return vj=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},vj.apply(this,arguments)}function gj(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function bj(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?gj(Object(n),!0).forEach((function(t){xj(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):gj(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function xj(e,t,n){return t=function(e){var t=function(e,t){if("object"!=yj(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=yj(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==yj(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var wj=function(e){var t=e.cx,n=e.cy,r=e.radius,o=e.angle,i=e.sign,a=e.isExternal,l=e.cornerRadius,s=e.cornerIsExternal,u=l*(a?1:-1)+r,c=Math.asin(l/u)/yk,d=s?o:o+i*c,f=s?o-i*c:o;return{center:gk(t,n,u,d),circleTangency:gk(t,n,r,d),lineTangency:gk(t,n,u*Math.cos(c*yk),f),theta:c}},Sj=function(e){var t=e.cx,n=e.cy,r=e.innerRadius,o=e.outerRadius,i=e.startAngle,a=function(e,t){return vf(t-e)*Math.min(Math.abs(t-e),359.999)}(i,e.endAngle),l=i+a,s=gk(t,n,o,i),u=gk(t,n,o,l),c="M ".concat(s.x,",").concat(s.y,"\n    A ").concat(o,",").concat(o,",0,\n    ").concat(+(Math.abs(a)>180),",").concat(+(i>l),",\n    ").concat(u.x,",").concat(u.y,"\n  ");if(r>0){var d=gk(t,n,r,i),f=gk(t,n,r,l);c+="L ".concat(f.x,",").concat(f.y,"\n            A ").concat(r,",").concat(r,",0,\n            ").concat(+(Math.abs(a)>180),",").concat(+(i<=l),",\n            ").concat(d.x,",").concat(d.y," Z")}else c+="L ".concat(t,",").concat(n," Z");return c},Aj={cx:0,cy:0,innerRadius:0,outerRadius:0,startAngle:0,endAngle:0,cornerRadius:0,forceCornerRadius:!1,cornerIsExternal:!1},Oj=function(e){var n=bj(bj({},Aj),e),r=n.cx,o=n.cy,i=n.innerRadius,a=n.outerRadius,l=n.cornerRadius,s=n.forceCornerRadius,u=n.cornerIsExternal,c=n.startAngle,d=n.endAngle,f=n.className;if(a<i||c===d)return null;var p,h=zt("recharts-sector",f),m=a-i,y=Af(l,m,0,!0);return p=y>0&&Math.abs(c-d)<360?function(e){var t=e.cx,n=e.cy,r=e.innerRadius,o=e.outerRadius,i=e.cornerRadius,a=e.forceCornerRadius,l=e.cornerIsExternal,s=e.startAngle,u=e.endAngle,c=vf(u-s),d=wj({cx:t,cy:n,radius:o,angle:s,sign:c,cornerRadius:i,cornerIsExternal:l}),f=d.circleTangency,p=d.lineTangency,h=d.theta,m=wj({cx:t,cy:n,radius:o,angle:u,sign:-c,cornerRadius:i,cornerIsExternal:l}),y=m.circleTangency,v=m.lineTangency,g=m.theta,b=l?Math.abs(s-u):Math.abs(s-u)-h-g;if(b<0)return a?"M ".concat(p.x,",").concat(p.y,"\n        a").concat(i,",").concat(i,",0,0,1,").concat(2*i,",0\n        a").concat(i,",").concat(i,",0,0,1,").concat(2*-i,",0\n      "):Sj({cx:t,cy:n,innerRadius:r,outerRadius:o,startAngle:s,endAngle:u});var x="M ".concat(p.x,",").concat(p.y,"\n    A").concat(i,",").concat(i,",0,0,").concat(+(c<0),",").concat(f.x,",").concat(f.y,"\n    A").concat(o,",").concat(o,",0,").concat(+(b>180),",").concat(+(c<0),",").concat(y.x,",").concat(y.y,"\n    A").concat(i,",").concat(i,",0,0,").concat(+(c<0),",").concat(v.x,",").concat(v.y,"\n  ");if(r>0){var w=wj({cx:t,cy:n,radius:r,angle:s,sign:c,isExternal:!0,cornerRadius:i,cornerIsExternal:l}),S=w.circleTangency,A=w.lineTangency,O=w.theta,k=wj({cx:t,cy:n,radius:r,angle:u,sign:-c,isExternal:!0,cornerRadius:i,cornerIsExternal:l}),j=k.circleTangency,E=k.lineTangency,C=k.theta,P=l?Math.abs(s-u):Math.abs(s-u)-O-C;if(P<0&&0===i)return"".concat(x,"L").concat(t,",").concat(n,"Z");x+="L".concat(E.x,",").concat(E.y,"\n      A").concat(i,",").concat(i,",0,0,").concat(+(c<0),",").concat(j.x,",").concat(j.y,"\n      A").concat(r,",").concat(r,",0,").concat(+(P>180),",").concat(+(c>0),",").concat(S.x,",").concat(S.y,"\n      A").concat(i,",").concat(i,",0,0,").concat(+(c<0),",").concat(A.x,",").concat(A.y,"Z")}else x+="L".concat(t,",").concat(n,"Z");return x}({cx:r,cy:o,innerRadius:i,outerRadius:a,cornerRadius:Math.min(y,m/2),forceCornerRadius:s,cornerIsExternal:u,startAngle:c,endAngle:d}):Sj({cx:r,cy:o,innerRadius:i,outerRadius:a,startAngle:c,endAngle:d}),t.createElement("path",vj({},rp(n,!0),{className:h,d:p,role:"img"}))},kj=["option","shapeType","propTransformer","activeClassName","isActive"];function jj(e){return jj="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},jj(e)}function Ej(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Cj(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Pj(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Cj(Object(n),!0).forEach((function(t){Mj(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Cj(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function Mj(e,t,n){return t=function(e){var t=function(e,t){if("object"!=jj(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=jj(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==jj(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Tj(e,t){return Pj(Pj({},t),e)}function _j(e){var n=e.shapeType,r=e.elementProps;switch(n){case"rectangle":return t.createElement(vv,r);case"trapezoid":return t.createElement(mj,r);case"sector":return t.createElement(Oj,r);case"symbols":if(function(e){return"symbols"===e}(n))return t.createElement(rm,r);break;default:return null}}function Rj(e){var n,r=e.option,o=e.shapeType,i=e.propTransformer,a=void 0===i?Tj:i,l=e.activeClassName,s=void 0===l?"recharts-active-shape":l,u=e.isActive,c=Ej(e,kj);if((0,t.isValidElement)(r))n=(0,t.cloneElement)(r,Pj(Pj({},c),function(e){return(0,t.isValidElement)(e)?e.props:e}(r)));else if(_f()(r))n=r(c);else if(rj()(r)&&!ij()(r)){var d=a(r,c);n=t.createElement(_j,{shapeType:o,elementProps:d})}else{var f=c;n=t.createElement(_j,{shapeType:o,elementProps:f})}return u?t.createElement(Ep,{className:s},n):n}function Nj(e,t){return null!=t&&"trapezoids"in e.props}function Ij(e,t){return null!=t&&"sectors"in e.props}function Dj(e,t){return null!=t&&"points"in e.props}function Lj(e,t){var n,r,o=e.x===(null===t||void 0===t||null===(n=t.labelViewBox)||void 0===n?void 0:n.x)||e.x===t.x,i=e.y===(null===t||void 0===t||null===(r=t.labelViewBox)||void 0===r?void 0:r.y)||e.y===t.y;return o&&i}function zj(e,t){var n=e.endAngle===t.endAngle,r=e.startAngle===t.startAngle;return n&&r}function $j(e,t){var n=e.x===t.x,r=e.y===t.y,o=e.z===t.z;return n&&r&&o}function Bj(e){var t=e.activeTooltipItem,n=e.graphicalItem,r=e.itemData,o=function(e,t){var n;return Nj(e,t)?n="trapezoids":Ij(e,t)?n="sectors":Dj(e,t)&&(n="points"),n}(n,t),i=function(e,t){var n,r;return Nj(e,t)?null===(n=t.tooltipPayload)||void 0===n||null===(n=n[0])||void 0===n||null===(n=n.payload)||void 0===n?void 0:n.payload:Ij(e,t)?null===(r=t.tooltipPayload)||void 0===r||null===(r=r[0])||void 0===r||null===(r=r.payload)||void 0===r?void 0:r.payload:Dj(e,t)?t.payload:{}}(n,t),a=r.filter((function(e,r){var a=wA()(i,e),l=n.props[o].filter((function(e){var r=function(e,t){var n;return Nj(e,t)?n=Lj:Ij(e,t)?n=zj:Dj(e,t)&&(n=$j),n}(n,t);return r(e,t)})),s=n.props[o].indexOf(l[l.length-1]);return a&&r===s}));return r.indexOf(a[a.length-1])}var Fj=["x","y"];function Wj(e){return Wj="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Wj(e)}function Uj(){return Uj=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Uj.apply(this,arguments)}function Hj(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Vj(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Hj(Object(n),!0).forEach((function(t){qj(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Hj(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function qj(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Wj(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Wj(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Wj(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Xj(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Kj(e,t){var n=e.x,r=e.y,o=Xj(e,Fj),i="".concat(n),a=parseInt(i,10),l="".concat(r),s=parseInt(l,10),u="".concat(t.height||o.height),c=parseInt(u,10),d="".concat(t.width||o.width),f=parseInt(d,10);return Vj(Vj(Vj(Vj(Vj({},t),o),a?{x:a}:{}),s?{y:s}:{}),{},{height:c,width:f,name:t.name,radius:t.radius})}function Gj(e){return t.createElement(Rj,Uj({shapeType:"rectangle",propTransformer:Kj,activeClassName:"recharts-active-bar"},e))}var Yj,Qj=["value","background"];function Jj(e){return Jj="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Jj(e)}function Zj(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function eE(){return eE=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},eE.apply(this,arguments)}function tE(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function nE(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?tE(Object(n),!0).forEach((function(t){sE(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):tE(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function rE(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,uE(r.key),r)}}function oE(e,t,n){return t=aE(t),function(e,t){if(t&&("object"===Jj(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,iE()?Reflect.construct(t,n||[],aE(e).constructor):t.apply(e,n))}function iE(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(iE=function(){return!!e})()}function aE(e){return aE=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},aE(e)}function lE(e,t){return lE=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},lE(e,t)}function sE(e,t,n){return(t=uE(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function uE(e){var t=function(e,t){if("object"!=Jj(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Jj(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Jj(t)?t:t+""}var cE=function(e){function n(){var e;!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n);for(var t=arguments.length,r=new Array(t),o=0;o<t;o++)r[o]=arguments[o];return sE(e=oE(this,n,[].concat(r)),"state",{isAnimationFinished:!1}),sE(e,"id",Sf("recharts-bar-")),sE(e,"handleAnimationEnd",(function(){var t=e.props.onAnimationEnd;e.setState({isAnimationFinished:!0}),t&&t()})),sE(e,"handleAnimationStart",(function(){var t=e.props.onAnimationStart;e.setState({isAnimationFinished:!1}),t&&t()})),e}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&lE(e,t)}(n,e),r=n,o=[{key:"renderRectanglesStatically",value:function(e){var n=this,r=this.props,o=r.shape,i=r.dataKey,a=r.activeIndex,l=r.activeBar,s=rp(this.props,!1);return e&&e.map((function(e,r){var u=r===a,c=u?l:o,d=nE(nE(nE({},s),e),{},{isActive:u,option:c,index:r,dataKey:i,onAnimationStart:n.handleAnimationStart,onAnimationEnd:n.handleAnimationEnd});return t.createElement(Ep,eE({className:"recharts-bar-rectangle"},Uf(n.props,e,r),{key:"rectangle-".concat(null===e||void 0===e?void 0:e.x,"-").concat(null===e||void 0===e?void 0:e.y,"-").concat(null===e||void 0===e?void 0:e.value,"-").concat(r)}),t.createElement(Gj,d))}))}},{key:"renderRectanglesWithAnimation",value:function(){var e=this,n=this.props,r=n.data,o=n.layout,i=n.isAnimationActive,a=n.animationBegin,l=n.animationDuration,s=n.animationEasing,u=n.animationId,c=this.state.prevData;return t.createElement(av,{begin:a,duration:l,isActive:i,easing:s,from:{t:0},to:{t:1},key:"bar-".concat(u),onAnimationEnd:this.handleAnimationEnd,onAnimationStart:this.handleAnimationStart},(function(n){var i=n.t,a=r.map((function(e,t){var n=c&&c[t];if(n){var r=kf(n.x,e.x),a=kf(n.y,e.y),l=kf(n.width,e.width),s=kf(n.height,e.height);return nE(nE({},e),{},{x:r(i),y:a(i),width:l(i),height:s(i)})}if("horizontal"===o){var u=kf(0,e.height)(i);return nE(nE({},e),{},{y:e.y+e.height-u,height:u})}var d=kf(0,e.width)(i);return nE(nE({},e),{},{width:d})}));return t.createElement(Ep,null,e.renderRectanglesStatically(a))}))}},{key:"renderRectangles",value:function(){var e=this.props,t=e.data,n=e.isAnimationActive,r=this.state.prevData;return!(n&&t&&t.length)||r&&wA()(r,t)?this.renderRectanglesStatically(t):this.renderRectanglesWithAnimation()}},{key:"renderBackground",value:function(){var e=this,n=this.props,r=n.data,o=n.dataKey,i=n.activeIndex,a=rp(this.props.background,!1);return r.map((function(n,r){n.value;var l=n.background,s=Zj(n,Qj);if(!l)return null;var u=nE(nE(nE(nE(nE({},s),{},{fill:"#eee"},l),a),Uf(e.props,n,r)),{},{onAnimationStart:e.handleAnimationStart,onAnimationEnd:e.handleAnimationEnd,dataKey:o,index:r,className:"recharts-bar-background-rectangle"});return t.createElement(Gj,eE({key:"background-bar-".concat(r),option:e.props.background,isActive:r===i},u))}))}},{key:"renderErrorBar",value:function(e,n){if(this.props.isAnimationActive&&!this.state.isAnimationFinished)return null;var r=this.props,o=r.data,i=r.xAxis,a=r.yAxis,l=r.layout,s=Jf(r.children,cO);if(!s)return null;var u="vertical"===l?o[0].height/2:o[0].width/2,c=function(e,t){var n=Array.isArray(e.value)?e.value[1]:e.value;return{x:e.x,y:e.y,value:n,errorVal:SO(e,t)}},d={clipPath:e?"url(#clipPath-".concat(n,")"):null};return t.createElement(Ep,d,s.map((function(e){return t.cloneElement(e,{key:"error-bar-".concat(n,"-").concat(e.props.dataKey),data:o,xAxis:i,yAxis:a,layout:l,offset:u,dataPointFormatter:c})})))}},{key:"render",value:function(){var e=this.props,n=e.hide,r=e.data,o=e.className,i=e.xAxis,a=e.yAxis,l=e.left,s=e.top,u=e.width,c=e.height,d=e.isAnimationActive,f=e.background,p=e.id;if(n||!r||!r.length)return null;var h=this.state.isAnimationFinished,m=zt("recharts-bar",o),y=i&&i.allowDataOverflow,v=a&&a.allowDataOverflow,g=y||v,b=Mf()(p)?this.id:p;return t.createElement(Ep,{className:m},y||v?t.createElement("defs",null,t.createElement("clipPath",{id:"clipPath-".concat(b)},t.createElement("rect",{x:y?l:l-u/2,y:v?s:s-c/2,width:y?u:2*u,height:v?c:2*c}))):null,t.createElement(Ep,{className:"recharts-bar-rectangles",clipPath:g?"url(#clipPath-".concat(b,")"):null},f?this.renderBackground():null,this.renderRectangles()),this.renderErrorBar(g,b),(!d||h)&&tj.renderCallByParent(this.props,r))}}],i=[{key:"getDerivedStateFromProps",value:function(e,t){return e.animationId!==t.prevAnimationId?{prevAnimationId:e.animationId,curData:e.data,prevData:t.curData}:e.data!==t.curData?{curData:e.data}:null}}],o&&rE(r.prototype,o),i&&rE(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);function dE(e){return dE="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},dE(e)}function fE(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,yE(r.key),r)}}function pE(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function hE(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?pE(Object(n),!0).forEach((function(t){mE(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):pE(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function mE(e,t,n){return(t=yE(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function yE(e){var t=function(e,t){if("object"!=dE(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=dE(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==dE(t)?t:t+""}Yj=cE,sE(cE,"displayName","Bar"),sE(cE,"defaultProps",{xAxisId:0,yAxisId:0,legendType:"rect",minPointSize:0,hide:!1,data:[],layout:"vertical",activeBar:!1,isAnimationActive:!eh.isSsr,animationBegin:0,animationDuration:400,animationEasing:"ease"}),sE(cE,"getComposedData",(function(e){var t=e.props,n=e.item,r=e.barPosition,o=e.bandSize,i=e.xAxis,a=e.yAxis,l=e.xAxisTicks,s=e.yAxisTicks,u=e.stackedData,c=e.dataStartIndex,d=e.displayedData,f=e.offset,p=function(e,t){if(!e)return null;for(var n=0,r=e.length;n<r;n++)if(e[n].item===t)return e[n].position;return null}(r,n);if(!p)return null;var h=t.layout,m=n.type.defaultProps,y=void 0!==m?nE(nE({},m),n.props):n.props,v=y.dataKey,g=y.children,b=y.minPointSize,x="horizontal"===h?a:i,w=u?x.scale.domain():null,S=function(e){var t=e.numericAxis,n=t.scale.domain();if("number"===t.type){var r=Math.min(n[0],n[1]),o=Math.max(n[0],n[1]);return r<=0&&o>=0?0:o<0?o:r}return n[0]}({numericAxis:x}),A=Jf(g,Fk),O=d.map((function(e,t){var r,d,f,m,y,g;u?r=function(e,t){if(!t||2!==t.length||!bf(t[0])||!bf(t[1]))return e;var n=Math.min(t[0],t[1]),r=Math.max(t[0],t[1]),o=[e[0],e[1]];return(!bf(e[0])||e[0]<n)&&(o[0]=n),(!bf(e[1])||e[1]>r)&&(o[1]=r),o[0]>r&&(o[0]=r),o[1]<n&&(o[1]=n),o}(u[c+t],w):(r=SO(e,v),Array.isArray(r)||(r=[S,r]));var x=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;return function(n,r){if("number"===typeof e)return e;var o="number"===typeof n;return o?e(n,r):(o||bp(!1),t)}}(b,Yj.defaultProps.minPointSize)(r[1],t);if("horizontal"===h){var O,k=[a.scale(r[0]),a.scale(r[1])],j=k[0],E=k[1];d=zO({axis:i,ticks:l,bandSize:o,offset:p.offset,entry:e,index:t}),f=null!==(O=null!==E&&void 0!==E?E:j)&&void 0!==O?O:void 0,m=p.size;var C=j-E;if(y=Number.isNaN(C)?0:C,g={x:d,y:a.y,width:m,height:a.height},Math.abs(x)>0&&Math.abs(y)<Math.abs(x)){var P=vf(y||x)*(Math.abs(x)-Math.abs(y));f-=P,y+=P}}else{var M=[i.scale(r[0]),i.scale(r[1])],T=M[0],_=M[1];if(d=T,f=zO({axis:a,ticks:s,bandSize:o,offset:p.offset,entry:e,index:t}),m=_-T,y=p.size,g={x:i.x,y:f,width:i.width,height:y},Math.abs(x)>0&&Math.abs(m)<Math.abs(x))m+=vf(m||x)*(Math.abs(x)-Math.abs(m))}return nE(nE(nE({},e),{},{x:d,y:f,width:m,height:y,value:u?r:r[1],payload:e,background:g},A&&A[t]&&A[t].props),{},{tooltipPayload:[VO(n,e)],tooltipPosition:{x:d+m/2,y:f+y/2}})}));return nE({data:O,layout:h},f)}));var vE=function(e,t){var n=e.x,r=e.y,o=t.x,i=t.y;return{x:Math.min(n,o),y:Math.min(r,i),width:Math.abs(o-n),height:Math.abs(i-r)}},gE=function(){function e(t){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.scale=t}return t=e,n=[{key:"domain",get:function(){return this.scale.domain}},{key:"range",get:function(){return this.scale.range}},{key:"rangeMin",get:function(){return this.range()[0]}},{key:"rangeMax",get:function(){return this.range()[1]}},{key:"bandwidth",get:function(){return this.scale.bandwidth}},{key:"apply",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=t.bandAware,r=t.position;if(void 0!==e){if(r)switch(r){case"start":default:return this.scale(e);case"middle":var o=this.bandwidth?this.bandwidth()/2:0;return this.scale(e)+o;case"end":var i=this.bandwidth?this.bandwidth():0;return this.scale(e)+i}if(n){var a=this.bandwidth?this.bandwidth()/2:0;return this.scale(e)+a}return this.scale(e)}}},{key:"isInRange",value:function(e){var t=this.range(),n=t[0],r=t[t.length-1];return n<=r?e>=n&&e<=r:e>=r&&e<=n}}],r=[{key:"create",value:function(t){return new e(t)}}],n&&fE(t.prototype,n),r&&fE(t,r),Object.defineProperty(t,"prototype",{writable:!1}),t;var t,n,r}();mE(gE,"EPS",1e-4);var bE=function(e){var t=Object.keys(e).reduce((function(t,n){return hE(hE({},t),{},mE({},n,gE.create(e[n])))}),{});return hE(hE({},t),{},{apply:function(e){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=n.bandAware,o=n.position;return zk()(e,(function(e,n){return t[n].apply(e,{bandAware:r,position:o})}))},isInRange:function(e){return Bk()(e,(function(e,n){return t[n].isInRange(e)}))}})};function xE(){return xE=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},xE.apply(this,arguments)}function wE(e){return wE="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},wE(e)}function SE(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function AE(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?SE(Object(n),!0).forEach((function(t){PE(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):SE(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function OE(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,ME(r.key),r)}}function kE(e,t,n){return t=EE(t),function(e,t){if(t&&("object"===wE(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,jE()?Reflect.construct(t,n||[],EE(e).constructor):t.apply(e,n))}function jE(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(jE=function(){return!!e})()}function EE(e){return EE=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},EE(e)}function CE(e,t){return CE=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},CE(e,t)}function PE(e,t,n){return(t=ME(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ME(e){var t=function(e,t){if("object"!=wE(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=wE(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==wE(t)?t:t+""}var TE=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),kE(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&CE(e,t)}(n,e),r=n,o=[{key:"render",value:function(){var e=this.props,r=e.x,o=e.y,i=e.r,a=e.alwaysShow,l=e.clipPathId,s=xf(r),u=xf(o);if(Cf(void 0===a,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.'),!s||!u)return null;var c=function(e){var t=e.x,n=e.y,r=e.xAxis,o=e.yAxis,i=bE({x:r.scale,y:o.scale}),a=i.apply({x:t,y:n},{bandAware:!0});return Dk(e,"discard")&&!i.isInRange(a)?null:a}(this.props);if(!c)return null;var d=c.x,f=c.y,p=this.props,h=p.shape,m=p.className,y=AE(AE({clipPath:Dk(this.props,"hidden")?"url(#".concat(l,")"):void 0},rp(this.props,!0)),{},{cx:d,cy:f});return t.createElement(Ep,{className:zt("recharts-reference-dot",m)},n.renderDot(h,y),Nk.renderCallByParent(this.props,{x:d-i,y:f-i,width:2*i,height:2*i}))}}],o&&OE(r.prototype,o),i&&OE(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);PE(TE,"displayName","ReferenceDot"),PE(TE,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,r:10,fill:"#fff",stroke:"#ccc",fillOpacity:1,strokeWidth:1}),PE(TE,"renderDot",(function(e,n){return t.isValidElement(e)?t.cloneElement(e,n):_f()(e)?e(n):t.createElement(Tm,xE({},n,{cx:n.cx,cy:n.cy,className:"recharts-reference-dot-dot"}))}));var _E=n(4597),RE=n.n(_E),NE=n(8990),IE=n.n(NE),DE=n(5797),LE=n.n(DE)()((function(e){return{x:e.left,y:e.top,width:e.width,height:e.height}}),(function(e){return["l",e.left,"t",e.top,"w",e.width,"h",e.height].join("")}));var zE=(0,t.createContext)(void 0),$E=(0,t.createContext)(void 0),BE=(0,t.createContext)(void 0),FE=(0,t.createContext)({}),WE=(0,t.createContext)(void 0),UE=(0,t.createContext)(0),HE=(0,t.createContext)(0),VE=function(e){var n=e.state,r=n.xAxisMap,o=n.yAxisMap,i=n.offset,a=e.clipPathId,l=e.children,s=e.width,u=e.height,c=LE(i);return t.createElement(zE.Provider,{value:r},t.createElement($E.Provider,{value:o},t.createElement(FE.Provider,{value:i},t.createElement(BE.Provider,{value:c},t.createElement(WE.Provider,{value:a},t.createElement(UE.Provider,{value:u},t.createElement(HE.Provider,{value:s},l)))))))};var qE=function(e){var n=(0,t.useContext)(zE);null==n&&bp(!1);var r=n[e];return null==r&&bp(!1),r},XE=function(e){var n=(0,t.useContext)($E);null==n&&bp(!1);var r=n[e];return null==r&&bp(!1),r},KE=function(){return(0,t.useContext)(HE)},GE=function(){return(0,t.useContext)(UE)};function YE(e){return YE="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},YE(e)}function QE(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,iC(r.key),r)}}function JE(e,t,n){return t=eC(t),function(e,t){if(t&&("object"===YE(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,ZE()?Reflect.construct(t,n||[],eC(e).constructor):t.apply(e,n))}function ZE(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(ZE=function(){return!!e})()}function eC(e){return eC=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},eC(e)}function tC(e,t){return tC=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},tC(e,t)}function nC(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function rC(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?nC(Object(n),!0).forEach((function(t){oC(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):nC(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function oC(e,t,n){return(t=iC(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function iC(e){var t=function(e,t){if("object"!=YE(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=YE(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==YE(t)?t:t+""}function aC(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return lC(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return lC(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function lC(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function sC(){return sC=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},sC.apply(this,arguments)}function uC(e){var n=e.x,r=e.y,o=e.segment,i=e.xAxisId,a=e.yAxisId,l=e.shape,s=e.className,u=e.alwaysShow,c=(0,t.useContext)(WE),d=qE(i),f=XE(a),p=(0,t.useContext)(BE);if(!c||!p)return null;Cf(void 0===u,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.');var h=function(e,t,n,r,o,i,a,l,s){var u=o.x,c=o.y,d=o.width,f=o.height;if(n){var p=s.y,h=e.y.apply(p,{position:i});if(Dk(s,"discard")&&!e.y.isInRange(h))return null;var m=[{x:u+d,y:h},{x:u,y:h}];return"left"===l?m.reverse():m}if(t){var y=s.x,v=e.x.apply(y,{position:i});if(Dk(s,"discard")&&!e.x.isInRange(v))return null;var g=[{x:v,y:c+f},{x:v,y:c}];return"top"===a?g.reverse():g}if(r){var b=s.segment.map((function(t){return e.apply(t,{position:i})}));return Dk(s,"discard")&&RE()(b,(function(t){return!e.isInRange(t)}))?null:b}return null}(bE({x:d.scale,y:f.scale}),xf(n),xf(r),o&&2===o.length,p,e.position,d.orientation,f.orientation,e);if(!h)return null;var m=aC(h,2),y=m[0],v=y.x,g=y.y,b=m[1],x=b.x,w=b.y,S=rC(rC({clipPath:Dk(e,"hidden")?"url(#".concat(c,")"):void 0},rp(e,!0)),{},{x1:v,y1:g,x2:x,y2:w});return t.createElement(Ep,{className:zt("recharts-reference-line",s)},function(e,n){return t.isValidElement(e)?t.cloneElement(e,n):_f()(e)?e(n):t.createElement("line",sC({},n,{className:"recharts-reference-line-line"}))}(l,S),Nk.renderCallByParent(e,function(e){var t=e.x1,n=e.y1,r=e.x2,o=e.y2;return vE({x:t,y:n},{x:r,y:o})}({x1:v,y1:g,x2:x,y2:w})))}var cC=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),JE(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&tC(e,t)}(n,e),r=n,(o=[{key:"render",value:function(){return t.createElement(uC,this.props)}}])&&QE(r.prototype,o),i&&QE(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);function dC(){return dC=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},dC.apply(this,arguments)}function fC(e){return fC="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},fC(e)}function pC(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function hC(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?pC(Object(n),!0).forEach((function(t){xC(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):pC(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function mC(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,wC(r.key),r)}}function yC(e,t,n){return t=gC(t),function(e,t){if(t&&("object"===fC(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,vC()?Reflect.construct(t,n||[],gC(e).constructor):t.apply(e,n))}function vC(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(vC=function(){return!!e})()}function gC(e){return gC=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},gC(e)}function bC(e,t){return bC=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},bC(e,t)}function xC(e,t,n){return(t=wC(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function wC(e){var t=function(e,t){if("object"!=fC(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=fC(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==fC(t)?t:t+""}oC(cC,"displayName","ReferenceLine"),oC(cC,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,fill:"none",stroke:"#ccc",fillOpacity:1,strokeWidth:1,position:"middle"});var SC=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),yC(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&bC(e,t)}(n,e),r=n,(o=[{key:"render",value:function(){var e=this.props,r=e.x1,o=e.x2,i=e.y1,a=e.y2,l=e.className,s=e.alwaysShow,u=e.clipPathId;Cf(void 0===s,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.');var c=xf(r),d=xf(o),f=xf(i),p=xf(a),h=this.props.shape;if(!c&&!d&&!f&&!p&&!h)return null;var m=function(e,t,n,r,o){var i=o.x1,a=o.x2,l=o.y1,s=o.y2,u=o.xAxis,c=o.yAxis;if(!u||!c)return null;var d=bE({x:u.scale,y:c.scale}),f={x:e?d.x.apply(i,{position:"start"}):d.x.rangeMin,y:n?d.y.apply(l,{position:"start"}):d.y.rangeMin},p={x:t?d.x.apply(a,{position:"end"}):d.x.rangeMax,y:r?d.y.apply(s,{position:"end"}):d.y.rangeMax};return!Dk(o,"discard")||d.isInRange(f)&&d.isInRange(p)?vE(f,p):null}(c,d,f,p,this.props);if(!m&&!h)return null;var y=Dk(this.props,"hidden")?"url(#".concat(u,")"):void 0;return t.createElement(Ep,{className:zt("recharts-reference-area",l)},n.renderRect(h,hC(hC({clipPath:y},rp(this.props,!0)),m)),Nk.renderCallByParent(this.props,m))}}])&&mC(r.prototype,o),i&&mC(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);function AC(e){return function(e){if(Array.isArray(e))return OC(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return OC(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return OC(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function OC(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}xC(SC,"displayName","ReferenceArea"),xC(SC,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,r:10,fill:"#ccc",fillOpacity:.5,stroke:"none",strokeWidth:1}),xC(SC,"renderRect",(function(e,n){return t.isValidElement(e)?t.cloneElement(e,n):_f()(e)?e(n):t.createElement(vv,dC({},n,{className:"recharts-reference-area-rect"}))}));var kC=function(e,t,n,r,o){var i=Jf(e,cC),a=Jf(e,TE),l=[].concat(AC(i),AC(a)),s=Jf(e,SC),u="".concat(r,"Id"),c=r[0],d=t;if(l.length&&(d=l.reduce((function(e,t){if(t.props[u]===n&&Dk(t.props,"extendDomain")&&bf(t.props[c])){var r=t.props[c];return[Math.min(e[0],r),Math.max(e[1],r)]}return e}),d)),s.length){var f="".concat(c,"1"),p="".concat(c,"2");d=s.reduce((function(e,t){if(t.props[u]===n&&Dk(t.props,"extendDomain")&&bf(t.props[f])&&bf(t.props[p])){var r=t.props[f],o=t.props[p];return[Math.min(e[0],r,o),Math.max(e[1],r,o)]}return e}),d)}return o&&o.length&&(d=o.reduce((function(e,t){return bf(t)?[Math.min(e[0],t),Math.max(e[1],t)]:e}),d)),d},jC=n(7283),EC=new(n.n(jC)()),CC="recharts.syncMouseEvents";function PC(e){return PC="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},PC(e)}function MC(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,_C(r.key),r)}}function TC(e,t,n){return(t=_C(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function _C(e){var t=function(e,t){if("object"!=PC(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=PC(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==PC(t)?t:t+""}var RC=function(){return e=function e(){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),TC(this,"activeIndex",0),TC(this,"coordinateList",[]),TC(this,"layout","horizontal")},t=[{key:"setDetails",value:function(e){var t,n=e.coordinateList,r=void 0===n?null:n,o=e.container,i=void 0===o?null:o,a=e.layout,l=void 0===a?null:a,s=e.offset,u=void 0===s?null:s,c=e.mouseHandlerCallback,d=void 0===c?null:c;this.coordinateList=null!==(t=null!==r&&void 0!==r?r:this.coordinateList)&&void 0!==t?t:[],this.container=null!==i&&void 0!==i?i:this.container,this.layout=null!==l&&void 0!==l?l:this.layout,this.offset=null!==u&&void 0!==u?u:this.offset,this.mouseHandlerCallback=null!==d&&void 0!==d?d:this.mouseHandlerCallback,this.activeIndex=Math.min(Math.max(this.activeIndex,0),this.coordinateList.length-1)}},{key:"focus",value:function(){this.spoofMouse()}},{key:"keyboardEvent",value:function(e){if(0!==this.coordinateList.length)switch(e.key){case"ArrowRight":if("horizontal"!==this.layout)return;this.activeIndex=Math.min(this.activeIndex+1,this.coordinateList.length-1),this.spoofMouse();break;case"ArrowLeft":if("horizontal"!==this.layout)return;this.activeIndex=Math.max(this.activeIndex-1,0),this.spoofMouse()}}},{key:"setIndex",value:function(e){this.activeIndex=e}},{key:"spoofMouse",value:function(){var e,t;if("horizontal"===this.layout&&0!==this.coordinateList.length){var n=this.container.getBoundingClientRect(),r=n.x,o=n.y,i=n.height,a=this.coordinateList[this.activeIndex].coordinate,l=(null===(e=window)||void 0===e?void 0:e.scrollX)||0,s=(null===(t=window)||void 0===t?void 0:t.scrollY)||0,u=r+a+l,c=o+this.offset.top+i/2+s;this.mouseHandlerCallback({pageX:u,pageY:c})}}}],t&&MC(e.prototype,t),n&&MC(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e;var e,t,n}();function NC(){}function IC(e,t,n){e._context.bezierCurveTo((2*e._x0+e._x1)/3,(2*e._y0+e._y1)/3,(e._x0+2*e._x1)/3,(e._y0+2*e._y1)/3,(e._x0+4*e._x1+t)/6,(e._y0+4*e._y1+n)/6)}function DC(e){this._context=e}function LC(e){this._context=e}function zC(e){this._context=e}DC.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){switch(this._point){case 3:IC(this,this._x1,this._y1);case 2:this._context.lineTo(this._x1,this._y1)}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,this._context.lineTo((5*this._x0+this._x1)/6,(5*this._y0+this._y1)/6);default:IC(this,e,t)}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}},LC.prototype={areaStart:NC,areaEnd:NC,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._y0=this._y1=this._y2=this._y3=this._y4=NaN,this._point=0},lineEnd:function(){switch(this._point){case 1:this._context.moveTo(this._x2,this._y2),this._context.closePath();break;case 2:this._context.moveTo((this._x2+2*this._x3)/3,(this._y2+2*this._y3)/3),this._context.lineTo((this._x3+2*this._x2)/3,(this._y3+2*this._y2)/3),this._context.closePath();break;case 3:this.point(this._x2,this._y2),this.point(this._x3,this._y3),this.point(this._x4,this._y4)}},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._x2=e,this._y2=t;break;case 1:this._point=2,this._x3=e,this._y3=t;break;case 2:this._point=3,this._x4=e,this._y4=t,this._context.moveTo((this._x0+4*this._x1+e)/6,(this._y0+4*this._y1+t)/6);break;default:IC(this,e,t)}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}},zC.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){(this._line||0!==this._line&&3===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3;var n=(this._x0+4*this._x1+e)/6,r=(this._y0+4*this._y1+t)/6;this._line?this._context.lineTo(n,r):this._context.moveTo(n,r);break;case 3:this._point=4;default:IC(this,e,t)}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};class $C{constructor(e,t){this._context=e,this._x=t}areaStart(){this._line=0}areaEnd(){this._line=NaN}lineStart(){this._point=0}lineEnd(){(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line}point(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:this._x?this._context.bezierCurveTo(this._x0=(this._x0+e)/2,this._y0,this._x0,t,e,t):this._context.bezierCurveTo(this._x0,this._y0=(this._y0+t)/2,e,this._y0,e,t)}this._x0=e,this._y0=t}}function BC(e){this._context=e}function FC(e){this._context=e}function WC(e){return new FC(e)}function UC(e){return e<0?-1:1}function HC(e,t,n){var r=e._x1-e._x0,o=t-e._x1,i=(e._y1-e._y0)/(r||o<0&&-0),a=(n-e._y1)/(o||r<0&&-0),l=(i*o+a*r)/(r+o);return(UC(i)+UC(a))*Math.min(Math.abs(i),Math.abs(a),.5*Math.abs(l))||0}function VC(e,t){var n=e._x1-e._x0;return n?(3*(e._y1-e._y0)/n-t)/2:t}function qC(e,t,n){var r=e._x0,o=e._y0,i=e._x1,a=e._y1,l=(i-r)/3;e._context.bezierCurveTo(r+l,o+l*t,i-l,a-l*n,i,a)}function XC(e){this._context=e}function KC(e){this._context=new GC(e)}function GC(e){this._context=e}function YC(e){this._context=e}function QC(e){var t,n,r=e.length-1,o=new Array(r),i=new Array(r),a=new Array(r);for(o[0]=0,i[0]=2,a[0]=e[0]+2*e[1],t=1;t<r-1;++t)o[t]=1,i[t]=4,a[t]=4*e[t]+2*e[t+1];for(o[r-1]=2,i[r-1]=7,a[r-1]=8*e[r-1]+e[r],t=1;t<r;++t)n=o[t]/i[t-1],i[t]-=n,a[t]-=n*a[t-1];for(o[r-1]=a[r-1]/i[r-1],t=r-2;t>=0;--t)o[t]=(a[t]-o[t+1])/i[t];for(i[r-1]=(e[r]+o[r-1])/2,t=0;t<r-1;++t)i[t]=2*e[t+1]-o[t+1];return[o,i]}function JC(e,t){this._context=e,this._t=t}function ZC(e){return e[0]}function eP(e){return e[1]}function tP(e,t){var n=Bh(!0),r=null,o=WC,i=null,a=Xh(l);function l(l){var s,u,c,d=(l=cA(l)).length,f=!1;for(null==r&&(i=o(c=a())),s=0;s<=d;++s)!(s<d&&n(u=l[s],s,l))===f&&((f=!f)?i.lineStart():i.lineEnd()),f&&i.point(+e(u,s,l),+t(u,s,l));if(c)return i=null,c+""||null}return e="function"===typeof e?e:void 0===e?ZC:Bh(e),t="function"===typeof t?t:void 0===t?eP:Bh(t),l.x=function(t){return arguments.length?(e="function"===typeof t?t:Bh(+t),l):e},l.y=function(e){return arguments.length?(t="function"===typeof e?e:Bh(+e),l):t},l.defined=function(e){return arguments.length?(n="function"===typeof e?e:Bh(!!e),l):n},l.curve=function(e){return arguments.length?(o=e,null!=r&&(i=o(r)),l):o},l.context=function(e){return arguments.length?(null==e?r=i=null:i=o(r=e),l):r},l}function nP(e,t,n){var r=null,o=Bh(!0),i=null,a=WC,l=null,s=Xh(u);function u(u){var c,d,f,p,h,m=(u=cA(u)).length,y=!1,v=new Array(m),g=new Array(m);for(null==i&&(l=a(h=s())),c=0;c<=m;++c){if(!(c<m&&o(p=u[c],c,u))===y)if(y=!y)d=c,l.areaStart(),l.lineStart();else{for(l.lineEnd(),l.lineStart(),f=c-1;f>=d;--f)l.point(v[f],g[f]);l.lineEnd(),l.areaEnd()}y&&(v[c]=+e(p,c,u),g[c]=+t(p,c,u),l.point(r?+r(p,c,u):v[c],n?+n(p,c,u):g[c]))}if(h)return l=null,h+""||null}function c(){return tP().defined(o).curve(a).context(i)}return e="function"===typeof e?e:void 0===e?ZC:Bh(+e),t="function"===typeof t?t:Bh(void 0===t?0:+t),n="function"===typeof n?n:void 0===n?eP:Bh(+n),u.x=function(t){return arguments.length?(e="function"===typeof t?t:Bh(+t),r=null,u):e},u.x0=function(t){return arguments.length?(e="function"===typeof t?t:Bh(+t),u):e},u.x1=function(e){return arguments.length?(r=null==e?null:"function"===typeof e?e:Bh(+e),u):r},u.y=function(e){return arguments.length?(t="function"===typeof e?e:Bh(+e),n=null,u):t},u.y0=function(e){return arguments.length?(t="function"===typeof e?e:Bh(+e),u):t},u.y1=function(e){return arguments.length?(n=null==e?null:"function"===typeof e?e:Bh(+e),u):n},u.lineX0=u.lineY0=function(){return c().x(e).y(t)},u.lineY1=function(){return c().x(e).y(n)},u.lineX1=function(){return c().x(r).y(t)},u.defined=function(e){return arguments.length?(o="function"===typeof e?e:Bh(!!e),u):o},u.curve=function(e){return arguments.length?(a=e,null!=i&&(l=a(i)),u):a},u.context=function(e){return arguments.length?(null==e?i=l=null:l=a(i=e),u):i},u}function rP(e){return rP="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},rP(e)}function oP(){return oP=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},oP.apply(this,arguments)}function iP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function aP(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?iP(Object(n),!0).forEach((function(t){lP(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):iP(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function lP(e,t,n){return t=function(e){var t=function(e,t){if("object"!=rP(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=rP(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==rP(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}BC.prototype={areaStart:NC,areaEnd:NC,lineStart:function(){this._point=0},lineEnd:function(){this._point&&this._context.closePath()},point:function(e,t){e=+e,t=+t,this._point?this._context.lineTo(e,t):(this._point=1,this._context.moveTo(e,t))}},FC.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:this._context.lineTo(e,t)}}},XC.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=this._t0=NaN,this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x1,this._y1);break;case 3:qC(this,this._t0,VC(this,this._t0))}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){var n=NaN;if(t=+t,(e=+e)!==this._x1||t!==this._y1){switch(this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,qC(this,VC(this,n=HC(this,e,t)),n);break;default:qC(this,this._t0,n=HC(this,e,t))}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t,this._t0=n}}},(KC.prototype=Object.create(XC.prototype)).point=function(e,t){XC.prototype.point.call(this,t,e)},GC.prototype={moveTo:function(e,t){this._context.moveTo(t,e)},closePath:function(){this._context.closePath()},lineTo:function(e,t){this._context.lineTo(t,e)},bezierCurveTo:function(e,t,n,r,o,i){this._context.bezierCurveTo(t,e,r,n,i,o)}},YC.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=[],this._y=[]},lineEnd:function(){var e=this._x,t=this._y,n=e.length;if(n)if(this._line?this._context.lineTo(e[0],t[0]):this._context.moveTo(e[0],t[0]),2===n)this._context.lineTo(e[1],t[1]);else for(var r=QC(e),o=QC(t),i=0,a=1;a<n;++i,++a)this._context.bezierCurveTo(r[0][i],o[0][i],r[1][i],o[1][i],e[a],t[a]);(this._line||0!==this._line&&1===n)&&this._context.closePath(),this._line=1-this._line,this._x=this._y=null},point:function(e,t){this._x.push(+e),this._y.push(+t)}},JC.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=this._y=NaN,this._point=0},lineEnd:function(){0<this._t&&this._t<1&&2===this._point&&this._context.lineTo(this._x,this._y),(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line>=0&&(this._t=1-this._t,this._line=1-this._line)},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:if(this._t<=0)this._context.lineTo(this._x,t),this._context.lineTo(e,t);else{var n=this._x*(1-this._t)+e*this._t;this._context.lineTo(n,this._y),this._context.lineTo(n,t)}}this._x=e,this._y=t}};var sP={curveBasisClosed:function(e){return new LC(e)},curveBasisOpen:function(e){return new zC(e)},curveBasis:function(e){return new DC(e)},curveBumpX:function(e){return new $C(e,!0)},curveBumpY:function(e){return new $C(e,!1)},curveLinearClosed:function(e){return new BC(e)},curveLinear:WC,curveMonotoneX:function(e){return new XC(e)},curveMonotoneY:function(e){return new KC(e)},curveNatural:function(e){return new YC(e)},curveStep:function(e){return new JC(e,.5)},curveStepAfter:function(e){return new JC(e,1)},curveStepBefore:function(e){return new JC(e,0)}},uP=function(e){return e.x===+e.x&&e.y===+e.y},cP=function(e){return e.x},dP=function(e){return e.y},fP=function(e){var t,n=e.type,r=void 0===n?"linear":n,o=e.points,i=void 0===o?[]:o,a=e.baseLine,l=e.layout,s=e.connectNulls,u=void 0!==s&&s,c=function(e,t){if(_f()(e))return e;var n="curve".concat(vh()(e));return"curveMonotone"!==n&&"curveBump"!==n||!t?sP[n]||WC:sP["".concat(n).concat("vertical"===t?"Y":"X")]}(r,l),d=u?i.filter((function(e){return uP(e)})):i;if(Array.isArray(a)){var f=u?a.filter((function(e){return uP(e)})):a,p=d.map((function(e,t){return aP(aP({},e),{},{base:f[t]})}));return(t="vertical"===l?nP().y(dP).x1(cP).x0((function(e){return e.base.x})):nP().x(cP).y1(dP).y0((function(e){return e.base.y}))).defined(uP).curve(c),t(p)}return(t="vertical"===l&&bf(a)?nP().y(dP).x1(cP).x0(a):bf(a)?nP().x(cP).y1(dP).y0(a):tP().x(cP).y(dP)).defined(uP).curve(c),t(d)},pP=function(e){var n=e.className,r=e.points,o=e.path,i=e.pathRef;if((!r||!r.length)&&!o)return null;var a=r&&r.length?fP(e):o;return t.createElement("path",oP({},rp(e,!1),Wf(e),{className:zt("recharts-curve",n),d:a,ref:i}))};function hP(e){return hP="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},hP(e)}var mP=["x","y","top","left","width","height","className"];function yP(){return yP=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},yP.apply(this,arguments)}function vP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function gP(e,t,n){return t=function(e){var t=function(e,t){if("object"!=hP(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=hP(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==hP(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function bP(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var xP=function(e,t,n,r,o,i){return"M".concat(e,",").concat(o,"v").concat(r,"M").concat(i,",").concat(t,"h").concat(n)},wP=function(e){var n=e.x,r=void 0===n?0:n,o=e.y,i=void 0===o?0:o,a=e.top,l=void 0===a?0:a,s=e.left,u=void 0===s?0:s,c=e.width,d=void 0===c?0:c,f=e.height,p=void 0===f?0:f,h=e.className,m=function(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?vP(Object(n),!0).forEach((function(t){gP(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):vP(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}({x:r,y:i,top:l,left:u,width:d,height:p},bP(e,mP));return bf(r)&&bf(i)&&bf(d)&&bf(p)&&bf(l)&&bf(u)?t.createElement("path",yP({},rp(m,!0),{className:zt("recharts-cross",h),d:xP(r,i,d,p,l,u)})):null};function SP(e){var t=e.cx,n=e.cy,r=e.radius,o=e.startAngle,i=e.endAngle;return{points:[gk(t,n,r,o),gk(t,n,r,i)],cx:t,cy:n,radius:r,startAngle:o,endAngle:i}}function AP(e,t,n){var r,o,i,a;if("horizontal"===e)i=r=t.x,o=n.top,a=n.top+n.height;else if("vertical"===e)a=o=t.y,r=n.left,i=n.left+n.width;else if(null!=t.cx&&null!=t.cy){if("centric"!==e)return SP(t);var l=t.cx,s=t.cy,u=t.innerRadius,c=t.outerRadius,d=t.angle,f=gk(l,s,u,d),p=gk(l,s,c,d);r=f.x,o=f.y,i=p.x,a=p.y}return[{x:r,y:o},{x:i,y:a}]}function OP(e){return OP="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},OP(e)}function kP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function jP(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?kP(Object(n),!0).forEach((function(t){EP(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):kP(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function EP(e,t,n){return t=function(e){var t=function(e,t){if("object"!=OP(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=OP(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==OP(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function CP(e){var n,r,o,i=e.element,a=e.tooltipEventType,l=e.isActive,s=e.activeCoordinate,u=e.activePayload,c=e.offset,d=e.activeTooltipIndex,f=e.tooltipAxisBandSize,p=e.layout,h=e.chartName,m=null!==(n=i.props.cursor)&&void 0!==n?n:null===(r=i.type.defaultProps)||void 0===r?void 0:r.cursor;if(!i||!m||!l||!s||"ScatterChart"!==h&&"axis"!==a)return null;var y=pP;if("ScatterChart"===h)o=s,y=wP;else if("BarChart"===h)o=function(e,t,n,r){var o=r/2;return{stroke:"none",fill:"#ccc",x:"horizontal"===e?t.x-o:n.left+.5,y:"horizontal"===e?n.top+.5:t.y-o,width:"horizontal"===e?r:n.width-1,height:"horizontal"===e?n.height-1:r}}(p,s,c,f),y=vv;else if("radial"===p){var v=SP(s),g=v.cx,b=v.cy,x=v.radius;o={cx:g,cy:b,startAngle:v.startAngle,endAngle:v.endAngle,innerRadius:x,outerRadius:x},y=Oj}else o={points:AP(p,s,c)},y=pP;var w=jP(jP(jP(jP({stroke:"#ccc",pointerEvents:"none"},c),o),rp(m,!1)),{},{payload:u,payloadIndex:d,className:zt("recharts-tooltip-cursor",m.className)});return(0,t.isValidElement)(m)?(0,t.cloneElement)(m,w):(0,t.createElement)(y,w)}var PP=["item"],MP=["children","className","width","height","style","compact","title","desc"];function TP(e){return TP="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},TP(e)}function _P(){return _P=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},_P.apply(this,arguments)}function RP(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||FP(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function NP(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function IP(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,qP(r.key),r)}}function DP(e,t,n){return t=zP(t),function(e,t){if(t&&("object"===TP(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,LP()?Reflect.construct(t,n||[],zP(e).constructor):t.apply(e,n))}function LP(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(LP=function(){return!!e})()}function zP(e){return zP=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},zP(e)}function $P(e,t){return $P=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},$P(e,t)}function BP(e){return function(e){if(Array.isArray(e))return WP(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||FP(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function FP(e,t){if(e){if("string"===typeof e)return WP(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?WP(e,t):void 0}}function WP(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function UP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function HP(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?UP(Object(n),!0).forEach((function(t){VP(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):UP(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function VP(e,t,n){return(t=qP(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function qP(e){var t=function(e,t){if("object"!=TP(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=TP(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==TP(t)?t:t+""}var XP={xAxis:["bottom","top"],yAxis:["left","right"]},KP={width:"100%",height:"100%"},GP={x:0,y:0};function YP(e){return e}var QP=function(e,t){var n=t.graphicalItems,r=t.dataStartIndex,o=t.dataEndIndex,i=(null!==n&&void 0!==n?n:[]).reduce((function(e,t){var n=t.props.data;return n&&n.length?[].concat(BP(e),BP(n)):e}),[]);return i.length>0?i:e&&e.length&&bf(r)&&bf(o)?e.slice(r,o+1):[]};function JP(e){return"number"===e?[0,"auto"]:void 0}var ZP=function(e,t,n,r){var o=e.graphicalItems,i=e.tooltipAxis,a=QP(t,e);return n<0||!o||!o.length||n>=a.length?null:o.reduce((function(o,l){var s,u,c=null!==(s=l.props.data)&&void 0!==s?s:t;(c&&e.dataStartIndex+e.dataEndIndex!==0&&e.dataEndIndex-e.dataStartIndex>=n&&(c=c.slice(e.dataStartIndex,e.dataEndIndex+1)),i.dataKey&&!i.allowDuplicatedCategory)?u=jf(void 0===c?a:c,i.dataKey,r):u=c&&c[n]||a[n];return u?[].concat(BP(o),[VO(l,u)]):o}),[])},eM=function(e,t,n,r){var o=r||{x:e.chartX,y:e.chartY},i=function(e,t){return"horizontal"===t?e.x:"vertical"===t?e.y:"centric"===t?e.angle:e.radius}(o,n),a=e.orderedTooltipTicks,l=e.tooltipAxis,s=e.tooltipTicks,u=function(e){var t,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],r=arguments.length>2?arguments[2]:void 0,o=arguments.length>3?arguments[3]:void 0,i=-1,a=null!==(t=null===n||void 0===n?void 0:n.length)&&void 0!==t?t:0;if(a<=1)return 0;if(o&&"angleAxis"===o.axisType&&Math.abs(Math.abs(o.range[1]-o.range[0])-360)<=1e-6)for(var l=o.range,s=0;s<a;s++){var u=s>0?r[s-1].coordinate:r[a-1].coordinate,c=r[s].coordinate,d=s>=a-1?r[0].coordinate:r[s+1].coordinate,f=void 0;if(vf(c-u)!==vf(d-c)){var p=[];if(vf(d-c)===vf(l[1]-l[0])){f=d;var h=c+l[1]-l[0];p[0]=Math.min(h,(h+u)/2),p[1]=Math.max(h,(h+u)/2)}else{f=u;var m=d+l[1]-l[0];p[0]=Math.min(c,(m+c)/2),p[1]=Math.max(c,(m+c)/2)}var y=[Math.min(c,(f+c)/2),Math.max(c,(f+c)/2)];if(e>y[0]&&e<=y[1]||e>=p[0]&&e<=p[1]){i=r[s].index;break}}else{var v=Math.min(u,d),g=Math.max(u,d);if(e>(v+c)/2&&e<=(g+c)/2){i=r[s].index;break}}}else for(var b=0;b<a;b++)if(0===b&&e<=(n[b].coordinate+n[b+1].coordinate)/2||b>0&&b<a-1&&e>(n[b].coordinate+n[b-1].coordinate)/2&&e<=(n[b].coordinate+n[b+1].coordinate)/2||b===a-1&&e>(n[b].coordinate+n[b-1].coordinate)/2){i=n[b].index;break}return i}(i,a,s,l);if(u>=0&&s){var c=s[u]&&s[u].value,d=ZP(e,t,u,c),f=function(e,t,n,r){var o=t.find((function(e){return e&&e.index===n}));if(o){if("horizontal"===e)return{x:o.coordinate,y:r.y};if("vertical"===e)return{x:r.x,y:o.coordinate};if("centric"===e){var i=o.coordinate,a=r.radius;return HP(HP(HP({},r),gk(r.cx,r.cy,a,i)),{},{angle:i,radius:a})}var l=o.coordinate,s=r.angle;return HP(HP(HP({},r),gk(r.cx,r.cy,l,s)),{},{angle:s,radius:l})}return GP}(n,a,u,o);return{activeTooltipIndex:u,activeLabel:c,activePayload:d,activeCoordinate:f}}return null},tM=function(e,t){var n=t.axes,r=t.graphicalItems,o=t.axisType,i=t.axisIdKey,a=t.stackGroups,l=t.dataStartIndex,s=t.dataEndIndex,u=e.layout,c=e.children,d=e.stackOffset,f=EO(u,o);return n.reduce((function(t,n){var p,h=void 0!==n.type.defaultProps?HP(HP({},n.type.defaultProps),n.props):n.props,m=h.type,y=h.dataKey,v=h.allowDataOverflow,g=h.allowDuplicatedCategory,b=h.scale,x=h.ticks,w=h.includeHidden,S=h[i];if(t[S])return t;var A,O,k,j=QP(e.data,{graphicalItems:r.filter((function(e){var t;return(i in e.props?e.props[i]:null===(t=e.type.defaultProps)||void 0===t?void 0:t[i])===S})),dataStartIndex:l,dataEndIndex:s}),E=j.length;(function(e,t,n){if("number"===n&&!0===t&&Array.isArray(e)){var r=null===e||void 0===e?void 0:e[0],o=null===e||void 0===e?void 0:e[1];if(r&&o&&bf(r)&&bf(o))return!0}return!1})(h.domain,v,m)&&(A=WO(h.domain,null,v),!f||"number"!==m&&"auto"===b||(k=AO(j,y,"category")));var C=JP(m);if(!A||0===A.length){var P,M=null!==(P=h.domain)&&void 0!==P?P:C;if(y){if(A=AO(j,y,m),"category"===m&&f){var T=function(e){if(!Array.isArray(e))return!1;for(var t=e.length,n={},r=0;r<t;r++){if(n[e[r]])return!0;n[e[r]]=!0}return!1}(A);g&&T?(O=A,A=mp()(0,E)):g||(A=HO(M,A,n).reduce((function(e,t){return e.indexOf(t)>=0?e:[].concat(BP(e),[t])}),[]))}else if("category"===m)A=g?A.filter((function(e){return""!==e&&!Mf()(e)})):HO(M,A,n).reduce((function(e,t){return e.indexOf(t)>=0||""===t||Mf()(t)?e:[].concat(BP(e),[t])}),[]);else if("number"===m){var _=function(e,t,n,r,o){var i=t.map((function(t){return kO(e,t,n,o,r)})).filter((function(e){return!Mf()(e)}));return i&&i.length?i.reduce((function(e,t){return[Math.min(e[0],t[0]),Math.max(e[1],t[1])]}),[1/0,-1/0]):null}(j,r.filter((function(e){var t,n,r=i in e.props?e.props[i]:null===(t=e.type.defaultProps)||void 0===t?void 0:t[i],o="hide"in e.props?e.props.hide:null===(n=e.type.defaultProps)||void 0===n?void 0:n.hide;return r===S&&(w||!o)})),y,o,u);_&&(A=_)}!f||"number"!==m&&"auto"===b||(k=AO(j,y,"category"))}else A=f?mp()(0,E):a&&a[S]&&a[S].hasStack&&"number"===m?"expand"===d?[0,1]:$O(a[S].stackGroups,l,s):jO(j,r.filter((function(e){var t=i in e.props?e.props[i]:e.type.defaultProps[i],n="hide"in e.props?e.props.hide:e.type.defaultProps.hide;return t===S&&(w||!n)})),m,u,!0);if("number"===m)A=kC(c,A,S,o,x),M&&(A=WO(M,A,v));else if("category"===m&&M){var R=M;A.every((function(e){return R.indexOf(e)>=0}))&&(A=R)}}return HP(HP({},t),{},VP({},S,HP(HP({},h),{},{axisType:o,domain:A,categoricalDomain:k,duplicateDomain:O,originalDomain:null!==(p=h.domain)&&void 0!==p?p:C,isCategorical:f,layout:u})))}),{})},nM=function(e,t){var n=t.axisType,r=void 0===n?"xAxis":n,o=t.AxisComp,i=t.graphicalItems,a=t.stackGroups,l=t.dataStartIndex,s=t.dataEndIndex,u=e.children,c="".concat(r,"Id"),d=Jf(u,o),f={};return d&&d.length?f=tM(e,{axes:d,graphicalItems:i,axisType:r,axisIdKey:c,stackGroups:a,dataStartIndex:l,dataEndIndex:s}):i&&i.length&&(f=function(e,t){var n=t.graphicalItems,r=t.Axis,o=t.axisType,i=t.axisIdKey,a=t.stackGroups,l=t.dataStartIndex,s=t.dataEndIndex,u=e.layout,c=e.children,d=QP(e.data,{graphicalItems:n,dataStartIndex:l,dataEndIndex:s}),f=d.length,p=EO(u,o),h=-1;return n.reduce((function(e,t){var m,y=(void 0!==t.type.defaultProps?HP(HP({},t.type.defaultProps),t.props):t.props)[i],v=JP("number");return e[y]?e:(h++,p?m=mp()(0,f):a&&a[y]&&a[y].hasStack?(m=$O(a[y].stackGroups,l,s),m=kC(c,m,y,o)):(m=WO(v,jO(d,n.filter((function(e){var t,n,r=i in e.props?e.props[i]:null===(t=e.type.defaultProps)||void 0===t?void 0:t[i],o="hide"in e.props?e.props.hide:null===(n=e.type.defaultProps)||void 0===n?void 0:n.hide;return r===y&&!o})),"number",u),r.defaultProps.allowDataOverflow),m=kC(c,m,y,o)),HP(HP({},e),{},VP({},y,HP(HP({axisType:o},r.defaultProps),{},{hide:!0,orientation:hf()(XP,"".concat(o,".").concat(h%2),null),domain:m,originalDomain:v,isCategorical:p,layout:u}))))}),{})}(e,{Axis:o,graphicalItems:i,axisType:r,axisIdKey:c,stackGroups:a,dataStartIndex:l,dataEndIndex:s})),f},rM=function(e){var t=e.children,n=e.defaultShowTooltip,r=Zf(t,uk),o=0,i=0;return e.data&&0!==e.data.length&&(i=e.data.length-1),r&&r.props&&(r.props.startIndex>=0&&(o=r.props.startIndex),r.props.endIndex>=0&&(i=r.props.endIndex)),{chartX:0,chartY:0,dataStartIndex:o,dataEndIndex:i,activeTooltipIndex:-1,isTooltipActive:Boolean(n)}},oM=function(e){return"horizontal"===e?{numericAxisName:"yAxis",cateAxisName:"xAxis"}:"vertical"===e?{numericAxisName:"xAxis",cateAxisName:"yAxis"}:"centric"===e?{numericAxisName:"radiusAxis",cateAxisName:"angleAxis"}:{numericAxisName:"angleAxis",cateAxisName:"radiusAxis"}},iM=function(e,t){var n=e.props,r=(e.graphicalItems,e.xAxisMap),o=void 0===r?{}:r,i=e.yAxisMap,a=void 0===i?{}:i,l=n.width,s=n.height,u=n.children,c=n.margin||{},d=Zf(u,uk),f=Zf(u,Pm),p=Object.keys(a).reduce((function(e,t){var n=a[t],r=n.orientation;return n.mirror||n.hide?e:HP(HP({},e),{},VP({},r,e[r]+n.width))}),{left:c.left||0,right:c.right||0}),h=Object.keys(o).reduce((function(e,t){var n=o[t],r=n.orientation;return n.mirror||n.hide?e:HP(HP({},e),{},VP({},r,hf()(e,"".concat(r))+n.height))}),{top:c.top||0,bottom:c.bottom||0}),m=HP(HP({},h),p),y=m.bottom;d&&(m.bottom+=d.props.height||uk.defaultProps.height),f&&t&&(m=function(e,t,n,r){var o=n.children,i=n.width,a=n.margin,l=i-(a.left||0)-(a.right||0),s=mO({children:o,legendWidth:l});if(s){var u=r||{},c=u.width,d=u.height,f=s.align,p=s.verticalAlign,h=s.layout;if(("vertical"===h||"horizontal"===h&&"middle"===p)&&"center"!==f&&bf(e[f]))return xO(xO({},e),{},wO({},f,e[f]+(c||0)));if(("horizontal"===h||"vertical"===h&&"center"===f)&&"middle"!==p&&bf(e[p]))return xO(xO({},e),{},wO({},p,e[p]+(d||0)))}return e}(m,0,n,t));var v=l-m.left-m.right,g=s-m.top-m.bottom;return HP(HP({brushBottom:y},m),{},{width:Math.max(v,0),height:Math.max(g,0)})},aM=function(e,t){return"xAxis"===t?e[t].width:"yAxis"===t?e[t].height:void 0},lM=function(e){var n=e.chartName,r=e.GraphicalChild,o=e.defaultTooltipEventType,i=void 0===o?"axis":o,a=e.validateTooltipEventTypes,l=void 0===a?["axis"]:a,s=e.axisComponents,u=e.legendContent,c=e.formatAxisMap,d=e.defaultProps,f=function(e,t){var n=t.graphicalItems,r=t.stackGroups,o=t.offset,i=t.updateId,a=t.dataStartIndex,l=t.dataEndIndex,u=e.barSize,c=e.layout,d=e.barGap,f=e.barCategoryGap,p=e.maxBarSize,h=oM(c),m=h.numericAxisName,y=h.cateAxisName,v=function(e){return!(!e||!e.length)&&e.some((function(e){var t=Kf(e&&e.type);return t&&t.indexOf("Bar")>=0}))}(n),g=[];return n.forEach((function(n,h){var b=QP(e.data,{graphicalItems:[n],dataStartIndex:a,dataEndIndex:l}),x=void 0!==n.type.defaultProps?HP(HP({},n.type.defaultProps),n.props):n.props,w=x.dataKey,S=x.maxBarSize,A=x["".concat(m,"Id")],O=x["".concat(y,"Id")],k=s.reduce((function(e,n){var r=t["".concat(n.axisType,"Map")],o=x["".concat(n.axisType,"Id")];r&&r[o]||"zAxis"===n.axisType||bp(!1);var i=r[o];return HP(HP({},e),{},VP(VP({},n.axisType,i),"".concat(n.axisType,"Ticks"),PO(i)))}),{}),j=k[y],E=k["".concat(y,"Ticks")],C=r&&r[A]&&r[A].hasStack&&function(e,t){var n,r=(null!==(n=e.type)&&void 0!==n&&n.defaultProps?xO(xO({},e.type.defaultProps),e.props):e.props).stackId;if(xf(r)){var o=t[r];if(o){var i=o.items.indexOf(e);return i>=0?o.stackedData[i]:null}}return null}(n,r[A].stackGroups),P=Kf(n.type).indexOf("Bar")>=0,M=UO(j,E),T=[],_=v&&function(e){var t=e.barSize,n=e.totalSize,r=e.stackGroups,o=void 0===r?{}:r;if(!o)return{};for(var i={},a=Object.keys(o),l=0,s=a.length;l<s;l++)for(var u=o[a[l]].stackGroups,c=Object.keys(u),d=0,f=c.length;d<f;d++){var p=u[c[d]],h=p.items,m=p.cateAxisId,y=h.filter((function(e){return Kf(e.type).indexOf("Bar")>=0}));if(y&&y.length){var v=y[0].type.defaultProps,g=void 0!==v?xO(xO({},v),y[0].props):y[0].props,b=g.barSize,x=g[m];i[x]||(i[x]=[]);var w=Mf()(b)?t:b;i[x].push({item:y[0],stackList:y.slice(1),barSize:Mf()(w)?void 0:Af(w,n,0)})}}return i}({barSize:u,stackGroups:r,totalSize:aM(k,y)});if(P){var R,N,I=Mf()(S)?p:S,D=null!==(R=null!==(N=UO(j,E,!0))&&void 0!==N?N:I)&&void 0!==R?R:0;T=function(e){var t=e.barGap,n=e.barCategoryGap,r=e.bandSize,o=e.sizeList,i=void 0===o?[]:o,a=e.maxBarSize,l=i.length;if(l<1)return null;var s,u=Af(t,r,0,!0),c=[];if(i[0].barSize===+i[0].barSize){var d=!1,f=r/l,p=i.reduce((function(e,t){return e+t.barSize||0}),0);(p+=(l-1)*u)>=r&&(p-=(l-1)*u,u=0),p>=r&&f>0&&(d=!0,p=l*(f*=.9));var h={offset:((r-p)/2|0)-u,size:0};s=i.reduce((function(e,t){var n={item:t.item,position:{offset:h.offset+h.size+u,size:d?f:t.barSize}},r=[].concat(vO(e),[n]);return h=r[r.length-1].position,t.stackList&&t.stackList.length&&t.stackList.forEach((function(e){r.push({item:e,position:h})})),r}),c)}else{var m=Af(n,r,0,!0);r-2*m-(l-1)*u<=0&&(u=0);var y=(r-2*m-(l-1)*u)/l;y>1&&(y>>=0);var v=a===+a?Math.min(y,a):y;s=i.reduce((function(e,t,n){var r=[].concat(vO(e),[{item:t.item,position:{offset:m+(y+u)*n+(y-v)/2,size:v}}]);return t.stackList&&t.stackList.length&&t.stackList.forEach((function(e){r.push({item:e,position:r[r.length-1].position})})),r}),c)}return s}({barGap:d,barCategoryGap:f,bandSize:D!==M?D:M,sizeList:_[O],maxBarSize:I}),D!==M&&(T=T.map((function(e){return HP(HP({},e),{},{position:HP(HP({},e.position),{},{offset:e.position.offset-D/2})})})))}var L,z,$=n&&n.type&&n.type.getComposedData;$&&g.push({props:HP(HP({},$(HP(HP({},k),{},{displayedData:b,props:e,dataKey:w,item:n,bandSize:M,barPosition:T,offset:o,stackedData:C,layout:c,dataStartIndex:a,dataEndIndex:l}))),{},VP(VP(VP({key:n.key||"item-".concat(h)},m,k[m]),y,k[y]),"animationId",i)),childIndex:(L=n,z=e.children,Qf(z).indexOf(L)),item:n})})),g},p=function(e,t){var o=e.props,i=e.dataStartIndex,a=e.dataEndIndex,l=e.updateId;if(!ep({props:o}))return null;var u=o.children,d=o.layout,p=o.stackOffset,h=o.data,m=o.reverseStackOrder,y=oM(d),v=y.numericAxisName,g=y.cateAxisName,b=Jf(u,r),x=function(e,t,n,r,o,i){if(!e)return null;var a=(i?t.reverse():t).reduce((function(e,t){var o,i=null!==(o=t.type)&&void 0!==o&&o.defaultProps?xO(xO({},t.type.defaultProps),t.props):t.props,a=i.stackId;if(i.hide)return e;var l=i[n],s=e[l]||{hasStack:!1,stackGroups:{}};if(xf(a)){var u=s.stackGroups[a]||{numericAxisId:n,cateAxisId:r,items:[]};u.items.push(t),s.hasStack=!0,s.stackGroups[a]=u}else s.stackGroups[Sf("_stackId_")]={numericAxisId:n,cateAxisId:r,items:[t]};return xO(xO({},e),{},wO({},l,s))}),{});return Object.keys(a).reduce((function(t,i){var l=a[i];return l.hasStack&&(l.stackGroups=Object.keys(l.stackGroups).reduce((function(t,i){var a=l.stackGroups[i];return xO(xO({},t),{},wO({},i,{numericAxisId:n,cateAxisId:r,items:a.items,stackedData:DO(e,a.items,o)}))}),{})),xO(xO({},t),{},wO({},i,l))}),{})}(h,b,"".concat(v,"Id"),"".concat(g,"Id"),p,m),w=s.reduce((function(e,t){var n="".concat(t.axisType,"Map");return HP(HP({},e),{},VP({},n,nM(o,HP(HP({},t),{},{graphicalItems:b,stackGroups:t.axisType===v&&x,dataStartIndex:i,dataEndIndex:a}))))}),{}),S=iM(HP(HP({},w),{},{props:o,graphicalItems:b}),null===t||void 0===t?void 0:t.legendBBox);Object.keys(w).forEach((function(e){w[e]=c(o,w[e],S,e.replace("Map",""),n)}));var A=function(e){var t=Of(e),n=PO(t,!1,!0);return{tooltipTicks:n,orderedTooltipTicks:vp()(n,(function(e){return e.coordinate})),tooltipAxis:t,tooltipAxisBandSize:UO(t,n)}}(w["".concat(g,"Map")]),O=f(o,HP(HP({},w),{},{dataStartIndex:i,dataEndIndex:a,updateId:l,graphicalItems:b,stackGroups:x,offset:S}));return HP(HP({formattedGraphicalItems:O,graphicalItems:b,offset:S,stackGroups:x},A),w)},h=function(e){function r(e){var o,i,a;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,r),VP(a=DP(this,r,[e]),"eventEmitterSymbol",Symbol("rechartsEventEmitter")),VP(a,"accessibilityManager",new RC),VP(a,"handleLegendBBoxUpdate",(function(e){if(e){var t=a.state,n=t.dataStartIndex,r=t.dataEndIndex,o=t.updateId;a.setState(HP({legendBBox:e},p({props:a.props,dataStartIndex:n,dataEndIndex:r,updateId:o},HP(HP({},a.state),{},{legendBBox:e}))))}})),VP(a,"handleReceiveSyncEvent",(function(e,t,n){if(a.props.syncId===e){if(n===a.eventEmitterSymbol&&"function"!==typeof a.props.syncMethod)return;a.applySyncEvent(t)}})),VP(a,"handleBrushChange",(function(e){var t=e.startIndex,n=e.endIndex;if(t!==a.state.dataStartIndex||n!==a.state.dataEndIndex){var r=a.state.updateId;a.setState((function(){return HP({dataStartIndex:t,dataEndIndex:n},p({props:a.props,dataStartIndex:t,dataEndIndex:n,updateId:r},a.state))})),a.triggerSyncEvent({dataStartIndex:t,dataEndIndex:n})}})),VP(a,"handleMouseEnter",(function(e){var t=a.getMouseInfo(e);if(t){var n=HP(HP({},t),{},{isTooltipActive:!0});a.setState(n),a.triggerSyncEvent(n);var r=a.props.onMouseEnter;_f()(r)&&r(n,e)}})),VP(a,"triggeredAfterMouseMove",(function(e){var t=a.getMouseInfo(e),n=t?HP(HP({},t),{},{isTooltipActive:!0}):{isTooltipActive:!1};a.setState(n),a.triggerSyncEvent(n);var r=a.props.onMouseMove;_f()(r)&&r(n,e)})),VP(a,"handleItemMouseEnter",(function(e){a.setState((function(){return{isTooltipActive:!0,activeItem:e,activePayload:e.tooltipPayload,activeCoordinate:e.tooltipPosition||{x:e.cx,y:e.cy}}}))})),VP(a,"handleItemMouseLeave",(function(){a.setState((function(){return{isTooltipActive:!1}}))})),VP(a,"handleMouseMove",(function(e){e.persist(),a.throttleTriggeredAfterMouseMove(e)})),VP(a,"handleMouseLeave",(function(e){a.throttleTriggeredAfterMouseMove.cancel();var t={isTooltipActive:!1};a.setState(t),a.triggerSyncEvent(t);var n=a.props.onMouseLeave;_f()(n)&&n(t,e)})),VP(a,"handleOuterEvent",(function(e){var t,n=function(e){var t=e&&e.type;return t&&Xf[t]?Xf[t]:null}(e),r=hf()(a.props,"".concat(n));n&&_f()(r)&&r(null!==(t=/.*touch.*/i.test(n)?a.getMouseInfo(e.changedTouches[0]):a.getMouseInfo(e))&&void 0!==t?t:{},e)})),VP(a,"handleClick",(function(e){var t=a.getMouseInfo(e);if(t){var n=HP(HP({},t),{},{isTooltipActive:!0});a.setState(n),a.triggerSyncEvent(n);var r=a.props.onClick;_f()(r)&&r(n,e)}})),VP(a,"handleMouseDown",(function(e){var t=a.props.onMouseDown;_f()(t)&&t(a.getMouseInfo(e),e)})),VP(a,"handleMouseUp",(function(e){var t=a.props.onMouseUp;_f()(t)&&t(a.getMouseInfo(e),e)})),VP(a,"handleTouchMove",(function(e){null!=e.changedTouches&&e.changedTouches.length>0&&a.throttleTriggeredAfterMouseMove(e.changedTouches[0])})),VP(a,"handleTouchStart",(function(e){null!=e.changedTouches&&e.changedTouches.length>0&&a.handleMouseDown(e.changedTouches[0])})),VP(a,"handleTouchEnd",(function(e){null!=e.changedTouches&&e.changedTouches.length>0&&a.handleMouseUp(e.changedTouches[0])})),VP(a,"handleDoubleClick",(function(e){var t=a.props.onDoubleClick;_f()(t)&&t(a.getMouseInfo(e),e)})),VP(a,"handleContextMenu",(function(e){var t=a.props.onContextMenu;_f()(t)&&t(a.getMouseInfo(e),e)})),VP(a,"triggerSyncEvent",(function(e){void 0!==a.props.syncId&&EC.emit(CC,a.props.syncId,e,a.eventEmitterSymbol)})),VP(a,"applySyncEvent",(function(e){var t=a.props,n=t.layout,r=t.syncMethod,o=a.state.updateId,i=e.dataStartIndex,l=e.dataEndIndex;if(void 0!==e.dataStartIndex||void 0!==e.dataEndIndex)a.setState(HP({dataStartIndex:i,dataEndIndex:l},p({props:a.props,dataStartIndex:i,dataEndIndex:l,updateId:o},a.state)));else if(void 0!==e.activeTooltipIndex){var s=e.chartX,u=e.chartY,c=e.activeTooltipIndex,d=a.state,f=d.offset,h=d.tooltipTicks;if(!f)return;if("function"===typeof r)c=r(h,e);else if("value"===r){c=-1;for(var m=0;m<h.length;m++)if(h[m].value===e.activeLabel){c=m;break}}var y=HP(HP({},f),{},{x:f.left,y:f.top}),v=Math.min(s,y.x+y.width),g=Math.min(u,y.y+y.height),b=h[c]&&h[c].value,x=ZP(a.state,a.props.data,c),w=h[c]?{x:"horizontal"===n?h[c].coordinate:v,y:"horizontal"===n?g:h[c].coordinate}:GP;a.setState(HP(HP({},e),{},{activeLabel:b,activeCoordinate:w,activePayload:x,activeTooltipIndex:c}))}else a.setState(e)})),VP(a,"renderCursor",(function(e){var r,o=a.state,i=o.isTooltipActive,l=o.activeCoordinate,s=o.activePayload,u=o.offset,c=o.activeTooltipIndex,d=o.tooltipAxisBandSize,f=a.getTooltipEventType(),p=null!==(r=e.props.active)&&void 0!==r?r:i,h=a.props.layout,m=e.key||"_recharts-cursor";return t.createElement(CP,{key:m,activeCoordinate:l,activePayload:s,activeTooltipIndex:c,chartName:n,element:e,isActive:p,layout:h,offset:u,tooltipAxisBandSize:d,tooltipEventType:f})})),VP(a,"renderPolarAxis",(function(e,n,r){var o=hf()(e,"type.axisType"),i=hf()(a.state,"".concat(o,"Map")),l=e.type.defaultProps,s=void 0!==l?HP(HP({},l),e.props):e.props,u=i&&i[s["".concat(o,"Id")]];return(0,t.cloneElement)(e,HP(HP({},u),{},{className:zt(o,u.className),key:e.key||"".concat(n,"-").concat(r),ticks:PO(u,!0)}))})),VP(a,"renderPolarGrid",(function(e){var n=e.props,r=n.radialLines,o=n.polarAngles,i=n.polarRadius,l=a.state,s=l.radiusAxisMap,u=l.angleAxisMap,c=Of(s),d=Of(u),f=d.cx,p=d.cy,h=d.innerRadius,m=d.outerRadius;return(0,t.cloneElement)(e,{polarAngles:Array.isArray(o)?o:PO(d,!0).map((function(e){return e.coordinate})),polarRadius:Array.isArray(i)?i:PO(c,!0).map((function(e){return e.coordinate})),cx:f,cy:p,innerRadius:h,outerRadius:m,key:e.key||"polar-grid",radialLines:r})})),VP(a,"renderLegend",(function(){var e=a.state.formattedGraphicalItems,n=a.props,r=n.children,o=n.width,i=n.height,l=a.props.margin||{},s=o-(l.left||0)-(l.right||0),c=mO({children:r,formattedGraphicalItems:e,legendWidth:s,legendContent:u});if(!c)return null;var d=c.item,f=NP(c,PP);return(0,t.cloneElement)(d,HP(HP({},f),{},{chartWidth:o,chartHeight:i,margin:l,onBBoxUpdate:a.handleLegendBBoxUpdate}))})),VP(a,"renderTooltip",(function(){var e,n=a.props,r=n.children,o=n.accessibilityLayer,i=Zf(r,mh);if(!i)return null;var l=a.state,s=l.isTooltipActive,u=l.activeCoordinate,c=l.activePayload,d=l.activeLabel,f=l.offset,p=null!==(e=i.props.active)&&void 0!==e?e:s;return(0,t.cloneElement)(i,{viewBox:HP(HP({},f),{},{x:f.left,y:f.top}),active:p,label:d,payload:p?c:[],coordinate:u,accessibilityLayer:o})})),VP(a,"renderBrush",(function(e){var n=a.props,r=n.margin,o=n.data,i=a.state,l=i.offset,s=i.dataStartIndex,u=i.dataEndIndex,c=i.updateId;return(0,t.cloneElement)(e,{key:e.key||"_recharts-brush",onChange:TO(a.handleBrushChange,e.props.onChange),data:o,x:bf(e.props.x)?e.props.x:l.left,y:bf(e.props.y)?e.props.y:l.top+l.height+l.brushBottom-(r.bottom||0),width:bf(e.props.width)?e.props.width:l.width,startIndex:s,endIndex:u,updateId:"brush-".concat(c)})})),VP(a,"renderReferenceElement",(function(e,n,r){if(!e)return null;var o=a.clipPathId,i=a.state,l=i.xAxisMap,s=i.yAxisMap,u=i.offset,c=e.type.defaultProps||{},d=e.props,f=d.xAxisId,p=void 0===f?c.xAxisId:f,h=d.yAxisId,m=void 0===h?c.yAxisId:h;return(0,t.cloneElement)(e,{key:e.key||"".concat(n,"-").concat(r),xAxis:l[p],yAxis:s[m],viewBox:{x:u.left,y:u.top,width:u.width,height:u.height},clipPathId:o})})),VP(a,"renderActivePoints",(function(e){var t=e.item,n=e.activePoint,o=e.basePoint,i=e.childIndex,a=e.isRange,l=[],s=t.props.key,u=void 0!==t.item.type.defaultProps?HP(HP({},t.item.type.defaultProps),t.item.props):t.item.props,c=u.activeDot,d=HP(HP({index:i,dataKey:u.dataKey,cx:n.x,cy:n.y,r:4,fill:OO(t.item),strokeWidth:2,stroke:"#fff",payload:n.payload,value:n.value},rp(c,!1)),Wf(c));return l.push(r.renderActiveDot(c,d,"".concat(s,"-activePoint-").concat(i))),o?l.push(r.renderActiveDot(c,HP(HP({},d),{},{cx:o.x,cy:o.y}),"".concat(s,"-basePoint-").concat(i))):a&&l.push(null),l})),VP(a,"renderGraphicChild",(function(e,n,r){var o=a.filterFormatItem(e,n,r);if(!o)return null;var i=a.getTooltipEventType(),l=a.state,s=l.isTooltipActive,u=l.tooltipAxis,c=l.activeTooltipIndex,d=l.activeLabel,f=Zf(a.props.children,mh),p=o.props,h=p.points,m=p.isRange,y=p.baseLine,v=void 0!==o.item.type.defaultProps?HP(HP({},o.item.type.defaultProps),o.item.props):o.item.props,g=v.activeDot,b=v.hide,x=v.activeBar,w=v.activeShape,S=Boolean(!b&&s&&f&&(g||x||w)),A={};"axis"!==i&&f&&"click"===f.props.trigger?A={onClick:TO(a.handleItemMouseEnter,e.props.onClick)}:"axis"!==i&&(A={onMouseLeave:TO(a.handleItemMouseLeave,e.props.onMouseLeave),onMouseEnter:TO(a.handleItemMouseEnter,e.props.onMouseEnter)});var O=(0,t.cloneElement)(e,HP(HP({},o.props),A));if(S){if(!(c>=0)){var k,j=(null!==(k=a.getItemByXY(a.state.activeCoordinate))&&void 0!==k?k:{graphicalItem:O}).graphicalItem,E=j.item,C=void 0===E?e:E,P=j.childIndex,M=HP(HP(HP({},o.props),A),{},{activeIndex:P});return[(0,t.cloneElement)(C,M),null,null]}var T,_;if(u.dataKey&&!u.allowDuplicatedCategory){var R="function"===typeof u.dataKey?function(e){return"function"===typeof u.dataKey?u.dataKey(e.payload):null}:"payload.".concat(u.dataKey.toString());T=jf(h,R,d),_=m&&y&&jf(y,R,d)}else T=null===h||void 0===h?void 0:h[c],_=m&&y&&y[c];if(w||x){var N=void 0!==e.props.activeIndex?e.props.activeIndex:c;return[(0,t.cloneElement)(e,HP(HP(HP({},o.props),A),{},{activeIndex:N})),null,null]}if(!Mf()(T))return[O].concat(BP(a.renderActivePoints({item:o,activePoint:T,basePoint:_,childIndex:c,isRange:m})))}return m?[O,null,null]:[O,null]})),VP(a,"renderCustomized",(function(e,n,r){return(0,t.cloneElement)(e,HP(HP({key:"recharts-customized-".concat(r)},a.props),a.state))})),VP(a,"renderMap",{CartesianGrid:{handler:YP,once:!0},ReferenceArea:{handler:a.renderReferenceElement},ReferenceLine:{handler:YP},ReferenceDot:{handler:a.renderReferenceElement},XAxis:{handler:YP},YAxis:{handler:YP},Brush:{handler:a.renderBrush,once:!0},Bar:{handler:a.renderGraphicChild},Line:{handler:a.renderGraphicChild},Area:{handler:a.renderGraphicChild},Radar:{handler:a.renderGraphicChild},RadialBar:{handler:a.renderGraphicChild},Scatter:{handler:a.renderGraphicChild},Pie:{handler:a.renderGraphicChild},Funnel:{handler:a.renderGraphicChild},Tooltip:{handler:a.renderCursor,once:!0},PolarGrid:{handler:a.renderPolarGrid,once:!0},PolarAngleAxis:{handler:a.renderPolarAxis},PolarRadiusAxis:{handler:a.renderPolarAxis},Customized:{handler:a.renderCustomized}}),a.clipPathId="".concat(null!==(o=e.id)&&void 0!==o?o:Sf("recharts"),"-clip"),a.throttleTriggeredAfterMouseMove=sf()(a.triggeredAfterMouseMove,null!==(i=e.throttleDelay)&&void 0!==i?i:1e3/60),a.state={},a}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&$P(e,t)}(r,e),o=r,a=[{key:"componentDidMount",value:function(){var e,t;this.addListener(),this.accessibilityManager.setDetails({container:this.container,offset:{left:null!==(e=this.props.margin.left)&&void 0!==e?e:0,top:null!==(t=this.props.margin.top)&&void 0!==t?t:0},coordinateList:this.state.tooltipTicks,mouseHandlerCallback:this.triggeredAfterMouseMove,layout:this.props.layout}),this.displayDefaultTooltip()}},{key:"displayDefaultTooltip",value:function(){var e=this.props,t=e.children,n=e.data,r=e.height,o=e.layout,i=Zf(t,mh);if(i){var a=i.props.defaultIndex;if(!("number"!==typeof a||a<0||a>this.state.tooltipTicks.length-1)){var l=this.state.tooltipTicks[a]&&this.state.tooltipTicks[a].value,s=ZP(this.state,n,a,l),u=this.state.tooltipTicks[a].coordinate,c=(this.state.offset.top+r)/2,d="horizontal"===o?{x:u,y:c}:{y:u,x:c},f=this.state.formattedGraphicalItems.find((function(e){return"Scatter"===e.item.type.name}));f&&(d=HP(HP({},d),f.props.points[a].tooltipPosition),s=f.props.points[a].tooltipPayload);var p={activeTooltipIndex:a,isTooltipActive:!0,activeLabel:l,activePayload:s,activeCoordinate:d};this.setState(p),this.renderCursor(i),this.accessibilityManager.setIndex(a)}}}},{key:"getSnapshotBeforeUpdate",value:function(e,t){return this.props.accessibilityLayer?(this.state.tooltipTicks!==t.tooltipTicks&&this.accessibilityManager.setDetails({coordinateList:this.state.tooltipTicks}),this.props.layout!==e.layout&&this.accessibilityManager.setDetails({layout:this.props.layout}),this.props.margin!==e.margin&&this.accessibilityManager.setDetails({offset:{left:null!==(n=this.props.margin.left)&&void 0!==n?n:0,top:null!==(r=this.props.margin.top)&&void 0!==r?r:0}}),null):null;var n,r}},{key:"componentDidUpdate",value:function(e){op([Zf(e.children,mh)],[Zf(this.props.children,mh)])||this.displayDefaultTooltip()}},{key:"componentWillUnmount",value:function(){this.removeListener(),this.throttleTriggeredAfterMouseMove.cancel()}},{key:"getTooltipEventType",value:function(){var e=Zf(this.props.children,mh);if(e&&"boolean"===typeof e.props.shared){var t=e.props.shared?"axis":"item";return l.indexOf(t)>=0?t:i}return i}},{key:"getMouseInfo",value:function(e){if(!this.container)return null;var t,n=this.container,r=n.getBoundingClientRect(),o={top:(t=r).top+window.scrollY-document.documentElement.clientTop,left:t.left+window.scrollX-document.documentElement.clientLeft},i={chartX:Math.round(e.pageX-o.left),chartY:Math.round(e.pageY-o.top)},a=r.width/n.offsetWidth||1,l=this.inRange(i.chartX,i.chartY,a);if(!l)return null;var s=this.state,u=s.xAxisMap,c=s.yAxisMap,d=this.getTooltipEventType(),f=eM(this.state,this.props.data,this.props.layout,l);if("axis"!==d&&u&&c){var p=Of(u).scale,h=Of(c).scale,m=p&&p.invert?p.invert(i.chartX):null,y=h&&h.invert?h.invert(i.chartY):null;return HP(HP({},i),{},{xValue:m,yValue:y},f)}return f?HP(HP({},i),f):null}},{key:"inRange",value:function(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:1,r=this.props.layout,o=e/n,i=t/n;if("horizontal"===r||"vertical"===r){var a=this.state.offset;return o>=a.left&&o<=a.left+a.width&&i>=a.top&&i<=a.top+a.height?{x:o,y:i}:null}var l=this.state,s=l.angleAxisMap,u=l.radiusAxisMap;if(s&&u){var c=Of(s);return Sk({x:o,y:i},c)}return null}},{key:"parseEventsOfWrapper",value:function(){var e=this.props.children,t=this.getTooltipEventType(),n=Zf(e,mh),r={};return n&&"axis"===t&&(r="click"===n.props.trigger?{onClick:this.handleClick}:{onMouseEnter:this.handleMouseEnter,onDoubleClick:this.handleDoubleClick,onMouseMove:this.handleMouseMove,onMouseLeave:this.handleMouseLeave,onTouchMove:this.handleTouchMove,onTouchStart:this.handleTouchStart,onTouchEnd:this.handleTouchEnd,onContextMenu:this.handleContextMenu}),HP(HP({},Wf(this.props,this.handleOuterEvent)),r)}},{key:"addListener",value:function(){EC.on(CC,this.handleReceiveSyncEvent)}},{key:"removeListener",value:function(){EC.removeListener(CC,this.handleReceiveSyncEvent)}},{key:"filterFormatItem",value:function(e,t,n){for(var r=this.state.formattedGraphicalItems,o=0,i=r.length;o<i;o++){var a=r[o];if(a.item===e||a.props.key===e.key||t===Kf(a.item.type)&&n===a.childIndex)return a}return null}},{key:"renderClipPath",value:function(){var e=this.clipPathId,n=this.state.offset,r=n.left,o=n.top,i=n.height,a=n.width;return t.createElement("defs",null,t.createElement("clipPath",{id:e},t.createElement("rect",{x:r,y:o,height:i,width:a})))}},{key:"getXScales",value:function(){var e=this.state.xAxisMap;return e?Object.entries(e).reduce((function(e,t){var n=RP(t,2),r=n[0],o=n[1];return HP(HP({},e),{},VP({},r,o.scale))}),{}):null}},{key:"getYScales",value:function(){var e=this.state.yAxisMap;return e?Object.entries(e).reduce((function(e,t){var n=RP(t,2),r=n[0],o=n[1];return HP(HP({},e),{},VP({},r,o.scale))}),{}):null}},{key:"getXScaleByAxisId",value:function(e){var t;return null===(t=this.state.xAxisMap)||void 0===t||null===(t=t[e])||void 0===t?void 0:t.scale}},{key:"getYScaleByAxisId",value:function(e){var t;return null===(t=this.state.yAxisMap)||void 0===t||null===(t=t[e])||void 0===t?void 0:t.scale}},{key:"getItemByXY",value:function(e){var t=this.state,n=t.formattedGraphicalItems,r=t.activeItem;if(n&&n.length)for(var o=0,i=n.length;o<i;o++){var a=n[o],l=a.props,s=a.item,u=void 0!==s.type.defaultProps?HP(HP({},s.type.defaultProps),s.props):s.props,c=Kf(s.type);if("Bar"===c){var d=(l.data||[]).find((function(t){return mv(e,t)}));if(d)return{graphicalItem:a,payload:d}}else if("RadialBar"===c){var f=(l.data||[]).find((function(t){return Sk(e,t)}));if(f)return{graphicalItem:a,payload:f}}else if(Nj(a,r)||Ij(a,r)||Dj(a,r)){var p=Bj({graphicalItem:a,activeTooltipItem:r,itemData:u.data}),h=void 0===u.activeIndex?p:u.activeIndex;return{graphicalItem:HP(HP({},a),{},{childIndex:h}),payload:Dj(a,r)?u.data[p]:a.props.data[p]}}}return null}},{key:"render",value:function(){var e=this;if(!ep(this))return null;var n,r,o=this.props,i=o.children,a=o.className,l=o.width,s=o.height,u=o.style,c=o.compact,d=o.title,f=o.desc,p=NP(o,MP),h=rp(p,!1);if(c)return t.createElement(VE,{state:this.state,width:this.props.width,height:this.props.height,clipPathId:this.clipPathId},t.createElement(Ap,_P({},h,{width:l,height:s,title:d,desc:f}),this.renderClipPath(),ap(i,this.renderMap)));this.props.accessibilityLayer&&(h.tabIndex=null!==(n=this.props.tabIndex)&&void 0!==n?n:0,h.role=null!==(r=this.props.role)&&void 0!==r?r:"application",h.onKeyDown=function(t){e.accessibilityManager.keyboardEvent(t)},h.onFocus=function(){e.accessibilityManager.focus()});var m=this.parseEventsOfWrapper();return t.createElement(VE,{state:this.state,width:this.props.width,height:this.props.height,clipPathId:this.clipPathId},t.createElement("div",_P({className:zt("recharts-wrapper",a),style:HP({position:"relative",cursor:"default",width:l,height:s},u)},m,{ref:function(t){e.container=t}}),t.createElement(Ap,_P({},h,{width:l,height:s,title:d,desc:f,style:KP}),this.renderClipPath(),ap(i,this.renderMap)),this.renderLegend(),this.renderTooltip()))}}],a&&IP(o.prototype,a),s&&IP(o,s),Object.defineProperty(o,"prototype",{writable:!1}),o;var o,a,s}(t.Component);VP(h,"displayName",n),VP(h,"defaultProps",HP({layout:"horizontal",stackOffset:"none",barCategoryGap:"10%",barGap:4,margin:{top:5,right:5,bottom:5,left:5},reverseStackOrder:!1,syncMethod:"index"},d)),VP(h,"getDerivedStateFromProps",(function(e,t){var n=e.dataKey,r=e.data,o=e.children,i=e.width,a=e.height,l=e.layout,s=e.stackOffset,u=e.margin,c=t.dataStartIndex,d=t.dataEndIndex;if(void 0===t.updateId){var f=rM(e);return HP(HP(HP({},f),{},{updateId:0},p(HP(HP({props:e},f),{},{updateId:0}),t)),{},{prevDataKey:n,prevData:r,prevWidth:i,prevHeight:a,prevLayout:l,prevStackOffset:s,prevMargin:u,prevChildren:o})}if(n!==t.prevDataKey||r!==t.prevData||i!==t.prevWidth||a!==t.prevHeight||l!==t.prevLayout||s!==t.prevStackOffset||!Df(u,t.prevMargin)){var h=rM(e),m={chartX:t.chartX,chartY:t.chartY,isTooltipActive:t.isTooltipActive},y=HP(HP({},eM(t,r,l)),{},{updateId:t.updateId+1}),v=HP(HP(HP({},h),m),y);return HP(HP(HP({},v),p(HP({props:e},v),t)),{},{prevDataKey:n,prevData:r,prevWidth:i,prevHeight:a,prevLayout:l,prevStackOffset:s,prevMargin:u,prevChildren:o})}if(!op(o,t.prevChildren)){var g,b,x,w,S=Zf(o,uk),A=S&&null!==(g=null===(b=S.props)||void 0===b?void 0:b.startIndex)&&void 0!==g?g:c,O=S&&null!==(x=null===(w=S.props)||void 0===w?void 0:w.endIndex)&&void 0!==x?x:d,k=A!==c||O!==d,j=!Mf()(r)&&!k?t.updateId:t.updateId+1;return HP(HP({updateId:j},p(HP(HP({props:e},t),{},{updateId:j,dataStartIndex:A,dataEndIndex:O}),t)),{},{prevChildren:o,dataStartIndex:A,dataEndIndex:O})}return null})),VP(h,"renderActiveDot",(function(e,n,r){var o;return o=(0,t.isValidElement)(e)?(0,t.cloneElement)(e,n):_f()(e)?e(n):t.createElement(Tm,n),t.createElement(Ep,{className:"recharts-active-dot",key:r},o)}));var m=(0,t.forwardRef)((function(e,n){return t.createElement(h,_P({},e,{ref:n}))}));return m.displayName=h.displayName,m},sM=["points","className","baseLinePoints","connectNulls"];function uM(){return uM=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},uM.apply(this,arguments)}function cM(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function dM(e){return function(e){if(Array.isArray(e))return fM(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return fM(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return fM(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function fM(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var pM=function(e){return e&&e.x===+e.x&&e.y===+e.y},hM=function(e,t){var n=function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[],t=[[]];return e.forEach((function(e){pM(e)?t[t.length-1].push(e):t[t.length-1].length>0&&t.push([])})),pM(e[0])&&t[t.length-1].push(e[0]),t[t.length-1].length<=0&&(t=t.slice(0,-1)),t}(e);t&&(n=[n.reduce((function(e,t){return[].concat(dM(e),dM(t))}),[])]);var r=n.map((function(e){return e.reduce((function(e,t,n){return"".concat(e).concat(0===n?"M":"L").concat(t.x,",").concat(t.y)}),"")})).join("");return 1===n.length?"".concat(r,"Z"):r},mM=function(e){var n=e.points,r=e.className,o=e.baseLinePoints,i=e.connectNulls,a=cM(e,sM);if(!n||!n.length)return null;var l=zt("recharts-polygon",r);if(o&&o.length){var s=a.stroke&&"none"!==a.stroke,u=function(e,t,n){var r=hM(e,n);return"".concat("Z"===r.slice(-1)?r.slice(0,-1):r,"L").concat(hM(t.reverse(),n).slice(1))}(n,o,i);return t.createElement("g",{className:l},t.createElement("path",uM({},rp(a,!0),{fill:"Z"===u.slice(-1)?a.fill:"none",stroke:"none",d:u})),s?t.createElement("path",uM({},rp(a,!0),{fill:"none",d:hM(n,i)})):null,s?t.createElement("path",uM({},rp(a,!0),{fill:"none",d:hM(o,i)})):null)}var c=hM(n,i);return t.createElement("path",uM({},rp(a,!0),{fill:"Z"===c.slice(-1)?a.fill:"none",className:l,d:c}))};function yM(e){return yM="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},yM(e)}function vM(){return vM=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},vM.apply(this,arguments)}function gM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function bM(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?gM(Object(n),!0).forEach((function(t){kM(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):gM(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function xM(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,jM(r.key),r)}}function wM(e,t,n){return t=AM(t),function(e,t){if(t&&("object"===yM(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,SM()?Reflect.construct(t,n||[],AM(e).constructor):t.apply(e,n))}function SM(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(SM=function(){return!!e})()}function AM(e){return AM=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},AM(e)}function OM(e,t){return OM=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},OM(e,t)}function kM(e,t,n){return(t=jM(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function jM(e){var t=function(e,t){if("object"!=yM(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=yM(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==yM(t)?t:t+""}var EM=Math.PI/180,CM=1e-5,PM=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),wM(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&OM(e,t)}(n,e),r=n,o=[{key:"getTickLineCoord",value:function(e){var t=this.props,n=t.cx,r=t.cy,o=t.radius,i=t.orientation,a=t.tickSize||8,l=gk(n,r,o,e.coordinate),s=gk(n,r,o+("inner"===i?-1:1)*a,e.coordinate);return{x1:l.x,y1:l.y,x2:s.x,y2:s.y}}},{key:"getTickTextAnchor",value:function(e){var t=this.props.orientation,n=Math.cos(-e.coordinate*EM);return n>CM?"outer"===t?"start":"end":n<-CM?"outer"===t?"end":"start":"middle"}},{key:"renderAxisLine",value:function(){var e=this.props,n=e.cx,r=e.cy,o=e.radius,i=e.axisLine,a=e.axisLineType,l=bM(bM({},rp(this.props,!1)),{},{fill:"none"},rp(i,!1));if("circle"===a)return t.createElement(Tm,vM({className:"recharts-polar-angle-axis-line"},l,{cx:n,cy:r,r:o}));var s=this.props.ticks.map((function(e){return gk(n,r,o,e.coordinate)}));return t.createElement(mM,vM({className:"recharts-polar-angle-axis-line"},l,{points:s}))}},{key:"renderTicks",value:function(){var e=this,r=this.props,o=r.ticks,i=r.tick,a=r.tickLine,l=r.tickFormatter,s=r.stroke,u=rp(this.props,!1),c=rp(i,!1),d=bM(bM({},u),{},{fill:"none"},rp(a,!1)),f=o.map((function(r,o){var f=e.getTickLineCoord(r),p=bM(bM(bM({textAnchor:e.getTickTextAnchor(r)},u),{},{stroke:"none",fill:s},c),{},{index:o,payload:r,x:f.x2,y:f.y2});return t.createElement(Ep,vM({className:zt("recharts-polar-angle-axis-tick",Ak(i)),key:"tick-".concat(r.coordinate)},Uf(e.props,r,o)),a&&t.createElement("line",vM({className:"recharts-polar-angle-axis-tick-line"},d,f)),i&&n.renderTickItem(i,p,l?l(r.value,o):r.value))}));return t.createElement(Ep,{className:"recharts-polar-angle-axis-ticks"},f)}},{key:"render",value:function(){var e=this.props,n=e.ticks,r=e.radius,o=e.axisLine;return r<=0||!n||!n.length?null:t.createElement(Ep,{className:zt("recharts-polar-angle-axis",this.props.className)},o&&this.renderAxisLine(),this.renderTicks())}}],i=[{key:"renderTickItem",value:function(e,n,r){return t.isValidElement(e)?t.cloneElement(e,n):_f()(e)?e(n):t.createElement(fg,vM({},n,{className:"recharts-polar-angle-axis-tick-value"}),r)}}],o&&xM(r.prototype,o),i&&xM(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);kM(PM,"displayName","PolarAngleAxis"),kM(PM,"axisType","angleAxis"),kM(PM,"defaultProps",{type:"category",angleAxisId:0,scale:"auto",cx:0,cy:0,orientation:"outer",axisLine:!0,tickLine:!0,tickSize:8,tick:!0,hide:!1,allowDuplicatedCategory:!0});var MM=n(2794),TM=n.n(MM),_M=n(9364),RM=n.n(_M),NM=["cx","cy","angle","ticks","axisLine"],IM=["ticks","tick","angle","tickFormatter","stroke"];function DM(e){return DM="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},DM(e)}function LM(){return LM=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},LM.apply(this,arguments)}function zM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function $M(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?zM(Object(n),!0).forEach((function(t){qM(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):zM(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function BM(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function FM(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,XM(r.key),r)}}function WM(e,t,n){return t=HM(t),function(e,t){if(t&&("object"===DM(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,UM()?Reflect.construct(t,n||[],HM(e).constructor):t.apply(e,n))}function UM(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(UM=function(){return!!e})()}function HM(e){return HM=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},HM(e)}function VM(e,t){return VM=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},VM(e,t)}function qM(e,t,n){return(t=XM(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function XM(e){var t=function(e,t){if("object"!=DM(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=DM(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==DM(t)?t:t+""}var KM,GM=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),WM(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&VM(e,t)}(n,e),r=n,o=[{key:"getTickValueCoord",value:function(e){var t=e.coordinate,n=this.props,r=n.angle,o=n.cx,i=n.cy;return gk(o,i,t,r)}},{key:"getTickTextAnchor",value:function(){var e;switch(this.props.orientation){case"left":e="end";break;case"right":e="start";break;default:e="middle"}return e}},{key:"getViewBox",value:function(){var e=this.props,t=e.cx,n=e.cy,r=e.angle,o=e.ticks,i=TM()(o,(function(e){return e.coordinate||0}));return{cx:t,cy:n,startAngle:r,endAngle:r,innerRadius:RM()(o,(function(e){return e.coordinate||0})).coordinate||0,outerRadius:i.coordinate||0}}},{key:"renderAxisLine",value:function(){var e=this.props,n=e.cx,r=e.cy,o=e.angle,i=e.ticks,a=e.axisLine,l=BM(e,NM),s=i.reduce((function(e,t){return[Math.min(e[0],t.coordinate),Math.max(e[1],t.coordinate)]}),[1/0,-1/0]),u=gk(n,r,s[0],o),c=gk(n,r,s[1],o),d=$M($M($M({},rp(l,!1)),{},{fill:"none"},rp(a,!1)),{},{x1:u.x,y1:u.y,x2:c.x,y2:c.y});return t.createElement("line",LM({className:"recharts-polar-radius-axis-line"},d))}},{key:"renderTicks",value:function(){var e=this,r=this.props,o=r.ticks,i=r.tick,a=r.angle,l=r.tickFormatter,s=r.stroke,u=BM(r,IM),c=this.getTickTextAnchor(),d=rp(u,!1),f=rp(i,!1),p=o.map((function(r,o){var u=e.getTickValueCoord(r),p=$M($M($M($M({textAnchor:c,transform:"rotate(".concat(90-a,", ").concat(u.x,", ").concat(u.y,")")},d),{},{stroke:"none",fill:s},f),{},{index:o},u),{},{payload:r});return t.createElement(Ep,LM({className:zt("recharts-polar-radius-axis-tick",Ak(i)),key:"tick-".concat(r.coordinate)},Uf(e.props,r,o)),n.renderTickItem(i,p,l?l(r.value,o):r.value))}));return t.createElement(Ep,{className:"recharts-polar-radius-axis-ticks"},p)}},{key:"render",value:function(){var e=this.props,n=e.ticks,r=e.axisLine,o=e.tick;return n&&n.length?t.createElement(Ep,{className:zt("recharts-polar-radius-axis",this.props.className)},r&&this.renderAxisLine(),o&&this.renderTicks(),Nk.renderCallByParent(this.props,this.getViewBox())):null}}],i=[{key:"renderTickItem",value:function(e,n,r){return t.isValidElement(e)?t.cloneElement(e,n):_f()(e)?e(n):t.createElement(fg,LM({},n,{className:"recharts-polar-radius-axis-tick-value"}),r)}}],o&&FM(r.prototype,o),i&&FM(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);function YM(e){return YM="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},YM(e)}function QM(){return QM=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},QM.apply(this,arguments)}function JM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function ZM(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?JM(Object(n),!0).forEach((function(t){iT(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):JM(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function eT(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,aT(r.key),r)}}function tT(e,t,n){return t=rT(t),function(e,t){if(t&&("object"===YM(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,nT()?Reflect.construct(t,n||[],rT(e).constructor):t.apply(e,n))}function nT(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(nT=function(){return!!e})()}function rT(e){return rT=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},rT(e)}function oT(e,t){return oT=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},oT(e,t)}function iT(e,t,n){return(t=aT(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function aT(e){var t=function(e,t){if("object"!=YM(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=YM(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==YM(t)?t:t+""}qM(GM,"displayName","PolarRadiusAxis"),qM(GM,"axisType","radiusAxis"),qM(GM,"defaultProps",{type:"number",radiusAxisId:0,cx:0,cy:0,angle:0,orientation:"right",stroke:"#ccc",axisLine:!0,tick:!0,tickCount:5,allowDataOverflow:!1,scale:"auto",allowDuplicatedCategory:!0});var lT=function(e){function n(e){var t;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),iT(t=tT(this,n,[e]),"pieRef",null),iT(t,"sectorRefs",[]),iT(t,"id",Sf("recharts-pie-")),iT(t,"handleAnimationEnd",(function(){var e=t.props.onAnimationEnd;t.setState({isAnimationFinished:!0}),_f()(e)&&e()})),iT(t,"handleAnimationStart",(function(){var e=t.props.onAnimationStart;t.setState({isAnimationFinished:!1}),_f()(e)&&e()})),t.state={isAnimationFinished:!e.isAnimationActive,prevIsAnimationActive:e.isAnimationActive,prevAnimationId:e.animationId,sectorToFocus:0},t}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&oT(e,t)}(n,e),r=n,o=[{key:"isActiveIndex",value:function(e){var t=this.props.activeIndex;return Array.isArray(t)?-1!==t.indexOf(e):e===t}},{key:"hasActiveIndex",value:function(){var e=this.props.activeIndex;return Array.isArray(e)?0!==e.length:e||0===e}},{key:"renderLabels",value:function(e){if(this.props.isAnimationActive&&!this.state.isAnimationFinished)return null;var r=this.props,o=r.label,i=r.labelLine,a=r.dataKey,l=r.valueKey,s=rp(this.props,!1),u=rp(o,!1),c=rp(i,!1),d=o&&o.offsetRadius||20,f=e.map((function(e,r){var f=(e.startAngle+e.endAngle)/2,p=gk(e.cx,e.cy,e.outerRadius+d,f),h=ZM(ZM(ZM(ZM({},s),e),{},{stroke:"none"},u),{},{index:r,textAnchor:n.getTextAnchor(p.x,e.cx)},p),m=ZM(ZM(ZM(ZM({},s),e),{},{fill:"none",stroke:e.fill},c),{},{index:r,points:[gk(e.cx,e.cy,e.outerRadius,f),p]}),y=a;return Mf()(a)&&Mf()(l)?y="value":Mf()(a)&&(y=l),t.createElement(Ep,{key:"label-".concat(e.startAngle,"-").concat(e.endAngle,"-").concat(e.midAngle,"-").concat(r)},i&&n.renderLabelLineItem(i,m,"line"),n.renderLabelItem(o,h,SO(e,y)))}));return t.createElement(Ep,{className:"recharts-pie-labels"},f)}},{key:"renderSectorsStatically",value:function(e){var n=this,r=this.props,o=r.activeShape,i=r.blendStroke,a=r.inactiveShape;return e.map((function(r,l){if(0===(null===r||void 0===r?void 0:r.startAngle)&&0===(null===r||void 0===r?void 0:r.endAngle)&&1!==e.length)return null;var s=n.isActiveIndex(l),u=a&&n.hasActiveIndex()?a:null,c=s?o:u,d=ZM(ZM({},r),{},{stroke:i?r.fill:r.stroke,tabIndex:-1});return t.createElement(Ep,QM({ref:function(e){e&&!n.sectorRefs.includes(e)&&n.sectorRefs.push(e)},tabIndex:-1,className:"recharts-pie-sector"},Uf(n.props,r,l),{key:"sector-".concat(null===r||void 0===r?void 0:r.startAngle,"-").concat(null===r||void 0===r?void 0:r.endAngle,"-").concat(r.midAngle,"-").concat(l)}),t.createElement(Rj,QM({option:c,isActive:s,shapeType:"sector"},d)))}))}},{key:"renderSectorsWithAnimation",value:function(){var e=this,n=this.props,r=n.sectors,o=n.isAnimationActive,i=n.animationBegin,a=n.animationDuration,l=n.animationEasing,s=n.animationId,u=this.state,c=u.prevSectors,d=u.prevIsAnimationActive;return t.createElement(av,{begin:i,duration:a,isActive:o,easing:l,from:{t:0},to:{t:1},key:"pie-".concat(s,"-").concat(d),onAnimationStart:this.handleAnimationStart,onAnimationEnd:this.handleAnimationEnd},(function(n){var o=n.t,i=[],a=(r&&r[0]).startAngle;return r.forEach((function(e,t){var n=c&&c[t],r=t>0?hf()(e,"paddingAngle",0):0;if(n){var l=kf(n.endAngle-n.startAngle,e.endAngle-e.startAngle),s=ZM(ZM({},e),{},{startAngle:a+r,endAngle:a+l(o)+r});i.push(s),a=s.endAngle}else{var u=e.endAngle,d=e.startAngle,f=kf(0,u-d)(o),p=ZM(ZM({},e),{},{startAngle:a+r,endAngle:a+f+r});i.push(p),a=p.endAngle}})),t.createElement(Ep,null,e.renderSectorsStatically(i))}))}},{key:"attachKeyboardHandlers",value:function(e){var t=this;e.onkeydown=function(e){if(!e.altKey)switch(e.key){case"ArrowLeft":var n=++t.state.sectorToFocus%t.sectorRefs.length;t.sectorRefs[n].focus(),t.setState({sectorToFocus:n});break;case"ArrowRight":var r=--t.state.sectorToFocus<0?t.sectorRefs.length-1:t.state.sectorToFocus%t.sectorRefs.length;t.sectorRefs[r].focus(),t.setState({sectorToFocus:r});break;case"Escape":t.sectorRefs[t.state.sectorToFocus].blur(),t.setState({sectorToFocus:0})}}}},{key:"renderSectors",value:function(){var e=this.props,t=e.sectors,n=e.isAnimationActive,r=this.state.prevSectors;return!(n&&t&&t.length)||r&&wA()(r,t)?this.renderSectorsStatically(t):this.renderSectorsWithAnimation()}},{key:"componentDidMount",value:function(){this.pieRef&&this.attachKeyboardHandlers(this.pieRef)}},{key:"render",value:function(){var e=this,n=this.props,r=n.hide,o=n.sectors,i=n.className,a=n.label,l=n.cx,s=n.cy,u=n.innerRadius,c=n.outerRadius,d=n.isAnimationActive,f=this.state.isAnimationFinished;if(r||!o||!o.length||!bf(l)||!bf(s)||!bf(u)||!bf(c))return null;var p=zt("recharts-pie",i);return t.createElement(Ep,{tabIndex:this.props.rootTabIndex,className:p,ref:function(t){e.pieRef=t}},this.renderSectors(),a&&this.renderLabels(o),Nk.renderCallByParent(this.props,null,!1),(!d||f)&&tj.renderCallByParent(this.props,o,!1))}}],i=[{key:"getDerivedStateFromProps",value:function(e,t){return t.prevIsAnimationActive!==e.isAnimationActive?{prevIsAnimationActive:e.isAnimationActive,prevAnimationId:e.animationId,curSectors:e.sectors,prevSectors:[],isAnimationFinished:!0}:e.isAnimationActive&&e.animationId!==t.prevAnimationId?{prevAnimationId:e.animationId,curSectors:e.sectors,prevSectors:t.curSectors,isAnimationFinished:!0}:e.sectors!==t.curSectors?{curSectors:e.sectors,isAnimationFinished:!0}:null}},{key:"getTextAnchor",value:function(e,t){return e>t?"start":e<t?"end":"middle"}},{key:"renderLabelLineItem",value:function(e,n,r){if(t.isValidElement(e))return t.cloneElement(e,n);if(_f()(e))return e(n);var o=zt("recharts-pie-label-line","boolean"!==typeof e?e.className:"");return t.createElement(pP,QM({},n,{key:r,type:"linear",className:o}))}},{key:"renderLabelItem",value:function(e,n,r){if(t.isValidElement(e))return t.cloneElement(e,n);var o=r;if(_f()(e)&&(o=e(n),t.isValidElement(o)))return o;var i=zt("recharts-pie-label-text","boolean"===typeof e||_f()(e)?"":e.className);return t.createElement(fg,QM({},n,{alignmentBaseline:"middle",className:i}),o)}}],o&&eT(r.prototype,o),i&&eT(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);KM=lT,iT(lT,"displayName","Pie"),iT(lT,"defaultProps",{stroke:"#fff",fill:"#808080",legendType:"rect",cx:"50%",cy:"50%",startAngle:0,endAngle:360,innerRadius:0,outerRadius:"80%",paddingAngle:0,labelLine:!0,hide:!1,minAngle:0,isAnimationActive:!eh.isSsr,animationBegin:400,animationDuration:1500,animationEasing:"ease",nameKey:"name",blendStroke:!1,rootTabIndex:0}),iT(lT,"parseDeltaAngle",(function(e,t){return vf(t-e)*Math.min(Math.abs(t-e),360)})),iT(lT,"getRealPieData",(function(e){var t=e.data,n=e.children,r=rp(e,!1),o=Jf(n,Fk);return t&&t.length?t.map((function(e,t){return ZM(ZM(ZM({payload:e},r),e),o&&o[t]&&o[t].props)})):o&&o.length?o.map((function(e){return ZM(ZM({},r),e.props)})):[]})),iT(lT,"parseCoordinateOfPie",(function(e,t){var n=t.top,r=t.left,o=t.width,i=t.height,a=bk(o,i);return{cx:r+Af(e.cx,o,o/2),cy:n+Af(e.cy,i,i/2),innerRadius:Af(e.innerRadius,a,0),outerRadius:Af(e.outerRadius,a,.8*a),maxRadius:e.maxRadius||Math.sqrt(o*o+i*i)/2}})),iT(lT,"getComposedData",(function(e){var t=e.item,n=e.offset,r=void 0!==t.type.defaultProps?ZM(ZM({},t.type.defaultProps),t.props):t.props,o=KM.getRealPieData(r);if(!o||!o.length)return null;var i=r.cornerRadius,a=r.startAngle,l=r.endAngle,s=r.paddingAngle,u=r.dataKey,c=r.nameKey,d=r.valueKey,f=r.tooltipType,p=Math.abs(r.minAngle),h=KM.parseCoordinateOfPie(r,n),m=KM.parseDeltaAngle(a,l),y=Math.abs(m),v=u;Mf()(u)&&Mf()(d)?(Cf(!1,'Use "dataKey" to specify the value of pie,\n      the props "valueKey" will be deprecated in 1.1.0'),v="value"):Mf()(u)&&(Cf(!1,'Use "dataKey" to specify the value of pie,\n      the props "valueKey" will be deprecated in 1.1.0'),v=d);var g,b,x=o.filter((function(e){return 0!==SO(e,v,0)})).length,w=y-x*p-(y>=360?x:x-1)*s,S=o.reduce((function(e,t){var n=SO(t,v,0);return e+(bf(n)?n:0)}),0);S>0&&(g=o.map((function(e,t){var n,r=SO(e,v,0),o=SO(e,c,t),l=(bf(r)?r:0)/S,u=(n=t?b.endAngle+vf(m)*s*(0!==r?1:0):a)+vf(m)*((0!==r?p:0)+l*w),d=(n+u)/2,y=(h.innerRadius+h.outerRadius)/2,g=[{name:o,value:r,payload:e,dataKey:v,type:f}],x=gk(h.cx,h.cy,y,d);return b=ZM(ZM(ZM({percent:l,cornerRadius:i,name:o,tooltipPayload:g,midAngle:d,middleRadius:y,tooltipPosition:x},e),h),{},{value:SO(e,v),startAngle:n,endAngle:u,payload:e,paddingAngle:vf(m)*s})})));return ZM(ZM({},h),{},{sectors:g,data:o})}));var sT=lM({chartName:"PieChart",GraphicalChild:lT,validateTooltipEventTypes:["item"],defaultTooltipEventType:"item",legendContent:"children",axisComponents:[{axisType:"angleAxis",AxisComp:PM},{axisType:"radiusAxis",AxisComp:GM}],formatAxisMap:function(e,t,n,r,o){var i=e.width,a=e.height,l=e.startAngle,s=e.endAngle,u=Af(e.cx,i,i/2),c=Af(e.cy,a,a/2),d=bk(i,a,n),f=Af(e.innerRadius,d,0),p=Af(e.outerRadius,d,.8*d);return Object.keys(t).reduce((function(e,n){var i,a=t[n],d=a.domain,h=a.reversed;if(Mf()(a.range))"angleAxis"===r?i=[l,s]:"radiusAxis"===r&&(i=[f,p]),h&&(i=[i[1],i[0]]);else{var m=hk(i=a.range,2);l=m[0],s=m[1]}var y=_O(a,o),v=y.realScaleType,g=y.scale;g.domain(d).range(i),NO(g);var b=LO(g,fk(fk({},a),{},{realScaleType:v})),x=fk(fk(fk({},a),b),{},{range:i,radius:p,realScaleType:v,scale:g,cx:u,cy:c,innerRadius:f,outerRadius:p,startAngle:l,endAngle:s});return fk(fk({},e),{},pk({},n,x))}),{})},defaultProps:{layout:"centric",startAngle:0,endAngle:360,cx:"50%",cy:"50%",innerRadius:0,outerRadius:"80%"}});function uT(e,t,n){if(t<1)return[];if(1===t&&void 0===n)return e;for(var r=[],o=0;o<e.length;o+=t){if(void 0!==n&&!0!==n(e[o]))return;r.push(e[o])}return r}function cT(e,t,n){return function(e){var t=e.width,n=e.height,r=function(e){return(e%180+180)%180}(arguments.length>1&&void 0!==arguments[1]?arguments[1]:0),o=r*Math.PI/180,i=Math.atan(n/t),a=o>i&&o<Math.PI-i?n/Math.sin(o):t/Math.cos(o);return Math.abs(a)}({width:e.width+t.width,height:e.height+t.height},n)}function dT(e,t,n,r,o){if(e*t<e*r||e*t>e*o)return!1;var i=n();return e*(t-e*i/2-r)>=0&&e*(t+e*i/2-o)<=0}function fT(e){return fT="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},fT(e)}function pT(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function hT(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?pT(Object(n),!0).forEach((function(t){mT(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):pT(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function mT(e,t,n){return t=function(e){var t=function(e,t){if("object"!=fT(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=fT(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==fT(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function yT(e,t,n){var r=e.tick,o=e.ticks,i=e.viewBox,a=e.minTickGap,l=e.orientation,s=e.interval,u=e.tickFormatter,c=e.unit,d=e.angle;if(!o||!o.length||!r)return[];if(bf(s)||eh.isSsr)return function(e,t){return uT(e,t+1)}(o,"number"===typeof s&&bf(s)?s:0);var f=[],p="top"===l||"bottom"===l?"width":"height",h=c&&"width"===p?Lv(c,{fontSize:t,letterSpacing:n}):{width:0,height:0},m=function(e,r){var o=_f()(u)?u(e.value,r):e.value;return"width"===p?cT(Lv(o,{fontSize:t,letterSpacing:n}),h,d):Lv(o,{fontSize:t,letterSpacing:n})[p]},y=o.length>=2?vf(o[1].coordinate-o[0].coordinate):1,v=function(e,t,n){var r="width"===n,o=e.x,i=e.y,a=e.width,l=e.height;return 1===t?{start:r?o:i,end:r?o+a:i+l}:{start:r?o+a:i+l,end:r?o:i}}(i,y,p);return"equidistantPreserveStart"===s?function(e,t,n,r,o){for(var i,a=(r||[]).slice(),l=t.start,s=t.end,u=0,c=1,d=l,f=function(){var t=null===r||void 0===r?void 0:r[u];if(void 0===t)return{v:uT(r,c)};var i,a=u,f=function(){return void 0===i&&(i=n(t,a)),i},p=t.coordinate,h=0===u||dT(e,p,f,d,s);h||(u=0,d=l,c+=1),h&&(d=p+e*(f()/2+o),u+=c)};c<=a.length;)if(i=f())return i.v;return[]}(y,v,m,o,a):(f="preserveStart"===s||"preserveStartEnd"===s?function(e,t,n,r,o,i){var a=(r||[]).slice(),l=a.length,s=t.start,u=t.end;if(i){var c=r[l-1],d=n(c,l-1),f=e*(c.coordinate+e*d/2-u);a[l-1]=c=hT(hT({},c),{},{tickCoord:f>0?c.coordinate-f*e:c.coordinate}),dT(e,c.tickCoord,(function(){return d}),s,u)&&(u=c.tickCoord-e*(d/2+o),a[l-1]=hT(hT({},c),{},{isShow:!0}))}for(var p=i?l-1:l,h=function(t){var r,i=a[t],l=function(){return void 0===r&&(r=n(i,t)),r};if(0===t){var c=e*(i.coordinate-e*l()/2-s);a[t]=i=hT(hT({},i),{},{tickCoord:c<0?i.coordinate-c*e:i.coordinate})}else a[t]=i=hT(hT({},i),{},{tickCoord:i.coordinate});dT(e,i.tickCoord,l,s,u)&&(s=i.tickCoord+e*(l()/2+o),a[t]=hT(hT({},i),{},{isShow:!0}))},m=0;m<p;m++)h(m);return a}(y,v,m,o,a,"preserveStartEnd"===s):function(e,t,n,r,o){for(var i=(r||[]).slice(),a=i.length,l=t.start,s=t.end,u=function(t){var r,u=i[t],c=function(){return void 0===r&&(r=n(u,t)),r};if(t===a-1){var d=e*(u.coordinate+e*c()/2-s);i[t]=u=hT(hT({},u),{},{tickCoord:d>0?u.coordinate-d*e:u.coordinate})}else i[t]=u=hT(hT({},u),{},{tickCoord:u.coordinate});dT(e,u.tickCoord,c,l,s)&&(s=u.tickCoord-e*(c()/2+o),i[t]=hT(hT({},u),{},{isShow:!0}))},c=a-1;c>=0;c--)u(c);return i}(y,v,m,o,a),f.filter((function(e){return e.isShow})))}var vT=["viewBox"],gT=["viewBox"],bT=["ticks"];function xT(e){return xT="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},xT(e)}function wT(){return wT=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},wT.apply(this,arguments)}function ST(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function AT(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?ST(Object(n),!0).forEach((function(t){MT(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ST(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function OT(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function kT(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,TT(r.key),r)}}function jT(e,t,n){return t=CT(t),function(e,t){if(t&&("object"===xT(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,ET()?Reflect.construct(t,n||[],CT(e).constructor):t.apply(e,n))}function ET(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(ET=function(){return!!e})()}function CT(e){return CT=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},CT(e)}function PT(e,t){return PT=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},PT(e,t)}function MT(e,t,n){return(t=TT(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function TT(e){var t=function(e,t){if("object"!=xT(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=xT(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==xT(t)?t:t+""}var _T=function(e){function n(e){var t;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),(t=jT(this,n,[e])).state={fontSize:"",letterSpacing:""},t}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&PT(e,t)}(n,e),r=n,o=[{key:"shouldComponentUpdate",value:function(e,t){var n=e.viewBox,r=OT(e,vT),o=this.props,i=o.viewBox,a=OT(o,gT);return!Df(n,i)||!Df(r,a)||!Df(t,this.state)}},{key:"componentDidMount",value:function(){var e=this.layerReference;if(e){var t=e.getElementsByClassName("recharts-cartesian-axis-tick-value")[0];t&&this.setState({fontSize:window.getComputedStyle(t).fontSize,letterSpacing:window.getComputedStyle(t).letterSpacing})}}},{key:"getTickLineCoord",value:function(e){var t,n,r,o,i,a,l=this.props,s=l.x,u=l.y,c=l.width,d=l.height,f=l.orientation,p=l.tickSize,h=l.mirror,m=l.tickMargin,y=h?-1:1,v=e.tickSize||p,g=bf(e.tickCoord)?e.tickCoord:e.coordinate;switch(f){case"top":t=n=e.coordinate,a=(r=(o=u+ +!h*d)-y*v)-y*m,i=g;break;case"left":r=o=e.coordinate,i=(t=(n=s+ +!h*c)-y*v)-y*m,a=g;break;case"right":r=o=e.coordinate,i=(t=(n=s+ +h*c)+y*v)+y*m,a=g;break;default:t=n=e.coordinate,a=(r=(o=u+ +h*d)+y*v)+y*m,i=g}return{line:{x1:t,y1:r,x2:n,y2:o},tick:{x:i,y:a}}}},{key:"getTickTextAnchor",value:function(){var e,t=this.props,n=t.orientation,r=t.mirror;switch(n){case"left":e=r?"start":"end";break;case"right":e=r?"end":"start";break;default:e="middle"}return e}},{key:"getTickVerticalAnchor",value:function(){var e=this.props,t=e.orientation,n=e.mirror,r="end";switch(t){case"left":case"right":r="middle";break;case"top":r=n?"start":"end";break;default:r=n?"end":"start"}return r}},{key:"renderAxisLine",value:function(){var e=this.props,n=e.x,r=e.y,o=e.width,i=e.height,a=e.orientation,l=e.mirror,s=e.axisLine,u=AT(AT(AT({},rp(this.props,!1)),rp(s,!1)),{},{fill:"none"});if("top"===a||"bottom"===a){var c=+("top"===a&&!l||"bottom"===a&&l);u=AT(AT({},u),{},{x1:n,y1:r+c*i,x2:n+o,y2:r+c*i})}else{var d=+("left"===a&&!l||"right"===a&&l);u=AT(AT({},u),{},{x1:n+d*o,y1:r,x2:n+d*o,y2:r+i})}return t.createElement("line",wT({},u,{className:zt("recharts-cartesian-axis-line",hf()(s,"className"))}))}},{key:"renderTicks",value:function(e,r,o){var i=this,a=this.props,l=a.tickLine,s=a.stroke,u=a.tick,c=a.tickFormatter,d=a.unit,f=yT(AT(AT({},this.props),{},{ticks:e}),r,o),p=this.getTickTextAnchor(),h=this.getTickVerticalAnchor(),m=rp(this.props,!1),y=rp(u,!1),v=AT(AT({},m),{},{fill:"none"},rp(l,!1)),g=f.map((function(e,r){var o=i.getTickLineCoord(e),a=o.line,g=o.tick,b=AT(AT(AT(AT({textAnchor:p,verticalAnchor:h},m),{},{stroke:"none",fill:s},y),g),{},{index:r,payload:e,visibleTicksCount:f.length,tickFormatter:c});return t.createElement(Ep,wT({className:"recharts-cartesian-axis-tick",key:"tick-".concat(e.value,"-").concat(e.coordinate,"-").concat(e.tickCoord)},Uf(i.props,e,r)),l&&t.createElement("line",wT({},v,a,{className:zt("recharts-cartesian-axis-tick-line",hf()(l,"className"))})),u&&n.renderTickItem(u,b,"".concat(_f()(c)?c(e.value,r):e.value).concat(d||"")))}));return t.createElement("g",{className:"recharts-cartesian-axis-ticks"},g)}},{key:"render",value:function(){var e=this,n=this.props,r=n.axisLine,o=n.width,i=n.height,a=n.ticksGenerator,l=n.className;if(n.hide)return null;var s=this.props,u=s.ticks,c=OT(s,bT),d=u;return _f()(a)&&(d=u&&u.length>0?a(this.props):a(c)),o<=0||i<=0||!d||!d.length?null:t.createElement(Ep,{className:zt("recharts-cartesian-axis",l),ref:function(t){e.layerReference=t}},r&&this.renderAxisLine(),this.renderTicks(d,this.state.fontSize,this.state.letterSpacing),Nk.renderCallByParent(this.props))}}],i=[{key:"renderTickItem",value:function(e,n,r){return t.isValidElement(e)?t.cloneElement(e,n):_f()(e)?e(n):t.createElement(fg,wT({},n,{className:"recharts-cartesian-axis-tick-value"}),r)}}],o&&kT(r.prototype,o),i&&kT(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);function RT(e){return RT="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},RT(e)}function NT(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,BT(r.key),r)}}function IT(e,t,n){return t=LT(t),function(e,t){if(t&&("object"===RT(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,DT()?Reflect.construct(t,n||[],LT(e).constructor):t.apply(e,n))}function DT(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(DT=function(){return!!e})()}function LT(e){return LT=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},LT(e)}function zT(e,t){return zT=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},zT(e,t)}function $T(e,t,n){return(t=BT(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function BT(e){var t=function(e,t){if("object"!=RT(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=RT(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==RT(t)?t:t+""}function FT(){return FT=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},FT.apply(this,arguments)}function WT(e){var n=e.xAxisId,r=KE(),o=GE(),i=qE(n);return null==i?null:t.createElement(_T,FT({},i,{className:zt("recharts-".concat(i.axisType," ").concat(i.axisType),i.className),viewBox:{x:0,y:0,width:r,height:o},ticksGenerator:function(e){return PO(e,!0)}}))}MT(_T,"displayName","CartesianAxis"),MT(_T,"defaultProps",{x:0,y:0,width:0,height:0,viewBox:{x:0,y:0,width:0,height:0},orientation:"bottom",ticks:[],stroke:"#666",tickLine:!0,axisLine:!0,tick:!0,mirror:!1,minTickGap:5,tickSize:6,tickMargin:2,interval:"preserveEnd"});var UT=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),IT(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&zT(e,t)}(n,e),r=n,(o=[{key:"render",value:function(){return t.createElement(WT,this.props)}}])&&NT(r.prototype,o),i&&NT(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);function HT(e){return HT="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},HT(e)}function VT(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,QT(r.key),r)}}function qT(e,t,n){return t=KT(t),function(e,t){if(t&&("object"===HT(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,XT()?Reflect.construct(t,n||[],KT(e).constructor):t.apply(e,n))}function XT(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(XT=function(){return!!e})()}function KT(e){return KT=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},KT(e)}function GT(e,t){return GT=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},GT(e,t)}function YT(e,t,n){return(t=QT(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function QT(e){var t=function(e,t){if("object"!=HT(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=HT(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==HT(t)?t:t+""}function JT(){return JT=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},JT.apply(this,arguments)}$T(UT,"displayName","XAxis"),$T(UT,"defaultProps",{allowDecimals:!0,hide:!1,orientation:"bottom",width:0,height:30,mirror:!1,xAxisId:0,tickCount:5,type:"category",padding:{left:0,right:0},allowDataOverflow:!1,scale:"auto",reversed:!1,allowDuplicatedCategory:!0});var ZT=function(e){var n=e.yAxisId,r=KE(),o=GE(),i=XE(n);return null==i?null:t.createElement(_T,JT({},i,{className:zt("recharts-".concat(i.axisType," ").concat(i.axisType),i.className),viewBox:{x:0,y:0,width:r,height:o},ticksGenerator:function(e){return PO(e,!0)}}))},e_=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),qT(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&GT(e,t)}(n,e),r=n,(o=[{key:"render",value:function(){return t.createElement(ZT,this.props)}}])&&VT(r.prototype,o),i&&VT(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);YT(e_,"displayName","YAxis"),YT(e_,"defaultProps",{allowDuplicatedCategory:!0,allowDecimals:!0,hide:!1,orientation:"left",width:60,height:0,mirror:!1,yAxisId:0,tickCount:5,type:"number",padding:{top:0,bottom:0},allowDataOverflow:!1,scale:"auto",reversed:!1});var t_=lM({chartName:"BarChart",GraphicalChild:cE,defaultTooltipEventType:"axis",validateTooltipEventTypes:["axis","item"],axisComponents:[{axisType:"xAxis",AxisComp:UT},{axisType:"yAxis",AxisComp:e_}],formatAxisMap:function(e,t,n,r,o){var i=e.width,a=e.height,l=e.layout,s=e.children,u=Object.keys(t),c={left:n.left,leftMirror:n.left,right:i-n.right,rightMirror:i-n.right,top:n.top,topMirror:n.top,bottom:a-n.bottom,bottomMirror:a-n.bottom},d=!!Zf(s,cE);return u.reduce((function(i,a){var s,u,f,p,h,m=t[a],y=m.orientation,v=m.domain,g=m.padding,b=void 0===g?{}:g,x=m.mirror,w=m.reversed,S="".concat(y).concat(x?"Mirror":"");if("number"===m.type&&("gap"===m.padding||"no-gap"===m.padding)){var A=v[1]-v[0],O=1/0,k=m.categoricalDomain.sort(Ef);if(k.forEach((function(e,t){t>0&&(O=Math.min((e||0)-(k[t-1]||0),O))})),Number.isFinite(O)){var j=O/A,E="vertical"===m.layout?n.height:n.width;if("gap"===m.padding&&(s=j*E/2),"no-gap"===m.padding){var C=Af(e.barCategoryGap,j*E),P=j*E/2;s=P-C-(P-C)/E*C}}}u="xAxis"===r?[n.left+(b.left||0)+(s||0),n.left+n.width-(b.right||0)-(s||0)]:"yAxis"===r?"horizontal"===l?[n.top+n.height-(b.bottom||0),n.top+(b.top||0)]:[n.top+(b.top||0)+(s||0),n.top+n.height-(b.bottom||0)-(s||0)]:m.range,w&&(u=[u[1],u[0]]);var M=_O(m,o,d),T=M.scale,_=M.realScaleType;T.domain(v).range(u),NO(T);var R=LO(T,hE(hE({},m),{},{realScaleType:_}));"xAxis"===r?(h="top"===y&&!x||"bottom"===y&&x,f=n.left,p=c[S]-h*m.height):"yAxis"===r&&(h="left"===y&&!x||"right"===y&&x,f=c[S]-h*m.width,p=n.top);var N=hE(hE(hE({},m),R),{},{realScaleType:_,x:f,y:p,scale:T,width:"xAxis"===r?n.width:m.width,height:"yAxis"===r?n.height:m.height});return N.bandSize=UO(N,R),m.hide||"xAxis"!==r?m.hide||(c[S]+=(h?-1:1)*N.width):c[S]+=(h?-1:1)*N.height,hE(hE({},i),{},mE({},a,N))}),{})}}),n_=["x1","y1","x2","y2","key"],r_=["offset"];function o_(e){return o_="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},o_(e)}function i_(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function a_(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?i_(Object(n),!0).forEach((function(t){l_(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):i_(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function l_(e,t,n){return t=function(e){var t=function(e,t){if("object"!=o_(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=o_(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==o_(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function s_(){return s_=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},s_.apply(this,arguments)}function u_(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var c_=function(e){var n=e.fill;if(!n||"none"===n)return null;var r=e.fillOpacity,o=e.x,i=e.y,a=e.width,l=e.height,s=e.ry;return t.createElement("rect",{x:o,y:i,ry:s,width:a,height:l,stroke:"none",fill:n,fillOpacity:r,className:"recharts-cartesian-grid-bg"})};function d_(e,n){var r;if(t.isValidElement(e))r=t.cloneElement(e,n);else if(_f()(e))r=e(n);else{var o=n.x1,i=n.y1,a=n.x2,l=n.y2,s=n.key,u=u_(n,n_),c=rp(u,!1),d=(c.offset,u_(c,r_));r=t.createElement("line",s_({},d,{x1:o,y1:i,x2:a,y2:l,fill:"none",key:s}))}return r}function f_(e){var n=e.x,r=e.width,o=e.horizontal,i=void 0===o||o,a=e.horizontalPoints;if(!i||!a||!a.length)return null;var l=a.map((function(t,o){var a=a_(a_({},e),{},{x1:n,y1:t,x2:n+r,y2:t,key:"line-".concat(o),index:o});return d_(i,a)}));return t.createElement("g",{className:"recharts-cartesian-grid-horizontal"},l)}function p_(e){var n=e.y,r=e.height,o=e.vertical,i=void 0===o||o,a=e.verticalPoints;if(!i||!a||!a.length)return null;var l=a.map((function(t,o){var a=a_(a_({},e),{},{x1:t,y1:n,x2:t,y2:n+r,key:"line-".concat(o),index:o});return d_(i,a)}));return t.createElement("g",{className:"recharts-cartesian-grid-vertical"},l)}function h_(e){var n=e.horizontalFill,r=e.fillOpacity,o=e.x,i=e.y,a=e.width,l=e.height,s=e.horizontalPoints,u=e.horizontal;if(!(void 0===u||u)||!n||!n.length)return null;var c=s.map((function(e){return Math.round(e+i-i)})).sort((function(e,t){return e-t}));i!==c[0]&&c.unshift(0);var d=c.map((function(e,s){var u=!c[s+1]?i+l-e:c[s+1]-e;if(u<=0)return null;var d=s%n.length;return t.createElement("rect",{key:"react-".concat(s),y:e,x:o,height:u,width:a,stroke:"none",fill:n[d],fillOpacity:r,className:"recharts-cartesian-grid-bg"})}));return t.createElement("g",{className:"recharts-cartesian-gridstripes-horizontal"},d)}function m_(e){var n=e.vertical,r=void 0===n||n,o=e.verticalFill,i=e.fillOpacity,a=e.x,l=e.y,s=e.width,u=e.height,c=e.verticalPoints;if(!r||!o||!o.length)return null;var d=c.map((function(e){return Math.round(e+a-a)})).sort((function(e,t){return e-t}));a!==d[0]&&d.unshift(0);var f=d.map((function(e,n){var r=!d[n+1]?a+s-e:d[n+1]-e;if(r<=0)return null;var c=n%o.length;return t.createElement("rect",{key:"react-".concat(n),x:e,y:l,width:r,height:u,stroke:"none",fill:o[c],fillOpacity:i,className:"recharts-cartesian-grid-bg"})}));return t.createElement("g",{className:"recharts-cartesian-gridstripes-vertical"},f)}var y_=function(e,t){var n=e.xAxis,r=e.width,o=e.height,i=e.offset;return CO(yT(a_(a_(a_({},_T.defaultProps),n),{},{ticks:PO(n,!0),viewBox:{x:0,y:0,width:r,height:o}})),i.left,i.left+i.width,t)},v_=function(e,t){var n=e.yAxis,r=e.width,o=e.height,i=e.offset;return CO(yT(a_(a_(a_({},_T.defaultProps),n),{},{ticks:PO(n,!0),viewBox:{x:0,y:0,width:r,height:o}})),i.top,i.top+i.height,t)},g_={horizontal:!0,vertical:!0,horizontalPoints:[],verticalPoints:[],stroke:"#ccc",fill:"none",verticalFill:[],horizontalFill:[]};function b_(e){var n,r,o,i,a,l,s=KE(),u=GE(),c=(0,t.useContext)(FE),d=a_(a_({},e),{},{stroke:null!==(n=e.stroke)&&void 0!==n?n:g_.stroke,fill:null!==(r=e.fill)&&void 0!==r?r:g_.fill,horizontal:null!==(o=e.horizontal)&&void 0!==o?o:g_.horizontal,horizontalFill:null!==(i=e.horizontalFill)&&void 0!==i?i:g_.horizontalFill,vertical:null!==(a=e.vertical)&&void 0!==a?a:g_.vertical,verticalFill:null!==(l=e.verticalFill)&&void 0!==l?l:g_.verticalFill,x:bf(e.x)?e.x:c.left,y:bf(e.y)?e.y:c.top,width:bf(e.width)?e.width:c.width,height:bf(e.height)?e.height:c.height}),f=d.x,p=d.y,h=d.width,m=d.height,y=d.syncWithTicks,v=d.horizontalValues,g=d.verticalValues,b=function(){var e=(0,t.useContext)(zE);return Of(e)}(),x=function(){var e=(0,t.useContext)($E);return IE()(e,(function(e){return Bk()(e.domain,Number.isFinite)}))||Of(e)}();if(!bf(h)||h<=0||!bf(m)||m<=0||!bf(f)||f!==+f||!bf(p)||p!==+p)return null;var w=d.verticalCoordinatesGenerator||y_,S=d.horizontalCoordinatesGenerator||v_,A=d.horizontalPoints,O=d.verticalPoints;if((!A||!A.length)&&_f()(S)){var k=v&&v.length,j=S({yAxis:x?a_(a_({},x),{},{ticks:k?v:x.ticks}):void 0,width:s,height:u,offset:c},!!k||y);Cf(Array.isArray(j),"horizontalCoordinatesGenerator should return Array but instead it returned [".concat(o_(j),"]")),Array.isArray(j)&&(A=j)}if((!O||!O.length)&&_f()(w)){var E=g&&g.length,C=w({xAxis:b?a_(a_({},b),{},{ticks:E?g:b.ticks}):void 0,width:s,height:u,offset:c},!!E||y);Cf(Array.isArray(C),"verticalCoordinatesGenerator should return Array but instead it returned [".concat(o_(C),"]")),Array.isArray(C)&&(O=C)}return t.createElement("g",{className:"recharts-cartesian-grid"},t.createElement(c_,{fill:d.fill,fillOpacity:d.fillOpacity,x:d.x,y:d.y,width:d.width,height:d.height,ry:d.ry}),t.createElement(f_,s_({},d,{offset:c,horizontalPoints:A,xAxis:b,yAxis:x})),t.createElement(p_,s_({},d,{offset:c,verticalPoints:O,xAxis:b,yAxis:x})),t.createElement(h_,s_({},d,{horizontalPoints:A})),t.createElement(m_,s_({},d,{verticalPoints:O})))}b_.displayName="CartesianGrid";const x_=["#0088FE","#00C49F","#FFBB28","#FF8042","#b59d2b","#c0392b","#232b5c"];const w_=function(){const e=ee(),[n,r]=(0,t.useState)(""),[o,i]=(0,t.useState)(""),[a,l]=(0,t.useState)(""),[s,u]=(0,t.useState)(!1),[c,d]=(0,t.useState)(!1),[f,p]=(0,t.useState)(0),[h,m]=(0,t.useState)(null),[y,v]=(0,t.useState)([]),[g,b]=(0,t.useState)([]),[x,w]=(0,t.useState)([]),[S,A]=(0,t.useState)(null),[O,k]=(0,t.useState)(!1);(0,t.useEffect)((()=>{sessionStorage.getItem("admin_username")?(u(!0),E(),C(),P(),M()):e("/admin/login")}),[]),(0,t.useEffect)((()=>{2===f&&(console.log("useEffect: Fetching courses because Courses tab is active"),P())}),[f]);const j=async e=>{e.preventDefault(),d(!0),l("");try{const e=await fetch("/api/admin/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({username:n,password:o})}),t=await e.json();t.success?(u(!0),E()):l(t.message||"Login failed")}catch(t){l("An error occurred during login")}finally{d(!1)}},E=async()=>{try{const e=await fetch("/api/admin/dashboard"),t=await e.json();t.success&&m(t.stats)}catch(e){console.error("Error fetching dashboard data:",e)}},C=async()=>{try{const e=await fetch("/api/admin/students"),t=await e.json();t.success&&v(t.students)}catch(e){console.error("Error fetching students:",e)}},P=async()=>{try{const e=await fetch("/api/admin/courses"),t=await e.json();t.success&&(console.log("Courses:",t.courses),b(t.courses))}catch(e){console.error("Error fetching courses:",e)}},M=async()=>{try{const e=await fetch("/api/admin/enrollments"),t=await e.json();t.success&&w(t.enrollments)}catch(e){console.error("Error fetching enrollments:",e)}},T=(e,t)=>{switch(p(t),console.log("Tab changed to:",t),t){case 0:E();break;case 1:C();break;case 2:console.log("Fetching courses..."),P();break;case 3:M()}},_=h?Object.entries(h.department_stats).map((e=>{let[t,n]=e;return{name:t,value:n}})):[],R=h?Object.entries(h.difficulty_stats).map((e=>{let[t,n]=e;return{name:t,value:n}})):[],N=h?h.top_courses.map((e=>({name:e.Course_Name,value:e.Enrollment_Count}))):[];return s?(0,Pt.jsx)(mr,{maxWidth:"xl",sx:{px:{xs:.5,sm:2},py:{xs:1,sm:4}},children:(0,Pt.jsxs)(qt,{sx:{mt:{xs:2,sm:4}},children:[(0,Pt.jsxs)(qt,{sx:{display:"flex",flexDirection:{xs:"column",sm:"row"},justifyContent:"space-between",alignItems:{xs:"flex-start",sm:"center"},mb:3,gap:2},children:[(0,Pt.jsx)(en,{variant:"h4",component:"h1",sx:{fontSize:{xs:24,sm:32}},children:"Admin Dashboard"}),(0,Pt.jsxs)(qt,{children:[(0,Pt.jsx)(qu,{title:"Refresh Data",children:(0,Pt.jsx)(ql,{onClick:()=>T(0,f),sx:{mr:1},children:(0,Pt.jsx)(af.A,{})})}),(0,Pt.jsx)(qu,{title:"Logout",children:(0,Pt.jsx)(ql,{onClick:()=>{sessionStorage.removeItem("admin_username"),u(!1),r(""),i(""),m(null),v([]),b([]),w([]),p(0),e("/admin/login")},children:(0,Pt.jsx)(of.A,{})})})]})]}),(0,Pt.jsxs)(bc,{value:f,onChange:T,sx:{mb:3,minHeight:48},variant:"scrollable",scrollButtons:"auto",children:[(0,Pt.jsx)(kc,{icon:(0,Pt.jsx)(ef.A,{}),label:"Dashboard",sx:{minWidth:100}}),(0,Pt.jsx)(kc,{icon:(0,Pt.jsx)(nf.A,{}),label:"Students",sx:{minWidth:100}}),(0,Pt.jsx)(kc,{icon:(0,Pt.jsx)(tf.A,{}),label:"Courses",sx:{minWidth:100}}),(0,Pt.jsx)(kc,{icon:(0,Pt.jsx)(rf.A,{}),label:"Enrollments",sx:{minWidth:100}})]}),0===f&&h&&(0,Pt.jsxs)(Dt,{container:!0,spacing:2,children:[(0,Pt.jsx)(Dt,{item:!0,xs:12,md:6,lg:3,children:(0,Pt.jsx)(Pc,{children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{color:"textSecondary",gutterBottom:!0,children:"Total Students"}),(0,Pt.jsx)(en,{variant:"h4",children:h.total_students})]})})}),(0,Pt.jsx)(Dt,{item:!0,xs:12,md:6,lg:3,children:(0,Pt.jsx)(Pc,{children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{color:"textSecondary",gutterBottom:!0,children:"Total Courses"}),(0,Pt.jsx)(en,{variant:"h4",children:h.total_courses})]})})}),(0,Pt.jsx)(Dt,{item:!0,xs:12,md:6,lg:3,children:(0,Pt.jsx)(Pc,{children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{color:"textSecondary",gutterBottom:!0,children:"Total Enrollments"}),(0,Pt.jsx)(en,{variant:"h4",children:h.total_enrollments})]})})}),(0,Pt.jsx)(Dt,{item:!0,xs:12,md:6,lg:3,children:(0,Pt.jsx)(Pc,{children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{color:"textSecondary",gutterBottom:!0,children:"Departments"}),(0,Pt.jsx)(en,{variant:"h4",children:Object.keys(h.department_stats).length})]})})}),(0,Pt.jsx)(Dt,{item:!0,xs:12,md:6,lg:4,children:(0,Pt.jsx)(Pc,{sx:{height:340},children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{variant:"h6",align:"center",children:"Students by Department"}),(0,Pt.jsx)(pp,{width:"100%",height:250,children:(0,Pt.jsxs)(sT,{children:[(0,Pt.jsx)(lT,{data:_,dataKey:"value",nameKey:"name",cx:"50%",cy:"50%",outerRadius:80,label:!0,children:_.map(((e,t)=>(0,Pt.jsx)(Fk,{fill:x_[t%x_.length]},`cell-${t}`)))}),(0,Pt.jsx)(mh,{}),(0,Pt.jsx)(Pm,{})]})})]})})}),(0,Pt.jsx)(Dt,{item:!0,xs:12,md:6,lg:4,children:(0,Pt.jsx)(Pc,{sx:{height:340},children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{variant:"h6",align:"center",children:"Course Difficulty Distribution"}),(0,Pt.jsx)(pp,{width:"100%",height:250,children:(0,Pt.jsxs)(t_,{data:R,margin:{top:20,right:30,left:0,bottom:0},children:[(0,Pt.jsx)(b_,{strokeDasharray:"3 3"}),(0,Pt.jsx)(UT,{dataKey:"name"}),(0,Pt.jsx)(e_,{}),(0,Pt.jsx)(mh,{}),(0,Pt.jsx)(Pm,{}),(0,Pt.jsx)(cE,{dataKey:"value",fill:"#1976d2"})]})})]})})}),(0,Pt.jsx)(Dt,{item:!0,xs:12,md:12,lg:4,children:(0,Pt.jsx)(Pc,{sx:{height:340},children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{variant:"h6",align:"center",children:"Top Enrolled Courses"}),(0,Pt.jsx)(pp,{width:"100%",height:250,children:(0,Pt.jsxs)(t_,{data:N,layout:"vertical",margin:{top:20,right:30,left:0,bottom:0},children:[(0,Pt.jsx)(b_,{strokeDasharray:"3 3"}),(0,Pt.jsx)(UT,{type:"number"}),(0,Pt.jsx)(e_,{dataKey:"name",type:"category",width:120}),(0,Pt.jsx)(mh,{}),(0,Pt.jsx)(Pm,{}),(0,Pt.jsx)(cE,{dataKey:"value",fill:"#c0392b"})]})})]})})})]}),1===f&&(0,Pt.jsx)(qt,{sx:{width:"100%",overflowX:"auto"},children:(0,Pt.jsx)(Lc,{component:sn,sx:{minWidth:600},children:(0,Pt.jsxs)(Uc,{size:"small",children:[(0,Pt.jsx)(Yc,{children:(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:"Student ID"}),(0,Pt.jsx)(ud,{children:"Name"}),(0,Pt.jsx)(ud,{children:"Department"}),(0,Pt.jsx)(ud,{children:"CGPA"}),(0,Pt.jsx)(ud,{children:"Completed Courses"})]})}),(0,Pt.jsx)(md,{children:y.map((e=>(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:e.Student_ID}),(0,Pt.jsx)(ud,{children:e.Name}),(0,Pt.jsx)(ud,{children:e.Department}),(0,Pt.jsx)(ud,{children:e.CGPA}),(0,Pt.jsx)(ud,{children:e.Completed_Courses})]},e.Student_ID)))})]})})}),2===f&&(0,Pt.jsx)(qt,{sx:{width:"100%",overflowX:"auto"},children:(0,Pt.jsx)(Lc,{component:sn,sx:{minWidth:600},children:(0,Pt.jsxs)(Uc,{size:"small",children:[(0,Pt.jsx)(Yc,{children:(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:"Course Code"}),(0,Pt.jsx)(ud,{children:"Course Name"}),(0,Pt.jsx)(ud,{children:"Department"}),(0,Pt.jsx)(ud,{children:"Prerequisites"}),(0,Pt.jsx)(ud,{children:"Credit Hours"}),(0,Pt.jsx)(ud,{children:"Difficulty"})]})}),(0,Pt.jsx)(md,{children:0===g.length?(0,Pt.jsx)(rd,{children:(0,Pt.jsx)(ud,{colSpan:6,align:"center",children:"No courses found."})}):g.map(((e,t)=>(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:e.Course_Code}),(0,Pt.jsx)(ud,{children:e.Course_Name}),(0,Pt.jsx)(ud,{children:e.Department}),(0,Pt.jsx)(ud,{children:e.Prerequisites}),(0,Pt.jsx)(ud,{children:e.Credit_Hours}),(0,Pt.jsx)(ud,{children:e.Difficulty})]},e.Course_Code||t)))})]})})}),3===f&&(0,Pt.jsx)(qt,{sx:{width:"100%",overflowX:"auto"},children:(0,Pt.jsx)(Lc,{component:sn,sx:{minWidth:600},children:(0,Pt.jsxs)(Uc,{size:"small",children:[(0,Pt.jsx)(Yc,{children:(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:"Course Code"}),(0,Pt.jsx)(ud,{children:"Course Name"}),(0,Pt.jsx)(ud,{children:"Enrollment Count"}),(0,Pt.jsx)(ud,{children:"Students Enrolled"})]})}),(0,Pt.jsx)(md,{children:x.map((e=>(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:e.Course_Code}),(0,Pt.jsx)(ud,{children:e.Course_Name}),(0,Pt.jsx)(ud,{children:e.Enrollment_Count}),(0,Pt.jsx)(ud,{children:e.Students_Enrolled})]},e.Course_Code)))})]})})})]})}):(0,Pt.jsxs)(mr,{maxWidth:"sm",children:[(0,Pt.jsx)(qt,{sx:{mt:8,display:"flex",flexDirection:"column",alignItems:"center"},children:(0,Pt.jsxs)(sn,{elevation:3,sx:{p:4,width:"100%"},children:[(0,Pt.jsx)(en,{component:"h1",variant:"h5",align:"center",gutterBottom:!0,children:"Admin Login"}),(0,Pt.jsxs)("form",{onSubmit:j,children:[(0,Pt.jsx)(cl,{margin:"normal",required:!0,fullWidth:!0,label:"Username",value:n,onChange:e=>r(e.target.value)}),(0,Pt.jsx)(cl,{margin:"normal",required:!0,fullWidth:!0,label:"Password",type:"password",value:o,onChange:e=>i(e.target.value)}),(0,Pt.jsx)(or,{type:"submit",fullWidth:!0,variant:"contained",sx:{mt:3,mb:2},disabled:c,children:c?(0,Pt.jsx)(kl,{size:24}):"Login"})]})]})}),(0,Pt.jsx)(zl,{open:!!a,autoHideDuration:6e3,onClose:()=>l(""),children:(0,Pt.jsx)(is,{severity:"error",onClose:()=>l(""),children:a})})]})};const S_=function(){const e=ee(),[n,r]=(0,t.useState)(""),[o,i]=(0,t.useState)(""),[a,l]=(0,t.useState)(""),[s,u]=(0,t.useState)(!1);return(0,Pt.jsxs)(mr,{maxWidth:"sm",children:[(0,Pt.jsx)(qt,{sx:{mt:8,display:"flex",flexDirection:"column",alignItems:"center"},children:(0,Pt.jsxs)(sn,{elevation:3,sx:{p:4,width:"100%"},children:[(0,Pt.jsx)(en,{component:"h1",variant:"h5",align:"center",gutterBottom:!0,children:"Student Login"}),(0,Pt.jsxs)("form",{onSubmit:async t=>{t.preventDefault(),u(!0),l("");try{const t=await fetch("/api/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({student_id:n,password:o})}),r=await t.json();r.success?(sessionStorage.setItem("student_id",n),e("/student/dashboard")):l(r.message||"Login failed")}catch(r){l("An error occurred during login")}finally{u(!1)}},children:[(0,Pt.jsx)(cl,{margin:"normal",required:!0,fullWidth:!0,label:"Student ID",value:n,onChange:e=>r(e.target.value)}),(0,Pt.jsx)(cl,{margin:"normal",required:!0,fullWidth:!0,label:"Password",type:"password",value:o,onChange:e=>i(e.target.value)}),(0,Pt.jsx)(or,{type:"submit",fullWidth:!0,variant:"contained",sx:{mt:3,mb:2},disabled:s,children:s?(0,Pt.jsx)(kl,{size:24}):"Login"})]})]})}),(0,Pt.jsx)(zl,{open:!!a,autoHideDuration:6e3,onClose:()=>l(""),children:(0,Pt.jsx)(is,{severity:"error",onClose:()=>l(""),children:a})})]})};const A_=function(){const e=ee(),[n,r]=(0,t.useState)(""),[o,i]=(0,t.useState)(""),[a,l]=(0,t.useState)(""),[s,u]=(0,t.useState)(!1);return(0,Pt.jsxs)(mr,{maxWidth:"sm",children:[(0,Pt.jsx)(qt,{sx:{mt:8,display:"flex",flexDirection:"column",alignItems:"center"},children:(0,Pt.jsxs)(sn,{elevation:3,sx:{p:4,width:"100%"},children:[(0,Pt.jsx)(en,{component:"h1",variant:"h5",align:"center",gutterBottom:!0,children:"Admin Login"}),(0,Pt.jsxs)("form",{onSubmit:async t=>{t.preventDefault(),u(!0),l("");try{const t=await fetch("/api/admin/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({username:n,password:o})}),r=await t.json();r.success?(sessionStorage.setItem("admin_username",n),e("/admin/dashboard")):l(r.message||"Login failed")}catch(r){l("An error occurred during login")}finally{u(!1)}},children:[(0,Pt.jsx)(cl,{margin:"normal",required:!0,fullWidth:!0,label:"Username",value:n,onChange:e=>r(e.target.value)}),(0,Pt.jsx)(cl,{margin:"normal",required:!0,fullWidth:!0,label:"Password",type:"password",value:o,onChange:e=>i(e.target.value)}),(0,Pt.jsx)(or,{type:"submit",fullWidth:!0,variant:"contained",sx:{mt:3,mb:2},disabled:s,children:s?(0,Pt.jsx)(kl,{size:24}):"Login"})]})]})}),(0,Pt.jsx)(zl,{open:!!a,autoHideDuration:6e3,onClose:()=>l(""),children:(0,Pt.jsx)(is,{severity:"error",onClose:()=>l(""),children:a})})]})};function O_(e){return(0,kt.Ay)("MuiListItem",e)}const k_=(0,Ot.A)("MuiListItem",["root","container","focusVisible","dense","alignItemsFlexStart","disabled","divider","gutters","padding","button","secondaryAction","selected"]);const j_=(0,Ot.A)("MuiListItemButton",["root","focusVisible","dense","alignItemsFlexStart","disabled","divider","gutters","selected"]);function E_(e){return(0,kt.Ay)("MuiListItemSecondaryAction",e)}(0,Ot.A)("MuiListItemSecondaryAction",["root","disableGutters"]);const C_=["className"],P_=(0,vt.Ay)("div",{name:"MuiListItemSecondaryAction",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.disableGutters&&t.disableGutters]}})((e=>{let{ownerState:t}=e;return(0,ut.A)({position:"absolute",right:16,top:"50%",transform:"translateY(-50%)"},t.disableGutters&&{right:0})})),M_=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiListItemSecondaryAction"}),{className:o}=r,i=(0,st.A)(r,C_),a=t.useContext(qo),l=(0,ut.A)({},r,{disableGutters:a.disableGutters}),s=(e=>{const{disableGutters:t,classes:n}=e,r={root:["root",t&&"disableGutters"]};return(0,yt.A)(r,E_,n)})(l);return(0,Pt.jsx)(P_,(0,ut.A)({className:(0,ct.A)(s.root,o),ownerState:l,ref:n},i))}));M_.muiName="ListItemSecondaryAction";const T_=M_,__=["className"],R_=["alignItems","autoFocus","button","children","className","component","components","componentsProps","ContainerComponent","ContainerProps","dense","disabled","disableGutters","disablePadding","divider","focusVisibleClassName","secondaryAction","selected","slotProps","slots"],N_=(0,vt.Ay)("div",{name:"MuiListItem",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.dense&&t.dense,"flex-start"===n.alignItems&&t.alignItemsFlexStart,n.divider&&t.divider,!n.disableGutters&&t.gutters,!n.disablePadding&&t.padding,n.button&&t.button,n.hasSecondaryAction&&t.secondaryAction]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({display:"flex",justifyContent:"flex-start",alignItems:"center",position:"relative",textDecoration:"none",width:"100%",boxSizing:"border-box",textAlign:"left"},!n.disablePadding&&(0,ut.A)({paddingTop:8,paddingBottom:8},n.dense&&{paddingTop:4,paddingBottom:4},!n.disableGutters&&{paddingLeft:16,paddingRight:16},!!n.secondaryAction&&{paddingRight:48}),!!n.secondaryAction&&{[`& > .${j_.root}`]:{paddingRight:48}},{[`&.${k_.focusVisible}`]:{backgroundColor:(t.vars||t).palette.action.focus},[`&.${k_.selected}`]:{backgroundColor:t.vars?`rgba(${t.vars.palette.primary.mainChannel} / ${t.vars.palette.action.selectedOpacity})`:(0,tn.X4)(t.palette.primary.main,t.palette.action.selectedOpacity),[`&.${k_.focusVisible}`]:{backgroundColor:t.vars?`rgba(${t.vars.palette.primary.mainChannel} / calc(${t.vars.palette.action.selectedOpacity} + ${t.vars.palette.action.focusOpacity}))`:(0,tn.X4)(t.palette.primary.main,t.palette.action.selectedOpacity+t.palette.action.focusOpacity)}},[`&.${k_.disabled}`]:{opacity:(t.vars||t).palette.action.disabledOpacity}},"flex-start"===n.alignItems&&{alignItems:"flex-start"},n.divider&&{borderBottom:`1px solid ${(t.vars||t).palette.divider}`,backgroundClip:"padding-box"},n.button&&{transition:t.transitions.create("background-color",{duration:t.transitions.duration.shortest}),"&:hover":{textDecoration:"none",backgroundColor:(t.vars||t).palette.action.hover,"@media (hover: none)":{backgroundColor:"transparent"}},[`&.${k_.selected}:hover`]:{backgroundColor:t.vars?`rgba(${t.vars.palette.primary.mainChannel} / calc(${t.vars.palette.action.selectedOpacity} + ${t.vars.palette.action.hoverOpacity}))`:(0,tn.X4)(t.palette.primary.main,t.palette.action.selectedOpacity+t.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:t.vars?`rgba(${t.vars.palette.primary.mainChannel} / ${t.vars.palette.action.selectedOpacity})`:(0,tn.X4)(t.palette.primary.main,t.palette.action.selectedOpacity)}}},n.hasSecondaryAction&&{paddingRight:48})})),I_=(0,vt.Ay)("li",{name:"MuiListItem",slot:"Container",overridesResolver:(e,t)=>t.container})({position:"relative"}),D_=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiListItem"}),{alignItems:o="center",autoFocus:i=!1,button:a=!1,children:l,className:s,component:u,components:c={},componentsProps:d={},ContainerComponent:f="li",ContainerProps:{className:p}={},dense:h=!1,disabled:m=!1,disableGutters:y=!1,disablePadding:v=!1,divider:g=!1,focusVisibleClassName:b,secondaryAction:x,selected:w=!1,slotProps:S={},slots:A={}}=r,O=(0,st.A)(r.ContainerProps,__),k=(0,st.A)(r,R_),j=t.useContext(qo),E=t.useMemo((()=>({dense:h||j.dense||!1,alignItems:o,disableGutters:y})),[o,j.dense,h,y]),C=t.useRef(null);(0,Rr.A)((()=>{i&&C.current&&C.current.focus()}),[i]);const P=t.Children.toArray(l),M=P.length&&(0,Ro.A)(P[P.length-1],["ListItemSecondaryAction"]),T=(0,ut.A)({},r,{alignItems:o,autoFocus:i,button:a,dense:E.dense,disabled:m,disableGutters:y,disablePadding:v,divider:g,hasSecondaryAction:M,selected:w}),_=(e=>{const{alignItems:t,button:n,classes:r,dense:o,disabled:i,disableGutters:a,disablePadding:l,divider:s,hasSecondaryAction:u,selected:c}=e,d={root:["root",o&&"dense",!a&&"gutters",!l&&"padding",s&&"divider",i&&"disabled",n&&"button","flex-start"===t&&"alignItemsFlexStart",u&&"secondaryAction",c&&"selected"],container:["container"]};return(0,yt.A)(d,O_,r)})(T),R=(0,cn.A)(C,n),N=A.root||c.Root||N_,I=S.root||d.root||{},D=(0,ut.A)({className:(0,ct.A)(_.root,I.className,s),disabled:m},k);let L=u||"li";return a&&(D.component=u||"div",D.focusVisibleClassName=(0,ct.A)(k_.focusVisible,b),L=Kn),M?(L=D.component||u?L:"div","li"===f&&("li"===L?L="div":"li"===D.component&&(D.component="div")),(0,Pt.jsx)(qo.Provider,{value:E,children:(0,Pt.jsxs)(I_,(0,ut.A)({as:f,className:(0,ct.A)(_.container,p),ref:R,ownerState:T},O,{children:[(0,Pt.jsx)(N,(0,ut.A)({},I,!Pr(N)&&{as:L,ownerState:(0,ut.A)({},T,I.ownerState)},D,{children:P})),P.pop()]}))})):(0,Pt.jsx)(qo.Provider,{value:E,children:(0,Pt.jsxs)(N,(0,ut.A)({},I,{as:L,ref:R},!Pr(N)&&{ownerState:(0,ut.A)({},T,I.ownerState)},D,{children:[P,x&&(0,Pt.jsx)(T_,{children:x})]}))})})),L_=(0,Ya.A)((0,Pt.jsx)("path",{d:"M12 12c2.21 0 4-1.79 4-4s-1.79-4-4-4-4 1.79-4 4 1.79 4 4 4zm0 2c-2.67 0-8 1.34-8 4v2h16v-2c0-2.66-5.33-4-8-4z"}),"Person");function z_(e){return(0,kt.Ay)("MuiAvatar",e)}(0,Ot.A)("MuiAvatar",["root","colorDefault","circular","rounded","square","img","fallback"]);const $_=["alt","children","className","component","imgProps","sizes","src","srcSet","variant"],B_=(0,vt.Ay)("div",{name:"MuiAvatar",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[n.variant],n.colorDefault&&t.colorDefault]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({position:"relative",display:"flex",alignItems:"center",justifyContent:"center",flexShrink:0,width:40,height:40,fontFamily:t.typography.fontFamily,fontSize:t.typography.pxToRem(20),lineHeight:1,borderRadius:"50%",overflow:"hidden",userSelect:"none"},"rounded"===n.variant&&{borderRadius:(t.vars||t).shape.borderRadius},"square"===n.variant&&{borderRadius:0},n.colorDefault&&(0,ut.A)({color:(t.vars||t).palette.background.default},t.vars?{backgroundColor:t.vars.palette.Avatar.defaultBg}:{backgroundColor:"light"===t.palette.mode?t.palette.grey[400]:t.palette.grey[600]}))})),F_=(0,vt.Ay)("img",{name:"MuiAvatar",slot:"Img",overridesResolver:(e,t)=>t.img})({width:"100%",height:"100%",textAlign:"center",objectFit:"cover",color:"transparent",textIndent:1e4}),W_=(0,vt.Ay)(L_,{name:"MuiAvatar",slot:"Fallback",overridesResolver:(e,t)=>t.fallback})({width:"75%",height:"75%"});const U_=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiAvatar"}),{alt:o,children:i,className:a,component:l="div",imgProps:s,sizes:u,src:c,srcSet:d,variant:f="circular"}=r,p=(0,st.A)(r,$_);let h=null;const m=function(e){let{crossOrigin:n,referrerPolicy:r,src:o,srcSet:i}=e;const[a,l]=t.useState(!1);return t.useEffect((()=>{if(!o&&!i)return;l(!1);let e=!0;const t=new Image;return t.onload=()=>{e&&l("loaded")},t.onerror=()=>{e&&l("error")},t.crossOrigin=n,t.referrerPolicy=r,t.src=o,i&&(t.srcset=i),()=>{e=!1}}),[n,r,o,i]),a}((0,ut.A)({},s,{src:c,srcSet:d})),y=c||d,v=y&&"error"!==m,g=(0,ut.A)({},r,{colorDefault:!v,component:l,variant:f}),b=(e=>{const{classes:t,variant:n,colorDefault:r}=e,o={root:["root",n,r&&"colorDefault"],img:["img"],fallback:["fallback"]};return(0,yt.A)(o,z_,t)})(g);return h=v?(0,Pt.jsx)(F_,(0,ut.A)({alt:o,src:c,srcSet:d,sizes:u,ownerState:g,className:b.img},s)):null!=i?i:y&&o?o[0]:(0,Pt.jsx)(W_,{ownerState:g,className:b.fallback}),(0,Pt.jsx)(B_,(0,ut.A)({as:l,ownerState:g,className:(0,ct.A)(b.root,a),ref:n},p,{children:h}))}));function H_(e){return(0,kt.Ay)("MuiDivider",e)}(0,Ot.A)("MuiDivider",["root","absolute","fullWidth","inset","middle","flexItem","light","vertical","withChildren","withChildrenVertical","textAlignRight","textAlignLeft","wrapper","wrapperVertical"]);const V_=["absolute","children","className","component","flexItem","light","orientation","role","textAlign","variant"],q_=(0,vt.Ay)("div",{name:"MuiDivider",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.absolute&&t.absolute,t[n.variant],n.light&&t.light,"vertical"===n.orientation&&t.vertical,n.flexItem&&t.flexItem,n.children&&t.withChildren,n.children&&"vertical"===n.orientation&&t.withChildrenVertical,"right"===n.textAlign&&"vertical"!==n.orientation&&t.textAlignRight,"left"===n.textAlign&&"vertical"!==n.orientation&&t.textAlignLeft]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({margin:0,flexShrink:0,borderWidth:0,borderStyle:"solid",borderColor:(t.vars||t).palette.divider,borderBottomWidth:"thin"},n.absolute&&{position:"absolute",bottom:0,left:0,width:"100%"},n.light&&{borderColor:t.vars?`rgba(${t.vars.palette.dividerChannel} / 0.08)`:(0,tn.X4)(t.palette.divider,.08)},"inset"===n.variant&&{marginLeft:72},"middle"===n.variant&&"horizontal"===n.orientation&&{marginLeft:t.spacing(2),marginRight:t.spacing(2)},"middle"===n.variant&&"vertical"===n.orientation&&{marginTop:t.spacing(1),marginBottom:t.spacing(1)},"vertical"===n.orientation&&{height:"100%",borderBottomWidth:0,borderRightWidth:"thin"},n.flexItem&&{alignSelf:"stretch",height:"auto"})}),(e=>{let{ownerState:t}=e;return(0,ut.A)({},t.children&&{display:"flex",whiteSpace:"nowrap",textAlign:"center",border:0,"&::before, &::after":{content:'""',alignSelf:"center"}})}),(e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({},n.children&&"vertical"!==n.orientation&&{"&::before, &::after":{width:"100%",borderTop:`thin solid ${(t.vars||t).palette.divider}`}})}),(e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({},n.children&&"vertical"===n.orientation&&{flexDirection:"column","&::before, &::after":{height:"100%",borderLeft:`thin solid ${(t.vars||t).palette.divider}`}})}),(e=>{let{ownerState:t}=e;return(0,ut.A)({},"right"===t.textAlign&&"vertical"!==t.orientation&&{"&::before":{width:"90%"},"&::after":{width:"10%"}},"left"===t.textAlign&&"vertical"!==t.orientation&&{"&::before":{width:"10%"},"&::after":{width:"90%"}})})),X_=(0,vt.Ay)("span",{name:"MuiDivider",slot:"Wrapper",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.wrapper,"vertical"===n.orientation&&t.wrapperVertical]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({display:"inline-block",paddingLeft:`calc(${t.spacing(1)} * 1.2)`,paddingRight:`calc(${t.spacing(1)} * 1.2)`},"vertical"===n.orientation&&{paddingTop:`calc(${t.spacing(1)} * 1.2)`,paddingBottom:`calc(${t.spacing(1)} * 1.2)`})})),K_=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiDivider"}),{absolute:r=!1,children:o,className:i,component:a=(o?"div":"hr"),flexItem:l=!1,light:s=!1,orientation:u="horizontal",role:c=("hr"!==a?"separator":void 0),textAlign:d="center",variant:f="fullWidth"}=n,p=(0,st.A)(n,V_),h=(0,ut.A)({},n,{absolute:r,component:a,flexItem:l,light:s,orientation:u,role:c,textAlign:d,variant:f}),m=(e=>{const{absolute:t,children:n,classes:r,flexItem:o,light:i,orientation:a,textAlign:l,variant:s}=e,u={root:["root",t&&"absolute",s,i&&"light","vertical"===a&&"vertical",o&&"flexItem",n&&"withChildren",n&&"vertical"===a&&"withChildrenVertical","right"===l&&"vertical"!==a&&"textAlignRight","left"===l&&"vertical"!==a&&"textAlignLeft"],wrapper:["wrapper","vertical"===a&&"wrapperVertical"]};return(0,yt.A)(u,H_,r)})(h);return(0,Pt.jsx)(q_,(0,ut.A)({as:a,className:(0,ct.A)(m.root,i),role:c,ref:t,ownerState:h},p,{children:o?(0,Pt.jsx)(X_,{className:m.wrapper,ownerState:h,children:o}):null}))}));var G_=n(5678),Y_=n(7915),Q_=n(2177);const J_=()=>{const[e,n]=(0,t.useState)([]),[r,o]=(0,t.useState)(""),[i,a]=(0,t.useState)(!1),l=(0,t.useRef)(null);St();(0,t.useEffect)((()=>{(()=>{var e;null===(e=l.current)||void 0===e||e.scrollIntoView({behavior:"smooth"})})(),0===e.length&&n([{text:"Hello! I'm your academic advisor chatbot. I can help you with course recommendations and academic planning. How can I assist you today?",sender:"bot"}])}),[e]);const s=async()=>{if(!r.trim())return;const t={text:r,sender:"user"};n((e=>[...e,t])),o(""),a(!0);try{const t=await fetch("/api/chatbot/response",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({message:r,conversationHistory:e})}),o=await t.json();n((e=>[...e,{text:o.response,sender:"bot"}]))}catch(i){n((e=>[...e,{text:"I'm sorry, I encountered an error. Please try again.",sender:"bot"}]))}finally{a(!1)}};return(0,Pt.jsxs)(qt,{sx:{height:"80vh",display:"flex",flexDirection:"column",maxWidth:"800px",margin:"auto",padding:2,bgcolor:"background.default"},children:[(0,Pt.jsx)(sn,{elevation:3,sx:{flexGrow:1,overflow:"auto",mb:2,p:2,bgcolor:"background.paper"},children:(0,Pt.jsxs)(Yo,{children:[e.map(((n,r)=>(0,Pt.jsxs)(t.Fragment,{children:[(0,Pt.jsx)(D_,{sx:{display:"flex",justifyContent:"user"===n.sender?"flex-end":"flex-start",mb:1},children:(0,Pt.jsxs)(qt,{sx:{display:"flex",alignItems:"center",maxWidth:"70%"},children:["bot"===n.sender&&(0,Pt.jsx)(U_,{sx:{bgcolor:"primary.main",mr:1},children:(0,Pt.jsx)(Y_.A,{})}),(0,Pt.jsx)(sn,{elevation:1,sx:{p:2,bgcolor:"user"===n.sender?"primary.main":"background.paper",color:"user"===n.sender?"primary.contrastText":"text.primary"},children:(0,Pt.jsx)(en,{children:n.text})}),"user"===n.sender&&(0,Pt.jsx)(U_,{sx:{bgcolor:"secondary.main",ml:1},children:(0,Pt.jsx)(Q_.A,{})})]})}),r<e.length-1&&(0,Pt.jsx)(K_,{})]},r))),(0,Pt.jsx)("div",{ref:l})]})}),(0,Pt.jsxs)(qt,{sx:{display:"flex",gap:1},children:[(0,Pt.jsx)(cl,{fullWidth:!0,variant:"outlined",placeholder:"Type your message...",value:r,onChange:e=>o(e.target.value),onKeyPress:e=>"Enter"===e.key&&s(),disabled:i,sx:{"& .MuiOutlinedInput-root":{bgcolor:"background.paper"}}}),(0,Pt.jsx)(or,{variant:"contained",color:"primary",onClick:s,disabled:i,sx:{minWidth:"100px"},children:i?(0,Pt.jsx)(kl,{size:24}):(0,Pt.jsx)(G_.A,{})})]})]})};var Z_=n(9307),eR=n(2856);const tR=t.createContext(null);function nR(){return t.useContext(tR)}const rR="function"===typeof Symbol&&Symbol.for?Symbol.for("mui.nested"):"__THEME_NESTED__";const oR=function(e){const{children:n,theme:r}=e,o=nR(),i=t.useMemo((()=>{const e=null===o?r:function(e,t){if("function"===typeof t)return t(e);return(0,ut.A)({},e,t)}(o,r);return null!=e&&(e[rR]=null!==o),e}),[r,o]);return(0,Pt.jsx)(tR.Provider,{value:i,children:n})},iR=["value"],aR=t.createContext();const lR=function(e){let{value:t}=e,n=(0,st.A)(e,iR);return(0,Pt.jsx)(aR.Provider,(0,ut.A)({value:null==t||t},n))},sR=t.createContext(void 0);const uR=function(e){let{value:t,children:n}=e;return(0,Pt.jsx)(sR.Provider,{value:t,children:n})},cR={};function dR(e,n,r){let o=arguments.length>3&&void 0!==arguments[3]&&arguments[3];return t.useMemo((()=>{const t=e&&n[e]||n;if("function"===typeof r){const i=r(t),a=e?(0,ut.A)({},n,{[e]:i}):i;return o?()=>a:a}return e?(0,ut.A)({},n,{[e]:r}):(0,ut.A)({},n,r)}),[e,n,r,o])}const fR=function(e){const{children:t,theme:n,themeId:r}=e,o=(0,Pu.A)(cR),i=nR()||cR,a=dR(r,o,n),l=dR(r,i,n,!0),s="rtl"===a.direction;return(0,Pt.jsx)(oR,{theme:l,children:(0,Pt.jsx)(Sn.T.Provider,{value:a,children:(0,Pt.jsx)(lR,{value:s,children:(0,Pt.jsx)(uR,{value:null==a?void 0:a.components,children:t})})})})},pR=["theme"];function hR(e){let{theme:t}=e,n=(0,st.A)(e,pR);const r=t[wt.A];return(0,Pt.jsx)(fR,(0,ut.A)({},n,{themeId:r?wt.A:void 0,theme:r||t}))}const mR=(e,t)=>(0,ut.A)({WebkitFontSmoothing:"antialiased",MozOsxFontSmoothing:"grayscale",boxSizing:"border-box",WebkitTextSizeAdjust:"100%"},t&&!e.vars&&{colorScheme:e.palette.mode}),yR=e=>(0,ut.A)({color:(e.vars||e).palette.text.primary},e.typography.body1,{backgroundColor:(e.vars||e).palette.background.default,"@media print":{backgroundColor:(e.vars||e).palette.common.white}});const vR=function(e){const n=(0,gt.A)({props:e,name:"MuiCssBaseline"}),{children:r,enableColorScheme:o=!1}=n;return(0,Pt.jsxs)(t.Fragment,{children:[(0,Pt.jsx)(Dr,{styles:e=>function(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1];var n,r;const o={};t&&e.colorSchemes&&Object.entries(e.colorSchemes).forEach((t=>{let[n,r]=t;var i;o[e.getColorSchemeSelector(n).replace(/\s*&/,"")]={colorScheme:null==(i=r.palette)?void 0:i.mode}}));let i=(0,ut.A)({html:mR(e,t),"*, *::before, *::after":{boxSizing:"inherit"},"strong, b":{fontWeight:e.typography.fontWeightBold},body:(0,ut.A)({margin:0},yR(e),{"&::backdrop":{backgroundColor:(e.vars||e).palette.background.default}})},o);const a=null==(n=e.components)||null==(r=n.MuiCssBaseline)?void 0:r.styleOverrides;return a&&(i=[i,a]),i}(e,o)}),r]})},gR=(0,t.createContext)(),bR=e=>{let{children:n}=e;const[r,o]=(0,t.useState)((()=>localStorage.getItem("themeMode")||"light")),i=(0,t.useMemo)((()=>(0,Ut.A)({palette:{mode:r,..."light"===r?{primary:{main:"#1976d2"},secondary:{main:"#dc004e"},background:{default:"#ffffff",paper:"#ffffff"},text:{primary:"rgba(0, 0, 0, 0.87)",secondary:"rgba(0, 0, 0, 0.6)"}}:{primary:{main:"#90caf9"},secondary:{main:"#f48fb1"},background:{default:"#121212",paper:"#1e1e1e"},text:{primary:"#fff",secondary:"rgba(255, 255, 255, 0.7)"}}},components:{MuiPaper:{styleOverrides:{root:{backgroundImage:"none"}}},MuiAppBar:{styleOverrides:{root:{backgroundImage:"none"}}}}})),[r]);return(0,Pt.jsx)(gR.Provider,{value:{theme:i,toggleTheme:()=>{o((e=>{const t="light"===e?"dark":"light";return localStorage.setItem("themeMode",t),t}))},mode:r},children:(0,Pt.jsxs)(hR,{theme:i,children:[(0,Pt.jsx)(vR,{}),n]})})},xR=()=>{const{toggleTheme:e,mode:n}=(()=>{const e=(0,t.useContext)(gR);if(!e)throw new Error("useTheme must be used within a ThemeProvider");return e})(),r=St();return(0,Pt.jsx)(qu,{title:`Switch to ${"light"===n?"dark":"light"} mode`,children:(0,Pt.jsx)(ql,{onClick:e,color:"inherit",sx:{position:"fixed",top:16,right:16,zIndex:1e3,backgroundColor:"dark"===r.palette.mode?"rgba(255, 255, 255, 0.1)":"rgba(0, 0, 0, 0.1)","&:hover":{backgroundColor:"dark"===r.palette.mode?"rgba(255, 255, 255, 0.2)":"rgba(0, 0, 0, 0.2)"},transition:"all 0.3s ease"},children:"light"===n?(0,Pt.jsx)(Z_.A,{}):(0,Pt.jsx)(eR.A,{})})})};const wR=function(){return(0,Pt.jsx)(bR,{children:(0,Pt.jsxs)(Je,{children:[(0,Pt.jsx)(xR,{}),(0,Pt.jsxs)(ve,{children:[(0,Pt.jsx)(me,{path:"/",element:(0,Pt.jsx)(ir,{})}),(0,Pt.jsx)(me,{path:"/student/login",element:(0,Pt.jsx)(S_,{})}),(0,Pt.jsx)(me,{path:"/admin/login",element:(0,Pt.jsx)(A_,{})}),(0,Pt.jsx)(me,{path:"/student/dashboard",element:(0,Pt.jsx)(Zd,{})}),(0,Pt.jsx)(me,{path:"/admin/dashboard",element:(0,Pt.jsx)(w_,{})}),(0,Pt.jsx)(me,{path:"/chatbot",element:(0,Pt.jsx)(J_,{})})]})]})})};r.createRoot(document.getElementById("root")).render((0,Pt.jsx)(t.StrictMode,{children:(0,Pt.jsx)(wR,{})}))})()})();
+    `),xl)})),Ol=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiCircularProgress"}),{className:r,color:o="primary",disableShrink:i=!1,size:a=40,style:l,thickness:s=3.6,value:u=0,variant:c="indeterminate"}=n,d=(0,st.A)(n,fl),f=(0,ut.A)({},n,{color:o,disableShrink:i,size:a,thickness:s,value:u,variant:c}),p=(e=>{const{classes:t,variant:n,color:r,disableShrink:o}=e,i={root:["root",n,`color${(0,Xt.A)(r)}`],svg:["svg"],circle:["circle",`circle${(0,Xt.A)(n)}`,o&&"circleDisableShrink"]};return(0,yt.A)(i,dl,t)})(f),h={},m={},y={};if("determinate"===c){const e=2*Math.PI*((gl-s)/2);h.strokeDasharray=e.toFixed(3),y["aria-valuenow"]=Math.round(u),h.strokeDashoffset=`${((100-u)/100*e).toFixed(3)}px`,m.transform="rotate(-90deg)"}return(0,Pt.jsx)(wl,(0,ut.A)({className:(0,ct.A)(p.root,r),style:(0,ut.A)({width:a,height:a},m,l),ownerState:f,ref:t,role:"progressbar"},y,d,{children:(0,Pt.jsx)(Sl,{className:p.svg,ownerState:f,viewBox:"22 22 44 44",children:(0,Pt.jsx)(Al,{className:p.circle,style:h,ownerState:f,cx:gl,cy:gl,r:(gl-s)/2,fill:"none",strokeWidth:s})})}))})),kl=Ol;function jl(e){return e.substring(2).toLowerCase()}const El=function(e){const{children:n,disableReactTree:r=!1,mouseEvent:o="onClick",onClickAway:i,touchEvent:a="onTouchEnd"}=e,l=t.useRef(!1),s=t.useRef(null),u=t.useRef(!1),c=t.useRef(!1);t.useEffect((()=>(setTimeout((()=>{u.current=!0}),0),()=>{u.current=!1})),[]);const d=(0,br.A)(n.ref,s),f=(0,ki.A)((e=>{const t=c.current;c.current=!1;const n=(0,Oi.A)(s.current);if(!u.current||!s.current||"clientX"in e&&function(e,t){return t.documentElement.clientWidth<e.clientX||t.documentElement.clientHeight<e.clientY}(e,n))return;if(l.current)return void(l.current=!1);let o;o=e.composedPath?e.composedPath().indexOf(s.current)>-1:!n.documentElement.contains(e.target)||s.current.contains(e.target),o||!r&&t||i(e)})),p=e=>t=>{c.current=!0;const r=n.props[e];r&&r(t)},h={ref:d};return!1!==a&&(h[a]=p(a)),t.useEffect((()=>{if(!1!==a){const e=jl(a),t=(0,Oi.A)(s.current),n=()=>{l.current=!0};return t.addEventListener(e,f),t.addEventListener("touchmove",n),()=>{t.removeEventListener(e,f),t.removeEventListener("touchmove",n)}}}),[f,a]),!1!==o&&(h[o]=p(o)),t.useEffect((()=>{if(!1!==o){const e=jl(o),t=(0,Oi.A)(s.current);return t.addEventListener(e,f),()=>{t.removeEventListener(e,f)}}}),[f,o]),(0,Pt.jsx)(t.Fragment,{children:t.cloneElement(n,h)})};function Cl(e){return(0,kt.Ay)("MuiSnackbarContent",e)}(0,Ot.A)("MuiSnackbarContent",["root","message","action"]);const Pl=["action","className","message","role"],Ml=(0,vt.Ay)(sn,{name:"MuiSnackbarContent",slot:"Root",overridesResolver:(e,t)=>t.root})((e=>{let{theme:t}=e;const n="light"===t.palette.mode?.8:.98,r=(0,tn.tL)(t.palette.background.default,n);return(0,ut.A)({},t.typography.body2,{color:t.vars?t.vars.palette.SnackbarContent.color:t.palette.getContrastText(r),backgroundColor:t.vars?t.vars.palette.SnackbarContent.bg:r,display:"flex",alignItems:"center",flexWrap:"wrap",padding:"6px 16px",borderRadius:(t.vars||t).shape.borderRadius,flexGrow:1,[t.breakpoints.up("sm")]:{flexGrow:"initial",minWidth:288}})})),Tl=(0,vt.Ay)("div",{name:"MuiSnackbarContent",slot:"Message",overridesResolver:(e,t)=>t.message})({padding:"8px 0"}),_l=(0,vt.Ay)("div",{name:"MuiSnackbarContent",slot:"Action",overridesResolver:(e,t)=>t.action})({display:"flex",alignItems:"center",marginLeft:"auto",paddingLeft:16,marginRight:-8}),Rl=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiSnackbarContent"}),{action:r,className:o,message:i,role:a="alert"}=n,l=(0,st.A)(n,Pl),s=n,u=(e=>{const{classes:t}=e;return(0,yt.A)({root:["root"],action:["action"],message:["message"]},Cl,t)})(s);return(0,Pt.jsxs)(Ml,(0,ut.A)({role:a,square:!0,elevation:6,className:(0,ct.A)(u.root,o),ownerState:s,ref:t},l,{children:[(0,Pt.jsx)(Tl,{className:u.message,ownerState:s,children:i}),r?(0,Pt.jsx)(_l,{className:u.action,ownerState:s,children:r}):null]}))}));function Nl(e){return(0,kt.Ay)("MuiSnackbar",e)}(0,Ot.A)("MuiSnackbar",["root","anchorOriginTopCenter","anchorOriginBottomCenter","anchorOriginTopRight","anchorOriginBottomRight","anchorOriginTopLeft","anchorOriginBottomLeft"]);const Il=["onEnter","onExited"],Dl=["action","anchorOrigin","autoHideDuration","children","className","ClickAwayListenerProps","ContentProps","disableWindowBlurListener","message","onBlur","onClose","onFocus","onMouseEnter","onMouseLeave","open","resumeHideDuration","TransitionComponent","transitionDuration","TransitionProps"],Ll=(0,vt.Ay)("div",{name:"MuiSnackbar",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[`anchorOrigin${(0,Xt.A)(n.anchorOrigin.vertical)}${(0,Xt.A)(n.anchorOrigin.horizontal)}`]]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({zIndex:(t.vars||t).zIndex.snackbar,position:"fixed",display:"flex",left:8,right:8,justifyContent:"center",alignItems:"center"},"top"===n.anchorOrigin.vertical?{top:8}:{bottom:8},"left"===n.anchorOrigin.horizontal&&{justifyContent:"flex-start"},"right"===n.anchorOrigin.horizontal&&{justifyContent:"flex-end"},{[t.breakpoints.up("sm")]:(0,ut.A)({},"top"===n.anchorOrigin.vertical?{top:24}:{bottom:24},"center"===n.anchorOrigin.horizontal&&{left:"50%",right:"auto",transform:"translateX(-50%)"},"left"===n.anchorOrigin.horizontal&&{left:24,right:"auto"},"right"===n.anchorOrigin.horizontal&&{right:24,left:"auto"})})})),zl=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiSnackbar"}),o=St(),i={enter:o.transitions.duration.enteringScreen,exit:o.transitions.duration.leavingScreen},{action:a,anchorOrigin:{vertical:l,horizontal:s}={vertical:"bottom",horizontal:"left"},autoHideDuration:u=null,children:c,className:d,ClickAwayListenerProps:f,ContentProps:p,disableWindowBlurListener:h=!1,message:m,open:y,TransitionComponent:v=Ai,transitionDuration:g=i,TransitionProps:{onEnter:b,onExited:x}={}}=r,w=(0,st.A)(r.TransitionProps,Il),S=(0,st.A)(r,Dl),A=(0,ut.A)({},r,{anchorOrigin:{vertical:l,horizontal:s},autoHideDuration:u,disableWindowBlurListener:h,TransitionComponent:v,transitionDuration:g}),O=(e=>{const{classes:t,anchorOrigin:n}=e,r={root:["root",`anchorOrigin${(0,Xt.A)(n.vertical)}${(0,Xt.A)(n.horizontal)}`]};return(0,yt.A)(r,Nl,t)})(A),{getRootProps:k,onClickAway:j}=function(e){const{autoHideDuration:n=null,disableWindowBlurListener:r=!1,onClose:o,open:i,resumeHideDuration:a}=e,l=t.useRef();t.useEffect((()=>{if(i)return document.addEventListener("keydown",e),()=>{document.removeEventListener("keydown",e)};function e(e){e.defaultPrevented||"Escape"!==e.key&&"Esc"!==e.key||null==o||o(e,"escapeKeyDown")}}),[i,o]);const s=(0,ki.A)(((e,t)=>{null==o||o(e,t)})),u=(0,ki.A)((e=>{o&&null!=e&&(clearTimeout(l.current),l.current=setTimeout((()=>{s(null,"timeout")}),e))}));t.useEffect((()=>(i&&u(n),()=>{clearTimeout(l.current)})),[i,n,u]);const c=()=>{clearTimeout(l.current)},d=t.useCallback((()=>{null!=n&&u(null!=a?a:.5*n)}),[n,a,u]),f=e=>t=>{const n=e.onBlur;null==n||n(t),d()},p=e=>t=>{const n=e.onFocus;null==n||n(t),c()},h=e=>t=>{const n=e.onMouseEnter;null==n||n(t),c()},m=e=>t=>{const n=e.onMouseLeave;null==n||n(t),d()};return t.useEffect((()=>{if(!r&&i)return window.addEventListener("focus",d),window.addEventListener("blur",c),()=>{window.removeEventListener("focus",d),window.removeEventListener("blur",c)}}),[r,d,i]),{getRootProps:function(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const n=Wi(e),r=(0,ut.A)({},n,t);return(0,ut.A)({role:"presentation"},r,{onBlur:f(r),onFocus:p(r),onMouseEnter:h(r),onMouseLeave:m(r)})},onClickAway:e=>{null==o||o(e,"clickaway")}}}((0,ut.A)({},A)),[E,C]=t.useState(!0),P=qi({elementType:Ll,getSlotProps:k,externalForwardedProps:S,ownerState:A,additionalProps:{ref:n},className:[O.root,d]});return!y&&E?null:(0,Pt.jsx)(El,(0,ut.A)({onClickAway:j},f,{children:(0,Pt.jsx)(Ll,(0,ut.A)({},P,{children:(0,Pt.jsx)(v,(0,ut.A)({appear:!0,in:y,timeout:g,direction:"top"===l?"down":"up",onEnter:(e,t)=>{C(!1),b&&b(e,t)},onExited:e=>{C(!0),x&&x(e)}},w,{children:c||(0,Pt.jsx)(Rl,(0,ut.A)({message:m,action:a},p))}))}))}))}));function $l(e){return(0,kt.Ay)("MuiAlert",e)}const Bl=(0,Ot.A)("MuiAlert",["root","action","icon","message","filled","filledSuccess","filledInfo","filledWarning","filledError","outlined","outlinedSuccess","outlinedInfo","outlinedWarning","outlinedError","standard","standardSuccess","standardInfo","standardWarning","standardError"]);function Fl(e){return(0,kt.Ay)("MuiIconButton",e)}const Wl=(0,Ot.A)("MuiIconButton",["root","disabled","colorInherit","colorPrimary","colorSecondary","colorError","colorInfo","colorSuccess","colorWarning","edgeStart","edgeEnd","sizeSmall","sizeMedium","sizeLarge"]),Ul=["edge","children","className","color","disabled","disableFocusRipple","size"],Hl=(0,vt.Ay)(Kn,{name:"MuiIconButton",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,"default"!==n.color&&t[`color${(0,Xt.A)(n.color)}`],n.edge&&t[`edge${(0,Xt.A)(n.edge)}`],t[`size${(0,Xt.A)(n.size)}`]]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({textAlign:"center",flex:"0 0 auto",fontSize:t.typography.pxToRem(24),padding:8,borderRadius:"50%",overflow:"visible",color:(t.vars||t).palette.action.active,transition:t.transitions.create("background-color",{duration:t.transitions.duration.shortest})},!n.disableRipple&&{"&:hover":{backgroundColor:t.vars?`rgba(${t.vars.palette.action.activeChannel} / ${t.vars.palette.action.hoverOpacity})`:(0,tn.X4)(t.palette.action.active,t.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}}},"start"===n.edge&&{marginLeft:"small"===n.size?-3:-12},"end"===n.edge&&{marginRight:"small"===n.size?-3:-12})}),(e=>{let{theme:t,ownerState:n}=e;var r;const o=null==(r=(t.vars||t).palette)?void 0:r[n.color];return(0,ut.A)({},"inherit"===n.color&&{color:"inherit"},"inherit"!==n.color&&"default"!==n.color&&(0,ut.A)({color:null==o?void 0:o.main},!n.disableRipple&&{"&:hover":(0,ut.A)({},o&&{backgroundColor:t.vars?`rgba(${o.mainChannel} / ${t.vars.palette.action.hoverOpacity})`:(0,tn.X4)(o.main,t.palette.action.hoverOpacity)},{"@media (hover: none)":{backgroundColor:"transparent"}})}),"small"===n.size&&{padding:5,fontSize:t.typography.pxToRem(18)},"large"===n.size&&{padding:12,fontSize:t.typography.pxToRem(28)},{[`&.${Wl.disabled}`]:{backgroundColor:"transparent",color:(t.vars||t).palette.action.disabled}})})),Vl=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiIconButton"}),{edge:r=!1,children:o,className:i,color:a="default",disabled:l=!1,disableFocusRipple:s=!1,size:u="medium"}=n,c=(0,st.A)(n,Ul),d=(0,ut.A)({},n,{edge:r,color:a,disabled:l,disableFocusRipple:s,size:u}),f=(e=>{const{classes:t,disabled:n,color:r,edge:o,size:i}=e,a={root:["root",n&&"disabled","default"!==r&&`color${(0,Xt.A)(r)}`,o&&`edge${(0,Xt.A)(o)}`,`size${(0,Xt.A)(i)}`]};return(0,yt.A)(a,Fl,t)})(d);return(0,Pt.jsx)(Hl,(0,ut.A)({className:(0,ct.A)(f.root,i),centerRipple:!0,focusRipple:!s,disabled:l,ref:t,ownerState:d},c,{children:o}))})),ql=Vl,Xl=(0,Ya.A)((0,Pt.jsx)("path",{d:"M20,12A8,8 0 0,1 12,20A8,8 0 0,1 4,12A8,8 0 0,1 12,4C12.76,4 13.5,4.11 14.2, 4.31L15.77,2.74C14.61,2.26 13.34,2 12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0, 0 22,12M7.91,10.08L6.5,11.5L11,16L21,6L19.59,4.58L11,13.17L7.91,10.08Z"}),"SuccessOutlined"),Kl=(0,Ya.A)((0,Pt.jsx)("path",{d:"M12 5.99L19.53 19H4.47L12 5.99M12 2L1 21h22L12 2zm1 14h-2v2h2v-2zm0-6h-2v4h2v-4z"}),"ReportProblemOutlined"),Gl=(0,Ya.A)((0,Pt.jsx)("path",{d:"M11 15h2v2h-2zm0-8h2v6h-2zm.99-5C6.47 2 2 6.48 2 12s4.47 10 9.99 10C17.52 22 22 17.52 22 12S17.52 2 11.99 2zM12 20c-4.42 0-8-3.58-8-8s3.58-8 8-8 8 3.58 8 8-3.58 8-8 8z"}),"ErrorOutline"),Yl=(0,Ya.A)((0,Pt.jsx)("path",{d:"M11,9H13V7H11M12,20C7.59,20 4,16.41 4,12C4,7.59 7.59,4 12,4C16.41,4 20,7.59 20, 12C20,16.41 16.41,20 12,20M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10, 10 0 0,0 12,2M11,17H13V11H11V17Z"}),"InfoOutlined"),Ql=(0,Ya.A)((0,Pt.jsx)("path",{d:"M19 6.41L17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"}),"Close"),Jl=["action","children","className","closeText","color","components","componentsProps","icon","iconMapping","onClose","role","severity","slotProps","slots","variant"],Zl=(0,vt.Ay)(sn,{name:"MuiAlert",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[n.variant],t[`${n.variant}${(0,Xt.A)(n.color||n.severity)}`]]}})((e=>{let{theme:t,ownerState:n}=e;const r="light"===t.palette.mode?tn.e$:tn.a,o="light"===t.palette.mode?tn.a:tn.e$,i=n.color||n.severity;return(0,ut.A)({},t.typography.body2,{backgroundColor:"transparent",display:"flex",padding:"6px 16px"},i&&"standard"===n.variant&&{color:t.vars?t.vars.palette.Alert[`${i}Color`]:r(t.palette[i].light,.6),backgroundColor:t.vars?t.vars.palette.Alert[`${i}StandardBg`]:o(t.palette[i].light,.9),[`& .${Bl.icon}`]:t.vars?{color:t.vars.palette.Alert[`${i}IconColor`]}:{color:t.palette[i].main}},i&&"outlined"===n.variant&&{color:t.vars?t.vars.palette.Alert[`${i}Color`]:r(t.palette[i].light,.6),border:`1px solid ${(t.vars||t).palette[i].light}`,[`& .${Bl.icon}`]:t.vars?{color:t.vars.palette.Alert[`${i}IconColor`]}:{color:t.palette[i].main}},i&&"filled"===n.variant&&(0,ut.A)({fontWeight:t.typography.fontWeightMedium},t.vars?{color:t.vars.palette.Alert[`${i}FilledColor`],backgroundColor:t.vars.palette.Alert[`${i}FilledBg`]}:{backgroundColor:"dark"===t.palette.mode?t.palette[i].dark:t.palette[i].main,color:t.palette.getContrastText(t.palette[i].main)}))})),es=(0,vt.Ay)("div",{name:"MuiAlert",slot:"Icon",overridesResolver:(e,t)=>t.icon})({marginRight:12,padding:"7px 0",display:"flex",fontSize:22,opacity:.9}),ts=(0,vt.Ay)("div",{name:"MuiAlert",slot:"Message",overridesResolver:(e,t)=>t.message})({padding:"8px 0",minWidth:0,overflow:"auto"}),ns=(0,vt.Ay)("div",{name:"MuiAlert",slot:"Action",overridesResolver:(e,t)=>t.action})({display:"flex",alignItems:"flex-start",padding:"4px 0 0 16px",marginLeft:"auto",marginRight:-8}),rs={success:(0,Pt.jsx)(Xl,{fontSize:"inherit"}),warning:(0,Pt.jsx)(Kl,{fontSize:"inherit"}),error:(0,Pt.jsx)(Gl,{fontSize:"inherit"}),info:(0,Pt.jsx)(Yl,{fontSize:"inherit"})},os=t.forwardRef((function(e,t){var n,r,o,i,a,l;const s=(0,gt.A)({props:e,name:"MuiAlert"}),{action:u,children:c,className:d,closeText:f="Close",color:p,components:h={},componentsProps:m={},icon:y,iconMapping:v=rs,onClose:g,role:b="alert",severity:x="success",slotProps:w={},slots:S={},variant:A="standard"}=s,O=(0,st.A)(s,Jl),k=(0,ut.A)({},s,{color:p,severity:x,variant:A}),j=(e=>{const{variant:t,color:n,severity:r,classes:o}=e,i={root:["root",`${t}${(0,Xt.A)(n||r)}`,`${t}`],icon:["icon"],message:["message"],action:["action"]};return(0,yt.A)(i,$l,o)})(k),E=null!=(n=null!=(r=S.closeButton)?r:h.CloseButton)?n:ql,C=null!=(o=null!=(i=S.closeIcon)?i:h.CloseIcon)?o:Ql,P=null!=(a=w.closeButton)?a:m.closeButton,M=null!=(l=w.closeIcon)?l:m.closeIcon;return(0,Pt.jsxs)(Zl,(0,ut.A)({role:b,elevation:0,ownerState:k,className:(0,ct.A)(j.root,d),ref:t},O,{children:[!1!==y?(0,Pt.jsx)(es,{ownerState:k,className:j.icon,children:y||v[x]||rs[x]}):null,(0,Pt.jsx)(ts,{ownerState:k,className:j.message,children:c}),null!=u?(0,Pt.jsx)(ns,{ownerState:k,className:j.action,children:u}):null,null==u&&g?(0,Pt.jsx)(ns,{ownerState:k,className:j.action,children:(0,Pt.jsx)(E,(0,ut.A)({size:"small","aria-label":f,title:f,color:"inherit",onClick:g},P,{children:(0,Pt.jsx)(C,(0,ut.A)({fontSize:"small"},M))}))}):null]}))})),is=os;function as(e){if(null==e)return window;if("[object Window]"!==e.toString()){var t=e.ownerDocument;return t&&t.defaultView||window}return e}function ls(e){return e instanceof as(e).Element||e instanceof Element}function ss(e){return e instanceof as(e).HTMLElement||e instanceof HTMLElement}function us(e){return"undefined"!==typeof ShadowRoot&&(e instanceof as(e).ShadowRoot||e instanceof ShadowRoot)}var cs=Math.max,ds=Math.min,fs=Math.round;function ps(){var e=navigator.userAgentData;return null!=e&&e.brands&&Array.isArray(e.brands)?e.brands.map((function(e){return e.brand+"/"+e.version})).join(" "):navigator.userAgent}function hs(){return!/^((?!chrome|android).)*safari/i.test(ps())}function ms(e,t,n){void 0===t&&(t=!1),void 0===n&&(n=!1);var r=e.getBoundingClientRect(),o=1,i=1;t&&ss(e)&&(o=e.offsetWidth>0&&fs(r.width)/e.offsetWidth||1,i=e.offsetHeight>0&&fs(r.height)/e.offsetHeight||1);var a=(ls(e)?as(e):window).visualViewport,l=!hs()&&n,s=(r.left+(l&&a?a.offsetLeft:0))/o,u=(r.top+(l&&a?a.offsetTop:0))/i,c=r.width/o,d=r.height/i;return{width:c,height:d,top:u,right:s+c,bottom:u+d,left:s,x:s,y:u}}function ys(e){var t=as(e);return{scrollLeft:t.pageXOffset,scrollTop:t.pageYOffset}}function vs(e){return e?(e.nodeName||"").toLowerCase():null}function gs(e){return((ls(e)?e.ownerDocument:e.document)||window.document).documentElement}function bs(e){return ms(gs(e)).left+ys(e).scrollLeft}function xs(e){return as(e).getComputedStyle(e)}function ws(e){var t=xs(e),n=t.overflow,r=t.overflowX,o=t.overflowY;return/auto|scroll|overlay|hidden/.test(n+o+r)}function Ss(e,t,n){void 0===n&&(n=!1);var r=ss(t),o=ss(t)&&function(e){var t=e.getBoundingClientRect(),n=fs(t.width)/e.offsetWidth||1,r=fs(t.height)/e.offsetHeight||1;return 1!==n||1!==r}(t),i=gs(t),a=ms(e,o,n),l={scrollLeft:0,scrollTop:0},s={x:0,y:0};return(r||!r&&!n)&&(("body"!==vs(t)||ws(i))&&(l=function(e){return e!==as(e)&&ss(e)?{scrollLeft:(t=e).scrollLeft,scrollTop:t.scrollTop}:ys(e);var t}(t)),ss(t)?((s=ms(t,!0)).x+=t.clientLeft,s.y+=t.clientTop):i&&(s.x=bs(i))),{x:a.left+l.scrollLeft-s.x,y:a.top+l.scrollTop-s.y,width:a.width,height:a.height}}function As(e){var t=ms(e),n=e.offsetWidth,r=e.offsetHeight;return Math.abs(t.width-n)<=1&&(n=t.width),Math.abs(t.height-r)<=1&&(r=t.height),{x:e.offsetLeft,y:e.offsetTop,width:n,height:r}}function Os(e){return"html"===vs(e)?e:e.assignedSlot||e.parentNode||(us(e)?e.host:null)||gs(e)}function ks(e){return["html","body","#document"].indexOf(vs(e))>=0?e.ownerDocument.body:ss(e)&&ws(e)?e:ks(Os(e))}function js(e,t){var n;void 0===t&&(t=[]);var r=ks(e),o=r===(null==(n=e.ownerDocument)?void 0:n.body),i=as(r),a=o?[i].concat(i.visualViewport||[],ws(r)?r:[]):r,l=t.concat(a);return o?l:l.concat(js(Os(a)))}function Es(e){return["table","td","th"].indexOf(vs(e))>=0}function Cs(e){return ss(e)&&"fixed"!==xs(e).position?e.offsetParent:null}function Ps(e){for(var t=as(e),n=Cs(e);n&&Es(n)&&"static"===xs(n).position;)n=Cs(n);return n&&("html"===vs(n)||"body"===vs(n)&&"static"===xs(n).position)?t:n||function(e){var t=/firefox/i.test(ps());if(/Trident/i.test(ps())&&ss(e)&&"fixed"===xs(e).position)return null;var n=Os(e);for(us(n)&&(n=n.host);ss(n)&&["html","body"].indexOf(vs(n))<0;){var r=xs(n);if("none"!==r.transform||"none"!==r.perspective||"paint"===r.contain||-1!==["transform","perspective"].indexOf(r.willChange)||t&&"filter"===r.willChange||t&&r.filter&&"none"!==r.filter)return n;n=n.parentNode}return null}(e)||t}var Ms="top",Ts="bottom",_s="right",Rs="left",Ns="auto",Is=[Ms,Ts,_s,Rs],Ds="start",Ls="end",zs="viewport",$s="popper",Bs=Is.reduce((function(e,t){return e.concat([t+"-"+Ds,t+"-"+Ls])}),[]),Fs=[].concat(Is,[Ns]).reduce((function(e,t){return e.concat([t,t+"-"+Ds,t+"-"+Ls])}),[]),Ws=["beforeRead","read","afterRead","beforeMain","main","afterMain","beforeWrite","write","afterWrite"];function Us(e){var t=new Map,n=new Set,r=[];function o(e){n.add(e.name),[].concat(e.requires||[],e.requiresIfExists||[]).forEach((function(e){if(!n.has(e)){var r=t.get(e);r&&o(r)}})),r.push(e)}return e.forEach((function(e){t.set(e.name,e)})),e.forEach((function(e){n.has(e.name)||o(e)})),r}function Hs(e){var t;return function(){return t||(t=new Promise((function(n){Promise.resolve().then((function(){t=void 0,n(e())}))}))),t}}var Vs={placement:"bottom",modifiers:[],strategy:"absolute"};function qs(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return!t.some((function(e){return!(e&&"function"===typeof e.getBoundingClientRect)}))}function Xs(e){void 0===e&&(e={});var t=e,n=t.defaultModifiers,r=void 0===n?[]:n,o=t.defaultOptions,i=void 0===o?Vs:o;return function(e,t,n){void 0===n&&(n=i);var o={placement:"bottom",orderedModifiers:[],options:Object.assign({},Vs,i),modifiersData:{},elements:{reference:e,popper:t},attributes:{},styles:{}},a=[],l=!1,s={state:o,setOptions:function(n){var l="function"===typeof n?n(o.options):n;u(),o.options=Object.assign({},i,o.options,l),o.scrollParents={reference:ls(e)?js(e):e.contextElement?js(e.contextElement):[],popper:js(t)};var c=function(e){var t=Us(e);return Ws.reduce((function(e,n){return e.concat(t.filter((function(e){return e.phase===n})))}),[])}(function(e){var t=e.reduce((function(e,t){var n=e[t.name];return e[t.name]=n?Object.assign({},n,t,{options:Object.assign({},n.options,t.options),data:Object.assign({},n.data,t.data)}):t,e}),{});return Object.keys(t).map((function(e){return t[e]}))}([].concat(r,o.options.modifiers)));return o.orderedModifiers=c.filter((function(e){return e.enabled})),o.orderedModifiers.forEach((function(e){var t=e.name,n=e.options,r=void 0===n?{}:n,i=e.effect;if("function"===typeof i){var l=i({state:o,name:t,instance:s,options:r}),u=function(){};a.push(l||u)}})),s.update()},forceUpdate:function(){if(!l){var e=o.elements,t=e.reference,n=e.popper;if(qs(t,n)){o.rects={reference:Ss(t,Ps(n),"fixed"===o.options.strategy),popper:As(n)},o.reset=!1,o.placement=o.options.placement,o.orderedModifiers.forEach((function(e){return o.modifiersData[e.name]=Object.assign({},e.data)}));for(var r=0;r<o.orderedModifiers.length;r++)if(!0!==o.reset){var i=o.orderedModifiers[r],a=i.fn,u=i.options,c=void 0===u?{}:u,d=i.name;"function"===typeof a&&(o=a({state:o,options:c,name:d,instance:s})||o)}else o.reset=!1,r=-1}}},update:Hs((function(){return new Promise((function(e){s.forceUpdate(),e(o)}))})),destroy:function(){u(),l=!0}};if(!qs(e,t))return s;function u(){a.forEach((function(e){return e()})),a=[]}return s.setOptions(n).then((function(e){!l&&n.onFirstUpdate&&n.onFirstUpdate(e)})),s}}var Ks={passive:!0};function Gs(e){return e.split("-")[0]}function Ys(e){return e.split("-")[1]}function Qs(e){return["top","bottom"].indexOf(e)>=0?"x":"y"}function Js(e){var t,n=e.reference,r=e.element,o=e.placement,i=o?Gs(o):null,a=o?Ys(o):null,l=n.x+n.width/2-r.width/2,s=n.y+n.height/2-r.height/2;switch(i){case Ms:t={x:l,y:n.y-r.height};break;case Ts:t={x:l,y:n.y+n.height};break;case _s:t={x:n.x+n.width,y:s};break;case Rs:t={x:n.x-r.width,y:s};break;default:t={x:n.x,y:n.y}}var u=i?Qs(i):null;if(null!=u){var c="y"===u?"height":"width";switch(a){case Ds:t[u]=t[u]-(n[c]/2-r[c]/2);break;case Ls:t[u]=t[u]+(n[c]/2-r[c]/2)}}return t}var Zs={top:"auto",right:"auto",bottom:"auto",left:"auto"};function eu(e){var t,n=e.popper,r=e.popperRect,o=e.placement,i=e.variation,a=e.offsets,l=e.position,s=e.gpuAcceleration,u=e.adaptive,c=e.roundOffsets,d=e.isFixed,f=a.x,p=void 0===f?0:f,h=a.y,m=void 0===h?0:h,y="function"===typeof c?c({x:p,y:m}):{x:p,y:m};p=y.x,m=y.y;var v=a.hasOwnProperty("x"),g=a.hasOwnProperty("y"),b=Rs,x=Ms,w=window;if(u){var S=Ps(n),A="clientHeight",O="clientWidth";if(S===as(n)&&"static"!==xs(S=gs(n)).position&&"absolute"===l&&(A="scrollHeight",O="scrollWidth"),o===Ms||(o===Rs||o===_s)&&i===Ls)x=Ts,m-=(d&&S===w&&w.visualViewport?w.visualViewport.height:S[A])-r.height,m*=s?1:-1;if(o===Rs||(o===Ms||o===Ts)&&i===Ls)b=_s,p-=(d&&S===w&&w.visualViewport?w.visualViewport.width:S[O])-r.width,p*=s?1:-1}var k,j=Object.assign({position:l},u&&Zs),E=!0===c?function(e,t){var n=e.x,r=e.y,o=t.devicePixelRatio||1;return{x:fs(n*o)/o||0,y:fs(r*o)/o||0}}({x:p,y:m},as(n)):{x:p,y:m};return p=E.x,m=E.y,s?Object.assign({},j,((k={})[x]=g?"0":"",k[b]=v?"0":"",k.transform=(w.devicePixelRatio||1)<=1?"translate("+p+"px, "+m+"px)":"translate3d("+p+"px, "+m+"px, 0)",k)):Object.assign({},j,((t={})[x]=g?m+"px":"",t[b]=v?p+"px":"",t.transform="",t))}const tu={name:"applyStyles",enabled:!0,phase:"write",fn:function(e){var t=e.state;Object.keys(t.elements).forEach((function(e){var n=t.styles[e]||{},r=t.attributes[e]||{},o=t.elements[e];ss(o)&&vs(o)&&(Object.assign(o.style,n),Object.keys(r).forEach((function(e){var t=r[e];!1===t?o.removeAttribute(e):o.setAttribute(e,!0===t?"":t)})))}))},effect:function(e){var t=e.state,n={popper:{position:t.options.strategy,left:"0",top:"0",margin:"0"},arrow:{position:"absolute"},reference:{}};return Object.assign(t.elements.popper.style,n.popper),t.styles=n,t.elements.arrow&&Object.assign(t.elements.arrow.style,n.arrow),function(){Object.keys(t.elements).forEach((function(e){var r=t.elements[e],o=t.attributes[e]||{},i=Object.keys(t.styles.hasOwnProperty(e)?t.styles[e]:n[e]).reduce((function(e,t){return e[t]="",e}),{});ss(r)&&vs(r)&&(Object.assign(r.style,i),Object.keys(o).forEach((function(e){r.removeAttribute(e)})))}))}},requires:["computeStyles"]};const nu={name:"offset",enabled:!0,phase:"main",requires:["popperOffsets"],fn:function(e){var t=e.state,n=e.options,r=e.name,o=n.offset,i=void 0===o?[0,0]:o,a=Fs.reduce((function(e,n){return e[n]=function(e,t,n){var r=Gs(e),o=[Rs,Ms].indexOf(r)>=0?-1:1,i="function"===typeof n?n(Object.assign({},t,{placement:e})):n,a=i[0],l=i[1];return a=a||0,l=(l||0)*o,[Rs,_s].indexOf(r)>=0?{x:l,y:a}:{x:a,y:l}}(n,t.rects,i),e}),{}),l=a[t.placement],s=l.x,u=l.y;null!=t.modifiersData.popperOffsets&&(t.modifiersData.popperOffsets.x+=s,t.modifiersData.popperOffsets.y+=u),t.modifiersData[r]=a}};var ru={left:"right",right:"left",bottom:"top",top:"bottom"};function ou(e){return e.replace(/left|right|bottom|top/g,(function(e){return ru[e]}))}var iu={start:"end",end:"start"};function au(e){return e.replace(/start|end/g,(function(e){return iu[e]}))}function lu(e,t){var n=t.getRootNode&&t.getRootNode();if(e.contains(t))return!0;if(n&&us(n)){var r=t;do{if(r&&e.isSameNode(r))return!0;r=r.parentNode||r.host}while(r)}return!1}function su(e){return Object.assign({},e,{left:e.x,top:e.y,right:e.x+e.width,bottom:e.y+e.height})}function uu(e,t,n){return t===zs?su(function(e,t){var n=as(e),r=gs(e),o=n.visualViewport,i=r.clientWidth,a=r.clientHeight,l=0,s=0;if(o){i=o.width,a=o.height;var u=hs();(u||!u&&"fixed"===t)&&(l=o.offsetLeft,s=o.offsetTop)}return{width:i,height:a,x:l+bs(e),y:s}}(e,n)):ls(t)?function(e,t){var n=ms(e,!1,"fixed"===t);return n.top=n.top+e.clientTop,n.left=n.left+e.clientLeft,n.bottom=n.top+e.clientHeight,n.right=n.left+e.clientWidth,n.width=e.clientWidth,n.height=e.clientHeight,n.x=n.left,n.y=n.top,n}(t,n):su(function(e){var t,n=gs(e),r=ys(e),o=null==(t=e.ownerDocument)?void 0:t.body,i=cs(n.scrollWidth,n.clientWidth,o?o.scrollWidth:0,o?o.clientWidth:0),a=cs(n.scrollHeight,n.clientHeight,o?o.scrollHeight:0,o?o.clientHeight:0),l=-r.scrollLeft+bs(e),s=-r.scrollTop;return"rtl"===xs(o||n).direction&&(l+=cs(n.clientWidth,o?o.clientWidth:0)-i),{width:i,height:a,x:l,y:s}}(gs(e)))}function cu(e,t,n,r){var o="clippingParents"===t?function(e){var t=js(Os(e)),n=["absolute","fixed"].indexOf(xs(e).position)>=0&&ss(e)?Ps(e):e;return ls(n)?t.filter((function(e){return ls(e)&&lu(e,n)&&"body"!==vs(e)})):[]}(e):[].concat(t),i=[].concat(o,[n]),a=i[0],l=i.reduce((function(t,n){var o=uu(e,n,r);return t.top=cs(o.top,t.top),t.right=ds(o.right,t.right),t.bottom=ds(o.bottom,t.bottom),t.left=cs(o.left,t.left),t}),uu(e,a,r));return l.width=l.right-l.left,l.height=l.bottom-l.top,l.x=l.left,l.y=l.top,l}function du(e){return Object.assign({},{top:0,right:0,bottom:0,left:0},e)}function fu(e,t){return t.reduce((function(t,n){return t[n]=e,t}),{})}function pu(e,t){void 0===t&&(t={});var n=t,r=n.placement,o=void 0===r?e.placement:r,i=n.strategy,a=void 0===i?e.strategy:i,l=n.boundary,s=void 0===l?"clippingParents":l,u=n.rootBoundary,c=void 0===u?zs:u,d=n.elementContext,f=void 0===d?$s:d,p=n.altBoundary,h=void 0!==p&&p,m=n.padding,y=void 0===m?0:m,v=du("number"!==typeof y?y:fu(y,Is)),g=f===$s?"reference":$s,b=e.rects.popper,x=e.elements[h?g:f],w=cu(ls(x)?x:x.contextElement||gs(e.elements.popper),s,c,a),S=ms(e.elements.reference),A=Js({reference:S,element:b,strategy:"absolute",placement:o}),O=su(Object.assign({},b,A)),k=f===$s?O:S,j={top:w.top-k.top+v.top,bottom:k.bottom-w.bottom+v.bottom,left:w.left-k.left+v.left,right:k.right-w.right+v.right},E=e.modifiersData.offset;if(f===$s&&E){var C=E[o];Object.keys(j).forEach((function(e){var t=[_s,Ts].indexOf(e)>=0?1:-1,n=[Ms,Ts].indexOf(e)>=0?"y":"x";j[e]+=C[n]*t}))}return j}const hu={name:"flip",enabled:!0,phase:"main",fn:function(e){var t=e.state,n=e.options,r=e.name;if(!t.modifiersData[r]._skip){for(var o=n.mainAxis,i=void 0===o||o,a=n.altAxis,l=void 0===a||a,s=n.fallbackPlacements,u=n.padding,c=n.boundary,d=n.rootBoundary,f=n.altBoundary,p=n.flipVariations,h=void 0===p||p,m=n.allowedAutoPlacements,y=t.options.placement,v=Gs(y),g=s||(v===y||!h?[ou(y)]:function(e){if(Gs(e)===Ns)return[];var t=ou(e);return[au(e),t,au(t)]}(y)),b=[y].concat(g).reduce((function(e,n){return e.concat(Gs(n)===Ns?function(e,t){void 0===t&&(t={});var n=t,r=n.placement,o=n.boundary,i=n.rootBoundary,a=n.padding,l=n.flipVariations,s=n.allowedAutoPlacements,u=void 0===s?Fs:s,c=Ys(r),d=c?l?Bs:Bs.filter((function(e){return Ys(e)===c})):Is,f=d.filter((function(e){return u.indexOf(e)>=0}));0===f.length&&(f=d);var p=f.reduce((function(t,n){return t[n]=pu(e,{placement:n,boundary:o,rootBoundary:i,padding:a})[Gs(n)],t}),{});return Object.keys(p).sort((function(e,t){return p[e]-p[t]}))}(t,{placement:n,boundary:c,rootBoundary:d,padding:u,flipVariations:h,allowedAutoPlacements:m}):n)}),[]),x=t.rects.reference,w=t.rects.popper,S=new Map,A=!0,O=b[0],k=0;k<b.length;k++){var j=b[k],E=Gs(j),C=Ys(j)===Ds,P=[Ms,Ts].indexOf(E)>=0,M=P?"width":"height",T=pu(t,{placement:j,boundary:c,rootBoundary:d,altBoundary:f,padding:u}),_=P?C?_s:Rs:C?Ts:Ms;x[M]>w[M]&&(_=ou(_));var R=ou(_),N=[];if(i&&N.push(T[E]<=0),l&&N.push(T[_]<=0,T[R]<=0),N.every((function(e){return e}))){O=j,A=!1;break}S.set(j,N)}if(A)for(var I=function(e){var t=b.find((function(t){var n=S.get(t);if(n)return n.slice(0,e).every((function(e){return e}))}));if(t)return O=t,"break"},D=h?3:1;D>0;D--){if("break"===I(D))break}t.placement!==O&&(t.modifiersData[r]._skip=!0,t.placement=O,t.reset=!0)}},requiresIfExists:["offset"],data:{_skip:!1}};function mu(e,t,n){return cs(e,ds(t,n))}const yu={name:"preventOverflow",enabled:!0,phase:"main",fn:function(e){var t=e.state,n=e.options,r=e.name,o=n.mainAxis,i=void 0===o||o,a=n.altAxis,l=void 0!==a&&a,s=n.boundary,u=n.rootBoundary,c=n.altBoundary,d=n.padding,f=n.tether,p=void 0===f||f,h=n.tetherOffset,m=void 0===h?0:h,y=pu(t,{boundary:s,rootBoundary:u,padding:d,altBoundary:c}),v=Gs(t.placement),g=Ys(t.placement),b=!g,x=Qs(v),w="x"===x?"y":"x",S=t.modifiersData.popperOffsets,A=t.rects.reference,O=t.rects.popper,k="function"===typeof m?m(Object.assign({},t.rects,{placement:t.placement})):m,j="number"===typeof k?{mainAxis:k,altAxis:k}:Object.assign({mainAxis:0,altAxis:0},k),E=t.modifiersData.offset?t.modifiersData.offset[t.placement]:null,C={x:0,y:0};if(S){if(i){var P,M="y"===x?Ms:Rs,T="y"===x?Ts:_s,_="y"===x?"height":"width",R=S[x],N=R+y[M],I=R-y[T],D=p?-O[_]/2:0,L=g===Ds?A[_]:O[_],z=g===Ds?-O[_]:-A[_],$=t.elements.arrow,B=p&&$?As($):{width:0,height:0},F=t.modifiersData["arrow#persistent"]?t.modifiersData["arrow#persistent"].padding:{top:0,right:0,bottom:0,left:0},W=F[M],U=F[T],H=mu(0,A[_],B[_]),V=b?A[_]/2-D-H-W-j.mainAxis:L-H-W-j.mainAxis,q=b?-A[_]/2+D+H+U+j.mainAxis:z+H+U+j.mainAxis,X=t.elements.arrow&&Ps(t.elements.arrow),K=X?"y"===x?X.clientTop||0:X.clientLeft||0:0,G=null!=(P=null==E?void 0:E[x])?P:0,Y=R+q-G,Q=mu(p?ds(N,R+V-G-K):N,R,p?cs(I,Y):I);S[x]=Q,C[x]=Q-R}if(l){var J,Z="x"===x?Ms:Rs,ee="x"===x?Ts:_s,te=S[w],ne="y"===w?"height":"width",re=te+y[Z],oe=te-y[ee],ie=-1!==[Ms,Rs].indexOf(v),ae=null!=(J=null==E?void 0:E[w])?J:0,le=ie?re:te-A[ne]-O[ne]-ae+j.altAxis,se=ie?te+A[ne]+O[ne]-ae-j.altAxis:oe,ue=p&&ie?function(e,t,n){var r=mu(e,t,n);return r>n?n:r}(le,te,se):mu(p?le:re,te,p?se:oe);S[w]=ue,C[w]=ue-te}t.modifiersData[r]=C}},requiresIfExists:["offset"]};const vu={name:"arrow",enabled:!0,phase:"main",fn:function(e){var t,n=e.state,r=e.name,o=e.options,i=n.elements.arrow,a=n.modifiersData.popperOffsets,l=Gs(n.placement),s=Qs(l),u=[Rs,_s].indexOf(l)>=0?"height":"width";if(i&&a){var c=function(e,t){return du("number"!==typeof(e="function"===typeof e?e(Object.assign({},t.rects,{placement:t.placement})):e)?e:fu(e,Is))}(o.padding,n),d=As(i),f="y"===s?Ms:Rs,p="y"===s?Ts:_s,h=n.rects.reference[u]+n.rects.reference[s]-a[s]-n.rects.popper[u],m=a[s]-n.rects.reference[s],y=Ps(i),v=y?"y"===s?y.clientHeight||0:y.clientWidth||0:0,g=h/2-m/2,b=c[f],x=v-d[u]-c[p],w=v/2-d[u]/2+g,S=mu(b,w,x),A=s;n.modifiersData[r]=((t={})[A]=S,t.centerOffset=S-w,t)}},effect:function(e){var t=e.state,n=e.options.element,r=void 0===n?"[data-popper-arrow]":n;null!=r&&("string"!==typeof r||(r=t.elements.popper.querySelector(r)))&&lu(t.elements.popper,r)&&(t.elements.arrow=r)},requires:["popperOffsets"],requiresIfExists:["preventOverflow"]};function gu(e,t,n){return void 0===n&&(n={x:0,y:0}),{top:e.top-t.height-n.y,right:e.right-t.width+n.x,bottom:e.bottom-t.height+n.y,left:e.left-t.width-n.x}}function bu(e){return[Ms,_s,Ts,Rs].some((function(t){return e[t]>=0}))}var xu=Xs({defaultModifiers:[{name:"eventListeners",enabled:!0,phase:"write",fn:function(){},effect:function(e){var t=e.state,n=e.instance,r=e.options,o=r.scroll,i=void 0===o||o,a=r.resize,l=void 0===a||a,s=as(t.elements.popper),u=[].concat(t.scrollParents.reference,t.scrollParents.popper);return i&&u.forEach((function(e){e.addEventListener("scroll",n.update,Ks)})),l&&s.addEventListener("resize",n.update,Ks),function(){i&&u.forEach((function(e){e.removeEventListener("scroll",n.update,Ks)})),l&&s.removeEventListener("resize",n.update,Ks)}},data:{}},{name:"popperOffsets",enabled:!0,phase:"read",fn:function(e){var t=e.state,n=e.name;t.modifiersData[n]=Js({reference:t.rects.reference,element:t.rects.popper,strategy:"absolute",placement:t.placement})},data:{}},{name:"computeStyles",enabled:!0,phase:"beforeWrite",fn:function(e){var t=e.state,n=e.options,r=n.gpuAcceleration,o=void 0===r||r,i=n.adaptive,a=void 0===i||i,l=n.roundOffsets,s=void 0===l||l,u={placement:Gs(t.placement),variation:Ys(t.placement),popper:t.elements.popper,popperRect:t.rects.popper,gpuAcceleration:o,isFixed:"fixed"===t.options.strategy};null!=t.modifiersData.popperOffsets&&(t.styles.popper=Object.assign({},t.styles.popper,eu(Object.assign({},u,{offsets:t.modifiersData.popperOffsets,position:t.options.strategy,adaptive:a,roundOffsets:s})))),null!=t.modifiersData.arrow&&(t.styles.arrow=Object.assign({},t.styles.arrow,eu(Object.assign({},u,{offsets:t.modifiersData.arrow,position:"absolute",adaptive:!1,roundOffsets:s})))),t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-placement":t.placement})},data:{}},tu,nu,hu,yu,vu,{name:"hide",enabled:!0,phase:"main",requiresIfExists:["preventOverflow"],fn:function(e){var t=e.state,n=e.name,r=t.rects.reference,o=t.rects.popper,i=t.modifiersData.preventOverflow,a=pu(t,{elementContext:"reference"}),l=pu(t,{altBoundary:!0}),s=gu(a,r),u=gu(l,o,i),c=bu(s),d=bu(u);t.modifiersData[n]={referenceClippingOffsets:s,popperEscapeOffsets:u,isReferenceHidden:c,hasPopperEscaped:d},t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-reference-hidden":c,"data-popper-escaped":d})}}]});function wu(e){return(0,kt.Ay)("MuiPopper",e)}(0,Ot.A)("MuiPopper",["root"]);const Su=["anchorEl","children","direction","disablePortal","modifiers","open","placement","popperOptions","popperRef","slotProps","slots","TransitionProps","ownerState"],Au=["anchorEl","children","container","direction","disablePortal","keepMounted","modifiers","open","placement","popperOptions","popperRef","style","transition","slotProps","slots"];function Ou(e){return"function"===typeof e?e():e}function ku(e){return void 0!==e.nodeType}const ju={},Eu=t.forwardRef((function(e,n){var r;const{anchorEl:o,children:i,direction:a,disablePortal:l,modifiers:s,open:u,placement:c,popperOptions:d,popperRef:f,slotProps:p={},slots:h={},TransitionProps:m}=e,y=(0,st.A)(e,Su),v=t.useRef(null),g=(0,br.A)(v,n),b=t.useRef(null),x=(0,br.A)(b,f),w=t.useRef(x);(0,Sr.A)((()=>{w.current=x}),[x]),t.useImperativeHandle(f,(()=>b.current),[]);const S=function(e,t){if("ltr"===t)return e;switch(e){case"bottom-end":return"bottom-start";case"bottom-start":return"bottom-end";case"top-end":return"top-start";case"top-start":return"top-end";default:return e}}(c,a),[A,O]=t.useState(S),[k,j]=t.useState(Ou(o));t.useEffect((()=>{b.current&&b.current.forceUpdate()})),t.useEffect((()=>{o&&j(Ou(o))}),[o]),(0,Sr.A)((()=>{if(!k||!u)return;let e=[{name:"preventOverflow",options:{altBoundary:l}},{name:"flip",options:{altBoundary:l}},{name:"onUpdate",enabled:!0,phase:"afterWrite",fn:e=>{let{state:t}=e;(e=>{O(e.placement)})(t)}}];null!=s&&(e=e.concat(s)),d&&null!=d.modifiers&&(e=e.concat(d.modifiers));const t=xu(k,v.current,(0,ut.A)({placement:S},d,{modifiers:e}));return w.current(t),()=>{t.destroy(),w.current(null)}}),[k,l,s,u,d,S]);const E={placement:A};null!==m&&(E.TransitionProps=m);const C=(0,yt.A)({root:["root"]},Gi(wu)),P=null!=(r=h.root)?r:"div",M=qi({elementType:P,externalSlotProps:p.root,externalForwardedProps:y,additionalProps:{role:"tooltip",ref:g},ownerState:e,className:C.root});return(0,Pt.jsx)(P,(0,ut.A)({},M,{children:"function"===typeof i?i(E):i}))})),Cu=t.forwardRef((function(e,n){const{anchorEl:r,children:o,container:i,direction:a="ltr",disablePortal:l=!1,keepMounted:s=!1,modifiers:u,open:c,placement:d="bottom",popperOptions:f=ju,popperRef:p,style:h,transition:m=!1,slotProps:y={},slots:v={}}=e,g=(0,st.A)(e,Au),[b,x]=t.useState(!0);if(!s&&!c&&(!m||b))return null;let w;if(i)w=i;else if(r){const e=Ou(r);w=e&&ku(e)?(0,Oi.A)(e).body:(0,Oi.A)(null).body}const S=c||!s||m&&!b?void 0:"none",A=m?{in:c,onEnter:()=>{x(!1)},onExited:()=>{x(!0)}}:void 0;return(0,Pt.jsx)(Ci,{disablePortal:l,container:w,children:(0,Pt.jsx)(Eu,(0,ut.A)({anchorEl:r,direction:a,disablePortal:l,modifiers:u,ref:n,open:m?!b:c,placement:d,popperOptions:f,popperRef:p,slotProps:y,slots:v},g,{style:(0,ut.A)({position:"fixed",top:0,left:0,display:S},h),TransitionProps:A,children:o}))})}));var Pu=n(7082);const Mu=["anchorEl","component","components","componentsProps","container","disablePortal","keepMounted","modifiers","open","placement","popperOptions","popperRef","transition","slots","slotProps"],Tu=(0,vt.Ay)(Cu,{name:"MuiPopper",slot:"Root",overridesResolver:(e,t)=>t.root})({}),_u=t.forwardRef((function(e,t){var n;const r=(0,Pu.A)(),o=(0,gt.A)({props:e,name:"MuiPopper"}),{anchorEl:i,component:a,components:l,componentsProps:s,container:u,disablePortal:c,keepMounted:d,modifiers:f,open:p,placement:h,popperOptions:m,popperRef:y,transition:v,slots:g,slotProps:b}=o,x=(0,st.A)(o,Mu),w=null!=(n=null==g?void 0:g.root)?n:null==l?void 0:l.Root,S=(0,ut.A)({anchorEl:i,container:u,disablePortal:c,keepMounted:d,modifiers:f,open:p,placement:h,popperOptions:m,popperRef:y,transition:v},x);return(0,Pt.jsx)(Tu,(0,ut.A)({as:a,direction:null==r?void 0:r.direction,slots:{root:w},slotProps:null!=b?b:s},S,{ref:t}))}));var Ru=n(5879);function Nu(e){return(0,kt.Ay)("MuiTooltip",e)}const Iu=(0,Ot.A)("MuiTooltip",["popper","popperInteractive","popperArrow","popperClose","tooltip","tooltipArrow","touch","tooltipPlacementLeft","tooltipPlacementRight","tooltipPlacementTop","tooltipPlacementBottom","arrow"]),Du=["arrow","children","classes","components","componentsProps","describeChild","disableFocusListener","disableHoverListener","disableInteractive","disableTouchListener","enterDelay","enterNextDelay","enterTouchDelay","followCursor","id","leaveDelay","leaveTouchDelay","onClose","onOpen","open","placement","PopperComponent","PopperProps","slotProps","slots","title","TransitionComponent","TransitionProps"];function Lu(e){return Math.round(1e5*e)/1e5}const zu=(0,vt.Ay)(_u,{name:"MuiTooltip",slot:"Popper",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.popper,!n.disableInteractive&&t.popperInteractive,n.arrow&&t.popperArrow,!n.open&&t.popperClose]}})((e=>{let{theme:t,ownerState:n,open:r}=e;return(0,ut.A)({zIndex:(t.vars||t).zIndex.tooltip,pointerEvents:"none"},!n.disableInteractive&&{pointerEvents:"auto"},!r&&{pointerEvents:"none"},n.arrow&&{[`&[data-popper-placement*="bottom"] .${Iu.arrow}`]:{top:0,marginTop:"-0.71em","&::before":{transformOrigin:"0 100%"}},[`&[data-popper-placement*="top"] .${Iu.arrow}`]:{bottom:0,marginBottom:"-0.71em","&::before":{transformOrigin:"100% 0"}},[`&[data-popper-placement*="right"] .${Iu.arrow}`]:(0,ut.A)({},n.isRtl?{right:0,marginRight:"-0.71em"}:{left:0,marginLeft:"-0.71em"},{height:"1em",width:"0.71em","&::before":{transformOrigin:"100% 100%"}}),[`&[data-popper-placement*="left"] .${Iu.arrow}`]:(0,ut.A)({},n.isRtl?{left:0,marginLeft:"-0.71em"}:{right:0,marginRight:"-0.71em"},{height:"1em",width:"0.71em","&::before":{transformOrigin:"0 0"}})})})),$u=(0,vt.Ay)("div",{name:"MuiTooltip",slot:"Tooltip",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.tooltip,n.touch&&t.touch,n.arrow&&t.tooltipArrow,t[`tooltipPlacement${(0,Xt.A)(n.placement.split("-")[0])}`]]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({backgroundColor:t.vars?t.vars.palette.Tooltip.bg:(0,tn.X4)(t.palette.grey[700],.92),borderRadius:(t.vars||t).shape.borderRadius,color:(t.vars||t).palette.common.white,fontFamily:t.typography.fontFamily,padding:"4px 8px",fontSize:t.typography.pxToRem(11),maxWidth:300,margin:2,wordWrap:"break-word",fontWeight:t.typography.fontWeightMedium},n.arrow&&{position:"relative",margin:0},n.touch&&{padding:"8px 16px",fontSize:t.typography.pxToRem(14),lineHeight:`${Lu(16/14)}em`,fontWeight:t.typography.fontWeightRegular},{[`.${Iu.popper}[data-popper-placement*="left"] &`]:(0,ut.A)({transformOrigin:"right center"},n.isRtl?(0,ut.A)({marginLeft:"14px"},n.touch&&{marginLeft:"24px"}):(0,ut.A)({marginRight:"14px"},n.touch&&{marginRight:"24px"})),[`.${Iu.popper}[data-popper-placement*="right"] &`]:(0,ut.A)({transformOrigin:"left center"},n.isRtl?(0,ut.A)({marginRight:"14px"},n.touch&&{marginRight:"24px"}):(0,ut.A)({marginLeft:"14px"},n.touch&&{marginLeft:"24px"})),[`.${Iu.popper}[data-popper-placement*="top"] &`]:(0,ut.A)({transformOrigin:"center bottom",marginBottom:"14px"},n.touch&&{marginBottom:"24px"}),[`.${Iu.popper}[data-popper-placement*="bottom"] &`]:(0,ut.A)({transformOrigin:"center top",marginTop:"14px"},n.touch&&{marginTop:"24px"})})})),Bu=(0,vt.Ay)("span",{name:"MuiTooltip",slot:"Arrow",overridesResolver:(e,t)=>t.arrow})((e=>{let{theme:t}=e;return{overflow:"hidden",position:"absolute",width:"1em",height:"0.71em",boxSizing:"border-box",color:t.vars?t.vars.palette.Tooltip.bg:(0,tn.X4)(t.palette.grey[700],.9),"&::before":{content:'""',margin:"auto",display:"block",width:"100%",height:"100%",backgroundColor:"currentColor",transform:"rotate(45deg)"}}}));let Fu=!1,Wu=null,Uu={x:0,y:0};function Hu(e,t){return n=>{t&&t(n),e(n)}}const Vu=t.forwardRef((function(e,n){var r,o,i,a,l,s,u,c,d,f,p,h,m,y,v,g,b,x,w;const S=(0,gt.A)({props:e,name:"MuiTooltip"}),{arrow:A=!1,children:O,components:k={},componentsProps:j={},describeChild:E=!1,disableFocusListener:C=!1,disableHoverListener:P=!1,disableInteractive:M=!1,disableTouchListener:T=!1,enterDelay:_=100,enterNextDelay:R=0,enterTouchDelay:N=700,followCursor:I=!1,id:D,leaveDelay:L=0,leaveTouchDelay:z=1500,onClose:$,onOpen:B,open:F,placement:W="bottom",PopperComponent:U,PopperProps:H={},slotProps:V={},slots:q={},title:X,TransitionComponent:K=Ai,TransitionProps:G}=S,Y=(0,st.A)(S,Du),Q=St(),J="rtl"===Q.direction,[Z,ee]=t.useState(),[te,ne]=t.useState(null),re=t.useRef(!1),oe=M||I,ie=t.useRef(),ae=t.useRef(),le=t.useRef(),se=t.useRef(),[ue,ce]=(0,za.A)({controlled:F,default:!1,name:"Tooltip",state:"open"});let de=ue;const fe=(0,Ru.A)(D),pe=t.useRef(),he=t.useCallback((()=>{void 0!==pe.current&&(document.body.style.WebkitUserSelect=pe.current,pe.current=void 0),clearTimeout(se.current)}),[]);t.useEffect((()=>()=>{clearTimeout(ie.current),clearTimeout(ae.current),clearTimeout(le.current),he()}),[he]);const me=e=>{clearTimeout(Wu),Fu=!0,ce(!0),B&&!de&&B(e)},ye=(0,dn.A)((e=>{clearTimeout(Wu),Wu=setTimeout((()=>{Fu=!1}),800+L),ce(!1),$&&de&&$(e),clearTimeout(ie.current),ie.current=setTimeout((()=>{re.current=!1}),Q.transitions.duration.shortest)})),ve=e=>{re.current&&"touchstart"!==e.type||(Z&&Z.removeAttribute("title"),clearTimeout(ae.current),clearTimeout(le.current),_||Fu&&R?ae.current=setTimeout((()=>{me(e)}),Fu?R:_):me(e))},ge=e=>{clearTimeout(ae.current),clearTimeout(le.current),le.current=setTimeout((()=>{ye(e)}),L)},{isFocusVisibleRef:be,onBlur:xe,onFocus:we,ref:Se}=(0,fn.A)(),[,Ae]=t.useState(!1),Oe=e=>{xe(e),!1===be.current&&(Ae(!1),ge(e))},ke=e=>{Z||ee(e.currentTarget),we(e),!0===be.current&&(Ae(!0),ve(e))},je=e=>{re.current=!0;const t=O.props;t.onTouchStart&&t.onTouchStart(e)},Ee=ve,Ce=ge,Pe=e=>{je(e),clearTimeout(le.current),clearTimeout(ie.current),he(),pe.current=document.body.style.WebkitUserSelect,document.body.style.WebkitUserSelect="none",se.current=setTimeout((()=>{document.body.style.WebkitUserSelect=pe.current,ve(e)}),N)},Me=e=>{O.props.onTouchEnd&&O.props.onTouchEnd(e),he(),clearTimeout(le.current),le.current=setTimeout((()=>{ye(e)}),z)};t.useEffect((()=>{if(de)return document.addEventListener("keydown",e),()=>{document.removeEventListener("keydown",e)};function e(e){"Escape"!==e.key&&"Esc"!==e.key||ye(e)}}),[ye,de]);const Te=(0,cn.A)(O.ref,Se,ee,n);X||0===X||(de=!1);const _e=t.useRef(),Re={},Ne="string"===typeof X;E?(Re.title=de||!Ne||P?null:X,Re["aria-describedby"]=de?fe:null):(Re["aria-label"]=Ne?X:null,Re["aria-labelledby"]=de&&!Ne?fe:null);const Ie=(0,ut.A)({},Re,Y,O.props,{className:(0,ct.A)(Y.className,O.props.className),onTouchStart:je,ref:Te},I?{onMouseMove:e=>{const t=O.props;t.onMouseMove&&t.onMouseMove(e),Uu={x:e.clientX,y:e.clientY},_e.current&&_e.current.update()}}:{});const De={};T||(Ie.onTouchStart=Pe,Ie.onTouchEnd=Me),P||(Ie.onMouseOver=Hu(Ee,Ie.onMouseOver),Ie.onMouseLeave=Hu(Ce,Ie.onMouseLeave),oe||(De.onMouseOver=Ee,De.onMouseLeave=Ce)),C||(Ie.onFocus=Hu(ke,Ie.onFocus),Ie.onBlur=Hu(Oe,Ie.onBlur),oe||(De.onFocus=ke,De.onBlur=Oe));const Le=t.useMemo((()=>{var e;let t=[{name:"arrow",enabled:Boolean(te),options:{element:te,padding:4}}];return null!=(e=H.popperOptions)&&e.modifiers&&(t=t.concat(H.popperOptions.modifiers)),(0,ut.A)({},H.popperOptions,{modifiers:t})}),[te,H]),ze=(0,ut.A)({},S,{isRtl:J,arrow:A,disableInteractive:oe,placement:W,PopperComponentProp:U,touch:re.current}),$e=(e=>{const{classes:t,disableInteractive:n,arrow:r,touch:o,placement:i}=e,a={popper:["popper",!n&&"popperInteractive",r&&"popperArrow"],tooltip:["tooltip",r&&"tooltipArrow",o&&"touch",`tooltipPlacement${(0,Xt.A)(i.split("-")[0])}`],arrow:["arrow"]};return(0,yt.A)(a,Nu,t)})(ze),Be=null!=(r=null!=(o=q.popper)?o:k.Popper)?r:zu,Fe=null!=(i=null!=(a=null!=(l=q.transition)?l:k.Transition)?a:K)?i:Ai,We=null!=(s=null!=(u=q.tooltip)?u:k.Tooltip)?s:$u,Ue=null!=(c=null!=(d=q.arrow)?d:k.Arrow)?c:Bu,He=$i(Be,(0,ut.A)({},H,null!=(f=V.popper)?f:j.popper,{className:(0,ct.A)($e.popper,null==H?void 0:H.className,null==(p=null!=(h=V.popper)?h:j.popper)?void 0:p.className)}),ze),Ve=$i(Fe,(0,ut.A)({},G,null!=(m=V.transition)?m:j.transition),ze),qe=$i(We,(0,ut.A)({},null!=(y=V.tooltip)?y:j.tooltip,{className:(0,ct.A)($e.tooltip,null==(v=null!=(g=V.tooltip)?g:j.tooltip)?void 0:v.className)}),ze),Xe=$i(Ue,(0,ut.A)({},null!=(b=V.arrow)?b:j.arrow,{className:(0,ct.A)($e.arrow,null==(x=null!=(w=V.arrow)?w:j.arrow)?void 0:x.className)}),ze);return(0,Pt.jsxs)(t.Fragment,{children:[t.cloneElement(O,Ie),(0,Pt.jsx)(Be,(0,ut.A)({as:null!=U?U:_u,placement:W,anchorEl:I?{getBoundingClientRect:()=>({top:Uu.y,left:Uu.x,right:Uu.x,bottom:Uu.y,width:0,height:0})}:Z,popperRef:_e,open:!!Z&&de,id:fe,transition:!0},De,He,{popperOptions:Le,children:e=>{let{TransitionProps:t}=e;return(0,Pt.jsx)(Fe,(0,ut.A)({timeout:Q.transitions.duration.shorter},t,Ve,{children:(0,Pt.jsxs)(We,(0,ut.A)({},qe,{children:[X,A?(0,Pt.jsx)(Ue,(0,ut.A)({},Xe,{ref:ne})):null]}))}))}}))]})})),qu=Vu;let Xu;function Ku(){if(Xu)return Xu;const e=document.createElement("div"),t=document.createElement("div");return t.style.width="10px",t.style.height="1px",e.appendChild(t),e.dir="rtl",e.style.fontSize="14px",e.style.width="4px",e.style.height="1px",e.style.position="absolute",e.style.top="-1000px",e.style.overflow="scroll",document.body.appendChild(e),Xu="reverse",e.scrollLeft>0?Xu="default":(e.scrollLeft=1,0===e.scrollLeft&&(Xu="negative")),document.body.removeChild(e),Xu}function Gu(e,t){const n=e.scrollLeft;if("rtl"!==t)return n;switch(Ku()){case"negative":return e.scrollWidth-e.clientWidth+n;case"reverse":return e.scrollWidth-e.clientWidth-n;default:return n}}function Yu(e){return(1+Math.sin(Math.PI*e-Math.PI/2))/2}const Qu=["onChange"],Ju={width:99,height:99,position:"absolute",top:-9999,overflow:"scroll"};const Zu=(0,Ya.A)((0,Pt.jsx)("path",{d:"M15.41 16.09l-4.58-4.59 4.58-4.59L14 5.5l-6 6 6 6z"}),"KeyboardArrowLeft"),ec=(0,Ya.A)((0,Pt.jsx)("path",{d:"M8.59 16.34l4.58-4.59-4.58-4.59L10 5.75l6 6-6 6z"}),"KeyboardArrowRight");function tc(e){return(0,kt.Ay)("MuiTabScrollButton",e)}const nc=(0,Ot.A)("MuiTabScrollButton",["root","vertical","horizontal","disabled"]),rc=["className","slots","slotProps","direction","orientation","disabled"],oc=(0,vt.Ay)(Kn,{name:"MuiTabScrollButton",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.orientation&&t[n.orientation]]}})((e=>{let{ownerState:t}=e;return(0,ut.A)({width:40,flexShrink:0,opacity:.8,[`&.${nc.disabled}`]:{opacity:0}},"vertical"===t.orientation&&{width:"100%",height:40,"& svg":{transform:`rotate(${t.isRtl?-90:90}deg)`}})})),ic=t.forwardRef((function(e,t){var n,r;const o=(0,gt.A)({props:e,name:"MuiTabScrollButton"}),{className:i,slots:a={},slotProps:l={},direction:s}=o,u=(0,st.A)(o,rc),c="rtl"===St().direction,d=(0,ut.A)({isRtl:c},o),f=(e=>{const{classes:t,orientation:n,disabled:r}=e,o={root:["root",n,r&&"disabled"]};return(0,yt.A)(o,tc,t)})(d),p=null!=(n=a.StartScrollButtonIcon)?n:Zu,h=null!=(r=a.EndScrollButtonIcon)?r:ec,m=qi({elementType:p,externalSlotProps:l.startScrollButtonIcon,additionalProps:{fontSize:"small"},ownerState:d}),y=qi({elementType:h,externalSlotProps:l.endScrollButtonIcon,additionalProps:{fontSize:"small"},ownerState:d});return(0,Pt.jsx)(oc,(0,ut.A)({component:"div",className:(0,ct.A)(f.root,i),ref:t,role:null,ownerState:d,tabIndex:null},u,{children:"left"===s?(0,Pt.jsx)(p,(0,ut.A)({},m)):(0,Pt.jsx)(h,(0,ut.A)({},y))}))}));function ac(e){return(0,kt.Ay)("MuiTabs",e)}const lc=(0,Ot.A)("MuiTabs",["root","vertical","flexContainer","flexContainerVertical","centered","scroller","fixed","scrollableX","scrollableY","hideScrollbar","scrollButtons","scrollButtonsHideMobile","indicator"]),sc=["aria-label","aria-labelledby","action","centered","children","className","component","allowScrollButtonsMobile","indicatorColor","onChange","orientation","ScrollButtonComponent","scrollButtons","selectionFollowsFocus","slots","slotProps","TabIndicatorProps","TabScrollButtonProps","textColor","value","variant","visibleScrollbar"],uc=(e,t)=>e===t?e.firstChild:t&&t.nextElementSibling?t.nextElementSibling:e.firstChild,cc=(e,t)=>e===t?e.lastChild:t&&t.previousElementSibling?t.previousElementSibling:e.lastChild,dc=(e,t,n)=>{let r=!1,o=n(e,t);for(;o;){if(o===e.firstChild){if(r)return;r=!0}const t=o.disabled||"true"===o.getAttribute("aria-disabled");if(o.hasAttribute("tabindex")&&!t)return void o.focus();o=n(e,o)}},fc=(0,vt.Ay)("div",{name:"MuiTabs",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[{[`& .${lc.scrollButtons}`]:t.scrollButtons},{[`& .${lc.scrollButtons}`]:n.scrollButtonsHideMobile&&t.scrollButtonsHideMobile},t.root,n.vertical&&t.vertical]}})((e=>{let{ownerState:t,theme:n}=e;return(0,ut.A)({overflow:"hidden",minHeight:48,WebkitOverflowScrolling:"touch",display:"flex"},t.vertical&&{flexDirection:"column"},t.scrollButtonsHideMobile&&{[`& .${lc.scrollButtons}`]:{[n.breakpoints.down("sm")]:{display:"none"}}})})),pc=(0,vt.Ay)("div",{name:"MuiTabs",slot:"Scroller",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.scroller,n.fixed&&t.fixed,n.hideScrollbar&&t.hideScrollbar,n.scrollableX&&t.scrollableX,n.scrollableY&&t.scrollableY]}})((e=>{let{ownerState:t}=e;return(0,ut.A)({position:"relative",display:"inline-block",flex:"1 1 auto",whiteSpace:"nowrap"},t.fixed&&{overflowX:"hidden",width:"100%"},t.hideScrollbar&&{scrollbarWidth:"none","&::-webkit-scrollbar":{display:"none"}},t.scrollableX&&{overflowX:"auto",overflowY:"hidden"},t.scrollableY&&{overflowY:"auto",overflowX:"hidden"})})),hc=(0,vt.Ay)("div",{name:"MuiTabs",slot:"FlexContainer",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.flexContainer,n.vertical&&t.flexContainerVertical,n.centered&&t.centered]}})((e=>{let{ownerState:t}=e;return(0,ut.A)({display:"flex"},t.vertical&&{flexDirection:"column"},t.centered&&{justifyContent:"center"})})),mc=(0,vt.Ay)("span",{name:"MuiTabs",slot:"Indicator",overridesResolver:(e,t)=>t.indicator})((e=>{let{ownerState:t,theme:n}=e;return(0,ut.A)({position:"absolute",height:2,bottom:0,width:"100%",transition:n.transitions.create()},"primary"===t.indicatorColor&&{backgroundColor:(n.vars||n).palette.primary.main},"secondary"===t.indicatorColor&&{backgroundColor:(n.vars||n).palette.secondary.main},t.vertical&&{height:"100%",width:2,right:0})})),yc=(0,vt.Ay)((function(e){const{onChange:n}=e,r=(0,st.A)(e,Qu),o=t.useRef(),i=t.useRef(null),a=()=>{o.current=i.current.offsetHeight-i.current.clientHeight};return(0,Rr.A)((()=>{const e=(0,ii.A)((()=>{const e=o.current;a(),e!==o.current&&n(o.current)})),t=(0,ai.A)(i.current);return t.addEventListener("resize",e),()=>{e.clear(),t.removeEventListener("resize",e)}}),[n]),t.useEffect((()=>{a(),n(o.current)}),[n]),(0,Pt.jsx)("div",(0,ut.A)({style:Ju,ref:i},r))}),{name:"MuiTabs",slot:"ScrollbarSize"})({overflowX:"auto",overflowY:"hidden",scrollbarWidth:"none","&::-webkit-scrollbar":{display:"none"}}),vc={};const gc=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiTabs"}),o=St(),i="rtl"===o.direction,{"aria-label":a,"aria-labelledby":l,action:s,centered:u=!1,children:c,className:d,component:f="div",allowScrollButtonsMobile:p=!1,indicatorColor:h="primary",onChange:m,orientation:y="horizontal",ScrollButtonComponent:v=ic,scrollButtons:g="auto",selectionFollowsFocus:b,slots:x={},slotProps:w={},TabIndicatorProps:S={},TabScrollButtonProps:A={},textColor:O="primary",value:k,variant:j="standard",visibleScrollbar:E=!1}=r,C=(0,st.A)(r,sc),P="scrollable"===j,M="vertical"===y,T=M?"scrollTop":"scrollLeft",_=M?"top":"left",R=M?"bottom":"right",N=M?"clientHeight":"clientWidth",I=M?"height":"width",D=(0,ut.A)({},r,{component:f,allowScrollButtonsMobile:p,indicatorColor:h,orientation:y,vertical:M,scrollButtons:g,textColor:O,variant:j,visibleScrollbar:E,fixed:!P,hideScrollbar:P&&!E,scrollableX:P&&!M,scrollableY:P&&M,centered:u&&!P,scrollButtonsHideMobile:!p}),L=(e=>{const{vertical:t,fixed:n,hideScrollbar:r,scrollableX:o,scrollableY:i,centered:a,scrollButtonsHideMobile:l,classes:s}=e,u={root:["root",t&&"vertical"],scroller:["scroller",n&&"fixed",r&&"hideScrollbar",o&&"scrollableX",i&&"scrollableY"],flexContainer:["flexContainer",t&&"flexContainerVertical",a&&"centered"],indicator:["indicator"],scrollButtons:["scrollButtons",l&&"scrollButtonsHideMobile"],scrollableX:[o&&"scrollableX"],hideScrollbar:[r&&"hideScrollbar"]};return(0,yt.A)(u,ac,s)})(D),z=qi({elementType:x.StartScrollButtonIcon,externalSlotProps:w.startScrollButtonIcon,ownerState:D}),$=qi({elementType:x.EndScrollButtonIcon,externalSlotProps:w.endScrollButtonIcon,ownerState:D});const[B,F]=t.useState(!1),[W,U]=t.useState(vc),[H,V]=t.useState({start:!1,end:!1}),[q,X]=t.useState({overflow:"hidden",scrollbarWidth:0}),K=new Map,G=t.useRef(null),Y=t.useRef(null),Q=()=>{const e=G.current;let t,n;if(e){const n=e.getBoundingClientRect();t={clientWidth:e.clientWidth,scrollLeft:e.scrollLeft,scrollTop:e.scrollTop,scrollLeftNormalized:Gu(e,o.direction),scrollWidth:e.scrollWidth,top:n.top,bottom:n.bottom,left:n.left,right:n.right}}if(e&&!1!==k){const e=Y.current.children;if(e.length>0){const t=e[K.get(k)];0,n=t?t.getBoundingClientRect():null}}return{tabsMeta:t,tabMeta:n}},J=(0,dn.A)((()=>{const{tabsMeta:e,tabMeta:t}=Q();let n,r=0;if(M)n="top",t&&e&&(r=t.top-e.top+e.scrollTop);else if(n=i?"right":"left",t&&e){const o=i?e.scrollLeftNormalized+e.clientWidth-e.scrollWidth:e.scrollLeft;r=(i?-1:1)*(t[n]-e[n]+o)}const o={[n]:r,[I]:t?t[I]:0};if(isNaN(W[n])||isNaN(W[I]))U(o);else{const e=Math.abs(W[n]-o[n]),t=Math.abs(W[I]-o[I]);(e>=1||t>=1)&&U(o)}})),Z=function(e){let{animation:t=!0}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};t?function(e,t,n){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{},o=arguments.length>4&&void 0!==arguments[4]?arguments[4]:()=>{};const{ease:i=Yu,duration:a=300}=r;let l=null;const s=t[e];let u=!1;const c=()=>{u=!0},d=r=>{if(u)return void o(new Error("Animation cancelled"));null===l&&(l=r);const c=Math.min(1,(r-l)/a);t[e]=i(c)*(n-s)+s,c>=1?requestAnimationFrame((()=>{o(null)})):requestAnimationFrame(d)};s===n?o(new Error("Element already at target position")):requestAnimationFrame(d)}(T,G.current,e,{duration:o.transitions.duration.standard}):G.current[T]=e},ee=e=>{let t=G.current[T];M?t+=e:(t+=e*(i?-1:1),t*=i&&"reverse"===Ku()?-1:1),Z(t)},te=()=>{const e=G.current[N];let t=0;const n=Array.from(Y.current.children);for(let r=0;r<n.length;r+=1){const o=n[r];if(t+o[N]>e){0===r&&(t=e);break}t+=o[N]}return t},ne=()=>{ee(-1*te())},re=()=>{ee(te())},oe=t.useCallback((e=>{X({overflow:null,scrollbarWidth:e})}),[]),ie=(0,dn.A)((e=>{const{tabsMeta:t,tabMeta:n}=Q();if(n&&t)if(n[_]<t[_]){const r=t[T]+(n[_]-t[_]);Z(r,{animation:e})}else if(n[R]>t[R]){const r=t[T]+(n[R]-t[R]);Z(r,{animation:e})}})),ae=(0,dn.A)((()=>{if(P&&!1!==g){const{scrollTop:e,scrollHeight:t,clientHeight:n,scrollWidth:r,clientWidth:a}=G.current;let l,s;if(M)l=e>1,s=e<t-n-1;else{const e=Gu(G.current,o.direction);l=i?e<r-a-1:e>1,s=i?e>1:e<r-a-1}l===H.start&&s===H.end||V({start:l,end:s})}}));t.useEffect((()=>{const e=(0,ii.A)((()=>{G.current&&(J(),ae())})),t=(0,ai.A)(G.current);let n;return t.addEventListener("resize",e),"undefined"!==typeof ResizeObserver&&(n=new ResizeObserver(e),Array.from(Y.current.children).forEach((e=>{n.observe(e)}))),()=>{e.clear(),t.removeEventListener("resize",e),n&&n.disconnect()}}),[J,ae]);const le=t.useMemo((()=>(0,ii.A)((()=>{ae()}))),[ae]);t.useEffect((()=>()=>{le.clear()}),[le]),t.useEffect((()=>{F(!0)}),[]),t.useEffect((()=>{J(),ae()})),t.useEffect((()=>{ie(vc!==W)}),[ie,W]),t.useImperativeHandle(s,(()=>({updateIndicator:J,updateScrollButtons:ae})),[J,ae]);const se=(0,Pt.jsx)(mc,(0,ut.A)({},S,{className:(0,ct.A)(L.indicator,S.className),ownerState:D,style:(0,ut.A)({},W,S.style)}));let ue=0;const ce=t.Children.map(c,(e=>{if(!t.isValidElement(e))return null;const n=void 0===e.props.value?ue:e.props.value;K.set(n,ue);const r=n===k;return ue+=1,t.cloneElement(e,(0,ut.A)({fullWidth:"fullWidth"===j,indicator:r&&!B&&se,selected:r,selectionFollowsFocus:b,onChange:m,textColor:O,value:n},1!==ue||!1!==k||e.props.tabIndex?{}:{tabIndex:0}))})),de=(()=>{const e={};e.scrollbarSizeListener=P?(0,Pt.jsx)(yc,{onChange:oe,className:(0,ct.A)(L.scrollableX,L.hideScrollbar)}):null;const t=H.start||H.end,n=P&&("auto"===g&&t||!0===g);return e.scrollButtonStart=n?(0,Pt.jsx)(v,(0,ut.A)({slots:{StartScrollButtonIcon:x.StartScrollButtonIcon},slotProps:{startScrollButtonIcon:z},orientation:y,direction:i?"right":"left",onClick:ne,disabled:!H.start},A,{className:(0,ct.A)(L.scrollButtons,A.className)})):null,e.scrollButtonEnd=n?(0,Pt.jsx)(v,(0,ut.A)({slots:{EndScrollButtonIcon:x.EndScrollButtonIcon},slotProps:{endScrollButtonIcon:$},orientation:y,direction:i?"left":"right",onClick:re,disabled:!H.end},A,{className:(0,ct.A)(L.scrollButtons,A.className)})):null,e})();return(0,Pt.jsxs)(fc,(0,ut.A)({className:(0,ct.A)(L.root,d),ownerState:D,ref:n,as:f},C,{children:[de.scrollButtonStart,de.scrollbarSizeListener,(0,Pt.jsxs)(pc,{className:L.scroller,ownerState:D,style:{overflow:q.overflow,[M?"margin"+(i?"Left":"Right"):"marginBottom"]:E?void 0:-q.scrollbarWidth},ref:G,onScroll:le,children:[(0,Pt.jsx)(hc,{"aria-label":a,"aria-labelledby":l,"aria-orientation":"vertical"===y?"vertical":null,className:L.flexContainer,ownerState:D,onKeyDown:e=>{const t=Y.current,n=(0,Vo.A)(t).activeElement;if("tab"!==n.getAttribute("role"))return;let r="horizontal"===y?"ArrowLeft":"ArrowUp",o="horizontal"===y?"ArrowRight":"ArrowDown";switch("horizontal"===y&&i&&(r="ArrowRight",o="ArrowLeft"),e.key){case r:e.preventDefault(),dc(t,n,cc);break;case o:e.preventDefault(),dc(t,n,uc);break;case"Home":e.preventDefault(),dc(t,null,uc);break;case"End":e.preventDefault(),dc(t,null,cc)}},ref:Y,role:"tablist",children:ce}),B&&se]}),de.scrollButtonEnd]}))})),bc=gc;function xc(e){return(0,kt.Ay)("MuiTab",e)}const wc=(0,Ot.A)("MuiTab",["root","labelIcon","textColorInherit","textColorPrimary","textColorSecondary","selected","disabled","fullWidth","wrapped","iconWrapper"]),Sc=["className","disabled","disableFocusRipple","fullWidth","icon","iconPosition","indicator","label","onChange","onClick","onFocus","selected","selectionFollowsFocus","textColor","value","wrapped"],Ac=(0,vt.Ay)(Kn,{name:"MuiTab",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.label&&n.icon&&t.labelIcon,t[`textColor${(0,Xt.A)(n.textColor)}`],n.fullWidth&&t.fullWidth,n.wrapped&&t.wrapped]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({},t.typography.button,{maxWidth:360,minWidth:90,position:"relative",minHeight:48,flexShrink:0,padding:"12px 16px",overflow:"hidden",whiteSpace:"normal",textAlign:"center"},n.label&&{flexDirection:"top"===n.iconPosition||"bottom"===n.iconPosition?"column":"row"},{lineHeight:1.25},n.icon&&n.label&&{minHeight:72,paddingTop:9,paddingBottom:9,[`& > .${wc.iconWrapper}`]:(0,ut.A)({},"top"===n.iconPosition&&{marginBottom:6},"bottom"===n.iconPosition&&{marginTop:6},"start"===n.iconPosition&&{marginRight:t.spacing(1)},"end"===n.iconPosition&&{marginLeft:t.spacing(1)})},"inherit"===n.textColor&&{color:"inherit",opacity:.6,[`&.${wc.selected}`]:{opacity:1},[`&.${wc.disabled}`]:{opacity:(t.vars||t).palette.action.disabledOpacity}},"primary"===n.textColor&&{color:(t.vars||t).palette.text.secondary,[`&.${wc.selected}`]:{color:(t.vars||t).palette.primary.main},[`&.${wc.disabled}`]:{color:(t.vars||t).palette.text.disabled}},"secondary"===n.textColor&&{color:(t.vars||t).palette.text.secondary,[`&.${wc.selected}`]:{color:(t.vars||t).palette.secondary.main},[`&.${wc.disabled}`]:{color:(t.vars||t).palette.text.disabled}},n.fullWidth&&{flexShrink:1,flexGrow:1,flexBasis:0,maxWidth:"none"},n.wrapped&&{fontSize:t.typography.pxToRem(12)})})),Oc=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiTab"}),{className:o,disabled:i=!1,disableFocusRipple:a=!1,fullWidth:l,icon:s,iconPosition:u="top",indicator:c,label:d,onChange:f,onClick:p,onFocus:h,selected:m,selectionFollowsFocus:y,textColor:v="inherit",value:g,wrapped:b=!1}=r,x=(0,st.A)(r,Sc),w=(0,ut.A)({},r,{disabled:i,disableFocusRipple:a,selected:m,icon:!!s,iconPosition:u,label:!!d,fullWidth:l,textColor:v,wrapped:b}),S=(e=>{const{classes:t,textColor:n,fullWidth:r,wrapped:o,icon:i,label:a,selected:l,disabled:s}=e,u={root:["root",i&&a&&"labelIcon",`textColor${(0,Xt.A)(n)}`,r&&"fullWidth",o&&"wrapped",l&&"selected",s&&"disabled"],iconWrapper:["iconWrapper"]};return(0,yt.A)(u,xc,t)})(w),A=s&&d&&t.isValidElement(s)?t.cloneElement(s,{className:(0,ct.A)(S.iconWrapper,s.props.className)}):s;return(0,Pt.jsxs)(Ac,(0,ut.A)({focusRipple:!a,className:(0,ct.A)(S.root,o),ref:n,role:"tab","aria-selected":m,disabled:i,onClick:e=>{!m&&f&&f(e,g),p&&p(e)},onFocus:e=>{y&&!m&&f&&f(e,g),h&&h(e)},ownerState:w,tabIndex:m?0:-1},x,{children:["top"===u||"start"===u?(0,Pt.jsxs)(t.Fragment,{children:[A,d]}):(0,Pt.jsxs)(t.Fragment,{children:[d,A]}),c]}))})),kc=Oc;function jc(e){return(0,kt.Ay)("MuiCard",e)}(0,Ot.A)("MuiCard",["root"]);const Ec=["className","raised"],Cc=(0,vt.Ay)(sn,{name:"MuiCard",slot:"Root",overridesResolver:(e,t)=>t.root})((()=>({overflow:"hidden"}))),Pc=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiCard"}),{className:r,raised:o=!1}=n,i=(0,st.A)(n,Ec),a=(0,ut.A)({},n,{raised:o}),l=(e=>{const{classes:t}=e;return(0,yt.A)({root:["root"]},jc,t)})(a);return(0,Pt.jsx)(Cc,(0,ut.A)({className:(0,ct.A)(l.root,r),elevation:o?8:void 0,ref:t,ownerState:a},i))}));function Mc(e){return(0,kt.Ay)("MuiCardContent",e)}(0,Ot.A)("MuiCardContent",["root"]);const Tc=["className","component"],_c=(0,vt.Ay)("div",{name:"MuiCardContent",slot:"Root",overridesResolver:(e,t)=>t.root})((()=>({padding:16,"&:last-child":{paddingBottom:24}}))),Rc=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiCardContent"}),{className:r,component:o="div"}=n,i=(0,st.A)(n,Tc),a=(0,ut.A)({},n,{component:o}),l=(e=>{const{classes:t}=e;return(0,yt.A)({root:["root"]},Mc,t)})(a);return(0,Pt.jsx)(_c,(0,ut.A)({as:o,className:(0,ct.A)(l.root,r),ownerState:a,ref:t},i))}));function Nc(e){return(0,kt.Ay)("MuiTableContainer",e)}(0,Ot.A)("MuiTableContainer",["root"]);const Ic=["className","component"],Dc=(0,vt.Ay)("div",{name:"MuiTableContainer",slot:"Root",overridesResolver:(e,t)=>t.root})({width:"100%",overflowX:"auto"}),Lc=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiTableContainer"}),{className:r,component:o="div"}=n,i=(0,st.A)(n,Ic),a=(0,ut.A)({},n,{component:o}),l=(e=>{const{classes:t}=e;return(0,yt.A)({root:["root"]},Nc,t)})(a);return(0,Pt.jsx)(Dc,(0,ut.A)({ref:t,as:o,className:(0,ct.A)(l.root,r),ownerState:a},i))}));const zc=t.createContext();function $c(e){return(0,kt.Ay)("MuiTable",e)}(0,Ot.A)("MuiTable",["root","stickyHeader"]);const Bc=["className","component","padding","size","stickyHeader"],Fc=(0,vt.Ay)("table",{name:"MuiTable",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.stickyHeader&&t.stickyHeader]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({display:"table",width:"100%",borderCollapse:"collapse",borderSpacing:0,"& caption":(0,ut.A)({},t.typography.body2,{padding:t.spacing(2),color:(t.vars||t).palette.text.secondary,textAlign:"left",captionSide:"bottom"})},n.stickyHeader&&{borderCollapse:"separate"})})),Wc="table",Uc=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiTable"}),{className:o,component:i=Wc,padding:a="normal",size:l="medium",stickyHeader:s=!1}=r,u=(0,st.A)(r,Bc),c=(0,ut.A)({},r,{component:i,padding:a,size:l,stickyHeader:s}),d=(e=>{const{classes:t,stickyHeader:n}=e,r={root:["root",n&&"stickyHeader"]};return(0,yt.A)(r,$c,t)})(c),f=t.useMemo((()=>({padding:a,size:l,stickyHeader:s})),[a,l,s]);return(0,Pt.jsx)(zc.Provider,{value:f,children:(0,Pt.jsx)(Fc,(0,ut.A)({as:i,role:i===Wc?null:"table",ref:n,className:(0,ct.A)(d.root,o),ownerState:c},u))})}));const Hc=t.createContext();function Vc(e){return(0,kt.Ay)("MuiTableHead",e)}(0,Ot.A)("MuiTableHead",["root"]);const qc=["className","component"],Xc=(0,vt.Ay)("thead",{name:"MuiTableHead",slot:"Root",overridesResolver:(e,t)=>t.root})({display:"table-header-group"}),Kc={variant:"head"},Gc="thead",Yc=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiTableHead"}),{className:r,component:o=Gc}=n,i=(0,st.A)(n,qc),a=(0,ut.A)({},n,{component:o}),l=(e=>{const{classes:t}=e;return(0,yt.A)({root:["root"]},Vc,t)})(a);return(0,Pt.jsx)(Hc.Provider,{value:Kc,children:(0,Pt.jsx)(Xc,(0,ut.A)({as:o,className:(0,ct.A)(l.root,r),ref:t,role:o===Gc?null:"rowgroup",ownerState:a},i))})}));function Qc(e){return(0,kt.Ay)("MuiTableRow",e)}const Jc=(0,Ot.A)("MuiTableRow",["root","selected","hover","head","footer"]),Zc=["className","component","hover","selected"],ed=(0,vt.Ay)("tr",{name:"MuiTableRow",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.head&&t.head,n.footer&&t.footer]}})((e=>{let{theme:t}=e;return{color:"inherit",display:"table-row",verticalAlign:"middle",outline:0,[`&.${Jc.hover}:hover`]:{backgroundColor:(t.vars||t).palette.action.hover},[`&.${Jc.selected}`]:{backgroundColor:t.vars?`rgba(${t.vars.palette.primary.mainChannel} / ${t.vars.palette.action.selectedOpacity})`:(0,tn.X4)(t.palette.primary.main,t.palette.action.selectedOpacity),"&:hover":{backgroundColor:t.vars?`rgba(${t.vars.palette.primary.mainChannel} / calc(${t.vars.palette.action.selectedOpacity} + ${t.vars.palette.action.hoverOpacity}))`:(0,tn.X4)(t.palette.primary.main,t.palette.action.selectedOpacity+t.palette.action.hoverOpacity)}}}})),td="tr",nd=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiTableRow"}),{className:o,component:i=td,hover:a=!1,selected:l=!1}=r,s=(0,st.A)(r,Zc),u=t.useContext(Hc),c=(0,ut.A)({},r,{component:i,hover:a,selected:l,head:u&&"head"===u.variant,footer:u&&"footer"===u.variant}),d=(e=>{const{classes:t,selected:n,hover:r,head:o,footer:i}=e,a={root:["root",n&&"selected",r&&"hover",o&&"head",i&&"footer"]};return(0,yt.A)(a,Qc,t)})(c);return(0,Pt.jsx)(ed,(0,ut.A)({as:i,ref:n,className:(0,ct.A)(d.root,o),role:i===td?null:"row",ownerState:c},s))})),rd=nd;function od(e){return(0,kt.Ay)("MuiTableCell",e)}const id=(0,Ot.A)("MuiTableCell",["root","head","body","footer","sizeSmall","sizeMedium","paddingCheckbox","paddingNone","alignLeft","alignCenter","alignRight","alignJustify","stickyHeader"]),ad=["align","className","component","padding","scope","size","sortDirection","variant"],ld=(0,vt.Ay)("td",{name:"MuiTableCell",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[n.variant],t[`size${(0,Xt.A)(n.size)}`],"normal"!==n.padding&&t[`padding${(0,Xt.A)(n.padding)}`],"inherit"!==n.align&&t[`align${(0,Xt.A)(n.align)}`],n.stickyHeader&&t.stickyHeader]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({},t.typography.body2,{display:"table-cell",verticalAlign:"inherit",borderBottom:t.vars?`1px solid ${t.vars.palette.TableCell.border}`:`1px solid\n    ${"light"===t.palette.mode?(0,tn.a)((0,tn.X4)(t.palette.divider,1),.88):(0,tn.e$)((0,tn.X4)(t.palette.divider,1),.68)}`,textAlign:"left",padding:16},"head"===n.variant&&{color:(t.vars||t).palette.text.primary,lineHeight:t.typography.pxToRem(24),fontWeight:t.typography.fontWeightMedium},"body"===n.variant&&{color:(t.vars||t).palette.text.primary},"footer"===n.variant&&{color:(t.vars||t).palette.text.secondary,lineHeight:t.typography.pxToRem(21),fontSize:t.typography.pxToRem(12)},"small"===n.size&&{padding:"6px 16px",[`&.${id.paddingCheckbox}`]:{width:24,padding:"0 12px 0 16px","& > *":{padding:0}}},"checkbox"===n.padding&&{width:48,padding:"0 0 0 4px"},"none"===n.padding&&{padding:0},"left"===n.align&&{textAlign:"left"},"center"===n.align&&{textAlign:"center"},"right"===n.align&&{textAlign:"right",flexDirection:"row-reverse"},"justify"===n.align&&{textAlign:"justify"},n.stickyHeader&&{position:"sticky",top:0,zIndex:2,backgroundColor:(t.vars||t).palette.background.default})})),sd=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiTableCell"}),{align:o="inherit",className:i,component:a,padding:l,scope:s,size:u,sortDirection:c,variant:d}=r,f=(0,st.A)(r,ad),p=t.useContext(zc),h=t.useContext(Hc),m=h&&"head"===h.variant;let y;y=a||(m?"th":"td");let v=s;"td"===y?v=void 0:!v&&m&&(v="col");const g=d||h&&h.variant,b=(0,ut.A)({},r,{align:o,component:y,padding:l||(p&&p.padding?p.padding:"normal"),size:u||(p&&p.size?p.size:"medium"),sortDirection:c,stickyHeader:"head"===g&&p&&p.stickyHeader,variant:g}),x=(e=>{const{classes:t,variant:n,align:r,padding:o,size:i,stickyHeader:a}=e,l={root:["root",n,a&&"stickyHeader","inherit"!==r&&`align${(0,Xt.A)(r)}`,"normal"!==o&&`padding${(0,Xt.A)(o)}`,`size${(0,Xt.A)(i)}`]};return(0,yt.A)(l,od,t)})(b);let w=null;return c&&(w="asc"===c?"ascending":"descending"),(0,Pt.jsx)(ld,(0,ut.A)({as:y,ref:n,className:(0,ct.A)(x.root,i),"aria-sort":w,scope:v,ownerState:b},f))})),ud=sd;function cd(e){return(0,kt.Ay)("MuiTableBody",e)}(0,Ot.A)("MuiTableBody",["root"]);const dd=["className","component"],fd=(0,vt.Ay)("tbody",{name:"MuiTableBody",slot:"Root",overridesResolver:(e,t)=>t.root})({display:"table-row-group"}),pd={variant:"body"},hd="tbody",md=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiTableBody"}),{className:r,component:o=hd}=n,i=(0,st.A)(n,dd),a=(0,ut.A)({},n,{component:o}),l=(e=>{const{classes:t}=e;return(0,yt.A)({root:["root"]},cd,t)})(a);return(0,Pt.jsx)(Hc.Provider,{value:pd,children:(0,Pt.jsx)(fd,(0,ut.A)({className:(0,ct.A)(l.root,r),as:o,ref:t,role:o===hd?null:"rowgroup",ownerState:a},i))})})),yd=(0,Ya.A)((0,Pt.jsx)("path",{d:"M12 2C6.47 2 2 6.47 2 12s4.47 10 10 10 10-4.47 10-10S17.53 2 12 2zm5 13.59L15.59 17 12 13.41 8.41 17 7 15.59 10.59 12 7 8.41 8.41 7 12 10.59 15.59 7 17 8.41 13.41 12 17 15.59z"}),"Cancel");function vd(e){return(0,kt.Ay)("MuiChip",e)}const gd=(0,Ot.A)("MuiChip",["root","sizeSmall","sizeMedium","colorError","colorInfo","colorPrimary","colorSecondary","colorSuccess","colorWarning","disabled","clickable","clickableColorPrimary","clickableColorSecondary","deletable","deletableColorPrimary","deletableColorSecondary","outlined","filled","outlinedPrimary","outlinedSecondary","filledPrimary","filledSecondary","avatar","avatarSmall","avatarMedium","avatarColorPrimary","avatarColorSecondary","icon","iconSmall","iconMedium","iconColorPrimary","iconColorSecondary","label","labelSmall","labelMedium","deleteIcon","deleteIconSmall","deleteIconMedium","deleteIconColorPrimary","deleteIconColorSecondary","deleteIconOutlinedColorPrimary","deleteIconOutlinedColorSecondary","deleteIconFilledColorPrimary","deleteIconFilledColorSecondary","focusVisible"]),bd=["avatar","className","clickable","color","component","deleteIcon","disabled","icon","label","onClick","onDelete","onKeyDown","onKeyUp","size","variant","tabIndex","skipFocusWhenDisabled"],xd=(0,vt.Ay)("div",{name:"MuiChip",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e,{color:r,iconColor:o,clickable:i,onDelete:a,size:l,variant:s}=n;return[{[`& .${gd.avatar}`]:t.avatar},{[`& .${gd.avatar}`]:t[`avatar${(0,Xt.A)(l)}`]},{[`& .${gd.avatar}`]:t[`avatarColor${(0,Xt.A)(r)}`]},{[`& .${gd.icon}`]:t.icon},{[`& .${gd.icon}`]:t[`icon${(0,Xt.A)(l)}`]},{[`& .${gd.icon}`]:t[`iconColor${(0,Xt.A)(o)}`]},{[`& .${gd.deleteIcon}`]:t.deleteIcon},{[`& .${gd.deleteIcon}`]:t[`deleteIcon${(0,Xt.A)(l)}`]},{[`& .${gd.deleteIcon}`]:t[`deleteIconColor${(0,Xt.A)(r)}`]},{[`& .${gd.deleteIcon}`]:t[`deleteIcon${(0,Xt.A)(s)}Color${(0,Xt.A)(r)}`]},t.root,t[`size${(0,Xt.A)(l)}`],t[`color${(0,Xt.A)(r)}`],i&&t.clickable,i&&"default"!==r&&t[`clickableColor${(0,Xt.A)(r)})`],a&&t.deletable,a&&"default"!==r&&t[`deletableColor${(0,Xt.A)(r)}`],t[s],t[`${s}${(0,Xt.A)(r)}`]]}})((e=>{let{theme:t,ownerState:n}=e;const r="light"===t.palette.mode?t.palette.grey[700]:t.palette.grey[300];return(0,ut.A)({maxWidth:"100%",fontFamily:t.typography.fontFamily,fontSize:t.typography.pxToRem(13),display:"inline-flex",alignItems:"center",justifyContent:"center",height:32,color:(t.vars||t).palette.text.primary,backgroundColor:(t.vars||t).palette.action.selected,borderRadius:16,whiteSpace:"nowrap",transition:t.transitions.create(["background-color","box-shadow"]),cursor:"default",outline:0,textDecoration:"none",border:0,padding:0,verticalAlign:"middle",boxSizing:"border-box",[`&.${gd.disabled}`]:{opacity:(t.vars||t).palette.action.disabledOpacity,pointerEvents:"none"},[`& .${gd.avatar}`]:{marginLeft:5,marginRight:-6,width:24,height:24,color:t.vars?t.vars.palette.Chip.defaultAvatarColor:r,fontSize:t.typography.pxToRem(12)},[`& .${gd.avatarColorPrimary}`]:{color:(t.vars||t).palette.primary.contrastText,backgroundColor:(t.vars||t).palette.primary.dark},[`& .${gd.avatarColorSecondary}`]:{color:(t.vars||t).palette.secondary.contrastText,backgroundColor:(t.vars||t).palette.secondary.dark},[`& .${gd.avatarSmall}`]:{marginLeft:4,marginRight:-4,width:18,height:18,fontSize:t.typography.pxToRem(10)},[`& .${gd.icon}`]:(0,ut.A)({marginLeft:5,marginRight:-6},"small"===n.size&&{fontSize:18,marginLeft:4,marginRight:-4},n.iconColor===n.color&&(0,ut.A)({color:t.vars?t.vars.palette.Chip.defaultIconColor:r},"default"!==n.color&&{color:"inherit"})),[`& .${gd.deleteIcon}`]:(0,ut.A)({WebkitTapHighlightColor:"transparent",color:t.vars?`rgba(${t.vars.palette.text.primaryChannel} / 0.26)`:(0,tn.X4)(t.palette.text.primary,.26),fontSize:22,cursor:"pointer",margin:"0 5px 0 -6px","&:hover":{color:t.vars?`rgba(${t.vars.palette.text.primaryChannel} / 0.4)`:(0,tn.X4)(t.palette.text.primary,.4)}},"small"===n.size&&{fontSize:16,marginRight:4,marginLeft:-4},"default"!==n.color&&{color:t.vars?`rgba(${t.vars.palette[n.color].contrastTextChannel} / 0.7)`:(0,tn.X4)(t.palette[n.color].contrastText,.7),"&:hover, &:active":{color:(t.vars||t).palette[n.color].contrastText}})},"small"===n.size&&{height:24},"default"!==n.color&&{backgroundColor:(t.vars||t).palette[n.color].main,color:(t.vars||t).palette[n.color].contrastText},n.onDelete&&{[`&.${gd.focusVisible}`]:{backgroundColor:t.vars?`rgba(${t.vars.palette.action.selectedChannel} / calc(${t.vars.palette.action.selectedOpacity} + ${t.vars.palette.action.focusOpacity}))`:(0,tn.X4)(t.palette.action.selected,t.palette.action.selectedOpacity+t.palette.action.focusOpacity)}},n.onDelete&&"default"!==n.color&&{[`&.${gd.focusVisible}`]:{backgroundColor:(t.vars||t).palette[n.color].dark}})}),(e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({},n.clickable&&{userSelect:"none",WebkitTapHighlightColor:"transparent",cursor:"pointer","&:hover":{backgroundColor:t.vars?`rgba(${t.vars.palette.action.selectedChannel} / calc(${t.vars.palette.action.selectedOpacity} + ${t.vars.palette.action.hoverOpacity}))`:(0,tn.X4)(t.palette.action.selected,t.palette.action.selectedOpacity+t.palette.action.hoverOpacity)},[`&.${gd.focusVisible}`]:{backgroundColor:t.vars?`rgba(${t.vars.palette.action.selectedChannel} / calc(${t.vars.palette.action.selectedOpacity} + ${t.vars.palette.action.focusOpacity}))`:(0,tn.X4)(t.palette.action.selected,t.palette.action.selectedOpacity+t.palette.action.focusOpacity)},"&:active":{boxShadow:(t.vars||t).shadows[1]}},n.clickable&&"default"!==n.color&&{[`&:hover, &.${gd.focusVisible}`]:{backgroundColor:(t.vars||t).palette[n.color].dark}})}),(e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({},"outlined"===n.variant&&{backgroundColor:"transparent",border:t.vars?`1px solid ${t.vars.palette.Chip.defaultBorder}`:`1px solid ${"light"===t.palette.mode?t.palette.grey[400]:t.palette.grey[700]}`,[`&.${gd.clickable}:hover`]:{backgroundColor:(t.vars||t).palette.action.hover},[`&.${gd.focusVisible}`]:{backgroundColor:(t.vars||t).palette.action.focus},[`& .${gd.avatar}`]:{marginLeft:4},[`& .${gd.avatarSmall}`]:{marginLeft:2},[`& .${gd.icon}`]:{marginLeft:4},[`& .${gd.iconSmall}`]:{marginLeft:2},[`& .${gd.deleteIcon}`]:{marginRight:5},[`& .${gd.deleteIconSmall}`]:{marginRight:3}},"outlined"===n.variant&&"default"!==n.color&&{color:(t.vars||t).palette[n.color].main,border:`1px solid ${t.vars?`rgba(${t.vars.palette[n.color].mainChannel} / 0.7)`:(0,tn.X4)(t.palette[n.color].main,.7)}`,[`&.${gd.clickable}:hover`]:{backgroundColor:t.vars?`rgba(${t.vars.palette[n.color].mainChannel} / ${t.vars.palette.action.hoverOpacity})`:(0,tn.X4)(t.palette[n.color].main,t.palette.action.hoverOpacity)},[`&.${gd.focusVisible}`]:{backgroundColor:t.vars?`rgba(${t.vars.palette[n.color].mainChannel} / ${t.vars.palette.action.focusOpacity})`:(0,tn.X4)(t.palette[n.color].main,t.palette.action.focusOpacity)},[`& .${gd.deleteIcon}`]:{color:t.vars?`rgba(${t.vars.palette[n.color].mainChannel} / 0.7)`:(0,tn.X4)(t.palette[n.color].main,.7),"&:hover, &:active":{color:(t.vars||t).palette[n.color].main}}})})),wd=(0,vt.Ay)("span",{name:"MuiChip",slot:"Label",overridesResolver:(e,t)=>{const{ownerState:n}=e,{size:r}=n;return[t.label,t[`label${(0,Xt.A)(r)}`]]}})((e=>{let{ownerState:t}=e;return(0,ut.A)({overflow:"hidden",textOverflow:"ellipsis",paddingLeft:12,paddingRight:12,whiteSpace:"nowrap"},"small"===t.size&&{paddingLeft:8,paddingRight:8})}));function Sd(e){return"Backspace"===e.key||"Delete"===e.key}const Ad=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiChip"}),{avatar:o,className:i,clickable:a,color:l="default",component:s,deleteIcon:u,disabled:c=!1,icon:d,label:f,onClick:p,onDelete:h,onKeyDown:m,onKeyUp:y,size:v="medium",variant:g="filled",tabIndex:b,skipFocusWhenDisabled:x=!1}=r,w=(0,st.A)(r,bd),S=t.useRef(null),A=(0,cn.A)(S,n),O=e=>{e.stopPropagation(),h&&h(e)},k=!(!1===a||!p)||a,j=k||h?Kn:s||"div",E=(0,ut.A)({},r,{component:j,disabled:c,size:v,color:l,iconColor:t.isValidElement(d)&&d.props.color||l,onDelete:!!h,clickable:k,variant:g}),C=(e=>{const{classes:t,disabled:n,size:r,color:o,iconColor:i,onDelete:a,clickable:l,variant:s}=e,u={root:["root",s,n&&"disabled",`size${(0,Xt.A)(r)}`,`color${(0,Xt.A)(o)}`,l&&"clickable",l&&`clickableColor${(0,Xt.A)(o)}`,a&&"deletable",a&&`deletableColor${(0,Xt.A)(o)}`,`${s}${(0,Xt.A)(o)}`],label:["label",`label${(0,Xt.A)(r)}`],avatar:["avatar",`avatar${(0,Xt.A)(r)}`,`avatarColor${(0,Xt.A)(o)}`],icon:["icon",`icon${(0,Xt.A)(r)}`,`iconColor${(0,Xt.A)(i)}`],deleteIcon:["deleteIcon",`deleteIcon${(0,Xt.A)(r)}`,`deleteIconColor${(0,Xt.A)(o)}`,`deleteIcon${(0,Xt.A)(s)}Color${(0,Xt.A)(o)}`]};return(0,yt.A)(u,vd,t)})(E),P=j===Kn?(0,ut.A)({component:s||"div",focusVisibleClassName:C.focusVisible},h&&{disableRipple:!0}):{};let M=null;h&&(M=u&&t.isValidElement(u)?t.cloneElement(u,{className:(0,ct.A)(u.props.className,C.deleteIcon),onClick:O}):(0,Pt.jsx)(yd,{className:(0,ct.A)(C.deleteIcon),onClick:O}));let T=null;o&&t.isValidElement(o)&&(T=t.cloneElement(o,{className:(0,ct.A)(C.avatar,o.props.className)}));let _=null;return d&&t.isValidElement(d)&&(_=t.cloneElement(d,{className:(0,ct.A)(C.icon,d.props.className)})),(0,Pt.jsxs)(xd,(0,ut.A)({as:j,className:(0,ct.A)(C.root,i),disabled:!(!k||!c)||void 0,onClick:p,onKeyDown:e=>{e.currentTarget===e.target&&Sd(e)&&e.preventDefault(),m&&m(e)},onKeyUp:e=>{e.currentTarget===e.target&&(h&&Sd(e)?h(e):"Escape"===e.key&&S.current&&S.current.blur()),y&&y(e)},ref:A,tabIndex:x&&c?-1:b,ownerState:E},P,w,{children:[T||_,(0,Pt.jsx)(wd,{className:(0,ct.A)(C.label),ownerState:E,children:f}),M]}))})),Od=Ad;function kd(e){return(0,kt.Ay)("MuiDialog",e)}const jd=(0,Ot.A)("MuiDialog",["root","scrollPaper","scrollBody","container","paper","paperScrollPaper","paperScrollBody","paperWidthFalse","paperWidthXs","paperWidthSm","paperWidthMd","paperWidthLg","paperWidthXl","paperFullWidth","paperFullScreen"]);const Ed=t.createContext({}),Cd=["aria-describedby","aria-labelledby","BackdropComponent","BackdropProps","children","className","disableEscapeKeyDown","fullScreen","fullWidth","maxWidth","onBackdropClick","onClose","open","PaperComponent","PaperProps","scroll","TransitionComponent","transitionDuration","TransitionProps"],Pd=(0,vt.Ay)(ia,{name:"MuiDialog",slot:"Backdrop",overrides:(e,t)=>t.backdrop})({zIndex:-1}),Md=(0,vt.Ay)(ua,{name:"MuiDialog",slot:"Root",overridesResolver:(e,t)=>t.root})({"@media print":{position:"absolute !important"}}),Td=(0,vt.Ay)("div",{name:"MuiDialog",slot:"Container",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.container,t[`scroll${(0,Xt.A)(n.scroll)}`]]}})((e=>{let{ownerState:t}=e;return(0,ut.A)({height:"100%","@media print":{height:"auto"},outline:0},"paper"===t.scroll&&{display:"flex",justifyContent:"center",alignItems:"center"},"body"===t.scroll&&{overflowY:"auto",overflowX:"hidden",textAlign:"center","&:after":{content:'""',display:"inline-block",verticalAlign:"middle",height:"100%",width:"0"}})})),_d=(0,vt.Ay)(sn,{name:"MuiDialog",slot:"Paper",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.paper,t[`scrollPaper${(0,Xt.A)(n.scroll)}`],t[`paperWidth${(0,Xt.A)(String(n.maxWidth))}`],n.fullWidth&&t.paperFullWidth,n.fullScreen&&t.paperFullScreen]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({margin:32,position:"relative",overflowY:"auto","@media print":{overflowY:"visible",boxShadow:"none"}},"paper"===n.scroll&&{display:"flex",flexDirection:"column",maxHeight:"calc(100% - 64px)"},"body"===n.scroll&&{display:"inline-block",verticalAlign:"middle",textAlign:"left"},!n.maxWidth&&{maxWidth:"calc(100% - 64px)"},"xs"===n.maxWidth&&{maxWidth:"px"===t.breakpoints.unit?Math.max(t.breakpoints.values.xs,444):`${t.breakpoints.values.xs}${t.breakpoints.unit}`,[`&.${jd.paperScrollBody}`]:{[t.breakpoints.down(Math.max(t.breakpoints.values.xs,444)+64)]:{maxWidth:"calc(100% - 64px)"}}},n.maxWidth&&"xs"!==n.maxWidth&&{maxWidth:`${t.breakpoints.values[n.maxWidth]}${t.breakpoints.unit}`,[`&.${jd.paperScrollBody}`]:{[t.breakpoints.down(t.breakpoints.values[n.maxWidth]+64)]:{maxWidth:"calc(100% - 64px)"}}},n.fullWidth&&{width:"calc(100% - 64px)"},n.fullScreen&&{margin:0,width:"100%",maxWidth:"100%",height:"100%",maxHeight:"none",borderRadius:0,[`&.${jd.paperScrollBody}`]:{margin:0,maxWidth:"100%"}})})),Rd=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiDialog"}),o=St(),i={enter:o.transitions.duration.enteringScreen,exit:o.transitions.duration.leavingScreen},{"aria-describedby":a,"aria-labelledby":l,BackdropComponent:s,BackdropProps:u,children:c,className:d,disableEscapeKeyDown:f=!1,fullScreen:p=!1,fullWidth:h=!1,maxWidth:m="sm",onBackdropClick:y,onClose:v,open:g,PaperComponent:b=sn,PaperProps:x={},scroll:w="paper",TransitionComponent:S=ta,transitionDuration:A=i,TransitionProps:O}=r,k=(0,st.A)(r,Cd),j=(0,ut.A)({},r,{disableEscapeKeyDown:f,fullScreen:p,fullWidth:h,maxWidth:m,scroll:w}),E=(e=>{const{classes:t,scroll:n,maxWidth:r,fullWidth:o,fullScreen:i}=e,a={root:["root"],container:["container",`scroll${(0,Xt.A)(n)}`],paper:["paper",`paperScroll${(0,Xt.A)(n)}`,`paperWidth${(0,Xt.A)(String(r))}`,o&&"paperFullWidth",i&&"paperFullScreen"]};return(0,yt.A)(a,kd,t)})(j),C=t.useRef(),P=(0,yr.A)(l),M=t.useMemo((()=>({titleId:P})),[P]);return(0,Pt.jsx)(Md,(0,ut.A)({className:(0,ct.A)(E.root,d),closeAfterTransition:!0,components:{Backdrop:Pd},componentsProps:{backdrop:(0,ut.A)({transitionDuration:A,as:s},u)},disableEscapeKeyDown:f,onClose:v,open:g,ref:n,onClick:e=>{C.current&&(C.current=null,y&&y(e),v&&v(e,"backdropClick"))},ownerState:j},k,{children:(0,Pt.jsx)(S,(0,ut.A)({appear:!0,in:g,timeout:A,role:"presentation"},O,{children:(0,Pt.jsx)(Td,{className:(0,ct.A)(E.container),onMouseDown:e=>{C.current=e.target===e.currentTarget},ownerState:j,children:(0,Pt.jsx)(_d,(0,ut.A)({as:b,elevation:24,role:"dialog","aria-describedby":a,"aria-labelledby":P},x,{className:(0,ct.A)(E.paper,x.className),ownerState:j,children:(0,Pt.jsx)(Ed.Provider,{value:M,children:c})}))})}))}))}));function Nd(e){return(0,kt.Ay)("MuiDialogTitle",e)}const Id=(0,Ot.A)("MuiDialogTitle",["root"]),Dd=["className","id"],Ld=(0,vt.Ay)(en,{name:"MuiDialogTitle",slot:"Root",overridesResolver:(e,t)=>t.root})({padding:"16px 24px",flex:"0 0 auto"}),zd=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiDialogTitle"}),{className:o,id:i}=r,a=(0,st.A)(r,Dd),l=r,s=(e=>{const{classes:t}=e;return(0,yt.A)({root:["root"]},Nd,t)})(l),{titleId:u=i}=t.useContext(Ed);return(0,Pt.jsx)(Ld,(0,ut.A)({component:"h2",className:(0,ct.A)(s.root,o),ownerState:l,ref:n,variant:"h6",id:null!=i?i:u},a))}));function $d(e){return(0,kt.Ay)("MuiDialogContent",e)}(0,Ot.A)("MuiDialogContent",["root","dividers"]);const Bd=["className","dividers"],Fd=(0,vt.Ay)("div",{name:"MuiDialogContent",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.dividers&&t.dividers]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({flex:"1 1 auto",WebkitOverflowScrolling:"touch",overflowY:"auto",padding:"20px 24px"},n.dividers?{padding:"16px 24px",borderTop:`1px solid ${(t.vars||t).palette.divider}`,borderBottom:`1px solid ${(t.vars||t).palette.divider}`}:{[`.${Id.root} + &`]:{paddingTop:0}})})),Wd=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiDialogContent"}),{className:r,dividers:o=!1}=n,i=(0,st.A)(n,Bd),a=(0,ut.A)({},n,{dividers:o}),l=(e=>{const{classes:t,dividers:n}=e,r={root:["root",n&&"dividers"]};return(0,yt.A)(r,$d,t)})(a);return(0,Pt.jsx)(Fd,(0,ut.A)({className:(0,ct.A)(l.root,r),ownerState:a,ref:t},i))}));function Ud(e){return(0,kt.Ay)("MuiDialogActions",e)}(0,Ot.A)("MuiDialogActions",["root","spacing"]);const Hd=["className","disableSpacing"],Vd=(0,vt.Ay)("div",{name:"MuiDialogActions",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,!n.disableSpacing&&t.spacing]}})((e=>{let{ownerState:t}=e;return(0,ut.A)({display:"flex",alignItems:"center",padding:8,justifyContent:"flex-end",flex:"0 0 auto"},!t.disableSpacing&&{"& > :not(:first-of-type)":{marginLeft:8}})})),qd=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiDialogActions"}),{className:r,disableSpacing:o=!1}=n,i=(0,st.A)(n,Hd),a=(0,ut.A)({},n,{disableSpacing:o}),l=(e=>{const{classes:t,disableSpacing:n}=e,r={root:["root",!n&&"spacing"]};return(0,yt.A)(r,Ud,t)})(a);return(0,Pt.jsx)(Vd,(0,ut.A)({className:(0,ct.A)(l.root,r),ownerState:a,ref:t},i))})),Xd=(0,Ya.A)((0,Pt.jsx)("path",{d:"M17.65 6.35C16.2 4.9 14.21 4 12 4c-4.42 0-7.99 3.58-7.99 8s3.57 8 7.99 8c3.73 0 6.84-2.55 7.73-6h-2.08c-.82 2.33-3.04 4-5.65 4-3.31 0-6-2.69-6-6s2.69-6 6-6c1.66 0 3.14.69 4.22 1.78L13 11h7V4l-2.35 2.35z"}),"Refresh"),Kd=(0,Ya.A)((0,Pt.jsx)("path",{d:"m17 7-1.41 1.41L18.17 11H8v2h10.17l-2.58 2.58L17 17l5-5zM4 5h8V3H4c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h8v-2H4V5z"}),"Logout"),Gd=(0,Ya.A)((0,Pt.jsx)("path",{d:"M12 12c2.21 0 4-1.79 4-4s-1.79-4-4-4-4 1.79-4 4 1.79 4 4 4zm0 2c-2.67 0-8 1.34-8 4v2h16v-2c0-2.66-5.33-4-8-4z"}),"Person"),Yd=(0,Ya.A)((0,Pt.jsx)("path",{d:"m16 6 2.29 2.29-4.88 4.88-4-4L2 16.59 3.41 18l6-6 4 4 6.3-6.29L22 12V6z"}),"TrendingUp"),Qd=(0,Ya.A)((0,Pt.jsx)("path",{d:"M20 2H4c-1.1 0-1.99.9-1.99 2L2 22l4-4h14c1.1 0 2-.9 2-2V4c0-1.1-.9-2-2-2zM6 9h12v2H6V9zm8 5H6v-2h8v2zm4-6H6V6h12v2z"}),"Chat"),Jd=(0,Ya.A)((0,Pt.jsx)("path",{d:"M12 4.5C7 4.5 2.73 7.61 1 12c1.73 4.39 6 7.5 11 7.5s9.27-3.11 11-7.5c-1.73-4.39-6-7.5-11-7.5zM12 17c-2.76 0-5-2.24-5-5s2.24-5 5-5 5 2.24 5 5-2.24 5-5 5zm0-8c-1.66 0-3 1.34-3 3s1.34 3 3 3 3-1.34 3-3-1.34-3-3-3z"}),"Visibility");const Zd=function(){const e=ee(),[n,r]=(0,t.useState)(""),[o,i]=(0,t.useState)(""),[a,l]=(0,t.useState)(""),[s,u]=(0,t.useState)(!1),[c,d]=(0,t.useState)(null),[f,p]=(0,t.useState)(!1),[h,m]=(0,t.useState)(0),[y,v]=(0,t.useState)(""),[g,b]=(0,t.useState)([]),[x,w]=(0,t.useState)(null),[S,A]=(0,t.useState)(!1),[O,k]=(0,t.useState)([]);t.useEffect((()=>{const t=sessionStorage.getItem("student_id");t?(r(t),E(t)):e("/student/login")}),[]);const j=async e=>{e.preventDefault(),p(!0),l("");try{const e=await fetch("/api/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({student_id:n,password:o})}),t=await e.json();t.success?(u(!0),E()):l(t.message||"Login failed")}catch(t){l("An error occurred during login")}finally{p(!1)}},E=async e=>{try{const t=await fetch("/api/student_portal",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({student_id:e})}),n=await t.json();n.profile&&(d(n.profile),k(n.recommendations||[]))}catch(t){console.error("Error fetching student data:",t),l("Failed to fetch student data")}},C=async()=>{if(!y.trim())return;const e={sender:"student",text:y,timestamp:(new Date).toISOString()};b([...g,e]),v("");try{const e=await fetch("/api/chat",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({message:y,student_id:n})}),t={sender:"bot",text:(await e.json()).message,timestamp:(new Date).toISOString()};b((e=>[...e,t]))}catch(t){console.error("Error sending message:",t),l("Failed to send message")}},P=()=>{w(null),A(!1)},M=e=>{switch(e.toLowerCase()){case"easy":return"#4caf50";case"medium":return"#ff9800";case"hard":return"#f44336";default:return"#757575"}};return s?(0,Pt.jsx)(mr,{maxWidth:"lg",children:(0,Pt.jsxs)(qt,{sx:{mt:4},children:[(0,Pt.jsxs)(qt,{sx:{display:"flex",justifyContent:"space-between",alignItems:"center",mb:3},children:[(0,Pt.jsx)(en,{variant:"h4",component:"h1",children:"Student Portal"}),(0,Pt.jsxs)(qt,{children:[(0,Pt.jsx)(qu,{title:"Refresh Data",children:(0,Pt.jsx)(ql,{onClick:E,sx:{mr:1},children:(0,Pt.jsx)(Xd,{})})}),(0,Pt.jsx)(qu,{title:"Logout",children:(0,Pt.jsx)(ql,{onClick:()=>{sessionStorage.removeItem("student_id"),u(!1),r(""),d(null),k([]),b([]),m(0),e("/student/login")},children:(0,Pt.jsx)(Kd,{})})})]})]}),(0,Pt.jsxs)(bc,{value:h,onChange:(e,t)=>{m(t)},sx:{mb:3},children:[(0,Pt.jsx)(kc,{icon:(0,Pt.jsx)(Gd,{}),label:"Profile"}),(0,Pt.jsx)(kc,{icon:(0,Pt.jsx)(Yd,{}),label:"Recommendations"}),(0,Pt.jsx)(kc,{icon:(0,Pt.jsx)(Qd,{}),label:"Chat"})]}),0===h&&c&&(0,Pt.jsxs)(Dt,{container:!0,spacing:3,children:[(0,Pt.jsx)(Dt,{item:!0,xs:12,md:6,children:(0,Pt.jsx)(Pc,{children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{variant:"h6",gutterBottom:!0,children:"Personal Information"}),(0,Pt.jsxs)(en,{variant:"body1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Student ID:"})," ",c.Student_ID]}),(0,Pt.jsxs)(en,{variant:"body1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Name:"})," ",c.Name]}),(0,Pt.jsxs)(en,{variant:"body1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Department:"})," ",c.Department]}),(0,Pt.jsxs)(en,{variant:"body1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"CGPA:"})," ",c.CGPA]})]})})}),(0,Pt.jsx)(Dt,{item:!0,xs:12,md:6,children:(0,Pt.jsx)(Pc,{children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{variant:"h6",gutterBottom:!0,children:"Completed Courses"}),(0,Pt.jsx)(Lc,{children:(0,Pt.jsxs)(Uc,{size:"small",children:[(0,Pt.jsx)(Yc,{children:(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:"Course Code"}),(0,Pt.jsx)(ud,{children:"Course Name"})]})}),(0,Pt.jsx)(md,{children:c.Completed_Courses.map(((e,t)=>(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:e.Course_Code}),(0,Pt.jsx)(ud,{children:e.Course_Name})]},t)))})]})})]})})})]}),1===h&&(0,Pt.jsx)(Lc,{component:sn,children:(0,Pt.jsxs)(Uc,{children:[(0,Pt.jsx)(Yc,{children:(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:"Course Code"}),(0,Pt.jsx)(ud,{children:"Course Name"}),(0,Pt.jsx)(ud,{children:"Department"}),(0,Pt.jsx)(ud,{children:"Difficulty"}),(0,Pt.jsx)(ud,{children:"Match Score"}),(0,Pt.jsx)(ud,{children:"Actions"})]})}),(0,Pt.jsx)(md,{children:O.map((e=>{return(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:e.Course_Code}),(0,Pt.jsx)(ud,{children:e.Course_Name}),(0,Pt.jsx)(ud,{children:e.Department}),(0,Pt.jsx)(ud,{children:(0,Pt.jsx)(Od,{label:e.Difficulty,size:"small",sx:{backgroundColor:M(e.Difficulty),color:"white"}})}),(0,Pt.jsx)(ud,{children:(0,Pt.jsx)(Od,{label:`${(100*e.Match_Score).toFixed(0)}%`,size:"small",sx:{backgroundColor:(t=e.Match_Score,t>=.8?"#4caf50":t>=.6?"#ff9800":"#f44336"),color:"white"}})}),(0,Pt.jsx)(ud,{children:(0,Pt.jsx)(qu,{title:"View Details",children:(0,Pt.jsx)(ql,{size:"small",onClick:()=>(e=>{w(e),A(!0)})(e),children:(0,Pt.jsx)(Jd,{})})})})]},e.Course_Code);var t}))})]})}),2===h&&(0,Pt.jsxs)(Dt,{container:!0,spacing:3,children:[(0,Pt.jsx)(Dt,{item:!0,xs:12,children:(0,Pt.jsx)(sn,{sx:{p:2,height:"400px",overflow:"auto"},children:g.map(((e,t)=>(0,Pt.jsx)(qt,{sx:{display:"flex",justifyContent:"student"===e.sender?"flex-end":"flex-start",mb:2},children:(0,Pt.jsx)(sn,{sx:{p:2,maxWidth:"70%",backgroundColor:"student"===e.sender?"primary.main":"grey.100",color:"student"===e.sender?"white":"text.primary"},children:(0,Pt.jsx)(en,{variant:"body1",children:e.text})})},t)))})}),(0,Pt.jsx)(Dt,{item:!0,xs:12,children:(0,Pt.jsxs)(qt,{sx:{display:"flex",gap:1},children:[(0,Pt.jsx)(cl,{fullWidth:!0,value:y,onChange:e=>v(e.target.value),placeholder:"Type your message...",onKeyPress:e=>{"Enter"===e.key&&C()}}),(0,Pt.jsx)(or,{variant:"contained",onClick:C,disabled:!y.trim(),children:"Send"})]})})]}),(0,Pt.jsx)(Rd,{open:S,onClose:P,maxWidth:"md",fullWidth:!0,children:x&&(0,Pt.jsxs)(Pt.Fragment,{children:[(0,Pt.jsx)(zd,{children:"Course Details"}),(0,Pt.jsx)(Wd,{children:(0,Pt.jsxs)(Dt,{container:!0,spacing:2,sx:{mt:1},children:[(0,Pt.jsxs)(Dt,{item:!0,xs:12,sm:6,children:[(0,Pt.jsxs)(en,{variant:"subtitle1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Course Code:"})," ",x.Course_Code]}),(0,Pt.jsxs)(en,{variant:"subtitle1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Course Name:"})," ",x.Course_Name]}),(0,Pt.jsxs)(en,{variant:"subtitle1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Department:"})," ",x.Department]})]}),(0,Pt.jsxs)(Dt,{item:!0,xs:12,sm:6,children:[(0,Pt.jsxs)(en,{variant:"subtitle1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Credit Hours:"})," ",x.Credit_Hours]}),(0,Pt.jsxs)(en,{variant:"subtitle1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Difficulty:"})," ",x.Difficulty]}),(0,Pt.jsxs)(en,{variant:"subtitle1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Prerequisites:"})," ",x.Prerequisites]}),(0,Pt.jsxs)(en,{variant:"subtitle1",gutterBottom:!0,children:[(0,Pt.jsx)("strong",{children:"Match Score:"})," ",(100*x.Match_Score).toFixed(0),"%"]})]})]})}),(0,Pt.jsx)(qd,{children:(0,Pt.jsx)(or,{onClick:P,children:"Close"})})]})}),(0,Pt.jsx)(zl,{open:!!a,autoHideDuration:6e3,onClose:()=>l(""),children:(0,Pt.jsx)(is,{severity:"error",onClose:()=>l(""),children:a})})]})}):(0,Pt.jsxs)(mr,{maxWidth:"sm",children:[(0,Pt.jsx)(qt,{sx:{mt:8,display:"flex",flexDirection:"column",alignItems:"center"},children:(0,Pt.jsxs)(sn,{elevation:3,sx:{p:4,width:"100%"},children:[(0,Pt.jsx)(en,{component:"h1",variant:"h5",align:"center",gutterBottom:!0,children:"Student Login"}),(0,Pt.jsxs)("form",{onSubmit:j,children:[(0,Pt.jsx)(cl,{margin:"normal",required:!0,fullWidth:!0,label:"Student ID",value:n,onChange:e=>r(e.target.value)}),(0,Pt.jsx)(cl,{margin:"normal",required:!0,fullWidth:!0,label:"Password",type:"password",value:o,onChange:e=>i(e.target.value)}),(0,Pt.jsx)(or,{type:"submit",fullWidth:!0,variant:"contained",sx:{mt:3,mb:2},disabled:f,children:f?(0,Pt.jsx)(kl,{size:24}):"Login"})]})]})}),(0,Pt.jsx)(zl,{open:!!a,autoHideDuration:6e3,onClose:()=>l(""),children:(0,Pt.jsx)(is,{severity:"error",onClose:()=>l(""),children:a})})]})};var ef=n(8094),tf=n(6300),nf=n(7991),rf=n(7912),of=n(1702),af=n(8625),lf=n(9889),sf=n.n(lf),uf=n(620),cf=n.n(uf),df=n(5268),ff=n.n(df),pf=n(3097),hf=n.n(pf),mf=n(9160),yf=n.n(mf),vf=function(e){return 0===e?0:e>0?1:-1},gf=function(e){return cf()(e)&&e.indexOf("%")===e.length-1},bf=function(e){return yf()(e)&&!ff()(e)},xf=function(e){return bf(e)||cf()(e)},wf=0,Sf=function(e){var t=++wf;return"".concat(e||"").concat(t)},Af=function(e,t){var n,r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,o=arguments.length>3&&void 0!==arguments[3]&&arguments[3];if(!bf(e)&&!cf()(e))return r;if(gf(e)){var i=e.indexOf("%");n=t*parseFloat(e.slice(0,i))/100}else n=+e;return ff()(n)&&(n=r),o&&n>t&&(n=t),n},Of=function(e){if(!e)return null;var t=Object.keys(e);return t&&t.length?e[t[0]]:null},kf=function(e,t){return bf(e)&&bf(t)?function(n){return e+n*(t-e)}:function(){return t}};function jf(e,t,n){return e&&e.length?e.find((function(e){return e&&("function"===typeof t?t(e):hf()(e,t))===n})):null}var Ef=function(e,t){return bf(e)&&bf(t)?e-t:cf()(e)&&cf()(t)?e.localeCompare(t):e instanceof Date&&t instanceof Date?e.getTime()-t.getTime():String(e).localeCompare(String(t))},Cf=function(e,t){for(var n=arguments.length,r=new Array(n>2?n-2:0),o=2;o<n;o++)r[o-2]=arguments[o]},Pf=n(9686),Mf=n.n(Pf),Tf=n(1629),_f=n.n(Tf),Rf=n(6686),Nf=n.n(Rf),If=n(9062);function Df(e,t){for(var n in e)if({}.hasOwnProperty.call(e,n)&&(!{}.hasOwnProperty.call(t,n)||e[n]!==t[n]))return!1;for(var r in t)if({}.hasOwnProperty.call(t,r)&&!{}.hasOwnProperty.call(e,r))return!1;return!0}function Lf(e){return Lf="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Lf(e)}var zf=["aria-activedescendant","aria-atomic","aria-autocomplete","aria-busy","aria-checked","aria-colcount","aria-colindex","aria-colspan","aria-controls","aria-current","aria-describedby","aria-details","aria-disabled","aria-errormessage","aria-expanded","aria-flowto","aria-haspopup","aria-hidden","aria-invalid","aria-keyshortcuts","aria-label","aria-labelledby","aria-level","aria-live","aria-modal","aria-multiline","aria-multiselectable","aria-orientation","aria-owns","aria-placeholder","aria-posinset","aria-pressed","aria-readonly","aria-relevant","aria-required","aria-roledescription","aria-rowcount","aria-rowindex","aria-rowspan","aria-selected","aria-setsize","aria-sort","aria-valuemax","aria-valuemin","aria-valuenow","aria-valuetext","className","color","height","id","lang","max","media","method","min","name","style","target","width","role","tabIndex","accentHeight","accumulate","additive","alignmentBaseline","allowReorder","alphabetic","amplitude","arabicForm","ascent","attributeName","attributeType","autoReverse","azimuth","baseFrequency","baselineShift","baseProfile","bbox","begin","bias","by","calcMode","capHeight","clip","clipPath","clipPathUnits","clipRule","colorInterpolation","colorInterpolationFilters","colorProfile","colorRendering","contentScriptType","contentStyleType","cursor","cx","cy","d","decelerate","descent","diffuseConstant","direction","display","divisor","dominantBaseline","dur","dx","dy","edgeMode","elevation","enableBackground","end","exponent","externalResourcesRequired","fill","fillOpacity","fillRule","filter","filterRes","filterUnits","floodColor","floodOpacity","focusable","fontFamily","fontSize","fontSizeAdjust","fontStretch","fontStyle","fontVariant","fontWeight","format","from","fx","fy","g1","g2","glyphName","glyphOrientationHorizontal","glyphOrientationVertical","glyphRef","gradientTransform","gradientUnits","hanging","horizAdvX","horizOriginX","href","ideographic","imageRendering","in2","in","intercept","k1","k2","k3","k4","k","kernelMatrix","kernelUnitLength","kerning","keyPoints","keySplines","keyTimes","lengthAdjust","letterSpacing","lightingColor","limitingConeAngle","local","markerEnd","markerHeight","markerMid","markerStart","markerUnits","markerWidth","mask","maskContentUnits","maskUnits","mathematical","mode","numOctaves","offset","opacity","operator","order","orient","orientation","origin","overflow","overlinePosition","overlineThickness","paintOrder","panose1","pathLength","patternContentUnits","patternTransform","patternUnits","pointerEvents","pointsAtX","pointsAtY","pointsAtZ","preserveAlpha","preserveAspectRatio","primitiveUnits","r","radius","refX","refY","renderingIntent","repeatCount","repeatDur","requiredExtensions","requiredFeatures","restart","result","rotate","rx","ry","seed","shapeRendering","slope","spacing","specularConstant","specularExponent","speed","spreadMethod","startOffset","stdDeviation","stemh","stemv","stitchTiles","stopColor","stopOpacity","strikethroughPosition","strikethroughThickness","string","stroke","strokeDasharray","strokeDashoffset","strokeLinecap","strokeLinejoin","strokeMiterlimit","strokeOpacity","strokeWidth","surfaceScale","systemLanguage","tableValues","targetX","targetY","textAnchor","textDecoration","textLength","textRendering","to","transform","u1","u2","underlinePosition","underlineThickness","unicode","unicodeBidi","unicodeRange","unitsPerEm","vAlphabetic","values","vectorEffect","version","vertAdvY","vertOriginX","vertOriginY","vHanging","vIdeographic","viewTarget","visibility","vMathematical","widths","wordSpacing","writingMode","x1","x2","x","xChannelSelector","xHeight","xlinkActuate","xlinkArcrole","xlinkHref","xlinkRole","xlinkShow","xlinkTitle","xlinkType","xmlBase","xmlLang","xmlns","xmlnsXlink","xmlSpace","y1","y2","y","yChannelSelector","z","zoomAndPan","ref","key","angle"],$f=["points","pathLength"],Bf={svg:["viewBox","children"],polygon:$f,polyline:$f},Ff=["dangerouslySetInnerHTML","onCopy","onCopyCapture","onCut","onCutCapture","onPaste","onPasteCapture","onCompositionEnd","onCompositionEndCapture","onCompositionStart","onCompositionStartCapture","onCompositionUpdate","onCompositionUpdateCapture","onFocus","onFocusCapture","onBlur","onBlurCapture","onChange","onChangeCapture","onBeforeInput","onBeforeInputCapture","onInput","onInputCapture","onReset","onResetCapture","onSubmit","onSubmitCapture","onInvalid","onInvalidCapture","onLoad","onLoadCapture","onError","onErrorCapture","onKeyDown","onKeyDownCapture","onKeyPress","onKeyPressCapture","onKeyUp","onKeyUpCapture","onAbort","onAbortCapture","onCanPlay","onCanPlayCapture","onCanPlayThrough","onCanPlayThroughCapture","onDurationChange","onDurationChangeCapture","onEmptied","onEmptiedCapture","onEncrypted","onEncryptedCapture","onEnded","onEndedCapture","onLoadedData","onLoadedDataCapture","onLoadedMetadata","onLoadedMetadataCapture","onLoadStart","onLoadStartCapture","onPause","onPauseCapture","onPlay","onPlayCapture","onPlaying","onPlayingCapture","onProgress","onProgressCapture","onRateChange","onRateChangeCapture","onSeeked","onSeekedCapture","onSeeking","onSeekingCapture","onStalled","onStalledCapture","onSuspend","onSuspendCapture","onTimeUpdate","onTimeUpdateCapture","onVolumeChange","onVolumeChangeCapture","onWaiting","onWaitingCapture","onAuxClick","onAuxClickCapture","onClick","onClickCapture","onContextMenu","onContextMenuCapture","onDoubleClick","onDoubleClickCapture","onDrag","onDragCapture","onDragEnd","onDragEndCapture","onDragEnter","onDragEnterCapture","onDragExit","onDragExitCapture","onDragLeave","onDragLeaveCapture","onDragOver","onDragOverCapture","onDragStart","onDragStartCapture","onDrop","onDropCapture","onMouseDown","onMouseDownCapture","onMouseEnter","onMouseLeave","onMouseMove","onMouseMoveCapture","onMouseOut","onMouseOutCapture","onMouseOver","onMouseOverCapture","onMouseUp","onMouseUpCapture","onSelect","onSelectCapture","onTouchCancel","onTouchCancelCapture","onTouchEnd","onTouchEndCapture","onTouchMove","onTouchMoveCapture","onTouchStart","onTouchStartCapture","onPointerDown","onPointerDownCapture","onPointerMove","onPointerMoveCapture","onPointerUp","onPointerUpCapture","onPointerCancel","onPointerCancelCapture","onPointerEnter","onPointerEnterCapture","onPointerLeave","onPointerLeaveCapture","onPointerOver","onPointerOverCapture","onPointerOut","onPointerOutCapture","onGotPointerCapture","onGotPointerCaptureCapture","onLostPointerCapture","onLostPointerCaptureCapture","onScroll","onScrollCapture","onWheel","onWheelCapture","onAnimationStart","onAnimationStartCapture","onAnimationEnd","onAnimationEndCapture","onAnimationIteration","onAnimationIterationCapture","onTransitionEnd","onTransitionEndCapture"],Wf=function(e,n){if(!e||"function"===typeof e||"boolean"===typeof e)return null;var r=e;if((0,t.isValidElement)(e)&&(r=e.props),!Nf()(r))return null;var o={};return Object.keys(r).forEach((function(e){Ff.includes(e)&&(o[e]=n||function(t){return r[e](r,t)})})),o},Uf=function(e,t,n){if(!Nf()(e)||"object"!==Lf(e))return null;var r=null;return Object.keys(e).forEach((function(o){var i=e[o];Ff.includes(o)&&"function"===typeof i&&(r||(r={}),r[o]=function(e,t,n){return function(r){return e(t,n,r),null}}(i,t,n))})),r},Hf=["children"],Vf=["children"];function qf(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var Xf={click:"onClick",mousedown:"onMouseDown",mouseup:"onMouseUp",mouseover:"onMouseOver",mousemove:"onMouseMove",mouseout:"onMouseOut",mouseenter:"onMouseEnter",mouseleave:"onMouseLeave",touchcancel:"onTouchCancel",touchend:"onTouchEnd",touchmove:"onTouchMove",touchstart:"onTouchStart",contextmenu:"onContextMenu",dblclick:"onDoubleClick"},Kf=function(e){return"string"===typeof e?e:e?e.displayName||e.name||"Component":""},Gf=null,Yf=null,Qf=function e(n){if(n===Gf&&Array.isArray(Yf))return Yf;var r=[];return t.Children.forEach(n,(function(t){Mf()(t)||((0,If.isFragment)(t)?r=r.concat(e(t.props.children)):r.push(t))})),Yf=r,Gf=n,r};function Jf(e,t){var n=[],r=[];return r=Array.isArray(t)?t.map((function(e){return Kf(e)})):[Kf(t)],Qf(e).forEach((function(e){var t=hf()(e,"type.displayName")||hf()(e,"type.name");-1!==r.indexOf(t)&&n.push(e)})),n}function Zf(e,t){var n=Jf(e,t);return n&&n[0]}var ep=function(e){if(!e||!e.props)return!1;var t=e.props,n=t.width,r=t.height;return!(!bf(n)||n<=0||!bf(r)||r<=0)},tp=["a","altGlyph","altGlyphDef","altGlyphItem","animate","animateColor","animateMotion","animateTransform","circle","clipPath","color-profile","cursor","defs","desc","ellipse","feBlend","feColormatrix","feComponentTransfer","feComposite","feConvolveMatrix","feDiffuseLighting","feDisplacementMap","feDistantLight","feFlood","feFuncA","feFuncB","feFuncG","feFuncR","feGaussianBlur","feImage","feMerge","feMergeNode","feMorphology","feOffset","fePointLight","feSpecularLighting","feSpotLight","feTile","feTurbulence","filter","font","font-face","font-face-format","font-face-name","font-face-url","foreignObject","g","glyph","glyphRef","hkern","image","line","lineGradient","marker","mask","metadata","missing-glyph","mpath","path","pattern","polygon","polyline","radialGradient","rect","script","set","stop","style","svg","switch","symbol","text","textPath","title","tref","tspan","use","view","vkern"],np=function(e){return e&&e.type&&cf()(e.type)&&tp.indexOf(e.type)>=0},rp=function(e,n,r){if(!e||"function"===typeof e||"boolean"===typeof e)return null;var o=e;if((0,t.isValidElement)(e)&&(o=e.props),!Nf()(o))return null;var i={};return Object.keys(o).forEach((function(e){var t;(function(e,t,n,r){var o,i=null!==(o=null===Bf||void 0===Bf?void 0:Bf[r])&&void 0!==o?o:[];return t.startsWith("data-")||!_f()(e)&&(r&&i.includes(t)||zf.includes(t))||n&&Ff.includes(t)})(null===(t=o)||void 0===t?void 0:t[e],e,n,r)&&(i[e]=o[e])})),i},op=function e(n,r){if(n===r)return!0;var o=t.Children.count(n);if(o!==t.Children.count(r))return!1;if(0===o)return!0;if(1===o)return ip(Array.isArray(n)?n[0]:n,Array.isArray(r)?r[0]:r);for(var i=0;i<o;i++){var a=n[i],l=r[i];if(Array.isArray(a)||Array.isArray(l)){if(!e(a,l))return!1}else if(!ip(a,l))return!1}return!0},ip=function(e,t){if(Mf()(e)&&Mf()(t))return!0;if(!Mf()(e)&&!Mf()(t)){var n=e.props||{},r=n.children,o=qf(n,Hf),i=t.props||{},a=i.children,l=qf(i,Vf);return r&&a?Df(o,l)&&op(r,a):!r&&!a&&Df(o,l)}return!1},ap=function(e,t){var n=[],r={};return Qf(e).forEach((function(e,o){if(np(e))n.push(e);else if(e){var i=Kf(e.type),a=t[i]||{},l=a.handler,s=a.once;if(l&&(!s||!r[i])){var u=l(e,i,o);n.push(u),r[i]=!0}}})),n};function lp(e){return lp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},lp(e)}function sp(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function up(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?sp(Object(n),!0).forEach((function(t){cp(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):sp(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function cp(e,t,n){return t=function(e){var t=function(e,t){if("object"!=lp(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=lp(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==lp(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function dp(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return fp(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return fp(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function fp(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var pp=(0,t.forwardRef)((function(e,n){var r=e.aspect,o=e.initialDimension,i=void 0===o?{width:-1,height:-1}:o,a=e.width,l=void 0===a?"100%":a,s=e.height,u=void 0===s?"100%":s,c=e.minWidth,d=void 0===c?0:c,f=e.minHeight,p=e.maxHeight,h=e.children,m=e.debounce,y=void 0===m?0:m,v=e.id,g=e.className,b=e.onResize,x=e.style,w=void 0===x?{}:x,S=(0,t.useRef)(null),A=(0,t.useRef)();A.current=b,(0,t.useImperativeHandle)(n,(function(){return Object.defineProperty(S.current,"current",{get:function(){return console.warn("The usage of ref.current.current is deprecated and will no longer be supported."),S.current},configurable:!0})}));var O=dp((0,t.useState)({containerWidth:i.width,containerHeight:i.height}),2),k=O[0],j=O[1],E=(0,t.useCallback)((function(e,t){j((function(n){var r=Math.round(e),o=Math.round(t);return n.containerWidth===r&&n.containerHeight===o?n:{containerWidth:r,containerHeight:o}}))}),[]);(0,t.useEffect)((function(){var e=function(e){var t,n=e[0].contentRect,r=n.width,o=n.height;E(r,o),null===(t=A.current)||void 0===t||t.call(A,r,o)};y>0&&(e=sf()(e,y,{trailing:!0,leading:!1}));var t=new ResizeObserver(e),n=S.current.getBoundingClientRect(),r=n.width,o=n.height;return E(r,o),t.observe(S.current),function(){t.disconnect()}}),[E,y]);var C=(0,t.useMemo)((function(){var e=k.containerWidth,n=k.containerHeight;if(e<0||n<0)return null;Cf(gf(l)||gf(u),"The width(%s) and height(%s) are both fixed numbers,\n       maybe you don't need to use a ResponsiveContainer.",l,u),Cf(!r||r>0,"The aspect(%s) must be greater than zero.",r);var o=gf(l)?e:l,i=gf(u)?n:u;r&&r>0&&(o?i=o/r:i&&(o=i*r),p&&i>p&&(i=p)),Cf(o>0||i>0,"The width(%s) and height(%s) of chart should be greater than 0,\n       please check the style of container, or the props width(%s) and height(%s),\n       or add a minWidth(%s) or minHeight(%s) or use aspect(%s) to control the\n       height and width.",o,i,l,u,d,f,r);var a=!Array.isArray(h)&&Kf(h.type).endsWith("Chart");return t.Children.map(h,(function(e){return t.isValidElement(e)?(0,t.cloneElement)(e,up({width:o,height:i},a?{style:up({height:"100%",width:"100%",maxHeight:i,maxWidth:o},e.props.style)}:{})):e}))}),[r,h,u,p,f,d,k,l]);return t.createElement("div",{id:v?"".concat(v):void 0,className:zt("recharts-responsive-container",g),style:up(up({},w),{},{width:l,height:u,minWidth:d,minHeight:f,maxHeight:p}),ref:S},C)})),hp=n(6604),mp=n.n(hp),yp=n(7424),vp=n.n(yp),gp="Invariant failed";function bp(e,t){if(!e)throw new Error(gp)}var xp=["children","width","height","viewBox","className","style","title","desc"];function wp(){return wp=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},wp.apply(this,arguments)}function Sp(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Ap(e){var n=e.children,r=e.width,o=e.height,i=e.viewBox,a=e.className,l=e.style,s=e.title,u=e.desc,c=Sp(e,xp),d=i||{width:r,height:o,x:0,y:0},f=zt("recharts-surface",a);return t.createElement("svg",wp({},rp(c,!0,"svg"),{className:f,width:r,height:o,style:l,viewBox:"".concat(d.x," ").concat(d.y," ").concat(d.width," ").concat(d.height)}),t.createElement("title",null,s),t.createElement("desc",null,u),n)}var Op=["children","className"];function kp(){return kp=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},kp.apply(this,arguments)}function jp(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var Ep=t.forwardRef((function(e,n){var r=e.children,o=e.className,i=jp(e,Op),a=zt("recharts-layer",o);return t.createElement("g",kp({className:a},rp(i,!0),{ref:n}),r)}));function Cp(e){return Cp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Cp(e)}function Pp(){return Pp=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Pp.apply(this,arguments)}function Mp(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return Tp(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Tp(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Tp(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function _p(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Rp(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?_p(Object(n),!0).forEach((function(t){Np(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):_p(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function Np(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Cp(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Cp(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Cp(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Ip(e){return Array.isArray(e)&&xf(e[0])&&xf(e[1])?e.join(" ~ "):e}var Dp=function(e){var n=e.separator,r=void 0===n?" : ":n,o=e.contentStyle,i=void 0===o?{}:o,a=e.itemStyle,l=void 0===a?{}:a,s=e.labelStyle,u=void 0===s?{}:s,c=e.payload,d=e.formatter,f=e.itemSorter,p=e.wrapperClassName,h=e.labelClassName,m=e.label,y=e.labelFormatter,v=e.accessibilityLayer,g=void 0!==v&&v,b=Rp({margin:0,padding:10,backgroundColor:"#fff",border:"1px solid #ccc",whiteSpace:"nowrap"},i),x=Rp({margin:0},u),w=!Mf()(m),S=w?m:"",A=zt("recharts-default-tooltip",p),O=zt("recharts-tooltip-label",h);w&&y&&void 0!==c&&null!==c&&(S=y(m,c));var k=g?{role:"status","aria-live":"assertive"}:{};return t.createElement("div",Pp({className:A,style:b},k),t.createElement("p",{className:O,style:x},t.isValidElement(S)?S:"".concat(S)),function(){if(c&&c.length){var e=(f?vp()(c,f):c).map((function(e,n){if("none"===e.type)return null;var o=Rp({display:"block",paddingTop:4,paddingBottom:4,color:e.color||"#000"},l),i=e.formatter||d||Ip,a=e.value,s=e.name,u=a,f=s;if(i&&null!=u&&null!=f){var p=i(a,s,e,n,c);if(Array.isArray(p)){var h=Mp(p,2);u=h[0],f=h[1]}else u=p}return t.createElement("li",{className:"recharts-tooltip-item",key:"tooltip-item-".concat(n),style:o},xf(f)?t.createElement("span",{className:"recharts-tooltip-item-name"},f):null,xf(f)?t.createElement("span",{className:"recharts-tooltip-item-separator"},r):null,t.createElement("span",{className:"recharts-tooltip-item-value"},u),t.createElement("span",{className:"recharts-tooltip-item-unit"},e.unit||""))}));return t.createElement("ul",{className:"recharts-tooltip-item-list",style:{padding:0,margin:0}},e)}return null}())};function Lp(e){return Lp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Lp(e)}function zp(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Lp(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Lp(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Lp(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var $p="recharts-tooltip-wrapper",Bp={visibility:"hidden"};function Fp(e){var t=e.coordinate,n=e.translateX,r=e.translateY;return zt($p,zp(zp(zp(zp({},"".concat($p,"-right"),bf(n)&&t&&bf(t.x)&&n>=t.x),"".concat($p,"-left"),bf(n)&&t&&bf(t.x)&&n<t.x),"".concat($p,"-bottom"),bf(r)&&t&&bf(t.y)&&r>=t.y),"".concat($p,"-top"),bf(r)&&t&&bf(t.y)&&r<t.y))}function Wp(e){var t=e.allowEscapeViewBox,n=e.coordinate,r=e.key,o=e.offsetTopLeft,i=e.position,a=e.reverseDirection,l=e.tooltipDimension,s=e.viewBox,u=e.viewBoxDimension;if(i&&bf(i[r]))return i[r];var c=n[r]-l-o,d=n[r]+o;return t[r]?a[r]?c:d:a[r]?c<s[r]?Math.max(d,s[r]):Math.max(c,s[r]):d+l>s[r]+u?Math.max(c,s[r]):Math.max(d,s[r])}function Up(e){return Up="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Up(e)}function Hp(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Vp(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Hp(Object(n),!0).forEach((function(t){Qp(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Hp(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function qp(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Jp(r.key),r)}}function Xp(e,t,n){return t=Gp(t),function(e,t){if(t&&("object"===Up(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,Kp()?Reflect.construct(t,n||[],Gp(e).constructor):t.apply(e,n))}function Kp(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(Kp=function(){return!!e})()}function Gp(e){return Gp=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},Gp(e)}function Yp(e,t){return Yp=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},Yp(e,t)}function Qp(e,t,n){return(t=Jp(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Jp(e){var t=function(e,t){if("object"!=Up(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Up(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Up(t)?t:t+""}var Zp=function(e){function n(){var e;!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n);for(var t=arguments.length,r=new Array(t),o=0;o<t;o++)r[o]=arguments[o];return Qp(e=Xp(this,n,[].concat(r)),"state",{dismissed:!1,dismissedAtCoordinate:{x:0,y:0},lastBoundingBox:{width:-1,height:-1}}),Qp(e,"handleKeyDown",(function(t){var n,r,o,i;"Escape"===t.key&&e.setState({dismissed:!0,dismissedAtCoordinate:{x:null!==(n=null===(r=e.props.coordinate)||void 0===r?void 0:r.x)&&void 0!==n?n:0,y:null!==(o=null===(i=e.props.coordinate)||void 0===i?void 0:i.y)&&void 0!==o?o:0}})})),e}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&Yp(e,t)}(n,e),r=n,o=[{key:"updateBBox",value:function(){if(this.wrapperNode&&this.wrapperNode.getBoundingClientRect){var e=this.wrapperNode.getBoundingClientRect();(Math.abs(e.width-this.state.lastBoundingBox.width)>1||Math.abs(e.height-this.state.lastBoundingBox.height)>1)&&this.setState({lastBoundingBox:{width:e.width,height:e.height}})}else-1===this.state.lastBoundingBox.width&&-1===this.state.lastBoundingBox.height||this.setState({lastBoundingBox:{width:-1,height:-1}})}},{key:"componentDidMount",value:function(){document.addEventListener("keydown",this.handleKeyDown),this.updateBBox()}},{key:"componentWillUnmount",value:function(){document.removeEventListener("keydown",this.handleKeyDown)}},{key:"componentDidUpdate",value:function(){var e,t;this.props.active&&this.updateBBox(),this.state.dismissed&&((null===(e=this.props.coordinate)||void 0===e?void 0:e.x)===this.state.dismissedAtCoordinate.x&&(null===(t=this.props.coordinate)||void 0===t?void 0:t.y)===this.state.dismissedAtCoordinate.y||(this.state.dismissed=!1))}},{key:"render",value:function(){var e=this,n=this.props,r=n.active,o=n.allowEscapeViewBox,i=n.animationDuration,a=n.animationEasing,l=n.children,s=n.coordinate,u=n.hasPayload,c=n.isAnimationActive,d=n.offset,f=n.position,p=n.reverseDirection,h=n.useTranslate3d,m=n.viewBox,y=n.wrapperStyle,v=function(e){var t,n,r=e.allowEscapeViewBox,o=e.coordinate,i=e.offsetTopLeft,a=e.position,l=e.reverseDirection,s=e.tooltipBox,u=e.useTranslate3d,c=e.viewBox;return{cssProperties:s.height>0&&s.width>0&&o?function(e){var t=e.translateX,n=e.translateY;return{transform:e.useTranslate3d?"translate3d(".concat(t,"px, ").concat(n,"px, 0)"):"translate(".concat(t,"px, ").concat(n,"px)")}}({translateX:t=Wp({allowEscapeViewBox:r,coordinate:o,key:"x",offsetTopLeft:i,position:a,reverseDirection:l,tooltipDimension:s.width,viewBox:c,viewBoxDimension:c.width}),translateY:n=Wp({allowEscapeViewBox:r,coordinate:o,key:"y",offsetTopLeft:i,position:a,reverseDirection:l,tooltipDimension:s.height,viewBox:c,viewBoxDimension:c.height}),useTranslate3d:u}):Bp,cssClasses:Fp({translateX:t,translateY:n,coordinate:o})}}({allowEscapeViewBox:o,coordinate:s,offsetTopLeft:d,position:f,reverseDirection:p,tooltipBox:this.state.lastBoundingBox,useTranslate3d:h,viewBox:m}),g=v.cssClasses,b=v.cssProperties,x=Vp(Vp({transition:c&&r?"transform ".concat(i,"ms ").concat(a):void 0},b),{},{pointerEvents:"none",visibility:!this.state.dismissed&&r&&u?"visible":"hidden",position:"absolute",top:0,left:0},y);return t.createElement("div",{tabIndex:-1,className:g,style:x,ref:function(t){e.wrapperNode=t}},l)}}],o&&qp(r.prototype,o),i&&qp(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent),eh={isSsr:!("undefined"!==typeof window&&window.document&&window.document.createElement&&window.setTimeout),get:function(e){return eh[e]},set:function(e,t){if("string"===typeof e)eh[e]=t;else{var n=Object.keys(e);n&&n.length&&n.forEach((function(t){eh[t]=e[t]}))}}},th=n(977),nh=n.n(th);function rh(e,t,n){return!0===t?nh()(e,n):_f()(t)?nh()(e,t):e}function oh(e){return oh="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},oh(e)}function ih(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function ah(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?ih(Object(n),!0).forEach((function(t){fh(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ih(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function lh(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,ph(r.key),r)}}function sh(e,t,n){return t=ch(t),function(e,t){if(t&&("object"===oh(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,uh()?Reflect.construct(t,n||[],ch(e).constructor):t.apply(e,n))}function uh(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(uh=function(){return!!e})()}function ch(e){return ch=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},ch(e)}function dh(e,t){return dh=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},dh(e,t)}function fh(e,t,n){return(t=ph(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ph(e){var t=function(e,t){if("object"!=oh(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=oh(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==oh(t)?t:t+""}function hh(e){return e.dataKey}var mh=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),sh(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&dh(e,t)}(n,e),r=n,o=[{key:"render",value:function(){var e=this,n=this.props,r=n.active,o=n.allowEscapeViewBox,i=n.animationDuration,a=n.animationEasing,l=n.content,s=n.coordinate,u=n.filterNull,c=n.isAnimationActive,d=n.offset,f=n.payload,p=n.payloadUniqBy,h=n.position,m=n.reverseDirection,y=n.useTranslate3d,v=n.viewBox,g=n.wrapperStyle,b=null!==f&&void 0!==f?f:[];u&&b.length&&(b=rh(f.filter((function(t){return null!=t.value&&(!0!==t.hide||e.props.includeHidden)})),p,hh));var x=b.length>0;return t.createElement(Zp,{allowEscapeViewBox:o,animationDuration:i,animationEasing:a,isAnimationActive:c,active:r,coordinate:s,hasPayload:x,offset:d,position:h,reverseDirection:m,useTranslate3d:y,viewBox:v,wrapperStyle:g},function(e,n){return t.isValidElement(e)?t.cloneElement(e,n):"function"===typeof e?t.createElement(e,n):t.createElement(Dp,n)}(l,ah(ah({},this.props),{},{payload:b})))}}],o&&lh(r.prototype,o),i&&lh(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);fh(mh,"displayName","Tooltip"),fh(mh,"defaultProps",{accessibilityLayer:!1,allowEscapeViewBox:{x:!1,y:!1},animationDuration:400,animationEasing:"ease",contentStyle:{},coordinate:{x:0,y:0},cursor:!0,cursorStyle:{},filterNull:!0,isAnimationActive:!eh.isSsr,itemStyle:{},labelStyle:{},offset:10,reverseDirection:{x:!1,y:!1},separator:" : ",trigger:"hover",useTranslate3d:!1,viewBox:{x:0,y:0,height:0,width:0},wrapperStyle:{}});var yh=n(643),vh=n.n(yh);Math.abs,Math.atan2;const gh=Math.cos,bh=(Math.max,Math.min,Math.sin),xh=Math.sqrt,wh=Math.PI,Sh=2*wh;const Ah={draw(e,t){const n=xh(t/wh);e.moveTo(n,0),e.arc(0,0,n,0,Sh)}},Oh={draw(e,t){const n=xh(t/5)/2;e.moveTo(-3*n,-n),e.lineTo(-n,-n),e.lineTo(-n,-3*n),e.lineTo(n,-3*n),e.lineTo(n,-n),e.lineTo(3*n,-n),e.lineTo(3*n,n),e.lineTo(n,n),e.lineTo(n,3*n),e.lineTo(-n,3*n),e.lineTo(-n,n),e.lineTo(-3*n,n),e.closePath()}},kh=xh(1/3),jh=2*kh,Eh={draw(e,t){const n=xh(t/jh),r=n*kh;e.moveTo(0,-n),e.lineTo(r,0),e.lineTo(0,n),e.lineTo(-r,0),e.closePath()}},Ch={draw(e,t){const n=xh(t),r=-n/2;e.rect(r,r,n,n)}},Ph=bh(wh/10)/bh(7*wh/10),Mh=bh(Sh/10)*Ph,Th=-gh(Sh/10)*Ph,_h={draw(e,t){const n=xh(.8908130915292852*t),r=Mh*n,o=Th*n;e.moveTo(0,-n),e.lineTo(r,o);for(let i=1;i<5;++i){const t=Sh*i/5,a=gh(t),l=bh(t);e.lineTo(l*n,-a*n),e.lineTo(a*r-l*o,l*r+a*o)}e.closePath()}},Rh=xh(3),Nh={draw(e,t){const n=-xh(t/(3*Rh));e.moveTo(0,2*n),e.lineTo(-Rh*n,-n),e.lineTo(Rh*n,-n),e.closePath()}},Ih=-.5,Dh=xh(3)/2,Lh=1/xh(12),zh=3*(Lh/2+1),$h={draw(e,t){const n=xh(t/zh),r=n/2,o=n*Lh,i=r,a=n*Lh+n,l=-i,s=a;e.moveTo(r,o),e.lineTo(i,a),e.lineTo(l,s),e.lineTo(Ih*r-Dh*o,Dh*r+Ih*o),e.lineTo(Ih*i-Dh*a,Dh*i+Ih*a),e.lineTo(Ih*l-Dh*s,Dh*l+Ih*s),e.lineTo(Ih*r+Dh*o,Ih*o-Dh*r),e.lineTo(Ih*i+Dh*a,Ih*a-Dh*i),e.lineTo(Ih*l+Dh*s,Ih*s-Dh*l),e.closePath()}};function Bh(e){return function(){return e}}const Fh=Math.PI,Wh=2*Fh,Uh=1e-6,Hh=Wh-Uh;function Vh(e){this._+=e[0];for(let t=1,n=e.length;t<n;++t)this._+=arguments[t]+e[t]}class qh{constructor(e){this._x0=this._y0=this._x1=this._y1=null,this._="",this._append=null==e?Vh:function(e){let t=Math.floor(e);if(!(t>=0))throw new Error(`invalid digits: ${e}`);if(t>15)return Vh;const n=10**t;return function(e){this._+=e[0];for(let t=1,r=e.length;t<r;++t)this._+=Math.round(arguments[t]*n)/n+e[t]}}(e)}moveTo(e,t){this._append`M${this._x0=this._x1=+e},${this._y0=this._y1=+t}`}closePath(){null!==this._x1&&(this._x1=this._x0,this._y1=this._y0,this._append`Z`)}lineTo(e,t){this._append`L${this._x1=+e},${this._y1=+t}`}quadraticCurveTo(e,t,n,r){this._append`Q${+e},${+t},${this._x1=+n},${this._y1=+r}`}bezierCurveTo(e,t,n,r,o,i){this._append`C${+e},${+t},${+n},${+r},${this._x1=+o},${this._y1=+i}`}arcTo(e,t,n,r,o){if(e=+e,t=+t,n=+n,r=+r,(o=+o)<0)throw new Error(`negative radius: ${o}`);let i=this._x1,a=this._y1,l=n-e,s=r-t,u=i-e,c=a-t,d=u*u+c*c;if(null===this._x1)this._append`M${this._x1=e},${this._y1=t}`;else if(d>Uh)if(Math.abs(c*l-s*u)>Uh&&o){let f=n-i,p=r-a,h=l*l+s*s,m=f*f+p*p,y=Math.sqrt(h),v=Math.sqrt(d),g=o*Math.tan((Fh-Math.acos((h+d-m)/(2*y*v)))/2),b=g/v,x=g/y;Math.abs(b-1)>Uh&&this._append`L${e+b*u},${t+b*c}`,this._append`A${o},${o},0,0,${+(c*f>u*p)},${this._x1=e+x*l},${this._y1=t+x*s}`}else this._append`L${this._x1=e},${this._y1=t}`;else;}arc(e,t,n,r,o,i){if(e=+e,t=+t,i=!!i,(n=+n)<0)throw new Error(`negative radius: ${n}`);let a=n*Math.cos(r),l=n*Math.sin(r),s=e+a,u=t+l,c=1^i,d=i?r-o:o-r;null===this._x1?this._append`M${s},${u}`:(Math.abs(this._x1-s)>Uh||Math.abs(this._y1-u)>Uh)&&this._append`L${s},${u}`,n&&(d<0&&(d=d%Wh+Wh),d>Hh?this._append`A${n},${n},0,1,${c},${e-a},${t-l}A${n},${n},0,1,${c},${this._x1=s},${this._y1=u}`:d>Uh&&this._append`A${n},${n},0,${+(d>=Fh)},${c},${this._x1=e+n*Math.cos(o)},${this._y1=t+n*Math.sin(o)}`)}rect(e,t,n,r){this._append`M${this._x0=this._x1=+e},${this._y0=this._y1=+t}h${n=+n}v${+r}h${-n}Z`}toString(){return this._}}function Xh(e){let t=3;return e.digits=function(n){if(!arguments.length)return t;if(null==n)t=null;else{const e=Math.floor(n);if(!(e>=0))throw new RangeError(`invalid digits: ${n}`);t=e}return e},()=>new qh(t)}xh(3),xh(3);function Kh(e){return Kh="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Kh(e)}var Gh=["type","size","sizeType"];function Yh(){return Yh=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Yh.apply(this,arguments)}function Qh(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Jh(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Qh(Object(n),!0).forEach((function(t){Zh(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Qh(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function Zh(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Kh(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Kh(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Kh(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function em(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var tm={symbolCircle:Ah,symbolCross:Oh,symbolDiamond:Eh,symbolSquare:Ch,symbolStar:_h,symbolTriangle:Nh,symbolWye:$h},nm=Math.PI/180,rm=function(e){var n=e.type,r=void 0===n?"circle":n,o=e.size,i=void 0===o?64:o,a=e.sizeType,l=void 0===a?"area":a,s=Jh(Jh({},em(e,Gh)),{},{type:r,size:i,sizeType:l}),u=s.className,c=s.cx,d=s.cy,f=rp(s,!0);return c===+c&&d===+d&&i===+i?t.createElement("path",Yh({},f,{className:zt("recharts-symbols",u),transform:"translate(".concat(c,", ").concat(d,")"),d:function(){var e=function(e){var t="symbol".concat(vh()(e));return tm[t]||Ah}(r),t=function(e,t){let n=null,r=Xh(o);function o(){let o;if(n||(n=o=r()),e.apply(this,arguments).draw(n,+t.apply(this,arguments)),o)return n=null,o+""||null}return e="function"===typeof e?e:Bh(e||Ah),t="function"===typeof t?t:Bh(void 0===t?64:+t),o.type=function(t){return arguments.length?(e="function"===typeof t?t:Bh(t),o):e},o.size=function(e){return arguments.length?(t="function"===typeof e?e:Bh(+e),o):t},o.context=function(e){return arguments.length?(n=null==e?null:e,o):n},o}().type(e).size(function(e,t,n){if("area"===t)return e;switch(n){case"cross":return 5*e*e/9;case"diamond":return.5*e*e/Math.sqrt(3);case"square":return e*e;case"star":var r=18*nm;return 1.25*e*e*(Math.tan(r)-Math.tan(2*r)*Math.pow(Math.tan(r),2));case"triangle":return Math.sqrt(3)*e*e/4;case"wye":return(21-10*Math.sqrt(3))*e*e/8;default:return Math.PI*e*e/4}}(i,l,r));return t()}()})):null};function om(e){return om="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},om(e)}function im(){return im=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},im.apply(this,arguments)}function am(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function lm(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,pm(r.key),r)}}function sm(e,t,n){return t=cm(t),function(e,t){if(t&&("object"===om(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,um()?Reflect.construct(t,n||[],cm(e).constructor):t.apply(e,n))}function um(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(um=function(){return!!e})()}function cm(e){return cm=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},cm(e)}function dm(e,t){return dm=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},dm(e,t)}function fm(e,t,n){return(t=pm(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function pm(e){var t=function(e,t){if("object"!=om(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=om(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==om(t)?t:t+""}rm.registerSymbol=function(e,t){tm["symbol".concat(vh()(e))]=t};var hm=32,mm=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),sm(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&dm(e,t)}(n,e),r=n,o=[{key:"renderIcon",value:function(e){var n=this.props.inactiveColor,r=16,o=5.333333333333333,i=10.666666666666666,a=e.inactive?n:e.color;if("plainline"===e.type)return t.createElement("line",{strokeWidth:4,fill:"none",stroke:a,strokeDasharray:e.payload.strokeDasharray,x1:0,y1:r,x2:hm,y2:r,className:"recharts-legend-icon"});if("line"===e.type)return t.createElement("path",{strokeWidth:4,fill:"none",stroke:a,d:"M0,".concat(r,"h").concat(i,"\n            A").concat(o,",").concat(o,",0,1,1,").concat(2*i,",").concat(r,"\n            H").concat(hm,"M").concat(2*i,",").concat(r,"\n            A").concat(o,",").concat(o,",0,1,1,").concat(i,",").concat(r),className:"recharts-legend-icon"});if("rect"===e.type)return t.createElement("path",{stroke:"none",fill:a,d:"M0,".concat(4,"h").concat(hm,"v").concat(24,"h").concat(-32,"z"),className:"recharts-legend-icon"});if(t.isValidElement(e.legendIcon)){var l=function(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?am(Object(n),!0).forEach((function(t){fm(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):am(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}({},e);return delete l.legendIcon,t.cloneElement(e.legendIcon,l)}return t.createElement(rm,{fill:a,cx:r,cy:r,size:hm,sizeType:"diameter",type:e.type})}},{key:"renderItems",value:function(){var e=this,n=this.props,r=n.payload,o=n.iconSize,i=n.layout,a=n.formatter,l=n.inactiveColor,s={x:0,y:0,width:hm,height:hm},u={display:"horizontal"===i?"inline-block":"block",marginRight:10},c={display:"inline-block",verticalAlign:"middle",marginRight:4};return r.map((function(n,r){var i=n.formatter||a,d=zt(fm(fm({"recharts-legend-item":!0},"legend-item-".concat(r),!0),"inactive",n.inactive));if("none"===n.type)return null;var f=_f()(n.value)?null:n.value;Cf(!_f()(n.value),'The name property is also required when using a function for the dataKey of a chart\'s cartesian components. Ex: <Bar name="Name of my Data"/>');var p=n.inactive?l:n.color;return t.createElement("li",im({className:d,style:u,key:"legend-item-".concat(r)},Uf(e.props,n,r)),t.createElement(Ap,{width:o,height:o,viewBox:s,style:c},e.renderIcon(n)),t.createElement("span",{className:"recharts-legend-item-text",style:{color:p}},i?i(f,n,r):f))}))}},{key:"render",value:function(){var e=this.props,n=e.payload,r=e.layout,o=e.align;if(!n||!n.length)return null;var i={padding:0,margin:0,textAlign:"horizontal"===r?o:"left"};return t.createElement("ul",{className:"recharts-default-legend",style:i},this.renderItems())}}],o&&lm(r.prototype,o),i&&lm(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);function ym(e){return ym="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},ym(e)}fm(mm,"displayName","Legend"),fm(mm,"defaultProps",{iconSize:14,layout:"horizontal",align:"center",verticalAlign:"middle",inactiveColor:"#ccc"});var vm=["ref"];function gm(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function bm(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?gm(Object(n),!0).forEach((function(t){km(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):gm(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function xm(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,jm(r.key),r)}}function wm(e,t,n){return t=Am(t),function(e,t){if(t&&("object"===ym(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,Sm()?Reflect.construct(t,n||[],Am(e).constructor):t.apply(e,n))}function Sm(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(Sm=function(){return!!e})()}function Am(e){return Am=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},Am(e)}function Om(e,t){return Om=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},Om(e,t)}function km(e,t,n){return(t=jm(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function jm(e){var t=function(e,t){if("object"!=ym(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=ym(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==ym(t)?t:t+""}function Em(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Cm(e){return e.value}var Pm=function(e){function n(){var e;!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n);for(var t=arguments.length,r=new Array(t),o=0;o<t;o++)r[o]=arguments[o];return km(e=wm(this,n,[].concat(r)),"lastBoundingBox",{width:-1,height:-1}),e}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&Om(e,t)}(n,e),r=n,i=[{key:"getWithHeight",value:function(e,t){var n=bm(bm({},this.defaultProps),e.props).layout;return"vertical"===n&&bf(e.props.height)?{height:e.props.height}:"horizontal"===n?{width:e.props.width||t}:null}}],(o=[{key:"componentDidMount",value:function(){this.updateBBox()}},{key:"componentDidUpdate",value:function(){this.updateBBox()}},{key:"getBBox",value:function(){if(this.wrapperNode&&this.wrapperNode.getBoundingClientRect){var e=this.wrapperNode.getBoundingClientRect();return e.height=this.wrapperNode.offsetHeight,e.width=this.wrapperNode.offsetWidth,e}return null}},{key:"updateBBox",value:function(){var e=this.props.onBBoxUpdate,t=this.getBBox();t?(Math.abs(t.width-this.lastBoundingBox.width)>1||Math.abs(t.height-this.lastBoundingBox.height)>1)&&(this.lastBoundingBox.width=t.width,this.lastBoundingBox.height=t.height,e&&e(t)):-1===this.lastBoundingBox.width&&-1===this.lastBoundingBox.height||(this.lastBoundingBox.width=-1,this.lastBoundingBox.height=-1,e&&e(null))}},{key:"getBBoxSnapshot",value:function(){return this.lastBoundingBox.width>=0&&this.lastBoundingBox.height>=0?bm({},this.lastBoundingBox):{width:0,height:0}}},{key:"getDefaultPosition",value:function(e){var t,n,r=this.props,o=r.layout,i=r.align,a=r.verticalAlign,l=r.margin,s=r.chartWidth,u=r.chartHeight;return e&&(void 0!==e.left&&null!==e.left||void 0!==e.right&&null!==e.right)||(t="center"===i&&"vertical"===o?{left:((s||0)-this.getBBoxSnapshot().width)/2}:"right"===i?{right:l&&l.right||0}:{left:l&&l.left||0}),e&&(void 0!==e.top&&null!==e.top||void 0!==e.bottom&&null!==e.bottom)||(n="middle"===a?{top:((u||0)-this.getBBoxSnapshot().height)/2}:"bottom"===a?{bottom:l&&l.bottom||0}:{top:l&&l.top||0}),bm(bm({},t),n)}},{key:"render",value:function(){var e=this,n=this.props,r=n.content,o=n.width,i=n.height,a=n.wrapperStyle,l=n.payloadUniqBy,s=n.payload,u=bm(bm({position:"absolute",width:o||"auto",height:i||"auto"},this.getDefaultPosition(a)),a);return t.createElement("div",{className:"recharts-legend-wrapper",style:u,ref:function(t){e.wrapperNode=t}},function(e,n){if(t.isValidElement(e))return t.cloneElement(e,n);if("function"===typeof e)return t.createElement(e,n);n.ref;var r=Em(n,vm);return t.createElement(mm,r)}(r,bm(bm({},this.props),{},{payload:rh(s,l,Cm)})))}}])&&xm(r.prototype,o),i&&xm(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);function Mm(){return Mm=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Mm.apply(this,arguments)}km(Pm,"displayName","Legend"),km(Pm,"defaultProps",{iconSize:14,layout:"horizontal",align:"center",verticalAlign:"bottom"});var Tm=function(e){var n=e.cx,r=e.cy,o=e.r,i=e.className,a=zt("recharts-dot",i);return n===+n&&r===+r&&o===+o?t.createElement("circle",Mm({},rp(e,!1),Wf(e),{className:a,cx:n,cy:r,r:o})):null},_m=n(5173),Rm=n.n(_m),Nm=Object.getOwnPropertyNames,Im=Object.getOwnPropertySymbols,Dm=Object.prototype.hasOwnProperty;function Lm(e,t){return function(n,r,o){return e(n,r,o)&&t(n,r,o)}}function zm(e){return function(t,n,r){if(!t||!n||"object"!==typeof t||"object"!==typeof n)return e(t,n,r);var o=r.cache,i=o.get(t),a=o.get(n);if(i&&a)return i===n&&a===t;o.set(t,n),o.set(n,t);var l=e(t,n,r);return o.delete(t),o.delete(n),l}}function $m(e){return Nm(e).concat(Im(e))}var Bm=Object.hasOwn||function(e,t){return Dm.call(e,t)};function Fm(e,t){return e===t||!e&&!t&&e!==e&&t!==t}var Wm=Object.getOwnPropertyDescriptor,Um=Object.keys;function Hm(e,t,n){var r=e.length;if(t.length!==r)return!1;for(;r-- >0;)if(!n.equals(e[r],t[r],r,r,e,t,n))return!1;return!0}function Vm(e,t){return Fm(e.getTime(),t.getTime())}function qm(e,t){return e.name===t.name&&e.message===t.message&&e.cause===t.cause&&e.stack===t.stack}function Xm(e,t){return e===t}function Km(e,t,n){var r=e.size;if(r!==t.size)return!1;if(!r)return!0;for(var o,i,a=new Array(r),l=e.entries(),s=0;(o=l.next())&&!o.done;){for(var u=t.entries(),c=!1,d=0;(i=u.next())&&!i.done;)if(a[d])d++;else{var f=o.value,p=i.value;if(n.equals(f[0],p[0],s,d,e,t,n)&&n.equals(f[1],p[1],f[0],p[0],e,t,n)){c=a[d]=!0;break}d++}if(!c)return!1;s++}return!0}var Gm=Fm;function Ym(e,t,n){var r=Um(e),o=r.length;if(Um(t).length!==o)return!1;for(;o-- >0;)if(!ry(e,t,n,r[o]))return!1;return!0}function Qm(e,t,n){var r,o,i,a=$m(e),l=a.length;if($m(t).length!==l)return!1;for(;l-- >0;){if(!ry(e,t,n,r=a[l]))return!1;if(o=Wm(e,r),i=Wm(t,r),(o||i)&&(!o||!i||o.configurable!==i.configurable||o.enumerable!==i.enumerable||o.writable!==i.writable))return!1}return!0}function Jm(e,t){return Fm(e.valueOf(),t.valueOf())}function Zm(e,t){return e.source===t.source&&e.flags===t.flags}function ey(e,t,n){var r=e.size;if(r!==t.size)return!1;if(!r)return!0;for(var o,i,a=new Array(r),l=e.values();(o=l.next())&&!o.done;){for(var s=t.values(),u=!1,c=0;(i=s.next())&&!i.done;){if(!a[c]&&n.equals(o.value,i.value,o.value,i.value,e,t,n)){u=a[c]=!0;break}c++}if(!u)return!1}return!0}function ty(e,t){var n=e.length;if(t.length!==n)return!1;for(;n-- >0;)if(e[n]!==t[n])return!1;return!0}function ny(e,t){return e.hostname===t.hostname&&e.pathname===t.pathname&&e.protocol===t.protocol&&e.port===t.port&&e.hash===t.hash&&e.username===t.username&&e.password===t.password}function ry(e,t,n,r){return!("_owner"!==r&&"__o"!==r&&"__v"!==r||!e.$$typeof&&!t.$$typeof)||Bm(t,r)&&n.equals(e[r],t[r],r,r,e,t,n)}var oy=Array.isArray,iy="function"===typeof ArrayBuffer&&ArrayBuffer.isView?ArrayBuffer.isView:null,ay=Object.assign,ly=Object.prototype.toString.call.bind(Object.prototype.toString);var sy=uy();uy({strict:!0}),uy({circular:!0}),uy({circular:!0,strict:!0}),uy({createInternalComparator:function(){return Fm}}),uy({strict:!0,createInternalComparator:function(){return Fm}}),uy({circular:!0,createInternalComparator:function(){return Fm}}),uy({circular:!0,createInternalComparator:function(){return Fm},strict:!0});function uy(e){void 0===e&&(e={});var t,n=e.circular,r=void 0!==n&&n,o=e.createInternalComparator,i=e.createState,a=e.strict,l=void 0!==a&&a,s=function(e){var t=e.circular,n=e.createCustomConfig,r=e.strict,o={areArraysEqual:r?Qm:Hm,areDatesEqual:Vm,areErrorsEqual:qm,areFunctionsEqual:Xm,areMapsEqual:r?Lm(Km,Qm):Km,areNumbersEqual:Gm,areObjectsEqual:r?Qm:Ym,arePrimitiveWrappersEqual:Jm,areRegExpsEqual:Zm,areSetsEqual:r?Lm(ey,Qm):ey,areTypedArraysEqual:r?Qm:ty,areUrlsEqual:ny};if(n&&(o=ay({},o,n(o))),t){var i=zm(o.areArraysEqual),a=zm(o.areMapsEqual),l=zm(o.areObjectsEqual),s=zm(o.areSetsEqual);o=ay({},o,{areArraysEqual:i,areMapsEqual:a,areObjectsEqual:l,areSetsEqual:s})}return o}(e),u=function(e){var t=e.areArraysEqual,n=e.areDatesEqual,r=e.areErrorsEqual,o=e.areFunctionsEqual,i=e.areMapsEqual,a=e.areNumbersEqual,l=e.areObjectsEqual,s=e.arePrimitiveWrappersEqual,u=e.areRegExpsEqual,c=e.areSetsEqual,d=e.areTypedArraysEqual,f=e.areUrlsEqual;return function(e,p,h){if(e===p)return!0;if(null==e||null==p)return!1;var m=typeof e;if(m!==typeof p)return!1;if("object"!==m)return"number"===m?a(e,p,h):"function"===m&&o(e,p,h);var y=e.constructor;if(y!==p.constructor)return!1;if(y===Object)return l(e,p,h);if(oy(e))return t(e,p,h);if(null!=iy&&iy(e))return d(e,p,h);if(y===Date)return n(e,p,h);if(y===RegExp)return u(e,p,h);if(y===Map)return i(e,p,h);if(y===Set)return c(e,p,h);var v=ly(e);return"[object Date]"===v?n(e,p,h):"[object RegExp]"===v?u(e,p,h):"[object Map]"===v?i(e,p,h):"[object Set]"===v?c(e,p,h):"[object Object]"===v?"function"!==typeof e.then&&"function"!==typeof p.then&&l(e,p,h):"[object URL]"===v?f(e,p,h):"[object Error]"===v?r(e,p,h):"[object Arguments]"===v?l(e,p,h):("[object Boolean]"===v||"[object Number]"===v||"[object String]"===v)&&s(e,p,h)}}(s),c=o?o(u):(t=u,function(e,n,r,o,i,a,l){return t(e,n,l)});return function(e){var t=e.circular,n=e.comparator,r=e.createState,o=e.equals,i=e.strict;if(r)return function(e,a){var l=r(),s=l.cache,u=void 0===s?t?new WeakMap:void 0:s,c=l.meta;return n(e,a,{cache:u,equals:o,meta:c,strict:i})};if(t)return function(e,t){return n(e,t,{cache:new WeakMap,equals:o,meta:void 0,strict:i})};var a={cache:void 0,equals:o,meta:void 0,strict:i};return function(e,t){return n(e,t,a)}}({circular:r,comparator:u,createState:i,equals:c,strict:l})}function cy(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0,n=-1;requestAnimationFrame((function r(o){n<0&&(n=o),o-n>t?(e(o),n=-1):function(e){"undefined"!==typeof requestAnimationFrame&&requestAnimationFrame(e)}(r)}))}function dy(e){return dy="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},dy(e)}function fy(e){return function(e){if(Array.isArray(e))return e}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return py(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return py(e,t)}(e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function py(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function hy(){var e=function(){return null},t=!1,n=function n(r){if(!t){if(Array.isArray(r)){if(!r.length)return;var o=fy(r),i=o[0],a=o.slice(1);return"number"===typeof i?void cy(n.bind(null,a),i):(n(i),void cy(n.bind(null,a)))}"object"===dy(r)&&e(r),"function"===typeof r&&r()}};return{stop:function(){t=!0},start:function(e){t=!1,n(e)},subscribe:function(t){return e=t,function(){e=function(){return null}}}}}function my(e){return my="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},my(e)}function yy(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function vy(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?yy(Object(n),!0).forEach((function(t){gy(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):yy(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function gy(e,t,n){return(t=function(e){var t=function(e,t){if("object"!==my(e)||null===e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!==my(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"===my(t)?t:String(t)}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var by=function(e){return e},xy=function(e,t){return Object.keys(t).reduce((function(n,r){return vy(vy({},n),{},gy({},r,e(r,t[r])))}),{})},wy=function(e,t,n){return e.map((function(e){return"".concat((r=e,r.replace(/([A-Z])/g,(function(e){return"-".concat(e.toLowerCase())})))," ").concat(t,"ms ").concat(n);var r})).join(",")};function Sy(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||Oy(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ay(e){return function(e){if(Array.isArray(e))return ky(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||Oy(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Oy(e,t){if(e){if("string"===typeof e)return ky(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?ky(e,t):void 0}}function ky(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var jy=1e-4,Ey=function(e,t){return[0,3*e,3*t-6*e,3*e-3*t+1]},Cy=function(e,t){return e.map((function(e,n){return e*Math.pow(t,n)})).reduce((function(e,t){return e+t}))},Py=function(e,t){return function(n){var r=Ey(e,t);return Cy(r,n)}},My=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];var r=t[0],o=t[1],i=t[2],a=t[3];if(1===t.length)switch(t[0]){case"linear":r=0,o=0,i=1,a=1;break;case"ease":r=.25,o=.1,i=.25,a=1;break;case"ease-in":r=.42,o=0,i=1,a=1;break;case"ease-out":r=.42,o=0,i=.58,a=1;break;case"ease-in-out":r=0,o=0,i=.58,a=1;break;default:var l=t[0].split("(");if("cubic-bezier"===l[0]&&4===l[1].split(")")[0].split(",").length){var s=Sy(l[1].split(")")[0].split(",").map((function(e){return parseFloat(e)})),4);r=s[0],o=s[1],i=s[2],a=s[3]}}[r,i,o,a].every((function(e){return"number"===typeof e&&e>=0&&e<=1}));var u,c,d=Py(r,i),f=Py(o,a),p=(u=r,c=i,function(e){var t=Ey(u,c),n=[].concat(Ay(t.map((function(e,t){return e*t})).slice(1)),[0]);return Cy(n,e)}),h=function(e){return e>1?1:e<0?0:e},m=function(e){for(var t=e>1?1:e,n=t,r=0;r<8;++r){var o=d(n)-t,i=p(n);if(Math.abs(o-t)<jy||i<jy)return f(n);n=h(n-o/i)}return f(n)};return m.isStepper=!1,m},Ty=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];var r=t[0];if("string"===typeof r)switch(r){case"ease":case"ease-in-out":case"ease-out":case"ease-in":case"linear":return My(r);case"spring":return function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=e.stiff,n=void 0===t?100:t,r=e.damping,o=void 0===r?8:r,i=e.dt,a=void 0===i?17:i,l=function(e,t,r){var i=r+(-(e-t)*n-r*o)*a/1e3,l=r*a/1e3+e;return Math.abs(l-t)<jy&&Math.abs(i)<jy?[t,0]:[l,i]};return l.isStepper=!0,l.dt=a,l}();default:if("cubic-bezier"===r.split("(")[0])return My(r)}return"function"===typeof r?r:null};function _y(e){return _y="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},_y(e)}function Ry(e){return function(e){if(Array.isArray(e))return $y(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||zy(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ny(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Iy(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Ny(Object(n),!0).forEach((function(t){Dy(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Ny(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function Dy(e,t,n){return(t=function(e){var t=function(e,t){if("object"!==_y(e)||null===e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!==_y(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"===_y(t)?t:String(t)}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Ly(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||zy(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function zy(e,t){if(e){if("string"===typeof e)return $y(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?$y(e,t):void 0}}function $y(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var By=function(e,t,n){return e+(t-e)*n},Fy=function(e){return e.from!==e.to},Wy=function e(t,n,r){var o=xy((function(e,n){if(Fy(n)){var r=Ly(t(n.from,n.to,n.velocity),2),o=r[0],i=r[1];return Iy(Iy({},n),{},{from:o,velocity:i})}return n}),n);return r<1?xy((function(e,t){return Fy(t)?Iy(Iy({},t),{},{velocity:By(t.velocity,o[e].velocity,r),from:By(t.from,o[e].from,r)}):t}),n):e(t,o,r-1)};const Uy=function(e,t,n,r,o){var i,a,l,s,u=(i=e,a=t,[Object.keys(i),Object.keys(a)].reduce((function(e,t){return e.filter((function(e){return t.includes(e)}))}))),c=u.reduce((function(n,r){return Iy(Iy({},n),{},Dy({},r,[e[r],t[r]]))}),{}),d=u.reduce((function(n,r){return Iy(Iy({},n),{},Dy({},r,{from:e[r],velocity:0,to:t[r]}))}),{}),f=-1,p=function(){return null};return p=n.isStepper?function(r){l||(l=r);var i=(r-l)/n.dt;d=Wy(n,d,i),o(Iy(Iy(Iy({},e),t),xy((function(e,t){return t.from}),d))),l=r,Object.values(d).filter(Fy).length&&(f=requestAnimationFrame(p))}:function(i){s||(s=i);var a=(i-s)/r,l=xy((function(e,t){return By.apply(void 0,Ry(t).concat([n(a)]))}),c);if(o(Iy(Iy(Iy({},e),t),l)),a<1)f=requestAnimationFrame(p);else{var u=xy((function(e,t){return By.apply(void 0,Ry(t).concat([n(1)]))}),c);o(Iy(Iy(Iy({},e),t),u))}},function(){return requestAnimationFrame(p),function(){cancelAnimationFrame(f)}}};function Hy(e){return Hy="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Hy(e)}var Vy=["children","begin","duration","attributeName","easing","isActive","steps","from","to","canBegin","onAnimationEnd","shouldReAnimate","onAnimationReStart"];function qy(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Xy(e){return function(e){if(Array.isArray(e))return Ky(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return Ky(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Ky(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ky(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function Gy(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Yy(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Gy(Object(n),!0).forEach((function(t){Qy(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Gy(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function Qy(e,t,n){return(t=Zy(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Jy(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Zy(r.key),r)}}function Zy(e){var t=function(e,t){if("object"!==Hy(e)||null===e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!==Hy(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"===Hy(t)?t:String(t)}function ev(e,t){return ev=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},ev(e,t)}function tv(e){var t=function(){if("undefined"===typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"===typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(SR){return!1}}();return function(){var n,r=ov(e);if(t){var o=ov(this).constructor;n=Reflect.construct(r,arguments,o)}else n=r.apply(this,arguments);return nv(this,n)}}function nv(e,t){if(t&&("object"===Hy(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return rv(e)}function rv(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function ov(e){return ov=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},ov(e)}var iv=function(e){!function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&ev(e,t)}(a,e);var n,r,o,i=tv(a);function a(e,t){var n;!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,a);var r=(n=i.call(this,e,t)).props,o=r.isActive,l=r.attributeName,s=r.from,u=r.to,c=r.steps,d=r.children,f=r.duration;if(n.handleStyleChange=n.handleStyleChange.bind(rv(n)),n.changeStyle=n.changeStyle.bind(rv(n)),!o||f<=0)return n.state={style:{}},"function"===typeof d&&(n.state={style:u}),nv(n);if(c&&c.length)n.state={style:c[0].style};else if(s){if("function"===typeof d)return n.state={style:s},nv(n);n.state={style:l?Qy({},l,s):s}}else n.state={style:{}};return n}return n=a,r=[{key:"componentDidMount",value:function(){var e=this.props,t=e.isActive,n=e.canBegin;this.mounted=!0,t&&n&&this.runAnimation(this.props)}},{key:"componentDidUpdate",value:function(e){var t=this.props,n=t.isActive,r=t.canBegin,o=t.attributeName,i=t.shouldReAnimate,a=t.to,l=t.from,s=this.state.style;if(r)if(n){if(!(sy(e.to,a)&&e.canBegin&&e.isActive)){var u=!e.canBegin||!e.isActive;this.manager&&this.manager.stop(),this.stopJSAnimation&&this.stopJSAnimation();var c=u||i?l:e.to;if(this.state&&s){var d={style:o?Qy({},o,c):c};(o&&s[o]!==c||!o&&s!==c)&&this.setState(d)}this.runAnimation(Yy(Yy({},this.props),{},{from:c,begin:0}))}}else{var f={style:o?Qy({},o,a):a};this.state&&s&&(o&&s[o]!==a||!o&&s!==a)&&this.setState(f)}}},{key:"componentWillUnmount",value:function(){this.mounted=!1;var e=this.props.onAnimationEnd;this.unSubscribe&&this.unSubscribe(),this.manager&&(this.manager.stop(),this.manager=null),this.stopJSAnimation&&this.stopJSAnimation(),e&&e()}},{key:"handleStyleChange",value:function(e){this.changeStyle(e)}},{key:"changeStyle",value:function(e){this.mounted&&this.setState({style:e})}},{key:"runJSAnimation",value:function(e){var t=this,n=e.from,r=e.to,o=e.duration,i=e.easing,a=e.begin,l=e.onAnimationEnd,s=e.onAnimationStart,u=Uy(n,r,Ty(i),o,this.changeStyle);this.manager.start([s,a,function(){t.stopJSAnimation=u()},o,l])}},{key:"runStepAnimation",value:function(e){var t=this,n=e.steps,r=e.begin,o=e.onAnimationStart,i=n[0],a=i.style,l=i.duration,s=void 0===l?0:l;return this.manager.start([o].concat(Xy(n.reduce((function(e,r,o){if(0===o)return e;var i=r.duration,a=r.easing,l=void 0===a?"ease":a,s=r.style,u=r.properties,c=r.onAnimationEnd,d=o>0?n[o-1]:r,f=u||Object.keys(s);if("function"===typeof l||"spring"===l)return[].concat(Xy(e),[t.runJSAnimation.bind(t,{from:d.style,to:s,duration:i,easing:l}),i]);var p=wy(f,i,l),h=Yy(Yy(Yy({},d.style),s),{},{transition:p});return[].concat(Xy(e),[h,i,c]).filter(by)}),[a,Math.max(s,r)])),[e.onAnimationEnd]))}},{key:"runAnimation",value:function(e){this.manager||(this.manager=hy());var t=e.begin,n=e.duration,r=e.attributeName,o=e.to,i=e.easing,a=e.onAnimationStart,l=e.onAnimationEnd,s=e.steps,u=e.children,c=this.manager;if(this.unSubscribe=c.subscribe(this.handleStyleChange),"function"!==typeof i&&"function"!==typeof u&&"spring"!==i)if(s.length>1)this.runStepAnimation(e);else{var d=r?Qy({},r,o):o,f=wy(Object.keys(d),n,i);c.start([a,t,Yy(Yy({},d),{},{transition:f}),n,l])}else this.runJSAnimation(e)}},{key:"render",value:function(){var e=this.props,n=e.children,r=(e.begin,e.duration),o=(e.attributeName,e.easing,e.isActive),i=(e.steps,e.from,e.to,e.canBegin,e.onAnimationEnd,e.shouldReAnimate,e.onAnimationReStart,qy(e,Vy)),a=t.Children.count(n),l=this.state.style;if("function"===typeof n)return n(l);if(!o||0===a||r<=0)return n;var s=function(e){var n=e.props,r=n.style,o=void 0===r?{}:r,a=n.className;return(0,t.cloneElement)(e,Yy(Yy({},i),{},{style:Yy(Yy({},o),l),className:a}))};return 1===a?s(t.Children.only(n)):t.createElement("div",null,t.Children.map(n,(function(e){return s(e)})))}}],r&&Jy(n.prototype,r),o&&Jy(n,o),Object.defineProperty(n,"prototype",{writable:!1}),a}(t.PureComponent);iv.displayName="Animate",iv.defaultProps={begin:0,duration:1e3,from:"",to:"",attributeName:"",easing:"ease",isActive:!0,canBegin:!0,steps:[],onAnimationEnd:function(){},onAnimationStart:function(){}},iv.propTypes={from:Rm().oneOfType([Rm().object,Rm().string]),to:Rm().oneOfType([Rm().object,Rm().string]),attributeName:Rm().string,duration:Rm().number,begin:Rm().number,easing:Rm().oneOfType([Rm().string,Rm().func]),steps:Rm().arrayOf(Rm().shape({duration:Rm().number.isRequired,style:Rm().object.isRequired,easing:Rm().oneOfType([Rm().oneOf(["ease","ease-in","ease-out","ease-in-out","linear"]),Rm().func]),properties:Rm().arrayOf("string"),onAnimationEnd:Rm().func})),children:Rm().oneOfType([Rm().node,Rm().func]),isActive:Rm().bool,canBegin:Rm().bool,onAnimationEnd:Rm().func,shouldReAnimate:Rm().bool,onAnimationStart:Rm().func,onAnimationReStart:Rm().func};const av=iv;function lv(e){return lv="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},lv(e)}function sv(){return sv=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},sv.apply(this,arguments)}function uv(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return cv(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return cv(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function cv(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function dv(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function fv(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?dv(Object(n),!0).forEach((function(t){pv(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):dv(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function pv(e,t,n){return t=function(e){var t=function(e,t){if("object"!=lv(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=lv(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==lv(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var hv=function(e,t,n,r,o){var i,a=Math.min(Math.abs(n)/2,Math.abs(r)/2),l=r>=0?1:-1,s=n>=0?1:-1,u=r>=0&&n>=0||r<0&&n<0?1:0;if(a>0&&o instanceof Array){for(var c=[0,0,0,0],d=0;d<4;d++)c[d]=o[d]>a?a:o[d];i="M".concat(e,",").concat(t+l*c[0]),c[0]>0&&(i+="A ".concat(c[0],",").concat(c[0],",0,0,").concat(u,",").concat(e+s*c[0],",").concat(t)),i+="L ".concat(e+n-s*c[1],",").concat(t),c[1]>0&&(i+="A ".concat(c[1],",").concat(c[1],",0,0,").concat(u,",\n        ").concat(e+n,",").concat(t+l*c[1])),i+="L ".concat(e+n,",").concat(t+r-l*c[2]),c[2]>0&&(i+="A ".concat(c[2],",").concat(c[2],",0,0,").concat(u,",\n        ").concat(e+n-s*c[2],",").concat(t+r)),i+="L ".concat(e+s*c[3],",").concat(t+r),c[3]>0&&(i+="A ".concat(c[3],",").concat(c[3],",0,0,").concat(u,",\n        ").concat(e,",").concat(t+r-l*c[3])),i+="Z"}else if(a>0&&o===+o&&o>0){var f=Math.min(a,o);i="M ".concat(e,",").concat(t+l*f,"\n            A ").concat(f,",").concat(f,",0,0,").concat(u,",").concat(e+s*f,",").concat(t,"\n            L ").concat(e+n-s*f,",").concat(t,"\n            A ").concat(f,",").concat(f,",0,0,").concat(u,",").concat(e+n,",").concat(t+l*f,"\n            L ").concat(e+n,",").concat(t+r-l*f,"\n            A ").concat(f,",").concat(f,",0,0,").concat(u,",").concat(e+n-s*f,",").concat(t+r,"\n            L ").concat(e+s*f,",").concat(t+r,"\n            A ").concat(f,",").concat(f,",0,0,").concat(u,",").concat(e,",").concat(t+r-l*f," Z")}else i="M ".concat(e,",").concat(t," h ").concat(n," v ").concat(r," h ").concat(-n," Z");return i},mv=function(e,t){if(!e||!t)return!1;var n=e.x,r=e.y,o=t.x,i=t.y,a=t.width,l=t.height;if(Math.abs(a)>0&&Math.abs(l)>0){var s=Math.min(o,o+a),u=Math.max(o,o+a),c=Math.min(i,i+l),d=Math.max(i,i+l);return n>=s&&n<=u&&r>=c&&r<=d}return!1},yv={x:0,y:0,width:0,height:0,radius:0,isAnimationActive:!1,isUpdateAnimationActive:!1,animationBegin:0,animationDuration:1500,animationEasing:"ease"},vv=function(e){var n=fv(fv({},yv),e),r=(0,t.useRef)(),o=uv((0,t.useState)(-1),2),i=o[0],a=o[1];(0,t.useEffect)((function(){if(r.current&&r.current.getTotalLength)try{var e=r.current.getTotalLength();e&&a(e)}catch(t){}}),[]);var l=n.x,s=n.y,u=n.width,c=n.height,d=n.radius,f=n.className,p=n.animationEasing,h=n.animationDuration,m=n.animationBegin,y=n.isAnimationActive,v=n.isUpdateAnimationActive;if(l!==+l||s!==+s||u!==+u||c!==+c||0===u||0===c)return null;var g=zt("recharts-rectangle",f);return v?t.createElement(av,{canBegin:i>0,from:{width:u,height:c,x:l,y:s},to:{width:u,height:c,x:l,y:s},duration:h,animationEasing:p,isActive:v},(function(e){var o=e.width,a=e.height,l=e.x,s=e.y;return t.createElement(av,{canBegin:i>0,from:"0px ".concat(-1===i?1:i,"px"),to:"".concat(i,"px 0px"),attributeName:"strokeDasharray",begin:m,duration:h,isActive:y,easing:p},t.createElement("path",sv({},rp(n,!0),{className:g,d:hv(l,s,o,a,d),ref:r})))})):t.createElement("path",sv({},rp(n,!0),{className:g,d:hv(l,s,u,c,d)}))};function gv(e,t){switch(arguments.length){case 0:break;case 1:this.range(e);break;default:this.range(t).domain(e)}return this}function bv(e,t){switch(arguments.length){case 0:break;case 1:"function"===typeof e?this.interpolator(e):this.range(e);break;default:this.domain(e),"function"===typeof t?this.interpolator(t):this.range(t)}return this}class xv extends Map{constructor(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Ov;if(super(),Object.defineProperties(this,{_intern:{value:new Map},_key:{value:t}}),null!=e)for(const[n,r]of e)this.set(n,r)}get(e){return super.get(wv(this,e))}has(e){return super.has(wv(this,e))}set(e,t){return super.set(Sv(this,e),t)}delete(e){return super.delete(Av(this,e))}}Set;function wv(e,t){let{_intern:n,_key:r}=e;const o=r(t);return n.has(o)?n.get(o):t}function Sv(e,t){let{_intern:n,_key:r}=e;const o=r(t);return n.has(o)?n.get(o):(n.set(o,t),t)}function Av(e,t){let{_intern:n,_key:r}=e;const o=r(t);return n.has(o)&&(t=n.get(o),n.delete(o)),t}function Ov(e){return null!==e&&"object"===typeof e?e.valueOf():e}const kv=Symbol("implicit");function jv(){var e=new xv,t=[],n=[],r=kv;function o(o){let i=e.get(o);if(void 0===i){if(r!==kv)return r;e.set(o,i=t.push(o)-1)}return n[i%n.length]}return o.domain=function(n){if(!arguments.length)return t.slice();t=[],e=new xv;for(const r of n)e.has(r)||e.set(r,t.push(r)-1);return o},o.range=function(e){return arguments.length?(n=Array.from(e),o):n.slice()},o.unknown=function(e){return arguments.length?(r=e,o):r},o.copy=function(){return jv(t,n).unknown(r)},gv.apply(o,arguments),o}function Ev(){var e,t,n=jv().unknown(void 0),r=n.domain,o=n.range,i=0,a=1,l=!1,s=0,u=0,c=.5;function d(){var n=r().length,d=a<i,f=d?a:i,p=d?i:a;e=(p-f)/Math.max(1,n-s+2*u),l&&(e=Math.floor(e)),f+=(p-f-e*(n-s))*c,t=e*(1-s),l&&(f=Math.round(f),t=Math.round(t));var h=function(e,t,n){e=+e,t=+t,n=(o=arguments.length)<2?(t=e,e=0,1):o<3?1:+n;for(var r=-1,o=0|Math.max(0,Math.ceil((t-e)/n)),i=new Array(o);++r<o;)i[r]=e+r*n;return i}(n).map((function(t){return f+e*t}));return o(d?h.reverse():h)}return delete n.unknown,n.domain=function(e){return arguments.length?(r(e),d()):r()},n.range=function(e){return arguments.length?([i,a]=e,i=+i,a=+a,d()):[i,a]},n.rangeRound=function(e){return[i,a]=e,i=+i,a=+a,l=!0,d()},n.bandwidth=function(){return t},n.step=function(){return e},n.round=function(e){return arguments.length?(l=!!e,d()):l},n.padding=function(e){return arguments.length?(s=Math.min(1,u=+e),d()):s},n.paddingInner=function(e){return arguments.length?(s=Math.min(1,e),d()):s},n.paddingOuter=function(e){return arguments.length?(u=+e,d()):u},n.align=function(e){return arguments.length?(c=Math.max(0,Math.min(1,e)),d()):c},n.copy=function(){return Ev(r(),[i,a]).round(l).paddingInner(s).paddingOuter(u).align(c)},gv.apply(d(),arguments)}function Cv(e){var t=e.copy;return e.padding=e.paddingOuter,delete e.paddingInner,delete e.paddingOuter,e.copy=function(){return Cv(t())},e}function Pv(){return Cv(Ev.apply(null,arguments).paddingInner(1))}function Mv(e){return Mv="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Mv(e)}function Tv(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function _v(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Tv(Object(n),!0).forEach((function(t){Rv(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Tv(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function Rv(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Mv(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Mv(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Mv(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var Nv={widthCache:{},cacheCount:0},Iv={position:"absolute",top:"-20000px",left:0,padding:0,margin:0,border:"none",whiteSpace:"pre"},Dv="recharts_measurement_span";var Lv=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if(void 0===e||null===e||eh.isSsr)return{width:0,height:0};var n=function(e){var t=_v({},e);return Object.keys(t).forEach((function(e){t[e]||delete t[e]})),t}(t),r=JSON.stringify({text:e,copyStyle:n});if(Nv.widthCache[r])return Nv.widthCache[r];try{var o=document.getElementById(Dv);o||((o=document.createElement("span")).setAttribute("id",Dv),o.setAttribute("aria-hidden","true"),document.body.appendChild(o));var i=_v(_v({},Iv),n);Object.assign(o.style,i),o.textContent="".concat(e);var a=o.getBoundingClientRect(),l={width:a.width,height:a.height};return Nv.widthCache[r]=l,++Nv.cacheCount>2e3&&(Nv.cacheCount=0,Nv.widthCache={}),l}catch(SR){return{width:0,height:0}}};function zv(e){return zv="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},zv(e)}function $v(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return Bv(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Bv(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Bv(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function Fv(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Wv(r.key),r)}}function Wv(e){var t=function(e,t){if("object"!=zv(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=zv(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==zv(t)?t:t+""}var Uv=/(-?\d+(?:\.\d+)?[a-zA-Z%]*)([*/])(-?\d+(?:\.\d+)?[a-zA-Z%]*)/,Hv=/(-?\d+(?:\.\d+)?[a-zA-Z%]*)([+-])(-?\d+(?:\.\d+)?[a-zA-Z%]*)/,Vv=/^px|cm|vh|vw|em|rem|%|mm|in|pt|pc|ex|ch|vmin|vmax|Q$/,qv=/(-?\d+(?:\.\d+)?)([a-zA-Z%]+)?/,Xv={cm:96/2.54,mm:96/25.4,pt:96/72,pc:16,in:96,Q:96/101.6,px:1},Kv=Object.keys(Xv),Gv="NaN";var Yv=function(){function e(t,n){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.num=t,this.unit=n,this.num=t,this.unit=n,Number.isNaN(t)&&(this.unit=""),""===n||Vv.test(n)||(this.num=NaN,this.unit=""),Kv.includes(n)&&(this.num=function(e,t){return e*Xv[t]}(t,n),this.unit="px")}return t=e,r=[{key:"parse",value:function(t){var n,r=$v(null!==(n=qv.exec(t))&&void 0!==n?n:[],3),o=r[1],i=r[2];return new e(parseFloat(o),null!==i&&void 0!==i?i:"")}}],(n=[{key:"add",value:function(t){return this.unit!==t.unit?new e(NaN,""):new e(this.num+t.num,this.unit)}},{key:"subtract",value:function(t){return this.unit!==t.unit?new e(NaN,""):new e(this.num-t.num,this.unit)}},{key:"multiply",value:function(t){return""!==this.unit&&""!==t.unit&&this.unit!==t.unit?new e(NaN,""):new e(this.num*t.num,this.unit||t.unit)}},{key:"divide",value:function(t){return""!==this.unit&&""!==t.unit&&this.unit!==t.unit?new e(NaN,""):new e(this.num/t.num,this.unit||t.unit)}},{key:"toString",value:function(){return"".concat(this.num).concat(this.unit)}},{key:"isNaN",value:function(){return Number.isNaN(this.num)}}])&&Fv(t.prototype,n),r&&Fv(t,r),Object.defineProperty(t,"prototype",{writable:!1}),t;var t,n,r}();function Qv(e){if(e.includes(Gv))return Gv;for(var t=e;t.includes("*")||t.includes("/");){var n,r=$v(null!==(n=Uv.exec(t))&&void 0!==n?n:[],4),o=r[1],i=r[2],a=r[3],l=Yv.parse(null!==o&&void 0!==o?o:""),s=Yv.parse(null!==a&&void 0!==a?a:""),u="*"===i?l.multiply(s):l.divide(s);if(u.isNaN())return Gv;t=t.replace(Uv,u.toString())}for(;t.includes("+")||/.-\d+(?:\.\d+)?/.test(t);){var c,d=$v(null!==(c=Hv.exec(t))&&void 0!==c?c:[],4),f=d[1],p=d[2],h=d[3],m=Yv.parse(null!==f&&void 0!==f?f:""),y=Yv.parse(null!==h&&void 0!==h?h:""),v="+"===p?m.add(y):m.subtract(y);if(v.isNaN())return Gv;t=t.replace(Hv,v.toString())}return t}var Jv=/\(([^()]*)\)/;function Zv(e){var t=e.replace(/\s+/g,"");return t=function(e){for(var t=e;t.includes("(");){var n=$v(Jv.exec(t),2)[1];t=t.replace(Jv,Qv(n))}return t}(t),t=Qv(t)}function eg(e){var t=function(e){try{return Zv(e)}catch(SR){return Gv}}(e.slice(5,-1));return t===Gv?"":t}var tg=["x","y","lineHeight","capHeight","scaleToFit","textAnchor","verticalAnchor","fill"],ng=["dx","dy","angle","className","breakAll"];function rg(){return rg=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},rg.apply(this,arguments)}function og(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function ig(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return ag(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return ag(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function ag(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var lg=/[ \f\n\r\t\v\u2028\u2029]+/,sg=function(e){var t=e.children,n=e.breakAll,r=e.style;try{var o=[];return Mf()(t)||(o=n?t.toString().split(""):t.toString().split(lg)),{wordsWithComputedWidth:o.map((function(e){return{word:e,width:Lv(e,r).width}})),spaceWidth:n?0:Lv("\xa0",r).width}}catch(SR){return null}},ug=function(e){return[{words:Mf()(e)?[]:e.toString().split(lg)}]},cg=function(e){var t=e.width,n=e.scaleToFit,r=e.children,o=e.style,i=e.breakAll,a=e.maxLines;if((t||n)&&!eh.isSsr){var l=sg({breakAll:i,children:r,style:o});return l?function(e,t,n,r,o){var i=e.maxLines,a=e.children,l=e.style,s=e.breakAll,u=bf(i),c=a,d=function(){return(arguments.length>0&&void 0!==arguments[0]?arguments[0]:[]).reduce((function(e,t){var i=t.word,a=t.width,l=e[e.length-1];if(l&&(null==r||o||l.width+a+n<Number(r)))l.words.push(i),l.width+=a+n;else{var s={words:[i],width:a};e.push(s)}return e}),[])},f=d(t);if(!u)return f;for(var p,h=function(e){var t=c.slice(0,e),n=sg({breakAll:s,style:l,children:t+"\u2026"}).wordsWithComputedWidth,o=d(n),a=o.length>i||function(e){return e.reduce((function(e,t){return e.width>t.width?e:t}))}(o).width>Number(r);return[a,o]},m=0,y=c.length-1,v=0;m<=y&&v<=c.length-1;){var g=Math.floor((m+y)/2),b=ig(h(g-1),2),x=b[0],w=b[1],S=ig(h(g),1)[0];if(x||S||(m=g+1),x&&S&&(y=g-1),!x&&S){p=w;break}v++}return p||f}({breakAll:i,children:r,maxLines:a,style:o},l.wordsWithComputedWidth,l.spaceWidth,t,n):ug(r)}return ug(r)},dg="#808080",fg=function(e){var n=e.x,r=void 0===n?0:n,o=e.y,i=void 0===o?0:o,a=e.lineHeight,l=void 0===a?"1em":a,s=e.capHeight,u=void 0===s?"0.71em":s,c=e.scaleToFit,d=void 0!==c&&c,f=e.textAnchor,p=void 0===f?"start":f,h=e.verticalAnchor,m=void 0===h?"end":h,y=e.fill,v=void 0===y?dg:y,g=og(e,tg),b=(0,t.useMemo)((function(){return cg({breakAll:g.breakAll,children:g.children,maxLines:g.maxLines,scaleToFit:d,style:g.style,width:g.width})}),[g.breakAll,g.children,g.maxLines,d,g.style,g.width]),x=g.dx,w=g.dy,S=g.angle,A=g.className,O=g.breakAll,k=og(g,ng);if(!xf(r)||!xf(i))return null;var j,E=r+(bf(x)?x:0),C=i+(bf(w)?w:0);switch(m){case"start":j=eg("calc(".concat(u,")"));break;case"middle":j=eg("calc(".concat((b.length-1)/2," * -").concat(l," + (").concat(u," / 2))"));break;default:j=eg("calc(".concat(b.length-1," * -").concat(l,")"))}var P=[];if(d){var M=b[0].width,T=g.width;P.push("scale(".concat((bf(T)?T/M:1)/M,")"))}return S&&P.push("rotate(".concat(S,", ").concat(E,", ").concat(C,")")),P.length&&(k.transform=P.join(" ")),t.createElement("text",rg({},rp(k,!0),{x:E,y:C,className:zt("recharts-text",A),textAnchor:p,fill:v.includes("url")?dg:v}),b.map((function(e,n){var r=e.words.join(O?"":" ");return t.createElement("tspan",{x:E,dy:0===n?j:l,key:"".concat(r,"-").concat(n)},r)})))};const pg=Math.sqrt(50),hg=Math.sqrt(10),mg=Math.sqrt(2);function yg(e,t,n){const r=(t-e)/Math.max(0,n),o=Math.floor(Math.log10(r)),i=r/Math.pow(10,o),a=i>=pg?10:i>=hg?5:i>=mg?2:1;let l,s,u;return o<0?(u=Math.pow(10,-o)/a,l=Math.round(e*u),s=Math.round(t*u),l/u<e&&++l,s/u>t&&--s,u=-u):(u=Math.pow(10,o)*a,l=Math.round(e/u),s=Math.round(t/u),l*u<e&&++l,s*u>t&&--s),s<l&&.5<=n&&n<2?yg(e,t,2*n):[l,s,u]}function vg(e,t,n){if(!((n=+n)>0))return[];if((e=+e)===(t=+t))return[e];const r=t<e,[o,i,a]=r?yg(t,e,n):yg(e,t,n);if(!(i>=o))return[];const l=i-o+1,s=new Array(l);if(r)if(a<0)for(let u=0;u<l;++u)s[u]=(i-u)/-a;else for(let u=0;u<l;++u)s[u]=(i-u)*a;else if(a<0)for(let u=0;u<l;++u)s[u]=(o+u)/-a;else for(let u=0;u<l;++u)s[u]=(o+u)*a;return s}function gg(e,t,n){return yg(e=+e,t=+t,n=+n)[2]}function bg(e,t,n){n=+n;const r=(t=+t)<(e=+e),o=r?gg(t,e,n):gg(e,t,n);return(r?-1:1)*(o<0?1/-o:o)}function xg(e,t){return null==e||null==t?NaN:e<t?-1:e>t?1:e>=t?0:NaN}function wg(e,t){return null==e||null==t?NaN:t<e?-1:t>e?1:t>=e?0:NaN}function Sg(e){let t,n,r;function o(e,r){let o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,i=arguments.length>3&&void 0!==arguments[3]?arguments[3]:e.length;if(o<i){if(0!==t(r,r))return i;do{const t=o+i>>>1;n(e[t],r)<0?o=t+1:i=t}while(o<i)}return o}return 2!==e.length?(t=xg,n=(t,n)=>xg(e(t),n),r=(t,n)=>e(t)-n):(t=e===xg||e===wg?e:Ag,n=e,r=e),{left:o,center:function(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0;const i=o(e,t,n,(arguments.length>3&&void 0!==arguments[3]?arguments[3]:e.length)-1);return i>n&&r(e[i-1],t)>-r(e[i],t)?i-1:i},right:function(e,r){let o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,i=arguments.length>3&&void 0!==arguments[3]?arguments[3]:e.length;if(o<i){if(0!==t(r,r))return i;do{const t=o+i>>>1;n(e[t],r)<=0?o=t+1:i=t}while(o<i)}return o}}}function Ag(){return 0}function Og(e){return null===e?NaN:+e}const kg=Sg(xg),jg=kg.right,Eg=(kg.left,Sg(Og).center,jg);function Cg(e,t,n){e.prototype=t.prototype=n,n.constructor=e}function Pg(e,t){var n=Object.create(e.prototype);for(var r in t)n[r]=t[r];return n}function Mg(){}var Tg=.7,_g=1/Tg,Rg="\\s*([+-]?\\d+)\\s*",Ng="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",Ig="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",Dg=/^#([0-9a-f]{3,8})$/,Lg=new RegExp(`^rgb\\(${Rg},${Rg},${Rg}\\)$`),zg=new RegExp(`^rgb\\(${Ig},${Ig},${Ig}\\)$`),$g=new RegExp(`^rgba\\(${Rg},${Rg},${Rg},${Ng}\\)$`),Bg=new RegExp(`^rgba\\(${Ig},${Ig},${Ig},${Ng}\\)$`),Fg=new RegExp(`^hsl\\(${Ng},${Ig},${Ig}\\)$`),Wg=new RegExp(`^hsla\\(${Ng},${Ig},${Ig},${Ng}\\)$`),Ug={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};function Hg(){return this.rgb().formatHex()}function Vg(){return this.rgb().formatRgb()}function qg(e){var t,n;return e=(e+"").trim().toLowerCase(),(t=Dg.exec(e))?(n=t[1].length,t=parseInt(t[1],16),6===n?Xg(t):3===n?new Yg(t>>8&15|t>>4&240,t>>4&15|240&t,(15&t)<<4|15&t,1):8===n?Kg(t>>24&255,t>>16&255,t>>8&255,(255&t)/255):4===n?Kg(t>>12&15|t>>8&240,t>>8&15|t>>4&240,t>>4&15|240&t,((15&t)<<4|15&t)/255):null):(t=Lg.exec(e))?new Yg(t[1],t[2],t[3],1):(t=zg.exec(e))?new Yg(255*t[1]/100,255*t[2]/100,255*t[3]/100,1):(t=$g.exec(e))?Kg(t[1],t[2],t[3],t[4]):(t=Bg.exec(e))?Kg(255*t[1]/100,255*t[2]/100,255*t[3]/100,t[4]):(t=Fg.exec(e))?nb(t[1],t[2]/100,t[3]/100,1):(t=Wg.exec(e))?nb(t[1],t[2]/100,t[3]/100,t[4]):Ug.hasOwnProperty(e)?Xg(Ug[e]):"transparent"===e?new Yg(NaN,NaN,NaN,0):null}function Xg(e){return new Yg(e>>16&255,e>>8&255,255&e,1)}function Kg(e,t,n,r){return r<=0&&(e=t=n=NaN),new Yg(e,t,n,r)}function Gg(e,t,n,r){return 1===arguments.length?((o=e)instanceof Mg||(o=qg(o)),o?new Yg((o=o.rgb()).r,o.g,o.b,o.opacity):new Yg):new Yg(e,t,n,null==r?1:r);var o}function Yg(e,t,n,r){this.r=+e,this.g=+t,this.b=+n,this.opacity=+r}function Qg(){return`#${tb(this.r)}${tb(this.g)}${tb(this.b)}`}function Jg(){const e=Zg(this.opacity);return`${1===e?"rgb(":"rgba("}${eb(this.r)}, ${eb(this.g)}, ${eb(this.b)}${1===e?")":`, ${e})`}`}function Zg(e){return isNaN(e)?1:Math.max(0,Math.min(1,e))}function eb(e){return Math.max(0,Math.min(255,Math.round(e)||0))}function tb(e){return((e=eb(e))<16?"0":"")+e.toString(16)}function nb(e,t,n,r){return r<=0?e=t=n=NaN:n<=0||n>=1?e=t=NaN:t<=0&&(e=NaN),new ob(e,t,n,r)}function rb(e){if(e instanceof ob)return new ob(e.h,e.s,e.l,e.opacity);if(e instanceof Mg||(e=qg(e)),!e)return new ob;if(e instanceof ob)return e;var t=(e=e.rgb()).r/255,n=e.g/255,r=e.b/255,o=Math.min(t,n,r),i=Math.max(t,n,r),a=NaN,l=i-o,s=(i+o)/2;return l?(a=t===i?(n-r)/l+6*(n<r):n===i?(r-t)/l+2:(t-n)/l+4,l/=s<.5?i+o:2-i-o,a*=60):l=s>0&&s<1?0:a,new ob(a,l,s,e.opacity)}function ob(e,t,n,r){this.h=+e,this.s=+t,this.l=+n,this.opacity=+r}function ib(e){return(e=(e||0)%360)<0?e+360:e}function ab(e){return Math.max(0,Math.min(1,e||0))}function lb(e,t,n){return 255*(e<60?t+(n-t)*e/60:e<180?n:e<240?t+(n-t)*(240-e)/60:t)}function sb(e,t,n,r,o){var i=e*e,a=i*e;return((1-3*e+3*i-a)*t+(4-6*i+3*a)*n+(1+3*e+3*i-3*a)*r+a*o)/6}Cg(Mg,qg,{copy(e){return Object.assign(new this.constructor,this,e)},displayable(){return this.rgb().displayable()},hex:Hg,formatHex:Hg,formatHex8:function(){return this.rgb().formatHex8()},formatHsl:function(){return rb(this).formatHsl()},formatRgb:Vg,toString:Vg}),Cg(Yg,Gg,Pg(Mg,{brighter(e){return e=null==e?_g:Math.pow(_g,e),new Yg(this.r*e,this.g*e,this.b*e,this.opacity)},darker(e){return e=null==e?Tg:Math.pow(Tg,e),new Yg(this.r*e,this.g*e,this.b*e,this.opacity)},rgb(){return this},clamp(){return new Yg(eb(this.r),eb(this.g),eb(this.b),Zg(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:Qg,formatHex:Qg,formatHex8:function(){return`#${tb(this.r)}${tb(this.g)}${tb(this.b)}${tb(255*(isNaN(this.opacity)?1:this.opacity))}`},formatRgb:Jg,toString:Jg})),Cg(ob,(function(e,t,n,r){return 1===arguments.length?rb(e):new ob(e,t,n,null==r?1:r)}),Pg(Mg,{brighter(e){return e=null==e?_g:Math.pow(_g,e),new ob(this.h,this.s,this.l*e,this.opacity)},darker(e){return e=null==e?Tg:Math.pow(Tg,e),new ob(this.h,this.s,this.l*e,this.opacity)},rgb(){var e=this.h%360+360*(this.h<0),t=isNaN(e)||isNaN(this.s)?0:this.s,n=this.l,r=n+(n<.5?n:1-n)*t,o=2*n-r;return new Yg(lb(e>=240?e-240:e+120,o,r),lb(e,o,r),lb(e<120?e+240:e-120,o,r),this.opacity)},clamp(){return new ob(ib(this.h),ab(this.s),ab(this.l),Zg(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){const e=Zg(this.opacity);return`${1===e?"hsl(":"hsla("}${ib(this.h)}, ${100*ab(this.s)}%, ${100*ab(this.l)}%${1===e?")":`, ${e})`}`}}));const ub=e=>()=>e;function cb(e,t){return function(n){return e+n*t}}function db(e){return 1===(e=+e)?fb:function(t,n){return n-t?function(e,t,n){return e=Math.pow(e,n),t=Math.pow(t,n)-e,n=1/n,function(r){return Math.pow(e+r*t,n)}}(t,n,e):ub(isNaN(t)?n:t)}}function fb(e,t){var n=t-e;return n?cb(e,n):ub(isNaN(e)?t:e)}const pb=function e(t){var n=db(t);function r(e,t){var r=n((e=Gg(e)).r,(t=Gg(t)).r),o=n(e.g,t.g),i=n(e.b,t.b),a=fb(e.opacity,t.opacity);return function(t){return e.r=r(t),e.g=o(t),e.b=i(t),e.opacity=a(t),e+""}}return r.gamma=e,r}(1);function hb(e){return function(t){var n,r,o=t.length,i=new Array(o),a=new Array(o),l=new Array(o);for(n=0;n<o;++n)r=Gg(t[n]),i[n]=r.r||0,a[n]=r.g||0,l[n]=r.b||0;return i=e(i),a=e(a),l=e(l),r.opacity=1,function(e){return r.r=i(e),r.g=a(e),r.b=l(e),r+""}}}hb((function(e){var t=e.length-1;return function(n){var r=n<=0?n=0:n>=1?(n=1,t-1):Math.floor(n*t),o=e[r],i=e[r+1],a=r>0?e[r-1]:2*o-i,l=r<t-1?e[r+2]:2*i-o;return sb((n-r/t)*t,a,o,i,l)}})),hb((function(e){var t=e.length;return function(n){var r=Math.floor(((n%=1)<0?++n:n)*t),o=e[(r+t-1)%t],i=e[r%t],a=e[(r+1)%t],l=e[(r+2)%t];return sb((n-r/t)*t,o,i,a,l)}}));function mb(e,t){var n,r=t?t.length:0,o=e?Math.min(r,e.length):0,i=new Array(o),a=new Array(r);for(n=0;n<o;++n)i[n]=Ab(e[n],t[n]);for(;n<r;++n)a[n]=t[n];return function(e){for(n=0;n<o;++n)a[n]=i[n](e);return a}}function yb(e,t){var n=new Date;return e=+e,t=+t,function(r){return n.setTime(e*(1-r)+t*r),n}}function vb(e,t){return e=+e,t=+t,function(n){return e*(1-n)+t*n}}function gb(e,t){var n,r={},o={};for(n in null!==e&&"object"===typeof e||(e={}),null!==t&&"object"===typeof t||(t={}),t)n in e?r[n]=Ab(e[n],t[n]):o[n]=t[n];return function(e){for(n in r)o[n]=r[n](e);return o}}var bb=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,xb=new RegExp(bb.source,"g");function wb(e,t){var n,r,o,i=bb.lastIndex=xb.lastIndex=0,a=-1,l=[],s=[];for(e+="",t+="";(n=bb.exec(e))&&(r=xb.exec(t));)(o=r.index)>i&&(o=t.slice(i,o),l[a]?l[a]+=o:l[++a]=o),(n=n[0])===(r=r[0])?l[a]?l[a]+=r:l[++a]=r:(l[++a]=null,s.push({i:a,x:vb(n,r)})),i=xb.lastIndex;return i<t.length&&(o=t.slice(i),l[a]?l[a]+=o:l[++a]=o),l.length<2?s[0]?function(e){return function(t){return e(t)+""}}(s[0].x):function(e){return function(){return e}}(t):(t=s.length,function(e){for(var n,r=0;r<t;++r)l[(n=s[r]).i]=n.x(e);return l.join("")})}function Sb(e,t){t||(t=[]);var n,r=e?Math.min(t.length,e.length):0,o=t.slice();return function(i){for(n=0;n<r;++n)o[n]=e[n]*(1-i)+t[n]*i;return o}}function Ab(e,t){var n,r,o=typeof t;return null==t||"boolean"===o?ub(t):("number"===o?vb:"string"===o?(n=qg(t))?(t=n,pb):wb:t instanceof qg?pb:t instanceof Date?yb:(r=t,!ArrayBuffer.isView(r)||r instanceof DataView?Array.isArray(t)?mb:"function"!==typeof t.valueOf&&"function"!==typeof t.toString||isNaN(t)?gb:vb:Sb))(e,t)}function Ob(e,t){return e=+e,t=+t,function(n){return Math.round(e*(1-n)+t*n)}}function kb(e){return+e}var jb=[0,1];function Eb(e){return e}function Cb(e,t){return(t-=e=+e)?function(n){return(n-e)/t}:(n=isNaN(t)?NaN:.5,function(){return n});var n}function Pb(e,t,n){var r=e[0],o=e[1],i=t[0],a=t[1];return o<r?(r=Cb(o,r),i=n(a,i)):(r=Cb(r,o),i=n(i,a)),function(e){return i(r(e))}}function Mb(e,t,n){var r=Math.min(e.length,t.length)-1,o=new Array(r),i=new Array(r),a=-1;for(e[r]<e[0]&&(e=e.slice().reverse(),t=t.slice().reverse());++a<r;)o[a]=Cb(e[a],e[a+1]),i[a]=n(t[a],t[a+1]);return function(t){var n=Eg(e,t,1,r)-1;return i[n](o[n](t))}}function Tb(e,t){return t.domain(e.domain()).range(e.range()).interpolate(e.interpolate()).clamp(e.clamp()).unknown(e.unknown())}function _b(){var e,t,n,r,o,i,a=jb,l=jb,s=Ab,u=Eb;function c(){var e=Math.min(a.length,l.length);return u!==Eb&&(u=function(e,t){var n;return e>t&&(n=e,e=t,t=n),function(n){return Math.max(e,Math.min(t,n))}}(a[0],a[e-1])),r=e>2?Mb:Pb,o=i=null,d}function d(t){return null==t||isNaN(t=+t)?n:(o||(o=r(a.map(e),l,s)))(e(u(t)))}return d.invert=function(n){return u(t((i||(i=r(l,a.map(e),vb)))(n)))},d.domain=function(e){return arguments.length?(a=Array.from(e,kb),c()):a.slice()},d.range=function(e){return arguments.length?(l=Array.from(e),c()):l.slice()},d.rangeRound=function(e){return l=Array.from(e),s=Ob,c()},d.clamp=function(e){return arguments.length?(u=!!e||Eb,c()):u!==Eb},d.interpolate=function(e){return arguments.length?(s=e,c()):s},d.unknown=function(e){return arguments.length?(n=e,d):n},function(n,r){return e=n,t=r,c()}}function Rb(){return _b()(Eb,Eb)}var Nb,Ib=/^(?:(.)?([<>=^]))?([+\-( ])?([$#])?(0)?(\d+)?(,)?(\.\d+)?(~)?([a-z%])?$/i;function Db(e){if(!(t=Ib.exec(e)))throw new Error("invalid format: "+e);var t;return new Lb({fill:t[1],align:t[2],sign:t[3],symbol:t[4],zero:t[5],width:t[6],comma:t[7],precision:t[8]&&t[8].slice(1),trim:t[9],type:t[10]})}function Lb(e){this.fill=void 0===e.fill?" ":e.fill+"",this.align=void 0===e.align?">":e.align+"",this.sign=void 0===e.sign?"-":e.sign+"",this.symbol=void 0===e.symbol?"":e.symbol+"",this.zero=!!e.zero,this.width=void 0===e.width?void 0:+e.width,this.comma=!!e.comma,this.precision=void 0===e.precision?void 0:+e.precision,this.trim=!!e.trim,this.type=void 0===e.type?"":e.type+""}function zb(e,t){if((n=(e=t?e.toExponential(t-1):e.toExponential()).indexOf("e"))<0)return null;var n,r=e.slice(0,n);return[r.length>1?r[0]+r.slice(2):r,+e.slice(n+1)]}function $b(e){return(e=zb(Math.abs(e)))?e[1]:NaN}function Bb(e,t){var n=zb(e,t);if(!n)return e+"";var r=n[0],o=n[1];return o<0?"0."+new Array(-o).join("0")+r:r.length>o+1?r.slice(0,o+1)+"."+r.slice(o+1):r+new Array(o-r.length+2).join("0")}Db.prototype=Lb.prototype,Lb.prototype.toString=function(){return this.fill+this.align+this.sign+this.symbol+(this.zero?"0":"")+(void 0===this.width?"":Math.max(1,0|this.width))+(this.comma?",":"")+(void 0===this.precision?"":"."+Math.max(0,0|this.precision))+(this.trim?"~":"")+this.type};const Fb={"%":(e,t)=>(100*e).toFixed(t),b:e=>Math.round(e).toString(2),c:e=>e+"",d:function(e){return Math.abs(e=Math.round(e))>=1e21?e.toLocaleString("en").replace(/,/g,""):e.toString(10)},e:(e,t)=>e.toExponential(t),f:(e,t)=>e.toFixed(t),g:(e,t)=>e.toPrecision(t),o:e=>Math.round(e).toString(8),p:(e,t)=>Bb(100*e,t),r:Bb,s:function(e,t){var n=zb(e,t);if(!n)return e+"";var r=n[0],o=n[1],i=o-(Nb=3*Math.max(-8,Math.min(8,Math.floor(o/3))))+1,a=r.length;return i===a?r:i>a?r+new Array(i-a+1).join("0"):i>0?r.slice(0,i)+"."+r.slice(i):"0."+new Array(1-i).join("0")+zb(e,Math.max(0,t+i-1))[0]},X:e=>Math.round(e).toString(16).toUpperCase(),x:e=>Math.round(e).toString(16)};function Wb(e){return e}var Ub,Hb,Vb,qb=Array.prototype.map,Xb=["y","z","a","f","p","n","\xb5","m","","k","M","G","T","P","E","Z","Y"];function Kb(e){var t,n,r=void 0===e.grouping||void 0===e.thousands?Wb:(t=qb.call(e.grouping,Number),n=e.thousands+"",function(e,r){for(var o=e.length,i=[],a=0,l=t[0],s=0;o>0&&l>0&&(s+l+1>r&&(l=Math.max(1,r-s)),i.push(e.substring(o-=l,o+l)),!((s+=l+1)>r));)l=t[a=(a+1)%t.length];return i.reverse().join(n)}),o=void 0===e.currency?"":e.currency[0]+"",i=void 0===e.currency?"":e.currency[1]+"",a=void 0===e.decimal?".":e.decimal+"",l=void 0===e.numerals?Wb:function(e){return function(t){return t.replace(/[0-9]/g,(function(t){return e[+t]}))}}(qb.call(e.numerals,String)),s=void 0===e.percent?"%":e.percent+"",u=void 0===e.minus?"\u2212":e.minus+"",c=void 0===e.nan?"NaN":e.nan+"";function d(e){var t=(e=Db(e)).fill,n=e.align,d=e.sign,f=e.symbol,p=e.zero,h=e.width,m=e.comma,y=e.precision,v=e.trim,g=e.type;"n"===g?(m=!0,g="g"):Fb[g]||(void 0===y&&(y=12),v=!0,g="g"),(p||"0"===t&&"="===n)&&(p=!0,t="0",n="=");var b="$"===f?o:"#"===f&&/[boxX]/.test(g)?"0"+g.toLowerCase():"",x="$"===f?i:/[%p]/.test(g)?s:"",w=Fb[g],S=/[defgprs%]/.test(g);function A(e){var o,i,s,f=b,A=x;if("c"===g)A=w(e)+A,e="";else{var O=(e=+e)<0||1/e<0;if(e=isNaN(e)?c:w(Math.abs(e),y),v&&(e=function(e){e:for(var t,n=e.length,r=1,o=-1;r<n;++r)switch(e[r]){case".":o=t=r;break;case"0":0===o&&(o=r),t=r;break;default:if(!+e[r])break e;o>0&&(o=0)}return o>0?e.slice(0,o)+e.slice(t+1):e}(e)),O&&0===+e&&"+"!==d&&(O=!1),f=(O?"("===d?d:u:"-"===d||"("===d?"":d)+f,A=("s"===g?Xb[8+Nb/3]:"")+A+(O&&"("===d?")":""),S)for(o=-1,i=e.length;++o<i;)if(48>(s=e.charCodeAt(o))||s>57){A=(46===s?a+e.slice(o+1):e.slice(o))+A,e=e.slice(0,o);break}}m&&!p&&(e=r(e,1/0));var k=f.length+e.length+A.length,j=k<h?new Array(h-k+1).join(t):"";switch(m&&p&&(e=r(j+e,j.length?h-A.length:1/0),j=""),n){case"<":e=f+e+A+j;break;case"=":e=f+j+e+A;break;case"^":e=j.slice(0,k=j.length>>1)+f+e+A+j.slice(k);break;default:e=j+f+e+A}return l(e)}return y=void 0===y?6:/[gprs]/.test(g)?Math.max(1,Math.min(21,y)):Math.max(0,Math.min(20,y)),A.toString=function(){return e+""},A}return{format:d,formatPrefix:function(e,t){var n=d(((e=Db(e)).type="f",e)),r=3*Math.max(-8,Math.min(8,Math.floor($b(t)/3))),o=Math.pow(10,-r),i=Xb[8+r/3];return function(e){return n(o*e)+i}}}}function Gb(e,t,n,r){var o,i=bg(e,t,n);switch((r=Db(null==r?",f":r)).type){case"s":var a=Math.max(Math.abs(e),Math.abs(t));return null!=r.precision||isNaN(o=function(e,t){return Math.max(0,3*Math.max(-8,Math.min(8,Math.floor($b(t)/3)))-$b(Math.abs(e)))}(i,a))||(r.precision=o),Vb(r,a);case"":case"e":case"g":case"p":case"r":null!=r.precision||isNaN(o=function(e,t){return e=Math.abs(e),t=Math.abs(t)-e,Math.max(0,$b(t)-$b(e))+1}(i,Math.max(Math.abs(e),Math.abs(t))))||(r.precision=o-("e"===r.type));break;case"f":case"%":null!=r.precision||isNaN(o=function(e){return Math.max(0,-$b(Math.abs(e)))}(i))||(r.precision=o-2*("%"===r.type))}return Hb(r)}function Yb(e){var t=e.domain;return e.ticks=function(e){var n=t();return vg(n[0],n[n.length-1],null==e?10:e)},e.tickFormat=function(e,n){var r=t();return Gb(r[0],r[r.length-1],null==e?10:e,n)},e.nice=function(n){null==n&&(n=10);var r,o,i=t(),a=0,l=i.length-1,s=i[a],u=i[l],c=10;for(u<s&&(o=s,s=u,u=o,o=a,a=l,l=o);c-- >0;){if((o=gg(s,u,n))===r)return i[a]=s,i[l]=u,t(i);if(o>0)s=Math.floor(s/o)*o,u=Math.ceil(u/o)*o;else{if(!(o<0))break;s=Math.ceil(s*o)/o,u=Math.floor(u*o)/o}r=o}return e},e}function Qb(){var e=Rb();return e.copy=function(){return Tb(e,Qb())},gv.apply(e,arguments),Yb(e)}function Jb(e){var t;function n(e){return null==e||isNaN(e=+e)?t:e}return n.invert=n,n.domain=n.range=function(t){return arguments.length?(e=Array.from(t,kb),n):e.slice()},n.unknown=function(e){return arguments.length?(t=e,n):t},n.copy=function(){return Jb(e).unknown(t)},e=arguments.length?Array.from(e,kb):[0,1],Yb(n)}function Zb(e,t){var n,r=0,o=(e=e.slice()).length-1,i=e[r],a=e[o];return a<i&&(n=r,r=o,o=n,n=i,i=a,a=n),e[r]=t.floor(i),e[o]=t.ceil(a),e}function ex(e){return Math.log(e)}function tx(e){return Math.exp(e)}function nx(e){return-Math.log(-e)}function rx(e){return-Math.exp(-e)}function ox(e){return isFinite(e)?+("1e"+e):e<0?0:e}function ix(e){return(t,n)=>-e(-t,n)}function ax(e){const t=e(ex,tx),n=t.domain;let r,o,i=10;function a(){return r=function(e){return e===Math.E?Math.log:10===e&&Math.log10||2===e&&Math.log2||(e=Math.log(e),t=>Math.log(t)/e)}(i),o=function(e){return 10===e?ox:e===Math.E?Math.exp:t=>Math.pow(e,t)}(i),n()[0]<0?(r=ix(r),o=ix(o),e(nx,rx)):e(ex,tx),t}return t.base=function(e){return arguments.length?(i=+e,a()):i},t.domain=function(e){return arguments.length?(n(e),a()):n()},t.ticks=e=>{const t=n();let a=t[0],l=t[t.length-1];const s=l<a;s&&([a,l]=[l,a]);let u,c,d=r(a),f=r(l);const p=null==e?10:+e;let h=[];if(!(i%1)&&f-d<p){if(d=Math.floor(d),f=Math.ceil(f),a>0){for(;d<=f;++d)for(u=1;u<i;++u)if(c=d<0?u/o(-d):u*o(d),!(c<a)){if(c>l)break;h.push(c)}}else for(;d<=f;++d)for(u=i-1;u>=1;--u)if(c=d>0?u/o(-d):u*o(d),!(c<a)){if(c>l)break;h.push(c)}2*h.length<p&&(h=vg(a,l,p))}else h=vg(d,f,Math.min(f-d,p)).map(o);return s?h.reverse():h},t.tickFormat=(e,n)=>{if(null==e&&(e=10),null==n&&(n=10===i?"s":","),"function"!==typeof n&&(i%1||null!=(n=Db(n)).precision||(n.trim=!0),n=Hb(n)),e===1/0)return n;const a=Math.max(1,i*e/t.ticks().length);return e=>{let t=e/o(Math.round(r(e)));return t*i<i-.5&&(t*=i),t<=a?n(e):""}},t.nice=()=>n(Zb(n(),{floor:e=>o(Math.floor(r(e))),ceil:e=>o(Math.ceil(r(e)))})),t}function lx(){const e=ax(_b()).domain([1,10]);return e.copy=()=>Tb(e,lx()).base(e.base()),gv.apply(e,arguments),e}function sx(e){return function(t){return Math.sign(t)*Math.log1p(Math.abs(t/e))}}function ux(e){return function(t){return Math.sign(t)*Math.expm1(Math.abs(t))*e}}function cx(e){var t=1,n=e(sx(t),ux(t));return n.constant=function(n){return arguments.length?e(sx(t=+n),ux(t)):t},Yb(n)}function dx(){var e=cx(_b());return e.copy=function(){return Tb(e,dx()).constant(e.constant())},gv.apply(e,arguments)}function fx(e){return function(t){return t<0?-Math.pow(-t,e):Math.pow(t,e)}}function px(e){return e<0?-Math.sqrt(-e):Math.sqrt(e)}function hx(e){return e<0?-e*e:e*e}function mx(e){var t=e(Eb,Eb),n=1;return t.exponent=function(t){return arguments.length?1===(n=+t)?e(Eb,Eb):.5===n?e(px,hx):e(fx(n),fx(1/n)):n},Yb(t)}function yx(){var e=mx(_b());return e.copy=function(){return Tb(e,yx()).exponent(e.exponent())},gv.apply(e,arguments),e}function vx(){return yx.apply(null,arguments).exponent(.5)}function gx(e){return Math.sign(e)*e*e}function bx(){var e,t=Rb(),n=[0,1],r=!1;function o(n){var o=function(e){return Math.sign(e)*Math.sqrt(Math.abs(e))}(t(n));return isNaN(o)?e:r?Math.round(o):o}return o.invert=function(e){return t.invert(gx(e))},o.domain=function(e){return arguments.length?(t.domain(e),o):t.domain()},o.range=function(e){return arguments.length?(t.range((n=Array.from(e,kb)).map(gx)),o):n.slice()},o.rangeRound=function(e){return o.range(e).round(!0)},o.round=function(e){return arguments.length?(r=!!e,o):r},o.clamp=function(e){return arguments.length?(t.clamp(e),o):t.clamp()},o.unknown=function(t){return arguments.length?(e=t,o):e},o.copy=function(){return bx(t.domain(),n).round(r).clamp(t.clamp()).unknown(e)},gv.apply(o,arguments),Yb(o)}function xx(e,t){let n;if(void 0===t)for(const r of e)null!=r&&(n<r||void 0===n&&r>=r)&&(n=r);else{let r=-1;for(let o of e)null!=(o=t(o,++r,e))&&(n<o||void 0===n&&o>=o)&&(n=o)}return n}function wx(e,t){let n;if(void 0===t)for(const r of e)null!=r&&(n>r||void 0===n&&r>=r)&&(n=r);else{let r=-1;for(let o of e)null!=(o=t(o,++r,e))&&(n>o||void 0===n&&o>=o)&&(n=o)}return n}function Sx(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:xg;if(e===xg)return Ax;if("function"!==typeof e)throw new TypeError("compare is not a function");return(t,n)=>{const r=e(t,n);return r||0===r?r:(0===e(n,n))-(0===e(t,t))}}function Ax(e,t){return(null==e||!(e>=e))-(null==t||!(t>=t))||(e<t?-1:e>t?1:0)}function Ox(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:1/0,o=arguments.length>4?arguments[4]:void 0;if(t=Math.floor(t),n=Math.floor(Math.max(0,n)),r=Math.floor(Math.min(e.length-1,r)),!(n<=t&&t<=r))return e;for(o=void 0===o?Ax:Sx(o);r>n;){if(r-n>600){const i=r-n+1,a=t-n+1,l=Math.log(i),s=.5*Math.exp(2*l/3),u=.5*Math.sqrt(l*s*(i-s)/i)*(a-i/2<0?-1:1);Ox(e,t,Math.max(n,Math.floor(t-a*s/i+u)),Math.min(r,Math.floor(t+(i-a)*s/i+u)),o)}const i=e[t];let a=n,l=r;for(kx(e,n,t),o(e[r],i)>0&&kx(e,n,r);a<l;){for(kx(e,a,l),++a,--l;o(e[a],i)<0;)++a;for(;o(e[l],i)>0;)--l}0===o(e[n],i)?kx(e,n,l):(++l,kx(e,l,r)),l<=t&&(n=l+1),t<=l&&(r=l-1)}return e}function kx(e,t,n){const r=e[t];e[t]=e[n],e[n]=r}function jx(e,t,n){if(e=Float64Array.from(function*(e,t){if(void 0===t)for(let n of e)null!=n&&(n=+n)>=n&&(yield n);else{let n=-1;for(let r of e)null!=(r=t(r,++n,e))&&(r=+r)>=r&&(yield r)}}(e,n)),(r=e.length)&&!isNaN(t=+t)){if(t<=0||r<2)return wx(e);if(t>=1)return xx(e);var r,o=(r-1)*t,i=Math.floor(o),a=xx(Ox(e,i).subarray(0,i+1));return a+(wx(e.subarray(i+1))-a)*(o-i)}}function Ex(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:Og;if((r=e.length)&&!isNaN(t=+t)){if(t<=0||r<2)return+n(e[0],0,e);if(t>=1)return+n(e[r-1],r-1,e);var r,o=(r-1)*t,i=Math.floor(o),a=+n(e[i],i,e);return a+(+n(e[i+1],i+1,e)-a)*(o-i)}}function Cx(){var e,t=[],n=[],r=[];function o(){var e=0,o=Math.max(1,n.length);for(r=new Array(o-1);++e<o;)r[e-1]=Ex(t,e/o);return i}function i(t){return null==t||isNaN(t=+t)?e:n[Eg(r,t)]}return i.invertExtent=function(e){var o=n.indexOf(e);return o<0?[NaN,NaN]:[o>0?r[o-1]:t[0],o<r.length?r[o]:t[t.length-1]]},i.domain=function(e){if(!arguments.length)return t.slice();t=[];for(let n of e)null==n||isNaN(n=+n)||t.push(n);return t.sort(xg),o()},i.range=function(e){return arguments.length?(n=Array.from(e),o()):n.slice()},i.unknown=function(t){return arguments.length?(e=t,i):e},i.quantiles=function(){return r.slice()},i.copy=function(){return Cx().domain(t).range(n).unknown(e)},gv.apply(i,arguments)}function Px(){var e,t=0,n=1,r=1,o=[.5],i=[0,1];function a(t){return null!=t&&t<=t?i[Eg(o,t,0,r)]:e}function l(){var e=-1;for(o=new Array(r);++e<r;)o[e]=((e+1)*n-(e-r)*t)/(r+1);return a}return a.domain=function(e){return arguments.length?([t,n]=e,t=+t,n=+n,l()):[t,n]},a.range=function(e){return arguments.length?(r=(i=Array.from(e)).length-1,l()):i.slice()},a.invertExtent=function(e){var a=i.indexOf(e);return a<0?[NaN,NaN]:a<1?[t,o[0]]:a>=r?[o[r-1],n]:[o[a-1],o[a]]},a.unknown=function(t){return arguments.length?(e=t,a):a},a.thresholds=function(){return o.slice()},a.copy=function(){return Px().domain([t,n]).range(i).unknown(e)},gv.apply(Yb(a),arguments)}function Mx(){var e,t=[.5],n=[0,1],r=1;function o(o){return null!=o&&o<=o?n[Eg(t,o,0,r)]:e}return o.domain=function(e){return arguments.length?(t=Array.from(e),r=Math.min(t.length,n.length-1),o):t.slice()},o.range=function(e){return arguments.length?(n=Array.from(e),r=Math.min(t.length,n.length-1),o):n.slice()},o.invertExtent=function(e){var r=n.indexOf(e);return[t[r-1],t[r]]},o.unknown=function(t){return arguments.length?(e=t,o):e},o.copy=function(){return Mx().domain(t).range(n).unknown(e)},gv.apply(o,arguments)}Ub=Kb({thousands:",",grouping:[3],currency:["$",""]}),Hb=Ub.format,Vb=Ub.formatPrefix;const Tx=1e3,_x=6e4,Rx=36e5,Nx=864e5,Ix=6048e5,Dx=2592e6,Lx=31536e6,zx=new Date,$x=new Date;function Bx(e,t,n,r){function o(t){return e(t=0===arguments.length?new Date:new Date(+t)),t}return o.floor=t=>(e(t=new Date(+t)),t),o.ceil=n=>(e(n=new Date(n-1)),t(n,1),e(n),n),o.round=e=>{const t=o(e),n=o.ceil(e);return e-t<n-e?t:n},o.offset=(e,n)=>(t(e=new Date(+e),null==n?1:Math.floor(n)),e),o.range=(n,r,i)=>{const a=[];if(n=o.ceil(n),i=null==i?1:Math.floor(i),!(n<r)||!(i>0))return a;let l;do{a.push(l=new Date(+n)),t(n,i),e(n)}while(l<n&&n<r);return a},o.filter=n=>Bx((t=>{if(t>=t)for(;e(t),!n(t);)t.setTime(t-1)}),((e,r)=>{if(e>=e)if(r<0)for(;++r<=0;)for(;t(e,-1),!n(e););else for(;--r>=0;)for(;t(e,1),!n(e););})),n&&(o.count=(t,r)=>(zx.setTime(+t),$x.setTime(+r),e(zx),e($x),Math.floor(n(zx,$x))),o.every=e=>(e=Math.floor(e),isFinite(e)&&e>0?e>1?o.filter(r?t=>r(t)%e===0:t=>o.count(0,t)%e===0):o:null)),o}const Fx=Bx((()=>{}),((e,t)=>{e.setTime(+e+t)}),((e,t)=>t-e));Fx.every=e=>(e=Math.floor(e),isFinite(e)&&e>0?e>1?Bx((t=>{t.setTime(Math.floor(t/e)*e)}),((t,n)=>{t.setTime(+t+n*e)}),((t,n)=>(n-t)/e)):Fx:null);Fx.range;const Wx=Bx((e=>{e.setTime(e-e.getMilliseconds())}),((e,t)=>{e.setTime(+e+t*Tx)}),((e,t)=>(t-e)/Tx),(e=>e.getUTCSeconds())),Ux=(Wx.range,Bx((e=>{e.setTime(e-e.getMilliseconds()-e.getSeconds()*Tx)}),((e,t)=>{e.setTime(+e+t*_x)}),((e,t)=>(t-e)/_x),(e=>e.getMinutes()))),Hx=(Ux.range,Bx((e=>{e.setUTCSeconds(0,0)}),((e,t)=>{e.setTime(+e+t*_x)}),((e,t)=>(t-e)/_x),(e=>e.getUTCMinutes()))),Vx=(Hx.range,Bx((e=>{e.setTime(e-e.getMilliseconds()-e.getSeconds()*Tx-e.getMinutes()*_x)}),((e,t)=>{e.setTime(+e+t*Rx)}),((e,t)=>(t-e)/Rx),(e=>e.getHours()))),qx=(Vx.range,Bx((e=>{e.setUTCMinutes(0,0,0)}),((e,t)=>{e.setTime(+e+t*Rx)}),((e,t)=>(t-e)/Rx),(e=>e.getUTCHours()))),Xx=(qx.range,Bx((e=>e.setHours(0,0,0,0)),((e,t)=>e.setDate(e.getDate()+t)),((e,t)=>(t-e-(t.getTimezoneOffset()-e.getTimezoneOffset())*_x)/Nx),(e=>e.getDate()-1))),Kx=(Xx.range,Bx((e=>{e.setUTCHours(0,0,0,0)}),((e,t)=>{e.setUTCDate(e.getUTCDate()+t)}),((e,t)=>(t-e)/Nx),(e=>e.getUTCDate()-1))),Gx=(Kx.range,Bx((e=>{e.setUTCHours(0,0,0,0)}),((e,t)=>{e.setUTCDate(e.getUTCDate()+t)}),((e,t)=>(t-e)/Nx),(e=>Math.floor(e/Nx))));Gx.range;function Yx(e){return Bx((t=>{t.setDate(t.getDate()-(t.getDay()+7-e)%7),t.setHours(0,0,0,0)}),((e,t)=>{e.setDate(e.getDate()+7*t)}),((e,t)=>(t-e-(t.getTimezoneOffset()-e.getTimezoneOffset())*_x)/Ix))}const Qx=Yx(0),Jx=Yx(1),Zx=Yx(2),ew=Yx(3),tw=Yx(4),nw=Yx(5),rw=Yx(6);Qx.range,Jx.range,Zx.range,ew.range,tw.range,nw.range,rw.range;function ow(e){return Bx((t=>{t.setUTCDate(t.getUTCDate()-(t.getUTCDay()+7-e)%7),t.setUTCHours(0,0,0,0)}),((e,t)=>{e.setUTCDate(e.getUTCDate()+7*t)}),((e,t)=>(t-e)/Ix))}const iw=ow(0),aw=ow(1),lw=ow(2),sw=ow(3),uw=ow(4),cw=ow(5),dw=ow(6),fw=(iw.range,aw.range,lw.range,sw.range,uw.range,cw.range,dw.range,Bx((e=>{e.setDate(1),e.setHours(0,0,0,0)}),((e,t)=>{e.setMonth(e.getMonth()+t)}),((e,t)=>t.getMonth()-e.getMonth()+12*(t.getFullYear()-e.getFullYear())),(e=>e.getMonth()))),pw=(fw.range,Bx((e=>{e.setUTCDate(1),e.setUTCHours(0,0,0,0)}),((e,t)=>{e.setUTCMonth(e.getUTCMonth()+t)}),((e,t)=>t.getUTCMonth()-e.getUTCMonth()+12*(t.getUTCFullYear()-e.getUTCFullYear())),(e=>e.getUTCMonth()))),hw=(pw.range,Bx((e=>{e.setMonth(0,1),e.setHours(0,0,0,0)}),((e,t)=>{e.setFullYear(e.getFullYear()+t)}),((e,t)=>t.getFullYear()-e.getFullYear()),(e=>e.getFullYear())));hw.every=e=>isFinite(e=Math.floor(e))&&e>0?Bx((t=>{t.setFullYear(Math.floor(t.getFullYear()/e)*e),t.setMonth(0,1),t.setHours(0,0,0,0)}),((t,n)=>{t.setFullYear(t.getFullYear()+n*e)})):null;hw.range;const mw=Bx((e=>{e.setUTCMonth(0,1),e.setUTCHours(0,0,0,0)}),((e,t)=>{e.setUTCFullYear(e.getUTCFullYear()+t)}),((e,t)=>t.getUTCFullYear()-e.getUTCFullYear()),(e=>e.getUTCFullYear()));mw.every=e=>isFinite(e=Math.floor(e))&&e>0?Bx((t=>{t.setUTCFullYear(Math.floor(t.getUTCFullYear()/e)*e),t.setUTCMonth(0,1),t.setUTCHours(0,0,0,0)}),((t,n)=>{t.setUTCFullYear(t.getUTCFullYear()+n*e)})):null;mw.range;function yw(e,t,n,r,o,i){const a=[[Wx,1,Tx],[Wx,5,5e3],[Wx,15,15e3],[Wx,30,3e4],[i,1,_x],[i,5,3e5],[i,15,9e5],[i,30,18e5],[o,1,Rx],[o,3,108e5],[o,6,216e5],[o,12,432e5],[r,1,Nx],[r,2,1728e5],[n,1,Ix],[t,1,Dx],[t,3,7776e6],[e,1,Lx]];function l(t,n,r){const o=Math.abs(n-t)/r,i=Sg((e=>{let[,,t]=e;return t})).right(a,o);if(i===a.length)return e.every(bg(t/Lx,n/Lx,r));if(0===i)return Fx.every(Math.max(bg(t,n,r),1));const[l,s]=a[o/a[i-1][2]<a[i][2]/o?i-1:i];return l.every(s)}return[function(e,t,n){const r=t<e;r&&([e,t]=[t,e]);const o=n&&"function"===typeof n.range?n:l(e,t,n),i=o?o.range(e,+t+1):[];return r?i.reverse():i},l]}const[vw,gw]=yw(mw,pw,iw,Gx,qx,Hx),[bw,xw]=yw(hw,fw,Qx,Xx,Vx,Ux);function ww(e){if(0<=e.y&&e.y<100){var t=new Date(-1,e.m,e.d,e.H,e.M,e.S,e.L);return t.setFullYear(e.y),t}return new Date(e.y,e.m,e.d,e.H,e.M,e.S,e.L)}function Sw(e){if(0<=e.y&&e.y<100){var t=new Date(Date.UTC(-1,e.m,e.d,e.H,e.M,e.S,e.L));return t.setUTCFullYear(e.y),t}return new Date(Date.UTC(e.y,e.m,e.d,e.H,e.M,e.S,e.L))}function Aw(e,t,n){return{y:e,m:t,d:n,H:0,M:0,S:0,L:0}}var Ow,kw,jw,Ew={"-":"",_:" ",0:"0"},Cw=/^\s*\d+/,Pw=/^%/,Mw=/[\\^$*+?|[\]().{}]/g;function Tw(e,t,n){var r=e<0?"-":"",o=(r?-e:e)+"",i=o.length;return r+(i<n?new Array(n-i+1).join(t)+o:o)}function _w(e){return e.replace(Mw,"\\$&")}function Rw(e){return new RegExp("^(?:"+e.map(_w).join("|")+")","i")}function Nw(e){return new Map(e.map(((e,t)=>[e.toLowerCase(),t])))}function Iw(e,t,n){var r=Cw.exec(t.slice(n,n+1));return r?(e.w=+r[0],n+r[0].length):-1}function Dw(e,t,n){var r=Cw.exec(t.slice(n,n+1));return r?(e.u=+r[0],n+r[0].length):-1}function Lw(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.U=+r[0],n+r[0].length):-1}function zw(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.V=+r[0],n+r[0].length):-1}function $w(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.W=+r[0],n+r[0].length):-1}function Bw(e,t,n){var r=Cw.exec(t.slice(n,n+4));return r?(e.y=+r[0],n+r[0].length):-1}function Fw(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.y=+r[0]+(+r[0]>68?1900:2e3),n+r[0].length):-1}function Ww(e,t,n){var r=/^(Z)|([+-]\d\d)(?::?(\d\d))?/.exec(t.slice(n,n+6));return r?(e.Z=r[1]?0:-(r[2]+(r[3]||"00")),n+r[0].length):-1}function Uw(e,t,n){var r=Cw.exec(t.slice(n,n+1));return r?(e.q=3*r[0]-3,n+r[0].length):-1}function Hw(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.m=r[0]-1,n+r[0].length):-1}function Vw(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.d=+r[0],n+r[0].length):-1}function qw(e,t,n){var r=Cw.exec(t.slice(n,n+3));return r?(e.m=0,e.d=+r[0],n+r[0].length):-1}function Xw(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.H=+r[0],n+r[0].length):-1}function Kw(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.M=+r[0],n+r[0].length):-1}function Gw(e,t,n){var r=Cw.exec(t.slice(n,n+2));return r?(e.S=+r[0],n+r[0].length):-1}function Yw(e,t,n){var r=Cw.exec(t.slice(n,n+3));return r?(e.L=+r[0],n+r[0].length):-1}function Qw(e,t,n){var r=Cw.exec(t.slice(n,n+6));return r?(e.L=Math.floor(r[0]/1e3),n+r[0].length):-1}function Jw(e,t,n){var r=Pw.exec(t.slice(n,n+1));return r?n+r[0].length:-1}function Zw(e,t,n){var r=Cw.exec(t.slice(n));return r?(e.Q=+r[0],n+r[0].length):-1}function eS(e,t,n){var r=Cw.exec(t.slice(n));return r?(e.s=+r[0],n+r[0].length):-1}function tS(e,t){return Tw(e.getDate(),t,2)}function nS(e,t){return Tw(e.getHours(),t,2)}function rS(e,t){return Tw(e.getHours()%12||12,t,2)}function oS(e,t){return Tw(1+Xx.count(hw(e),e),t,3)}function iS(e,t){return Tw(e.getMilliseconds(),t,3)}function aS(e,t){return iS(e,t)+"000"}function lS(e,t){return Tw(e.getMonth()+1,t,2)}function sS(e,t){return Tw(e.getMinutes(),t,2)}function uS(e,t){return Tw(e.getSeconds(),t,2)}function cS(e){var t=e.getDay();return 0===t?7:t}function dS(e,t){return Tw(Qx.count(hw(e)-1,e),t,2)}function fS(e){var t=e.getDay();return t>=4||0===t?tw(e):tw.ceil(e)}function pS(e,t){return e=fS(e),Tw(tw.count(hw(e),e)+(4===hw(e).getDay()),t,2)}function hS(e){return e.getDay()}function mS(e,t){return Tw(Jx.count(hw(e)-1,e),t,2)}function yS(e,t){return Tw(e.getFullYear()%100,t,2)}function vS(e,t){return Tw((e=fS(e)).getFullYear()%100,t,2)}function gS(e,t){return Tw(e.getFullYear()%1e4,t,4)}function bS(e,t){var n=e.getDay();return Tw((e=n>=4||0===n?tw(e):tw.ceil(e)).getFullYear()%1e4,t,4)}function xS(e){var t=e.getTimezoneOffset();return(t>0?"-":(t*=-1,"+"))+Tw(t/60|0,"0",2)+Tw(t%60,"0",2)}function wS(e,t){return Tw(e.getUTCDate(),t,2)}function SS(e,t){return Tw(e.getUTCHours(),t,2)}function AS(e,t){return Tw(e.getUTCHours()%12||12,t,2)}function OS(e,t){return Tw(1+Kx.count(mw(e),e),t,3)}function kS(e,t){return Tw(e.getUTCMilliseconds(),t,3)}function jS(e,t){return kS(e,t)+"000"}function ES(e,t){return Tw(e.getUTCMonth()+1,t,2)}function CS(e,t){return Tw(e.getUTCMinutes(),t,2)}function PS(e,t){return Tw(e.getUTCSeconds(),t,2)}function MS(e){var t=e.getUTCDay();return 0===t?7:t}function TS(e,t){return Tw(iw.count(mw(e)-1,e),t,2)}function _S(e){var t=e.getUTCDay();return t>=4||0===t?uw(e):uw.ceil(e)}function RS(e,t){return e=_S(e),Tw(uw.count(mw(e),e)+(4===mw(e).getUTCDay()),t,2)}function NS(e){return e.getUTCDay()}function IS(e,t){return Tw(aw.count(mw(e)-1,e),t,2)}function DS(e,t){return Tw(e.getUTCFullYear()%100,t,2)}function LS(e,t){return Tw((e=_S(e)).getUTCFullYear()%100,t,2)}function zS(e,t){return Tw(e.getUTCFullYear()%1e4,t,4)}function $S(e,t){var n=e.getUTCDay();return Tw((e=n>=4||0===n?uw(e):uw.ceil(e)).getUTCFullYear()%1e4,t,4)}function BS(){return"+0000"}function FS(){return"%"}function WS(e){return+e}function US(e){return Math.floor(+e/1e3)}function HS(e){return new Date(e)}function VS(e){return e instanceof Date?+e:+new Date(+e)}function qS(e,t,n,r,o,i,a,l,s,u){var c=Rb(),d=c.invert,f=c.domain,p=u(".%L"),h=u(":%S"),m=u("%I:%M"),y=u("%I %p"),v=u("%a %d"),g=u("%b %d"),b=u("%B"),x=u("%Y");function w(e){return(s(e)<e?p:l(e)<e?h:a(e)<e?m:i(e)<e?y:r(e)<e?o(e)<e?v:g:n(e)<e?b:x)(e)}return c.invert=function(e){return new Date(d(e))},c.domain=function(e){return arguments.length?f(Array.from(e,VS)):f().map(HS)},c.ticks=function(t){var n=f();return e(n[0],n[n.length-1],null==t?10:t)},c.tickFormat=function(e,t){return null==t?w:u(t)},c.nice=function(e){var n=f();return e&&"function"===typeof e.range||(e=t(n[0],n[n.length-1],null==e?10:e)),e?f(Zb(n,e)):c},c.copy=function(){return Tb(c,qS(e,t,n,r,o,i,a,l,s,u))},c}function XS(){return gv.apply(qS(bw,xw,hw,fw,Qx,Xx,Vx,Ux,Wx,kw).domain([new Date(2e3,0,1),new Date(2e3,0,2)]),arguments)}function KS(){return gv.apply(qS(vw,gw,mw,pw,iw,Kx,qx,Hx,Wx,jw).domain([Date.UTC(2e3,0,1),Date.UTC(2e3,0,2)]),arguments)}function GS(){var e,t,n,r,o,i=0,a=1,l=Eb,s=!1;function u(t){return null==t||isNaN(t=+t)?o:l(0===n?.5:(t=(r(t)-e)*n,s?Math.max(0,Math.min(1,t)):t))}function c(e){return function(t){var n,r;return arguments.length?([n,r]=t,l=e(n,r),u):[l(0),l(1)]}}return u.domain=function(o){return arguments.length?([i,a]=o,e=r(i=+i),t=r(a=+a),n=e===t?0:1/(t-e),u):[i,a]},u.clamp=function(e){return arguments.length?(s=!!e,u):s},u.interpolator=function(e){return arguments.length?(l=e,u):l},u.range=c(Ab),u.rangeRound=c(Ob),u.unknown=function(e){return arguments.length?(o=e,u):o},function(o){return r=o,e=o(i),t=o(a),n=e===t?0:1/(t-e),u}}function YS(e,t){return t.domain(e.domain()).interpolator(e.interpolator()).clamp(e.clamp()).unknown(e.unknown())}function QS(){var e=Yb(GS()(Eb));return e.copy=function(){return YS(e,QS())},bv.apply(e,arguments)}function JS(){var e=ax(GS()).domain([1,10]);return e.copy=function(){return YS(e,JS()).base(e.base())},bv.apply(e,arguments)}function ZS(){var e=cx(GS());return e.copy=function(){return YS(e,ZS()).constant(e.constant())},bv.apply(e,arguments)}function eA(){var e=mx(GS());return e.copy=function(){return YS(e,eA()).exponent(e.exponent())},bv.apply(e,arguments)}function tA(){return eA.apply(null,arguments).exponent(.5)}function nA(){var e=[],t=Eb;function n(n){if(null!=n&&!isNaN(n=+n))return t((Eg(e,n,1)-1)/(e.length-1))}return n.domain=function(t){if(!arguments.length)return e.slice();e=[];for(let n of t)null==n||isNaN(n=+n)||e.push(n);return e.sort(xg),n},n.interpolator=function(e){return arguments.length?(t=e,n):t},n.range=function(){return e.map(((n,r)=>t(r/(e.length-1))))},n.quantiles=function(t){return Array.from({length:t+1},((n,r)=>jx(e,r/t)))},n.copy=function(){return nA(t).domain(e)},bv.apply(n,arguments)}function rA(){var e,t,n,r,o,i,a,l=0,s=.5,u=1,c=1,d=Eb,f=!1;function p(e){return isNaN(e=+e)?a:(e=.5+((e=+i(e))-t)*(c*e<c*t?r:o),d(f?Math.max(0,Math.min(1,e)):e))}function h(e){return function(t){var n,r,o;return arguments.length?([n,r,o]=t,d=function(e,t){void 0===t&&(t=e,e=Ab);for(var n=0,r=t.length-1,o=t[0],i=new Array(r<0?0:r);n<r;)i[n]=e(o,o=t[++n]);return function(e){var t=Math.max(0,Math.min(r-1,Math.floor(e*=r)));return i[t](e-t)}}(e,[n,r,o]),p):[d(0),d(.5),d(1)]}}return p.domain=function(a){return arguments.length?([l,s,u]=a,e=i(l=+l),t=i(s=+s),n=i(u=+u),r=e===t?0:.5/(t-e),o=t===n?0:.5/(n-t),c=t<e?-1:1,p):[l,s,u]},p.clamp=function(e){return arguments.length?(f=!!e,p):f},p.interpolator=function(e){return arguments.length?(d=e,p):d},p.range=h(Ab),p.rangeRound=h(Ob),p.unknown=function(e){return arguments.length?(a=e,p):a},function(a){return i=a,e=a(l),t=a(s),n=a(u),r=e===t?0:.5/(t-e),o=t===n?0:.5/(n-t),c=t<e?-1:1,p}}function oA(){var e=Yb(rA()(Eb));return e.copy=function(){return YS(e,oA())},bv.apply(e,arguments)}function iA(){var e=ax(rA()).domain([.1,1,10]);return e.copy=function(){return YS(e,iA()).base(e.base())},bv.apply(e,arguments)}function aA(){var e=cx(rA());return e.copy=function(){return YS(e,aA()).constant(e.constant())},bv.apply(e,arguments)}function lA(){var e=mx(rA());return e.copy=function(){return YS(e,lA()).exponent(e.exponent())},bv.apply(e,arguments)}function sA(){return lA.apply(null,arguments).exponent(.5)}function uA(e,t){if((o=e.length)>1)for(var n,r,o,i=1,a=e[t[0]],l=a.length;i<o;++i)for(r=a,a=e[t[i]],n=0;n<l;++n)a[n][1]+=a[n][0]=isNaN(r[n][1])?r[n][0]:r[n][1]}!function(e){Ow=function(e){var t=e.dateTime,n=e.date,r=e.time,o=e.periods,i=e.days,a=e.shortDays,l=e.months,s=e.shortMonths,u=Rw(o),c=Nw(o),d=Rw(i),f=Nw(i),p=Rw(a),h=Nw(a),m=Rw(l),y=Nw(l),v=Rw(s),g=Nw(s),b={a:function(e){return a[e.getDay()]},A:function(e){return i[e.getDay()]},b:function(e){return s[e.getMonth()]},B:function(e){return l[e.getMonth()]},c:null,d:tS,e:tS,f:aS,g:vS,G:bS,H:nS,I:rS,j:oS,L:iS,m:lS,M:sS,p:function(e){return o[+(e.getHours()>=12)]},q:function(e){return 1+~~(e.getMonth()/3)},Q:WS,s:US,S:uS,u:cS,U:dS,V:pS,w:hS,W:mS,x:null,X:null,y:yS,Y:gS,Z:xS,"%":FS},x={a:function(e){return a[e.getUTCDay()]},A:function(e){return i[e.getUTCDay()]},b:function(e){return s[e.getUTCMonth()]},B:function(e){return l[e.getUTCMonth()]},c:null,d:wS,e:wS,f:jS,g:LS,G:$S,H:SS,I:AS,j:OS,L:kS,m:ES,M:CS,p:function(e){return o[+(e.getUTCHours()>=12)]},q:function(e){return 1+~~(e.getUTCMonth()/3)},Q:WS,s:US,S:PS,u:MS,U:TS,V:RS,w:NS,W:IS,x:null,X:null,y:DS,Y:zS,Z:BS,"%":FS},w={a:function(e,t,n){var r=p.exec(t.slice(n));return r?(e.w=h.get(r[0].toLowerCase()),n+r[0].length):-1},A:function(e,t,n){var r=d.exec(t.slice(n));return r?(e.w=f.get(r[0].toLowerCase()),n+r[0].length):-1},b:function(e,t,n){var r=v.exec(t.slice(n));return r?(e.m=g.get(r[0].toLowerCase()),n+r[0].length):-1},B:function(e,t,n){var r=m.exec(t.slice(n));return r?(e.m=y.get(r[0].toLowerCase()),n+r[0].length):-1},c:function(e,n,r){return O(e,t,n,r)},d:Vw,e:Vw,f:Qw,g:Fw,G:Bw,H:Xw,I:Xw,j:qw,L:Yw,m:Hw,M:Kw,p:function(e,t,n){var r=u.exec(t.slice(n));return r?(e.p=c.get(r[0].toLowerCase()),n+r[0].length):-1},q:Uw,Q:Zw,s:eS,S:Gw,u:Dw,U:Lw,V:zw,w:Iw,W:$w,x:function(e,t,r){return O(e,n,t,r)},X:function(e,t,n){return O(e,r,t,n)},y:Fw,Y:Bw,Z:Ww,"%":Jw};function S(e,t){return function(n){var r,o,i,a=[],l=-1,s=0,u=e.length;for(n instanceof Date||(n=new Date(+n));++l<u;)37===e.charCodeAt(l)&&(a.push(e.slice(s,l)),null!=(o=Ew[r=e.charAt(++l)])?r=e.charAt(++l):o="e"===r?" ":"0",(i=t[r])&&(r=i(n,o)),a.push(r),s=l+1);return a.push(e.slice(s,l)),a.join("")}}function A(e,t){return function(n){var r,o,i=Aw(1900,void 0,1);if(O(i,e,n+="",0)!=n.length)return null;if("Q"in i)return new Date(i.Q);if("s"in i)return new Date(1e3*i.s+("L"in i?i.L:0));if(t&&!("Z"in i)&&(i.Z=0),"p"in i&&(i.H=i.H%12+12*i.p),void 0===i.m&&(i.m="q"in i?i.q:0),"V"in i){if(i.V<1||i.V>53)return null;"w"in i||(i.w=1),"Z"in i?(o=(r=Sw(Aw(i.y,0,1))).getUTCDay(),r=o>4||0===o?aw.ceil(r):aw(r),r=Kx.offset(r,7*(i.V-1)),i.y=r.getUTCFullYear(),i.m=r.getUTCMonth(),i.d=r.getUTCDate()+(i.w+6)%7):(o=(r=ww(Aw(i.y,0,1))).getDay(),r=o>4||0===o?Jx.ceil(r):Jx(r),r=Xx.offset(r,7*(i.V-1)),i.y=r.getFullYear(),i.m=r.getMonth(),i.d=r.getDate()+(i.w+6)%7)}else("W"in i||"U"in i)&&("w"in i||(i.w="u"in i?i.u%7:"W"in i?1:0),o="Z"in i?Sw(Aw(i.y,0,1)).getUTCDay():ww(Aw(i.y,0,1)).getDay(),i.m=0,i.d="W"in i?(i.w+6)%7+7*i.W-(o+5)%7:i.w+7*i.U-(o+6)%7);return"Z"in i?(i.H+=i.Z/100|0,i.M+=i.Z%100,Sw(i)):ww(i)}}function O(e,t,n,r){for(var o,i,a=0,l=t.length,s=n.length;a<l;){if(r>=s)return-1;if(37===(o=t.charCodeAt(a++))){if(o=t.charAt(a++),!(i=w[o in Ew?t.charAt(a++):o])||(r=i(e,n,r))<0)return-1}else if(o!=n.charCodeAt(r++))return-1}return r}return b.x=S(n,b),b.X=S(r,b),b.c=S(t,b),x.x=S(n,x),x.X=S(r,x),x.c=S(t,x),{format:function(e){var t=S(e+="",b);return t.toString=function(){return e},t},parse:function(e){var t=A(e+="",!1);return t.toString=function(){return e},t},utcFormat:function(e){var t=S(e+="",x);return t.toString=function(){return e},t},utcParse:function(e){var t=A(e+="",!0);return t.toString=function(){return e},t}}}(e),kw=Ow.format,Ow.parse,jw=Ow.utcFormat,Ow.utcParse}({dateTime:"%x, %X",date:"%-m/%-d/%Y",time:"%-I:%M:%S %p",periods:["AM","PM"],days:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],shortDays:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],months:["January","February","March","April","May","June","July","August","September","October","November","December"],shortMonths:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]});Array.prototype.slice;function cA(e){return"object"===typeof e&&"length"in e?e:Array.from(e)}function dA(e){for(var t=e.length,n=new Array(t);--t>=0;)n[t]=t;return n}function fA(e,t){return e[t]}function pA(e){const t=[];return t.key=e,t}var hA=n(539),mA=n.n(hA),yA=n(6745),vA=n.n(yA),gA=n(3538),bA=n.n(gA),xA=n(9853),wA=n.n(xA),SA=n(8210),AA=n.n(SA);function OA(e){return function(e){if(Array.isArray(e))return kA(e)}(e)||function(e){if("undefined"!==typeof Symbol&&Symbol.iterator in Object(e))return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return kA(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return kA(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function kA(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var jA=function(e){return e},EA={"@@functional/placeholder":!0},CA=function(e){return e===EA},PA=function(e){return function t(){return 0===arguments.length||1===arguments.length&&CA(arguments.length<=0?void 0:arguments[0])?t:e.apply(void 0,arguments)}},MA=function e(t,n){return 1===t?n:PA((function(){for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];var a=o.filter((function(e){return e!==EA})).length;return a>=t?n.apply(void 0,o):e(t-a,PA((function(){for(var e=arguments.length,t=new Array(e),r=0;r<e;r++)t[r]=arguments[r];var i=o.map((function(e){return CA(e)?t.shift():e}));return n.apply(void 0,OA(i).concat(t))})))}))},TA=function(e){return MA(e.length,e)},_A=function(e,t){for(var n=[],r=e;r<t;++r)n[r-e]=r;return n},RA=TA((function(e,t){return Array.isArray(t)?t.map(e):Object.keys(t).map((function(e){return t[e]})).map(e)})),NA=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];if(!t.length)return jA;var r=t.reverse(),o=r[0],i=r.slice(1);return function(){return i.reduce((function(e,t){return t(e)}),o.apply(void 0,arguments))}},IA=function(e){return Array.isArray(e)?e.reverse():e.split("").reverse.join("")},DA=function(e){var t=null,n=null;return function(){for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return t&&o.every((function(e,n){return e===t[n]}))?n:(t=o,n=e.apply(void 0,o))}};var LA=TA((function(e,t,n){var r=+e;return r+n*(+t-r)})),zA=TA((function(e,t,n){var r=t-+e;return(n-e)/(r=r||1/0)})),$A=TA((function(e,t,n){var r=t-+e;return r=r||1/0,Math.max(0,Math.min(1,(n-e)/r))}));const BA={rangeStep:function(e,t,n){for(var r=new(AA())(e),o=0,i=[];r.lt(t)&&o<1e5;)i.push(r.toNumber()),r=r.add(n),o++;return i},getDigitCount:function(e){return 0===e?1:Math.floor(new(AA())(e).abs().log(10).toNumber())+1},interpolateNumber:LA,uninterpolateNumber:zA,uninterpolateTruncation:$A};function FA(e){return function(e){if(Array.isArray(e))return HA(e)}(e)||function(e){if("undefined"!==typeof Symbol&&Symbol.iterator in Object(e))return Array.from(e)}(e)||UA(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function WA(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if("undefined"===typeof Symbol||!(Symbol.iterator in Object(e)))return;var n=[],r=!0,o=!1,i=void 0;try{for(var a,l=e[Symbol.iterator]();!(r=(a=l.next()).done)&&(n.push(a.value),!t||n.length!==t);r=!0);}catch(s){o=!0,i=s}finally{try{r||null==l.return||l.return()}finally{if(o)throw i}}return n}(e,t)||UA(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function UA(e,t){if(e){if("string"===typeof e)return HA(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?HA(e,t):void 0}}function HA(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function VA(e){var t=WA(e,2),n=t[0],r=t[1],o=n,i=r;return n>r&&(o=r,i=n),[o,i]}function qA(e,t,n){if(e.lte(0))return new(AA())(0);var r=BA.getDigitCount(e.toNumber()),o=new(AA())(10).pow(r),i=e.div(o),a=1!==r?.05:.1,l=new(AA())(Math.ceil(i.div(a).toNumber())).add(n).mul(a).mul(o);return t?l:new(AA())(Math.ceil(l))}function XA(e,t,n){var r=1,o=new(AA())(e);if(!o.isint()&&n){var i=Math.abs(e);i<1?(r=new(AA())(10).pow(BA.getDigitCount(e)-1),o=new(AA())(Math.floor(o.div(r).toNumber())).mul(r)):i>1&&(o=new(AA())(Math.floor(e)))}else 0===e?o=new(AA())(Math.floor((t-1)/2)):n||(o=new(AA())(Math.floor(e)));var a=Math.floor((t-1)/2);return NA(RA((function(e){return o.add(new(AA())(e-a).mul(r)).toNumber()})),_A)(0,t)}function KA(e,t,n,r){var o=arguments.length>4&&void 0!==arguments[4]?arguments[4]:0;if(!Number.isFinite((t-e)/(n-1)))return{step:new(AA())(0),tickMin:new(AA())(0),tickMax:new(AA())(0)};var i,a=qA(new(AA())(t).sub(e).div(n-1),r,o);i=e<=0&&t>=0?new(AA())(0):(i=new(AA())(e).add(t).div(2)).sub(new(AA())(i).mod(a));var l=Math.ceil(i.sub(e).div(a).toNumber()),s=Math.ceil(new(AA())(t).sub(i).div(a).toNumber()),u=l+s+1;return u>n?KA(e,t,n,r,o+1):(u<n&&(s=t>0?s+(n-u):s,l=t>0?l:l+(n-u)),{step:a,tickMin:i.sub(new(AA())(l).mul(a)),tickMax:i.add(new(AA())(s).mul(a))})}var GA=DA((function(e){var t=WA(e,2),n=t[0],r=t[1],o=arguments.length>1&&void 0!==arguments[1]?arguments[1]:6,i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],a=Math.max(o,2),l=WA(VA([n,r]),2),s=l[0],u=l[1];if(s===-1/0||u===1/0){var c=u===1/0?[s].concat(FA(_A(0,o-1).map((function(){return 1/0})))):[].concat(FA(_A(0,o-1).map((function(){return-1/0}))),[u]);return n>r?IA(c):c}if(s===u)return XA(s,o,i);var d=KA(s,u,a,i),f=d.step,p=d.tickMin,h=d.tickMax,m=BA.rangeStep(p,h.add(new(AA())(.1).mul(f)),f);return n>r?IA(m):m})),YA=(DA((function(e){var t=WA(e,2),n=t[0],r=t[1],o=arguments.length>1&&void 0!==arguments[1]?arguments[1]:6,i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],a=Math.max(o,2),l=WA(VA([n,r]),2),s=l[0],u=l[1];if(s===-1/0||u===1/0)return[n,r];if(s===u)return XA(s,o,i);var c=qA(new(AA())(u).sub(s).div(a-1),i,0),d=NA(RA((function(e){return new(AA())(s).add(new(AA())(e).mul(c)).toNumber()})),_A)(0,a).filter((function(e){return e>=s&&e<=u}));return n>r?IA(d):d})),DA((function(e,t){var n=WA(e,2),r=n[0],o=n[1],i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],a=WA(VA([r,o]),2),l=a[0],s=a[1];if(l===-1/0||s===1/0)return[r,o];if(l===s)return[l];var u=Math.max(t,2),c=qA(new(AA())(s).sub(l).div(u-1),i,0),d=[].concat(FA(BA.rangeStep(new(AA())(l),new(AA())(s).sub(new(AA())(.99).mul(c)),c)),[s]);return r>o?IA(d):d}))),QA=["offset","layout","width","dataKey","data","dataPointFormatter","xAxis","yAxis"];function JA(e){return JA="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},JA(e)}function ZA(){return ZA=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},ZA.apply(this,arguments)}function eO(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return tO(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return tO(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function tO(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function nO(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function rO(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,uO(r.key),r)}}function oO(e,t,n){return t=aO(t),function(e,t){if(t&&("object"===JA(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,iO()?Reflect.construct(t,n||[],aO(e).constructor):t.apply(e,n))}function iO(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(iO=function(){return!!e})()}function aO(e){return aO=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},aO(e)}function lO(e,t){return lO=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},lO(e,t)}function sO(e,t,n){return(t=uO(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function uO(e){var t=function(e,t){if("object"!=JA(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=JA(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==JA(t)?t:t+""}var cO=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),oO(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&lO(e,t)}(n,e),r=n,o=[{key:"render",value:function(){var e=this.props,n=e.offset,r=e.layout,o=e.width,i=e.dataKey,a=e.data,l=e.dataPointFormatter,s=e.xAxis,u=e.yAxis,c=nO(e,QA),d=rp(c,!1);"x"===this.props.direction&&"number"!==s.type&&bp(!1);var f=a.map((function(e){var a=l(e,i),c=a.x,f=a.y,p=a.value,h=a.errorVal;if(!h)return null;var m,y,v=[];if(Array.isArray(h)){var g=eO(h,2);m=g[0],y=g[1]}else m=y=h;if("vertical"===r){var b=s.scale,x=f+n,w=x+o,S=x-o,A=b(p-m),O=b(p+y);v.push({x1:O,y1:w,x2:O,y2:S}),v.push({x1:A,y1:x,x2:O,y2:x}),v.push({x1:A,y1:w,x2:A,y2:S})}else if("horizontal"===r){var k=u.scale,j=c+n,E=j-o,C=j+o,P=k(p-m),M=k(p+y);v.push({x1:E,y1:M,x2:C,y2:M}),v.push({x1:j,y1:P,x2:j,y2:M}),v.push({x1:E,y1:P,x2:C,y2:P})}return t.createElement(Ep,ZA({className:"recharts-errorBar",key:"bar-".concat(v.map((function(e){return"".concat(e.x1,"-").concat(e.x2,"-").concat(e.y1,"-").concat(e.y2)})))},d),v.map((function(e){return t.createElement("line",ZA({},e,{key:"line-".concat(e.x1,"-").concat(e.x2,"-").concat(e.y1,"-").concat(e.y2)}))})))}));return t.createElement(Ep,{className:"recharts-errorBars"},f)}}],o&&rO(r.prototype,o),i&&rO(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);function dO(e){return dO="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},dO(e)}function fO(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function pO(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?fO(Object(n),!0).forEach((function(t){hO(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):fO(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function hO(e,t,n){return t=function(e){var t=function(e,t){if("object"!=dO(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=dO(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==dO(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}sO(cO,"defaultProps",{stroke:"black",strokeWidth:1.5,width:5,offset:0,layout:"horizontal"}),sO(cO,"displayName","ErrorBar");var mO=function(e){var t=e.children,n=e.formattedGraphicalItems,r=e.legendWidth,o=e.legendContent,i=Zf(t,Pm);if(!i)return null;var a,l=Pm.defaultProps,s=void 0!==l?pO(pO({},l),i.props):{};return a=i.props&&i.props.payload?i.props&&i.props.payload:"children"===o?(n||[]).reduce((function(e,t){var n=t.item,r=t.props,o=r.sectors||r.data||[];return e.concat(o.map((function(e){return{type:i.props.iconType||n.props.legendType,value:e.name,color:e.fill,payload:e}})))}),[]):(n||[]).map((function(e){var t=e.item,n=t.type.defaultProps,r=void 0!==n?pO(pO({},n),t.props):{},o=r.dataKey,i=r.name,a=r.legendType;return{inactive:r.hide,dataKey:o,type:s.iconType||a||"square",color:OO(t),value:i||o,payload:r}})),pO(pO(pO({},s),Pm.getWithHeight(i,r)),{},{payload:a,item:i})};function yO(e){return yO="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},yO(e)}function vO(e){return function(e){if(Array.isArray(e))return gO(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return gO(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return gO(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function gO(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function bO(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function xO(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?bO(Object(n),!0).forEach((function(t){wO(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):bO(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function wO(e,t,n){return t=function(e){var t=function(e,t){if("object"!=yO(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=yO(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==yO(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function SO(e,t,n){return Mf()(e)||Mf()(t)?n:xf(t)?hf()(e,t,n):_f()(t)?t(e):n}function AO(e,t,n,r){var o=bA()(e,(function(e){return SO(e,t)}));if("number"===n){var i=o.filter((function(e){return bf(e)||parseFloat(e)}));return i.length?[vA()(i),mA()(i)]:[1/0,-1/0]}return(r?o.filter((function(e){return!Mf()(e)})):o).map((function(e){return xf(e)||e instanceof Date?e:""}))}var OO=function(e){var t,n,r=e.type.displayName,o=null!==(t=e.type)&&void 0!==t&&t.defaultProps?xO(xO({},e.type.defaultProps),e.props):e.props,i=o.stroke,a=o.fill;switch(r){case"Line":n=i;break;case"Area":case"Radar":n=i&&"none"!==i?i:a;break;default:n=a}return n},kO=function(e,t,n,r,o){var i=Jf(t.props.children,cO).filter((function(e){return function(e,t,n){return!!Mf()(t)||("horizontal"===e?"yAxis"===t:"vertical"===e||"x"===n?"xAxis"===t:"y"!==n||"yAxis"===t)}(r,o,e.props.direction)}));if(i&&i.length){var a=i.map((function(e){return e.props.dataKey}));return e.reduce((function(e,t){var r=SO(t,n);if(Mf()(r))return e;var o=Array.isArray(r)?[vA()(r),mA()(r)]:[r,r],i=a.reduce((function(e,n){var r=SO(t,n,0),i=o[0]-Math.abs(Array.isArray(r)?r[0]:r),a=o[1]+Math.abs(Array.isArray(r)?r[1]:r);return[Math.min(i,e[0]),Math.max(a,e[1])]}),[1/0,-1/0]);return[Math.min(i[0],e[0]),Math.max(i[1],e[1])]}),[1/0,-1/0])}return null},jO=function(e,t,n,r,o){var i=t.map((function(t){var i=t.props.dataKey;return"number"===n&&i&&kO(e,t,i,r)||AO(e,i,n,o)}));if("number"===n)return i.reduce((function(e,t){return[Math.min(e[0],t[0]),Math.max(e[1],t[1])]}),[1/0,-1/0]);var a={};return i.reduce((function(e,t){for(var n=0,r=t.length;n<r;n++)a[t[n]]||(a[t[n]]=!0,e.push(t[n]));return e}),[])},EO=function(e,t){return"horizontal"===e&&"xAxis"===t||"vertical"===e&&"yAxis"===t||"centric"===e&&"angleAxis"===t||"radial"===e&&"radiusAxis"===t},CO=function(e,t,n,r){if(r)return e.map((function(e){return e.coordinate}));var o,i,a=e.map((function(e){return e.coordinate===t&&(o=!0),e.coordinate===n&&(i=!0),e.coordinate}));return o||a.push(t),i||a.push(n),a},PO=function(e,t,n){if(!e)return null;var r=e.scale,o=e.duplicateDomain,i=e.type,a=e.range,l="scaleBand"===e.realScaleType?r.bandwidth()/2:2,s=(t||n)&&"category"===i&&r.bandwidth?r.bandwidth()/l:0;return s="angleAxis"===e.axisType&&(null===a||void 0===a?void 0:a.length)>=2?2*vf(a[0]-a[1])*s:s,t&&(e.ticks||e.niceTicks)?(e.ticks||e.niceTicks).map((function(e){var t=o?o.indexOf(e):e;return{coordinate:r(t)+s,value:e,offset:s}})).filter((function(e){return!ff()(e.coordinate)})):e.isCategorical&&e.categoricalDomain?e.categoricalDomain.map((function(e,t){return{coordinate:r(e)+s,value:e,index:t,offset:s}})):r.ticks&&!n?r.ticks(e.tickCount).map((function(e){return{coordinate:r(e)+s,value:e,offset:s}})):r.domain().map((function(e,t){return{coordinate:r(e)+s,value:o?o[e]:e,index:t,offset:s}}))},MO=new WeakMap,TO=function(e,t){if("function"!==typeof t)return e;MO.has(e)||MO.set(e,new WeakMap);var n=MO.get(e);if(n.has(t))return n.get(t);var r=function(){e.apply(void 0,arguments),t.apply(void 0,arguments)};return n.set(t,r),r},_O=function(t,n,r){var o=t.scale,i=t.type,a=t.layout,l=t.axisType;if("auto"===o)return"radial"===a&&"radiusAxis"===l?{scale:Ev(),realScaleType:"band"}:"radial"===a&&"angleAxis"===l?{scale:Qb(),realScaleType:"linear"}:"category"===i&&n&&(n.indexOf("LineChart")>=0||n.indexOf("AreaChart")>=0||n.indexOf("ComposedChart")>=0&&!r)?{scale:Pv(),realScaleType:"point"}:"category"===i?{scale:Ev(),realScaleType:"band"}:{scale:Qb(),realScaleType:"linear"};if(cf()(o)){var s="scale".concat(vh()(o));return{scale:(e[s]||Pv)(),realScaleType:e[s]?s:"point"}}return _f()(o)?{scale:o}:{scale:Pv(),realScaleType:"point"}},RO=1e-4,NO=function(e){var t=e.domain();if(t&&!(t.length<=2)){var n=t.length,r=e.range(),o=Math.min(r[0],r[1])-RO,i=Math.max(r[0],r[1])+RO,a=e(t[0]),l=e(t[n-1]);(a<o||a>i||l<o||l>i)&&e.domain([t[0],t[n-1]])}},IO={sign:function(e){var t=e.length;if(!(t<=0))for(var n=0,r=e[0].length;n<r;++n)for(var o=0,i=0,a=0;a<t;++a){var l=ff()(e[a][n][1])?e[a][n][0]:e[a][n][1];l>=0?(e[a][n][0]=o,e[a][n][1]=o+l,o=e[a][n][1]):(e[a][n][0]=i,e[a][n][1]=i+l,i=e[a][n][1])}},expand:function(e,t){if((r=e.length)>0){for(var n,r,o,i=0,a=e[0].length;i<a;++i){for(o=n=0;n<r;++n)o+=e[n][i][1]||0;if(o)for(n=0;n<r;++n)e[n][i][1]/=o}uA(e,t)}},none:uA,silhouette:function(e,t){if((n=e.length)>0){for(var n,r=0,o=e[t[0]],i=o.length;r<i;++r){for(var a=0,l=0;a<n;++a)l+=e[a][r][1]||0;o[r][1]+=o[r][0]=-l/2}uA(e,t)}},wiggle:function(e,t){if((o=e.length)>0&&(r=(n=e[t[0]]).length)>0){for(var n,r,o,i=0,a=1;a<r;++a){for(var l=0,s=0,u=0;l<o;++l){for(var c=e[t[l]],d=c[a][1]||0,f=(d-(c[a-1][1]||0))/2,p=0;p<l;++p){var h=e[t[p]];f+=(h[a][1]||0)-(h[a-1][1]||0)}s+=d,u+=f*d}n[a-1][1]+=n[a-1][0]=i,s&&(i-=u/s)}n[a-1][1]+=n[a-1][0]=i,uA(e,t)}},positive:function(e){var t=e.length;if(!(t<=0))for(var n=0,r=e[0].length;n<r;++n)for(var o=0,i=0;i<t;++i){var a=ff()(e[i][n][1])?e[i][n][0]:e[i][n][1];a>=0?(e[i][n][0]=o,e[i][n][1]=o+a,o=e[i][n][1]):(e[i][n][0]=0,e[i][n][1]=0)}}},DO=function(e,t,n){var r=t.map((function(e){return e.props.dataKey})),o=IO[n],i=function(){var e=Bh([]),t=dA,n=uA,r=fA;function o(o){var i,a,l=Array.from(e.apply(this,arguments),pA),s=l.length,u=-1;for(const e of o)for(i=0,++u;i<s;++i)(l[i][u]=[0,+r(e,l[i].key,u,o)]).data=e;for(i=0,a=cA(t(l));i<s;++i)l[a[i]].index=i;return n(l,a),l}return o.keys=function(t){return arguments.length?(e="function"===typeof t?t:Bh(Array.from(t)),o):e},o.value=function(e){return arguments.length?(r="function"===typeof e?e:Bh(+e),o):r},o.order=function(e){return arguments.length?(t=null==e?dA:"function"===typeof e?e:Bh(Array.from(e)),o):t},o.offset=function(e){return arguments.length?(n=null==e?uA:e,o):n},o}().keys(r).value((function(e,t){return+SO(e,t,0)})).order(dA).offset(o);return i(e)},LO=function(e,t){var n=t.realScaleType,r=t.type,o=t.tickCount,i=t.originalDomain,a=t.allowDecimals,l=n||t.scale;if("auto"!==l&&"linear"!==l)return null;if(o&&"number"===r&&i&&("auto"===i[0]||"auto"===i[1])){var s=e.domain();if(!s.length)return null;var u=GA(s,o,a);return e.domain([vA()(u),mA()(u)]),{niceTicks:u}}if(o&&"number"===r){var c=e.domain();return{niceTicks:YA(c,o,a)}}return null};var zO=function(e){var t=e.axis,n=e.ticks,r=e.offset,o=e.bandSize,i=e.entry,a=e.index;if("category"===t.type)return n[a]?n[a].coordinate+r:null;var l=SO(i,t.dataKey,t.domain[a]);return Mf()(l)?null:t.scale(l)-o/2+r},$O=function(e,t,n){return Object.keys(e).reduce((function(r,o){var i=e[o].stackedData.reduce((function(e,r){var o=function(e){return e.reduce((function(e,t){return[vA()(t.concat([e[0]]).filter(bf)),mA()(t.concat([e[1]]).filter(bf))]}),[1/0,-1/0])}(r.slice(t,n+1));return[Math.min(e[0],o[0]),Math.max(e[1],o[1])]}),[1/0,-1/0]);return[Math.min(i[0],r[0]),Math.max(i[1],r[1])]}),[1/0,-1/0]).map((function(e){return e===1/0||e===-1/0?0:e}))},BO=/^dataMin[\s]*-[\s]*([0-9]+([.]{1}[0-9]+){0,1})$/,FO=/^dataMax[\s]*\+[\s]*([0-9]+([.]{1}[0-9]+){0,1})$/,WO=function(e,t,n){if(_f()(e))return e(t,n);if(!Array.isArray(e))return t;var r=[];if(bf(e[0]))r[0]=n?e[0]:Math.min(e[0],t[0]);else if(BO.test(e[0])){var o=+BO.exec(e[0])[1];r[0]=t[0]-o}else _f()(e[0])?r[0]=e[0](t[0]):r[0]=t[0];if(bf(e[1]))r[1]=n?e[1]:Math.max(e[1],t[1]);else if(FO.test(e[1])){var i=+FO.exec(e[1])[1];r[1]=t[1]+i}else _f()(e[1])?r[1]=e[1](t[1]):r[1]=t[1];return r},UO=function(e,t,n){if(e&&e.scale&&e.scale.bandwidth){var r=e.scale.bandwidth();if(!n||r>0)return r}if(e&&t&&t.length>=2){for(var o=vp()(t,(function(e){return e.coordinate})),i=1/0,a=1,l=o.length;a<l;a++){var s=o[a],u=o[a-1];i=Math.min((s.coordinate||0)-(u.coordinate||0),i)}return i===1/0?0:i}return n?void 0:0},HO=function(e,t,n){return e&&e.length?wA()(e,hf()(n,"type.defaultProps.domain"))?t:e:t},VO=function(e,t){var n=e.type.defaultProps?xO(xO({},e.type.defaultProps),e.props):e.props,r=n.dataKey,o=n.name,i=n.unit,a=n.formatter,l=n.tooltipType,s=n.chartType,u=n.hide;return xO(xO({},rp(e,!1)),{},{dataKey:r,unit:i,formatter:a,name:o||r,color:OO(e),value:SO(t,r),type:l,payload:t,chartType:s,hide:u})};function qO(e){return qO="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},qO(e)}function XO(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function KO(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?XO(Object(n),!0).forEach((function(t){GO(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):XO(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function GO(e,t,n){return t=function(e){var t=function(e,t){if("object"!=qO(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=qO(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==qO(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var YO=["Webkit","Moz","O","ms"];function QO(e){return QO="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},QO(e)}function JO(){return JO=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},JO.apply(this,arguments)}function ZO(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function ek(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?ZO(Object(n),!0).forEach((function(t){ak(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ZO(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function tk(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,lk(r.key),r)}}function nk(e,t,n){return t=ok(t),function(e,t){if(t&&("object"===QO(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,rk()?Reflect.construct(t,n||[],ok(e).constructor):t.apply(e,n))}function rk(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(rk=function(){return!!e})()}function ok(e){return ok=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},ok(e)}function ik(e,t){return ik=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},ik(e,t)}function ak(e,t,n){return(t=lk(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function lk(e){var t=function(e,t){if("object"!=QO(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=QO(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==QO(t)?t:t+""}var sk=function(e){return e.changedTouches&&!!e.changedTouches.length},uk=function(e){function n(e){var t;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),ak(t=nk(this,n,[e]),"handleDrag",(function(e){t.leaveTimer&&(clearTimeout(t.leaveTimer),t.leaveTimer=null),t.state.isTravellerMoving?t.handleTravellerMove(e):t.state.isSlideMoving&&t.handleSlideDrag(e)})),ak(t,"handleTouchMove",(function(e){null!=e.changedTouches&&e.changedTouches.length>0&&t.handleDrag(e.changedTouches[0])})),ak(t,"handleDragEnd",(function(){t.setState({isTravellerMoving:!1,isSlideMoving:!1},(function(){var e=t.props,n=e.endIndex,r=e.onDragEnd,o=e.startIndex;null===r||void 0===r||r({endIndex:n,startIndex:o})})),t.detachDragEndListener()})),ak(t,"handleLeaveWrapper",(function(){(t.state.isTravellerMoving||t.state.isSlideMoving)&&(t.leaveTimer=window.setTimeout(t.handleDragEnd,t.props.leaveTimeOut))})),ak(t,"handleEnterSlideOrTraveller",(function(){t.setState({isTextActive:!0})})),ak(t,"handleLeaveSlideOrTraveller",(function(){t.setState({isTextActive:!1})})),ak(t,"handleSlideDragStart",(function(e){var n=sk(e)?e.changedTouches[0]:e;t.setState({isTravellerMoving:!1,isSlideMoving:!0,slideMoveStartX:n.pageX}),t.attachDragEndListener()})),t.travellerDragStartHandlers={startX:t.handleTravellerDragStart.bind(t,"startX"),endX:t.handleTravellerDragStart.bind(t,"endX")},t.state={},t}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&ik(e,t)}(n,e),r=n,o=[{key:"componentWillUnmount",value:function(){this.leaveTimer&&(clearTimeout(this.leaveTimer),this.leaveTimer=null),this.detachDragEndListener()}},{key:"getIndex",value:function(e){var t=e.startX,r=e.endX,o=this.state.scaleValues,i=this.props,a=i.gap,l=i.data.length-1,s=Math.min(t,r),u=Math.max(t,r),c=n.getIndexInRange(o,s),d=n.getIndexInRange(o,u);return{startIndex:c-c%a,endIndex:d===l?l:d-d%a}}},{key:"getTextOfTick",value:function(e){var t=this.props,n=t.data,r=t.tickFormatter,o=t.dataKey,i=SO(n[e],o,e);return _f()(r)?r(i,e):i}},{key:"attachDragEndListener",value:function(){window.addEventListener("mouseup",this.handleDragEnd,!0),window.addEventListener("touchend",this.handleDragEnd,!0),window.addEventListener("mousemove",this.handleDrag,!0)}},{key:"detachDragEndListener",value:function(){window.removeEventListener("mouseup",this.handleDragEnd,!0),window.removeEventListener("touchend",this.handleDragEnd,!0),window.removeEventListener("mousemove",this.handleDrag,!0)}},{key:"handleSlideDrag",value:function(e){var t=this.state,n=t.slideMoveStartX,r=t.startX,o=t.endX,i=this.props,a=i.x,l=i.width,s=i.travellerWidth,u=i.startIndex,c=i.endIndex,d=i.onChange,f=e.pageX-n;f>0?f=Math.min(f,a+l-s-o,a+l-s-r):f<0&&(f=Math.max(f,a-r,a-o));var p=this.getIndex({startX:r+f,endX:o+f});p.startIndex===u&&p.endIndex===c||!d||d(p),this.setState({startX:r+f,endX:o+f,slideMoveStartX:e.pageX})}},{key:"handleTravellerDragStart",value:function(e,t){var n=sk(t)?t.changedTouches[0]:t;this.setState({isSlideMoving:!1,isTravellerMoving:!0,movingTravellerId:e,brushMoveStartX:n.pageX}),this.attachDragEndListener()}},{key:"handleTravellerMove",value:function(e){var t=this.state,n=t.brushMoveStartX,r=t.movingTravellerId,o=t.endX,i=t.startX,a=this.state[r],l=this.props,s=l.x,u=l.width,c=l.travellerWidth,d=l.onChange,f=l.gap,p=l.data,h={startX:this.state.startX,endX:this.state.endX},m=e.pageX-n;m>0?m=Math.min(m,s+u-c-a):m<0&&(m=Math.max(m,s-a)),h[r]=a+m;var y=this.getIndex(h),v=y.startIndex,g=y.endIndex;this.setState(ak(ak({},r,a+m),"brushMoveStartX",e.pageX),(function(){d&&function(){var e=p.length-1;return"startX"===r&&(o>i?v%f===0:g%f===0)||o<i&&g===e||"endX"===r&&(o>i?g%f===0:v%f===0)||o>i&&g===e}()&&d(y)}))}},{key:"handleTravellerMoveKeyboard",value:function(e,t){var n=this,r=this.state,o=r.scaleValues,i=r.startX,a=r.endX,l=this.state[t],s=o.indexOf(l);if(-1!==s){var u=s+e;if(!(-1===u||u>=o.length)){var c=o[u];"startX"===t&&c>=a||"endX"===t&&c<=i||this.setState(ak({},t,c),(function(){n.props.onChange(n.getIndex({startX:n.state.startX,endX:n.state.endX}))}))}}}},{key:"renderBackground",value:function(){var e=this.props,n=e.x,r=e.y,o=e.width,i=e.height,a=e.fill,l=e.stroke;return t.createElement("rect",{stroke:l,fill:a,x:n,y:r,width:o,height:i})}},{key:"renderPanorama",value:function(){var e=this.props,n=e.x,r=e.y,o=e.width,i=e.height,a=e.data,l=e.children,s=e.padding,u=t.Children.only(l);return u?t.cloneElement(u,{x:n,y:r,width:o,height:i,margin:s,compact:!0,data:a}):null}},{key:"renderTravellerLayer",value:function(e,r){var o,i,a=this,l=this.props,s=l.y,u=l.travellerWidth,c=l.height,d=l.traveller,f=l.ariaLabel,p=l.data,h=l.startIndex,m=l.endIndex,y=Math.max(e,this.props.x),v=ek(ek({},rp(this.props,!1)),{},{x:y,y:s,width:u,height:c}),g=f||"Min value: ".concat(null===(o=p[h])||void 0===o?void 0:o.name,", Max value: ").concat(null===(i=p[m])||void 0===i?void 0:i.name);return t.createElement(Ep,{tabIndex:0,role:"slider","aria-label":g,"aria-valuenow":e,className:"recharts-brush-traveller",onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.travellerDragStartHandlers[r],onTouchStart:this.travellerDragStartHandlers[r],onKeyDown:function(e){["ArrowLeft","ArrowRight"].includes(e.key)&&(e.preventDefault(),e.stopPropagation(),a.handleTravellerMoveKeyboard("ArrowRight"===e.key?1:-1,r))},onFocus:function(){a.setState({isTravellerFocused:!0})},onBlur:function(){a.setState({isTravellerFocused:!1})},style:{cursor:"col-resize"}},n.renderTraveller(d,v))}},{key:"renderSlide",value:function(e,n){var r=this.props,o=r.y,i=r.height,a=r.stroke,l=r.travellerWidth,s=Math.min(e,n)+l,u=Math.max(Math.abs(n-e)-l,0);return t.createElement("rect",{className:"recharts-brush-slide",onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.handleSlideDragStart,onTouchStart:this.handleSlideDragStart,style:{cursor:"move"},stroke:"none",fill:a,fillOpacity:.2,x:s,y:o,width:u,height:i})}},{key:"renderText",value:function(){var e=this.props,n=e.startIndex,r=e.endIndex,o=e.y,i=e.height,a=e.travellerWidth,l=e.stroke,s=this.state,u=s.startX,c=s.endX,d={pointerEvents:"none",fill:l};return t.createElement(Ep,{className:"recharts-brush-texts"},t.createElement(fg,JO({textAnchor:"end",verticalAnchor:"middle",x:Math.min(u,c)-5,y:o+i/2},d),this.getTextOfTick(n)),t.createElement(fg,JO({textAnchor:"start",verticalAnchor:"middle",x:Math.max(u,c)+a+5,y:o+i/2},d),this.getTextOfTick(r)))}},{key:"render",value:function(){var e=this.props,n=e.data,r=e.className,o=e.children,i=e.x,a=e.y,l=e.width,s=e.height,u=e.alwaysShowText,c=this.state,d=c.startX,f=c.endX,p=c.isTextActive,h=c.isSlideMoving,m=c.isTravellerMoving,y=c.isTravellerFocused;if(!n||!n.length||!bf(i)||!bf(a)||!bf(l)||!bf(s)||l<=0||s<=0)return null;var v=zt("recharts-brush",r),g=1===t.Children.count(o),b=function(e,t){if(!e)return null;var n=e.replace(/(\w)/,(function(e){return e.toUpperCase()})),r=YO.reduce((function(e,r){return KO(KO({},e),{},GO({},r+n,t))}),{});return r[e]=t,r}("userSelect","none");return t.createElement(Ep,{className:v,onMouseLeave:this.handleLeaveWrapper,onTouchMove:this.handleTouchMove,style:b},this.renderBackground(),g&&this.renderPanorama(),this.renderSlide(d,f),this.renderTravellerLayer(d,"startX"),this.renderTravellerLayer(f,"endX"),(p||h||m||y||u)&&this.renderText())}}],i=[{key:"renderDefaultTraveller",value:function(e){var n=e.x,r=e.y,o=e.width,i=e.height,a=e.stroke,l=Math.floor(r+i/2)-1;return t.createElement(t.Fragment,null,t.createElement("rect",{x:n,y:r,width:o,height:i,fill:a,stroke:"none"}),t.createElement("line",{x1:n+1,y1:l,x2:n+o-1,y2:l,fill:"none",stroke:"#fff"}),t.createElement("line",{x1:n+1,y1:l+2,x2:n+o-1,y2:l+2,fill:"none",stroke:"#fff"}))}},{key:"renderTraveller",value:function(e,r){return t.isValidElement(e)?t.cloneElement(e,r):_f()(e)?e(r):n.renderDefaultTraveller(r)}},{key:"getDerivedStateFromProps",value:function(e,t){var n=e.data,r=e.width,o=e.x,i=e.travellerWidth,a=e.updateId,l=e.startIndex,s=e.endIndex;if(n!==t.prevData||a!==t.prevUpdateId)return ek({prevData:n,prevTravellerWidth:i,prevUpdateId:a,prevX:o,prevWidth:r},n&&n.length?function(e){var t=e.data,n=e.startIndex,r=e.endIndex,o=e.x,i=e.width,a=e.travellerWidth;if(!t||!t.length)return{};var l=t.length,s=Pv().domain(mp()(0,l)).range([o,o+i-a]),u=s.domain().map((function(e){return s(e)}));return{isTextActive:!1,isSlideMoving:!1,isTravellerMoving:!1,isTravellerFocused:!1,startX:s(n),endX:s(r),scale:s,scaleValues:u}}({data:n,width:r,x:o,travellerWidth:i,startIndex:l,endIndex:s}):{scale:null,scaleValues:null});if(t.scale&&(r!==t.prevWidth||o!==t.prevX||i!==t.prevTravellerWidth)){t.scale.range([o,o+r-i]);var u=t.scale.domain().map((function(e){return t.scale(e)}));return{prevData:n,prevTravellerWidth:i,prevUpdateId:a,prevX:o,prevWidth:r,startX:t.scale(e.startIndex),endX:t.scale(e.endIndex),scaleValues:u}}return null}},{key:"getIndexInRange",value:function(e,t){for(var n=0,r=e.length-1;r-n>1;){var o=Math.floor((n+r)/2);e[o]>t?r=o:n=o}return t>=e[r]?r:n}}],o&&tk(r.prototype,o),i&&tk(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);function ck(e){return ck="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},ck(e)}function dk(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function fk(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?dk(Object(n),!0).forEach((function(t){pk(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):dk(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function pk(e,t,n){return t=function(e){var t=function(e,t){if("object"!=ck(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=ck(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==ck(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function hk(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return mk(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return mk(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function mk(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}ak(uk,"displayName","Brush"),ak(uk,"defaultProps",{height:40,travellerWidth:5,gap:1,fill:"#fff",stroke:"#666",padding:{top:1,right:1,bottom:1,left:1},leaveTimeOut:1e3,alwaysShowText:!1});var yk=Math.PI/180,vk=function(e){return 180*e/Math.PI},gk=function(e,t,n,r){return{x:e+Math.cos(-yk*r)*n,y:t+Math.sin(-yk*r)*n}},bk=function(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{top:0,right:0,bottom:0,left:0};return Math.min(Math.abs(e-(n.left||0)-(n.right||0)),Math.abs(t-(n.top||0)-(n.bottom||0)))/2},xk=function(e,t){var n=e.x,r=e.y,o=t.cx,i=t.cy,a=function(e,t){var n=e.x,r=e.y,o=t.x,i=t.y;return Math.sqrt(Math.pow(n-o,2)+Math.pow(r-i,2))}({x:n,y:r},{x:o,y:i});if(a<=0)return{radius:a};var l=(n-o)/a,s=Math.acos(l);return r>i&&(s=2*Math.PI-s),{radius:a,angle:vk(s),angleInRadian:s}},wk=function(e,t){var n=t.startAngle,r=t.endAngle,o=Math.floor(n/360),i=Math.floor(r/360);return e+360*Math.min(o,i)},Sk=function(e,t){var n=e.x,r=e.y,o=xk({x:n,y:r},t),i=o.radius,a=o.angle,l=t.innerRadius,s=t.outerRadius;if(i<l||i>s)return!1;if(0===i)return!0;var u,c=function(e){var t=e.startAngle,n=e.endAngle,r=Math.floor(t/360),o=Math.floor(n/360),i=Math.min(r,o);return{startAngle:t-360*i,endAngle:n-360*i}}(t),d=c.startAngle,f=c.endAngle,p=a;if(d<=f){for(;p>f;)p-=360;for(;p<d;)p+=360;u=p>=d&&p<=f}else{for(;p>d;)p-=360;for(;p<f;)p+=360;u=p>=f&&p<=d}return u?fk(fk({},t),{},{radius:i,angle:wk(p,t)}):null},Ak=function(e){return(0,t.isValidElement)(e)||_f()(e)||"boolean"===typeof e?"":e.className};function Ok(e){return Ok="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Ok(e)}var kk=["offset"];function jk(e){return function(e){if(Array.isArray(e))return Ek(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return Ek(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Ek(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ek(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function Ck(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Pk(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Mk(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Pk(Object(n),!0).forEach((function(t){Tk(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Pk(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function Tk(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Ok(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Ok(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Ok(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function _k(){return _k=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},_k.apply(this,arguments)}var Rk=function(e,n,r){var o,i,a=e.position,l=e.viewBox,s=e.offset,u=e.className,c=l,d=c.cx,f=c.cy,p=c.innerRadius,h=c.outerRadius,m=c.startAngle,y=c.endAngle,v=c.clockWise,g=(p+h)/2,b=function(e,t){return vf(t-e)*Math.min(Math.abs(t-e),360)}(m,y),x=b>=0?1:-1;"insideStart"===a?(o=m+x*s,i=v):"insideEnd"===a?(o=y-x*s,i=!v):"end"===a&&(o=y+x*s,i=v),i=b<=0?i:!i;var w=gk(d,f,g,o),S=gk(d,f,g,o+359*(i?1:-1)),A="M".concat(w.x,",").concat(w.y,"\n    A").concat(g,",").concat(g,",0,1,").concat(i?0:1,",\n    ").concat(S.x,",").concat(S.y),O=Mf()(e.id)?Sf("recharts-radial-line-"):e.id;return t.createElement("text",_k({},r,{dominantBaseline:"central",className:zt("recharts-radial-bar-label",u)}),t.createElement("defs",null,t.createElement("path",{id:O,d:A})),t.createElement("textPath",{xlinkHref:"#".concat(O)},n))};function Nk(e){var n,r=e.offset,o=Mk({offset:void 0===r?5:r},Ck(e,kk)),i=o.viewBox,a=o.position,l=o.value,s=o.children,u=o.content,c=o.className,d=void 0===c?"":c,f=o.textBreakAll;if(!i||Mf()(l)&&Mf()(s)&&!(0,t.isValidElement)(u)&&!_f()(u))return null;if((0,t.isValidElement)(u))return(0,t.cloneElement)(u,o);if(_f()(u)){if(n=(0,t.createElement)(u,o),(0,t.isValidElement)(n))return n}else n=function(e){var t=e.value,n=e.formatter,r=Mf()(e.children)?t:e.children;return _f()(n)?n(r):r}(o);var p=function(e){return"cx"in e&&bf(e.cx)}(i),h=rp(o,!0);if(p&&("insideStart"===a||"insideEnd"===a||"end"===a))return Rk(o,n,h);var m=p?function(e){var t=e.viewBox,n=e.offset,r=e.position,o=t,i=o.cx,a=o.cy,l=o.innerRadius,s=o.outerRadius,u=(o.startAngle+o.endAngle)/2;if("outside"===r){var c=gk(i,a,s+n,u),d=c.x;return{x:d,y:c.y,textAnchor:d>=i?"start":"end",verticalAnchor:"middle"}}if("center"===r)return{x:i,y:a,textAnchor:"middle",verticalAnchor:"middle"};if("centerTop"===r)return{x:i,y:a,textAnchor:"middle",verticalAnchor:"start"};if("centerBottom"===r)return{x:i,y:a,textAnchor:"middle",verticalAnchor:"end"};var f=gk(i,a,(l+s)/2,u);return{x:f.x,y:f.y,textAnchor:"middle",verticalAnchor:"middle"}}(o):function(e){var t=e.viewBox,n=e.parentViewBox,r=e.offset,o=e.position,i=t,a=i.x,l=i.y,s=i.width,u=i.height,c=u>=0?1:-1,d=c*r,f=c>0?"end":"start",p=c>0?"start":"end",h=s>=0?1:-1,m=h*r,y=h>0?"end":"start",v=h>0?"start":"end";if("top"===o)return Mk(Mk({},{x:a+s/2,y:l-c*r,textAnchor:"middle",verticalAnchor:f}),n?{height:Math.max(l-n.y,0),width:s}:{});if("bottom"===o)return Mk(Mk({},{x:a+s/2,y:l+u+d,textAnchor:"middle",verticalAnchor:p}),n?{height:Math.max(n.y+n.height-(l+u),0),width:s}:{});if("left"===o){var g={x:a-m,y:l+u/2,textAnchor:y,verticalAnchor:"middle"};return Mk(Mk({},g),n?{width:Math.max(g.x-n.x,0),height:u}:{})}if("right"===o){var b={x:a+s+m,y:l+u/2,textAnchor:v,verticalAnchor:"middle"};return Mk(Mk({},b),n?{width:Math.max(n.x+n.width-b.x,0),height:u}:{})}var x=n?{width:s,height:u}:{};return"insideLeft"===o?Mk({x:a+m,y:l+u/2,textAnchor:v,verticalAnchor:"middle"},x):"insideRight"===o?Mk({x:a+s-m,y:l+u/2,textAnchor:y,verticalAnchor:"middle"},x):"insideTop"===o?Mk({x:a+s/2,y:l+d,textAnchor:"middle",verticalAnchor:p},x):"insideBottom"===o?Mk({x:a+s/2,y:l+u-d,textAnchor:"middle",verticalAnchor:f},x):"insideTopLeft"===o?Mk({x:a+m,y:l+d,textAnchor:v,verticalAnchor:p},x):"insideTopRight"===o?Mk({x:a+s-m,y:l+d,textAnchor:y,verticalAnchor:p},x):"insideBottomLeft"===o?Mk({x:a+m,y:l+u-d,textAnchor:v,verticalAnchor:f},x):"insideBottomRight"===o?Mk({x:a+s-m,y:l+u-d,textAnchor:y,verticalAnchor:f},x):Nf()(o)&&(bf(o.x)||gf(o.x))&&(bf(o.y)||gf(o.y))?Mk({x:a+Af(o.x,s),y:l+Af(o.y,u),textAnchor:"end",verticalAnchor:"end"},x):Mk({x:a+s/2,y:l+u/2,textAnchor:"middle",verticalAnchor:"middle"},x)}(o);return t.createElement(fg,_k({className:zt("recharts-label",d)},h,m,{breakAll:f}),n)}Nk.displayName="Label";var Ik=function(e){var t=e.cx,n=e.cy,r=e.angle,o=e.startAngle,i=e.endAngle,a=e.r,l=e.radius,s=e.innerRadius,u=e.outerRadius,c=e.x,d=e.y,f=e.top,p=e.left,h=e.width,m=e.height,y=e.clockWise,v=e.labelViewBox;if(v)return v;if(bf(h)&&bf(m)){if(bf(c)&&bf(d))return{x:c,y:d,width:h,height:m};if(bf(f)&&bf(p))return{x:f,y:p,width:h,height:m}}return bf(c)&&bf(d)?{x:c,y:d,width:0,height:0}:bf(t)&&bf(n)?{cx:t,cy:n,startAngle:o||r||0,endAngle:i||r||0,innerRadius:s||0,outerRadius:u||l||a||0,clockWise:y}:e.viewBox?e.viewBox:{}};Nk.parseViewBox=Ik,Nk.renderCallByParent=function(e,n){var r=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if(!e||!e.children&&r&&!e.label)return null;var o=e.children,i=Ik(e),a=Jf(o,Nk).map((function(e,r){return(0,t.cloneElement)(e,{viewBox:n||i,key:"label-".concat(r)})}));if(!r)return a;var l=function(e,n){return e?!0===e?t.createElement(Nk,{key:"label-implicit",viewBox:n}):xf(e)?t.createElement(Nk,{key:"label-implicit",viewBox:n,value:e}):(0,t.isValidElement)(e)?e.type===Nk?(0,t.cloneElement)(e,{key:"label-implicit",viewBox:n}):t.createElement(Nk,{key:"label-implicit",content:e,viewBox:n}):_f()(e)?t.createElement(Nk,{key:"label-implicit",content:e,viewBox:n}):Nf()(e)?t.createElement(Nk,_k({viewBox:n},e,{key:"label-implicit"})):null:null}(e.label,n||i);return[l].concat(jk(a))};var Dk=function(e,t){var n=e.alwaysShow,r=e.ifOverflow;return n&&(r="extendDomain"),r===t},Lk=n(1733),zk=n.n(Lk),$k=n(7002),Bk=n.n($k),Fk=function(e){return null};Fk.displayName="Cell";var Wk=n(4065),Uk=n.n(Wk);function Hk(e){return Hk="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Hk(e)}var Vk=["valueAccessor"],qk=["data","dataKey","clockWise","id","textBreakAll"];function Xk(e){return function(e){if(Array.isArray(e))return Kk(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return Kk(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Kk(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Kk(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function Gk(){return Gk=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Gk.apply(this,arguments)}function Yk(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Qk(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Yk(Object(n),!0).forEach((function(t){Jk(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Yk(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function Jk(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Hk(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Hk(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Hk(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Zk(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var ej=function(e){return Array.isArray(e.value)?Uk()(e.value):e.value};function tj(e){var n=e.valueAccessor,r=void 0===n?ej:n,o=Zk(e,Vk),i=o.data,a=o.dataKey,l=o.clockWise,s=o.id,u=o.textBreakAll,c=Zk(o,qk);return i&&i.length?t.createElement(Ep,{className:"recharts-label-list"},i.map((function(e,n){var o=Mf()(a)?r(e,n):SO(e&&e.payload,a),i=Mf()(s)?{}:{id:"".concat(s,"-").concat(n)};return t.createElement(Nk,Gk({},rp(e,!0),c,i,{parentViewBox:e.parentViewBox,value:o,textBreakAll:u,viewBox:Nk.parseViewBox(Mf()(l)?e:Qk(Qk({},e),{},{clockWise:l})),key:"label-".concat(n),index:n}))}))):null}tj.displayName="LabelList",tj.renderCallByParent=function(e,n){var r=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if(!e||!e.children&&r&&!e.label)return null;var o=Jf(e.children,tj).map((function(e,r){return(0,t.cloneElement)(e,{data:n,key:"labelList-".concat(r)})}));if(!r)return o;var i=function(e,n){return e?!0===e?t.createElement(tj,{key:"labelList-implicit",data:n}):t.isValidElement(e)||_f()(e)?t.createElement(tj,{key:"labelList-implicit",data:n,content:e}):Nf()(e)?t.createElement(tj,Gk({data:n},e,{key:"labelList-implicit"})):null:null}(e.label,n);return[i].concat(Xk(o))};var nj=n(2322),rj=n.n(nj),oj=n(6361),ij=n.n(oj);function aj(e){return aj="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},aj(e)}function lj(){return lj=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},lj.apply(this,arguments)}function sj(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return uj(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return uj(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function uj(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function cj(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function dj(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?cj(Object(n),!0).forEach((function(t){fj(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):cj(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function fj(e,t,n){return t=function(e){var t=function(e,t){if("object"!=aj(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=aj(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==aj(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var pj=function(e,t,n,r,o){var i,a=n-r;return i="M ".concat(e,",").concat(t),i+="L ".concat(e+n,",").concat(t),i+="L ".concat(e+n-a/2,",").concat(t+o),i+="L ".concat(e+n-a/2-r,",").concat(t+o),i+="L ".concat(e,",").concat(t," Z")},hj={x:0,y:0,upperWidth:0,lowerWidth:0,height:0,isUpdateAnimationActive:!1,animationBegin:0,animationDuration:1500,animationEasing:"ease"},mj=function(e){var n=dj(dj({},hj),e),r=(0,t.useRef)(),o=sj((0,t.useState)(-1),2),i=o[0],a=o[1];(0,t.useEffect)((function(){if(r.current&&r.current.getTotalLength)try{var e=r.current.getTotalLength();e&&a(e)}catch(t){}}),[]);var l=n.x,s=n.y,u=n.upperWidth,c=n.lowerWidth,d=n.height,f=n.className,p=n.animationEasing,h=n.animationDuration,m=n.animationBegin,y=n.isUpdateAnimationActive;if(l!==+l||s!==+s||u!==+u||c!==+c||d!==+d||0===u&&0===c||0===d)return null;var v=zt("recharts-trapezoid",f);return y?t.createElement(av,{canBegin:i>0,from:{upperWidth:0,lowerWidth:0,height:d,x:l,y:s},to:{upperWidth:u,lowerWidth:c,height:d,x:l,y:s},duration:h,animationEasing:p,isActive:y},(function(e){var o=e.upperWidth,a=e.lowerWidth,l=e.height,s=e.x,u=e.y;return t.createElement(av,{canBegin:i>0,from:"0px ".concat(-1===i?1:i,"px"),to:"".concat(i,"px 0px"),attributeName:"strokeDasharray",begin:m,duration:h,easing:p},t.createElement("path",lj({},rp(n,!0),{className:v,d:pj(s,u,o,a,l),ref:r})))})):t.createElement("g",null,t.createElement("path",lj({},rp(n,!0),{className:v,d:pj(l,s,u,c,d)})))};function yj(e){return yj="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},yj(e)}function vj(){return vj=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},vj.apply(this,arguments)}function gj(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function bj(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?gj(Object(n),!0).forEach((function(t){xj(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):gj(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function xj(e,t,n){return t=function(e){var t=function(e,t){if("object"!=yj(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=yj(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==yj(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var wj=function(e){var t=e.cx,n=e.cy,r=e.radius,o=e.angle,i=e.sign,a=e.isExternal,l=e.cornerRadius,s=e.cornerIsExternal,u=l*(a?1:-1)+r,c=Math.asin(l/u)/yk,d=s?o:o+i*c,f=s?o-i*c:o;return{center:gk(t,n,u,d),circleTangency:gk(t,n,r,d),lineTangency:gk(t,n,u*Math.cos(c*yk),f),theta:c}},Sj=function(e){var t=e.cx,n=e.cy,r=e.innerRadius,o=e.outerRadius,i=e.startAngle,a=function(e,t){return vf(t-e)*Math.min(Math.abs(t-e),359.999)}(i,e.endAngle),l=i+a,s=gk(t,n,o,i),u=gk(t,n,o,l),c="M ".concat(s.x,",").concat(s.y,"\n    A ").concat(o,",").concat(o,",0,\n    ").concat(+(Math.abs(a)>180),",").concat(+(i>l),",\n    ").concat(u.x,",").concat(u.y,"\n  ");if(r>0){var d=gk(t,n,r,i),f=gk(t,n,r,l);c+="L ".concat(f.x,",").concat(f.y,"\n            A ").concat(r,",").concat(r,",0,\n            ").concat(+(Math.abs(a)>180),",").concat(+(i<=l),",\n            ").concat(d.x,",").concat(d.y," Z")}else c+="L ".concat(t,",").concat(n," Z");return c},Aj={cx:0,cy:0,innerRadius:0,outerRadius:0,startAngle:0,endAngle:0,cornerRadius:0,forceCornerRadius:!1,cornerIsExternal:!1},Oj=function(e){var n=bj(bj({},Aj),e),r=n.cx,o=n.cy,i=n.innerRadius,a=n.outerRadius,l=n.cornerRadius,s=n.forceCornerRadius,u=n.cornerIsExternal,c=n.startAngle,d=n.endAngle,f=n.className;if(a<i||c===d)return null;var p,h=zt("recharts-sector",f),m=a-i,y=Af(l,m,0,!0);return p=y>0&&Math.abs(c-d)<360?function(e){var t=e.cx,n=e.cy,r=e.innerRadius,o=e.outerRadius,i=e.cornerRadius,a=e.forceCornerRadius,l=e.cornerIsExternal,s=e.startAngle,u=e.endAngle,c=vf(u-s),d=wj({cx:t,cy:n,radius:o,angle:s,sign:c,cornerRadius:i,cornerIsExternal:l}),f=d.circleTangency,p=d.lineTangency,h=d.theta,m=wj({cx:t,cy:n,radius:o,angle:u,sign:-c,cornerRadius:i,cornerIsExternal:l}),y=m.circleTangency,v=m.lineTangency,g=m.theta,b=l?Math.abs(s-u):Math.abs(s-u)-h-g;if(b<0)return a?"M ".concat(p.x,",").concat(p.y,"\n        a").concat(i,",").concat(i,",0,0,1,").concat(2*i,",0\n        a").concat(i,",").concat(i,",0,0,1,").concat(2*-i,",0\n      "):Sj({cx:t,cy:n,innerRadius:r,outerRadius:o,startAngle:s,endAngle:u});var x="M ".concat(p.x,",").concat(p.y,"\n    A").concat(i,",").concat(i,",0,0,").concat(+(c<0),",").concat(f.x,",").concat(f.y,"\n    A").concat(o,",").concat(o,",0,").concat(+(b>180),",").concat(+(c<0),",").concat(y.x,",").concat(y.y,"\n    A").concat(i,",").concat(i,",0,0,").concat(+(c<0),",").concat(v.x,",").concat(v.y,"\n  ");if(r>0){var w=wj({cx:t,cy:n,radius:r,angle:s,sign:c,isExternal:!0,cornerRadius:i,cornerIsExternal:l}),S=w.circleTangency,A=w.lineTangency,O=w.theta,k=wj({cx:t,cy:n,radius:r,angle:u,sign:-c,isExternal:!0,cornerRadius:i,cornerIsExternal:l}),j=k.circleTangency,E=k.lineTangency,C=k.theta,P=l?Math.abs(s-u):Math.abs(s-u)-O-C;if(P<0&&0===i)return"".concat(x,"L").concat(t,",").concat(n,"Z");x+="L".concat(E.x,",").concat(E.y,"\n      A").concat(i,",").concat(i,",0,0,").concat(+(c<0),",").concat(j.x,",").concat(j.y,"\n      A").concat(r,",").concat(r,",0,").concat(+(P>180),",").concat(+(c>0),",").concat(S.x,",").concat(S.y,"\n      A").concat(i,",").concat(i,",0,0,").concat(+(c<0),",").concat(A.x,",").concat(A.y,"Z")}else x+="L".concat(t,",").concat(n,"Z");return x}({cx:r,cy:o,innerRadius:i,outerRadius:a,cornerRadius:Math.min(y,m/2),forceCornerRadius:s,cornerIsExternal:u,startAngle:c,endAngle:d}):Sj({cx:r,cy:o,innerRadius:i,outerRadius:a,startAngle:c,endAngle:d}),t.createElement("path",vj({},rp(n,!0),{className:h,d:p,role:"img"}))},kj=["option","shapeType","propTransformer","activeClassName","isActive"];function jj(e){return jj="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},jj(e)}function Ej(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Cj(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Pj(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Cj(Object(n),!0).forEach((function(t){Mj(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Cj(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function Mj(e,t,n){return t=function(e){var t=function(e,t){if("object"!=jj(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=jj(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==jj(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Tj(e,t){return Pj(Pj({},t),e)}function _j(e){var n=e.shapeType,r=e.elementProps;switch(n){case"rectangle":return t.createElement(vv,r);case"trapezoid":return t.createElement(mj,r);case"sector":return t.createElement(Oj,r);case"symbols":if(function(e){return"symbols"===e}(n))return t.createElement(rm,r);break;default:return null}}function Rj(e){var n,r=e.option,o=e.shapeType,i=e.propTransformer,a=void 0===i?Tj:i,l=e.activeClassName,s=void 0===l?"recharts-active-shape":l,u=e.isActive,c=Ej(e,kj);if((0,t.isValidElement)(r))n=(0,t.cloneElement)(r,Pj(Pj({},c),function(e){return(0,t.isValidElement)(e)?e.props:e}(r)));else if(_f()(r))n=r(c);else if(rj()(r)&&!ij()(r)){var d=a(r,c);n=t.createElement(_j,{shapeType:o,elementProps:d})}else{var f=c;n=t.createElement(_j,{shapeType:o,elementProps:f})}return u?t.createElement(Ep,{className:s},n):n}function Nj(e,t){return null!=t&&"trapezoids"in e.props}function Ij(e,t){return null!=t&&"sectors"in e.props}function Dj(e,t){return null!=t&&"points"in e.props}function Lj(e,t){var n,r,o=e.x===(null===t||void 0===t||null===(n=t.labelViewBox)||void 0===n?void 0:n.x)||e.x===t.x,i=e.y===(null===t||void 0===t||null===(r=t.labelViewBox)||void 0===r?void 0:r.y)||e.y===t.y;return o&&i}function zj(e,t){var n=e.endAngle===t.endAngle,r=e.startAngle===t.startAngle;return n&&r}function $j(e,t){var n=e.x===t.x,r=e.y===t.y,o=e.z===t.z;return n&&r&&o}function Bj(e){var t=e.activeTooltipItem,n=e.graphicalItem,r=e.itemData,o=function(e,t){var n;return Nj(e,t)?n="trapezoids":Ij(e,t)?n="sectors":Dj(e,t)&&(n="points"),n}(n,t),i=function(e,t){var n,r;return Nj(e,t)?null===(n=t.tooltipPayload)||void 0===n||null===(n=n[0])||void 0===n||null===(n=n.payload)||void 0===n?void 0:n.payload:Ij(e,t)?null===(r=t.tooltipPayload)||void 0===r||null===(r=r[0])||void 0===r||null===(r=r.payload)||void 0===r?void 0:r.payload:Dj(e,t)?t.payload:{}}(n,t),a=r.filter((function(e,r){var a=wA()(i,e),l=n.props[o].filter((function(e){var r=function(e,t){var n;return Nj(e,t)?n=Lj:Ij(e,t)?n=zj:Dj(e,t)&&(n=$j),n}(n,t);return r(e,t)})),s=n.props[o].indexOf(l[l.length-1]);return a&&r===s}));return r.indexOf(a[a.length-1])}var Fj=["x","y"];function Wj(e){return Wj="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Wj(e)}function Uj(){return Uj=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Uj.apply(this,arguments)}function Hj(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Vj(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Hj(Object(n),!0).forEach((function(t){qj(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Hj(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function qj(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Wj(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Wj(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Wj(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Xj(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Kj(e,t){var n=e.x,r=e.y,o=Xj(e,Fj),i="".concat(n),a=parseInt(i,10),l="".concat(r),s=parseInt(l,10),u="".concat(t.height||o.height),c=parseInt(u,10),d="".concat(t.width||o.width),f=parseInt(d,10);return Vj(Vj(Vj(Vj(Vj({},t),o),a?{x:a}:{}),s?{y:s}:{}),{},{height:c,width:f,name:t.name,radius:t.radius})}function Gj(e){return t.createElement(Rj,Uj({shapeType:"rectangle",propTransformer:Kj,activeClassName:"recharts-active-bar"},e))}var Yj,Qj=["value","background"];function Jj(e){return Jj="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Jj(e)}function Zj(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function eE(){return eE=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},eE.apply(this,arguments)}function tE(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function nE(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?tE(Object(n),!0).forEach((function(t){sE(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):tE(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function rE(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,uE(r.key),r)}}function oE(e,t,n){return t=aE(t),function(e,t){if(t&&("object"===Jj(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,iE()?Reflect.construct(t,n||[],aE(e).constructor):t.apply(e,n))}function iE(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(iE=function(){return!!e})()}function aE(e){return aE=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},aE(e)}function lE(e,t){return lE=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},lE(e,t)}function sE(e,t,n){return(t=uE(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function uE(e){var t=function(e,t){if("object"!=Jj(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Jj(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Jj(t)?t:t+""}var cE=function(e){function n(){var e;!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n);for(var t=arguments.length,r=new Array(t),o=0;o<t;o++)r[o]=arguments[o];return sE(e=oE(this,n,[].concat(r)),"state",{isAnimationFinished:!1}),sE(e,"id",Sf("recharts-bar-")),sE(e,"handleAnimationEnd",(function(){var t=e.props.onAnimationEnd;e.setState({isAnimationFinished:!0}),t&&t()})),sE(e,"handleAnimationStart",(function(){var t=e.props.onAnimationStart;e.setState({isAnimationFinished:!1}),t&&t()})),e}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&lE(e,t)}(n,e),r=n,o=[{key:"renderRectanglesStatically",value:function(e){var n=this,r=this.props,o=r.shape,i=r.dataKey,a=r.activeIndex,l=r.activeBar,s=rp(this.props,!1);return e&&e.map((function(e,r){var u=r===a,c=u?l:o,d=nE(nE(nE({},s),e),{},{isActive:u,option:c,index:r,dataKey:i,onAnimationStart:n.handleAnimationStart,onAnimationEnd:n.handleAnimationEnd});return t.createElement(Ep,eE({className:"recharts-bar-rectangle"},Uf(n.props,e,r),{key:"rectangle-".concat(null===e||void 0===e?void 0:e.x,"-").concat(null===e||void 0===e?void 0:e.y,"-").concat(null===e||void 0===e?void 0:e.value,"-").concat(r)}),t.createElement(Gj,d))}))}},{key:"renderRectanglesWithAnimation",value:function(){var e=this,n=this.props,r=n.data,o=n.layout,i=n.isAnimationActive,a=n.animationBegin,l=n.animationDuration,s=n.animationEasing,u=n.animationId,c=this.state.prevData;return t.createElement(av,{begin:a,duration:l,isActive:i,easing:s,from:{t:0},to:{t:1},key:"bar-".concat(u),onAnimationEnd:this.handleAnimationEnd,onAnimationStart:this.handleAnimationStart},(function(n){var i=n.t,a=r.map((function(e,t){var n=c&&c[t];if(n){var r=kf(n.x,e.x),a=kf(n.y,e.y),l=kf(n.width,e.width),s=kf(n.height,e.height);return nE(nE({},e),{},{x:r(i),y:a(i),width:l(i),height:s(i)})}if("horizontal"===o){var u=kf(0,e.height)(i);return nE(nE({},e),{},{y:e.y+e.height-u,height:u})}var d=kf(0,e.width)(i);return nE(nE({},e),{},{width:d})}));return t.createElement(Ep,null,e.renderRectanglesStatically(a))}))}},{key:"renderRectangles",value:function(){var e=this.props,t=e.data,n=e.isAnimationActive,r=this.state.prevData;return!(n&&t&&t.length)||r&&wA()(r,t)?this.renderRectanglesStatically(t):this.renderRectanglesWithAnimation()}},{key:"renderBackground",value:function(){var e=this,n=this.props,r=n.data,o=n.dataKey,i=n.activeIndex,a=rp(this.props.background,!1);return r.map((function(n,r){n.value;var l=n.background,s=Zj(n,Qj);if(!l)return null;var u=nE(nE(nE(nE(nE({},s),{},{fill:"#eee"},l),a),Uf(e.props,n,r)),{},{onAnimationStart:e.handleAnimationStart,onAnimationEnd:e.handleAnimationEnd,dataKey:o,index:r,className:"recharts-bar-background-rectangle"});return t.createElement(Gj,eE({key:"background-bar-".concat(r),option:e.props.background,isActive:r===i},u))}))}},{key:"renderErrorBar",value:function(e,n){if(this.props.isAnimationActive&&!this.state.isAnimationFinished)return null;var r=this.props,o=r.data,i=r.xAxis,a=r.yAxis,l=r.layout,s=Jf(r.children,cO);if(!s)return null;var u="vertical"===l?o[0].height/2:o[0].width/2,c=function(e,t){var n=Array.isArray(e.value)?e.value[1]:e.value;return{x:e.x,y:e.y,value:n,errorVal:SO(e,t)}},d={clipPath:e?"url(#clipPath-".concat(n,")"):null};return t.createElement(Ep,d,s.map((function(e){return t.cloneElement(e,{key:"error-bar-".concat(n,"-").concat(e.props.dataKey),data:o,xAxis:i,yAxis:a,layout:l,offset:u,dataPointFormatter:c})})))}},{key:"render",value:function(){var e=this.props,n=e.hide,r=e.data,o=e.className,i=e.xAxis,a=e.yAxis,l=e.left,s=e.top,u=e.width,c=e.height,d=e.isAnimationActive,f=e.background,p=e.id;if(n||!r||!r.length)return null;var h=this.state.isAnimationFinished,m=zt("recharts-bar",o),y=i&&i.allowDataOverflow,v=a&&a.allowDataOverflow,g=y||v,b=Mf()(p)?this.id:p;return t.createElement(Ep,{className:m},y||v?t.createElement("defs",null,t.createElement("clipPath",{id:"clipPath-".concat(b)},t.createElement("rect",{x:y?l:l-u/2,y:v?s:s-c/2,width:y?u:2*u,height:v?c:2*c}))):null,t.createElement(Ep,{className:"recharts-bar-rectangles",clipPath:g?"url(#clipPath-".concat(b,")"):null},f?this.renderBackground():null,this.renderRectangles()),this.renderErrorBar(g,b),(!d||h)&&tj.renderCallByParent(this.props,r))}}],i=[{key:"getDerivedStateFromProps",value:function(e,t){return e.animationId!==t.prevAnimationId?{prevAnimationId:e.animationId,curData:e.data,prevData:t.curData}:e.data!==t.curData?{curData:e.data}:null}}],o&&rE(r.prototype,o),i&&rE(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);function dE(e){return dE="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},dE(e)}function fE(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,yE(r.key),r)}}function pE(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function hE(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?pE(Object(n),!0).forEach((function(t){mE(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):pE(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function mE(e,t,n){return(t=yE(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function yE(e){var t=function(e,t){if("object"!=dE(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=dE(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==dE(t)?t:t+""}Yj=cE,sE(cE,"displayName","Bar"),sE(cE,"defaultProps",{xAxisId:0,yAxisId:0,legendType:"rect",minPointSize:0,hide:!1,data:[],layout:"vertical",activeBar:!1,isAnimationActive:!eh.isSsr,animationBegin:0,animationDuration:400,animationEasing:"ease"}),sE(cE,"getComposedData",(function(e){var t=e.props,n=e.item,r=e.barPosition,o=e.bandSize,i=e.xAxis,a=e.yAxis,l=e.xAxisTicks,s=e.yAxisTicks,u=e.stackedData,c=e.dataStartIndex,d=e.displayedData,f=e.offset,p=function(e,t){if(!e)return null;for(var n=0,r=e.length;n<r;n++)if(e[n].item===t)return e[n].position;return null}(r,n);if(!p)return null;var h=t.layout,m=n.type.defaultProps,y=void 0!==m?nE(nE({},m),n.props):n.props,v=y.dataKey,g=y.children,b=y.minPointSize,x="horizontal"===h?a:i,w=u?x.scale.domain():null,S=function(e){var t=e.numericAxis,n=t.scale.domain();if("number"===t.type){var r=Math.min(n[0],n[1]),o=Math.max(n[0],n[1]);return r<=0&&o>=0?0:o<0?o:r}return n[0]}({numericAxis:x}),A=Jf(g,Fk),O=d.map((function(e,t){var r,d,f,m,y,g;u?r=function(e,t){if(!t||2!==t.length||!bf(t[0])||!bf(t[1]))return e;var n=Math.min(t[0],t[1]),r=Math.max(t[0],t[1]),o=[e[0],e[1]];return(!bf(e[0])||e[0]<n)&&(o[0]=n),(!bf(e[1])||e[1]>r)&&(o[1]=r),o[0]>r&&(o[0]=r),o[1]<n&&(o[1]=n),o}(u[c+t],w):(r=SO(e,v),Array.isArray(r)||(r=[S,r]));var x=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;return function(n,r){if("number"===typeof e)return e;var o="number"===typeof n;return o?e(n,r):(o||bp(!1),t)}}(b,Yj.defaultProps.minPointSize)(r[1],t);if("horizontal"===h){var O,k=[a.scale(r[0]),a.scale(r[1])],j=k[0],E=k[1];d=zO({axis:i,ticks:l,bandSize:o,offset:p.offset,entry:e,index:t}),f=null!==(O=null!==E&&void 0!==E?E:j)&&void 0!==O?O:void 0,m=p.size;var C=j-E;if(y=Number.isNaN(C)?0:C,g={x:d,y:a.y,width:m,height:a.height},Math.abs(x)>0&&Math.abs(y)<Math.abs(x)){var P=vf(y||x)*(Math.abs(x)-Math.abs(y));f-=P,y+=P}}else{var M=[i.scale(r[0]),i.scale(r[1])],T=M[0],_=M[1];if(d=T,f=zO({axis:a,ticks:s,bandSize:o,offset:p.offset,entry:e,index:t}),m=_-T,y=p.size,g={x:i.x,y:f,width:i.width,height:y},Math.abs(x)>0&&Math.abs(m)<Math.abs(x))m+=vf(m||x)*(Math.abs(x)-Math.abs(m))}return nE(nE(nE({},e),{},{x:d,y:f,width:m,height:y,value:u?r:r[1],payload:e,background:g},A&&A[t]&&A[t].props),{},{tooltipPayload:[VO(n,e)],tooltipPosition:{x:d+m/2,y:f+y/2}})}));return nE({data:O,layout:h},f)}));var vE=function(e,t){var n=e.x,r=e.y,o=t.x,i=t.y;return{x:Math.min(n,o),y:Math.min(r,i),width:Math.abs(o-n),height:Math.abs(i-r)}},gE=function(){function e(t){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.scale=t}return t=e,n=[{key:"domain",get:function(){return this.scale.domain}},{key:"range",get:function(){return this.scale.range}},{key:"rangeMin",get:function(){return this.range()[0]}},{key:"rangeMax",get:function(){return this.range()[1]}},{key:"bandwidth",get:function(){return this.scale.bandwidth}},{key:"apply",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=t.bandAware,r=t.position;if(void 0!==e){if(r)switch(r){case"start":default:return this.scale(e);case"middle":var o=this.bandwidth?this.bandwidth()/2:0;return this.scale(e)+o;case"end":var i=this.bandwidth?this.bandwidth():0;return this.scale(e)+i}if(n){var a=this.bandwidth?this.bandwidth()/2:0;return this.scale(e)+a}return this.scale(e)}}},{key:"isInRange",value:function(e){var t=this.range(),n=t[0],r=t[t.length-1];return n<=r?e>=n&&e<=r:e>=r&&e<=n}}],r=[{key:"create",value:function(t){return new e(t)}}],n&&fE(t.prototype,n),r&&fE(t,r),Object.defineProperty(t,"prototype",{writable:!1}),t;var t,n,r}();mE(gE,"EPS",1e-4);var bE=function(e){var t=Object.keys(e).reduce((function(t,n){return hE(hE({},t),{},mE({},n,gE.create(e[n])))}),{});return hE(hE({},t),{},{apply:function(e){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=n.bandAware,o=n.position;return zk()(e,(function(e,n){return t[n].apply(e,{bandAware:r,position:o})}))},isInRange:function(e){return Bk()(e,(function(e,n){return t[n].isInRange(e)}))}})};function xE(){return xE=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},xE.apply(this,arguments)}function wE(e){return wE="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},wE(e)}function SE(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function AE(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?SE(Object(n),!0).forEach((function(t){PE(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):SE(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function OE(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,ME(r.key),r)}}function kE(e,t,n){return t=EE(t),function(e,t){if(t&&("object"===wE(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,jE()?Reflect.construct(t,n||[],EE(e).constructor):t.apply(e,n))}function jE(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(jE=function(){return!!e})()}function EE(e){return EE=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},EE(e)}function CE(e,t){return CE=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},CE(e,t)}function PE(e,t,n){return(t=ME(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ME(e){var t=function(e,t){if("object"!=wE(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=wE(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==wE(t)?t:t+""}var TE=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),kE(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&CE(e,t)}(n,e),r=n,o=[{key:"render",value:function(){var e=this.props,r=e.x,o=e.y,i=e.r,a=e.alwaysShow,l=e.clipPathId,s=xf(r),u=xf(o);if(Cf(void 0===a,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.'),!s||!u)return null;var c=function(e){var t=e.x,n=e.y,r=e.xAxis,o=e.yAxis,i=bE({x:r.scale,y:o.scale}),a=i.apply({x:t,y:n},{bandAware:!0});return Dk(e,"discard")&&!i.isInRange(a)?null:a}(this.props);if(!c)return null;var d=c.x,f=c.y,p=this.props,h=p.shape,m=p.className,y=AE(AE({clipPath:Dk(this.props,"hidden")?"url(#".concat(l,")"):void 0},rp(this.props,!0)),{},{cx:d,cy:f});return t.createElement(Ep,{className:zt("recharts-reference-dot",m)},n.renderDot(h,y),Nk.renderCallByParent(this.props,{x:d-i,y:f-i,width:2*i,height:2*i}))}}],o&&OE(r.prototype,o),i&&OE(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);PE(TE,"displayName","ReferenceDot"),PE(TE,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,r:10,fill:"#fff",stroke:"#ccc",fillOpacity:1,strokeWidth:1}),PE(TE,"renderDot",(function(e,n){return t.isValidElement(e)?t.cloneElement(e,n):_f()(e)?e(n):t.createElement(Tm,xE({},n,{cx:n.cx,cy:n.cy,className:"recharts-reference-dot-dot"}))}));var _E=n(4597),RE=n.n(_E),NE=n(8990),IE=n.n(NE),DE=n(5797),LE=n.n(DE)()((function(e){return{x:e.left,y:e.top,width:e.width,height:e.height}}),(function(e){return["l",e.left,"t",e.top,"w",e.width,"h",e.height].join("")}));var zE=(0,t.createContext)(void 0),$E=(0,t.createContext)(void 0),BE=(0,t.createContext)(void 0),FE=(0,t.createContext)({}),WE=(0,t.createContext)(void 0),UE=(0,t.createContext)(0),HE=(0,t.createContext)(0),VE=function(e){var n=e.state,r=n.xAxisMap,o=n.yAxisMap,i=n.offset,a=e.clipPathId,l=e.children,s=e.width,u=e.height,c=LE(i);return t.createElement(zE.Provider,{value:r},t.createElement($E.Provider,{value:o},t.createElement(FE.Provider,{value:i},t.createElement(BE.Provider,{value:c},t.createElement(WE.Provider,{value:a},t.createElement(UE.Provider,{value:u},t.createElement(HE.Provider,{value:s},l)))))))};var qE=function(e){var n=(0,t.useContext)(zE);null==n&&bp(!1);var r=n[e];return null==r&&bp(!1),r},XE=function(e){var n=(0,t.useContext)($E);null==n&&bp(!1);var r=n[e];return null==r&&bp(!1),r},KE=function(){return(0,t.useContext)(HE)},GE=function(){return(0,t.useContext)(UE)};function YE(e){return YE="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},YE(e)}function QE(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,iC(r.key),r)}}function JE(e,t,n){return t=eC(t),function(e,t){if(t&&("object"===YE(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,ZE()?Reflect.construct(t,n||[],eC(e).constructor):t.apply(e,n))}function ZE(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(ZE=function(){return!!e})()}function eC(e){return eC=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},eC(e)}function tC(e,t){return tC=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},tC(e,t)}function nC(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function rC(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?nC(Object(n),!0).forEach((function(t){oC(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):nC(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function oC(e,t,n){return(t=iC(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function iC(e){var t=function(e,t){if("object"!=YE(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=YE(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==YE(t)?t:t+""}function aC(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return lC(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return lC(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function lC(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function sC(){return sC=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},sC.apply(this,arguments)}function uC(e){var n=e.x,r=e.y,o=e.segment,i=e.xAxisId,a=e.yAxisId,l=e.shape,s=e.className,u=e.alwaysShow,c=(0,t.useContext)(WE),d=qE(i),f=XE(a),p=(0,t.useContext)(BE);if(!c||!p)return null;Cf(void 0===u,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.');var h=function(e,t,n,r,o,i,a,l,s){var u=o.x,c=o.y,d=o.width,f=o.height;if(n){var p=s.y,h=e.y.apply(p,{position:i});if(Dk(s,"discard")&&!e.y.isInRange(h))return null;var m=[{x:u+d,y:h},{x:u,y:h}];return"left"===l?m.reverse():m}if(t){var y=s.x,v=e.x.apply(y,{position:i});if(Dk(s,"discard")&&!e.x.isInRange(v))return null;var g=[{x:v,y:c+f},{x:v,y:c}];return"top"===a?g.reverse():g}if(r){var b=s.segment.map((function(t){return e.apply(t,{position:i})}));return Dk(s,"discard")&&RE()(b,(function(t){return!e.isInRange(t)}))?null:b}return null}(bE({x:d.scale,y:f.scale}),xf(n),xf(r),o&&2===o.length,p,e.position,d.orientation,f.orientation,e);if(!h)return null;var m=aC(h,2),y=m[0],v=y.x,g=y.y,b=m[1],x=b.x,w=b.y,S=rC(rC({clipPath:Dk(e,"hidden")?"url(#".concat(c,")"):void 0},rp(e,!0)),{},{x1:v,y1:g,x2:x,y2:w});return t.createElement(Ep,{className:zt("recharts-reference-line",s)},function(e,n){return t.isValidElement(e)?t.cloneElement(e,n):_f()(e)?e(n):t.createElement("line",sC({},n,{className:"recharts-reference-line-line"}))}(l,S),Nk.renderCallByParent(e,function(e){var t=e.x1,n=e.y1,r=e.x2,o=e.y2;return vE({x:t,y:n},{x:r,y:o})}({x1:v,y1:g,x2:x,y2:w})))}var cC=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),JE(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&tC(e,t)}(n,e),r=n,(o=[{key:"render",value:function(){return t.createElement(uC,this.props)}}])&&QE(r.prototype,o),i&&QE(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);function dC(){return dC=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},dC.apply(this,arguments)}function fC(e){return fC="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},fC(e)}function pC(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function hC(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?pC(Object(n),!0).forEach((function(t){xC(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):pC(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function mC(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,wC(r.key),r)}}function yC(e,t,n){return t=gC(t),function(e,t){if(t&&("object"===fC(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,vC()?Reflect.construct(t,n||[],gC(e).constructor):t.apply(e,n))}function vC(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(vC=function(){return!!e})()}function gC(e){return gC=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},gC(e)}function bC(e,t){return bC=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},bC(e,t)}function xC(e,t,n){return(t=wC(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function wC(e){var t=function(e,t){if("object"!=fC(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=fC(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==fC(t)?t:t+""}oC(cC,"displayName","ReferenceLine"),oC(cC,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,fill:"none",stroke:"#ccc",fillOpacity:1,strokeWidth:1,position:"middle"});var SC=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),yC(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&bC(e,t)}(n,e),r=n,(o=[{key:"render",value:function(){var e=this.props,r=e.x1,o=e.x2,i=e.y1,a=e.y2,l=e.className,s=e.alwaysShow,u=e.clipPathId;Cf(void 0===s,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.');var c=xf(r),d=xf(o),f=xf(i),p=xf(a),h=this.props.shape;if(!c&&!d&&!f&&!p&&!h)return null;var m=function(e,t,n,r,o){var i=o.x1,a=o.x2,l=o.y1,s=o.y2,u=o.xAxis,c=o.yAxis;if(!u||!c)return null;var d=bE({x:u.scale,y:c.scale}),f={x:e?d.x.apply(i,{position:"start"}):d.x.rangeMin,y:n?d.y.apply(l,{position:"start"}):d.y.rangeMin},p={x:t?d.x.apply(a,{position:"end"}):d.x.rangeMax,y:r?d.y.apply(s,{position:"end"}):d.y.rangeMax};return!Dk(o,"discard")||d.isInRange(f)&&d.isInRange(p)?vE(f,p):null}(c,d,f,p,this.props);if(!m&&!h)return null;var y=Dk(this.props,"hidden")?"url(#".concat(u,")"):void 0;return t.createElement(Ep,{className:zt("recharts-reference-area",l)},n.renderRect(h,hC(hC({clipPath:y},rp(this.props,!0)),m)),Nk.renderCallByParent(this.props,m))}}])&&mC(r.prototype,o),i&&mC(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);function AC(e){return function(e){if(Array.isArray(e))return OC(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return OC(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return OC(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function OC(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}xC(SC,"displayName","ReferenceArea"),xC(SC,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,r:10,fill:"#ccc",fillOpacity:.5,stroke:"none",strokeWidth:1}),xC(SC,"renderRect",(function(e,n){return t.isValidElement(e)?t.cloneElement(e,n):_f()(e)?e(n):t.createElement(vv,dC({},n,{className:"recharts-reference-area-rect"}))}));var kC=function(e,t,n,r,o){var i=Jf(e,cC),a=Jf(e,TE),l=[].concat(AC(i),AC(a)),s=Jf(e,SC),u="".concat(r,"Id"),c=r[0],d=t;if(l.length&&(d=l.reduce((function(e,t){if(t.props[u]===n&&Dk(t.props,"extendDomain")&&bf(t.props[c])){var r=t.props[c];return[Math.min(e[0],r),Math.max(e[1],r)]}return e}),d)),s.length){var f="".concat(c,"1"),p="".concat(c,"2");d=s.reduce((function(e,t){if(t.props[u]===n&&Dk(t.props,"extendDomain")&&bf(t.props[f])&&bf(t.props[p])){var r=t.props[f],o=t.props[p];return[Math.min(e[0],r,o),Math.max(e[1],r,o)]}return e}),d)}return o&&o.length&&(d=o.reduce((function(e,t){return bf(t)?[Math.min(e[0],t),Math.max(e[1],t)]:e}),d)),d},jC=n(7283),EC=new(n.n(jC)()),CC="recharts.syncMouseEvents";function PC(e){return PC="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},PC(e)}function MC(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,_C(r.key),r)}}function TC(e,t,n){return(t=_C(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function _C(e){var t=function(e,t){if("object"!=PC(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=PC(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==PC(t)?t:t+""}var RC=function(){return e=function e(){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),TC(this,"activeIndex",0),TC(this,"coordinateList",[]),TC(this,"layout","horizontal")},t=[{key:"setDetails",value:function(e){var t,n=e.coordinateList,r=void 0===n?null:n,o=e.container,i=void 0===o?null:o,a=e.layout,l=void 0===a?null:a,s=e.offset,u=void 0===s?null:s,c=e.mouseHandlerCallback,d=void 0===c?null:c;this.coordinateList=null!==(t=null!==r&&void 0!==r?r:this.coordinateList)&&void 0!==t?t:[],this.container=null!==i&&void 0!==i?i:this.container,this.layout=null!==l&&void 0!==l?l:this.layout,this.offset=null!==u&&void 0!==u?u:this.offset,this.mouseHandlerCallback=null!==d&&void 0!==d?d:this.mouseHandlerCallback,this.activeIndex=Math.min(Math.max(this.activeIndex,0),this.coordinateList.length-1)}},{key:"focus",value:function(){this.spoofMouse()}},{key:"keyboardEvent",value:function(e){if(0!==this.coordinateList.length)switch(e.key){case"ArrowRight":if("horizontal"!==this.layout)return;this.activeIndex=Math.min(this.activeIndex+1,this.coordinateList.length-1),this.spoofMouse();break;case"ArrowLeft":if("horizontal"!==this.layout)return;this.activeIndex=Math.max(this.activeIndex-1,0),this.spoofMouse()}}},{key:"setIndex",value:function(e){this.activeIndex=e}},{key:"spoofMouse",value:function(){var e,t;if("horizontal"===this.layout&&0!==this.coordinateList.length){var n=this.container.getBoundingClientRect(),r=n.x,o=n.y,i=n.height,a=this.coordinateList[this.activeIndex].coordinate,l=(null===(e=window)||void 0===e?void 0:e.scrollX)||0,s=(null===(t=window)||void 0===t?void 0:t.scrollY)||0,u=r+a+l,c=o+this.offset.top+i/2+s;this.mouseHandlerCallback({pageX:u,pageY:c})}}}],t&&MC(e.prototype,t),n&&MC(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e;var e,t,n}();function NC(){}function IC(e,t,n){e._context.bezierCurveTo((2*e._x0+e._x1)/3,(2*e._y0+e._y1)/3,(e._x0+2*e._x1)/3,(e._y0+2*e._y1)/3,(e._x0+4*e._x1+t)/6,(e._y0+4*e._y1+n)/6)}function DC(e){this._context=e}function LC(e){this._context=e}function zC(e){this._context=e}DC.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){switch(this._point){case 3:IC(this,this._x1,this._y1);case 2:this._context.lineTo(this._x1,this._y1)}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,this._context.lineTo((5*this._x0+this._x1)/6,(5*this._y0+this._y1)/6);default:IC(this,e,t)}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}},LC.prototype={areaStart:NC,areaEnd:NC,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._y0=this._y1=this._y2=this._y3=this._y4=NaN,this._point=0},lineEnd:function(){switch(this._point){case 1:this._context.moveTo(this._x2,this._y2),this._context.closePath();break;case 2:this._context.moveTo((this._x2+2*this._x3)/3,(this._y2+2*this._y3)/3),this._context.lineTo((this._x3+2*this._x2)/3,(this._y3+2*this._y2)/3),this._context.closePath();break;case 3:this.point(this._x2,this._y2),this.point(this._x3,this._y3),this.point(this._x4,this._y4)}},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._x2=e,this._y2=t;break;case 1:this._point=2,this._x3=e,this._y3=t;break;case 2:this._point=3,this._x4=e,this._y4=t,this._context.moveTo((this._x0+4*this._x1+e)/6,(this._y0+4*this._y1+t)/6);break;default:IC(this,e,t)}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}},zC.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){(this._line||0!==this._line&&3===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3;var n=(this._x0+4*this._x1+e)/6,r=(this._y0+4*this._y1+t)/6;this._line?this._context.lineTo(n,r):this._context.moveTo(n,r);break;case 3:this._point=4;default:IC(this,e,t)}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};class $C{constructor(e,t){this._context=e,this._x=t}areaStart(){this._line=0}areaEnd(){this._line=NaN}lineStart(){this._point=0}lineEnd(){(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line}point(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:this._x?this._context.bezierCurveTo(this._x0=(this._x0+e)/2,this._y0,this._x0,t,e,t):this._context.bezierCurveTo(this._x0,this._y0=(this._y0+t)/2,e,this._y0,e,t)}this._x0=e,this._y0=t}}function BC(e){this._context=e}function FC(e){this._context=e}function WC(e){return new FC(e)}function UC(e){return e<0?-1:1}function HC(e,t,n){var r=e._x1-e._x0,o=t-e._x1,i=(e._y1-e._y0)/(r||o<0&&-0),a=(n-e._y1)/(o||r<0&&-0),l=(i*o+a*r)/(r+o);return(UC(i)+UC(a))*Math.min(Math.abs(i),Math.abs(a),.5*Math.abs(l))||0}function VC(e,t){var n=e._x1-e._x0;return n?(3*(e._y1-e._y0)/n-t)/2:t}function qC(e,t,n){var r=e._x0,o=e._y0,i=e._x1,a=e._y1,l=(i-r)/3;e._context.bezierCurveTo(r+l,o+l*t,i-l,a-l*n,i,a)}function XC(e){this._context=e}function KC(e){this._context=new GC(e)}function GC(e){this._context=e}function YC(e){this._context=e}function QC(e){var t,n,r=e.length-1,o=new Array(r),i=new Array(r),a=new Array(r);for(o[0]=0,i[0]=2,a[0]=e[0]+2*e[1],t=1;t<r-1;++t)o[t]=1,i[t]=4,a[t]=4*e[t]+2*e[t+1];for(o[r-1]=2,i[r-1]=7,a[r-1]=8*e[r-1]+e[r],t=1;t<r;++t)n=o[t]/i[t-1],i[t]-=n,a[t]-=n*a[t-1];for(o[r-1]=a[r-1]/i[r-1],t=r-2;t>=0;--t)o[t]=(a[t]-o[t+1])/i[t];for(i[r-1]=(e[r]+o[r-1])/2,t=0;t<r-1;++t)i[t]=2*e[t+1]-o[t+1];return[o,i]}function JC(e,t){this._context=e,this._t=t}function ZC(e){return e[0]}function eP(e){return e[1]}function tP(e,t){var n=Bh(!0),r=null,o=WC,i=null,a=Xh(l);function l(l){var s,u,c,d=(l=cA(l)).length,f=!1;for(null==r&&(i=o(c=a())),s=0;s<=d;++s)!(s<d&&n(u=l[s],s,l))===f&&((f=!f)?i.lineStart():i.lineEnd()),f&&i.point(+e(u,s,l),+t(u,s,l));if(c)return i=null,c+""||null}return e="function"===typeof e?e:void 0===e?ZC:Bh(e),t="function"===typeof t?t:void 0===t?eP:Bh(t),l.x=function(t){return arguments.length?(e="function"===typeof t?t:Bh(+t),l):e},l.y=function(e){return arguments.length?(t="function"===typeof e?e:Bh(+e),l):t},l.defined=function(e){return arguments.length?(n="function"===typeof e?e:Bh(!!e),l):n},l.curve=function(e){return arguments.length?(o=e,null!=r&&(i=o(r)),l):o},l.context=function(e){return arguments.length?(null==e?r=i=null:i=o(r=e),l):r},l}function nP(e,t,n){var r=null,o=Bh(!0),i=null,a=WC,l=null,s=Xh(u);function u(u){var c,d,f,p,h,m=(u=cA(u)).length,y=!1,v=new Array(m),g=new Array(m);for(null==i&&(l=a(h=s())),c=0;c<=m;++c){if(!(c<m&&o(p=u[c],c,u))===y)if(y=!y)d=c,l.areaStart(),l.lineStart();else{for(l.lineEnd(),l.lineStart(),f=c-1;f>=d;--f)l.point(v[f],g[f]);l.lineEnd(),l.areaEnd()}y&&(v[c]=+e(p,c,u),g[c]=+t(p,c,u),l.point(r?+r(p,c,u):v[c],n?+n(p,c,u):g[c]))}if(h)return l=null,h+""||null}function c(){return tP().defined(o).curve(a).context(i)}return e="function"===typeof e?e:void 0===e?ZC:Bh(+e),t="function"===typeof t?t:Bh(void 0===t?0:+t),n="function"===typeof n?n:void 0===n?eP:Bh(+n),u.x=function(t){return arguments.length?(e="function"===typeof t?t:Bh(+t),r=null,u):e},u.x0=function(t){return arguments.length?(e="function"===typeof t?t:Bh(+t),u):e},u.x1=function(e){return arguments.length?(r=null==e?null:"function"===typeof e?e:Bh(+e),u):r},u.y=function(e){return arguments.length?(t="function"===typeof e?e:Bh(+e),n=null,u):t},u.y0=function(e){return arguments.length?(t="function"===typeof e?e:Bh(+e),u):t},u.y1=function(e){return arguments.length?(n=null==e?null:"function"===typeof e?e:Bh(+e),u):n},u.lineX0=u.lineY0=function(){return c().x(e).y(t)},u.lineY1=function(){return c().x(e).y(n)},u.lineX1=function(){return c().x(r).y(t)},u.defined=function(e){return arguments.length?(o="function"===typeof e?e:Bh(!!e),u):o},u.curve=function(e){return arguments.length?(a=e,null!=i&&(l=a(i)),u):a},u.context=function(e){return arguments.length?(null==e?i=l=null:l=a(i=e),u):i},u}function rP(e){return rP="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},rP(e)}function oP(){return oP=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},oP.apply(this,arguments)}function iP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function aP(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?iP(Object(n),!0).forEach((function(t){lP(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):iP(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function lP(e,t,n){return t=function(e){var t=function(e,t){if("object"!=rP(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=rP(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==rP(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}BC.prototype={areaStart:NC,areaEnd:NC,lineStart:function(){this._point=0},lineEnd:function(){this._point&&this._context.closePath()},point:function(e,t){e=+e,t=+t,this._point?this._context.lineTo(e,t):(this._point=1,this._context.moveTo(e,t))}},FC.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:this._context.lineTo(e,t)}}},XC.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=this._t0=NaN,this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x1,this._y1);break;case 3:qC(this,this._t0,VC(this,this._t0))}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){var n=NaN;if(t=+t,(e=+e)!==this._x1||t!==this._y1){switch(this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,qC(this,VC(this,n=HC(this,e,t)),n);break;default:qC(this,this._t0,n=HC(this,e,t))}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t,this._t0=n}}},(KC.prototype=Object.create(XC.prototype)).point=function(e,t){XC.prototype.point.call(this,t,e)},GC.prototype={moveTo:function(e,t){this._context.moveTo(t,e)},closePath:function(){this._context.closePath()},lineTo:function(e,t){this._context.lineTo(t,e)},bezierCurveTo:function(e,t,n,r,o,i){this._context.bezierCurveTo(t,e,r,n,i,o)}},YC.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=[],this._y=[]},lineEnd:function(){var e=this._x,t=this._y,n=e.length;if(n)if(this._line?this._context.lineTo(e[0],t[0]):this._context.moveTo(e[0],t[0]),2===n)this._context.lineTo(e[1],t[1]);else for(var r=QC(e),o=QC(t),i=0,a=1;a<n;++i,++a)this._context.bezierCurveTo(r[0][i],o[0][i],r[1][i],o[1][i],e[a],t[a]);(this._line||0!==this._line&&1===n)&&this._context.closePath(),this._line=1-this._line,this._x=this._y=null},point:function(e,t){this._x.push(+e),this._y.push(+t)}},JC.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=this._y=NaN,this._point=0},lineEnd:function(){0<this._t&&this._t<1&&2===this._point&&this._context.lineTo(this._x,this._y),(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line>=0&&(this._t=1-this._t,this._line=1-this._line)},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:if(this._t<=0)this._context.lineTo(this._x,t),this._context.lineTo(e,t);else{var n=this._x*(1-this._t)+e*this._t;this._context.lineTo(n,this._y),this._context.lineTo(n,t)}}this._x=e,this._y=t}};var sP={curveBasisClosed:function(e){return new LC(e)},curveBasisOpen:function(e){return new zC(e)},curveBasis:function(e){return new DC(e)},curveBumpX:function(e){return new $C(e,!0)},curveBumpY:function(e){return new $C(e,!1)},curveLinearClosed:function(e){return new BC(e)},curveLinear:WC,curveMonotoneX:function(e){return new XC(e)},curveMonotoneY:function(e){return new KC(e)},curveNatural:function(e){return new YC(e)},curveStep:function(e){return new JC(e,.5)},curveStepAfter:function(e){return new JC(e,1)},curveStepBefore:function(e){return new JC(e,0)}},uP=function(e){return e.x===+e.x&&e.y===+e.y},cP=function(e){return e.x},dP=function(e){return e.y},fP=function(e){var t,n=e.type,r=void 0===n?"linear":n,o=e.points,i=void 0===o?[]:o,a=e.baseLine,l=e.layout,s=e.connectNulls,u=void 0!==s&&s,c=function(e,t){if(_f()(e))return e;var n="curve".concat(vh()(e));return"curveMonotone"!==n&&"curveBump"!==n||!t?sP[n]||WC:sP["".concat(n).concat("vertical"===t?"Y":"X")]}(r,l),d=u?i.filter((function(e){return uP(e)})):i;if(Array.isArray(a)){var f=u?a.filter((function(e){return uP(e)})):a,p=d.map((function(e,t){return aP(aP({},e),{},{base:f[t]})}));return(t="vertical"===l?nP().y(dP).x1(cP).x0((function(e){return e.base.x})):nP().x(cP).y1(dP).y0((function(e){return e.base.y}))).defined(uP).curve(c),t(p)}return(t="vertical"===l&&bf(a)?nP().y(dP).x1(cP).x0(a):bf(a)?nP().x(cP).y1(dP).y0(a):tP().x(cP).y(dP)).defined(uP).curve(c),t(d)},pP=function(e){var n=e.className,r=e.points,o=e.path,i=e.pathRef;if((!r||!r.length)&&!o)return null;var a=r&&r.length?fP(e):o;return t.createElement("path",oP({},rp(e,!1),Wf(e),{className:zt("recharts-curve",n),d:a,ref:i}))};function hP(e){return hP="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},hP(e)}var mP=["x","y","top","left","width","height","className"];function yP(){return yP=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},yP.apply(this,arguments)}function vP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function gP(e,t,n){return t=function(e){var t=function(e,t){if("object"!=hP(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=hP(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==hP(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function bP(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var xP=function(e,t,n,r,o,i){return"M".concat(e,",").concat(o,"v").concat(r,"M").concat(i,",").concat(t,"h").concat(n)},wP=function(e){var n=e.x,r=void 0===n?0:n,o=e.y,i=void 0===o?0:o,a=e.top,l=void 0===a?0:a,s=e.left,u=void 0===s?0:s,c=e.width,d=void 0===c?0:c,f=e.height,p=void 0===f?0:f,h=e.className,m=function(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?vP(Object(n),!0).forEach((function(t){gP(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):vP(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}({x:r,y:i,top:l,left:u,width:d,height:p},bP(e,mP));return bf(r)&&bf(i)&&bf(d)&&bf(p)&&bf(l)&&bf(u)?t.createElement("path",yP({},rp(m,!0),{className:zt("recharts-cross",h),d:xP(r,i,d,p,l,u)})):null};function SP(e){var t=e.cx,n=e.cy,r=e.radius,o=e.startAngle,i=e.endAngle;return{points:[gk(t,n,r,o),gk(t,n,r,i)],cx:t,cy:n,radius:r,startAngle:o,endAngle:i}}function AP(e,t,n){var r,o,i,a;if("horizontal"===e)i=r=t.x,o=n.top,a=n.top+n.height;else if("vertical"===e)a=o=t.y,r=n.left,i=n.left+n.width;else if(null!=t.cx&&null!=t.cy){if("centric"!==e)return SP(t);var l=t.cx,s=t.cy,u=t.innerRadius,c=t.outerRadius,d=t.angle,f=gk(l,s,u,d),p=gk(l,s,c,d);r=f.x,o=f.y,i=p.x,a=p.y}return[{x:r,y:o},{x:i,y:a}]}function OP(e){return OP="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},OP(e)}function kP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function jP(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?kP(Object(n),!0).forEach((function(t){EP(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):kP(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function EP(e,t,n){return t=function(e){var t=function(e,t){if("object"!=OP(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=OP(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==OP(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function CP(e){var n,r,o,i=e.element,a=e.tooltipEventType,l=e.isActive,s=e.activeCoordinate,u=e.activePayload,c=e.offset,d=e.activeTooltipIndex,f=e.tooltipAxisBandSize,p=e.layout,h=e.chartName,m=null!==(n=i.props.cursor)&&void 0!==n?n:null===(r=i.type.defaultProps)||void 0===r?void 0:r.cursor;if(!i||!m||!l||!s||"ScatterChart"!==h&&"axis"!==a)return null;var y=pP;if("ScatterChart"===h)o=s,y=wP;else if("BarChart"===h)o=function(e,t,n,r){var o=r/2;return{stroke:"none",fill:"#ccc",x:"horizontal"===e?t.x-o:n.left+.5,y:"horizontal"===e?n.top+.5:t.y-o,width:"horizontal"===e?r:n.width-1,height:"horizontal"===e?n.height-1:r}}(p,s,c,f),y=vv;else if("radial"===p){var v=SP(s),g=v.cx,b=v.cy,x=v.radius;o={cx:g,cy:b,startAngle:v.startAngle,endAngle:v.endAngle,innerRadius:x,outerRadius:x},y=Oj}else o={points:AP(p,s,c)},y=pP;var w=jP(jP(jP(jP({stroke:"#ccc",pointerEvents:"none"},c),o),rp(m,!1)),{},{payload:u,payloadIndex:d,className:zt("recharts-tooltip-cursor",m.className)});return(0,t.isValidElement)(m)?(0,t.cloneElement)(m,w):(0,t.createElement)(y,w)}var PP=["item"],MP=["children","className","width","height","style","compact","title","desc"];function TP(e){return TP="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},TP(e)}function _P(){return _P=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},_P.apply(this,arguments)}function RP(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],s=!0,u=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw o}}return l}}(e,t)||FP(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function NP(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function IP(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,qP(r.key),r)}}function DP(e,t,n){return t=zP(t),function(e,t){if(t&&("object"===TP(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,LP()?Reflect.construct(t,n||[],zP(e).constructor):t.apply(e,n))}function LP(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(LP=function(){return!!e})()}function zP(e){return zP=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},zP(e)}function $P(e,t){return $P=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},$P(e,t)}function BP(e){return function(e){if(Array.isArray(e))return WP(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||FP(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function FP(e,t){if(e){if("string"===typeof e)return WP(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?WP(e,t):void 0}}function WP(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function UP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function HP(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?UP(Object(n),!0).forEach((function(t){VP(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):UP(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function VP(e,t,n){return(t=qP(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function qP(e){var t=function(e,t){if("object"!=TP(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=TP(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==TP(t)?t:t+""}var XP={xAxis:["bottom","top"],yAxis:["left","right"]},KP={width:"100%",height:"100%"},GP={x:0,y:0};function YP(e){return e}var QP=function(e,t){var n=t.graphicalItems,r=t.dataStartIndex,o=t.dataEndIndex,i=(null!==n&&void 0!==n?n:[]).reduce((function(e,t){var n=t.props.data;return n&&n.length?[].concat(BP(e),BP(n)):e}),[]);return i.length>0?i:e&&e.length&&bf(r)&&bf(o)?e.slice(r,o+1):[]};function JP(e){return"number"===e?[0,"auto"]:void 0}var ZP=function(e,t,n,r){var o=e.graphicalItems,i=e.tooltipAxis,a=QP(t,e);return n<0||!o||!o.length||n>=a.length?null:o.reduce((function(o,l){var s,u,c=null!==(s=l.props.data)&&void 0!==s?s:t;(c&&e.dataStartIndex+e.dataEndIndex!==0&&e.dataEndIndex-e.dataStartIndex>=n&&(c=c.slice(e.dataStartIndex,e.dataEndIndex+1)),i.dataKey&&!i.allowDuplicatedCategory)?u=jf(void 0===c?a:c,i.dataKey,r):u=c&&c[n]||a[n];return u?[].concat(BP(o),[VO(l,u)]):o}),[])},eM=function(e,t,n,r){var o=r||{x:e.chartX,y:e.chartY},i=function(e,t){return"horizontal"===t?e.x:"vertical"===t?e.y:"centric"===t?e.angle:e.radius}(o,n),a=e.orderedTooltipTicks,l=e.tooltipAxis,s=e.tooltipTicks,u=function(e){var t,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],r=arguments.length>2?arguments[2]:void 0,o=arguments.length>3?arguments[3]:void 0,i=-1,a=null!==(t=null===n||void 0===n?void 0:n.length)&&void 0!==t?t:0;if(a<=1)return 0;if(o&&"angleAxis"===o.axisType&&Math.abs(Math.abs(o.range[1]-o.range[0])-360)<=1e-6)for(var l=o.range,s=0;s<a;s++){var u=s>0?r[s-1].coordinate:r[a-1].coordinate,c=r[s].coordinate,d=s>=a-1?r[0].coordinate:r[s+1].coordinate,f=void 0;if(vf(c-u)!==vf(d-c)){var p=[];if(vf(d-c)===vf(l[1]-l[0])){f=d;var h=c+l[1]-l[0];p[0]=Math.min(h,(h+u)/2),p[1]=Math.max(h,(h+u)/2)}else{f=u;var m=d+l[1]-l[0];p[0]=Math.min(c,(m+c)/2),p[1]=Math.max(c,(m+c)/2)}var y=[Math.min(c,(f+c)/2),Math.max(c,(f+c)/2)];if(e>y[0]&&e<=y[1]||e>=p[0]&&e<=p[1]){i=r[s].index;break}}else{var v=Math.min(u,d),g=Math.max(u,d);if(e>(v+c)/2&&e<=(g+c)/2){i=r[s].index;break}}}else for(var b=0;b<a;b++)if(0===b&&e<=(n[b].coordinate+n[b+1].coordinate)/2||b>0&&b<a-1&&e>(n[b].coordinate+n[b-1].coordinate)/2&&e<=(n[b].coordinate+n[b+1].coordinate)/2||b===a-1&&e>(n[b].coordinate+n[b-1].coordinate)/2){i=n[b].index;break}return i}(i,a,s,l);if(u>=0&&s){var c=s[u]&&s[u].value,d=ZP(e,t,u,c),f=function(e,t,n,r){var o=t.find((function(e){return e&&e.index===n}));if(o){if("horizontal"===e)return{x:o.coordinate,y:r.y};if("vertical"===e)return{x:r.x,y:o.coordinate};if("centric"===e){var i=o.coordinate,a=r.radius;return HP(HP(HP({},r),gk(r.cx,r.cy,a,i)),{},{angle:i,radius:a})}var l=o.coordinate,s=r.angle;return HP(HP(HP({},r),gk(r.cx,r.cy,l,s)),{},{angle:s,radius:l})}return GP}(n,a,u,o);return{activeTooltipIndex:u,activeLabel:c,activePayload:d,activeCoordinate:f}}return null},tM=function(e,t){var n=t.axes,r=t.graphicalItems,o=t.axisType,i=t.axisIdKey,a=t.stackGroups,l=t.dataStartIndex,s=t.dataEndIndex,u=e.layout,c=e.children,d=e.stackOffset,f=EO(u,o);return n.reduce((function(t,n){var p,h=void 0!==n.type.defaultProps?HP(HP({},n.type.defaultProps),n.props):n.props,m=h.type,y=h.dataKey,v=h.allowDataOverflow,g=h.allowDuplicatedCategory,b=h.scale,x=h.ticks,w=h.includeHidden,S=h[i];if(t[S])return t;var A,O,k,j=QP(e.data,{graphicalItems:r.filter((function(e){var t;return(i in e.props?e.props[i]:null===(t=e.type.defaultProps)||void 0===t?void 0:t[i])===S})),dataStartIndex:l,dataEndIndex:s}),E=j.length;(function(e,t,n){if("number"===n&&!0===t&&Array.isArray(e)){var r=null===e||void 0===e?void 0:e[0],o=null===e||void 0===e?void 0:e[1];if(r&&o&&bf(r)&&bf(o))return!0}return!1})(h.domain,v,m)&&(A=WO(h.domain,null,v),!f||"number"!==m&&"auto"===b||(k=AO(j,y,"category")));var C=JP(m);if(!A||0===A.length){var P,M=null!==(P=h.domain)&&void 0!==P?P:C;if(y){if(A=AO(j,y,m),"category"===m&&f){var T=function(e){if(!Array.isArray(e))return!1;for(var t=e.length,n={},r=0;r<t;r++){if(n[e[r]])return!0;n[e[r]]=!0}return!1}(A);g&&T?(O=A,A=mp()(0,E)):g||(A=HO(M,A,n).reduce((function(e,t){return e.indexOf(t)>=0?e:[].concat(BP(e),[t])}),[]))}else if("category"===m)A=g?A.filter((function(e){return""!==e&&!Mf()(e)})):HO(M,A,n).reduce((function(e,t){return e.indexOf(t)>=0||""===t||Mf()(t)?e:[].concat(BP(e),[t])}),[]);else if("number"===m){var _=function(e,t,n,r,o){var i=t.map((function(t){return kO(e,t,n,o,r)})).filter((function(e){return!Mf()(e)}));return i&&i.length?i.reduce((function(e,t){return[Math.min(e[0],t[0]),Math.max(e[1],t[1])]}),[1/0,-1/0]):null}(j,r.filter((function(e){var t,n,r=i in e.props?e.props[i]:null===(t=e.type.defaultProps)||void 0===t?void 0:t[i],o="hide"in e.props?e.props.hide:null===(n=e.type.defaultProps)||void 0===n?void 0:n.hide;return r===S&&(w||!o)})),y,o,u);_&&(A=_)}!f||"number"!==m&&"auto"===b||(k=AO(j,y,"category"))}else A=f?mp()(0,E):a&&a[S]&&a[S].hasStack&&"number"===m?"expand"===d?[0,1]:$O(a[S].stackGroups,l,s):jO(j,r.filter((function(e){var t=i in e.props?e.props[i]:e.type.defaultProps[i],n="hide"in e.props?e.props.hide:e.type.defaultProps.hide;return t===S&&(w||!n)})),m,u,!0);if("number"===m)A=kC(c,A,S,o,x),M&&(A=WO(M,A,v));else if("category"===m&&M){var R=M;A.every((function(e){return R.indexOf(e)>=0}))&&(A=R)}}return HP(HP({},t),{},VP({},S,HP(HP({},h),{},{axisType:o,domain:A,categoricalDomain:k,duplicateDomain:O,originalDomain:null!==(p=h.domain)&&void 0!==p?p:C,isCategorical:f,layout:u})))}),{})},nM=function(e,t){var n=t.axisType,r=void 0===n?"xAxis":n,o=t.AxisComp,i=t.graphicalItems,a=t.stackGroups,l=t.dataStartIndex,s=t.dataEndIndex,u=e.children,c="".concat(r,"Id"),d=Jf(u,o),f={};return d&&d.length?f=tM(e,{axes:d,graphicalItems:i,axisType:r,axisIdKey:c,stackGroups:a,dataStartIndex:l,dataEndIndex:s}):i&&i.length&&(f=function(e,t){var n=t.graphicalItems,r=t.Axis,o=t.axisType,i=t.axisIdKey,a=t.stackGroups,l=t.dataStartIndex,s=t.dataEndIndex,u=e.layout,c=e.children,d=QP(e.data,{graphicalItems:n,dataStartIndex:l,dataEndIndex:s}),f=d.length,p=EO(u,o),h=-1;return n.reduce((function(e,t){var m,y=(void 0!==t.type.defaultProps?HP(HP({},t.type.defaultProps),t.props):t.props)[i],v=JP("number");return e[y]?e:(h++,p?m=mp()(0,f):a&&a[y]&&a[y].hasStack?(m=$O(a[y].stackGroups,l,s),m=kC(c,m,y,o)):(m=WO(v,jO(d,n.filter((function(e){var t,n,r=i in e.props?e.props[i]:null===(t=e.type.defaultProps)||void 0===t?void 0:t[i],o="hide"in e.props?e.props.hide:null===(n=e.type.defaultProps)||void 0===n?void 0:n.hide;return r===y&&!o})),"number",u),r.defaultProps.allowDataOverflow),m=kC(c,m,y,o)),HP(HP({},e),{},VP({},y,HP(HP({axisType:o},r.defaultProps),{},{hide:!0,orientation:hf()(XP,"".concat(o,".").concat(h%2),null),domain:m,originalDomain:v,isCategorical:p,layout:u}))))}),{})}(e,{Axis:o,graphicalItems:i,axisType:r,axisIdKey:c,stackGroups:a,dataStartIndex:l,dataEndIndex:s})),f},rM=function(e){var t=e.children,n=e.defaultShowTooltip,r=Zf(t,uk),o=0,i=0;return e.data&&0!==e.data.length&&(i=e.data.length-1),r&&r.props&&(r.props.startIndex>=0&&(o=r.props.startIndex),r.props.endIndex>=0&&(i=r.props.endIndex)),{chartX:0,chartY:0,dataStartIndex:o,dataEndIndex:i,activeTooltipIndex:-1,isTooltipActive:Boolean(n)}},oM=function(e){return"horizontal"===e?{numericAxisName:"yAxis",cateAxisName:"xAxis"}:"vertical"===e?{numericAxisName:"xAxis",cateAxisName:"yAxis"}:"centric"===e?{numericAxisName:"radiusAxis",cateAxisName:"angleAxis"}:{numericAxisName:"angleAxis",cateAxisName:"radiusAxis"}},iM=function(e,t){var n=e.props,r=(e.graphicalItems,e.xAxisMap),o=void 0===r?{}:r,i=e.yAxisMap,a=void 0===i?{}:i,l=n.width,s=n.height,u=n.children,c=n.margin||{},d=Zf(u,uk),f=Zf(u,Pm),p=Object.keys(a).reduce((function(e,t){var n=a[t],r=n.orientation;return n.mirror||n.hide?e:HP(HP({},e),{},VP({},r,e[r]+n.width))}),{left:c.left||0,right:c.right||0}),h=Object.keys(o).reduce((function(e,t){var n=o[t],r=n.orientation;return n.mirror||n.hide?e:HP(HP({},e),{},VP({},r,hf()(e,"".concat(r))+n.height))}),{top:c.top||0,bottom:c.bottom||0}),m=HP(HP({},h),p),y=m.bottom;d&&(m.bottom+=d.props.height||uk.defaultProps.height),f&&t&&(m=function(e,t,n,r){var o=n.children,i=n.width,a=n.margin,l=i-(a.left||0)-(a.right||0),s=mO({children:o,legendWidth:l});if(s){var u=r||{},c=u.width,d=u.height,f=s.align,p=s.verticalAlign,h=s.layout;if(("vertical"===h||"horizontal"===h&&"middle"===p)&&"center"!==f&&bf(e[f]))return xO(xO({},e),{},wO({},f,e[f]+(c||0)));if(("horizontal"===h||"vertical"===h&&"center"===f)&&"middle"!==p&&bf(e[p]))return xO(xO({},e),{},wO({},p,e[p]+(d||0)))}return e}(m,0,n,t));var v=l-m.left-m.right,g=s-m.top-m.bottom;return HP(HP({brushBottom:y},m),{},{width:Math.max(v,0),height:Math.max(g,0)})},aM=function(e,t){return"xAxis"===t?e[t].width:"yAxis"===t?e[t].height:void 0},lM=function(e){var n=e.chartName,r=e.GraphicalChild,o=e.defaultTooltipEventType,i=void 0===o?"axis":o,a=e.validateTooltipEventTypes,l=void 0===a?["axis"]:a,s=e.axisComponents,u=e.legendContent,c=e.formatAxisMap,d=e.defaultProps,f=function(e,t){var n=t.graphicalItems,r=t.stackGroups,o=t.offset,i=t.updateId,a=t.dataStartIndex,l=t.dataEndIndex,u=e.barSize,c=e.layout,d=e.barGap,f=e.barCategoryGap,p=e.maxBarSize,h=oM(c),m=h.numericAxisName,y=h.cateAxisName,v=function(e){return!(!e||!e.length)&&e.some((function(e){var t=Kf(e&&e.type);return t&&t.indexOf("Bar")>=0}))}(n),g=[];return n.forEach((function(n,h){var b=QP(e.data,{graphicalItems:[n],dataStartIndex:a,dataEndIndex:l}),x=void 0!==n.type.defaultProps?HP(HP({},n.type.defaultProps),n.props):n.props,w=x.dataKey,S=x.maxBarSize,A=x["".concat(m,"Id")],O=x["".concat(y,"Id")],k=s.reduce((function(e,n){var r=t["".concat(n.axisType,"Map")],o=x["".concat(n.axisType,"Id")];r&&r[o]||"zAxis"===n.axisType||bp(!1);var i=r[o];return HP(HP({},e),{},VP(VP({},n.axisType,i),"".concat(n.axisType,"Ticks"),PO(i)))}),{}),j=k[y],E=k["".concat(y,"Ticks")],C=r&&r[A]&&r[A].hasStack&&function(e,t){var n,r=(null!==(n=e.type)&&void 0!==n&&n.defaultProps?xO(xO({},e.type.defaultProps),e.props):e.props).stackId;if(xf(r)){var o=t[r];if(o){var i=o.items.indexOf(e);return i>=0?o.stackedData[i]:null}}return null}(n,r[A].stackGroups),P=Kf(n.type).indexOf("Bar")>=0,M=UO(j,E),T=[],_=v&&function(e){var t=e.barSize,n=e.totalSize,r=e.stackGroups,o=void 0===r?{}:r;if(!o)return{};for(var i={},a=Object.keys(o),l=0,s=a.length;l<s;l++)for(var u=o[a[l]].stackGroups,c=Object.keys(u),d=0,f=c.length;d<f;d++){var p=u[c[d]],h=p.items,m=p.cateAxisId,y=h.filter((function(e){return Kf(e.type).indexOf("Bar")>=0}));if(y&&y.length){var v=y[0].type.defaultProps,g=void 0!==v?xO(xO({},v),y[0].props):y[0].props,b=g.barSize,x=g[m];i[x]||(i[x]=[]);var w=Mf()(b)?t:b;i[x].push({item:y[0],stackList:y.slice(1),barSize:Mf()(w)?void 0:Af(w,n,0)})}}return i}({barSize:u,stackGroups:r,totalSize:aM(k,y)});if(P){var R,N,I=Mf()(S)?p:S,D=null!==(R=null!==(N=UO(j,E,!0))&&void 0!==N?N:I)&&void 0!==R?R:0;T=function(e){var t=e.barGap,n=e.barCategoryGap,r=e.bandSize,o=e.sizeList,i=void 0===o?[]:o,a=e.maxBarSize,l=i.length;if(l<1)return null;var s,u=Af(t,r,0,!0),c=[];if(i[0].barSize===+i[0].barSize){var d=!1,f=r/l,p=i.reduce((function(e,t){return e+t.barSize||0}),0);(p+=(l-1)*u)>=r&&(p-=(l-1)*u,u=0),p>=r&&f>0&&(d=!0,p=l*(f*=.9));var h={offset:((r-p)/2|0)-u,size:0};s=i.reduce((function(e,t){var n={item:t.item,position:{offset:h.offset+h.size+u,size:d?f:t.barSize}},r=[].concat(vO(e),[n]);return h=r[r.length-1].position,t.stackList&&t.stackList.length&&t.stackList.forEach((function(e){r.push({item:e,position:h})})),r}),c)}else{var m=Af(n,r,0,!0);r-2*m-(l-1)*u<=0&&(u=0);var y=(r-2*m-(l-1)*u)/l;y>1&&(y>>=0);var v=a===+a?Math.min(y,a):y;s=i.reduce((function(e,t,n){var r=[].concat(vO(e),[{item:t.item,position:{offset:m+(y+u)*n+(y-v)/2,size:v}}]);return t.stackList&&t.stackList.length&&t.stackList.forEach((function(e){r.push({item:e,position:r[r.length-1].position})})),r}),c)}return s}({barGap:d,barCategoryGap:f,bandSize:D!==M?D:M,sizeList:_[O],maxBarSize:I}),D!==M&&(T=T.map((function(e){return HP(HP({},e),{},{position:HP(HP({},e.position),{},{offset:e.position.offset-D/2})})})))}var L,z,$=n&&n.type&&n.type.getComposedData;$&&g.push({props:HP(HP({},$(HP(HP({},k),{},{displayedData:b,props:e,dataKey:w,item:n,bandSize:M,barPosition:T,offset:o,stackedData:C,layout:c,dataStartIndex:a,dataEndIndex:l}))),{},VP(VP(VP({key:n.key||"item-".concat(h)},m,k[m]),y,k[y]),"animationId",i)),childIndex:(L=n,z=e.children,Qf(z).indexOf(L)),item:n})})),g},p=function(e,t){var o=e.props,i=e.dataStartIndex,a=e.dataEndIndex,l=e.updateId;if(!ep({props:o}))return null;var u=o.children,d=o.layout,p=o.stackOffset,h=o.data,m=o.reverseStackOrder,y=oM(d),v=y.numericAxisName,g=y.cateAxisName,b=Jf(u,r),x=function(e,t,n,r,o,i){if(!e)return null;var a=(i?t.reverse():t).reduce((function(e,t){var o,i=null!==(o=t.type)&&void 0!==o&&o.defaultProps?xO(xO({},t.type.defaultProps),t.props):t.props,a=i.stackId;if(i.hide)return e;var l=i[n],s=e[l]||{hasStack:!1,stackGroups:{}};if(xf(a)){var u=s.stackGroups[a]||{numericAxisId:n,cateAxisId:r,items:[]};u.items.push(t),s.hasStack=!0,s.stackGroups[a]=u}else s.stackGroups[Sf("_stackId_")]={numericAxisId:n,cateAxisId:r,items:[t]};return xO(xO({},e),{},wO({},l,s))}),{});return Object.keys(a).reduce((function(t,i){var l=a[i];return l.hasStack&&(l.stackGroups=Object.keys(l.stackGroups).reduce((function(t,i){var a=l.stackGroups[i];return xO(xO({},t),{},wO({},i,{numericAxisId:n,cateAxisId:r,items:a.items,stackedData:DO(e,a.items,o)}))}),{})),xO(xO({},t),{},wO({},i,l))}),{})}(h,b,"".concat(v,"Id"),"".concat(g,"Id"),p,m),w=s.reduce((function(e,t){var n="".concat(t.axisType,"Map");return HP(HP({},e),{},VP({},n,nM(o,HP(HP({},t),{},{graphicalItems:b,stackGroups:t.axisType===v&&x,dataStartIndex:i,dataEndIndex:a}))))}),{}),S=iM(HP(HP({},w),{},{props:o,graphicalItems:b}),null===t||void 0===t?void 0:t.legendBBox);Object.keys(w).forEach((function(e){w[e]=c(o,w[e],S,e.replace("Map",""),n)}));var A=function(e){var t=Of(e),n=PO(t,!1,!0);return{tooltipTicks:n,orderedTooltipTicks:vp()(n,(function(e){return e.coordinate})),tooltipAxis:t,tooltipAxisBandSize:UO(t,n)}}(w["".concat(g,"Map")]),O=f(o,HP(HP({},w),{},{dataStartIndex:i,dataEndIndex:a,updateId:l,graphicalItems:b,stackGroups:x,offset:S}));return HP(HP({formattedGraphicalItems:O,graphicalItems:b,offset:S,stackGroups:x},A),w)},h=function(e){function r(e){var o,i,a;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,r),VP(a=DP(this,r,[e]),"eventEmitterSymbol",Symbol("rechartsEventEmitter")),VP(a,"accessibilityManager",new RC),VP(a,"handleLegendBBoxUpdate",(function(e){if(e){var t=a.state,n=t.dataStartIndex,r=t.dataEndIndex,o=t.updateId;a.setState(HP({legendBBox:e},p({props:a.props,dataStartIndex:n,dataEndIndex:r,updateId:o},HP(HP({},a.state),{},{legendBBox:e}))))}})),VP(a,"handleReceiveSyncEvent",(function(e,t,n){if(a.props.syncId===e){if(n===a.eventEmitterSymbol&&"function"!==typeof a.props.syncMethod)return;a.applySyncEvent(t)}})),VP(a,"handleBrushChange",(function(e){var t=e.startIndex,n=e.endIndex;if(t!==a.state.dataStartIndex||n!==a.state.dataEndIndex){var r=a.state.updateId;a.setState((function(){return HP({dataStartIndex:t,dataEndIndex:n},p({props:a.props,dataStartIndex:t,dataEndIndex:n,updateId:r},a.state))})),a.triggerSyncEvent({dataStartIndex:t,dataEndIndex:n})}})),VP(a,"handleMouseEnter",(function(e){var t=a.getMouseInfo(e);if(t){var n=HP(HP({},t),{},{isTooltipActive:!0});a.setState(n),a.triggerSyncEvent(n);var r=a.props.onMouseEnter;_f()(r)&&r(n,e)}})),VP(a,"triggeredAfterMouseMove",(function(e){var t=a.getMouseInfo(e),n=t?HP(HP({},t),{},{isTooltipActive:!0}):{isTooltipActive:!1};a.setState(n),a.triggerSyncEvent(n);var r=a.props.onMouseMove;_f()(r)&&r(n,e)})),VP(a,"handleItemMouseEnter",(function(e){a.setState((function(){return{isTooltipActive:!0,activeItem:e,activePayload:e.tooltipPayload,activeCoordinate:e.tooltipPosition||{x:e.cx,y:e.cy}}}))})),VP(a,"handleItemMouseLeave",(function(){a.setState((function(){return{isTooltipActive:!1}}))})),VP(a,"handleMouseMove",(function(e){e.persist(),a.throttleTriggeredAfterMouseMove(e)})),VP(a,"handleMouseLeave",(function(e){a.throttleTriggeredAfterMouseMove.cancel();var t={isTooltipActive:!1};a.setState(t),a.triggerSyncEvent(t);var n=a.props.onMouseLeave;_f()(n)&&n(t,e)})),VP(a,"handleOuterEvent",(function(e){var t,n=function(e){var t=e&&e.type;return t&&Xf[t]?Xf[t]:null}(e),r=hf()(a.props,"".concat(n));n&&_f()(r)&&r(null!==(t=/.*touch.*/i.test(n)?a.getMouseInfo(e.changedTouches[0]):a.getMouseInfo(e))&&void 0!==t?t:{},e)})),VP(a,"handleClick",(function(e){var t=a.getMouseInfo(e);if(t){var n=HP(HP({},t),{},{isTooltipActive:!0});a.setState(n),a.triggerSyncEvent(n);var r=a.props.onClick;_f()(r)&&r(n,e)}})),VP(a,"handleMouseDown",(function(e){var t=a.props.onMouseDown;_f()(t)&&t(a.getMouseInfo(e),e)})),VP(a,"handleMouseUp",(function(e){var t=a.props.onMouseUp;_f()(t)&&t(a.getMouseInfo(e),e)})),VP(a,"handleTouchMove",(function(e){null!=e.changedTouches&&e.changedTouches.length>0&&a.throttleTriggeredAfterMouseMove(e.changedTouches[0])})),VP(a,"handleTouchStart",(function(e){null!=e.changedTouches&&e.changedTouches.length>0&&a.handleMouseDown(e.changedTouches[0])})),VP(a,"handleTouchEnd",(function(e){null!=e.changedTouches&&e.changedTouches.length>0&&a.handleMouseUp(e.changedTouches[0])})),VP(a,"handleDoubleClick",(function(e){var t=a.props.onDoubleClick;_f()(t)&&t(a.getMouseInfo(e),e)})),VP(a,"handleContextMenu",(function(e){var t=a.props.onContextMenu;_f()(t)&&t(a.getMouseInfo(e),e)})),VP(a,"triggerSyncEvent",(function(e){void 0!==a.props.syncId&&EC.emit(CC,a.props.syncId,e,a.eventEmitterSymbol)})),VP(a,"applySyncEvent",(function(e){var t=a.props,n=t.layout,r=t.syncMethod,o=a.state.updateId,i=e.dataStartIndex,l=e.dataEndIndex;if(void 0!==e.dataStartIndex||void 0!==e.dataEndIndex)a.setState(HP({dataStartIndex:i,dataEndIndex:l},p({props:a.props,dataStartIndex:i,dataEndIndex:l,updateId:o},a.state)));else if(void 0!==e.activeTooltipIndex){var s=e.chartX,u=e.chartY,c=e.activeTooltipIndex,d=a.state,f=d.offset,h=d.tooltipTicks;if(!f)return;if("function"===typeof r)c=r(h,e);else if("value"===r){c=-1;for(var m=0;m<h.length;m++)if(h[m].value===e.activeLabel){c=m;break}}var y=HP(HP({},f),{},{x:f.left,y:f.top}),v=Math.min(s,y.x+y.width),g=Math.min(u,y.y+y.height),b=h[c]&&h[c].value,x=ZP(a.state,a.props.data,c),w=h[c]?{x:"horizontal"===n?h[c].coordinate:v,y:"horizontal"===n?g:h[c].coordinate}:GP;a.setState(HP(HP({},e),{},{activeLabel:b,activeCoordinate:w,activePayload:x,activeTooltipIndex:c}))}else a.setState(e)})),VP(a,"renderCursor",(function(e){var r,o=a.state,i=o.isTooltipActive,l=o.activeCoordinate,s=o.activePayload,u=o.offset,c=o.activeTooltipIndex,d=o.tooltipAxisBandSize,f=a.getTooltipEventType(),p=null!==(r=e.props.active)&&void 0!==r?r:i,h=a.props.layout,m=e.key||"_recharts-cursor";return t.createElement(CP,{key:m,activeCoordinate:l,activePayload:s,activeTooltipIndex:c,chartName:n,element:e,isActive:p,layout:h,offset:u,tooltipAxisBandSize:d,tooltipEventType:f})})),VP(a,"renderPolarAxis",(function(e,n,r){var o=hf()(e,"type.axisType"),i=hf()(a.state,"".concat(o,"Map")),l=e.type.defaultProps,s=void 0!==l?HP(HP({},l),e.props):e.props,u=i&&i[s["".concat(o,"Id")]];return(0,t.cloneElement)(e,HP(HP({},u),{},{className:zt(o,u.className),key:e.key||"".concat(n,"-").concat(r),ticks:PO(u,!0)}))})),VP(a,"renderPolarGrid",(function(e){var n=e.props,r=n.radialLines,o=n.polarAngles,i=n.polarRadius,l=a.state,s=l.radiusAxisMap,u=l.angleAxisMap,c=Of(s),d=Of(u),f=d.cx,p=d.cy,h=d.innerRadius,m=d.outerRadius;return(0,t.cloneElement)(e,{polarAngles:Array.isArray(o)?o:PO(d,!0).map((function(e){return e.coordinate})),polarRadius:Array.isArray(i)?i:PO(c,!0).map((function(e){return e.coordinate})),cx:f,cy:p,innerRadius:h,outerRadius:m,key:e.key||"polar-grid",radialLines:r})})),VP(a,"renderLegend",(function(){var e=a.state.formattedGraphicalItems,n=a.props,r=n.children,o=n.width,i=n.height,l=a.props.margin||{},s=o-(l.left||0)-(l.right||0),c=mO({children:r,formattedGraphicalItems:e,legendWidth:s,legendContent:u});if(!c)return null;var d=c.item,f=NP(c,PP);return(0,t.cloneElement)(d,HP(HP({},f),{},{chartWidth:o,chartHeight:i,margin:l,onBBoxUpdate:a.handleLegendBBoxUpdate}))})),VP(a,"renderTooltip",(function(){var e,n=a.props,r=n.children,o=n.accessibilityLayer,i=Zf(r,mh);if(!i)return null;var l=a.state,s=l.isTooltipActive,u=l.activeCoordinate,c=l.activePayload,d=l.activeLabel,f=l.offset,p=null!==(e=i.props.active)&&void 0!==e?e:s;return(0,t.cloneElement)(i,{viewBox:HP(HP({},f),{},{x:f.left,y:f.top}),active:p,label:d,payload:p?c:[],coordinate:u,accessibilityLayer:o})})),VP(a,"renderBrush",(function(e){var n=a.props,r=n.margin,o=n.data,i=a.state,l=i.offset,s=i.dataStartIndex,u=i.dataEndIndex,c=i.updateId;return(0,t.cloneElement)(e,{key:e.key||"_recharts-brush",onChange:TO(a.handleBrushChange,e.props.onChange),data:o,x:bf(e.props.x)?e.props.x:l.left,y:bf(e.props.y)?e.props.y:l.top+l.height+l.brushBottom-(r.bottom||0),width:bf(e.props.width)?e.props.width:l.width,startIndex:s,endIndex:u,updateId:"brush-".concat(c)})})),VP(a,"renderReferenceElement",(function(e,n,r){if(!e)return null;var o=a.clipPathId,i=a.state,l=i.xAxisMap,s=i.yAxisMap,u=i.offset,c=e.type.defaultProps||{},d=e.props,f=d.xAxisId,p=void 0===f?c.xAxisId:f,h=d.yAxisId,m=void 0===h?c.yAxisId:h;return(0,t.cloneElement)(e,{key:e.key||"".concat(n,"-").concat(r),xAxis:l[p],yAxis:s[m],viewBox:{x:u.left,y:u.top,width:u.width,height:u.height},clipPathId:o})})),VP(a,"renderActivePoints",(function(e){var t=e.item,n=e.activePoint,o=e.basePoint,i=e.childIndex,a=e.isRange,l=[],s=t.props.key,u=void 0!==t.item.type.defaultProps?HP(HP({},t.item.type.defaultProps),t.item.props):t.item.props,c=u.activeDot,d=HP(HP({index:i,dataKey:u.dataKey,cx:n.x,cy:n.y,r:4,fill:OO(t.item),strokeWidth:2,stroke:"#fff",payload:n.payload,value:n.value},rp(c,!1)),Wf(c));return l.push(r.renderActiveDot(c,d,"".concat(s,"-activePoint-").concat(i))),o?l.push(r.renderActiveDot(c,HP(HP({},d),{},{cx:o.x,cy:o.y}),"".concat(s,"-basePoint-").concat(i))):a&&l.push(null),l})),VP(a,"renderGraphicChild",(function(e,n,r){var o=a.filterFormatItem(e,n,r);if(!o)return null;var i=a.getTooltipEventType(),l=a.state,s=l.isTooltipActive,u=l.tooltipAxis,c=l.activeTooltipIndex,d=l.activeLabel,f=Zf(a.props.children,mh),p=o.props,h=p.points,m=p.isRange,y=p.baseLine,v=void 0!==o.item.type.defaultProps?HP(HP({},o.item.type.defaultProps),o.item.props):o.item.props,g=v.activeDot,b=v.hide,x=v.activeBar,w=v.activeShape,S=Boolean(!b&&s&&f&&(g||x||w)),A={};"axis"!==i&&f&&"click"===f.props.trigger?A={onClick:TO(a.handleItemMouseEnter,e.props.onClick)}:"axis"!==i&&(A={onMouseLeave:TO(a.handleItemMouseLeave,e.props.onMouseLeave),onMouseEnter:TO(a.handleItemMouseEnter,e.props.onMouseEnter)});var O=(0,t.cloneElement)(e,HP(HP({},o.props),A));if(S){if(!(c>=0)){var k,j=(null!==(k=a.getItemByXY(a.state.activeCoordinate))&&void 0!==k?k:{graphicalItem:O}).graphicalItem,E=j.item,C=void 0===E?e:E,P=j.childIndex,M=HP(HP(HP({},o.props),A),{},{activeIndex:P});return[(0,t.cloneElement)(C,M),null,null]}var T,_;if(u.dataKey&&!u.allowDuplicatedCategory){var R="function"===typeof u.dataKey?function(e){return"function"===typeof u.dataKey?u.dataKey(e.payload):null}:"payload.".concat(u.dataKey.toString());T=jf(h,R,d),_=m&&y&&jf(y,R,d)}else T=null===h||void 0===h?void 0:h[c],_=m&&y&&y[c];if(w||x){var N=void 0!==e.props.activeIndex?e.props.activeIndex:c;return[(0,t.cloneElement)(e,HP(HP(HP({},o.props),A),{},{activeIndex:N})),null,null]}if(!Mf()(T))return[O].concat(BP(a.renderActivePoints({item:o,activePoint:T,basePoint:_,childIndex:c,isRange:m})))}return m?[O,null,null]:[O,null]})),VP(a,"renderCustomized",(function(e,n,r){return(0,t.cloneElement)(e,HP(HP({key:"recharts-customized-".concat(r)},a.props),a.state))})),VP(a,"renderMap",{CartesianGrid:{handler:YP,once:!0},ReferenceArea:{handler:a.renderReferenceElement},ReferenceLine:{handler:YP},ReferenceDot:{handler:a.renderReferenceElement},XAxis:{handler:YP},YAxis:{handler:YP},Brush:{handler:a.renderBrush,once:!0},Bar:{handler:a.renderGraphicChild},Line:{handler:a.renderGraphicChild},Area:{handler:a.renderGraphicChild},Radar:{handler:a.renderGraphicChild},RadialBar:{handler:a.renderGraphicChild},Scatter:{handler:a.renderGraphicChild},Pie:{handler:a.renderGraphicChild},Funnel:{handler:a.renderGraphicChild},Tooltip:{handler:a.renderCursor,once:!0},PolarGrid:{handler:a.renderPolarGrid,once:!0},PolarAngleAxis:{handler:a.renderPolarAxis},PolarRadiusAxis:{handler:a.renderPolarAxis},Customized:{handler:a.renderCustomized}}),a.clipPathId="".concat(null!==(o=e.id)&&void 0!==o?o:Sf("recharts"),"-clip"),a.throttleTriggeredAfterMouseMove=sf()(a.triggeredAfterMouseMove,null!==(i=e.throttleDelay)&&void 0!==i?i:1e3/60),a.state={},a}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&$P(e,t)}(r,e),o=r,a=[{key:"componentDidMount",value:function(){var e,t;this.addListener(),this.accessibilityManager.setDetails({container:this.container,offset:{left:null!==(e=this.props.margin.left)&&void 0!==e?e:0,top:null!==(t=this.props.margin.top)&&void 0!==t?t:0},coordinateList:this.state.tooltipTicks,mouseHandlerCallback:this.triggeredAfterMouseMove,layout:this.props.layout}),this.displayDefaultTooltip()}},{key:"displayDefaultTooltip",value:function(){var e=this.props,t=e.children,n=e.data,r=e.height,o=e.layout,i=Zf(t,mh);if(i){var a=i.props.defaultIndex;if(!("number"!==typeof a||a<0||a>this.state.tooltipTicks.length-1)){var l=this.state.tooltipTicks[a]&&this.state.tooltipTicks[a].value,s=ZP(this.state,n,a,l),u=this.state.tooltipTicks[a].coordinate,c=(this.state.offset.top+r)/2,d="horizontal"===o?{x:u,y:c}:{y:u,x:c},f=this.state.formattedGraphicalItems.find((function(e){return"Scatter"===e.item.type.name}));f&&(d=HP(HP({},d),f.props.points[a].tooltipPosition),s=f.props.points[a].tooltipPayload);var p={activeTooltipIndex:a,isTooltipActive:!0,activeLabel:l,activePayload:s,activeCoordinate:d};this.setState(p),this.renderCursor(i),this.accessibilityManager.setIndex(a)}}}},{key:"getSnapshotBeforeUpdate",value:function(e,t){return this.props.accessibilityLayer?(this.state.tooltipTicks!==t.tooltipTicks&&this.accessibilityManager.setDetails({coordinateList:this.state.tooltipTicks}),this.props.layout!==e.layout&&this.accessibilityManager.setDetails({layout:this.props.layout}),this.props.margin!==e.margin&&this.accessibilityManager.setDetails({offset:{left:null!==(n=this.props.margin.left)&&void 0!==n?n:0,top:null!==(r=this.props.margin.top)&&void 0!==r?r:0}}),null):null;var n,r}},{key:"componentDidUpdate",value:function(e){op([Zf(e.children,mh)],[Zf(this.props.children,mh)])||this.displayDefaultTooltip()}},{key:"componentWillUnmount",value:function(){this.removeListener(),this.throttleTriggeredAfterMouseMove.cancel()}},{key:"getTooltipEventType",value:function(){var e=Zf(this.props.children,mh);if(e&&"boolean"===typeof e.props.shared){var t=e.props.shared?"axis":"item";return l.indexOf(t)>=0?t:i}return i}},{key:"getMouseInfo",value:function(e){if(!this.container)return null;var t,n=this.container,r=n.getBoundingClientRect(),o={top:(t=r).top+window.scrollY-document.documentElement.clientTop,left:t.left+window.scrollX-document.documentElement.clientLeft},i={chartX:Math.round(e.pageX-o.left),chartY:Math.round(e.pageY-o.top)},a=r.width/n.offsetWidth||1,l=this.inRange(i.chartX,i.chartY,a);if(!l)return null;var s=this.state,u=s.xAxisMap,c=s.yAxisMap,d=this.getTooltipEventType(),f=eM(this.state,this.props.data,this.props.layout,l);if("axis"!==d&&u&&c){var p=Of(u).scale,h=Of(c).scale,m=p&&p.invert?p.invert(i.chartX):null,y=h&&h.invert?h.invert(i.chartY):null;return HP(HP({},i),{},{xValue:m,yValue:y},f)}return f?HP(HP({},i),f):null}},{key:"inRange",value:function(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:1,r=this.props.layout,o=e/n,i=t/n;if("horizontal"===r||"vertical"===r){var a=this.state.offset;return o>=a.left&&o<=a.left+a.width&&i>=a.top&&i<=a.top+a.height?{x:o,y:i}:null}var l=this.state,s=l.angleAxisMap,u=l.radiusAxisMap;if(s&&u){var c=Of(s);return Sk({x:o,y:i},c)}return null}},{key:"parseEventsOfWrapper",value:function(){var e=this.props.children,t=this.getTooltipEventType(),n=Zf(e,mh),r={};return n&&"axis"===t&&(r="click"===n.props.trigger?{onClick:this.handleClick}:{onMouseEnter:this.handleMouseEnter,onDoubleClick:this.handleDoubleClick,onMouseMove:this.handleMouseMove,onMouseLeave:this.handleMouseLeave,onTouchMove:this.handleTouchMove,onTouchStart:this.handleTouchStart,onTouchEnd:this.handleTouchEnd,onContextMenu:this.handleContextMenu}),HP(HP({},Wf(this.props,this.handleOuterEvent)),r)}},{key:"addListener",value:function(){EC.on(CC,this.handleReceiveSyncEvent)}},{key:"removeListener",value:function(){EC.removeListener(CC,this.handleReceiveSyncEvent)}},{key:"filterFormatItem",value:function(e,t,n){for(var r=this.state.formattedGraphicalItems,o=0,i=r.length;o<i;o++){var a=r[o];if(a.item===e||a.props.key===e.key||t===Kf(a.item.type)&&n===a.childIndex)return a}return null}},{key:"renderClipPath",value:function(){var e=this.clipPathId,n=this.state.offset,r=n.left,o=n.top,i=n.height,a=n.width;return t.createElement("defs",null,t.createElement("clipPath",{id:e},t.createElement("rect",{x:r,y:o,height:i,width:a})))}},{key:"getXScales",value:function(){var e=this.state.xAxisMap;return e?Object.entries(e).reduce((function(e,t){var n=RP(t,2),r=n[0],o=n[1];return HP(HP({},e),{},VP({},r,o.scale))}),{}):null}},{key:"getYScales",value:function(){var e=this.state.yAxisMap;return e?Object.entries(e).reduce((function(e,t){var n=RP(t,2),r=n[0],o=n[1];return HP(HP({},e),{},VP({},r,o.scale))}),{}):null}},{key:"getXScaleByAxisId",value:function(e){var t;return null===(t=this.state.xAxisMap)||void 0===t||null===(t=t[e])||void 0===t?void 0:t.scale}},{key:"getYScaleByAxisId",value:function(e){var t;return null===(t=this.state.yAxisMap)||void 0===t||null===(t=t[e])||void 0===t?void 0:t.scale}},{key:"getItemByXY",value:function(e){var t=this.state,n=t.formattedGraphicalItems,r=t.activeItem;if(n&&n.length)for(var o=0,i=n.length;o<i;o++){var a=n[o],l=a.props,s=a.item,u=void 0!==s.type.defaultProps?HP(HP({},s.type.defaultProps),s.props):s.props,c=Kf(s.type);if("Bar"===c){var d=(l.data||[]).find((function(t){return mv(e,t)}));if(d)return{graphicalItem:a,payload:d}}else if("RadialBar"===c){var f=(l.data||[]).find((function(t){return Sk(e,t)}));if(f)return{graphicalItem:a,payload:f}}else if(Nj(a,r)||Ij(a,r)||Dj(a,r)){var p=Bj({graphicalItem:a,activeTooltipItem:r,itemData:u.data}),h=void 0===u.activeIndex?p:u.activeIndex;return{graphicalItem:HP(HP({},a),{},{childIndex:h}),payload:Dj(a,r)?u.data[p]:a.props.data[p]}}}return null}},{key:"render",value:function(){var e=this;if(!ep(this))return null;var n,r,o=this.props,i=o.children,a=o.className,l=o.width,s=o.height,u=o.style,c=o.compact,d=o.title,f=o.desc,p=NP(o,MP),h=rp(p,!1);if(c)return t.createElement(VE,{state:this.state,width:this.props.width,height:this.props.height,clipPathId:this.clipPathId},t.createElement(Ap,_P({},h,{width:l,height:s,title:d,desc:f}),this.renderClipPath(),ap(i,this.renderMap)));this.props.accessibilityLayer&&(h.tabIndex=null!==(n=this.props.tabIndex)&&void 0!==n?n:0,h.role=null!==(r=this.props.role)&&void 0!==r?r:"application",h.onKeyDown=function(t){e.accessibilityManager.keyboardEvent(t)},h.onFocus=function(){e.accessibilityManager.focus()});var m=this.parseEventsOfWrapper();return t.createElement(VE,{state:this.state,width:this.props.width,height:this.props.height,clipPathId:this.clipPathId},t.createElement("div",_P({className:zt("recharts-wrapper",a),style:HP({position:"relative",cursor:"default",width:l,height:s},u)},m,{ref:function(t){e.container=t}}),t.createElement(Ap,_P({},h,{width:l,height:s,title:d,desc:f,style:KP}),this.renderClipPath(),ap(i,this.renderMap)),this.renderLegend(),this.renderTooltip()))}}],a&&IP(o.prototype,a),s&&IP(o,s),Object.defineProperty(o,"prototype",{writable:!1}),o;var o,a,s}(t.Component);VP(h,"displayName",n),VP(h,"defaultProps",HP({layout:"horizontal",stackOffset:"none",barCategoryGap:"10%",barGap:4,margin:{top:5,right:5,bottom:5,left:5},reverseStackOrder:!1,syncMethod:"index"},d)),VP(h,"getDerivedStateFromProps",(function(e,t){var n=e.dataKey,r=e.data,o=e.children,i=e.width,a=e.height,l=e.layout,s=e.stackOffset,u=e.margin,c=t.dataStartIndex,d=t.dataEndIndex;if(void 0===t.updateId){var f=rM(e);return HP(HP(HP({},f),{},{updateId:0},p(HP(HP({props:e},f),{},{updateId:0}),t)),{},{prevDataKey:n,prevData:r,prevWidth:i,prevHeight:a,prevLayout:l,prevStackOffset:s,prevMargin:u,prevChildren:o})}if(n!==t.prevDataKey||r!==t.prevData||i!==t.prevWidth||a!==t.prevHeight||l!==t.prevLayout||s!==t.prevStackOffset||!Df(u,t.prevMargin)){var h=rM(e),m={chartX:t.chartX,chartY:t.chartY,isTooltipActive:t.isTooltipActive},y=HP(HP({},eM(t,r,l)),{},{updateId:t.updateId+1}),v=HP(HP(HP({},h),m),y);return HP(HP(HP({},v),p(HP({props:e},v),t)),{},{prevDataKey:n,prevData:r,prevWidth:i,prevHeight:a,prevLayout:l,prevStackOffset:s,prevMargin:u,prevChildren:o})}if(!op(o,t.prevChildren)){var g,b,x,w,S=Zf(o,uk),A=S&&null!==(g=null===(b=S.props)||void 0===b?void 0:b.startIndex)&&void 0!==g?g:c,O=S&&null!==(x=null===(w=S.props)||void 0===w?void 0:w.endIndex)&&void 0!==x?x:d,k=A!==c||O!==d,j=!Mf()(r)&&!k?t.updateId:t.updateId+1;return HP(HP({updateId:j},p(HP(HP({props:e},t),{},{updateId:j,dataStartIndex:A,dataEndIndex:O}),t)),{},{prevChildren:o,dataStartIndex:A,dataEndIndex:O})}return null})),VP(h,"renderActiveDot",(function(e,n,r){var o;return o=(0,t.isValidElement)(e)?(0,t.cloneElement)(e,n):_f()(e)?e(n):t.createElement(Tm,n),t.createElement(Ep,{className:"recharts-active-dot",key:r},o)}));var m=(0,t.forwardRef)((function(e,n){return t.createElement(h,_P({},e,{ref:n}))}));return m.displayName=h.displayName,m},sM=["points","className","baseLinePoints","connectNulls"];function uM(){return uM=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},uM.apply(this,arguments)}function cM(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function dM(e){return function(e){if(Array.isArray(e))return fM(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return fM(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return fM(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function fM(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var pM=function(e){return e&&e.x===+e.x&&e.y===+e.y},hM=function(e,t){var n=function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[],t=[[]];return e.forEach((function(e){pM(e)?t[t.length-1].push(e):t[t.length-1].length>0&&t.push([])})),pM(e[0])&&t[t.length-1].push(e[0]),t[t.length-1].length<=0&&(t=t.slice(0,-1)),t}(e);t&&(n=[n.reduce((function(e,t){return[].concat(dM(e),dM(t))}),[])]);var r=n.map((function(e){return e.reduce((function(e,t,n){return"".concat(e).concat(0===n?"M":"L").concat(t.x,",").concat(t.y)}),"")})).join("");return 1===n.length?"".concat(r,"Z"):r},mM=function(e){var n=e.points,r=e.className,o=e.baseLinePoints,i=e.connectNulls,a=cM(e,sM);if(!n||!n.length)return null;var l=zt("recharts-polygon",r);if(o&&o.length){var s=a.stroke&&"none"!==a.stroke,u=function(e,t,n){var r=hM(e,n);return"".concat("Z"===r.slice(-1)?r.slice(0,-1):r,"L").concat(hM(t.reverse(),n).slice(1))}(n,o,i);return t.createElement("g",{className:l},t.createElement("path",uM({},rp(a,!0),{fill:"Z"===u.slice(-1)?a.fill:"none",stroke:"none",d:u})),s?t.createElement("path",uM({},rp(a,!0),{fill:"none",d:hM(n,i)})):null,s?t.createElement("path",uM({},rp(a,!0),{fill:"none",d:hM(o,i)})):null)}var c=hM(n,i);return t.createElement("path",uM({},rp(a,!0),{fill:"Z"===c.slice(-1)?a.fill:"none",className:l,d:c}))};function yM(e){return yM="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},yM(e)}function vM(){return vM=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},vM.apply(this,arguments)}function gM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function bM(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?gM(Object(n),!0).forEach((function(t){kM(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):gM(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function xM(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,jM(r.key),r)}}function wM(e,t,n){return t=AM(t),function(e,t){if(t&&("object"===yM(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,SM()?Reflect.construct(t,n||[],AM(e).constructor):t.apply(e,n))}function SM(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(SM=function(){return!!e})()}function AM(e){return AM=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},AM(e)}function OM(e,t){return OM=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},OM(e,t)}function kM(e,t,n){return(t=jM(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function jM(e){var t=function(e,t){if("object"!=yM(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=yM(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==yM(t)?t:t+""}var EM=Math.PI/180,CM=1e-5,PM=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),wM(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&OM(e,t)}(n,e),r=n,o=[{key:"getTickLineCoord",value:function(e){var t=this.props,n=t.cx,r=t.cy,o=t.radius,i=t.orientation,a=t.tickSize||8,l=gk(n,r,o,e.coordinate),s=gk(n,r,o+("inner"===i?-1:1)*a,e.coordinate);return{x1:l.x,y1:l.y,x2:s.x,y2:s.y}}},{key:"getTickTextAnchor",value:function(e){var t=this.props.orientation,n=Math.cos(-e.coordinate*EM);return n>CM?"outer"===t?"start":"end":n<-CM?"outer"===t?"end":"start":"middle"}},{key:"renderAxisLine",value:function(){var e=this.props,n=e.cx,r=e.cy,o=e.radius,i=e.axisLine,a=e.axisLineType,l=bM(bM({},rp(this.props,!1)),{},{fill:"none"},rp(i,!1));if("circle"===a)return t.createElement(Tm,vM({className:"recharts-polar-angle-axis-line"},l,{cx:n,cy:r,r:o}));var s=this.props.ticks.map((function(e){return gk(n,r,o,e.coordinate)}));return t.createElement(mM,vM({className:"recharts-polar-angle-axis-line"},l,{points:s}))}},{key:"renderTicks",value:function(){var e=this,r=this.props,o=r.ticks,i=r.tick,a=r.tickLine,l=r.tickFormatter,s=r.stroke,u=rp(this.props,!1),c=rp(i,!1),d=bM(bM({},u),{},{fill:"none"},rp(a,!1)),f=o.map((function(r,o){var f=e.getTickLineCoord(r),p=bM(bM(bM({textAnchor:e.getTickTextAnchor(r)},u),{},{stroke:"none",fill:s},c),{},{index:o,payload:r,x:f.x2,y:f.y2});return t.createElement(Ep,vM({className:zt("recharts-polar-angle-axis-tick",Ak(i)),key:"tick-".concat(r.coordinate)},Uf(e.props,r,o)),a&&t.createElement("line",vM({className:"recharts-polar-angle-axis-tick-line"},d,f)),i&&n.renderTickItem(i,p,l?l(r.value,o):r.value))}));return t.createElement(Ep,{className:"recharts-polar-angle-axis-ticks"},f)}},{key:"render",value:function(){var e=this.props,n=e.ticks,r=e.radius,o=e.axisLine;return r<=0||!n||!n.length?null:t.createElement(Ep,{className:zt("recharts-polar-angle-axis",this.props.className)},o&&this.renderAxisLine(),this.renderTicks())}}],i=[{key:"renderTickItem",value:function(e,n,r){return t.isValidElement(e)?t.cloneElement(e,n):_f()(e)?e(n):t.createElement(fg,vM({},n,{className:"recharts-polar-angle-axis-tick-value"}),r)}}],o&&xM(r.prototype,o),i&&xM(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);kM(PM,"displayName","PolarAngleAxis"),kM(PM,"axisType","angleAxis"),kM(PM,"defaultProps",{type:"category",angleAxisId:0,scale:"auto",cx:0,cy:0,orientation:"outer",axisLine:!0,tickLine:!0,tickSize:8,tick:!0,hide:!1,allowDuplicatedCategory:!0});var MM=n(2794),TM=n.n(MM),_M=n(9364),RM=n.n(_M),NM=["cx","cy","angle","ticks","axisLine"],IM=["ticks","tick","angle","tickFormatter","stroke"];function DM(e){return DM="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},DM(e)}function LM(){return LM=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},LM.apply(this,arguments)}function zM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function $M(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?zM(Object(n),!0).forEach((function(t){qM(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):zM(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function BM(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function FM(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,XM(r.key),r)}}function WM(e,t,n){return t=HM(t),function(e,t){if(t&&("object"===DM(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,UM()?Reflect.construct(t,n||[],HM(e).constructor):t.apply(e,n))}function UM(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(UM=function(){return!!e})()}function HM(e){return HM=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},HM(e)}function VM(e,t){return VM=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},VM(e,t)}function qM(e,t,n){return(t=XM(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function XM(e){var t=function(e,t){if("object"!=DM(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=DM(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==DM(t)?t:t+""}var KM,GM=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),WM(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&VM(e,t)}(n,e),r=n,o=[{key:"getTickValueCoord",value:function(e){var t=e.coordinate,n=this.props,r=n.angle,o=n.cx,i=n.cy;return gk(o,i,t,r)}},{key:"getTickTextAnchor",value:function(){var e;switch(this.props.orientation){case"left":e="end";break;case"right":e="start";break;default:e="middle"}return e}},{key:"getViewBox",value:function(){var e=this.props,t=e.cx,n=e.cy,r=e.angle,o=e.ticks,i=TM()(o,(function(e){return e.coordinate||0}));return{cx:t,cy:n,startAngle:r,endAngle:r,innerRadius:RM()(o,(function(e){return e.coordinate||0})).coordinate||0,outerRadius:i.coordinate||0}}},{key:"renderAxisLine",value:function(){var e=this.props,n=e.cx,r=e.cy,o=e.angle,i=e.ticks,a=e.axisLine,l=BM(e,NM),s=i.reduce((function(e,t){return[Math.min(e[0],t.coordinate),Math.max(e[1],t.coordinate)]}),[1/0,-1/0]),u=gk(n,r,s[0],o),c=gk(n,r,s[1],o),d=$M($M($M({},rp(l,!1)),{},{fill:"none"},rp(a,!1)),{},{x1:u.x,y1:u.y,x2:c.x,y2:c.y});return t.createElement("line",LM({className:"recharts-polar-radius-axis-line"},d))}},{key:"renderTicks",value:function(){var e=this,r=this.props,o=r.ticks,i=r.tick,a=r.angle,l=r.tickFormatter,s=r.stroke,u=BM(r,IM),c=this.getTickTextAnchor(),d=rp(u,!1),f=rp(i,!1),p=o.map((function(r,o){var u=e.getTickValueCoord(r),p=$M($M($M($M({textAnchor:c,transform:"rotate(".concat(90-a,", ").concat(u.x,", ").concat(u.y,")")},d),{},{stroke:"none",fill:s},f),{},{index:o},u),{},{payload:r});return t.createElement(Ep,LM({className:zt("recharts-polar-radius-axis-tick",Ak(i)),key:"tick-".concat(r.coordinate)},Uf(e.props,r,o)),n.renderTickItem(i,p,l?l(r.value,o):r.value))}));return t.createElement(Ep,{className:"recharts-polar-radius-axis-ticks"},p)}},{key:"render",value:function(){var e=this.props,n=e.ticks,r=e.axisLine,o=e.tick;return n&&n.length?t.createElement(Ep,{className:zt("recharts-polar-radius-axis",this.props.className)},r&&this.renderAxisLine(),o&&this.renderTicks(),Nk.renderCallByParent(this.props,this.getViewBox())):null}}],i=[{key:"renderTickItem",value:function(e,n,r){return t.isValidElement(e)?t.cloneElement(e,n):_f()(e)?e(n):t.createElement(fg,LM({},n,{className:"recharts-polar-radius-axis-tick-value"}),r)}}],o&&FM(r.prototype,o),i&&FM(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);function YM(e){return YM="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},YM(e)}function QM(){return QM=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},QM.apply(this,arguments)}function JM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function ZM(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?JM(Object(n),!0).forEach((function(t){iT(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):JM(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function eT(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,aT(r.key),r)}}function tT(e,t,n){return t=rT(t),function(e,t){if(t&&("object"===YM(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,nT()?Reflect.construct(t,n||[],rT(e).constructor):t.apply(e,n))}function nT(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(nT=function(){return!!e})()}function rT(e){return rT=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},rT(e)}function oT(e,t){return oT=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},oT(e,t)}function iT(e,t,n){return(t=aT(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function aT(e){var t=function(e,t){if("object"!=YM(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=YM(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==YM(t)?t:t+""}qM(GM,"displayName","PolarRadiusAxis"),qM(GM,"axisType","radiusAxis"),qM(GM,"defaultProps",{type:"number",radiusAxisId:0,cx:0,cy:0,angle:0,orientation:"right",stroke:"#ccc",axisLine:!0,tick:!0,tickCount:5,allowDataOverflow:!1,scale:"auto",allowDuplicatedCategory:!0});var lT=function(e){function n(e){var t;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),iT(t=tT(this,n,[e]),"pieRef",null),iT(t,"sectorRefs",[]),iT(t,"id",Sf("recharts-pie-")),iT(t,"handleAnimationEnd",(function(){var e=t.props.onAnimationEnd;t.setState({isAnimationFinished:!0}),_f()(e)&&e()})),iT(t,"handleAnimationStart",(function(){var e=t.props.onAnimationStart;t.setState({isAnimationFinished:!1}),_f()(e)&&e()})),t.state={isAnimationFinished:!e.isAnimationActive,prevIsAnimationActive:e.isAnimationActive,prevAnimationId:e.animationId,sectorToFocus:0},t}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&oT(e,t)}(n,e),r=n,o=[{key:"isActiveIndex",value:function(e){var t=this.props.activeIndex;return Array.isArray(t)?-1!==t.indexOf(e):e===t}},{key:"hasActiveIndex",value:function(){var e=this.props.activeIndex;return Array.isArray(e)?0!==e.length:e||0===e}},{key:"renderLabels",value:function(e){if(this.props.isAnimationActive&&!this.state.isAnimationFinished)return null;var r=this.props,o=r.label,i=r.labelLine,a=r.dataKey,l=r.valueKey,s=rp(this.props,!1),u=rp(o,!1),c=rp(i,!1),d=o&&o.offsetRadius||20,f=e.map((function(e,r){var f=(e.startAngle+e.endAngle)/2,p=gk(e.cx,e.cy,e.outerRadius+d,f),h=ZM(ZM(ZM(ZM({},s),e),{},{stroke:"none"},u),{},{index:r,textAnchor:n.getTextAnchor(p.x,e.cx)},p),m=ZM(ZM(ZM(ZM({},s),e),{},{fill:"none",stroke:e.fill},c),{},{index:r,points:[gk(e.cx,e.cy,e.outerRadius,f),p]}),y=a;return Mf()(a)&&Mf()(l)?y="value":Mf()(a)&&(y=l),t.createElement(Ep,{key:"label-".concat(e.startAngle,"-").concat(e.endAngle,"-").concat(e.midAngle,"-").concat(r)},i&&n.renderLabelLineItem(i,m,"line"),n.renderLabelItem(o,h,SO(e,y)))}));return t.createElement(Ep,{className:"recharts-pie-labels"},f)}},{key:"renderSectorsStatically",value:function(e){var n=this,r=this.props,o=r.activeShape,i=r.blendStroke,a=r.inactiveShape;return e.map((function(r,l){if(0===(null===r||void 0===r?void 0:r.startAngle)&&0===(null===r||void 0===r?void 0:r.endAngle)&&1!==e.length)return null;var s=n.isActiveIndex(l),u=a&&n.hasActiveIndex()?a:null,c=s?o:u,d=ZM(ZM({},r),{},{stroke:i?r.fill:r.stroke,tabIndex:-1});return t.createElement(Ep,QM({ref:function(e){e&&!n.sectorRefs.includes(e)&&n.sectorRefs.push(e)},tabIndex:-1,className:"recharts-pie-sector"},Uf(n.props,r,l),{key:"sector-".concat(null===r||void 0===r?void 0:r.startAngle,"-").concat(null===r||void 0===r?void 0:r.endAngle,"-").concat(r.midAngle,"-").concat(l)}),t.createElement(Rj,QM({option:c,isActive:s,shapeType:"sector"},d)))}))}},{key:"renderSectorsWithAnimation",value:function(){var e=this,n=this.props,r=n.sectors,o=n.isAnimationActive,i=n.animationBegin,a=n.animationDuration,l=n.animationEasing,s=n.animationId,u=this.state,c=u.prevSectors,d=u.prevIsAnimationActive;return t.createElement(av,{begin:i,duration:a,isActive:o,easing:l,from:{t:0},to:{t:1},key:"pie-".concat(s,"-").concat(d),onAnimationStart:this.handleAnimationStart,onAnimationEnd:this.handleAnimationEnd},(function(n){var o=n.t,i=[],a=(r&&r[0]).startAngle;return r.forEach((function(e,t){var n=c&&c[t],r=t>0?hf()(e,"paddingAngle",0):0;if(n){var l=kf(n.endAngle-n.startAngle,e.endAngle-e.startAngle),s=ZM(ZM({},e),{},{startAngle:a+r,endAngle:a+l(o)+r});i.push(s),a=s.endAngle}else{var u=e.endAngle,d=e.startAngle,f=kf(0,u-d)(o),p=ZM(ZM({},e),{},{startAngle:a+r,endAngle:a+f+r});i.push(p),a=p.endAngle}})),t.createElement(Ep,null,e.renderSectorsStatically(i))}))}},{key:"attachKeyboardHandlers",value:function(e){var t=this;e.onkeydown=function(e){if(!e.altKey)switch(e.key){case"ArrowLeft":var n=++t.state.sectorToFocus%t.sectorRefs.length;t.sectorRefs[n].focus(),t.setState({sectorToFocus:n});break;case"ArrowRight":var r=--t.state.sectorToFocus<0?t.sectorRefs.length-1:t.state.sectorToFocus%t.sectorRefs.length;t.sectorRefs[r].focus(),t.setState({sectorToFocus:r});break;case"Escape":t.sectorRefs[t.state.sectorToFocus].blur(),t.setState({sectorToFocus:0})}}}},{key:"renderSectors",value:function(){var e=this.props,t=e.sectors,n=e.isAnimationActive,r=this.state.prevSectors;return!(n&&t&&t.length)||r&&wA()(r,t)?this.renderSectorsStatically(t):this.renderSectorsWithAnimation()}},{key:"componentDidMount",value:function(){this.pieRef&&this.attachKeyboardHandlers(this.pieRef)}},{key:"render",value:function(){var e=this,n=this.props,r=n.hide,o=n.sectors,i=n.className,a=n.label,l=n.cx,s=n.cy,u=n.innerRadius,c=n.outerRadius,d=n.isAnimationActive,f=this.state.isAnimationFinished;if(r||!o||!o.length||!bf(l)||!bf(s)||!bf(u)||!bf(c))return null;var p=zt("recharts-pie",i);return t.createElement(Ep,{tabIndex:this.props.rootTabIndex,className:p,ref:function(t){e.pieRef=t}},this.renderSectors(),a&&this.renderLabels(o),Nk.renderCallByParent(this.props,null,!1),(!d||f)&&tj.renderCallByParent(this.props,o,!1))}}],i=[{key:"getDerivedStateFromProps",value:function(e,t){return t.prevIsAnimationActive!==e.isAnimationActive?{prevIsAnimationActive:e.isAnimationActive,prevAnimationId:e.animationId,curSectors:e.sectors,prevSectors:[],isAnimationFinished:!0}:e.isAnimationActive&&e.animationId!==t.prevAnimationId?{prevAnimationId:e.animationId,curSectors:e.sectors,prevSectors:t.curSectors,isAnimationFinished:!0}:e.sectors!==t.curSectors?{curSectors:e.sectors,isAnimationFinished:!0}:null}},{key:"getTextAnchor",value:function(e,t){return e>t?"start":e<t?"end":"middle"}},{key:"renderLabelLineItem",value:function(e,n,r){if(t.isValidElement(e))return t.cloneElement(e,n);if(_f()(e))return e(n);var o=zt("recharts-pie-label-line","boolean"!==typeof e?e.className:"");return t.createElement(pP,QM({},n,{key:r,type:"linear",className:o}))}},{key:"renderLabelItem",value:function(e,n,r){if(t.isValidElement(e))return t.cloneElement(e,n);var o=r;if(_f()(e)&&(o=e(n),t.isValidElement(o)))return o;var i=zt("recharts-pie-label-text","boolean"===typeof e||_f()(e)?"":e.className);return t.createElement(fg,QM({},n,{alignmentBaseline:"middle",className:i}),o)}}],o&&eT(r.prototype,o),i&&eT(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);KM=lT,iT(lT,"displayName","Pie"),iT(lT,"defaultProps",{stroke:"#fff",fill:"#808080",legendType:"rect",cx:"50%",cy:"50%",startAngle:0,endAngle:360,innerRadius:0,outerRadius:"80%",paddingAngle:0,labelLine:!0,hide:!1,minAngle:0,isAnimationActive:!eh.isSsr,animationBegin:400,animationDuration:1500,animationEasing:"ease",nameKey:"name",blendStroke:!1,rootTabIndex:0}),iT(lT,"parseDeltaAngle",(function(e,t){return vf(t-e)*Math.min(Math.abs(t-e),360)})),iT(lT,"getRealPieData",(function(e){var t=e.data,n=e.children,r=rp(e,!1),o=Jf(n,Fk);return t&&t.length?t.map((function(e,t){return ZM(ZM(ZM({payload:e},r),e),o&&o[t]&&o[t].props)})):o&&o.length?o.map((function(e){return ZM(ZM({},r),e.props)})):[]})),iT(lT,"parseCoordinateOfPie",(function(e,t){var n=t.top,r=t.left,o=t.width,i=t.height,a=bk(o,i);return{cx:r+Af(e.cx,o,o/2),cy:n+Af(e.cy,i,i/2),innerRadius:Af(e.innerRadius,a,0),outerRadius:Af(e.outerRadius,a,.8*a),maxRadius:e.maxRadius||Math.sqrt(o*o+i*i)/2}})),iT(lT,"getComposedData",(function(e){var t=e.item,n=e.offset,r=void 0!==t.type.defaultProps?ZM(ZM({},t.type.defaultProps),t.props):t.props,o=KM.getRealPieData(r);if(!o||!o.length)return null;var i=r.cornerRadius,a=r.startAngle,l=r.endAngle,s=r.paddingAngle,u=r.dataKey,c=r.nameKey,d=r.valueKey,f=r.tooltipType,p=Math.abs(r.minAngle),h=KM.parseCoordinateOfPie(r,n),m=KM.parseDeltaAngle(a,l),y=Math.abs(m),v=u;Mf()(u)&&Mf()(d)?(Cf(!1,'Use "dataKey" to specify the value of pie,\n      the props "valueKey" will be deprecated in 1.1.0'),v="value"):Mf()(u)&&(Cf(!1,'Use "dataKey" to specify the value of pie,\n      the props "valueKey" will be deprecated in 1.1.0'),v=d);var g,b,x=o.filter((function(e){return 0!==SO(e,v,0)})).length,w=y-x*p-(y>=360?x:x-1)*s,S=o.reduce((function(e,t){var n=SO(t,v,0);return e+(bf(n)?n:0)}),0);S>0&&(g=o.map((function(e,t){var n,r=SO(e,v,0),o=SO(e,c,t),l=(bf(r)?r:0)/S,u=(n=t?b.endAngle+vf(m)*s*(0!==r?1:0):a)+vf(m)*((0!==r?p:0)+l*w),d=(n+u)/2,y=(h.innerRadius+h.outerRadius)/2,g=[{name:o,value:r,payload:e,dataKey:v,type:f}],x=gk(h.cx,h.cy,y,d);return b=ZM(ZM(ZM({percent:l,cornerRadius:i,name:o,tooltipPayload:g,midAngle:d,middleRadius:y,tooltipPosition:x},e),h),{},{value:SO(e,v),startAngle:n,endAngle:u,payload:e,paddingAngle:vf(m)*s})})));return ZM(ZM({},h),{},{sectors:g,data:o})}));var sT=lM({chartName:"PieChart",GraphicalChild:lT,validateTooltipEventTypes:["item"],defaultTooltipEventType:"item",legendContent:"children",axisComponents:[{axisType:"angleAxis",AxisComp:PM},{axisType:"radiusAxis",AxisComp:GM}],formatAxisMap:function(e,t,n,r,o){var i=e.width,a=e.height,l=e.startAngle,s=e.endAngle,u=Af(e.cx,i,i/2),c=Af(e.cy,a,a/2),d=bk(i,a,n),f=Af(e.innerRadius,d,0),p=Af(e.outerRadius,d,.8*d);return Object.keys(t).reduce((function(e,n){var i,a=t[n],d=a.domain,h=a.reversed;if(Mf()(a.range))"angleAxis"===r?i=[l,s]:"radiusAxis"===r&&(i=[f,p]),h&&(i=[i[1],i[0]]);else{var m=hk(i=a.range,2);l=m[0],s=m[1]}var y=_O(a,o),v=y.realScaleType,g=y.scale;g.domain(d).range(i),NO(g);var b=LO(g,fk(fk({},a),{},{realScaleType:v})),x=fk(fk(fk({},a),b),{},{range:i,radius:p,realScaleType:v,scale:g,cx:u,cy:c,innerRadius:f,outerRadius:p,startAngle:l,endAngle:s});return fk(fk({},e),{},pk({},n,x))}),{})},defaultProps:{layout:"centric",startAngle:0,endAngle:360,cx:"50%",cy:"50%",innerRadius:0,outerRadius:"80%"}});function uT(e,t,n){if(t<1)return[];if(1===t&&void 0===n)return e;for(var r=[],o=0;o<e.length;o+=t){if(void 0!==n&&!0!==n(e[o]))return;r.push(e[o])}return r}function cT(e,t,n){return function(e){var t=e.width,n=e.height,r=function(e){return(e%180+180)%180}(arguments.length>1&&void 0!==arguments[1]?arguments[1]:0),o=r*Math.PI/180,i=Math.atan(n/t),a=o>i&&o<Math.PI-i?n/Math.sin(o):t/Math.cos(o);return Math.abs(a)}({width:e.width+t.width,height:e.height+t.height},n)}function dT(e,t,n,r,o){if(e*t<e*r||e*t>e*o)return!1;var i=n();return e*(t-e*i/2-r)>=0&&e*(t+e*i/2-o)<=0}function fT(e){return fT="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},fT(e)}function pT(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function hT(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?pT(Object(n),!0).forEach((function(t){mT(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):pT(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function mT(e,t,n){return t=function(e){var t=function(e,t){if("object"!=fT(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=fT(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==fT(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function yT(e,t,n){var r=e.tick,o=e.ticks,i=e.viewBox,a=e.minTickGap,l=e.orientation,s=e.interval,u=e.tickFormatter,c=e.unit,d=e.angle;if(!o||!o.length||!r)return[];if(bf(s)||eh.isSsr)return function(e,t){return uT(e,t+1)}(o,"number"===typeof s&&bf(s)?s:0);var f=[],p="top"===l||"bottom"===l?"width":"height",h=c&&"width"===p?Lv(c,{fontSize:t,letterSpacing:n}):{width:0,height:0},m=function(e,r){var o=_f()(u)?u(e.value,r):e.value;return"width"===p?cT(Lv(o,{fontSize:t,letterSpacing:n}),h,d):Lv(o,{fontSize:t,letterSpacing:n})[p]},y=o.length>=2?vf(o[1].coordinate-o[0].coordinate):1,v=function(e,t,n){var r="width"===n,o=e.x,i=e.y,a=e.width,l=e.height;return 1===t?{start:r?o:i,end:r?o+a:i+l}:{start:r?o+a:i+l,end:r?o:i}}(i,y,p);return"equidistantPreserveStart"===s?function(e,t,n,r,o){for(var i,a=(r||[]).slice(),l=t.start,s=t.end,u=0,c=1,d=l,f=function(){var t=null===r||void 0===r?void 0:r[u];if(void 0===t)return{v:uT(r,c)};var i,a=u,f=function(){return void 0===i&&(i=n(t,a)),i},p=t.coordinate,h=0===u||dT(e,p,f,d,s);h||(u=0,d=l,c+=1),h&&(d=p+e*(f()/2+o),u+=c)};c<=a.length;)if(i=f())return i.v;return[]}(y,v,m,o,a):(f="preserveStart"===s||"preserveStartEnd"===s?function(e,t,n,r,o,i){var a=(r||[]).slice(),l=a.length,s=t.start,u=t.end;if(i){var c=r[l-1],d=n(c,l-1),f=e*(c.coordinate+e*d/2-u);a[l-1]=c=hT(hT({},c),{},{tickCoord:f>0?c.coordinate-f*e:c.coordinate}),dT(e,c.tickCoord,(function(){return d}),s,u)&&(u=c.tickCoord-e*(d/2+o),a[l-1]=hT(hT({},c),{},{isShow:!0}))}for(var p=i?l-1:l,h=function(t){var r,i=a[t],l=function(){return void 0===r&&(r=n(i,t)),r};if(0===t){var c=e*(i.coordinate-e*l()/2-s);a[t]=i=hT(hT({},i),{},{tickCoord:c<0?i.coordinate-c*e:i.coordinate})}else a[t]=i=hT(hT({},i),{},{tickCoord:i.coordinate});dT(e,i.tickCoord,l,s,u)&&(s=i.tickCoord+e*(l()/2+o),a[t]=hT(hT({},i),{},{isShow:!0}))},m=0;m<p;m++)h(m);return a}(y,v,m,o,a,"preserveStartEnd"===s):function(e,t,n,r,o){for(var i=(r||[]).slice(),a=i.length,l=t.start,s=t.end,u=function(t){var r,u=i[t],c=function(){return void 0===r&&(r=n(u,t)),r};if(t===a-1){var d=e*(u.coordinate+e*c()/2-s);i[t]=u=hT(hT({},u),{},{tickCoord:d>0?u.coordinate-d*e:u.coordinate})}else i[t]=u=hT(hT({},u),{},{tickCoord:u.coordinate});dT(e,u.tickCoord,c,l,s)&&(s=u.tickCoord-e*(c()/2+o),i[t]=hT(hT({},u),{},{isShow:!0}))},c=a-1;c>=0;c--)u(c);return i}(y,v,m,o,a),f.filter((function(e){return e.isShow})))}var vT=["viewBox"],gT=["viewBox"],bT=["ticks"];function xT(e){return xT="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},xT(e)}function wT(){return wT=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},wT.apply(this,arguments)}function ST(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function AT(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?ST(Object(n),!0).forEach((function(t){MT(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ST(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function OT(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function kT(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,TT(r.key),r)}}function jT(e,t,n){return t=CT(t),function(e,t){if(t&&("object"===xT(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,ET()?Reflect.construct(t,n||[],CT(e).constructor):t.apply(e,n))}function ET(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(ET=function(){return!!e})()}function CT(e){return CT=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},CT(e)}function PT(e,t){return PT=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},PT(e,t)}function MT(e,t,n){return(t=TT(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function TT(e){var t=function(e,t){if("object"!=xT(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=xT(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==xT(t)?t:t+""}var _T=function(e){function n(e){var t;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),(t=jT(this,n,[e])).state={fontSize:"",letterSpacing:""},t}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&PT(e,t)}(n,e),r=n,o=[{key:"shouldComponentUpdate",value:function(e,t){var n=e.viewBox,r=OT(e,vT),o=this.props,i=o.viewBox,a=OT(o,gT);return!Df(n,i)||!Df(r,a)||!Df(t,this.state)}},{key:"componentDidMount",value:function(){var e=this.layerReference;if(e){var t=e.getElementsByClassName("recharts-cartesian-axis-tick-value")[0];t&&this.setState({fontSize:window.getComputedStyle(t).fontSize,letterSpacing:window.getComputedStyle(t).letterSpacing})}}},{key:"getTickLineCoord",value:function(e){var t,n,r,o,i,a,l=this.props,s=l.x,u=l.y,c=l.width,d=l.height,f=l.orientation,p=l.tickSize,h=l.mirror,m=l.tickMargin,y=h?-1:1,v=e.tickSize||p,g=bf(e.tickCoord)?e.tickCoord:e.coordinate;switch(f){case"top":t=n=e.coordinate,a=(r=(o=u+ +!h*d)-y*v)-y*m,i=g;break;case"left":r=o=e.coordinate,i=(t=(n=s+ +!h*c)-y*v)-y*m,a=g;break;case"right":r=o=e.coordinate,i=(t=(n=s+ +h*c)+y*v)+y*m,a=g;break;default:t=n=e.coordinate,a=(r=(o=u+ +h*d)+y*v)+y*m,i=g}return{line:{x1:t,y1:r,x2:n,y2:o},tick:{x:i,y:a}}}},{key:"getTickTextAnchor",value:function(){var e,t=this.props,n=t.orientation,r=t.mirror;switch(n){case"left":e=r?"start":"end";break;case"right":e=r?"end":"start";break;default:e="middle"}return e}},{key:"getTickVerticalAnchor",value:function(){var e=this.props,t=e.orientation,n=e.mirror,r="end";switch(t){case"left":case"right":r="middle";break;case"top":r=n?"start":"end";break;default:r=n?"end":"start"}return r}},{key:"renderAxisLine",value:function(){var e=this.props,n=e.x,r=e.y,o=e.width,i=e.height,a=e.orientation,l=e.mirror,s=e.axisLine,u=AT(AT(AT({},rp(this.props,!1)),rp(s,!1)),{},{fill:"none"});if("top"===a||"bottom"===a){var c=+("top"===a&&!l||"bottom"===a&&l);u=AT(AT({},u),{},{x1:n,y1:r+c*i,x2:n+o,y2:r+c*i})}else{var d=+("left"===a&&!l||"right"===a&&l);u=AT(AT({},u),{},{x1:n+d*o,y1:r,x2:n+d*o,y2:r+i})}return t.createElement("line",wT({},u,{className:zt("recharts-cartesian-axis-line",hf()(s,"className"))}))}},{key:"renderTicks",value:function(e,r,o){var i=this,a=this.props,l=a.tickLine,s=a.stroke,u=a.tick,c=a.tickFormatter,d=a.unit,f=yT(AT(AT({},this.props),{},{ticks:e}),r,o),p=this.getTickTextAnchor(),h=this.getTickVerticalAnchor(),m=rp(this.props,!1),y=rp(u,!1),v=AT(AT({},m),{},{fill:"none"},rp(l,!1)),g=f.map((function(e,r){var o=i.getTickLineCoord(e),a=o.line,g=o.tick,b=AT(AT(AT(AT({textAnchor:p,verticalAnchor:h},m),{},{stroke:"none",fill:s},y),g),{},{index:r,payload:e,visibleTicksCount:f.length,tickFormatter:c});return t.createElement(Ep,wT({className:"recharts-cartesian-axis-tick",key:"tick-".concat(e.value,"-").concat(e.coordinate,"-").concat(e.tickCoord)},Uf(i.props,e,r)),l&&t.createElement("line",wT({},v,a,{className:zt("recharts-cartesian-axis-tick-line",hf()(l,"className"))})),u&&n.renderTickItem(u,b,"".concat(_f()(c)?c(e.value,r):e.value).concat(d||"")))}));return t.createElement("g",{className:"recharts-cartesian-axis-ticks"},g)}},{key:"render",value:function(){var e=this,n=this.props,r=n.axisLine,o=n.width,i=n.height,a=n.ticksGenerator,l=n.className;if(n.hide)return null;var s=this.props,u=s.ticks,c=OT(s,bT),d=u;return _f()(a)&&(d=u&&u.length>0?a(this.props):a(c)),o<=0||i<=0||!d||!d.length?null:t.createElement(Ep,{className:zt("recharts-cartesian-axis",l),ref:function(t){e.layerReference=t}},r&&this.renderAxisLine(),this.renderTicks(d,this.state.fontSize,this.state.letterSpacing),Nk.renderCallByParent(this.props))}}],i=[{key:"renderTickItem",value:function(e,n,r){return t.isValidElement(e)?t.cloneElement(e,n):_f()(e)?e(n):t.createElement(fg,wT({},n,{className:"recharts-cartesian-axis-tick-value"}),r)}}],o&&kT(r.prototype,o),i&&kT(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);function RT(e){return RT="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},RT(e)}function NT(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,BT(r.key),r)}}function IT(e,t,n){return t=LT(t),function(e,t){if(t&&("object"===RT(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,DT()?Reflect.construct(t,n||[],LT(e).constructor):t.apply(e,n))}function DT(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(DT=function(){return!!e})()}function LT(e){return LT=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},LT(e)}function zT(e,t){return zT=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},zT(e,t)}function $T(e,t,n){return(t=BT(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function BT(e){var t=function(e,t){if("object"!=RT(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=RT(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==RT(t)?t:t+""}function FT(){return FT=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},FT.apply(this,arguments)}function WT(e){var n=e.xAxisId,r=KE(),o=GE(),i=qE(n);return null==i?null:t.createElement(_T,FT({},i,{className:zt("recharts-".concat(i.axisType," ").concat(i.axisType),i.className),viewBox:{x:0,y:0,width:r,height:o},ticksGenerator:function(e){return PO(e,!0)}}))}MT(_T,"displayName","CartesianAxis"),MT(_T,"defaultProps",{x:0,y:0,width:0,height:0,viewBox:{x:0,y:0,width:0,height:0},orientation:"bottom",ticks:[],stroke:"#666",tickLine:!0,axisLine:!0,tick:!0,mirror:!1,minTickGap:5,tickSize:6,tickMargin:2,interval:"preserveEnd"});var UT=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),IT(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&zT(e,t)}(n,e),r=n,(o=[{key:"render",value:function(){return t.createElement(WT,this.props)}}])&&NT(r.prototype,o),i&&NT(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);function HT(e){return HT="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},HT(e)}function VT(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,QT(r.key),r)}}function qT(e,t,n){return t=KT(t),function(e,t){if(t&&("object"===HT(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,XT()?Reflect.construct(t,n||[],KT(e).constructor):t.apply(e,n))}function XT(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(e){}return(XT=function(){return!!e})()}function KT(e){return KT=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},KT(e)}function GT(e,t){return GT=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},GT(e,t)}function YT(e,t,n){return(t=QT(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function QT(e){var t=function(e,t){if("object"!=HT(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=HT(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==HT(t)?t:t+""}function JT(){return JT=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},JT.apply(this,arguments)}$T(UT,"displayName","XAxis"),$T(UT,"defaultProps",{allowDecimals:!0,hide:!1,orientation:"bottom",width:0,height:30,mirror:!1,xAxisId:0,tickCount:5,type:"category",padding:{left:0,right:0},allowDataOverflow:!1,scale:"auto",reversed:!1,allowDuplicatedCategory:!0});var ZT=function(e){var n=e.yAxisId,r=KE(),o=GE(),i=XE(n);return null==i?null:t.createElement(_T,JT({},i,{className:zt("recharts-".concat(i.axisType," ").concat(i.axisType),i.className),viewBox:{x:0,y:0,width:r,height:o},ticksGenerator:function(e){return PO(e,!0)}}))},e_=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),qT(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&GT(e,t)}(n,e),r=n,(o=[{key:"render",value:function(){return t.createElement(ZT,this.props)}}])&&VT(r.prototype,o),i&&VT(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);YT(e_,"displayName","YAxis"),YT(e_,"defaultProps",{allowDuplicatedCategory:!0,allowDecimals:!0,hide:!1,orientation:"left",width:60,height:0,mirror:!1,yAxisId:0,tickCount:5,type:"number",padding:{top:0,bottom:0},allowDataOverflow:!1,scale:"auto",reversed:!1});var t_=lM({chartName:"BarChart",GraphicalChild:cE,defaultTooltipEventType:"axis",validateTooltipEventTypes:["axis","item"],axisComponents:[{axisType:"xAxis",AxisComp:UT},{axisType:"yAxis",AxisComp:e_}],formatAxisMap:function(e,t,n,r,o){var i=e.width,a=e.height,l=e.layout,s=e.children,u=Object.keys(t),c={left:n.left,leftMirror:n.left,right:i-n.right,rightMirror:i-n.right,top:n.top,topMirror:n.top,bottom:a-n.bottom,bottomMirror:a-n.bottom},d=!!Zf(s,cE);return u.reduce((function(i,a){var s,u,f,p,h,m=t[a],y=m.orientation,v=m.domain,g=m.padding,b=void 0===g?{}:g,x=m.mirror,w=m.reversed,S="".concat(y).concat(x?"Mirror":"");if("number"===m.type&&("gap"===m.padding||"no-gap"===m.padding)){var A=v[1]-v[0],O=1/0,k=m.categoricalDomain.sort(Ef);if(k.forEach((function(e,t){t>0&&(O=Math.min((e||0)-(k[t-1]||0),O))})),Number.isFinite(O)){var j=O/A,E="vertical"===m.layout?n.height:n.width;if("gap"===m.padding&&(s=j*E/2),"no-gap"===m.padding){var C=Af(e.barCategoryGap,j*E),P=j*E/2;s=P-C-(P-C)/E*C}}}u="xAxis"===r?[n.left+(b.left||0)+(s||0),n.left+n.width-(b.right||0)-(s||0)]:"yAxis"===r?"horizontal"===l?[n.top+n.height-(b.bottom||0),n.top+(b.top||0)]:[n.top+(b.top||0)+(s||0),n.top+n.height-(b.bottom||0)-(s||0)]:m.range,w&&(u=[u[1],u[0]]);var M=_O(m,o,d),T=M.scale,_=M.realScaleType;T.domain(v).range(u),NO(T);var R=LO(T,hE(hE({},m),{},{realScaleType:_}));"xAxis"===r?(h="top"===y&&!x||"bottom"===y&&x,f=n.left,p=c[S]-h*m.height):"yAxis"===r&&(h="left"===y&&!x||"right"===y&&x,f=c[S]-h*m.width,p=n.top);var N=hE(hE(hE({},m),R),{},{realScaleType:_,x:f,y:p,scale:T,width:"xAxis"===r?n.width:m.width,height:"yAxis"===r?n.height:m.height});return N.bandSize=UO(N,R),m.hide||"xAxis"!==r?m.hide||(c[S]+=(h?-1:1)*N.width):c[S]+=(h?-1:1)*N.height,hE(hE({},i),{},mE({},a,N))}),{})}}),n_=["x1","y1","x2","y2","key"],r_=["offset"];function o_(e){return o_="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},o_(e)}function i_(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function a_(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?i_(Object(n),!0).forEach((function(t){l_(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):i_(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function l_(e,t,n){return t=function(e){var t=function(e,t){if("object"!=o_(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=o_(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==o_(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function s_(){return s_=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},s_.apply(this,arguments)}function u_(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var c_=function(e){var n=e.fill;if(!n||"none"===n)return null;var r=e.fillOpacity,o=e.x,i=e.y,a=e.width,l=e.height,s=e.ry;return t.createElement("rect",{x:o,y:i,ry:s,width:a,height:l,stroke:"none",fill:n,fillOpacity:r,className:"recharts-cartesian-grid-bg"})};function d_(e,n){var r;if(t.isValidElement(e))r=t.cloneElement(e,n);else if(_f()(e))r=e(n);else{var o=n.x1,i=n.y1,a=n.x2,l=n.y2,s=n.key,u=u_(n,n_),c=rp(u,!1),d=(c.offset,u_(c,r_));r=t.createElement("line",s_({},d,{x1:o,y1:i,x2:a,y2:l,fill:"none",key:s}))}return r}function f_(e){var n=e.x,r=e.width,o=e.horizontal,i=void 0===o||o,a=e.horizontalPoints;if(!i||!a||!a.length)return null;var l=a.map((function(t,o){var a=a_(a_({},e),{},{x1:n,y1:t,x2:n+r,y2:t,key:"line-".concat(o),index:o});return d_(i,a)}));return t.createElement("g",{className:"recharts-cartesian-grid-horizontal"},l)}function p_(e){var n=e.y,r=e.height,o=e.vertical,i=void 0===o||o,a=e.verticalPoints;if(!i||!a||!a.length)return null;var l=a.map((function(t,o){var a=a_(a_({},e),{},{x1:t,y1:n,x2:t,y2:n+r,key:"line-".concat(o),index:o});return d_(i,a)}));return t.createElement("g",{className:"recharts-cartesian-grid-vertical"},l)}function h_(e){var n=e.horizontalFill,r=e.fillOpacity,o=e.x,i=e.y,a=e.width,l=e.height,s=e.horizontalPoints,u=e.horizontal;if(!(void 0===u||u)||!n||!n.length)return null;var c=s.map((function(e){return Math.round(e+i-i)})).sort((function(e,t){return e-t}));i!==c[0]&&c.unshift(0);var d=c.map((function(e,s){var u=!c[s+1]?i+l-e:c[s+1]-e;if(u<=0)return null;var d=s%n.length;return t.createElement("rect",{key:"react-".concat(s),y:e,x:o,height:u,width:a,stroke:"none",fill:n[d],fillOpacity:r,className:"recharts-cartesian-grid-bg"})}));return t.createElement("g",{className:"recharts-cartesian-gridstripes-horizontal"},d)}function m_(e){var n=e.vertical,r=void 0===n||n,o=e.verticalFill,i=e.fillOpacity,a=e.x,l=e.y,s=e.width,u=e.height,c=e.verticalPoints;if(!r||!o||!o.length)return null;var d=c.map((function(e){return Math.round(e+a-a)})).sort((function(e,t){return e-t}));a!==d[0]&&d.unshift(0);var f=d.map((function(e,n){var r=!d[n+1]?a+s-e:d[n+1]-e;if(r<=0)return null;var c=n%o.length;return t.createElement("rect",{key:"react-".concat(n),x:e,y:l,width:r,height:u,stroke:"none",fill:o[c],fillOpacity:i,className:"recharts-cartesian-grid-bg"})}));return t.createElement("g",{className:"recharts-cartesian-gridstripes-vertical"},f)}var y_=function(e,t){var n=e.xAxis,r=e.width,o=e.height,i=e.offset;return CO(yT(a_(a_(a_({},_T.defaultProps),n),{},{ticks:PO(n,!0),viewBox:{x:0,y:0,width:r,height:o}})),i.left,i.left+i.width,t)},v_=function(e,t){var n=e.yAxis,r=e.width,o=e.height,i=e.offset;return CO(yT(a_(a_(a_({},_T.defaultProps),n),{},{ticks:PO(n,!0),viewBox:{x:0,y:0,width:r,height:o}})),i.top,i.top+i.height,t)},g_={horizontal:!0,vertical:!0,horizontalPoints:[],verticalPoints:[],stroke:"#ccc",fill:"none",verticalFill:[],horizontalFill:[]};function b_(e){var n,r,o,i,a,l,s=KE(),u=GE(),c=(0,t.useContext)(FE),d=a_(a_({},e),{},{stroke:null!==(n=e.stroke)&&void 0!==n?n:g_.stroke,fill:null!==(r=e.fill)&&void 0!==r?r:g_.fill,horizontal:null!==(o=e.horizontal)&&void 0!==o?o:g_.horizontal,horizontalFill:null!==(i=e.horizontalFill)&&void 0!==i?i:g_.horizontalFill,vertical:null!==(a=e.vertical)&&void 0!==a?a:g_.vertical,verticalFill:null!==(l=e.verticalFill)&&void 0!==l?l:g_.verticalFill,x:bf(e.x)?e.x:c.left,y:bf(e.y)?e.y:c.top,width:bf(e.width)?e.width:c.width,height:bf(e.height)?e.height:c.height}),f=d.x,p=d.y,h=d.width,m=d.height,y=d.syncWithTicks,v=d.horizontalValues,g=d.verticalValues,b=function(){var e=(0,t.useContext)(zE);return Of(e)}(),x=function(){var e=(0,t.useContext)($E);return IE()(e,(function(e){return Bk()(e.domain,Number.isFinite)}))||Of(e)}();if(!bf(h)||h<=0||!bf(m)||m<=0||!bf(f)||f!==+f||!bf(p)||p!==+p)return null;var w=d.verticalCoordinatesGenerator||y_,S=d.horizontalCoordinatesGenerator||v_,A=d.horizontalPoints,O=d.verticalPoints;if((!A||!A.length)&&_f()(S)){var k=v&&v.length,j=S({yAxis:x?a_(a_({},x),{},{ticks:k?v:x.ticks}):void 0,width:s,height:u,offset:c},!!k||y);Cf(Array.isArray(j),"horizontalCoordinatesGenerator should return Array but instead it returned [".concat(o_(j),"]")),Array.isArray(j)&&(A=j)}if((!O||!O.length)&&_f()(w)){var E=g&&g.length,C=w({xAxis:b?a_(a_({},b),{},{ticks:E?g:b.ticks}):void 0,width:s,height:u,offset:c},!!E||y);Cf(Array.isArray(C),"verticalCoordinatesGenerator should return Array but instead it returned [".concat(o_(C),"]")),Array.isArray(C)&&(O=C)}return t.createElement("g",{className:"recharts-cartesian-grid"},t.createElement(c_,{fill:d.fill,fillOpacity:d.fillOpacity,x:d.x,y:d.y,width:d.width,height:d.height,ry:d.ry}),t.createElement(f_,s_({},d,{offset:c,horizontalPoints:A,xAxis:b,yAxis:x})),t.createElement(p_,s_({},d,{offset:c,verticalPoints:O,xAxis:b,yAxis:x})),t.createElement(h_,s_({},d,{horizontalPoints:A})),t.createElement(m_,s_({},d,{verticalPoints:O})))}b_.displayName="CartesianGrid";const x_=["#0088FE","#00C49F","#FFBB28","#FF8042","#b59d2b","#c0392b","#232b5c"];const w_=function(){const e=ee(),[n,r]=(0,t.useState)(""),[o,i]=(0,t.useState)(""),[a,l]=(0,t.useState)(""),[s,u]=(0,t.useState)(!1),[c,d]=(0,t.useState)(!1),[f,p]=(0,t.useState)(0),[h,m]=(0,t.useState)(null),[y,v]=(0,t.useState)([]),[g,b]=(0,t.useState)([]),[x,w]=(0,t.useState)([]),[S,A]=(0,t.useState)(null),[O,k]=(0,t.useState)(!1);(0,t.useEffect)((()=>{sessionStorage.getItem("admin_username")?(u(!0),E(),C(),P(),M()):e("/admin/login")}),[]),(0,t.useEffect)((()=>{2===f&&(console.log("useEffect: Fetching courses because Courses tab is active"),P())}),[f]);const j=async e=>{e.preventDefault(),d(!0),l("");try{const e=await fetch("/api/admin/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({username:n,password:o})}),t=await e.json();t.success?(u(!0),E()):l(t.message||"Login failed")}catch(t){l("An error occurred during login")}finally{d(!1)}},E=async()=>{try{const e=await fetch("/api/admin/dashboard"),t=await e.json();t.success&&m(t.stats)}catch(e){console.error("Error fetching dashboard data:",e)}},C=async()=>{try{const e=await fetch("/api/admin/students"),t=await e.json();t.success&&v(t.students)}catch(e){console.error("Error fetching students:",e)}},P=async()=>{try{const e=await fetch("/api/admin/courses"),t=await e.json();t.success&&(console.log("Courses:",t.courses),b(t.courses))}catch(e){console.error("Error fetching courses:",e)}},M=async()=>{try{const e=await fetch("/api/admin/enrollments"),t=await e.json();t.success&&w(t.enrollments)}catch(e){console.error("Error fetching enrollments:",e)}},T=(e,t)=>{switch(p(t),console.log("Tab changed to:",t),t){case 0:E();break;case 1:C();break;case 2:console.log("Fetching courses..."),P();break;case 3:M()}},_=h?Object.entries(h.department_stats).map((e=>{let[t,n]=e;return{name:t,value:n}})):[],R=h?Object.entries(h.difficulty_stats).map((e=>{let[t,n]=e;return{name:t,value:n}})):[],N=h?h.top_courses.map((e=>({name:e.Course_Name,value:e.Enrollment_Count}))):[];return s?(0,Pt.jsx)(mr,{maxWidth:"xl",sx:{px:{xs:.5,sm:2},py:{xs:1,sm:4}},children:(0,Pt.jsxs)(qt,{sx:{mt:{xs:2,sm:4}},children:[(0,Pt.jsxs)(qt,{sx:{display:"flex",flexDirection:{xs:"column",sm:"row"},justifyContent:"space-between",alignItems:{xs:"flex-start",sm:"center"},mb:3,gap:2},children:[(0,Pt.jsx)(en,{variant:"h4",component:"h1",sx:{fontSize:{xs:24,sm:32}},children:"Admin Dashboard"}),(0,Pt.jsxs)(qt,{children:[(0,Pt.jsx)(qu,{title:"Refresh Data",children:(0,Pt.jsx)(ql,{onClick:()=>T(0,f),sx:{mr:1},children:(0,Pt.jsx)(af.A,{})})}),(0,Pt.jsx)(qu,{title:"Logout",children:(0,Pt.jsx)(ql,{onClick:()=>{sessionStorage.removeItem("admin_username"),u(!1),r(""),i(""),m(null),v([]),b([]),w([]),p(0),e("/admin/login")},children:(0,Pt.jsx)(of.A,{})})})]})]}),(0,Pt.jsxs)(bc,{value:f,onChange:T,sx:{mb:3,minHeight:48},variant:"scrollable",scrollButtons:"auto",children:[(0,Pt.jsx)(kc,{icon:(0,Pt.jsx)(ef.A,{}),label:"Dashboard",sx:{minWidth:100}}),(0,Pt.jsx)(kc,{icon:(0,Pt.jsx)(nf.A,{}),label:"Students",sx:{minWidth:100}}),(0,Pt.jsx)(kc,{icon:(0,Pt.jsx)(tf.A,{}),label:"Courses",sx:{minWidth:100}}),(0,Pt.jsx)(kc,{icon:(0,Pt.jsx)(rf.A,{}),label:"Enrollments",sx:{minWidth:100}})]}),0===f&&h&&(0,Pt.jsxs)(Dt,{container:!0,spacing:2,children:[(0,Pt.jsx)(Dt,{item:!0,xs:12,md:6,lg:3,children:(0,Pt.jsx)(Pc,{children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{color:"textSecondary",gutterBottom:!0,children:"Total Students"}),(0,Pt.jsx)(en,{variant:"h4",children:h.total_students})]})})}),(0,Pt.jsx)(Dt,{item:!0,xs:12,md:6,lg:3,children:(0,Pt.jsx)(Pc,{children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{color:"textSecondary",gutterBottom:!0,children:"Total Courses"}),(0,Pt.jsx)(en,{variant:"h4",children:h.total_courses})]})})}),(0,Pt.jsx)(Dt,{item:!0,xs:12,md:6,lg:3,children:(0,Pt.jsx)(Pc,{children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{color:"textSecondary",gutterBottom:!0,children:"Total Enrollments"}),(0,Pt.jsx)(en,{variant:"h4",children:h.total_enrollments})]})})}),(0,Pt.jsx)(Dt,{item:!0,xs:12,md:6,lg:3,children:(0,Pt.jsx)(Pc,{children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{color:"textSecondary",gutterBottom:!0,children:"Departments"}),(0,Pt.jsx)(en,{variant:"h4",children:Object.keys(h.department_stats).length})]})})}),(0,Pt.jsx)(Dt,{item:!0,xs:12,md:6,lg:4,children:(0,Pt.jsx)(Pc,{sx:{height:340},children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{variant:"h6",align:"center",children:"Students by Department"}),(0,Pt.jsx)(pp,{width:"100%",height:250,children:(0,Pt.jsxs)(sT,{children:[(0,Pt.jsx)(lT,{data:_,dataKey:"value",nameKey:"name",cx:"50%",cy:"50%",outerRadius:80,label:!0,children:_.map(((e,t)=>(0,Pt.jsx)(Fk,{fill:x_[t%x_.length]},`cell-${t}`)))}),(0,Pt.jsx)(mh,{}),(0,Pt.jsx)(Pm,{})]})})]})})}),(0,Pt.jsx)(Dt,{item:!0,xs:12,md:6,lg:4,children:(0,Pt.jsx)(Pc,{sx:{height:340},children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{variant:"h6",align:"center",children:"Course Difficulty Distribution"}),(0,Pt.jsx)(pp,{width:"100%",height:250,children:(0,Pt.jsxs)(t_,{data:R,margin:{top:20,right:30,left:0,bottom:0},children:[(0,Pt.jsx)(b_,{strokeDasharray:"3 3"}),(0,Pt.jsx)(UT,{dataKey:"name"}),(0,Pt.jsx)(e_,{}),(0,Pt.jsx)(mh,{}),(0,Pt.jsx)(Pm,{}),(0,Pt.jsx)(cE,{dataKey:"value",fill:"#1976d2"})]})})]})})}),(0,Pt.jsx)(Dt,{item:!0,xs:12,md:12,lg:4,children:(0,Pt.jsx)(Pc,{sx:{height:340},children:(0,Pt.jsxs)(Rc,{children:[(0,Pt.jsx)(en,{variant:"h6",align:"center",children:"Top Enrolled Courses"}),(0,Pt.jsx)(pp,{width:"100%",height:250,children:(0,Pt.jsxs)(t_,{data:N,layout:"vertical",margin:{top:20,right:30,left:0,bottom:0},children:[(0,Pt.jsx)(b_,{strokeDasharray:"3 3"}),(0,Pt.jsx)(UT,{type:"number"}),(0,Pt.jsx)(e_,{dataKey:"name",type:"category",width:120}),(0,Pt.jsx)(mh,{}),(0,Pt.jsx)(Pm,{}),(0,Pt.jsx)(cE,{dataKey:"value",fill:"#c0392b"})]})})]})})})]}),1===f&&(0,Pt.jsx)(qt,{sx:{width:"100%",overflowX:"auto"},children:(0,Pt.jsx)(Lc,{component:sn,sx:{minWidth:600},children:(0,Pt.jsxs)(Uc,{size:"small",children:[(0,Pt.jsx)(Yc,{children:(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:"Student ID"}),(0,Pt.jsx)(ud,{children:"Name"}),(0,Pt.jsx)(ud,{children:"Department"}),(0,Pt.jsx)(ud,{children:"CGPA"}),(0,Pt.jsx)(ud,{children:"Completed Courses"})]})}),(0,Pt.jsx)(md,{children:y.map((e=>(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:e.Student_ID}),(0,Pt.jsx)(ud,{children:e.Name}),(0,Pt.jsx)(ud,{children:e.Department}),(0,Pt.jsx)(ud,{children:e.CGPA}),(0,Pt.jsx)(ud,{children:e.Completed_Courses})]},e.Student_ID)))})]})})}),2===f&&(0,Pt.jsx)(qt,{sx:{width:"100%",overflowX:"auto"},children:(0,Pt.jsx)(Lc,{component:sn,sx:{minWidth:600},children:(0,Pt.jsxs)(Uc,{size:"small",children:[(0,Pt.jsx)(Yc,{children:(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:"Course Code"}),(0,Pt.jsx)(ud,{children:"Course Name"}),(0,Pt.jsx)(ud,{children:"Department"}),(0,Pt.jsx)(ud,{children:"Prerequisites"}),(0,Pt.jsx)(ud,{children:"Credit Hours"}),(0,Pt.jsx)(ud,{children:"Difficulty"})]})}),(0,Pt.jsx)(md,{children:0===g.length?(0,Pt.jsx)(rd,{children:(0,Pt.jsx)(ud,{colSpan:6,align:"center",children:"No courses found."})}):g.map(((e,t)=>(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:e.Course_Code}),(0,Pt.jsx)(ud,{children:e.Course_Name}),(0,Pt.jsx)(ud,{children:e.Department}),(0,Pt.jsx)(ud,{children:e.Prerequisites}),(0,Pt.jsx)(ud,{children:e.Credit_Hours}),(0,Pt.jsx)(ud,{children:e.Difficulty})]},e.Course_Code||t)))})]})})}),3===f&&(0,Pt.jsx)(qt,{sx:{width:"100%",overflowX:"auto"},children:(0,Pt.jsx)(Lc,{component:sn,sx:{minWidth:600},children:(0,Pt.jsxs)(Uc,{size:"small",children:[(0,Pt.jsx)(Yc,{children:(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:"Course Code"}),(0,Pt.jsx)(ud,{children:"Course Name"}),(0,Pt.jsx)(ud,{children:"Enrollment Count"}),(0,Pt.jsx)(ud,{children:"Students Enrolled"})]})}),(0,Pt.jsx)(md,{children:x.map((e=>(0,Pt.jsxs)(rd,{children:[(0,Pt.jsx)(ud,{children:e.Course_Code}),(0,Pt.jsx)(ud,{children:e.Course_Name}),(0,Pt.jsx)(ud,{children:e.Enrollment_Count}),(0,Pt.jsx)(ud,{children:e.Students_Enrolled})]},e.Course_Code)))})]})})})]})}):(0,Pt.jsxs)(mr,{maxWidth:"sm",children:[(0,Pt.jsx)(qt,{sx:{mt:8,display:"flex",flexDirection:"column",alignItems:"center"},children:(0,Pt.jsxs)(sn,{elevation:3,sx:{p:4,width:"100%"},children:[(0,Pt.jsx)(en,{component:"h1",variant:"h5",align:"center",gutterBottom:!0,children:"Admin Login"}),(0,Pt.jsxs)("form",{onSubmit:j,children:[(0,Pt.jsx)(cl,{margin:"normal",required:!0,fullWidth:!0,label:"Username",value:n,onChange:e=>r(e.target.value)}),(0,Pt.jsx)(cl,{margin:"normal",required:!0,fullWidth:!0,label:"Password",type:"password",value:o,onChange:e=>i(e.target.value)}),(0,Pt.jsx)(or,{type:"submit",fullWidth:!0,variant:"contained",sx:{mt:3,mb:2},disabled:c,children:c?(0,Pt.jsx)(kl,{size:24}):"Login"})]})]})}),(0,Pt.jsx)(zl,{open:!!a,autoHideDuration:6e3,onClose:()=>l(""),children:(0,Pt.jsx)(is,{severity:"error",onClose:()=>l(""),children:a})})]})};const S_=function(){const e=ee(),[n,r]=(0,t.useState)(""),[o,i]=(0,t.useState)(""),[a,l]=(0,t.useState)(""),[s,u]=(0,t.useState)(!1);return(0,Pt.jsxs)(mr,{maxWidth:"sm",children:[(0,Pt.jsx)(qt,{sx:{mt:8,display:"flex",flexDirection:"column",alignItems:"center"},children:(0,Pt.jsxs)(sn,{elevation:3,sx:{p:4,width:"100%"},children:[(0,Pt.jsx)(en,{component:"h1",variant:"h5",align:"center",gutterBottom:!0,children:"Student Login"}),(0,Pt.jsxs)("form",{onSubmit:async t=>{t.preventDefault(),u(!0),l("");try{const t=await fetch("/api/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({student_id:n,password:o})}),r=await t.json();r.success?(sessionStorage.setItem("student_id",n),e("/student/dashboard")):l(r.message||"Login failed")}catch(r){l("An error occurred during login")}finally{u(!1)}},children:[(0,Pt.jsx)(cl,{margin:"normal",required:!0,fullWidth:!0,label:"Student ID",value:n,onChange:e=>r(e.target.value)}),(0,Pt.jsx)(cl,{margin:"normal",required:!0,fullWidth:!0,label:"Password",type:"password",value:o,onChange:e=>i(e.target.value)}),(0,Pt.jsx)(or,{type:"submit",fullWidth:!0,variant:"contained",sx:{mt:3,mb:2},disabled:s,children:s?(0,Pt.jsx)(kl,{size:24}):"Login"})]})]})}),(0,Pt.jsx)(zl,{open:!!a,autoHideDuration:6e3,onClose:()=>l(""),children:(0,Pt.jsx)(is,{severity:"error",onClose:()=>l(""),children:a})})]})};const A_=function(){const e=ee(),[n,r]=(0,t.useState)(""),[o,i]=(0,t.useState)(""),[a,l]=(0,t.useState)(""),[s,u]=(0,t.useState)(!1);return(0,Pt.jsxs)(mr,{maxWidth:"sm",children:[(0,Pt.jsx)(qt,{sx:{mt:8,display:"flex",flexDirection:"column",alignItems:"center"},children:(0,Pt.jsxs)(sn,{elevation:3,sx:{p:4,width:"100%"},children:[(0,Pt.jsx)(en,{component:"h1",variant:"h5",align:"center",gutterBottom:!0,children:"Admin Login"}),(0,Pt.jsxs)("form",{onSubmit:async t=>{t.preventDefault(),u(!0),l("");try{const t=await fetch("/api/admin/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({username:n,password:o})}),r=await t.json();r.success?(sessionStorage.setItem("admin_username",n),e("/admin/dashboard")):l(r.message||"Login failed")}catch(r){l("An error occurred during login")}finally{u(!1)}},children:[(0,Pt.jsx)(cl,{margin:"normal",required:!0,fullWidth:!0,label:"Username",value:n,onChange:e=>r(e.target.value)}),(0,Pt.jsx)(cl,{margin:"normal",required:!0,fullWidth:!0,label:"Password",type:"password",value:o,onChange:e=>i(e.target.value)}),(0,Pt.jsx)(or,{type:"submit",fullWidth:!0,variant:"contained",sx:{mt:3,mb:2},disabled:s,children:s?(0,Pt.jsx)(kl,{size:24}):"Login"})]})]})}),(0,Pt.jsx)(zl,{open:!!a,autoHideDuration:6e3,onClose:()=>l(""),children:(0,Pt.jsx)(is,{severity:"error",onClose:()=>l(""),children:a})})]})};function O_(e){return(0,kt.Ay)("MuiListItem",e)}const k_=(0,Ot.A)("MuiListItem",["root","container","focusVisible","dense","alignItemsFlexStart","disabled","divider","gutters","padding","button","secondaryAction","selected"]);const j_=(0,Ot.A)("MuiListItemButton",["root","focusVisible","dense","alignItemsFlexStart","disabled","divider","gutters","selected"]);function E_(e){return(0,kt.Ay)("MuiListItemSecondaryAction",e)}(0,Ot.A)("MuiListItemSecondaryAction",["root","disableGutters"]);const C_=["className"],P_=(0,vt.Ay)("div",{name:"MuiListItemSecondaryAction",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.disableGutters&&t.disableGutters]}})((e=>{let{ownerState:t}=e;return(0,ut.A)({position:"absolute",right:16,top:"50%",transform:"translateY(-50%)"},t.disableGutters&&{right:0})})),M_=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiListItemSecondaryAction"}),{className:o}=r,i=(0,st.A)(r,C_),a=t.useContext(qo),l=(0,ut.A)({},r,{disableGutters:a.disableGutters}),s=(e=>{const{disableGutters:t,classes:n}=e,r={root:["root",t&&"disableGutters"]};return(0,yt.A)(r,E_,n)})(l);return(0,Pt.jsx)(P_,(0,ut.A)({className:(0,ct.A)(s.root,o),ownerState:l,ref:n},i))}));M_.muiName="ListItemSecondaryAction";const T_=M_,__=["className"],R_=["alignItems","autoFocus","button","children","className","component","components","componentsProps","ContainerComponent","ContainerProps","dense","disabled","disableGutters","disablePadding","divider","focusVisibleClassName","secondaryAction","selected","slotProps","slots"],N_=(0,vt.Ay)("div",{name:"MuiListItem",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.dense&&t.dense,"flex-start"===n.alignItems&&t.alignItemsFlexStart,n.divider&&t.divider,!n.disableGutters&&t.gutters,!n.disablePadding&&t.padding,n.button&&t.button,n.hasSecondaryAction&&t.secondaryAction]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({display:"flex",justifyContent:"flex-start",alignItems:"center",position:"relative",textDecoration:"none",width:"100%",boxSizing:"border-box",textAlign:"left"},!n.disablePadding&&(0,ut.A)({paddingTop:8,paddingBottom:8},n.dense&&{paddingTop:4,paddingBottom:4},!n.disableGutters&&{paddingLeft:16,paddingRight:16},!!n.secondaryAction&&{paddingRight:48}),!!n.secondaryAction&&{[`& > .${j_.root}`]:{paddingRight:48}},{[`&.${k_.focusVisible}`]:{backgroundColor:(t.vars||t).palette.action.focus},[`&.${k_.selected}`]:{backgroundColor:t.vars?`rgba(${t.vars.palette.primary.mainChannel} / ${t.vars.palette.action.selectedOpacity})`:(0,tn.X4)(t.palette.primary.main,t.palette.action.selectedOpacity),[`&.${k_.focusVisible}`]:{backgroundColor:t.vars?`rgba(${t.vars.palette.primary.mainChannel} / calc(${t.vars.palette.action.selectedOpacity} + ${t.vars.palette.action.focusOpacity}))`:(0,tn.X4)(t.palette.primary.main,t.palette.action.selectedOpacity+t.palette.action.focusOpacity)}},[`&.${k_.disabled}`]:{opacity:(t.vars||t).palette.action.disabledOpacity}},"flex-start"===n.alignItems&&{alignItems:"flex-start"},n.divider&&{borderBottom:`1px solid ${(t.vars||t).palette.divider}`,backgroundClip:"padding-box"},n.button&&{transition:t.transitions.create("background-color",{duration:t.transitions.duration.shortest}),"&:hover":{textDecoration:"none",backgroundColor:(t.vars||t).palette.action.hover,"@media (hover: none)":{backgroundColor:"transparent"}},[`&.${k_.selected}:hover`]:{backgroundColor:t.vars?`rgba(${t.vars.palette.primary.mainChannel} / calc(${t.vars.palette.action.selectedOpacity} + ${t.vars.palette.action.hoverOpacity}))`:(0,tn.X4)(t.palette.primary.main,t.palette.action.selectedOpacity+t.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:t.vars?`rgba(${t.vars.palette.primary.mainChannel} / ${t.vars.palette.action.selectedOpacity})`:(0,tn.X4)(t.palette.primary.main,t.palette.action.selectedOpacity)}}},n.hasSecondaryAction&&{paddingRight:48})})),I_=(0,vt.Ay)("li",{name:"MuiListItem",slot:"Container",overridesResolver:(e,t)=>t.container})({position:"relative"}),D_=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiListItem"}),{alignItems:o="center",autoFocus:i=!1,button:a=!1,children:l,className:s,component:u,components:c={},componentsProps:d={},ContainerComponent:f="li",ContainerProps:{className:p}={},dense:h=!1,disabled:m=!1,disableGutters:y=!1,disablePadding:v=!1,divider:g=!1,focusVisibleClassName:b,secondaryAction:x,selected:w=!1,slotProps:S={},slots:A={}}=r,O=(0,st.A)(r.ContainerProps,__),k=(0,st.A)(r,R_),j=t.useContext(qo),E=t.useMemo((()=>({dense:h||j.dense||!1,alignItems:o,disableGutters:y})),[o,j.dense,h,y]),C=t.useRef(null);(0,Rr.A)((()=>{i&&C.current&&C.current.focus()}),[i]);const P=t.Children.toArray(l),M=P.length&&(0,Ro.A)(P[P.length-1],["ListItemSecondaryAction"]),T=(0,ut.A)({},r,{alignItems:o,autoFocus:i,button:a,dense:E.dense,disabled:m,disableGutters:y,disablePadding:v,divider:g,hasSecondaryAction:M,selected:w}),_=(e=>{const{alignItems:t,button:n,classes:r,dense:o,disabled:i,disableGutters:a,disablePadding:l,divider:s,hasSecondaryAction:u,selected:c}=e,d={root:["root",o&&"dense",!a&&"gutters",!l&&"padding",s&&"divider",i&&"disabled",n&&"button","flex-start"===t&&"alignItemsFlexStart",u&&"secondaryAction",c&&"selected"],container:["container"]};return(0,yt.A)(d,O_,r)})(T),R=(0,cn.A)(C,n),N=A.root||c.Root||N_,I=S.root||d.root||{},D=(0,ut.A)({className:(0,ct.A)(_.root,I.className,s),disabled:m},k);let L=u||"li";return a&&(D.component=u||"div",D.focusVisibleClassName=(0,ct.A)(k_.focusVisible,b),L=Kn),M?(L=D.component||u?L:"div","li"===f&&("li"===L?L="div":"li"===D.component&&(D.component="div")),(0,Pt.jsx)(qo.Provider,{value:E,children:(0,Pt.jsxs)(I_,(0,ut.A)({as:f,className:(0,ct.A)(_.container,p),ref:R,ownerState:T},O,{children:[(0,Pt.jsx)(N,(0,ut.A)({},I,!Pr(N)&&{as:L,ownerState:(0,ut.A)({},T,I.ownerState)},D,{children:P})),P.pop()]}))})):(0,Pt.jsx)(qo.Provider,{value:E,children:(0,Pt.jsxs)(N,(0,ut.A)({},I,{as:L,ref:R},!Pr(N)&&{ownerState:(0,ut.A)({},T,I.ownerState)},D,{children:[P,x&&(0,Pt.jsx)(T_,{children:x})]}))})})),L_=(0,Ya.A)((0,Pt.jsx)("path",{d:"M12 12c2.21 0 4-1.79 4-4s-1.79-4-4-4-4 1.79-4 4 1.79 4 4 4zm0 2c-2.67 0-8 1.34-8 4v2h16v-2c0-2.66-5.33-4-8-4z"}),"Person");function z_(e){return(0,kt.Ay)("MuiAvatar",e)}(0,Ot.A)("MuiAvatar",["root","colorDefault","circular","rounded","square","img","fallback"]);const $_=["alt","children","className","component","imgProps","sizes","src","srcSet","variant"],B_=(0,vt.Ay)("div",{name:"MuiAvatar",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[n.variant],n.colorDefault&&t.colorDefault]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({position:"relative",display:"flex",alignItems:"center",justifyContent:"center",flexShrink:0,width:40,height:40,fontFamily:t.typography.fontFamily,fontSize:t.typography.pxToRem(20),lineHeight:1,borderRadius:"50%",overflow:"hidden",userSelect:"none"},"rounded"===n.variant&&{borderRadius:(t.vars||t).shape.borderRadius},"square"===n.variant&&{borderRadius:0},n.colorDefault&&(0,ut.A)({color:(t.vars||t).palette.background.default},t.vars?{backgroundColor:t.vars.palette.Avatar.defaultBg}:{backgroundColor:"light"===t.palette.mode?t.palette.grey[400]:t.palette.grey[600]}))})),F_=(0,vt.Ay)("img",{name:"MuiAvatar",slot:"Img",overridesResolver:(e,t)=>t.img})({width:"100%",height:"100%",textAlign:"center",objectFit:"cover",color:"transparent",textIndent:1e4}),W_=(0,vt.Ay)(L_,{name:"MuiAvatar",slot:"Fallback",overridesResolver:(e,t)=>t.fallback})({width:"75%",height:"75%"});const U_=t.forwardRef((function(e,n){const r=(0,gt.A)({props:e,name:"MuiAvatar"}),{alt:o,children:i,className:a,component:l="div",imgProps:s,sizes:u,src:c,srcSet:d,variant:f="circular"}=r,p=(0,st.A)(r,$_);let h=null;const m=function(e){let{crossOrigin:n,referrerPolicy:r,src:o,srcSet:i}=e;const[a,l]=t.useState(!1);return t.useEffect((()=>{if(!o&&!i)return;l(!1);let e=!0;const t=new Image;return t.onload=()=>{e&&l("loaded")},t.onerror=()=>{e&&l("error")},t.crossOrigin=n,t.referrerPolicy=r,t.src=o,i&&(t.srcset=i),()=>{e=!1}}),[n,r,o,i]),a}((0,ut.A)({},s,{src:c,srcSet:d})),y=c||d,v=y&&"error"!==m,g=(0,ut.A)({},r,{colorDefault:!v,component:l,variant:f}),b=(e=>{const{classes:t,variant:n,colorDefault:r}=e,o={root:["root",n,r&&"colorDefault"],img:["img"],fallback:["fallback"]};return(0,yt.A)(o,z_,t)})(g);return h=v?(0,Pt.jsx)(F_,(0,ut.A)({alt:o,src:c,srcSet:d,sizes:u,ownerState:g,className:b.img},s)):null!=i?i:y&&o?o[0]:(0,Pt.jsx)(W_,{ownerState:g,className:b.fallback}),(0,Pt.jsx)(B_,(0,ut.A)({as:l,ownerState:g,className:(0,ct.A)(b.root,a),ref:n},p,{children:h}))}));function H_(e){return(0,kt.Ay)("MuiDivider",e)}(0,Ot.A)("MuiDivider",["root","absolute","fullWidth","inset","middle","flexItem","light","vertical","withChildren","withChildrenVertical","textAlignRight","textAlignLeft","wrapper","wrapperVertical"]);const V_=["absolute","children","className","component","flexItem","light","orientation","role","textAlign","variant"],q_=(0,vt.Ay)("div",{name:"MuiDivider",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.absolute&&t.absolute,t[n.variant],n.light&&t.light,"vertical"===n.orientation&&t.vertical,n.flexItem&&t.flexItem,n.children&&t.withChildren,n.children&&"vertical"===n.orientation&&t.withChildrenVertical,"right"===n.textAlign&&"vertical"!==n.orientation&&t.textAlignRight,"left"===n.textAlign&&"vertical"!==n.orientation&&t.textAlignLeft]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({margin:0,flexShrink:0,borderWidth:0,borderStyle:"solid",borderColor:(t.vars||t).palette.divider,borderBottomWidth:"thin"},n.absolute&&{position:"absolute",bottom:0,left:0,width:"100%"},n.light&&{borderColor:t.vars?`rgba(${t.vars.palette.dividerChannel} / 0.08)`:(0,tn.X4)(t.palette.divider,.08)},"inset"===n.variant&&{marginLeft:72},"middle"===n.variant&&"horizontal"===n.orientation&&{marginLeft:t.spacing(2),marginRight:t.spacing(2)},"middle"===n.variant&&"vertical"===n.orientation&&{marginTop:t.spacing(1),marginBottom:t.spacing(1)},"vertical"===n.orientation&&{height:"100%",borderBottomWidth:0,borderRightWidth:"thin"},n.flexItem&&{alignSelf:"stretch",height:"auto"})}),(e=>{let{ownerState:t}=e;return(0,ut.A)({},t.children&&{display:"flex",whiteSpace:"nowrap",textAlign:"center",border:0,"&::before, &::after":{content:'""',alignSelf:"center"}})}),(e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({},n.children&&"vertical"!==n.orientation&&{"&::before, &::after":{width:"100%",borderTop:`thin solid ${(t.vars||t).palette.divider}`}})}),(e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({},n.children&&"vertical"===n.orientation&&{flexDirection:"column","&::before, &::after":{height:"100%",borderLeft:`thin solid ${(t.vars||t).palette.divider}`}})}),(e=>{let{ownerState:t}=e;return(0,ut.A)({},"right"===t.textAlign&&"vertical"!==t.orientation&&{"&::before":{width:"90%"},"&::after":{width:"10%"}},"left"===t.textAlign&&"vertical"!==t.orientation&&{"&::before":{width:"10%"},"&::after":{width:"90%"}})})),X_=(0,vt.Ay)("span",{name:"MuiDivider",slot:"Wrapper",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.wrapper,"vertical"===n.orientation&&t.wrapperVertical]}})((e=>{let{theme:t,ownerState:n}=e;return(0,ut.A)({display:"inline-block",paddingLeft:`calc(${t.spacing(1)} * 1.2)`,paddingRight:`calc(${t.spacing(1)} * 1.2)`},"vertical"===n.orientation&&{paddingTop:`calc(${t.spacing(1)} * 1.2)`,paddingBottom:`calc(${t.spacing(1)} * 1.2)`})})),K_=t.forwardRef((function(e,t){const n=(0,gt.A)({props:e,name:"MuiDivider"}),{absolute:r=!1,children:o,className:i,component:a=(o?"div":"hr"),flexItem:l=!1,light:s=!1,orientation:u="horizontal",role:c=("hr"!==a?"separator":void 0),textAlign:d="center",variant:f="fullWidth"}=n,p=(0,st.A)(n,V_),h=(0,ut.A)({},n,{absolute:r,component:a,flexItem:l,light:s,orientation:u,role:c,textAlign:d,variant:f}),m=(e=>{const{absolute:t,children:n,classes:r,flexItem:o,light:i,orientation:a,textAlign:l,variant:s}=e,u={root:["root",t&&"absolute",s,i&&"light","vertical"===a&&"vertical",o&&"flexItem",n&&"withChildren",n&&"vertical"===a&&"withChildrenVertical","right"===l&&"vertical"!==a&&"textAlignRight","left"===l&&"vertical"!==a&&"textAlignLeft"],wrapper:["wrapper","vertical"===a&&"wrapperVertical"]};return(0,yt.A)(u,H_,r)})(h);return(0,Pt.jsx)(q_,(0,ut.A)({as:a,className:(0,ct.A)(m.root,i),role:c,ref:t,ownerState:h},p,{children:o?(0,Pt.jsx)(X_,{className:m.wrapper,ownerState:h,children:o}):null}))}));var G_=n(5678),Y_=n(7915),Q_=n(2177);const J_=()=>{const[e,n]=(0,t.useState)([]),[r,o]=(0,t.useState)(""),[i,a]=(0,t.useState)(!1),l=(0,t.useRef)(null),c=(0,t.useRef)(null);St();(0,t.useEffect)((()=>{(()=>{var e;null===(e=l.current)||void 0===e||e.scrollIntoView({behavior:"smooth"})})(),0===e.length&&n([{text:"Hello! I'm your academic advisor chatbot. I can help you with course recommendations and academic planning. How can I assist you today?",sender:"bot"}])}),[e]);const s=async()=>{if(!r.trim())return;const t={text:r,sender:"user"};n((e=>[...e,t])),o(""),a(!0);try{const t=await fetch("/api/chatbot/response",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({message:r,conversation_id:c.current,student_id:sessionStorage.getItem("student_id")})}),o=await t.json();c.current=o.conversation_id,n((e=>[...e,{text:o.response,sender:"bot"}]))}catch(i){n((e=>[...e,{text:"I'm sorry, I encountered an error. Please try again.",sender:"bot"}]))}finally{a(!1)}};return(0,Pt.jsxs)(qt,{sx:{height:"80vh",display:"flex",flexDirection:"column",maxWidth:"800px",margin:"auto",padding:2,bgcolor:"background.default"},children:[(0,Pt.jsx)(sn,{elevation:3,sx:{flexGrow:1,overflow:"auto",mb:2,p:2,bgcolor:"background.paper"},children:(0,Pt.jsxs)(Yo,{children:[e.map(((n,r)=>(0,Pt.jsxs)(t.Fragment,{children:[(0,Pt.jsx)(D_,{sx:{display:"flex",justifyContent:"user"===n.sender?"flex-end":"flex-start",mb:1},children:(0,Pt.jsxs)(qt,{sx:{display:"flex",alignItems:"center",maxWidth:"70%"},children:["bot"===n.sender&&(0,Pt.jsx)(U_,{sx:{bgcolor:"primary.main",mr:1},children:(0,Pt.jsx)(Y_.A,{})}),(0,Pt.jsx)(sn,{elevation:1,sx:{p:2,bgcolor:"user"===n.sender?"primary.main":"background.paper",color:"user"===n.sender?"primary.contrastText":"text.primary"},children:(0,Pt.jsx)(en,{children:n.text})}),"user"===n.sender&&(0,Pt.jsx)(U_,{sx:{bgcolor:"secondary.main",ml:1},children:(0,Pt.jsx)(Q_.A,{})})]})}),r<e.length-1&&(0,Pt.jsx)(K_,{})]},r))),(0,Pt.jsx)("div",{ref:l})]})}),(0,Pt.jsxs)(qt,{sx:{display:"flex",gap:1},children:[(0,Pt.jsx)(cl,{fullWidth:!0,variant:"outlined",placeholder:"Type your message...",value:r,onChange:e=>o(e.target.value),onKeyPress:e=>"Enter"===e.key&&s(),disabled:i,sx:{"& .MuiOutlinedInput-root":{bgcolor:"background.paper"}}}),(0,Pt.jsx)(or,{variant:"contained",color:"primary",onClick:s,disabled:i,sx:{minWidth:"100px"},children:i?(0,Pt.jsx)(kl,{size:24}):(0,Pt.jsx)(G_.A,{})})]})]})};var Z_=n(9307),eR=n(2856);const tR=t.createContext(null);function nR(){return t.useContext(tR)}const rR="function"===typeof Symbol&&Symbol.for?Symbol.for("mui.nested"):"__THEME_NESTED__";const oR=function(e){const{children:n,theme:r}=e,o=nR(),i=t.useMemo((()=>{const e=null===o?r:function(e,t){if("function"===typeof t)return t(e);return(0,ut.A)({},e,t)}(o,r);return null!=e&&(e[rR]=null!==o),e}),[r,o]);return(0,Pt.jsx)(tR.Provider,{value:i,children:n})},iR=["value"],aR=t.createContext();const lR=function(e){let{value:t}=e,n=(0,st.A)(e,iR);return(0,Pt.jsx)(aR.Provider,(0,ut.A)({value:null==t||t},n))},sR=t.createContext(void 0);const uR=function(e){let{value:t,children:n}=e;return(0,Pt.jsx)(sR.Provider,{value:t,children:n})},cR={};function dR(e,n,r){let o=arguments.length>3&&void 0!==arguments[3]&&arguments[3];return t.useMemo((()=>{const t=e&&n[e]||n;if("function"===typeof r){const i=r(t),a=e?(0,ut.A)({},n,{[e]:i}):i;return o?()=>a:a}return e?(0,ut.A)({},n,{[e]:r}):(0,ut.A)({},n,r)}),[e,n,r,o])}const fR=function(e){const{children:t,theme:n,themeId:r}=e,o=(0,Pu.A)(cR),i=nR()||cR,a=dR(r,o,n),l=dR(r,i,n,!0),s="rtl"===a.direction;return(0,Pt.jsx)(oR,{theme:l,children:(0,Pt.jsx)(Sn.T.Provider,{value:a,children:(0,Pt.jsx)(lR,{value:s,children:(0,Pt.jsx)(uR,{value:null==a?void 0:a.components,children:t})})})})},pR=["theme"];function hR(e){let{theme:t}=e,n=(0,st.A)(e,pR);const r=t[wt.A];return(0,Pt.jsx)(fR,(0,ut.A)({},n,{themeId:r?wt.A:void 0,theme:r||t}))}const mR=(e,t)=>(0,ut.A)({WebkitFontSmoothing:"antialiased",MozOsxFontSmoothing:"grayscale",boxSizing:"border-box",WebkitTextSizeAdjust:"100%"},t&&!e.vars&&{colorScheme:e.palette.mode}),yR=e=>(0,ut.A)({color:(e.vars||e).palette.text.primary},e.typography.body1,{backgroundColor:(e.vars||e).palette.background.default,"@media print":{backgroundColor:(e.vars||e).palette.common.white}});const vR=function(e){const n=(0,gt.A)({props:e,name:"MuiCssBaseline"}),{children:r,enableColorScheme:o=!1}=n;return(0,Pt.jsxs)(t.Fragment,{children:[(0,Pt.jsx)(Dr,{styles:e=>function(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1];var n,r;const o={};t&&e.colorSchemes&&Object.entries(e.colorSchemes).forEach((t=>{let[n,r]=t;var i;o[e.getColorSchemeSelector(n).replace(/\s*&/,"")]={colorScheme:null==(i=r.palette)?void 0:i.mode}}));let i=(0,ut.A)({html:mR(e,t),"*, *::before, *::after":{boxSizing:"inherit"},"strong, b":{fontWeight:e.typography.fontWeightBold},body:(0,ut.A)({margin:0},yR(e),{"&::backdrop":{backgroundColor:(e.vars||e).palette.background.default}})},o);const a=null==(n=e.components)||null==(r=n.MuiCssBaseline)?void 0:r.styleOverrides;return a&&(i=[i,a]),i}(e,o)}),r]})},gR=(0,t.createContext)(),bR=e=>{let{children:n}=e;const[r,o]=(0,t.useState)((()=>localStorage.getItem("themeMode")||"light")),i=(0,t.useMemo)((()=>(0,Ut.A)({palette:{mode:r,..."light"===r?{primary:{main:"#1976d2"},secondary:{main:"#dc004e"},background:{default:"#ffffff",paper:"#ffffff"},text:{primary:"rgba(0, 0, 0, 0.87)",secondary:"rgba(0, 0, 0, 0.6)"}}:{primary:{main:"#90caf9"},secondary:{main:"#f48fb1"},background:{default:"#121212",paper:"#1e1e1e"},text:{primary:"#fff",secondary:"rgba(255, 255, 255, 0.7)"}}},components:{MuiPaper:{styleOverrides:{root:{backgroundImage:"none"}}},MuiAppBar:{styleOverrides:{root:{backgroundImage:"none"}}}}})),[r]);return(0,Pt.jsx)(gR.Provider,{value:{theme:i,toggleTheme:()=>{o((e=>{const t="light"===e?"dark":"light";return localStorage.setItem("themeMode",t),t}))},mode:r},children:(0,Pt.jsxs)(hR,{theme:i,children:[(0,Pt.jsx)(vR,{}),n]})})},xR=()=>{const{toggleTheme:e,mode:n}=(()=>{const e=(0,t.useContext)(gR);if(!e)throw new Error("useTheme must be used within a ThemeProvider");return e})(),r=St();return(0,Pt.jsx)(qu,{title:`Switch to ${"light"===n?"dark":"light"} mode`,children:(0,Pt.jsx)(ql,{onClick:e,color:"inherit",sx:{position:"fixed",top:16,right:16,zIndex:1e3,backgroundColor:"dark"===r.palette.mode?"rgba(255, 255, 255, 0.1)":"rgba(0, 0, 0, 0.1)","&:hover":{backgroundColor:"dark"===r.palette.mode?"rgba(255, 255, 255, 0.2)":"rgba(0, 0, 0, 0.2)"},transition:"all 0.3s ease"},children:"light"===n?(0,Pt.jsx)(Z_.A,{}):(0,Pt.jsx)(eR.A,{})})})};const wR=function(){return(0,Pt.jsx)(bR,{children:(0,Pt.jsxs)(Je,{children:[(0,Pt.jsx)(xR,{}),(0,Pt.jsxs)(ve,{children:[(0,Pt.jsx)(me,{path:"/",element:(0,Pt.jsx)(ir,{})}),(0,Pt.jsx)(me,{path:"/student/login",element:(0,Pt.jsx)(S_,{})}),(0,Pt.jsx)(me,{path:"/admin/login",element:(0,Pt.jsx)(A_,{})}),(0,Pt.jsx)(me,{path:"/student/dashboard",element:(0,Pt.jsx)(Zd,{})}),(0,Pt.jsx)(me,{path:"/admin/dashboard",element:(0,Pt.jsx)(w_,{})}),(0,Pt.jsx)(me,{path:"/chatbot",element:(0,Pt.jsx)(J_,{})})]})]})})};r.createRoot(document.getElementById("root")).render((0,Pt.jsx)(t.StrictMode,{children:(0,Pt.jsx)(wR,{})}))})()})();
 //# sourceMappingURL=main.938d551a.js.map
\ No newline at end of file
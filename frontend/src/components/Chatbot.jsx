@@ -21,6 +21,8 @@ const Chatbot = () => {
   const [input, setInput] = useState('');
   const [loading, setLoading] = useState(false);
   const messagesEndRef = useRef(null);
+  // Issued by the server on the first reply; the server keeps the conversation history
+  const conversationId = useRef(null);
   const theme = useTheme();
 
   const scrollToBottom = () => {
@@ -60,11 +62,13 @@ const Chatbot = () => {
         },
         body: JSON.stringify({
           message: input,
-          conversationHistory: messages
+          conversation_id: conversationId.current,
+          student_id: sessionStorage.getItem('student_id')
         }),
       });
 
       const data = await response.json();
+      conversationId.current = data.conversation_id;
       setMessages(prev => [...prev, { text: data.response, sender: 'bot' }]);
     } catch (error) {
       setMessages(prev => [...prev, { 